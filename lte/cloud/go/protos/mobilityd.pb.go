@@ -125,7 +125,7 @@ func (x AllocateIPRequest_IPVersion) String() string {
 }
 
 func (AllocateIPRequest_IPVersion) EnumDescriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{7, 0}
+	return fileDescriptor_3f226a441609c6cc, []int{8, 0}
 }
 
 // --------------------------------------------------------------------------
@@ -480,6 +480,46 @@ func (m *SubscriberIPTable) GetEntries() []*SubscriberIPTableEntry {
 	return nil
 }
 
+type SubscriberIDsFromIPsRequest struct {
+	// ip_list: IP addresses to look up
+	IpList               []*IPAddress `protobuf:"bytes,1,rep,name=ip_list,json=ipList,proto3" json:"ip_list,omitempty"`
+	XXX_NoUnkeyedLiteral struct{}     `json:"-"`
+	XXX_unrecognized     []byte       `json:"-"`
+	XXX_sizecache        int32        `json:"-"`
+}
+
+func (m *SubscriberIDsFromIPsRequest) Reset()         { *m = SubscriberIDsFromIPsRequest{} }
+func (m *SubscriberIDsFromIPsRequest) String() string { return proto.CompactTextString(m) }
+func (*SubscriberIDsFromIPsRequest) ProtoMessage()    {}
+func (*SubscriberIDsFromIPsRequest) Descriptor() ([]byte, []int) {
+	return fileDescriptor_3f226a441609c6cc, []int{7}
+}
+
+func (m *SubscriberIDsFromIPsRequest) XXX_Unmarshal(b []byte) error {
+	return xxx_messageInfo_SubscriberIDsFromIPsRequest.Unmarshal(m, b)
+}
+func (m *SubscriberIDsFromIPsRequest) XXX_Marshal(b []byte, deterministic bool) ([]byte, error) {
+	return xxx_messageInfo_SubscriberIDsFromIPsRequest.Marshal(b, m, deterministic)
+}
+func (m *SubscriberIDsFromIPsRequest) XXX_Merge(src proto.Message) {
+	xxx_messageInfo_SubscriberIDsFromIPsRequest.Merge(m, src)
+}
+func (m *SubscriberIDsFromIPsRequest) XXX_Size() int {
+	return xxx_messageInfo_SubscriberIDsFromIPsRequest.Size(m)
+}
+func (m *SubscriberIDsFromIPsRequest) XXX_DiscardUnknown() {
+	xxx_messageInfo_SubscriberIDsFromIPsRequest.DiscardUnknown(m)
+}
+
+var xxx_messageInfo_SubscriberIDsFromIPsRequest proto.InternalMessageInfo
+
+func (m *SubscriberIDsFromIPsRequest) GetIpList() []*IPAddress {
+	if m != nil {
+		return m.IpList
+	}
+	return nil
+}
+
 // --------------------------------------------------------------------------
 // IP allocation service definition
 // --------------------------------------------------------------------------
@@ -499,7 +539,7 @@ func (m *AllocateIPRequest) Reset()         { *m = AllocateIPRequest{} }
 func (m *AllocateIPRequest) String() string { return proto.CompactTextString(m) }
 func (*AllocateIPRequest) ProtoMessage()    {}
 func (*AllocateIPRequest) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{7}
+	return fileDescriptor_3f226a441609c6cc, []int{8}
 }
 
 func (m *AllocateIPRequest) XXX_Unmarshal(b []byte) error {
@@ -553,7 +593,7 @@ func (m *ListAllocatedIPsResponse) Reset()         { *m = ListAllocatedIPsRespon
 func (m *ListAllocatedIPsResponse) String() string { return proto.CompactTextString(m) }
 func (*ListAllocatedIPsResponse) ProtoMessage()    {}
 func (*ListAllocatedIPsResponse) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{8}
+	return fileDescriptor_3f226a441609c6cc, []int{9}
 }
 
 func (m *ListAllocatedIPsResponse) XXX_Unmarshal(b []byte) error {
@@ -597,7 +637,7 @@ func (m *ReleaseIPRequest) Reset()         { *m = ReleaseIPRequest{} }
 func (m *ReleaseIPRequest) String() string { return proto.CompactTextString(m) }
 func (*ReleaseIPRequest) ProtoMessage()    {}
 func (*ReleaseIPRequest) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{9}
+	return fileDescriptor_3f226a441609c6cc, []int{10}
 }
 
 func (m *ReleaseIPRequest) XXX_Unmarshal(b []byte) error {
@@ -654,7 +694,7 @@ func (m *RemoveIPBlockRequest) Reset()         { *m = RemoveIPBlockRequest{} }
 func (m *RemoveIPBlockRequest) String() string { return proto.CompactTextString(m) }
 func (*RemoveIPBlockRequest) ProtoMessage()    {}
 func (*RemoveIPBlockRequest) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{10}
+	return fileDescriptor_3f226a441609c6cc, []int{11}
 }
 
 func (m *RemoveIPBlockRequest) XXX_Unmarshal(b []byte) error {
@@ -701,7 +741,7 @@ func (m *RemoveIPBlockResponse) Reset()         { *m = RemoveIPBlockResponse{} }
 func (m *RemoveIPBlockResponse) String() string { return proto.CompactTextString(m) }
 func (*RemoveIPBlockResponse) ProtoMessage()    {}
 func (*RemoveIPBlockResponse) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{11}
+	return fileDescriptor_3f226a441609c6cc, []int{12}
 }
 
 func (m *RemoveIPBlockResponse) XXX_Unmarshal(b []byte) error {
@@ -744,7 +784,7 @@ func (m *GWInfo) Reset()         { *m = GWInfo{} }
 func (m *GWInfo) String() string { return proto.CompactTextString(m) }
 func (*GWInfo) ProtoMessage()    {}
 func (*GWInfo) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{12}
+	return fileDescriptor_3f226a441609c6cc, []int{13}
 }
 
 func (m *GWInfo) XXX_Unmarshal(b []byte) error {
@@ -798,7 +838,7 @@ func (m *ListGWInfoResponse) Reset()         { *m = ListGWInfoResponse{} }
 func (m *ListGWInfoResponse) String() string { return proto.CompactTextString(m) }
 func (*ListGWInfoResponse) ProtoMessage()    {}
 func (*ListGWInfoResponse) Descriptor() ([]byte, []int) {
-	return fileDescriptor_3f226a441609c6cc, []int{13}
+	return fileDescriptor_3f226a441609c6cc, []int{14}
 }
 
 func (m *ListGWInfoResponse) XXX_Unmarshal(b []byte) error {
@@ -838,6 +878,7 @@ func init() {
 	proto.RegisterType((*ListAddedIPBlocksResponse)(nil), "magma.lte.ListAddedIPBlocksResponse")
 	proto.RegisterType((*SubscriberIPTableEntry)(nil), "magma.lte.SubscriberIPTableEntry")
 	proto.RegisterType((*SubscriberIPTable)(nil), "magma.lte.SubscriberIPTable")
+	proto.RegisterType((*SubscriberIDsFromIPsRequest)(nil), "magma.lte.SubscriberIDsFromIPsRequest")
 	proto.RegisterType((*AllocateIPRequest)(nil), "magma.lte.AllocateIPRequest")
 	proto.RegisterType((*ListAllocatedIPsResponse)(nil), "magma.lte.ListAllocatedIPsResponse")
 	proto.RegisterType((*ReleaseIPRequest)(nil), "magma.lte.ReleaseIPRequest")
@@ -850,60 +891,62 @@ func init() {
 func init() { proto.RegisterFile("lte/protos/mobilityd.proto", fileDescriptor_3f226a441609c6cc) }
 
 var fileDescriptor_3f226a441609c6cc = []byte{
-	// 841 bytes of a gzipped FileDescriptorProto
-	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x9c, 0x56, 0x6f, 0x6f, 0xda, 0x46,
-	0x18, 0x9f, 0x21, 0x83, 0xf0, 0xb0, 0x24, 0xe4, 0x46, 0x36, 0x70, 0x92, 0x85, 0x79, 0xd1, 0x94,
-	0x6d, 0x1a, 0x48, 0x24, 0x42, 0x91, 0x26, 0x4d, 0x21, 0x6d, 0xa1, 0x56, 0xd3, 0xca, 0x32, 0x11,
-	0x91, 0x2a, 0xb5, 0xc8, 0xd8, 0x17, 0x74, 0x8a, 0xed, 0x73, 0x7d, 0x86, 0x34, 0xea, 0x9b, 0x7e,
-	0x96, 0xbe, 0xec, 0x9b, 0x7e, 0x84, 0x7e, 0xb5, 0xca, 0x67, 0x1b, 0x6c, 0x30, 0x49, 0xc3, 0x2b,
-	0x9f, 0xcf, 0xbf, 0x7b, 0xfe, 0xfd, 0x7e, 0xcf, 0x73, 0x06, 0xd1, 0xf4, 0x70, 0xc3, 0x71, 0xa9,
-	0x47, 0x59, 0xc3, 0xa2, 0x43, 0x62, 0x12, 0xef, 0xce, 0xa8, 0xf3, 0x0d, 0x54, 0xb0, 0xb4, 0x91,
-	0xa5, 0xd5, 0x4d, 0x0f, 0x8b, 0xfb, 0x31, 0x18, 0x1b, 0x0f, 0x99, 0xee, 0x92, 0x21, 0x76, 0x8d,
-	0x61, 0x80, 0x14, 0xab, 0xd4, 0xd5, 0x4f, 0xdd, 0x08, 0xa0, 0x53, 0xcb, 0xa2, 0x76, 0xf0, 0x49,
-	0xfa, 0x28, 0x40, 0x41, 0x56, 0xda, 0x86, 0xe1, 0x62, 0xc6, 0xd0, 0x29, 0xe4, 0x27, 0xd8, 0x65,
-	0x84, 0xda, 0x15, 0xa1, 0x26, 0x1c, 0x6d, 0x36, 0x7f, 0xab, 0x4f, 0x9d, 0xd4, 0xa7, 0xb0, 0xba,
-	0xac, 0xf4, 0x03, 0x94, 0x1a, 0xc1, 0x51, 0x05, 0xf2, 0x5a, 0xf0, 0xb5, 0x92, 0xa9, 0x09, 0x47,
-	0x3f, 0xa9, 0xd1, 0xab, 0x74, 0xe0, 0x3b, 0x08, 0xf1, 0x68, 0x1d, 0xd6, 0x64, 0xa5, 0x7f, 0x52,
-	0xfa, 0x21, 0x5c, 0xb5, 0x4a, 0x82, 0xf4, 0x16, 0xaa, 0x6d, 0xd3, 0xa4, 0xba, 0xe6, 0xe1, 0xa9,
-	0x0b, 0x15, 0x33, 0x87, 0xda, 0x0c, 0xa3, 0x7f, 0x21, 0x4f, 0x9c, 0x81, 0x49, 0x98, 0x57, 0x11,
-	0x6a, 0xd9, 0xa3, 0x62, 0xb3, 0x9c, 0x16, 0x91, 0x9a, 0x23, 0xce, 0x05, 0x61, 0x1e, 0x42, 0xb0,
-	0x36, 0x31, 0x35, 0x9b, 0xc7, 0x50, 0x50, 0xf9, 0x5a, 0xfa, 0x22, 0xc0, 0x96, 0xac, 0x5c, 0x50,
-	0x7a, 0x33, 0x76, 0x54, 0xfc, 0x6e, 0x8c, 0x99, 0x87, 0xfe, 0x82, 0x2c, 0x23, 0x06, 0x4f, 0xb2,
-	0xd8, 0xfc, 0x35, 0x66, 0xb2, 0x37, 0xad, 0x9e, 0xfc, 0x54, 0xf5, 0x31, 0xa8, 0x04, 0x59, 0xcd,
-	0x89, 0x2c, 0xfa, 0x4b, 0xf4, 0xff, 0xac, 0x4a, 0x59, 0x5e, 0xa5, 0xc3, 0x44, 0x4c, 0x09, 0x4f,
-	0x29, 0xb5, 0x7a, 0xb8, 0x22, 0x9f, 0x04, 0xc8, 0xcb, 0xca, 0xb9, 0x49, 0xf5, 0x1b, 0xd4, 0x9a,
-	0xa7, 0x64, 0x2f, 0xe1, 0x8c, 0x83, 0xd2, 0x08, 0x39, 0x80, 0xa2, 0x8d, 0xbd, 0x41, 0x92, 0x14,
-	0xb0, 0xb1, 0x17, 0x71, 0xbd, 0x0f, 0xe0, 0xb8, 0xf8, 0x9a, 0xbc, 0x1f, 0x98, 0x38, 0x48, 0x64,
-	0x43, 0x2d, 0x04, 0x3b, 0x17, 0xf8, 0x3b, 0x82, 0xec, 0x41, 0xd5, 0x2f, 0x79, 0xdb, 0x30, 0xb0,
-	0x11, 0xc6, 0x31, 0xa3, 0xad, 0x05, 0x1b, 0xc4, 0x19, 0x0c, 0xfd, 0xcd, 0x38, 0x79, 0x68, 0x31,
-	0x76, 0xb5, 0x48, 0x1c, 0xbe, 0xf0, 0x8d, 0x49, 0x1f, 0xe0, 0x97, 0x18, 0x03, 0xca, 0xa5, 0x36,
-	0x34, 0xf1, 0x33, 0xdb, 0x73, 0xef, 0x1e, 0xc3, 0xd8, 0x21, 0x64, 0x88, 0xc3, 0x33, 0x5e, 0x26,
-	0x97, 0x0c, 0x71, 0x22, 0x5e, 0xb3, 0x53, 0x5e, 0x25, 0x05, 0xb6, 0x17, 0x9c, 0xa3, 0xff, 0x20,
-	0x8f, 0x6d, 0xcf, 0x25, 0x98, 0x85, 0x39, 0xfc, 0x9e, 0xee, 0x3b, 0x16, 0xab, 0x1a, 0x9d, 0x90,
-	0xbe, 0x0a, 0xb0, 0x3d, 0xd3, 0xf6, 0x0a, 0xe2, 0x3b, 0x9b, 0xb1, 0x9f, 0xe1, 0xec, 0xff, 0x19,
-	0x83, 0x2f, 0x58, 0x4e, 0xd3, 0xc1, 0x62, 0x9a, 0xff, 0x3c, 0xc0, 0x2c, 0x02, 0xc8, 0xf9, 0x7b,
-	0xfd, 0x56, 0x29, 0x23, 0xc9, 0x50, 0xe1, 0x2c, 0x87, 0xae, 0x0c, 0x59, 0x59, 0xb5, 0x37, 0xa5,
-	0x31, 0x94, 0x54, 0x6c, 0x62, 0x8d, 0xad, 0x56, 0x8a, 0x55, 0x59, 0x7d, 0x03, 0x65, 0x15, 0x5b,
-	0x74, 0x82, 0x23, 0xc1, 0x85, 0xae, 0x1b, 0x50, 0x88, 0x24, 0xca, 0xee, 0x91, 0xe7, 0x7a, 0x28,
-	0x4f, 0x86, 0xca, 0xf0, 0xe3, 0x35, 0x75, 0x75, 0xcc, 0x63, 0x58, 0x57, 0x83, 0x17, 0xe9, 0x39,
-	0xec, 0xcc, 0x99, 0x0f, 0xab, 0xf3, 0x58, 0xfb, 0xd2, 0x25, 0xe4, 0xba, 0x57, 0xb2, 0x7d, 0x4d,
-	0xc3, 0x54, 0x85, 0x87, 0x53, 0xb5, 0x34, 0x3d, 0x1a, 0x4c, 0x96, 0xa6, 0x4f, 0xa7, 0x5f, 0x36,
-	0x36, 0xfd, 0xce, 0x00, 0xf9, 0xd5, 0x0f, 0x2c, 0x4f, 0x83, 0xfb, 0x1b, 0xf2, 0xa3, 0xdb, 0x38,
-	0x75, 0xdb, 0x31, 0x37, 0x21, 0x36, 0x37, 0xba, 0xf5, 0x4f, 0x36, 0x3f, 0xe7, 0x60, 0xeb, 0x65,
-	0x78, 0xf7, 0xf4, 0xb0, 0x3b, 0x21, 0x3a, 0x46, 0xc7, 0x00, 0x6d, 0x23, 0x6a, 0x7b, 0x94, 0x92,
-	0x97, 0x18, 0x19, 0xe4, 0x57, 0x4f, 0xbd, 0x4f, 0x89, 0x81, 0x5e, 0xc1, 0xcf, 0xb1, 0x89, 0x31,
-	0x39, 0x09, 0xeb, 0xba, 0x88, 0x14, 0xe3, 0x03, 0x75, 0xf9, 0x90, 0x79, 0x01, 0xa5, 0x79, 0x6d,
-	0xa6, 0x86, 0xf2, 0xc7, 0xbc, 0xb5, 0x34, 0x31, 0x5f, 0xc5, 0x3b, 0x35, 0x9a, 0x91, 0x7b, 0xf7,
-	0x75, 0x5b, 0x22, 0xca, 0xe5, 0x37, 0xd8, 0x79, 0x4c, 0xf6, 0x91, 0xdd, 0xdd, 0xd8, 0xc9, 0xf9,
-	0x9e, 0x48, 0xab, 0x5c, 0x07, 0x50, 0x17, 0x7b, 0xb2, 0xd2, 0xa1, 0xee, 0xac, 0x31, 0x90, 0xb8,
-	0xfc, 0xda, 0x11, 0x53, 0x65, 0x83, 0x3a, 0xb0, 0xd3, 0xc5, 0x5e, 0xbc, 0xb7, 0x3a, 0x2e, 0xb5,
-	0x64, 0x05, 0xa5, 0xc2, 0xc5, 0x65, 0x0d, 0x89, 0xba, 0x50, 0x4e, 0xda, 0x09, 0x87, 0x65, 0x0a,
-	0x95, 0x7b, 0xf7, 0x8d, 0x4b, 0xa4, 0xc2, 0x46, 0xa2, 0x7b, 0xd0, 0x41, 0xa2, 0x32, 0x8b, 0x6d,
-	0x2b, 0xd6, 0x96, 0x03, 0xc2, 0x82, 0x3f, 0x81, 0x2d, 0xae, 0x78, 0xcd, 0xc3, 0xb7, 0xda, 0x1d,
-	0x6f, 0xa8, 0x94, 0xb8, 0xf6, 0xe7, 0x44, 0x31, 0xd7, 0x20, 0x2d, 0xd8, 0xec, 0xe1, 0x54, 0x1b,
-	0xb3, 0x0e, 0x49, 0x61, 0xea, 0x7c, 0xf7, 0x75, 0x95, 0xef, 0x35, 0xfc, 0x3f, 0x32, 0xdd, 0xa4,
-	0x63, 0xa3, 0x31, 0xa2, 0xe1, 0x9f, 0xd7, 0x30, 0xc7, 0x9f, 0xc7, 0xdf, 0x02, 0x00, 0x00, 0xff,
-	0xff, 0x26, 0xfe, 0xea, 0x1f, 0xd6, 0x09, 0x00, 0x00,
+	// 873 bytes of a gzipped FileDescriptorProto
+	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x9c, 0x56, 0xdd, 0x6e, 0xe3, 0x44,
+	0x14, 0xc6, 0xc9, 0x92, 0x34, 0xa7, 0x74, 0x9b, 0x0e, 0x5d, 0x36, 0x71, 0x5b, 0x1a, 0xcc, 0x6a,
+	0x55, 0x40, 0x24, 0x52, 0x76, 0x15, 0xad, 0x84, 0x84, 0x36, 0x05, 0x12, 0x2c, 0x02, 0xb2, 0x9c,
+	0x55, 0x56, 0x42, 0x82, 0xc8, 0xb1, 0xa7, 0xd1, 0x68, 0x6d, 0x8f, 0xf1, 0x38, 0x29, 0x15, 0x37,
+	0xdc, 0xf3, 0x16, 0xbc, 0x00, 0x8f, 0xc0, 0xab, 0x21, 0x8f, 0x3d, 0xc9, 0xd8, 0x71, 0x52, 0x9a,
+	0x2b, 0x8f, 0xc7, 0xdf, 0x9c, 0x9f, 0xef, 0x7c, 0xe7, 0x8c, 0x41, 0x75, 0x23, 0xdc, 0x09, 0x42,
+	0x1a, 0x51, 0xd6, 0xf1, 0xe8, 0x8c, 0xb8, 0x24, 0xba, 0x73, 0xda, 0x7c, 0x03, 0xd5, 0x3c, 0x6b,
+	0xee, 0x59, 0x6d, 0x37, 0xc2, 0xea, 0x85, 0x04, 0x63, 0x8b, 0x19, 0xb3, 0x43, 0x32, 0xc3, 0xa1,
+	0x33, 0x4b, 0x90, 0x6a, 0x93, 0x86, 0xf6, 0xab, 0x50, 0x00, 0x6c, 0xea, 0x79, 0xd4, 0x4f, 0x3e,
+	0x69, 0x7f, 0x2a, 0x50, 0xd3, 0x8d, 0xbe, 0xe3, 0x84, 0x98, 0x31, 0xf4, 0x0a, 0xaa, 0x4b, 0x1c,
+	0x32, 0x42, 0xfd, 0x86, 0xd2, 0x52, 0xae, 0x1e, 0x77, 0x3f, 0x6e, 0xaf, 0x9c, 0xb4, 0x57, 0xb0,
+	0xb6, 0x6e, 0x4c, 0x12, 0x94, 0x29, 0xe0, 0xa8, 0x01, 0x55, 0x2b, 0xf9, 0xda, 0x28, 0xb5, 0x94,
+	0xab, 0x0f, 0x4c, 0xf1, 0xaa, 0x5d, 0xc6, 0x0e, 0x52, 0x3c, 0x3a, 0x80, 0x47, 0xba, 0x31, 0x79,
+	0x59, 0x7f, 0x2f, 0x5d, 0xf5, 0xea, 0x8a, 0xf6, 0x2b, 0x34, 0xfb, 0xae, 0x4b, 0x6d, 0x2b, 0xc2,
+	0x2b, 0x17, 0x26, 0x66, 0x01, 0xf5, 0x19, 0x46, 0x5f, 0x42, 0x95, 0x04, 0x53, 0x97, 0xb0, 0xa8,
+	0xa1, 0xb4, 0xca, 0x57, 0x87, 0xdd, 0xd3, 0xa2, 0x88, 0xcc, 0x0a, 0x09, 0x46, 0x84, 0x45, 0x08,
+	0xc1, 0xa3, 0xa5, 0x6b, 0xf9, 0x3c, 0x86, 0x9a, 0xc9, 0xd7, 0xda, 0x3f, 0x0a, 0x1c, 0xeb, 0xc6,
+	0x88, 0xd2, 0x77, 0x8b, 0xc0, 0xc4, 0xbf, 0x2d, 0x30, 0x8b, 0xd0, 0x67, 0x50, 0x66, 0xc4, 0xe1,
+	0x49, 0x1e, 0x76, 0x9f, 0x4a, 0x26, 0xc7, 0x2b, 0xf6, 0xf4, 0x6f, 0xcd, 0x18, 0x83, 0xea, 0x50,
+	0xb6, 0x02, 0x61, 0x31, 0x5e, 0xa2, 0xaf, 0xd7, 0x2c, 0x95, 0x39, 0x4b, 0xcf, 0x32, 0x31, 0x65,
+	0x3c, 0x15, 0x70, 0x75, 0x3f, 0x23, 0x7f, 0x2b, 0x50, 0xd5, 0x8d, 0x6b, 0x97, 0xda, 0xef, 0x50,
+	0x2f, 0x5f, 0x92, 0xf3, 0x8c, 0x33, 0x0e, 0x2a, 0x2a, 0xc8, 0x25, 0x1c, 0xfa, 0x38, 0x9a, 0x66,
+	0x8b, 0x02, 0x3e, 0x8e, 0x44, 0xad, 0x2f, 0x00, 0x82, 0x10, 0xdf, 0x90, 0xdf, 0xa7, 0x2e, 0x4e,
+	0x12, 0x39, 0x32, 0x6b, 0xc9, 0xce, 0x08, 0xff, 0x8f, 0x20, 0xc7, 0xd0, 0x8c, 0x29, 0xef, 0x3b,
+	0x0e, 0x76, 0xd2, 0x38, 0xd6, 0x65, 0xeb, 0xc1, 0x11, 0x09, 0xa6, 0xb3, 0x78, 0x53, 0x2e, 0x1e,
+	0xda, 0x8c, 0xdd, 0x3c, 0x24, 0x01, 0x5f, 0xc4, 0xc6, 0xb4, 0x3f, 0xe0, 0x23, 0xa9, 0x02, 0xc6,
+	0x1b, 0x6b, 0xe6, 0xe2, 0xef, 0xfc, 0x28, 0xbc, 0x7b, 0x48, 0xc5, 0x9e, 0x41, 0x89, 0x04, 0x3c,
+	0xe3, 0x6d, 0x72, 0x29, 0x91, 0x40, 0xd4, 0xb5, 0xbc, 0xaa, 0xab, 0x66, 0xc0, 0xc9, 0x86, 0x73,
+	0xf4, 0x15, 0x54, 0xb1, 0x1f, 0x85, 0x04, 0xb3, 0x34, 0x87, 0x4f, 0x8a, 0x7d, 0x4b, 0xb1, 0x9a,
+	0xe2, 0x84, 0x36, 0x82, 0x33, 0x39, 0x3c, 0x36, 0x08, 0xa9, 0xa7, 0x1b, 0x4c, 0xa8, 0xf0, 0x61,
+	0xe2, 0xd6, 0xfe, 0x55, 0xe0, 0x64, 0xdd, 0x29, 0x7b, 0x48, 0xf9, 0xf5, 0x5a, 0x4b, 0x25, 0xae,
+	0xa5, 0xe7, 0x12, 0x7c, 0xc3, 0x72, 0x91, 0xaa, 0x36, 0x49, 0xfb, 0xe2, 0x1e, 0x9d, 0x20, 0x80,
+	0x4a, 0xbc, 0x37, 0xe9, 0xd5, 0x4b, 0x9a, 0x0e, 0x0d, 0xae, 0x99, 0xd4, 0x95, 0xc3, 0xb9, 0xd8,
+	0xab, 0xd3, 0xb5, 0x05, 0xd4, 0x4d, 0xec, 0x62, 0x8b, 0xed, 0x47, 0xc5, 0xbe, 0x1a, 0xf9, 0x05,
+	0x4e, 0x4d, 0xec, 0xd1, 0x25, 0x16, 0xf2, 0x4d, 0x5d, 0x77, 0xa0, 0x26, 0x04, 0xcf, 0x76, 0x88,
+	0xfd, 0x20, 0x15, 0x3b, 0x43, 0xa7, 0xf0, 0xfe, 0x0d, 0x0d, 0x6d, 0xcc, 0x63, 0x38, 0x30, 0x93,
+	0x17, 0xed, 0x7b, 0x78, 0x92, 0x33, 0x9f, 0xb2, 0xf3, 0x50, 0xfb, 0xda, 0x1b, 0xa8, 0x0c, 0xdf,
+	0xea, 0xfe, 0x0d, 0x4d, 0x53, 0x55, 0xee, 0x4f, 0xd5, 0xb3, 0x6c, 0x31, 0xe6, 0x3c, 0xcb, 0x5e,
+	0xcd, 0xd2, 0xb2, 0x34, 0x4b, 0x5f, 0x03, 0x8a, 0xd9, 0x4f, 0x2c, 0xaf, 0x82, 0xfb, 0x1c, 0xaa,
+	0xf3, 0x5b, 0xb9, 0x74, 0x27, 0x92, 0x9b, 0x14, 0x5b, 0x99, 0xdf, 0xc6, 0x27, 0xbb, 0x7f, 0x55,
+	0xe1, 0xf8, 0xc7, 0xf4, 0x26, 0x1b, 0xe3, 0x70, 0x49, 0x6c, 0x8c, 0x5e, 0x00, 0xf4, 0x1d, 0x31,
+	0x44, 0x50, 0x41, 0x5e, 0xaa, 0x30, 0xc8, 0x2f, 0xb2, 0xf6, 0x84, 0x12, 0x07, 0xfd, 0x04, 0x1f,
+	0x4a, 0xf3, 0x67, 0xf9, 0x32, 0xe5, 0x75, 0x13, 0xa9, 0xca, 0xe3, 0x79, 0xfb, 0xc8, 0xfa, 0x01,
+	0xea, 0x79, 0x6d, 0x16, 0x86, 0xf2, 0x69, 0xde, 0x5a, 0x91, 0x98, 0xdf, 0xca, 0x9d, 0x2a, 0x26,
+	0xee, 0xf9, 0xae, 0x6e, 0xcb, 0x44, 0xb9, 0xfd, 0x3e, 0xbc, 0x96, 0x64, 0x2f, 0xec, 0x9e, 0x49,
+	0x27, 0xf3, 0x3d, 0x51, 0xc4, 0xdc, 0x00, 0xd0, 0x10, 0x47, 0xba, 0x31, 0xa0, 0xe1, 0xba, 0x31,
+	0x90, 0xba, 0xfd, 0x12, 0x53, 0x0b, 0x65, 0x83, 0x06, 0xf0, 0x64, 0x88, 0x23, 0xb9, 0xb7, 0x92,
+	0xf9, 0x86, 0x0a, 0xe1, 0xea, 0xb6, 0x86, 0x44, 0x53, 0x78, 0x9a, 0xb3, 0x23, 0x06, 0x25, 0x7a,
+	0xbe, 0xe5, 0x4c, 0x6e, 0x92, 0xaa, 0xe7, 0xbb, 0x86, 0x32, 0x1a, 0xc2, 0x69, 0xd6, 0x41, 0xba,
+	0x5f, 0xa0, 0x95, 0xdd, 0x86, 0x4c, 0x38, 0xca, 0xb4, 0x27, 0xba, 0xcc, 0x50, 0xbf, 0x39, 0x17,
+	0xd4, 0xd6, 0x76, 0x40, 0x5a, 0xd1, 0x6f, 0xe0, 0x98, 0xb7, 0x94, 0x15, 0xe1, 0x5b, 0xeb, 0x8e,
+	0x77, 0x6c, 0x41, 0x5c, 0x17, 0x39, 0xd5, 0xe5, 0x3a, 0xb0, 0x07, 0x8f, 0xc7, 0xb8, 0xd0, 0xc6,
+	0xba, 0x05, 0x0b, 0xa4, 0x70, 0x7d, 0xf6, 0x73, 0x93, 0xef, 0x75, 0xe2, 0x1f, 0x48, 0xdb, 0xa5,
+	0x0b, 0xa7, 0x33, 0xa7, 0xe9, 0x8f, 0xe2, 0xac, 0xc2, 0x9f, 0x2f, 0xfe, 0x0b, 0x00, 0x00, 0xff,
+	0xff, 0x65, 0x7c, 0x90, 0x67, 0x85, 0x0a, 0x00, 0x00,
 }
 
 // Reference imports to suppress errors if they are not otherwise used.
@@ -945,6 +988,9 @@ type MobilityServiceClient interface {
 	// Gets subscriber's ID from an IP Address.
 	// Throws NOT_FOUND if it doesn't exist
 	GetSubscriberIDFromIP(ctx context.Context, in *IPAddress, opts ...grpc.CallOption) (*SubscriberID, error)
+	// Gets the subscriber IDs of a list of IP Addresses in one call.
+	// IPs that are not allocated are left out of the returned table
+	GetSubscriberIDsFromIPs(ctx context.Context, in *SubscriberIDsFromIPsRequest, opts ...grpc.CallOption) (*SubscriberIPTable, error)
 	// Get the full subscriber table
 	GetSubscriberIPTable(ctx context.Context, in *protos.Void, opts ...grpc.CallOption) (*SubscriberIPTable, error)
 	// Remove allocated IP blocks
@@ -1029,6 +1075,15 @@ func (c *mobilityServiceClient) GetSubscriberIDFromIP(ctx context.Context, in *I
 	return out, nil
 }
 
+func (c *mobilityServiceClient) GetSubscriberIDsFromIPs(ctx context.Context, in *SubscriberIDsFromIPsRequest, opts ...grpc.CallOption) (*SubscriberIPTable, error) {
+	out := new(SubscriberIPTable)
+	err := c.cc.Invoke(ctx, "/magma.lte.MobilityService/GetSubscriberIDsFromIPs", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *mobilityServiceClient) GetSubscriberIPTable(ctx context.Context, in *protos.Void, opts ...grpc.CallOption) (*SubscriberIPTable, error) {
 	out := new(SubscriberIPTable)
 	err := c.cc.Invoke(ctx, "/magma.lte.MobilityService/GetSubscriberIPTable", in, out, opts...)
@@ -1094,6 +1149,9 @@ type MobilityServiceServer interface {
 	// Gets subscriber's ID from an IP Address.
 	// Throws NOT_FOUND if it doesn't exist
 	GetSubscriberIDFromIP(context.Context, *IPAddress) (*SubscriberID, error)
+	// Gets the subscriber IDs of a list of IP Addresses in one call.
+	// IPs that are not allocated are left out of the returned table
+	GetSubscriberIDsFromIPs(context.Context, *SubscriberIDsFromIPsRequest) (*SubscriberIPTable, error)
 	// Get the full subscriber table
 	GetSubscriberIPTable(context.Context, *protos.Void) (*SubscriberIPTable, error)
 	// Remove allocated IP blocks
@@ -1132,6 +1190,9 @@ func (*UnimplementedMobilityServiceServer) GetIPForSubscriber(ctx context.Contex
 func (*UnimplementedMobilityServiceServer) GetSubscriberIDFromIP(ctx context.Context, req *IPAddress) (*SubscriberID, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetSubscriberIDFromIP not implemented")
 }
+func (*UnimplementedMobilityServiceServer) GetSubscriberIDsFromIPs(ctx context.Context, req *SubscriberIDsFromIPsRequest) (*SubscriberIPTable, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetSubscriberIDsFromIPs not implemented")
+}
 func (*UnimplementedMobilityServiceServer) GetSubscriberIPTable(ctx context.Context, req *protos.Void) (*SubscriberIPTable, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetSubscriberIPTable not implemented")
 }
@@ -1275,6 +1336,24 @@ func _MobilityService_GetSubscriberIDFromIP_Handler(srv interface{}, ctx context
 	return interceptor(ctx, in, info, handler)
 }
 
+func _MobilityService_GetSubscriberIDsFromIPs_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(SubscriberIDsFromIPsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(MobilityServiceServer).GetSubscriberIDsFromIPs(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/magma.lte.MobilityService/GetSubscriberIDsFromIPs",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(MobilityServiceServer).GetSubscriberIDsFromIPs(ctx, req.(*SubscriberIDsFromIPsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _MobilityService_GetSubscriberIPTable_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(protos.Void)
 	if err := dec(in); err != nil {
@@ -1379,6 +1458,10 @@ var _MobilityService_serviceDesc = grpc.ServiceDesc{
 			MethodName: "GetSubscriberIDFromIP",
 			Handler:    _MobilityService_GetSubscriberIDFromIP_Handler,
 		},
+		{
+			MethodName: "GetSubscriberIDsFromIPs",
+			Handler:    _MobilityService_GetSubscriberIDsFromIPs_Handler,
+		},
 		{
 			MethodName: "GetSubscriberIPTable",
 			Handler:    _MobilityService_GetSubscriberIPTable_Handler,
@@ -1356,7 +1356,11 @@ func (m *RuleRecord) GetFinalRecord() bool {
 type RuleRecordTable struct {
 	Records []*RuleRecord `protobuf:"bytes,1,rep,name=records,proto3" json:"records,omitempty"`
 	// Time at which PipelineD started
-	Epoch                uint64   `protobuf:"varint,2,opt,name=epoch,proto3" json:"epoch,omitempty"`
+	Epoch uint64 `protobuf:"varint,2,opt,name=epoch,proto3" json:"epoch,omitempty"`
+	// If set, records only holds the rule records that changed since the last
+	// report, and records of ended flows (with final_record set). Absence of a
+	// record does not mean its flows have ended.
+	DeltaUpdate          bool     `protobuf:"varint,3,opt,name=delta_update,json=deltaUpdate,proto3" json:"delta_update,omitempty"`
 	XXX_NoUnkeyedLiteral struct{} `json:"-"`
 	XXX_unrecognized     []byte   `json:"-"`
 	XXX_sizecache        int32    `json:"-"`
@@ -1401,6 +1405,13 @@ func (m *RuleRecordTable) GetEpoch() uint64 {
 	return 0
 }
 
+func (m *RuleRecordTable) GetDeltaUpdate() bool {
+	if m != nil {
+		return m.DeltaUpdate
+	}
+	return false
+}
+
 type LocalCreateSessionRequest struct {
 	CommonContext        *CommonSessionContext `protobuf:"bytes,16,opt,name=common_context,json=commonContext,proto3" json:"common_context,omitempty"`
 	RatSpecificContext   *RatSpecificContext   `protobuf:"bytes,17,opt,name=rat_specific_context,json=ratSpecificContext,proto3" json:"rat_specific_context,omitempty"`
@@ -6392,520 +6403,521 @@ func init() {
 func init() { proto.RegisterFile("lte/protos/session_manager.proto", fileDescriptor_85add0446af78174) }
 
 var fileDescriptor_85add0446af78174 = []byte{
-	// 8879 bytes of a gzipped FileDescriptorProto
+	// 8895 bytes of a gzipped FileDescriptorProto
 	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0xcc, 0x7d, 0x4b, 0x8c, 0x1b, 0x49,
-	0x96, 0x98, 0x48, 0xd6, 0x87, 0xf5, 0xf8, 0xa9, 0xac, 0xa8, 0x1f, 0xab, 0x5a, 0x6a, 0xa9, 0xa9,
+	0x96, 0x98, 0xc8, 0xfa, 0x90, 0xf5, 0xf8, 0xa9, 0xac, 0xa8, 0x1f, 0xab, 0x5a, 0x6a, 0xa9, 0xa9,
 	0x56, 0xb7, 0x46, 0x33, 0x5d, 0xea, 0xae, 0x6e, 0xa9, 0x5b, 0xd3, 0x33, 0xd3, 0x66, 0x25, 0x93,
 	0x55, 0x39, 0xe2, 0x4f, 0x91, 0x49, 0xa9, 0xd5, 0x86, 0x37, 0x9c, 0x62, 0x06, 0x4b, 0x69, 0x91,
-	0x99, 0x54, 0x66, 0x52, 0xaa, 0x9a, 0x9b, 0x31, 0x27, 0x1f, 0x7c, 0x30, 0x16, 0x86, 0xb1, 0x17,
-	0xdb, 0xc0, 0xc2, 0x27, 0x03, 0xbe, 0xd8, 0x8b, 0xb5, 0xc7, 0x87, 0xc5, 0x1a, 0x0b, 0xaf, 0x4f,
-	0x86, 0x0f, 0x86, 0x0f, 0x86, 0x61, 0x18, 0x3e, 0xf8, 0x60, 0xf8, 0xb0, 0x37, 0x03, 0x3e, 0x19,
-	0xf1, 0xc9, 0x64, 0x26, 0xc9, 0x2a, 0xa9, 0xd5, 0xbd, 0xc0, 0x00, 0x05, 0x30, 0xe3, 0xbd, 0x17,
-	0xff, 0x17, 0xef, 0xbd, 0x78, 0x11, 0x2f, 0x0a, 0x6e, 0x0c, 0x43, 0x7a, 0x77, 0xec, 0x7b, 0xa1,
-	0x17, 0xdc, 0x0d, 0x68, 0x10, 0x38, 0x9e, 0x4b, 0x46, 0x96, 0x6b, 0x9d, 0x52, 0xff, 0x80, 0x83,
-	0xd1, 0xda, 0xc8, 0x3a, 0x1d, 0x59, 0x07, 0xc3, 0x90, 0xee, 0xef, 0x79, 0x7e, 0xff, 0x2b, 0x3f,
-	0x22, 0xef, 0x7b, 0xa3, 0x91, 0xe7, 0x0a, 0xaa, 0xfd, 0xbd, 0x44, 0x39, 0x63, 0x6f, 0xe8, 0xf4,
-	0xcf, 0xed, 0x67, 0x12, 0x75, 0x2d, 0x59, 0xc5, 0xe4, 0x59, 0xd0, 0xf7, 0x9d, 0x67, 0xd4, 0x8f,
-	0xd1, 0xd7, 0x4f, 0x3d, 0xef, 0x74, 0x28, 0x29, 0x9e, 0x4d, 0x06, 0x77, 0x43, 0x67, 0x44, 0x83,
-	0xd0, 0x1a, 0x8d, 0x05, 0x41, 0xf5, 0x4f, 0xb3, 0x00, 0x78, 0x32, 0xa4, 0x98, 0xf6, 0x3d, 0xdf,
-	0x46, 0x0a, 0xe4, 0x02, 0xc7, 0xae, 0x64, 0x6e, 0x64, 0x6e, 0xaf, 0x61, 0xf6, 0x89, 0x76, 0x61,
-	0xd5, 0x9f, 0x0c, 0x29, 0x71, 0xec, 0x4a, 0x96, 0x43, 0x57, 0x58, 0x52, 0xb7, 0xd1, 0x1e, 0xe4,
-	0x9f, 0x9d, 0x87, 0x34, 0x20, 0xe1, 0x59, 0x25, 0x77, 0x23, 0x73, 0x7b, 0x09, 0xaf, 0xf2, 0xb4,
-	0x79, 0x36, 0x45, 0xf9, 0x67, 0x95, 0xa5, 0x04, 0x0a, 0x9f, 0xb1, 0xe2, 0x26, 0x94, 0x38, 0xe3,
-	0x57, 0x5f, 0x54, 0x96, 0x45, 0x71, 0x13, 0xaa, 0x8f, 0x5f, 0x7d, 0x31, 0x45, 0xdc, 0xaf, 0xac,
-	0x24, 0x10, 0xf7, 0xd1, 0x35, 0x00, 0xdb, 0xf7, 0xc6, 0x63, 0x6a, 0xb3, 0x9a, 0x56, 0x79, 0x71,
-	0x6b, 0x12, 0x62, 0x9e, 0x25, 0xd1, 0xfe, 0x59, 0x25, 0x9f, 0x42, 0xe3, 0x33, 0xf4, 0x01, 0x14,
-	0x79, 0xf3, 0x5f, 0x51, 0x9f, 0x0d, 0x7f, 0x65, 0x8d, 0x13, 0x14, 0x18, 0xec, 0xb1, 0x00, 0x21,
-	0x04, 0x4b, 0x21, 0x75, 0xec, 0x0a, 0xdc, 0xc8, 0xdc, 0x2e, 0x61, 0xfe, 0xcd, 0xb2, 0x0d, 0x1c,
-	0xd7, 0x1a, 0x12, 0x9f, 0x8f, 0x4b, 0xa5, 0x70, 0x23, 0x73, 0x3b, 0x8f, 0x0b, 0x1c, 0x26, 0x86,
-	0xaa, 0xfa, 0x2d, 0xac, 0x4f, 0x07, 0xce, 0xb4, 0x9e, 0x0d, 0x29, 0xba, 0x0b, 0xab, 0x82, 0x3e,
-	0xa8, 0x64, 0x6e, 0xe4, 0x6e, 0x17, 0x0e, 0xb7, 0x0f, 0xe2, 0xf9, 0x3d, 0x98, 0x12, 0xe3, 0x88,
-	0x0a, 0x6d, 0xc1, 0x32, 0x1d, 0x7b, 0xfd, 0xe7, 0x7c, 0x68, 0x97, 0xb0, 0x48, 0x54, 0xff, 0x55,
-	0x06, 0xf6, 0x9a, 0x5e, 0xdf, 0x1a, 0xaa, 0x3e, 0xb5, 0x42, 0x6a, 0x08, 0xce, 0xc1, 0xf4, 0xe5,
-	0x84, 0x06, 0x21, 0x6a, 0x40, 0x59, 0x30, 0x07, 0xe9, 0x7b, 0x6e, 0x48, 0xcf, 0xc2, 0x8a, 0x72,
-	0x23, 0x73, 0xbb, 0x70, 0x78, 0x3d, 0x51, 0x97, 0xca, 0x09, 0x64, 0x46, 0x55, 0x90, 0xe1, 0x92,
-	0xc8, 0x26, 0x93, 0xa8, 0x03, 0x5b, 0xbe, 0x15, 0x92, 0x60, 0x4c, 0xfb, 0xce, 0xc0, 0xe9, 0xc7,
-	0xa5, 0x6d, 0xf0, 0xd2, 0xae, 0x25, 0x5b, 0x6e, 0x85, 0x86, 0xa4, 0x8a, 0xca, 0x42, 0xfe, 0x1c,
-	0xac, 0xfa, 0x4b, 0x58, 0x36, 0xa9, 0x63, 0x07, 0x6c, 0xfa, 0xa9, 0xfb, 0x8c, 0xf0, 0x41, 0xcd,
-	0xf1, 0x41, 0x5d, 0xa5, 0xee, 0x33, 0x86, 0x63, 0x28, 0xeb, 0xf4, 0xb5, 0x40, 0x2d, 0x09, 0x94,
-	0x75, 0xfa, 0x9a, 0xa1, 0xaa, 0xff, 0x3b, 0x0b, 0x5b, 0x8b, 0xda, 0x8d, 0x7e, 0x32, 0xe5, 0xc9,
-	0xc2, 0xe1, 0x6e, 0xa2, 0x5d, 0x46, 0xcc, 0xef, 0x7a, 0x3d, 0x66, 0xd6, 0x88, 0xbb, 0x72, 0x29,
-	0xee, 0x52, 0x20, 0x67, 0x8d, 0x5d, 0x5e, 0xe5, 0x1a, 0x66, 0x9f, 0x68, 0x07, 0x56, 0x46, 0x81,
-	0x13, 0xd8, 0x2e, 0xe7, 0xc3, 0x22, 0x96, 0x29, 0xf4, 0x09, 0xe4, 0xd9, 0xb0, 0x84, 0xe7, 0x63,
-	0xca, 0x19, 0xb1, 0x7c, 0x88, 0x92, 0x43, 0x51, 0x33, 0xcd, 0xf3, 0x31, 0xc5, 0xab, 0xbe, 0x15,
-	0xb2, 0x0f, 0xd4, 0x00, 0x25, 0x18, 0x91, 0x68, 0x71, 0x07, 0xa1, 0x15, 0x52, 0xce, 0xa3, 0xe5,
-	0xc3, 0xab, 0xc9, 0x96, 0xb6, 0x64, 0x9f, 0x1a, 0x46, 0xcb, 0x60, 0x34, 0xb8, 0x1c, 0x8c, 0x24,
-	0x88, 0xa7, 0xd1, 0xcf, 0x00, 0x25, 0xca, 0x49, 0x72, 0x6b, 0x09, 0x2b, 0x31, 0x6d, 0xc4, 0xb2,
-	0x89, 0xc5, 0x02, 0xa9, 0xc5, 0xf2, 0x11, 0x2c, 0xb3, 0xb1, 0x0d, 0x38, 0xc3, 0x16, 0x0e, 0x95,
-	0x44, 0x1b, 0xf8, 0xdc, 0x60, 0x81, 0xae, 0xfe, 0xbf, 0x0c, 0xa0, 0xf9, 0x69, 0x45, 0xdf, 0x40,
-	0x61, 0x18, 0xd2, 0x19, 0x56, 0x48, 0x76, 0xa4, 0x69, 0x6a, 0xe9, 0xd9, 0x39, 0xb9, 0x82, 0x61,
-	0x18, 0xd2, 0xa8, 0x80, 0x23, 0x28, 0xbe, 0x1e, 0x5a, 0x53, 0xd6, 0x44, 0x73, 0xcc, 0xf4, 0xa4,
-	0x59, 0x6b, 0xcf, 0x15, 0x51, 0x60, 0x99, 0xa2, 0x32, 0x4c, 0xd8, 0x1e, 0xdd, 0x3b, 0x4d, 0x8c,
-	0x46, 0x54, 0xd8, 0x26, 0x2f, 0xec, 0xfd, 0x44, 0x61, 0xad, 0x7b, 0xc7, 0xf1, 0xd0, 0x4e, 0x4b,
-	0xdb, 0xe4, 0xd9, 0xd3, 0xe0, 0xa3, 0x35, 0x58, 0x95, 0xe5, 0x54, 0xff, 0x41, 0x06, 0x56, 0xd9,
-	0x68, 0x18, 0x34, 0x8c, 0x17, 0x7f, 0x26, 0xb1, 0xf8, 0xab, 0x50, 0xa2, 0xae, 0xcd, 0xd9, 0x88,
-	0x58, 0xb6, 0xed, 0x4b, 0xc1, 0x57, 0xa0, 0xae, 0xcd, 0x98, 0xa9, 0x66, 0xdb, 0x3e, 0x13, 0x3b,
-	0x8c, 0x96, 0xbc, 0xb2, 0x86, 0x13, 0x2a, 0xb9, 0x7c, 0x8d, 0x41, 0x1e, 0x33, 0x00, 0xba, 0x0b,
-	0x5b, 0xa9, 0x22, 0x48, 0x10, 0xfa, 0x8e, 0x7b, 0x2a, 0x19, 0x70, 0x23, 0x51, 0x92, 0xc1, 0x11,
-	0xd5, 0xdf, 0xe5, 0x60, 0x37, 0x31, 0x21, 0x6d, 0x2f, 0x64, 0x3f, 0x56, 0xc8, 0x66, 0xfb, 0x43,
-	0x28, 0x8f, 0xed, 0x49, 0x3c, 0x1c, 0x71, 0x6b, 0x8b, 0x63, 0x7b, 0x22, 0x7b, 0xa9, 0xdb, 0xe8,
-	0x01, 0x14, 0x7d, 0x21, 0x22, 0x04, 0xf3, 0x66, 0x39, 0x17, 0xee, 0x24, 0x99, 0x57, 0xa0, 0x39,
-	0x03, 0x17, 0xfc, 0x69, 0x02, 0xdd, 0x87, 0x82, 0xd5, 0xef, 0xd3, 0x20, 0x10, 0x39, 0x73, 0x3c,
-	0x67, 0x52, 0x76, 0xd5, 0x38, 0x96, 0x67, 0x04, 0x2b, 0xfe, 0x46, 0x2a, 0x28, 0xc9, 0x86, 0xf1,
-	0xcc, 0x4b, 0x3c, 0xf3, 0x5e, 0x22, 0x73, 0x37, 0x6e, 0x25, 0x2f, 0xa0, 0x3c, 0x4e, 0xa5, 0x51,
-	0x03, 0x36, 0x46, 0xf7, 0x4e, 0x49, 0x30, 0x22, 0x7d, 0x6b, 0x6c, 0x3d, 0x73, 0x86, 0x4e, 0x78,
-	0xce, 0xd7, 0x64, 0xe1, 0x70, 0x7f, 0x76, 0xaa, 0xd5, 0x98, 0x02, 0xaf, 0x8f, 0xee, 0x9d, 0x1a,
-	0xa3, 0x29, 0x80, 0x75, 0x42, 0xb0, 0x4d, 0xdf, 0x9a, 0x04, 0xd1, 0xda, 0xdd, 0x9e, 0x2f, 0x61,
-	0x12, 0x50, 0x0c, 0x9c, 0x92, 0x7f, 0xa3, 0x1a, 0xac, 0xbb, 0x6c, 0xb4, 0xcf, 0xc9, 0x84, 0x12,
-	0xfa, 0x8a, 0xba, 0xa1, 0x5c, 0xc0, 0xc9, 0x3e, 0xf0, 0xf9, 0x38, 0xef, 0x51, 0x8d, 0xe1, 0x03,
-	0x5c, 0x72, 0x93, 0xe9, 0xea, 0xbf, 0xcb, 0x40, 0xc5, 0xa0, 0xa1, 0x31, 0x4a, 0x4e, 0x5b, 0xc4,
-	0xce, 0xf3, 0xf2, 0x3a, 0xf3, 0x4e, 0xf2, 0xfa, 0x0f, 0x60, 0x2f, 0x25, 0xaf, 0xdd, 0x44, 0x5d,
-	0x7c, 0xb2, 0x0b, 0x87, 0xd5, 0xc5, 0x42, 0x3b, 0xd9, 0x2a, 0xbc, 0xeb, 0x2f, 0x46, 0x54, 0xff,
-	0x4d, 0x16, 0x36, 0xe6, 0x96, 0x37, 0x7a, 0x0f, 0xd6, 0x82, 0xf1, 0xe9, 0x6b, 0x21, 0x53, 0x85,
-	0x59, 0x90, 0x67, 0x00, 0x2e, 0x55, 0x11, 0x2c, 0x39, 0x23, 0xea, 0xc8, 0xf5, 0xc1, 0xbf, 0x99,
-	0x68, 0x1a, 0x0f, 0x47, 0x9c, 0x4b, 0xa5, 0x08, 0x66, 0x49, 0xdd, 0x46, 0x37, 0xa0, 0xe8, 0x8c,
-	0x02, 0x87, 0x44, 0x58, 0xb1, 0x14, 0x80, 0xc1, 0xba, 0x82, 0xe2, 0x26, 0x94, 0x26, 0x01, 0xf5,
-	0xc9, 0xd0, 0x93, 0xbd, 0x12, 0x92, 0xb9, 0xc8, 0x80, 0x4d, 0x09, 0x43, 0x5f, 0x43, 0xfe, 0xa5,
-	0x17, 0x10, 0xc7, 0x1d, 0x78, 0x7c, 0x8e, 0x0b, 0x87, 0x37, 0x12, 0xbd, 0x7e, 0xe4, 0x05, 0xba,
-	0x3b, 0xf0, 0xfc, 0x91, 0xe8, 0xac, 0xe0, 0x71, 0xbc, 0xfa, 0x52, 0x80, 0x59, 0x6f, 0x9e, 0x51,
-	0xcb, 0xa7, 0x3e, 0x6b, 0xc0, 0x2a, 0x5f, 0x44, 0x79, 0x01, 0xe0, 0x0b, 0xa8, 0xd2, 0x7f, 0x6e,
-	0xf9, 0xa7, 0x8e, 0x7b, 0x4a, 0xd8, 0x87, 0xd5, 0x0f, 0xa9, 0xef, 0x04, 0xa1, 0xd3, 0x0f, 0xb8,
-	0x5d, 0xb1, 0x86, 0x77, 0x23, 0xbc, 0x9a, 0x46, 0x57, 0x7f, 0x9b, 0x01, 0x34, 0x2f, 0xd8, 0xd0,
-	0x47, 0xb0, 0x3e, 0xb2, 0xfa, 0x42, 0x00, 0x3c, 0x73, 0x5c, 0xcb, 0x3f, 0xe7, 0x43, 0x58, 0xc4,
-	0xa5, 0x91, 0xd5, 0x67, 0x8b, 0xff, 0x88, 0x03, 0x99, 0x56, 0x8c, 0xe8, 0xe4, 0x58, 0xae, 0x4a,
-	0x02, 0x74, 0x07, 0x36, 0x7c, 0xcb, 0x76, 0x26, 0x41, 0x72, 0xf9, 0x8b, 0x81, 0x5d, 0x17, 0x88,
-	0x58, 0x02, 0x54, 0xbf, 0x86, 0xfd, 0x45, 0x66, 0x43, 0x30, 0xf6, 0xdc, 0x80, 0x32, 0x89, 0x35,
-	0x23, 0x41, 0xd6, 0xf0, 0x5a, 0x10, 0x67, 0xee, 0xc1, 0x0e, 0xcf, 0xac, 0xb9, 0xf6, 0x8c, 0xc1,
-	0xf1, 0x3d, 0xf4, 0xaf, 0x54, 0xb3, 0xd9, 0x58, 0xcd, 0x56, 0xf7, 0x60, 0x77, 0xae, 0x58, 0xd1,
-	0xa0, 0xea, 0x9f, 0x64, 0x60, 0xa7, 0x37, 0xb6, 0xad, 0x90, 0x9a, 0x13, 0xd7, 0xa5, 0x43, 0xdd,
-	0x0e, 0xde, 0xa1, 0xca, 0xd4, 0x94, 0x66, 0x67, 0xa6, 0xf4, 0x9d, 0x2c, 0x91, 0x99, 0x91, 0x5a,
-	0x9e, 0x1d, 0xa9, 0x3d, 0xd8, 0x9d, 0x6b, 0xb6, 0xec, 0xd2, 0x7f, 0xcb, 0xc0, 0x7e, 0x97, 0x1b,
-	0xe8, 0x47, 0xbc, 0x09, 0x47, 0x8e, 0x6b, 0x3b, 0xee, 0xe9, 0x3b, 0x74, 0xeb, 0x36, 0x28, 0x43,
-	0xc7, 0x7d, 0x41, 0x6d, 0x32, 0xdb, 0xbb, 0xb2, 0x80, 0x1f, 0x45, 0x7d, 0x64, 0xda, 0x81, 0x57,
-	0x49, 0x22, 0x3b, 0x5d, 0xb0, 0x47, 0x51, 0x40, 0xb1, 0xb0, 0xd6, 0x53, 0xc3, 0xb4, 0x34, 0x33,
-	0x4c, 0xb1, 0xd5, 0xb0, 0x7c, 0xb9, 0xd5, 0x70, 0x0d, 0xde, 0x5b, 0xd8, 0x3b, 0xd9, 0xfb, 0x3f,
-	0xce, 0xc2, 0xb6, 0x2a, 0x57, 0x08, 0xa6, 0xb5, 0x49, 0xf8, 0x3c, 0xea, 0xf8, 0xe5, 0xbc, 0xc7,
-	0xac, 0xed, 0x78, 0xe5, 0xbd, 0xa0, 0xe7, 0xb2, 0xa3, 0x85, 0x08, 0xf6, 0x90, 0x9e, 0x47, 0x1b,
-	0x93, 0xdc, 0x74, 0x63, 0xf2, 0x00, 0x96, 0x12, 0x0a, 0xe7, 0x56, 0x52, 0x9a, 0x2e, 0x6a, 0xc3,
-	0x01, 0x57, 0x3e, 0x3c, 0x0b, 0x7a, 0x08, 0x28, 0xa0, 0xfe, 0x2b, 0xa7, 0xcf, 0x86, 0x8b, 0xba,
-	0x4c, 0x08, 0x52, 0x5f, 0x76, 0x3e, 0x65, 0xb6, 0x09, 0x22, 0x3d, 0xa6, 0xc1, 0x1b, 0xc1, 0x2c,
-	0xa8, 0x7a, 0x00, 0x4b, 0x5c, 0x8f, 0x21, 0x28, 0x1b, 0x7a, 0xfb, 0xb8, 0xa9, 0x11, 0x43, 0xc3,
-	0x8f, 0x75, 0x55, 0x53, 0xae, 0x30, 0x98, 0xd6, 0x36, 0x75, 0xcc, 0x60, 0x86, 0xa1, 0x77, 0xda,
-	0x4a, 0xa6, 0x7a, 0x0c, 0x5b, 0xe9, 0x06, 0xd6, 0xdc, 0xe0, 0x35, 0xf5, 0xd1, 0x5d, 0x58, 0xf1,
-	0x69, 0x30, 0x19, 0x0a, 0xfd, 0x50, 0x4e, 0xf1, 0x47, 0xd4, 0x13, 0x86, 0xc6, 0x92, 0xac, 0xfa,
-	0xcf, 0x97, 0x60, 0x53, 0x4c, 0xc7, 0xf7, 0x1a, 0x6c, 0x2e, 0xb4, 0x83, 0x84, 0xd0, 0x0e, 0x1c,
-	0x26, 0xa8, 0x18, 0xf3, 0x04, 0x24, 0xf4, 0x88, 0x4f, 0x47, 0xde, 0x2b, 0x66, 0x04, 0xe4, 0x6e,
-	0xaf, 0xe1, 0x12, 0x07, 0x9b, 0x1e, 0xe6, 0x40, 0x66, 0xed, 0xc6, 0x74, 0x8e, 0x1b, 0x84, 0xd6,
-	0x70, 0x58, 0x59, 0xe1, 0x3b, 0x9d, 0xd4, 0xb0, 0x85, 0x56, 0xe8, 0xf4, 0x39, 0xe3, 0x09, 0x1a,
-	0x5c, 0x96, 0xc5, 0xc8, 0x34, 0x7a, 0x0c, 0x15, 0xfb, 0xdc, 0xb5, 0x46, 0x4e, 0x9f, 0xcc, 0x95,
-	0xb7, 0xca, 0xcb, 0x4b, 0x9a, 0x8c, 0x75, 0x41, 0x9a, 0x2c, 0x70, 0xdb, 0x9e, 0xc2, 0x12, 0xe5,
-	0xfe, 0x0a, 0xca, 0x5c, 0x83, 0x93, 0xd0, 0x77, 0x4e, 0x4f, 0xa9, 0xcf, 0x04, 0x77, 0x6e, 0x66,
-	0x2c, 0xb9, 0xca, 0x36, 0x05, 0x1e, 0x97, 0x68, 0x22, 0x15, 0xa0, 0x63, 0xd8, 0xf0, 0xe9, 0x2b,
-	0x6b, 0xe8, 0xd8, 0x5c, 0x7f, 0x10, 0xb6, 0x5b, 0xe6, 0x46, 0x38, 0xb3, 0x45, 0xc4, 0x56, 0xfa,
-	0x20, 0xda, 0x4a, 0x1f, 0x98, 0xd1, 0x56, 0x1a, 0x2b, 0xc9, 0x4c, 0x0c, 0x8c, 0xbe, 0x83, 0xca,
-	0x24, 0xb0, 0x4e, 0x29, 0x19, 0x79, 0xae, 0x13, 0x7a, 0x3e, 0xd7, 0x29, 0x3e, 0xb5, 0x9d, 0x30,
-	0xa8, 0x00, 0xef, 0x60, 0x52, 0x6b, 0xf5, 0x18, 0x69, 0x2b, 0xa6, 0x54, 0x39, 0x21, 0xde, 0x99,
-	0x2c, 0x02, 0x07, 0xe8, 0x8b, 0x84, 0x06, 0x14, 0x66, 0xfe, 0x5e, 0x4a, 0x03, 0x1a, 0x49, 0x0d,
-	0x18, 0xa9, 0xbe, 0x6a, 0x07, 0xca, 0x69, 0x54, 0x5a, 0x24, 0x48, 0xd5, 0x1e, 0x8b, 0x84, 0x1b,
-	0x90, 0x7b, 0xd9, 0x77, 0xa4, 0x11, 0x59, 0x4e, 0x96, 0xaf, 0xea, 0x98, 0xa1, 0xaa, 0xff, 0x30,
-	0x0f, 0x28, 0xc9, 0x7e, 0x92, 0x8d, 0xdf, 0xc0, 0x7d, 0x53, 0x2e, 0xcf, 0xbe, 0x15, 0x97, 0xa3,
-	0x47, 0x50, 0x1c, 0x58, 0xce, 0x90, 0x6d, 0xef, 0xd9, 0x5c, 0x73, 0xbe, 0x2c, 0x1c, 0x1e, 0x24,
-	0xed, 0xcb, 0xb9, 0x46, 0x1c, 0x34, 0x78, 0x0e, 0xce, 0x1c, 0x9a, 0x1b, 0xfa, 0xe7, 0xb8, 0x30,
-	0x98, 0x42, 0xf6, 0x1d, 0x50, 0x66, 0x09, 0x98, 0x7c, 0x61, 0x92, 0x47, 0x3a, 0x3e, 0x5e, 0xd0,
-	0x73, 0xf4, 0x0d, 0x2c, 0x0b, 0xe3, 0x5e, 0x34, 0xf4, 0x27, 0x6f, 0xae, 0x71, 0xe2, 0x53, 0xd5,
-	0xb3, 0x29, 0x16, 0xf9, 0x7e, 0x9e, 0xfd, 0x2a, 0x53, 0xfd, 0xab, 0x65, 0x28, 0x24, 0x50, 0x08,
-	0x60, 0xa5, 0xd7, 0xee, 0x19, 0x5a, 0x5d, 0xb9, 0x82, 0xb6, 0x61, 0xa3, 0xd7, 0x7e, 0xd8, 0xee,
-	0x3c, 0x69, 0x13, 0xdc, 0x6b, 0x6a, 0xa4, 0x5d, 0x6b, 0x69, 0x4a, 0x06, 0xed, 0x00, 0xc2, 0x35,
-	0x53, 0x6f, 0x1f, 0x93, 0x63, 0xdc, 0xe9, 0x75, 0x89, 0x86, 0x71, 0x07, 0x2b, 0x59, 0x74, 0x15,
-	0x2a, 0x52, 0xb0, 0x10, 0xbd, 0xce, 0xa4, 0x4a, 0x43, 0xd7, 0xb0, 0xc4, 0xe6, 0xd0, 0x2e, 0x6c,
-	0x1e, 0x3f, 0x21, 0x5d, 0x55, 0x6b, 0x90, 0x56, 0xad, 0xd9, 0xe8, 0xb5, 0x55, 0x93, 0x89, 0x9b,
-	0x25, 0x54, 0x81, 0x2d, 0xac, 0x19, 0x9d, 0x1e, 0x56, 0x35, 0x83, 0x34, 0xf5, 0x96, 0x6e, 0xd6,
-	0x38, 0x66, 0x19, 0xed, 0xc3, 0x4e, 0xab, 0xf6, 0x2d, 0x69, 0x63, 0x72, 0xa4, 0xd5, 0xb0, 0x86,
-	0x0d, 0x82, 0xb5, 0x9a, 0x7a, 0xa2, 0xd5, 0x95, 0x95, 0x64, 0xdb, 0x04, 0x92, 0xe8, 0x75, 0x65,
-	0x95, 0x81, 0x5b, 0xba, 0xc1, 0xc4, 0x5c, 0x02, 0x9c, 0x67, 0x4d, 0x8b, 0xc0, 0x8d, 0x66, 0xe7,
-	0x09, 0xd1, 0xdb, 0x8d, 0x0e, 0x6e, 0x89, 0x7a, 0xd6, 0xd0, 0x75, 0x78, 0x2f, 0x6a, 0x01, 0xa9,
-	0x35, 0x9b, 0x1d, 0x95, 0x23, 0x48, 0xa3, 0xa6, 0x37, 0x7b, 0x58, 0x53, 0x80, 0x11, 0xf4, 0xda,
-	0x46, 0x4f, 0x55, 0x35, 0xc3, 0x68, 0xf4, 0x9a, 0xe4, 0x51, 0xc7, 0x20, 0x8f, 0x6b, 0x4d, 0xbd,
-	0x2e, 0x4a, 0x28, 0xa0, 0xf7, 0x61, 0x5f, 0x6f, 0xab, 0x1d, 0x8c, 0x35, 0xd5, 0x9c, 0xaf, 0xa1,
-	0xc8, 0x9a, 0xd5, 0x35, 0x88, 0xd9, 0x21, 0xaa, 0x41, 0x4e, 0x6a, 0xed, 0x7a, 0xe7, 0xb1, 0x86,
-	0x95, 0x12, 0xfa, 0x10, 0x6e, 0x98, 0xf5, 0x06, 0xa9, 0x75, 0xbb, 0x4d, 0x5d, 0x56, 0x3a, 0x37,
-	0x72, 0x65, 0xb4, 0x09, 0xeb, 0xed, 0x4e, 0xd4, 0x9d, 0x46, 0xa7, 0xd7, 0xae, 0x2b, 0xeb, 0x6c,
-	0x38, 0x1b, 0x7a, 0xd3, 0xd4, 0x30, 0xc1, 0x9a, 0x61, 0x62, 0x9d, 0x8f, 0xa6, 0xa1, 0x28, 0x48,
-	0x81, 0x62, 0xad, 0x4d, 0x8e, 0x9f, 0xf0, 0xe6, 0x6b, 0x75, 0x65, 0x03, 0xdd, 0x84, 0xeb, 0x51,
-	0xe7, 0xb1, 0x56, 0xd7, 0x79, 0x1b, 0xd9, 0x44, 0x69, 0x98, 0xd4, 0xea, 0x75, 0xac, 0x19, 0x86,
-	0x82, 0x58, 0x0f, 0xd4, 0x16, 0xd1, 0xda, 0x75, 0xd2, 0x33, 0x34, 0x1c, 0x69, 0x08, 0x52, 0xd7,
-	0xda, 0xba, 0x56, 0x57, 0x36, 0x59, 0x53, 0xd5, 0x16, 0x51, 0x59, 0x01, 0x26, 0x51, 0x3b, 0x6d,
-	0x13, 0x77, 0x9a, 0xa4, 0xdd, 0x31, 0xa3, 0xc6, 0x1f, 0x35, 0x35, 0x65, 0x0b, 0x5d, 0x83, 0x3d,
-	0xb5, 0x45, 0x6a, 0x3d, 0xf3, 0xa4, 0x83, 0xf5, 0xef, 0x44, 0x8f, 0xb0, 0xf6, 0x6b, 0x4d, 0x35,
-	0xb5, 0xba, 0xb2, 0xcd, 0x7a, 0xa2, 0xb6, 0x44, 0x05, 0x72, 0xf2, 0x94, 0x1d, 0xb4, 0x05, 0x8a,
-	0xda, 0x22, 0x92, 0xa3, 0x64, 0xa3, 0x77, 0xd9, 0xdc, 0xe3, 0x4e, 0x8f, 0xc3, 0x38, 0xef, 0x89,
-	0x52, 0xd8, 0x68, 0x56, 0xd0, 0x47, 0x50, 0x8d, 0xf9, 0x52, 0xd2, 0xd4, 0xf8, 0xdc, 0xa4, 0x46,
-	0x7d, 0x8f, 0x8d, 0x7a, 0xbb, 0x43, 0xda, 0x47, 0x7a, 0xa3, 0xd3, 0x22, 0x46, 0xaf, 0xdb, 0xed,
-	0x60, 0x53, 0xd9, 0xaf, 0xfe, 0xe7, 0x0c, 0xac, 0xb2, 0x85, 0xc5, 0x76, 0xd7, 0x87, 0xb0, 0x6d,
-	0x8d, 0xc7, 0xc3, 0x73, 0x32, 0x75, 0x4d, 0x92, 0xd7, 0x8e, 0x4d, 0xf9, 0x3a, 0xcb, 0xe3, 0x4d,
-	0x8e, 0x9c, 0x1a, 0x3f, 0x4f, 0x1c, 0x9b, 0xce, 0xdb, 0x90, 0xe8, 0x1b, 0x28, 0x06, 0x5c, 0xa5,
-	0xa4, 0x44, 0xc0, 0xe5, 0x1a, 0xa7, 0x10, 0xc4, 0xa0, 0x00, 0x1d, 0x41, 0x29, 0xa5, 0x6e, 0x2a,
-	0x4b, 0x6f, 0xa3, 0x63, 0x8a, 0x49, 0x1d, 0x53, 0x7d, 0x02, 0x88, 0x7f, 0x74, 0xa9, 0x3f, 0x6d,
-	0x70, 0xac, 0x4c, 0x33, 0x09, 0x65, 0xfa, 0x09, 0xe4, 0xb9, 0x25, 0x16, 0xd0, 0x50, 0x36, 0x15,
-	0xcd, 0xb8, 0x01, 0x0d, 0x1a, 0x62, 0xee, 0x55, 0x35, 0x68, 0x58, 0x25, 0x50, 0x8c, 0x2c, 0x63,
-	0xde, 0xd8, 0x0e, 0x6c, 0x09, 0x9d, 0x38, 0xa6, 0x7e, 0x62, 0xdc, 0xa4, 0x47, 0xf1, 0xda, 0x4c,
-	0x51, 0xe9, 0xf6, 0x60, 0xe4, 0xcf, 0xc1, 0xaa, 0x9f, 0x41, 0x9e, 0xe9, 0xa4, 0xdf, 0x78, 0x2e,
-	0x45, 0xb7, 0xa0, 0xec, 0x0d, 0x06, 0x01, 0x0d, 0xc9, 0xc8, 0x71, 0x27, 0x21, 0x0d, 0x78, 0xcb,
-	0x97, 0x71, 0x49, 0x40, 0x5b, 0x02, 0x58, 0xfd, 0x06, 0x40, 0x68, 0x9b, 0x9e, 0xeb, 0x84, 0xcc,
-	0x54, 0x76, 0x02, 0xc2, 0x35, 0x9c, 0x9c, 0xb8, 0x55, 0x27, 0x78, 0xcc, 0x92, 0x68, 0x07, 0x56,
-	0x5e, 0x79, 0xc3, 0xc9, 0x88, 0x4a, 0x0f, 0xa6, 0x4c, 0x55, 0xff, 0x5e, 0x06, 0x8a, 0xc7, 0xbe,
-	0xe5, 0x86, 0xd4, 0x66, 0x45, 0x04, 0xe8, 0xa7, 0xb0, 0x1c, 0x7a, 0xa1, 0x35, 0x94, 0xc6, 0x6f,
-	0x72, 0x5f, 0x3e, 0xad, 0x09, 0x0b, 0x1a, 0x74, 0x0b, 0xb2, 0xe1, 0x99, 0xdc, 0xd3, 0x5e, 0x40,
-	0x99, 0x0d, 0xcf, 0x18, 0x99, 0x2f, 0x7c, 0xcf, 0x17, 0x93, 0xf9, 0x67, 0xd5, 0xff, 0x93, 0x81,
-	0x32, 0xa6, 0xb6, 0xe3, 0xd3, 0x7e, 0xc8, 0x2c, 0x3a, 0xea, 0x23, 0x0b, 0xb6, 0x7d, 0x09, 0xe1,
-	0xbb, 0xae, 0xd8, 0xf5, 0x21, 0x4c, 0xaf, 0x4f, 0x52, 0x4a, 0x29, 0x99, 0x33, 0x4e, 0xd6, 0x44,
-	0x2e, 0x6e, 0x54, 0x6e, 0xfa, 0xf3, 0x40, 0x74, 0x1f, 0x76, 0xe3, 0x2a, 0x02, 0x9e, 0x37, 0xaa,
-	0x49, 0xb2, 0x76, 0xdc, 0x02, 0x51, 0xb2, 0xcc, 0x5b, 0xfd, 0x06, 0x36, 0x17, 0xd4, 0x81, 0xf2,
-	0xb0, 0xa4, 0x77, 0x1f, 0x7f, 0xa1, 0x5c, 0x91, 0x5f, 0xf7, 0x95, 0x0c, 0x5a, 0x85, 0x5c, 0x0f,
-	0x37, 0x95, 0x2c, 0x2a, 0xc0, 0xaa, 0xa1, 0x77, 0x49, 0x0f, 0xeb, 0x4a, 0xae, 0xfa, 0x3f, 0x72,
-	0x50, 0x8e, 0x0c, 0x4c, 0x31, 0x12, 0xe8, 0xbe, 0x34, 0x95, 0x85, 0x26, 0xab, 0x2e, 0x30, 0x95,
-	0x05, 0xe1, 0x01, 0x1b, 0xb3, 0x84, 0x9d, 0x7c, 0x13, 0x4a, 0x7c, 0xd6, 0x9d, 0xf0, 0x5c, 0x98,
-	0x42, 0x62, 0x0f, 0x55, 0x8c, 0x80, 0xdc, 0xd4, 0x11, 0xdc, 0xc1, 0x3d, 0xe3, 0xdc, 0x16, 0xe7,
-	0xdc, 0xd1, 0x60, 0x49, 0x74, 0x12, 0x79, 0xd1, 0xad, 0x7e, 0xbc, 0x9f, 0x5f, 0x6c, 0xaa, 0xcb,
-	0xfa, 0x79, 0xb6, 0x1a, 0x27, 0x96, 0xce, 0x76, 0x91, 0x40, 0xbf, 0x80, 0xd2, 0xa9, 0x60, 0x27,
-	0x32, 0x61, 0xfc, 0x24, 0xb7, 0xfe, 0x49, 0xeb, 0x21, 0xc9, 0x6e, 0xb8, 0x78, 0x9a, 0x64, 0xbe,
-	0x23, 0x58, 0x9f, 0x99, 0x0b, 0xbe, 0xf9, 0x4f, 0x1b, 0x4e, 0xe9, 0x89, 0xc6, 0xe5, 0xf4, 0xf4,
-	0xb0, 0x95, 0xe3, 0xd3, 0x20, 0xf4, 0x9d, 0x7e, 0x28, 0x85, 0x48, 0x5e, 0x5a, 0xc8, 0x12, 0x2a,
-	0xc4, 0x44, 0x15, 0xf2, 0xd1, 0x20, 0xa2, 0x35, 0x58, 0x3e, 0x7a, 0x6a, 0x6a, 0x86, 0x72, 0x85,
-	0xcf, 0x90, 0xa6, 0x76, 0xda, 0x75, 0x43, 0xc9, 0x54, 0xbf, 0x81, 0x42, 0xa2, 0xa3, 0xa8, 0x04,
-	0x6b, 0xa6, 0x86, 0x5b, 0x7a, 0xbb, 0x66, 0xb2, 0x3d, 0x43, 0x11, 0xf2, 0x91, 0x1e, 0x51, 0x32,
-	0x4c, 0xa6, 0x47, 0x1a, 0x48, 0x4a, 0x61, 0x25, 0x5b, 0x6d, 0x30, 0x86, 0xe6, 0xc6, 0x7e, 0xd4,
-	0xc3, 0xad, 0xe4, 0xf2, 0x5a, 0x8a, 0xd6, 0x51, 0x39, 0x5e, 0x47, 0x4b, 0x7c, 0xc1, 0x94, 0xe3,
-	0x05, 0xb3, 0xc4, 0x57, 0xc6, 0x1f, 0x2d, 0x41, 0x41, 0x2e, 0x16, 0x66, 0x6a, 0xa6, 0x8e, 0x74,
-	0x32, 0x17, 0x1f, 0xe9, 0x64, 0xd3, 0x47, 0x3a, 0xb3, 0xbb, 0xb7, 0xa5, 0xf9, 0xdd, 0xdb, 0x3d,
-	0xc9, 0x80, 0x82, 0x01, 0x3e, 0x98, 0x5f, 0xab, 0xac, 0xfa, 0x03, 0xb9, 0xab, 0x9e, 0xf2, 0xdf,
-	0x2d, 0x28, 0x27, 0xec, 0x67, 0x56, 0xf6, 0x8a, 0x74, 0x9f, 0xc4, 0x50, 0x56, 0xfa, 0xe2, 0xed,
-	0xdc, 0xea, 0x3b, 0x6d, 0xe7, 0x04, 0xaf, 0xc8, 0xb1, 0x95, 0xbc, 0x96, 0x5f, 0xc0, 0x2b, 0xc9,
-	0xd1, 0x67, 0xbc, 0x92, 0x4c, 0x57, 0xff, 0x3c, 0x03, 0x30, 0xed, 0x0c, 0x9f, 0xe0, 0x13, 0xac,
-	0x19, 0x27, 0x9d, 0x26, 0xb3, 0xfb, 0x56, 0x21, 0xf7, 0xe8, 0x84, 0xcd, 0x6d, 0x19, 0x20, 0x9e,
-	0xf8, 0xba, 0x92, 0x65, 0x73, 0xfd, 0xa8, 0xd7, 0x31, 0x6b, 0x44, 0xfb, 0xf6, 0xa4, 0xd6, 0x33,
-	0x18, 0x30, 0xc7, 0x34, 0x35, 0xb7, 0x85, 0x74, 0xf3, 0x29, 0x31, 0xf5, 0x16, 0x33, 0x5c, 0xbe,
-	0xed, 0xea, 0x58, 0xab, 0x2b, 0x4b, 0x4c, 0xb7, 0x77, 0xcc, 0x13, 0x0d, 0x13, 0x91, 0xcd, 0x7c,
-	0xda, 0xd5, 0x94, 0x65, 0xf4, 0x1e, 0xec, 0x4a, 0x75, 0xcf, 0x18, 0x4e, 0xe7, 0x56, 0x82, 0x7a,
-	0x52, 0x6b, 0x1f, 0x6b, 0xca, 0x8a, 0xe0, 0x27, 0x66, 0x41, 0x10, 0xac, 0x3d, 0xea, 0xf1, 0x72,
-	0x56, 0xd9, 0x36, 0xb5, 0xdb, 0xe9, 0x34, 0x13, 0xf5, 0xe6, 0xab, 0x7f, 0xb1, 0x04, 0x1b, 0x89,
-	0xc9, 0x11, 0xdd, 0x41, 0x3f, 0x83, 0x65, 0xbe, 0x2b, 0x91, 0x62, 0x7c, 0x67, 0xf1, 0x4c, 0x62,
-	0x41, 0x34, 0xb3, 0x17, 0xc8, 0xce, 0xee, 0x05, 0xf8, 0x92, 0x12, 0x1e, 0x6b, 0x77, 0x32, 0x62,
-	0x3a, 0x4e, 0xc8, 0x97, 0x92, 0x84, 0xb6, 0x39, 0x30, 0xed, 0x82, 0x5c, 0xbd, 0xc0, 0x05, 0xb9,
-	0xb6, 0xd8, 0x05, 0x09, 0x97, 0xba, 0x20, 0x0b, 0x6f, 0x76, 0x41, 0x16, 0x17, 0xb8, 0x20, 0x6f,
-	0x42, 0xe9, 0xb9, 0xe5, 0xdb, 0xaf, 0x2d, 0x9f, 0x0a, 0x9f, 0x5d, 0x59, 0x10, 0x45, 0x40, 0xee,
-	0xb8, 0xfb, 0x0c, 0xf2, 0xe1, 0xe9, 0x78, 0x4c, 0xfa, 0xe1, 0x59, 0x65, 0x7d, 0x6e, 0xb0, 0xcc,
-	0xd3, 0xf1, 0x38, 0xf2, 0xf3, 0xae, 0x32, 0x3a, 0x35, 0x3c, 0xfb, 0xbd, 0x3d, 0xd9, 0xbb, 0xd4,
-	0x33, 0x8a, 0x2e, 0xf7, 0x8c, 0xfe, 0x61, 0x0e, 0xb6, 0x24, 0x67, 0x70, 0x0e, 0x8a, 0xdd, 0x91,
-	0x15, 0x58, 0x0d, 0x26, 0xfc, 0x28, 0x21, 0xb2, 0x29, 0x64, 0x32, 0x72, 0xf5, 0x64, 0xa7, 0xae,
-	0x9e, 0x59, 0x09, 0x93, 0x9b, 0x97, 0x30, 0x9f, 0xc1, 0x8a, 0xd8, 0x5f, 0x73, 0xf1, 0x93, 0x5e,
-	0xad, 0x69, 0x25, 0x83, 0x25, 0x21, 0xba, 0x0e, 0x05, 0xb1, 0xc7, 0x24, 0x7d, 0xcf, 0x16, 0x07,
-	0x06, 0x25, 0x0c, 0x02, 0xc4, 0x37, 0x6b, 0x3f, 0xaa, 0x5c, 0x79, 0x00, 0x30, 0x74, 0x46, 0x8e,
-	0x3c, 0x9c, 0x59, 0xe3, 0x82, 0x70, 0x7f, 0x6e, 0xf9, 0x34, 0x19, 0x09, 0x97, 0x80, 0x6b, 0xc3,
-	0xe8, 0x33, 0xc5, 0x4a, 0xf0, 0x76, 0xac, 0x94, 0x5e, 0x79, 0x85, 0x59, 0x17, 0xe6, 0x1f, 0x67,
-	0x00, 0x25, 0x9d, 0x0e, 0x72, 0x75, 0xcf, 0xcb, 0xdb, 0xcc, 0x22, 0x79, 0xfb, 0x29, 0x2c, 0x0f,
-	0xe9, 0x2b, 0x3a, 0x94, 0xf6, 0x44, 0xea, 0x94, 0x26, 0x26, 0x6c, 0x32, 0x0a, 0x2c, 0x08, 0xdf,
-	0xed, 0xae, 0x40, 0xf5, 0x9f, 0x64, 0x61, 0x7b, 0xa1, 0x6b, 0x04, 0x7d, 0x03, 0x2b, 0xd2, 0xa4,
-	0x10, 0x06, 0xdb, 0xc7, 0x6f, 0x72, 0xa6, 0x1c, 0x48, 0xa3, 0x42, 0x66, 0x5b, 0xd0, 0xd3, 0xec,
-	0xa5, 0x3d, 0xcd, 0xbd, 0x6d, 0x4f, 0xe7, 0x0c, 0x95, 0xe5, 0xef, 0x61, 0xa8, 0x54, 0x0f, 0x60,
-	0x45, 0x1a, 0x05, 0x45, 0xc8, 0xb3, 0x6d, 0xa0, 0xde, 0xee, 0x69, 0xc2, 0x7c, 0xa8, 0xeb, 0x06,
-	0xdf, 0x05, 0x66, 0x98, 0x59, 0xd1, 0xe8, 0x60, 0x55, 0x53, 0xb2, 0xd5, 0x7f, 0x9f, 0x83, 0xab,
-	0x33, 0xfd, 0x8d, 0x96, 0x99, 0xf0, 0x05, 0xde, 0x83, 0x95, 0x09, 0x07, 0x48, 0x81, 0x7d, 0xed,
-	0x82, 0x81, 0x92, 0xb9, 0x24, 0xf1, 0x8f, 0x24, 0xb8, 0xe5, 0x42, 0x5e, 0x4a, 0x5d, 0x26, 0x59,
-	0x7c, 0xfb, 0x63, 0x4e, 0xa4, 0xae, 0x2c, 0x10, 0xa9, 0xc9, 0xa3, 0xf9, 0xd5, 0x37, 0x1f, 0xcd,
-	0x27, 0x97, 0x4d, 0xfe, 0xed, 0x96, 0xcd, 0x2f, 0xa0, 0x94, 0xf2, 0x1f, 0xca, 0x75, 0x7a, 0xa1,
-	0xfb, 0xb0, 0x98, 0x74, 0x1f, 0x5e, 0x2a, 0x26, 0xe1, 0x72, 0x31, 0xf9, 0x5f, 0x96, 0xe0, 0xda,
-	0x05, 0x13, 0x29, 0xe5, 0xe5, 0x57, 0xb1, 0x80, 0xcb, 0xcc, 0x9d, 0x7a, 0x2d, 0xf6, 0x1f, 0x46,
-	0x72, 0xee, 0x0d, 0x93, 0x39, 0xef, 0x59, 0x4f, 0x88, 0xe6, 0xa5, 0xb4, 0x68, 0x9e, 0xf7, 0xaf,
-	0x2e, 0xff, 0x70, 0xff, 0xea, 0xca, 0x3b, 0xf8, 0x57, 0x67, 0x64, 0xf7, 0xea, 0x9c, 0xec, 0x5e,
-	0xe0, 0xd1, 0xce, 0x2f, 0xf2, 0x68, 0x1b, 0xb0, 0x9b, 0xf4, 0x2d, 0x24, 0x1d, 0xd1, 0x6b, 0x6f,
-	0xe1, 0x66, 0xd8, 0x4a, 0xb8, 0x19, 0xde, 0xce, 0xbd, 0x0d, 0x3f, 0xc0, 0xbd, 0x9d, 0xe4, 0xe8,
-	0xc2, 0x5b, 0x71, 0x74, 0xf5, 0xb7, 0x39, 0xd8, 0x5e, 0x78, 0x28, 0x8a, 0xde, 0x87, 0x82, 0x35,
-	0x76, 0x89, 0x35, 0x7a, 0xe6, 0x13, 0x7b, 0x28, 0xaf, 0x14, 0xac, 0x59, 0x63, 0xb7, 0x36, 0x7a,
-	0xe6, 0xd7, 0x87, 0x29, 0xfc, 0x64, 0x28, 0xcf, 0x64, 0x22, 0x7c, 0x8f, 0x6d, 0xd2, 0xcb, 0x63,
-	0xdf, 0xf1, 0x7c, 0xb6, 0x39, 0x9c, 0x0a, 0xc9, 0x12, 0x2e, 0x45, 0x50, 0x2e, 0x17, 0xd1, 0xe7,
-	0xb0, 0x3d, 0xf6, 0x29, 0x1d, 0x8d, 0xf9, 0x84, 0x27, 0x8e, 0xf8, 0xc5, 0x36, 0x61, 0x6b, 0x8a,
-	0x4c, 0x9c, 0xe5, 0x3f, 0x80, 0x4a, 0x22, 0xd3, 0xab, 0xc9, 0xd0, 0xa5, 0x7e, 0xf2, 0x6a, 0x40,
-	0x09, 0xef, 0x4e, 0xf1, 0x8f, 0x93, 0x68, 0x66, 0xe3, 0xbd, 0xf4, 0x02, 0xd2, 0x1f, 0x5a, 0x41,
-	0xc0, 0xf8, 0x5d, 0xaa, 0xf5, 0x97, 0x5e, 0xa0, 0x32, 0x90, 0x6e, 0xa3, 0x5f, 0xc3, 0x2a, 0xeb,
-	0x92, 0xeb, 0x44, 0x07, 0xfd, 0x9f, 0xbd, 0xe9, 0x00, 0xf9, 0xe0, 0xc8, 0x09, 0x7d, 0x2b, 0xa4,
-	0x5c, 0x48, 0xd7, 0x5a, 0x47, 0x18, 0xaf, 0x3c, 0xf3, 0x59, 0xa2, 0x7a, 0x0b, 0x94, 0x59, 0x1c,
-	0xb3, 0xef, 0x8f, 0xba, 0x86, 0xd8, 0xa9, 0x3f, 0x64, 0x5f, 0x99, 0xea, 0x23, 0x28, 0x24, 0x66,
-	0x87, 0xb5, 0xf1, 0xf4, 0x8c, 0xd8, 0x4c, 0x7e, 0x3e, 0xf7, 0x82, 0x50, 0x7a, 0x8f, 0xe0, 0xf4,
-	0xac, 0x4e, 0x83, 0xf0, 0xc4, 0x0b, 0x04, 0xc5, 0x79, 0x82, 0x22, 0x2b, 0x29, 0xce, 0x23, 0x8a,
-	0xea, 0x7f, 0xca, 0x72, 0xc3, 0x6a, 0xfe, 0x7e, 0xd8, 0x2f, 0x60, 0x3d, 0xba, 0xcc, 0x21, 0xbd,
-	0x3e, 0x52, 0x62, 0x6c, 0x26, 0x79, 0x45, 0xa2, 0x70, 0x59, 0x5e, 0xe7, 0x88, 0x1c, 0x44, 0x6f,
-	0x10, 0x16, 0x0b, 0x76, 0x47, 0xb9, 0xef, 0xb9, 0x3b, 0xfa, 0xfd, 0xbd, 0xc0, 0xf6, 0x27, 0x4b,
-	0xb0, 0xbd, 0xf8, 0xec, 0xfc, 0x01, 0xac, 0x46, 0xa7, 0x37, 0xc2, 0x0d, 0x77, 0x7d, 0x7e, 0xe3,
-	0x93, 0x12, 0xd7, 0x38, 0xa2, 0x47, 0x1d, 0x28, 0xa7, 0x4e, 0x82, 0x02, 0x79, 0x60, 0x76, 0xfb,
-	0x62, 0xf9, 0x3d, 0x53, 0x54, 0x29, 0x79, 0x0e, 0x14, 0xcc, 0x79, 0x43, 0x57, 0x7f, 0xb0, 0x37,
-	0x34, 0xff, 0xbd, 0xbd, 0xa1, 0x33, 0x6c, 0xb2, 0x36, 0xcb, 0x26, 0xef, 0x60, 0xb1, 0xce, 0xab,
-	0x96, 0xc2, 0x0f, 0x57, 0x2d, 0xc5, 0x77, 0x50, 0x2d, 0x3b, 0xb0, 0xe2, 0xb9, 0x43, 0xc7, 0xa5,
-	0x95, 0x12, 0x57, 0x7e, 0x32, 0xc5, 0xb4, 0xa2, 0x37, 0x18, 0x70, 0xc4, 0xba, 0xd0, 0x8a, 0x32,
-	0x59, 0xfd, 0x5d, 0x06, 0x36, 0xe6, 0xc6, 0x3c, 0x79, 0x71, 0x36, 0x93, 0xba, 0x38, 0xab, 0xb2,
-	0x05, 0x1a, 0x3a, 0xaf, 0x12, 0xed, 0xcc, 0xbe, 0xb1, 0x9d, 0xe5, 0x69, 0x16, 0xde, 0xca, 0x63,
-	0xd8, 0xb0, 0xe9, 0x6c, 0x31, 0xb9, 0x37, 0x77, 0x37, 0x99, 0x89, 0x81, 0xab, 0xff, 0x35, 0x03,
-	0x68, 0x7e, 0xba, 0xd1, 0x7d, 0x28, 0x24, 0x6e, 0x15, 0x2c, 0xf0, 0xda, 0x76, 0xe3, 0xdb, 0x05,
-	0x18, 0xa6, 0x37, 0x0d, 0x7e, 0xcf, 0x3a, 0xf7, 0x8f, 0x33, 0xb0, 0x25, 0x56, 0xd3, 0x8c, 0x90,
-	0xbc, 0x0f, 0xab, 0xc2, 0xd4, 0x8d, 0x16, 0xf4, 0xd5, 0xc5, 0x9e, 0x0c, 0xb9, 0x14, 0x23, 0x62,
-	0xd4, 0x9e, 0x5b, 0xcd, 0xc2, 0xc3, 0xff, 0xf1, 0x9b, 0x57, 0xb3, 0xb8, 0x8a, 0x94, 0x5e, 0xcc,
-	0xd5, 0x7f, 0x9d, 0x81, 0xed, 0x99, 0x06, 0x4a, 0x91, 0xf3, 0x4b, 0x58, 0xf3, 0xe5, 0xf7, 0x5b,
-	0x0b, 0x9d, 0x69, 0x0e, 0xf4, 0xb7, 0x61, 0x37, 0xd5, 0x50, 0x32, 0x2d, 0x2c, 0xf7, 0x3d, 0xe5,
-	0xcf, 0x76, 0xb2, 0xc9, 0x11, 0x34, 0xa8, 0x3e, 0x84, 0x4a, 0x74, 0x8d, 0x8f, 0xfa, 0x23, 0xc7,
-	0x4d, 0x1a, 0xab, 0xf3, 0xd7, 0xc8, 0x2f, 0xd7, 0x2b, 0xd5, 0xff, 0xb8, 0x04, 0xbb, 0xf3, 0xa5,
-	0x2d, 0xba, 0xcf, 0xf0, 0x16, 0x9b, 0x91, 0xa5, 0x45, 0x9b, 0x91, 0xaf, 0xa1, 0x24, 0x44, 0x32,
-	0xe1, 0xdd, 0x11, 0x96, 0xeb, 0xc5, 0x1e, 0xac, 0x62, 0x7f, 0x9a, 0x08, 0x50, 0x3d, 0xde, 0x2e,
-	0x46, 0xb9, 0x57, 0xe6, 0x64, 0xe6, 0x82, 0xed, 0x54, 0xb4, 0x9b, 0x94, 0xa5, 0xa4, 0x1c, 0x59,
-	0x6b, 0x17, 0x38, 0xb2, 0x60, 0xb1, 0x23, 0xab, 0x70, 0xa9, 0x23, 0xab, 0xf8, 0x66, 0x47, 0x56,
-	0xe9, 0x6d, 0x1c, 0x59, 0xeb, 0x6f, 0x70, 0x64, 0x29, 0xef, 0xea, 0xc8, 0xda, 0x78, 0x27, 0x0d,
-	0xff, 0x03, 0xfc, 0x4e, 0x7f, 0x3f, 0x03, 0x2b, 0x6d, 0xcf, 0xa6, 0x7a, 0x1d, 0xfd, 0x0a, 0x8a,
-	0xae, 0x67, 0x33, 0x41, 0x9c, 0x3c, 0xe3, 0xb9, 0x9a, 0xba, 0xdd, 0xc9, 0x08, 0xe5, 0x8f, 0xb8,
-	0xe5, 0xca, 0x72, 0xe8, 0x36, 0xdf, 0x47, 0xee, 0xc2, 0xaa, 0xcc, 0x1f, 0x45, 0x40, 0x08, 0x64,
-	0xf5, 0x0e, 0xc0, 0x34, 0x8b, 0x38, 0x97, 0x79, 0x15, 0x9f, 0xd0, 0xbc, 0xba, 0xaf, 0x64, 0xd8,
-	0x57, 0xe3, 0x51, 0xbd, 0xad, 0x64, 0xab, 0x67, 0xb0, 0x3e, 0x73, 0x83, 0x55, 0x30, 0xee, 0x60,
-	0x48, 0x99, 0xc8, 0xa2, 0xe4, 0xa5, 0x17, 0x39, 0xc2, 0x4a, 0x53, 0xe8, 0x23, 0x8f, 0xed, 0xb9,
-	0xae, 0x8e, 0x26, 0xc3, 0xd0, 0x21, 0xcf, 0xbd, 0x11, 0xe5, 0x57, 0x8a, 0xef, 0x93, 0xc4, 0xad,
-	0x5b, 0xde, 0xa6, 0x3c, 0xae, 0x70, 0x9a, 0x13, 0x46, 0xa2, 0x8f, 0x5f, 0xdd, 0x9f, 0xde, 0xb9,
-	0xad, 0xfe, 0x79, 0x16, 0xf2, 0x8f, 0xbc, 0x40, 0xe8, 0xed, 0x03, 0xd8, 0x64, 0xd6, 0xb1, 0x54,
-	0x4c, 0xb1, 0x4f, 0x4b, 0x18, 0xff, 0x1b, 0x2f, 0x05, 0x59, 0xc2, 0x6b, 0xa5, 0x40, 0xce, 0x7e,
-	0xe9, 0xcb, 0x3a, 0xd8, 0x27, 0xfa, 0x12, 0x2a, 0x62, 0x99, 0x11, 0x6f, 0x40, 0xc6, 0x56, 0xff,
-	0x05, 0x0d, 0xc9, 0xc0, 0x19, 0x86, 0xd4, 0x0f, 0xe4, 0x06, 0x60, 0x5b, 0xe0, 0x3b, 0x83, 0x2e,
-	0xc7, 0x36, 0x04, 0x12, 0x7d, 0x05, 0x95, 0x14, 0x79, 0xb2, 0xfe, 0xa5, 0x1b, 0xb9, 0xdb, 0xcb,
-	0x78, 0x67, 0x9c, 0xc8, 0x90, 0x68, 0x44, 0xb2, 0xd1, 0x63, 0x9f, 0xf6, 0xa9, 0x4d, 0xdd, 0x3e,
-	0x95, 0x1b, 0x81, 0xa8, 0xd1, 0xdd, 0x18, 0x81, 0x6e, 0x40, 0x21, 0xa0, 0xa7, 0x3e, 0x3d, 0x15,
-	0x9c, 0xbf, 0x22, 0x62, 0x37, 0x12, 0xa0, 0xa8, 0xc4, 0xc1, 0xd0, 0x7b, 0x3d, 0xeb, 0xda, 0x13,
-	0x25, 0x36, 0x86, 0xde, 0xeb, 0xc4, 0x1d, 0xaf, 0x33, 0x58, 0x6f, 0x5a, 0xb6, 0x2b, 0x1d, 0x7d,
-	0x35, 0x9f, 0x5a, 0x6c, 0x31, 0xdb, 0xae, 0x2b, 0xef, 0x7f, 0xcb, 0xdb, 0x33, 0xb6, 0xeb, 0x8a,
-	0xeb, 0xdf, 0x27, 0x50, 0x12, 0xc5, 0xb2, 0xbd, 0x91, 0xc3, 0xed, 0x77, 0x26, 0x2e, 0x6e, 0x26,
-	0x17, 0x8e, 0x6f, 0xf5, 0x5f, 0x38, 0xee, 0x29, 0x2b, 0x4c, 0x97, 0xb4, 0x4d, 0x27, 0x08, 0x71,
-	0xd1, 0x49, 0xa4, 0xaa, 0x7f, 0x9a, 0x81, 0xca, 0x45, 0xa4, 0xe8, 0x4b, 0x28, 0x32, 0x8e, 0x66,
-	0x33, 0xc1, 0x6b, 0xc9, 0x70, 0x8b, 0x29, 0xa9, 0xa5, 0x19, 0x67, 0x76, 0x06, 0xbc, 0x5c, 0x08,
-	0xe3, 0x6f, 0xf4, 0x33, 0x40, 0xd3, 0x49, 0xa4, 0x43, 0x3a, 0xa2, 0x6e, 0x18, 0xf0, 0x46, 0x2e,
-	0x63, 0x25, 0x9a, 0x3e, 0x4d, 0xc2, 0x19, 0x13, 0xb4, 0x54, 0x35, 0xf2, 0x10, 0xb4, 0x54, 0x95,
-	0x43, 0xda, 0x6a, 0xe4, 0xd9, 0x69, 0xb5, 0x39, 0xc4, 0xac, 0xa9, 0xd2, 0xab, 0xc3, 0x3e, 0xab,
-	0x7f, 0x05, 0xb0, 0xb9, 0xe0, 0x7e, 0xfe, 0x5f, 0xff, 0x6d, 0xf6, 0x9f, 0x43, 0x81, 0x55, 0x10,
-	0x9d, 0xb6, 0xe6, 0xde, 0x74, 0xd2, 0x07, 0x63, 0x7b, 0x22, 0x8f, 0x5a, 0xd9, 0xfe, 0x26, 0xde,
-	0xd4, 0x5a, 0x53, 0x17, 0x48, 0xfa, 0x32, 0x78, 0x44, 0x21, 0x08, 0x70, 0xbc, 0x0d, 0x16, 0xb7,
-	0xe4, 0x67, 0x6f, 0xd3, 0x2f, 0xbf, 0xed, 0x6d, 0xfa, 0x48, 0x03, 0xac, 0x24, 0x34, 0x00, 0x82,
-	0xa5, 0xd3, 0x71, 0xe0, 0xc8, 0x63, 0x0f, 0xfe, 0xcd, 0x26, 0x2f, 0x25, 0xda, 0xc5, 0x4d, 0x30,
-	0x71, 0x43, 0x59, 0x49, 0xca, 0x77, 0x7e, 0xe5, 0x79, 0x1b, 0x56, 0xc6, 0xfd, 0xc1, 0xd4, 0x4a,
-	0x5f, 0x1e, 0xf7, 0x07, 0xba, 0x8d, 0x1a, 0xb0, 0x31, 0xb4, 0x6c, 0x97, 0x44, 0x0e, 0x6e, 0xcb,
-	0xa7, 0x96, 0xf4, 0x4d, 0x24, 0xbd, 0x9c, 0x33, 0x5c, 0x8f, 0xd7, 0x87, 0x33, 0xcb, 0xa0, 0x09,
-	0x37, 0x93, 0xb3, 0xc9, 0xf6, 0x19, 0x93, 0x20, 0x75, 0x37, 0x9d, 0x04, 0x93, 0x67, 0x32, 0x7e,
-	0xea, 0xfa, 0x74, 0x8a, 0x0d, 0x4e, 0x98, 0xbc, 0x80, 0x6e, 0x4c, 0x9e, 0x21, 0x1d, 0x10, 0x5b,
-	0x54, 0x01, 0xe5, 0xf2, 0xcf, 0x73, 0xc9, 0xc8, 0xb3, 0x85, 0x15, 0x5f, 0x3e, 0x7c, 0x2f, 0xb9,
-	0x3f, 0x71, 0x5d, 0x23, 0xa2, 0x69, 0x79, 0x36, 0xc5, 0x8a, 0x3d, 0x03, 0x41, 0x3f, 0x85, 0x8d,
-	0xd0, 0xb7, 0xfa, 0x94, 0x30, 0xd6, 0x70, 0x7c, 0xce, 0xca, 0x5c, 0x09, 0xae, 0x61, 0x85, 0x23,
-	0xf0, 0x14, 0x8e, 0x7e, 0x0d, 0x55, 0xc7, 0x0d, 0xe9, 0x29, 0x9f, 0x77, 0x66, 0x59, 0x46, 0xd5,
-	0x5b, 0x67, 0xc4, 0xb6, 0x42, 0x8b, 0xb0, 0x1d, 0xbe, 0x3c, 0xe6, 0x79, 0x3f, 0xa6, 0xec, 0xc6,
-	0x84, 0x2d, 0xeb, 0xac, 0x6e, 0x85, 0x16, 0xb6, 0xc2, 0xc5, 0x41, 0x11, 0xeb, 0xdf, 0x37, 0x28,
-	0xe2, 0x13, 0xc8, 0x07, 0x41, 0x5f, 0x74, 0x5f, 0x99, 0x73, 0x75, 0x1a, 0x41, 0x9f, 0xf7, 0x7a,
-	0x35, 0x10, 0x1f, 0x8b, 0x63, 0x28, 0x36, 0xbe, 0x7f, 0x0c, 0xc5, 0x97, 0x50, 0x61, 0x5d, 0x1e,
-	0xbf, 0x88, 0x85, 0x74, 0x30, 0x19, 0x8f, 0x3d, 0x3f, 0xa4, 0x36, 0x57, 0xb8, 0x25, 0xbc, 0x3d,
-	0xb2, 0xce, 0xba, 0x2f, 0xa4, 0x8c, 0x36, 0x22, 0x24, 0xfa, 0x0a, 0xf6, 0x92, 0x9d, 0xf6, 0xe9,
-	0x4b, 0x62, 0x0d, 0x5f, 0x5b, 0xe7, 0x01, 0xf1, 0x5c, 0x1e, 0xb7, 0x93, 0xc7, 0xdb, 0xd3, 0x2e,
-	0x62, 0xfa, 0xb2, 0xc6, 0xb1, 0x1d, 0x17, 0x7d, 0x00, 0xa5, 0x60, 0xc4, 0x15, 0x9a, 0xcd, 0xf3,
-	0x55, 0xb6, 0x84, 0x2d, 0x13, 0x8c, 0xba, 0xf6, 0xa4, 0xce, 0x48, 0x67, 0x23, 0x3b, 0xb6, 0xdf,
-	0x36, 0xb2, 0x43, 0x85, 0xcd, 0xa9, 0xb3, 0x22, 0xd2, 0x20, 0x41, 0x65, 0x67, 0xce, 0x1b, 0x12,
-	0xa9, 0x47, 0xbc, 0x11, 0xd3, 0xc7, 0x1a, 0xf3, 0x01, 0x94, 0x4f, 0xb9, 0xfa, 0xa7, 0xae, 0x3d,
-	0xf6, 0x1c, 0x37, 0xac, 0xec, 0xf2, 0xfc, 0x68, 0xe6, 0x92, 0xb4, 0x41, 0x43, 0x5c, 0xe2, 0x94,
-	0x9a, 0x24, 0x44, 0xf7, 0xa0, 0x38, 0x19, 0x0f, 0xa6, 0x19, 0x2b, 0x17, 0x66, 0x2c, 0x4c, 0xc6,
-	0x83, 0x38, 0x1b, 0x53, 0x94, 0xbe, 0xd7, 0xa7, 0xf6, 0xc4, 0xa7, 0x24, 0xf4, 0x2d, 0x37, 0x20,
-	0x91, 0x4a, 0xa8, 0xec, 0x71, 0x16, 0xdc, 0x89, 0xf1, 0x26, 0x43, 0x47, 0x3a, 0xa1, 0xfa, 0x2f,
-	0x32, 0xb0, 0x69, 0xd0, 0x70, 0x4e, 0xe4, 0xfe, 0x58, 0x21, 0x28, 0x17, 0x79, 0x5c, 0xb2, 0xef,
-	0xea, 0x71, 0xf9, 0x18, 0x4a, 0xc6, 0x48, 0x26, 0x1e, 0x7b, 0xe2, 0x3e, 0x91, 0x37, 0x09, 0xc7,
-	0x93, 0xc8, 0x27, 0x26, 0x53, 0xd5, 0xd7, 0x50, 0x99, 0x2f, 0x52, 0xca, 0xdb, 0xbf, 0x09, 0xbb,
-	0x9c, 0xf9, 0xd3, 0xd1, 0x62, 0xc4, 0x0f, 0xc6, 0xb2, 0x61, 0x1f, 0x5e, 0x1e, 0x31, 0x26, 0x8a,
-	0xc1, 0x5b, 0x6c, 0x31, 0xa4, 0xbb, 0x1f, 0x8c, 0xab, 0xff, 0x34, 0x03, 0x79, 0xee, 0xf0, 0x74,
-	0x1d, 0x3e, 0x8e, 0xc2, 0x1d, 0xea, 0x46, 0xe7, 0x78, 0xc2, 0x96, 0x4c, 0xfa, 0xe2, 0x23, 0xe2,
-	0xf8, 0x83, 0xaf, 0xef, 0xa2, 0x95, 0x48, 0x55, 0x9b, 0x50, 0x4c, 0x62, 0x11, 0xc0, 0xca, 0xc3,
-	0x67, 0xe3, 0x80, 0x7c, 0xaa, 0x5c, 0x89, 0xbf, 0x3f, 0x53, 0x32, 0xf1, 0xf7, 0x17, 0xe2, 0x8e,
-	0x8f, 0x80, 0xdf, 0x57, 0x72, 0x71, 0xe2, 0xfe, 0x17, 0xca, 0x52, 0xf5, 0x77, 0xab, 0xb0, 0x77,
-	0x61, 0xb7, 0xde, 0x52, 0xdd, 0x2e, 0x12, 0x5a, 0xd9, 0xef, 0x2b, 0xb4, 0x7e, 0x05, 0x1b, 0x42,
-	0x72, 0x53, 0x9b, 0xc4, 0xd2, 0x2b, 0x77, 0xa1, 0xf4, 0x5a, 0x8f, 0x88, 0x25, 0x00, 0x69, 0xb0,
-	0x65, 0x4d, 0xc2, 0xe7, 0x9e, 0xef, 0xfc, 0x26, 0xb5, 0x60, 0xc5, 0x6d, 0xbd, 0x85, 0x0b, 0x16,
-	0x4d, 0x33, 0xc4, 0x2b, 0xb6, 0x06, 0xc8, 0xf6, 0x5e, 0xbb, 0x43, 0xc7, 0x7d, 0x91, 0x98, 0xa9,
-	0xe5, 0xb9, 0x55, 0x1f, 0x4d, 0x01, 0x56, 0x22, 0xf2, 0x78, 0x42, 0x6e, 0x41, 0x39, 0x55, 0x44,
-	0x20, 0xdd, 0xc8, 0xa5, 0x24, 0x65, 0x80, 0x7e, 0x09, 0xca, 0x64, 0x3c, 0x53, 0xcf, 0xea, 0xc5,
-	0xf5, 0x94, 0x05, 0x71, 0x5c, 0xcb, 0x07, 0x4c, 0x3e, 0x24, 0xea, 0xc8, 0x8b, 0x63, 0xed, 0x29,
-	0x15, 0xb7, 0x25, 0x5a, 0x09, 0xd1, 0xb7, 0x76, 0xa9, 0xe8, 0x6b, 0x4d, 0x45, 0x5f, 0x03, 0x6e,
-	0xc4, 0xf2, 0x97, 0xa4, 0xe6, 0xdf, 0xb5, 0xa3, 0x98, 0x31, 0xe0, 0x62, 0xf9, 0xaa, 0x25, 0x25,
-	0xf1, 0x74, 0x72, 0xf5, 0x98, 0x06, 0xfd, 0x02, 0x14, 0x6b, 0x38, 0xf4, 0x5e, 0x27, 0x67, 0xb4,
-	0x70, 0xe1, 0x8c, 0x96, 0x25, 0x6d, 0x34, 0xa1, 0x6d, 0xf8, 0x50, 0xb6, 0xde, 0x73, 0x4f, 0x69,
-	0x28, 0x34, 0x03, 0xb1, 0xc2, 0x90, 0x8e, 0xc6, 0x61, 0xd4, 0x14, 0xcf, 0xe7, 0x0a, 0x3e, 0x8f,
-	0x6f, 0x88, 0xf6, 0x47, 0xa4, 0x98, 0xd6, 0x04, 0xa1, 0x1e, 0xd1, 0xcd, 0x5a, 0x76, 0xa5, 0xef,
-	0x63, 0xd9, 0xcd, 0x0a, 0xe3, 0xf2, 0x0f, 0x17, 0xc6, 0xeb, 0x97, 0x09, 0x63, 0xf4, 0x21, 0xe4,
-	0xd8, 0x9e, 0x4e, 0x99, 0xab, 0x87, 0xed, 0x2d, 0x18, 0xb3, 0x32, 0x74, 0xf5, 0x77, 0x19, 0xd8,
-	0x5b, 0x20, 0xb2, 0xe5, 0xe2, 0xfd, 0xb1, 0x04, 0x77, 0xef, 0x52, 0xc1, 0x7d, 0xf3, 0x52, 0xc1,
-	0x2d, 0xc5, 0xe3, 0x22, 0xf1, 0xfd, 0x17, 0x19, 0x28, 0xf6, 0xba, 0x0d, 0xb6, 0x09, 0x16, 0x51,
-	0xcc, 0xdb, 0xb0, 0xc2, 0x06, 0x39, 0x76, 0xfd, 0x2c, 0x4f, 0xc6, 0xcc, 0xd8, 0x7c, 0x08, 0x8a,
-	0x15, 0x04, 0x5e, 0xdf, 0xb1, 0xc2, 0x38, 0x48, 0x3a, 0x3b, 0x17, 0xcc, 0xdb, 0xeb, 0x36, 0x6a,
-	0x92, 0x2a, 0x0a, 0x8b, 0x3e, 0xb9, 0x82, 0xd7, 0xa7, 0x39, 0x45, 0x1d, 0x5f, 0x43, 0x81, 0xeb,
-	0x63, 0x9f, 0x32, 0xdb, 0x43, 0x9a, 0xf7, 0x95, 0x74, 0x39, 0xac, 0x45, 0x98, 0xe3, 0x4f, 0xae,
-	0x88, 0xbd, 0xbc, 0x48, 0x1d, 0x6d, 0xc2, 0x06, 0x6b, 0x20, 0x2f, 0x60, 0x44, 0x03, 0xee, 0x97,
-	0xa9, 0xfe, 0xcf, 0x2c, 0xec, 0xf5, 0x02, 0xea, 0x77, 0x87, 0x96, 0x4b, 0xf5, 0x2e, 0xa6, 0x81,
-	0x37, 0xf1, 0xfb, 0xd4, 0xe8, 0x3f, 0xa7, 0x23, 0x8b, 0xad, 0xd2, 0x38, 0x8c, 0x37, 0xba, 0xad,
-	0xb2, 0x86, 0x0b, 0x8e, 0x8c, 0xdf, 0x65, 0xd3, 0x24, 0x48, 0xee, 0xcf, 0x5c, 0xf0, 0x64, 0x24,
-	0xf7, 0x23, 0x92, 0x43, 0xd8, 0xe6, 0xf1, 0xc2, 0xbe, 0xe5, 0x9e, 0xd2, 0xe4, 0x2a, 0x14, 0x7b,
-	0xe6, 0x4d, 0x86, 0xc4, 0x0c, 0x97, 0x58, 0x7c, 0x51, 0x8c, 0x31, 0xcf, 0x23, 0xbd, 0x5a, 0x6b,
-	0x31, 0x21, 0xfa, 0x02, 0x76, 0xf8, 0xd8, 0x10, 0x97, 0x86, 0xaf, 0x3d, 0xff, 0x85, 0x38, 0x62,
-	0x8c, 0x76, 0xc6, 0x6b, 0x78, 0x8b, 0x63, 0xdb, 0x02, 0xa9, 0x4b, 0xdc, 0x34, 0x97, 0xe8, 0x24,
-	0x61, 0xd6, 0xac, 0x3f, 0xb0, 0xfa, 0xd1, 0x05, 0x18, 0x91, 0xcb, 0xe0, 0x48, 0x3d, 0xc2, 0x55,
-	0xff, 0x06, 0x94, 0xe3, 0x84, 0xd8, 0xe2, 0x02, 0xac, 0xc8, 0xfb, 0x88, 0xdc, 0xe1, 0xa1, 0x76,
-	0xb0, 0x26, 0xae, 0xa4, 0x36, 0x6b, 0x6d, 0x25, 0x8b, 0xd6, 0xa1, 0xa0, 0x76, 0x49, 0x1c, 0x87,
-	0x90, 0xab, 0xfe, 0xa3, 0x25, 0xd8, 0x5c, 0x30, 0xc3, 0xe8, 0x26, 0x94, 0x38, 0x43, 0xc4, 0x31,
-	0xef, 0xe2, 0xa0, 0x91, 0x9f, 0x71, 0xc4, 0x4f, 0x34, 0x74, 0xa1, 0x20, 0x1b, 0xcd, 0x79, 0x47,
-	0xe8, 0x94, 0xbb, 0x97, 0xf3, 0xce, 0xc1, 0x2c, 0x00, 0x83, 0xe8, 0x1a, 0xaf, 0xf6, 0xd7, 0xcc,
-	0x36, 0xec, 0x7b, 0xaf, 0xa8, 0x2f, 0xae, 0xb6, 0x12, 0xee, 0x42, 0x96, 0x97, 0x87, 0x2e, 0x73,
-	0x32, 0x6f, 0x44, 0xd9, 0x18, 0xc8, 0x60, 0x20, 0xf4, 0x00, 0x0a, 0x03, 0x6a, 0x85, 0x4c, 0x42,
-	0x04, 0x34, 0x94, 0x9a, 0x66, 0x86, 0x23, 0x1b, 0x82, 0x80, 0xc9, 0x17, 0x18, 0xc4, 0xdf, 0x08,
-	0x03, 0x72, 0xc6, 0xc4, 0x97, 0x1c, 0x47, 0x02, 0xce, 0x72, 0xd2, 0xb9, 0xf8, 0x61, 0xca, 0xb9,
-	0x78, 0x01, 0x7b, 0x62, 0xc5, 0x19, 0xcf, 0x30, 0x2c, 0x86, 0xdd, 0x53, 0xb6, 0xc1, 0x19, 0x4c,
-	0x86, 0xc4, 0xa7, 0x43, 0x6a, 0x05, 0x94, 0x8c, 0xa9, 0xef, 0x78, 0xb6, 0x54, 0x4e, 0x97, 0x75,
-	0x6f, 0x3b, 0xca, 0x8a, 0x45, 0xce, 0x2e, 0xcf, 0x58, 0xfd, 0x0e, 0x94, 0xb9, 0x99, 0x2b, 0xc0,
-	0xaa, 0x61, 0xd6, 0xb0, 0xc9, 0x83, 0x59, 0x4a, 0xb0, 0xa6, 0xb7, 0x75, 0x53, 0xe7, 0x57, 0x19,
-	0x33, 0x6c, 0xfa, 0x35, 0xc3, 0xac, 0x1d, 0x35, 0x75, 0xe3, 0x84, 0xdf, 0x6d, 0x2c, 0x42, 0xbe,
-	0xd5, 0xa9, 0xeb, 0x0d, 0x9d, 0x5f, 0x6a, 0x2c, 0xc0, 0x2a, 0xd6, 0x9a, 0x5a, 0xcd, 0xd0, 0x94,
-	0xa5, 0xea, 0xff, 0x5d, 0x86, 0x52, 0x6a, 0x84, 0xd0, 0xd7, 0xb0, 0x1f, 0xab, 0x5f, 0xbe, 0xfd,
-	0x7a, 0x36, 0x19, 0x0c, 0xa8, 0x08, 0xa2, 0x1a, 0x4b, 0x2f, 0xd9, 0x6e, 0x44, 0xc1, 0x36, 0x5e,
-	0x47, 0x11, 0x5e, 0x1d, 0xa3, 0x63, 0xb8, 0x91, 0xce, 0x9c, 0xda, 0x8c, 0xda, 0x74, 0x68, 0x9d,
-	0x4b, 0x7f, 0xd6, 0xb5, 0x64, 0x11, 0xc9, 0xad, 0x68, 0x9d, 0x11, 0xb1, 0x25, 0x6b, 0x0f, 0x13,
-	0x55, 0xdb, 0x13, 0x7f, 0xba, 0x64, 0xf3, 0x78, 0xd3, 0x1e, 0xc6, 0xd5, 0xd6, 0x25, 0x0a, 0xfd,
-	0x04, 0xd8, 0xe6, 0x72, 0xc0, 0x64, 0x6c, 0x10, 0x52, 0x1a, 0xc7, 0xfc, 0xe7, 0xf1, 0xba, 0x84,
-	0x1b, 0x12, 0xcc, 0x64, 0xe5, 0x40, 0x84, 0x9f, 0x2e, 0x73, 0x82, 0xe5, 0x01, 0x0f, 0x3e, 0xbd,
-	0x05, 0xe5, 0xf1, 0xc0, 0x96, 0xcf, 0xc4, 0xf0, 0x4d, 0xab, 0xf0, 0x5f, 0x95, 0xc6, 0x03, 0xbb,
-	0x15, 0x03, 0x99, 0x5e, 0x7a, 0x4e, 0x2d, 0x9b, 0xfa, 0x84, 0xba, 0xbe, 0xd3, 0x7f, 0xce, 0x80,
-	0x44, 0x58, 0x0e, 0x7c, 0x96, 0xf3, 0x78, 0x47, 0xe0, 0xb5, 0x18, 0xdd, 0xe3, 0x58, 0xd4, 0x80,
-	0xeb, 0x51, 0x13, 0xa3, 0x2b, 0xce, 0x6c, 0x60, 0xa8, 0x3b, 0xf0, 0xfc, 0xbe, 0xa8, 0x31, 0x2f,
-	0x86, 0x47, 0x92, 0xe1, 0x29, 0x95, 0x36, 0x25, 0x8a, 0x9e, 0x38, 0xf0, 0x06, 0x64, 0x64, 0xf9,
-	0x2f, 0xa8, 0x2f, 0x9d, 0x81, 0xdc, 0x46, 0xc9, 0xf3, 0x27, 0x0e, 0x3a, 0x83, 0x16, 0xc7, 0x08,
-	0x3f, 0x20, 0xfa, 0x15, 0xbc, 0x37, 0xb6, 0x1d, 0xe2, 0x8d, 0x43, 0x67, 0xe4, 0xfc, 0x46, 0xfa,
-	0x06, 0x9c, 0x53, 0xd7, 0x1a, 0x0e, 0xd9, 0x30, 0x09, 0x73, 0x64, 0x6f, 0x6c, 0x3b, 0x9d, 0x04,
-	0x85, 0x11, 0x13, 0xa0, 0x7b, 0xb0, 0x3b, 0x19, 0x92, 0xd4, 0x94, 0x30, 0x3d, 0xe6, 0x7b, 0x43,
-	0xe9, 0x5e, 0xd8, 0x9a, 0x0c, 0xeb, 0xd3, 0x39, 0x51, 0x05, 0x8e, 0x31, 0xd3, 0xcb, 0x89, 0x17,
-	0x5a, 0xc4, 0x1a, 0x8f, 0x87, 0x11, 0x1b, 0x84, 0x1e, 0x4f, 0x9e, 0x4b, 0xd3, 0x63, 0x97, 0x53,
-	0xd4, 0xa6, 0x04, 0xa6, 0xc7, 0x12, 0xe7, 0xfc, 0x5e, 0x35, 0x5b, 0x10, 0xf2, 0x2c, 0x50, 0x24,
-	0x98, 0xcc, 0x1a, 0xf8, 0xd6, 0x88, 0x12, 0xdf, 0x9b, 0x84, 0xac, 0xed, 0x65, 0x8e, 0x2d, 0x72,
-	0x20, 0x16, 0x30, 0xa6, 0x14, 0xd8, 0x44, 0x72, 0x55, 0xeb, 0x86, 0x81, 0x3c, 0x34, 0x2c, 0x8c,
-	0x07, 0xb6, 0x2a, 0x41, 0xd5, 0xff, 0x9e, 0xe1, 0x9c, 0x3f, 0xd5, 0x56, 0x6f, 0x27, 0x0d, 0x5b,
-	0xb0, 0x31, 0xf4, 0x2c, 0x3b, 0xea, 0xbd, 0xf0, 0xff, 0x08, 0x3d, 0x98, 0xbc, 0x5a, 0xdd, 0xf4,
-	0x2c, 0x5b, 0x0e, 0x42, 0xf2, 0x4a, 0xc3, 0xfa, 0x30, 0x0d, 0x47, 0x4f, 0x61, 0x9b, 0x09, 0xb4,
-	0xf9, 0x22, 0x85, 0x30, 0x4c, 0x5e, 0xd7, 0xef, 0x48, 0xba, 0x05, 0xc5, 0x6e, 0x7a, 0xf3, 0xb8,
-	0xea, 0x18, 0x76, 0x16, 0xb7, 0x82, 0x4d, 0x66, 0xaa, 0xc2, 0x80, 0xbe, 0x8c, 0x8e, 0x6f, 0xc4,
-	0xfe, 0x64, 0x2b, 0x51, 0x96, 0x41, 0x5f, 0xca, 0x53, 0x9c, 0xeb, 0x50, 0xe0, 0xd9, 0x46, 0x34,
-	0xf4, 0x9d, 0xbe, 0x1c, 0x1d, 0x60, 0xa0, 0x16, 0x87, 0x54, 0x3b, 0x50, 0x8a, 0x1a, 0xc9, 0x84,
-	0x9a, 0x78, 0xa8, 0x83, 0x7d, 0x88, 0x0b, 0x1f, 0xf2, 0x96, 0x0b, 0x87, 0xf0, 0x2d, 0xdd, 0x75,
-	0x28, 0x08, 0xf4, 0x34, 0xd6, 0xaf, 0x84, 0x45, 0x0e, 0xae, 0xe7, 0xaa, 0xff, 0x2b, 0x03, 0xfb,
-	0x17, 0x77, 0x1b, 0x1d, 0xc0, 0xe6, 0x74, 0xf0, 0x42, 0x9f, 0x77, 0xc4, 0xf5, 0x22, 0x87, 0x7a,
-	0x3c, 0x26, 0xa1, 0xcf, 0x3a, 0xe1, 0x7a, 0xe8, 0xe7, 0xb0, 0x17, 0xd3, 0xfb, 0xd4, 0x9e, 0x48,
-	0x3f, 0x53, 0xb2, 0x3b, 0xbb, 0x11, 0x01, 0x8e, 0xf0, 0xa2, 0x6f, 0xa8, 0x01, 0x48, 0xc8, 0x71,
-	0xb6, 0xe8, 0xa2, 0x18, 0x8c, 0x05, 0x06, 0x50, 0x6a, 0x00, 0xb0, 0x22, 0xf2, 0x74, 0x06, 0x8f,
-	0x65, 0x0e, 0xc6, 0xd4, 0x83, 0xa1, 0x75, 0x1a, 0x48, 0x93, 0x42, 0x24, 0xaa, 0x7f, 0x37, 0x03,
-	0xeb, 0xbd, 0x6e, 0x23, 0xf5, 0x2a, 0x0d, 0x63, 0xc7, 0x69, 0xe4, 0x56, 0x6c, 0xd6, 0x15, 0xa7,
-	0x40, 0xdd, 0x46, 0x1f, 0xc3, 0xfa, 0xec, 0xbb, 0x35, 0x32, 0x52, 0x3d, 0x48, 0xbf, 0x5a, 0x73,
-	0x03, 0x8a, 0x43, 0xaf, 0x6f, 0x0d, 0xc9, 0x20, 0x19, 0x91, 0x0f, 0x1c, 0xd6, 0xe0, 0x6f, 0x00,
-	0x11, 0xd8, 0x9e, 0x36, 0x41, 0xf5, 0xdc, 0x81, 0x73, 0x2a, 0x1a, 0xd2, 0x10, 0x76, 0x5b, 0xfa,
-	0x9d, 0x9d, 0xcc, 0x9c, 0xbb, 0x72, 0xa6, 0xfd, 0x78, 0x7d, 0x32, 0x1e, 0x24, 0x01, 0x8c, 0x3d,
-	0x7a, 0xdd, 0x46, 0xd7, 0x3a, 0x75, 0xdc, 0x53, 0xce, 0xfc, 0xb3, 0x6d, 0xca, 0xcc, 0xb6, 0x09,
-	0x5d, 0x05, 0xe0, 0x77, 0x16, 0x93, 0xcf, 0x33, 0xe4, 0x27, 0x54, 0x1f, 0x33, 0xd3, 0xee, 0xce,
-	0xe7, 0xb0, 0x2a, 0x2f, 0x1e, 0x32, 0x15, 0x67, 0x1e, 0x77, 0xbb, 0xa4, 0xc9, 0xc3, 0x38, 0x4a,
-	0xb0, 0xc6, 0x53, 0x4f, 0x98, 0x3d, 0x94, 0x61, 0x1a, 0x8f, 0x27, 0xdb, 0x58, 0xc9, 0xde, 0xf9,
-	0x0f, 0x19, 0x28, 0xa7, 0x5f, 0x14, 0x41, 0xd7, 0xe1, 0xbd, 0x6e, 0xbd, 0x17, 0x85, 0x89, 0x13,
-	0xbd, 0x5d, 0x53, 0x4d, 0xfd, 0xb1, 0x46, 0xda, 0x1d, 0x53, 0x6f, 0x3c, 0x55, 0xae, 0xa0, 0x5d,
-	0xd8, 0xec, 0x69, 0x44, 0xaf, 0x37, 0x35, 0xd2, 0xea, 0xd4, 0x63, 0x44, 0x06, 0x6d, 0x81, 0xd2,
-	0xd3, 0x48, 0xb7, 0x76, 0xac, 0xb7, 0x8f, 0x23, 0x68, 0x96, 0x07, 0xf1, 0x69, 0xa4, 0xab, 0x61,
-	0xbd, 0x53, 0xd7, 0x55, 0x82, 0xb5, 0x63, 0x22, 0x4b, 0x4c, 0xe6, 0xce, 0xa1, 0xab, 0x50, 0x49,
-	0xd6, 0x6b, 0x98, 0x35, 0x33, 0xc6, 0x2e, 0xa1, 0x1b, 0x70, 0xb5, 0x17, 0xc7, 0xb3, 0xf3, 0x88,
-	0x01, 0xcd, 0x30, 0x49, 0xa7, 0x2d, 0xab, 0x53, 0x96, 0xef, 0xfc, 0xcb, 0x35, 0x28, 0x26, 0xaf,
-	0x65, 0x30, 0xcd, 0x6f, 0x1c, 0x1b, 0x71, 0xc4, 0xc1, 0x15, 0x54, 0x06, 0x78, 0xd4, 0x31, 0xa2,
-	0x34, 0x8f, 0x7a, 0xc0, 0x35, 0x33, 0x4a, 0x67, 0x79, 0x14, 0x44, 0x23, 0x4e, 0xe7, 0x58, 0x01,
-	0xdd, 0x66, 0x2b, 0x2e, 0x60, 0x09, 0x21, 0x28, 0x37, 0x3b, 0x86, 0x41, 0x3a, 0x0d, 0x19, 0xa5,
-	0xa9, 0x2c, 0xf3, 0x20, 0x59, 0x4d, 0xed, 0x3c, 0xd6, 0xf0, 0xd3, 0x04, 0x7c, 0x05, 0x6d, 0x40,
-	0x49, 0xef, 0x12, 0xb5, 0x16, 0x67, 0x5f, 0x65, 0x23, 0x31, 0xad, 0x9f, 0x68, 0xdf, 0xaa, 0x9a,
-	0x56, 0xe7, 0x31, 0x8d, 0xc9, 0x30, 0x4a, 0xa5, 0x20, 0xda, 0xa5, 0x47, 0xf9, 0x8a, 0xa8, 0x02,
-	0x5b, 0x3c, 0x94, 0x32, 0x0e, 0x58, 0x95, 0x98, 0x92, 0x0c, 0x7c, 0xd4, 0x1e, 0x6b, 0x6d, 0x93,
-	0x98, 0x58, 0x3f, 0x3e, 0xd6, 0xb0, 0xa1, 0x94, 0x59, 0xdd, 0x9d, 0x9e, 0xc9, 0x9a, 0x23, 0xe2,
-	0x38, 0x95, 0x75, 0x1e, 0x66, 0xa9, 0x25, 0x62, 0x5e, 0xa7, 0x38, 0x45, 0x04, 0xe6, 0x4e, 0xc3,
-	0x5c, 0x79, 0x70, 0x47, 0xa7, 0x67, 0x2a, 0x1b, 0x2c, 0x17, 0x9b, 0xea, 0x6e, 0x14, 0x3f, 0x1a,
-	0x45, 0xcd, 0x6a, 0x0a, 0x42, 0x7b, 0xb0, 0x9d, 0xc6, 0x45, 0x76, 0xd4, 0x26, 0xfa, 0x00, 0xae,
-	0xd5, 0xb5, 0x46, 0xad, 0xd7, 0x34, 0x89, 0xd6, 0x35, 0xa2, 0x88, 0xd6, 0xc4, 0xd8, 0x6f, 0x4d,
-	0xa3, 0x57, 0x25, 0x64, 0x1b, 0x55, 0xe1, 0xfd, 0x44, 0xe4, 0xed, 0x82, 0x38, 0x5d, 0x65, 0x87,
-	0x15, 0x1c, 0x23, 0x84, 0x11, 0xa7, 0x46, 0xb1, 0xa7, 0x9c, 0x21, 0x94, 0x5d, 0x1e, 0x81, 0x7b,
-	0xfc, 0x84, 0x98, 0xb8, 0xa6, 0x6a, 0x51, 0xfc, 0xaa, 0x52, 0x91, 0x4c, 0xcb, 0x7a, 0x46, 0xbe,
-	0xeb, 0xb4, 0xb5, 0xa8, 0xda, 0x3d, 0x3e, 0xe9, 0xd3, 0xc1, 0xde, 0xe7, 0xf6, 0xa2, 0x7a, 0x1c,
-	0x03, 0xde, 0x63, 0x75, 0xaa, 0x27, 0x35, 0x7c, 0x2c, 0xc2, 0x58, 0x30, 0xd6, 0x9a, 0xa2, 0x4a,
-	0xed, 0x5b, 0x49, 0x72, 0x95, 0x91, 0xd4, 0xba, 0x6d, 0x52, 0x6b, 0x1d, 0xe1, 0x74, 0xb3, 0xa2,
-	0xc8, 0xe2, 0x6b, 0x3c, 0xb2, 0x98, 0xcd, 0xa1, 0x6a, 0x1c, 0x27, 0x83, 0x57, 0xa3, 0x6a, 0xde,
-	0x67, 0x03, 0xd2, 0x33, 0x6a, 0xc7, 0x8c, 0xb7, 0x79, 0xf8, 0xea, 0x07, 0xe8, 0x2e, 0xfc, 0xf4,
-	0x82, 0x51, 0x5c, 0x58, 0x47, 0x15, 0x7d, 0x06, 0x9f, 0xc4, 0x75, 0x9c, 0x3c, 0x3d, 0xc2, 0x7a,
-	0x9d, 0x18, 0xbd, 0x23, 0x43, 0xc5, 0xfa, 0x91, 0x56, 0x5f, 0x54, 0xeb, 0x4d, 0xf4, 0x39, 0xdc,
-	0x9d, 0xcd, 0xd2, 0x6b, 0x5f, 0x9e, 0xe9, 0x43, 0x36, 0x96, 0xa9, 0x90, 0x5d, 0x89, 0xb8, 0xc5,
-	0xc6, 0x3e, 0x19, 0xe2, 0xcc, 0x6d, 0x72, 0xe5, 0x63, 0x26, 0x17, 0xd2, 0xe0, 0x4e, 0x57, 0xb9,
-	0xcd, 0x88, 0x55, 0x1e, 0x2a, 0xdd, 0x4d, 0x84, 0x4a, 0xdf, 0x41, 0xef, 0xc3, 0x7e, 0x4f, 0xe3,
-	0xac, 0xde, 0x4c, 0x32, 0x97, 0xac, 0xe3, 0xa7, 0x4c, 0x10, 0x9c, 0x68, 0xed, 0xa3, 0x0b, 0x29,
-	0x7e, 0xc6, 0x4a, 0x90, 0x51, 0xc2, 0x6d, 0xcd, 0x7c, 0xd2, 0xc1, 0x0f, 0x79, 0x2f, 0xa2, 0x71,
-	0xfd, 0x04, 0xdd, 0x82, 0x0f, 0x64, 0x78, 0x73, 0xab, 0xd6, 0xae, 0x1d, 0x6b, 0x2d, 0xb6, 0x7a,
-	0x22, 0xb1, 0x13, 0x8d, 0xe6, 0x01, 0x5b, 0xd8, 0xd1, 0xf0, 0x27, 0x38, 0xf7, 0x2e, 0xfa, 0x1a,
-	0xbe, 0x94, 0x2b, 0xb8, 0xd3, 0x20, 0x4c, 0xb2, 0x61, 0xcd, 0xd0, 0xda, 0xaa, 0x46, 0xf4, 0xf6,
-	0xf4, 0x5b, 0x54, 0xc6, 0x17, 0x37, 0xd6, 0x6a, 0x51, 0xdd, 0x9f, 0x32, 0xee, 0x62, 0xe3, 0xcb,
-	0x23, 0x94, 0xb5, 0xba, 0xf2, 0xd9, 0x9d, 0x7f, 0x9b, 0x81, 0xdc, 0x23, 0x55, 0x47, 0x6b, 0xb0,
-	0xfc, 0x48, 0xd5, 0xb9, 0xdf, 0x55, 0x7e, 0x7e, 0x26, 0x2e, 0xd8, 0xb3, 0xcf, 0x43, 0x25, 0x1b,
-	0x7d, 0x7e, 0xae, 0xe4, 0xa2, 0xcf, 0x2f, 0x94, 0xa5, 0xe8, 0xf3, 0x9e, 0xb2, 0x1c, 0x7d, 0xde,
-	0x57, 0x56, 0xa2, 0xcf, 0x2f, 0x95, 0xd5, 0xe8, 0xf3, 0x2b, 0x25, 0x1f, 0x7d, 0x3e, 0x50, 0xd6,
-	0xd8, 0x96, 0x99, 0xd3, 0xde, 0x53, 0x6a, 0xf1, 0xf7, 0x7d, 0xe5, 0x28, 0xfe, 0xfe, 0x52, 0x51,
-	0xa3, 0xef, 0x2f, 0x3f, 0x55, 0x1a, 0xf1, 0xf7, 0x3d, 0xe5, 0x61, 0xfc, 0xfd, 0x40, 0xe9, 0xdc,
-	0xa1, 0x50, 0x4c, 0x3e, 0x95, 0xc0, 0x35, 0x40, 0xb7, 0xce, 0x04, 0xf7, 0x74, 0x0b, 0x26, 0x9e,
-	0x17, 0x10, 0xd0, 0x76, 0xc7, 0x24, 0x6d, 0x4d, 0xab, 0xf3, 0x9d, 0xd9, 0x36, 0x6c, 0x44, 0xa3,
-	0xce, 0xe0, 0x22, 0xe0, 0x3d, 0xcb, 0x85, 0x17, 0x0f, 0x25, 0x8b, 0xa6, 0x22, 0x77, 0xe7, 0x21,
-	0xac, 0xcf, 0x04, 0xa5, 0xb0, 0x56, 0x34, 0x58, 0x1d, 0x4c, 0xae, 0xef, 0x00, 0xd2, 0xdb, 0x22,
-	0x45, 0x7a, 0xed, 0x96, 0x66, 0x6a, 0x98, 0x57, 0xb0, 0x05, 0x4a, 0x0c, 0x8f, 0xa0, 0xd9, 0x3b,
-	0x5f, 0xc1, 0xfa, 0x4c, 0xc4, 0x04, 0xab, 0x32, 0x6a, 0x49, 0x53, 0x7b, 0xac, 0x35, 0xc5, 0x7b,
-	0x29, 0x5d, 0x55, 0x15, 0xfc, 0x2d, 0x60, 0x99, 0x3b, 0x75, 0x28, 0xa7, 0xfd, 0xce, 0x0b, 0x63,
-	0x61, 0x8b, 0x90, 0x67, 0x30, 0x9e, 0xca, 0xf2, 0x65, 0xdd, 0x36, 0x4c, 0xdc, 0x53, 0xcd, 0x1e,
-	0xab, 0x3f, 0x77, 0xe7, 0x01, 0xac, 0x46, 0x5e, 0xc9, 0x32, 0x80, 0x61, 0xa8, 0x42, 0x0f, 0x7e,
-	0x26, 0x14, 0x54, 0x9c, 0x3e, 0x14, 0x0a, 0x2a, 0x4e, 0x7f, 0xae, 0x64, 0xef, 0xfc, 0x59, 0x01,
-	0x60, 0xea, 0x66, 0x65, 0x32, 0xa5, 0xd3, 0xd5, 0x70, 0xcd, 0xec, 0x60, 0x52, 0xd7, 0x44, 0x00,
-	0x9f, 0x56, 0x27, 0x47, 0x35, 0x8c, 0x99, 0x4a, 0xbc, 0xc2, 0xc4, 0xb7, 0xde, 0x36, 0x7a, 0x8d,
-	0x86, 0xae, 0xea, 0x8c, 0xc9, 0xe3, 0xe7, 0x17, 0x94, 0x0c, 0x7f, 0x73, 0x41, 0x3e, 0x16, 0xd0,
-	0x89, 0xa3, 0xf4, 0x49, 0xbd, 0xdd, 0x16, 0x0f, 0x3c, 0x44, 0x80, 0xa4, 0x4a, 0xe6, 0x51, 0x7d,
-	0x39, 0x26, 0x97, 0xb8, 0xcc, 0x60, 0x6a, 0x4b, 0x6b, 0x9b, 0xd1, 0xb2, 0xee, 0xe0, 0x99, 0xf7,
+	0x99, 0x54, 0x66, 0x52, 0xaa, 0x1a, 0x9f, 0x8c, 0x39, 0xf9, 0xe0, 0x83, 0xb1, 0x30, 0x8c, 0xbd,
+	0xd8, 0x06, 0x16, 0x3e, 0x19, 0xf0, 0xc5, 0x5e, 0xac, 0x3d, 0x3e, 0x2c, 0xd6, 0x58, 0x78, 0x7d,
+	0x32, 0x7c, 0x30, 0x7c, 0x30, 0x0c, 0xc3, 0xf0, 0xc1, 0x07, 0xc3, 0x87, 0xbd, 0x19, 0xf0, 0xc9,
+	0x88, 0x4f, 0x26, 0x33, 0x49, 0x56, 0x49, 0xad, 0x6e, 0x03, 0x03, 0x14, 0xc0, 0x8c, 0xf7, 0x5e,
+	0xfc, 0x5f, 0xbc, 0xf7, 0xe2, 0x45, 0xbc, 0x28, 0xb8, 0x31, 0x0c, 0xe9, 0xdd, 0xb1, 0xef, 0x85,
+	0x5e, 0x70, 0x37, 0xa0, 0x41, 0xe0, 0x78, 0x2e, 0x19, 0x59, 0xae, 0x75, 0x4a, 0xfd, 0x03, 0x0e,
+	0x46, 0x6b, 0x23, 0xeb, 0x74, 0x64, 0x1d, 0x0c, 0x43, 0xba, 0xbf, 0xe7, 0xf9, 0xfd, 0xaf, 0xfc,
+	0x88, 0xbc, 0xef, 0x8d, 0x46, 0x9e, 0x2b, 0xa8, 0xf6, 0xf7, 0x12, 0xe5, 0x8c, 0xbd, 0xa1, 0xd3,
+	0x3f, 0xb7, 0x9f, 0x49, 0xd4, 0xb5, 0x64, 0x15, 0x93, 0x67, 0x41, 0xdf, 0x77, 0x9e, 0x51, 0x3f,
+	0x46, 0x5f, 0x3f, 0xf5, 0xbc, 0xd3, 0xa1, 0xa4, 0x78, 0x36, 0x19, 0xdc, 0x0d, 0x9d, 0x11, 0x0d,
+	0x42, 0x6b, 0x34, 0x16, 0x04, 0xd5, 0x3f, 0xcd, 0x02, 0xe0, 0xc9, 0x90, 0x62, 0xda, 0xf7, 0x7c,
+	0x1b, 0x29, 0xb0, 0x14, 0x38, 0x76, 0x25, 0x73, 0x23, 0x73, 0x7b, 0x0d, 0xb3, 0x4f, 0xb4, 0x0b,
+	0x39, 0x7f, 0x32, 0xa4, 0xc4, 0xb1, 0x2b, 0x59, 0x0e, 0x5d, 0x65, 0x49, 0xdd, 0x46, 0x7b, 0x90,
+	0x7f, 0x76, 0x1e, 0xd2, 0x80, 0x84, 0x67, 0x95, 0xa5, 0x1b, 0x99, 0xdb, 0xcb, 0x38, 0xc7, 0xd3,
+	0xe6, 0xd9, 0x14, 0xe5, 0x9f, 0x55, 0x96, 0x13, 0x28, 0x7c, 0xc6, 0x8a, 0x9b, 0x50, 0xe2, 0x8c,
+	0x5f, 0x7d, 0x51, 0x59, 0x11, 0xc5, 0x4d, 0xa8, 0x3e, 0x7e, 0xf5, 0xc5, 0x14, 0x71, 0xbf, 0xb2,
+	0x9a, 0x40, 0xdc, 0x47, 0xd7, 0x00, 0x6c, 0xdf, 0x1b, 0x8f, 0xa9, 0xcd, 0x6a, 0xca, 0xf1, 0xe2,
+	0xd6, 0x24, 0xc4, 0x3c, 0x4b, 0xa2, 0xfd, 0xb3, 0x4a, 0x3e, 0x85, 0xc6, 0x67, 0xe8, 0x03, 0x28,
+	0xf2, 0xe6, 0xbf, 0xa2, 0x3e, 0x1b, 0xfe, 0xca, 0x1a, 0x27, 0x28, 0x30, 0xd8, 0x63, 0x01, 0x42,
+	0x08, 0x96, 0x43, 0xea, 0xd8, 0x15, 0xb8, 0x91, 0xb9, 0x5d, 0xc2, 0xfc, 0x9b, 0x65, 0x1b, 0x38,
+	0xae, 0x35, 0x24, 0x3e, 0x1f, 0x97, 0x4a, 0xe1, 0x46, 0xe6, 0x76, 0x1e, 0x17, 0x38, 0x4c, 0x0c,
+	0x55, 0xf5, 0x6f, 0xc3, 0xfa, 0x74, 0xe0, 0x4c, 0xeb, 0xd9, 0x90, 0xa2, 0xbb, 0x90, 0x13, 0xf4,
+	0x41, 0x25, 0x73, 0x63, 0xe9, 0x76, 0xe1, 0x70, 0xfb, 0x20, 0x9e, 0xdf, 0x83, 0x29, 0x31, 0x8e,
+	0xa8, 0xd0, 0x16, 0xac, 0xd0, 0xb1, 0xd7, 0x7f, 0xce, 0x87, 0x76, 0x19, 0x8b, 0x04, 0xab, 0xdc,
+	0xa6, 0xc3, 0xd0, 0x22, 0x93, 0xb1, 0x6d, 0x85, 0x94, 0x8f, 0x6e, 0x1e, 0x17, 0x38, 0xac, 0xc7,
+	0x41, 0xd5, 0x7f, 0x99, 0x81, 0xbd, 0xa6, 0xd7, 0xb7, 0x86, 0xaa, 0x4f, 0xad, 0x90, 0x1a, 0x82,
+	0xb9, 0x30, 0x7d, 0x39, 0xa1, 0x41, 0x88, 0x1a, 0x50, 0x16, 0xfc, 0x43, 0xfa, 0x9e, 0x1b, 0xd2,
+	0xb3, 0xb0, 0xa2, 0xdc, 0xc8, 0xdc, 0x2e, 0x1c, 0x5e, 0x4f, 0x34, 0x47, 0xe5, 0x04, 0x32, 0xa3,
+	0x2a, 0xc8, 0x70, 0x49, 0x64, 0x93, 0x49, 0xd4, 0x81, 0x2d, 0xdf, 0x0a, 0x49, 0x30, 0xa6, 0x7d,
+	0x67, 0xe0, 0xf4, 0xe3, 0xd2, 0x36, 0x78, 0x69, 0xd7, 0x92, 0x9d, 0xb3, 0x42, 0x43, 0x52, 0x45,
+	0x65, 0x21, 0x7f, 0x0e, 0x56, 0xfd, 0x25, 0xac, 0x98, 0xd4, 0xb1, 0x03, 0xc6, 0x21, 0xd4, 0x7d,
+	0x46, 0xf8, 0xb8, 0x2f, 0xf1, 0x71, 0xcf, 0x51, 0xf7, 0x19, 0xc3, 0x31, 0x94, 0x75, 0xfa, 0x5a,
+	0xa0, 0x96, 0x05, 0xca, 0x3a, 0x7d, 0xcd, 0x50, 0xd5, 0xff, 0x95, 0x85, 0xad, 0x45, 0xed, 0x46,
+	0x3f, 0x99, 0xb2, 0x6d, 0xe1, 0x70, 0x37, 0xd1, 0x2e, 0x23, 0x5e, 0x12, 0x7a, 0x3d, 0xe6, 0xe7,
+	0x88, 0x01, 0x97, 0x52, 0x0c, 0xa8, 0xc0, 0x92, 0x35, 0x76, 0x79, 0x95, 0x6b, 0x98, 0x7d, 0xa2,
+	0x1d, 0x58, 0x1d, 0x05, 0x4e, 0x60, 0xbb, 0x9c, 0x55, 0x8b, 0x58, 0xa6, 0xd0, 0x27, 0x90, 0x67,
+	0xc3, 0x12, 0x9e, 0x8f, 0x29, 0xe7, 0xd5, 0xf2, 0x21, 0x4a, 0x0e, 0x45, 0xcd, 0x34, 0xcf, 0xc7,
+	0x14, 0xe7, 0x7c, 0x2b, 0x64, 0x1f, 0xa8, 0x01, 0x4a, 0x30, 0x22, 0xd1, 0xfa, 0x0f, 0x42, 0x36,
+	0xa5, 0x39, 0x9e, 0xed, 0x6a, 0xb2, 0xa5, 0x2d, 0xd9, 0xa7, 0x86, 0xd1, 0x32, 0x18, 0x0d, 0x2e,
+	0x07, 0x23, 0x09, 0xe2, 0x69, 0xf4, 0x33, 0x40, 0x89, 0x72, 0x92, 0x0c, 0x5d, 0xc2, 0x4a, 0x4c,
+	0x1b, 0x71, 0x75, 0x62, 0x3d, 0x41, 0x6a, 0x3d, 0x7d, 0x04, 0x2b, 0x6c, 0x6c, 0x03, 0xce, 0xd3,
+	0x85, 0x43, 0x25, 0xd1, 0x06, 0x3e, 0x37, 0x58, 0xa0, 0xab, 0xff, 0x37, 0x03, 0x68, 0x7e, 0x5a,
+	0xd1, 0x37, 0x50, 0x18, 0x86, 0x74, 0x86, 0x15, 0x92, 0x1d, 0x69, 0x9a, 0x5a, 0x7a, 0x76, 0x4e,
+	0xae, 0x60, 0x18, 0x86, 0x34, 0x2a, 0xe0, 0x08, 0x8a, 0xaf, 0x87, 0xd6, 0x94, 0x35, 0xd1, 0x1c,
+	0x33, 0x3d, 0x69, 0xd6, 0xda, 0x73, 0x45, 0x14, 0x58, 0xa6, 0xa8, 0x0c, 0x13, 0xb6, 0x47, 0xf7,
+	0x4e, 0x13, 0xa3, 0x11, 0x15, 0xb6, 0xc9, 0x0b, 0x7b, 0x3f, 0x51, 0x58, 0xeb, 0xde, 0x71, 0x3c,
+	0xb4, 0xd3, 0xd2, 0x36, 0x79, 0xf6, 0x34, 0xf8, 0x68, 0x0d, 0x72, 0xb2, 0x9c, 0xea, 0xdf, 0xcf,
+	0x40, 0x8e, 0x8d, 0x86, 0x41, 0xc3, 0x58, 0x3e, 0x64, 0x12, 0xf2, 0xa1, 0x0a, 0x25, 0xea, 0xda,
+	0x9c, 0x8d, 0x88, 0x65, 0xdb, 0xbe, 0x94, 0x8d, 0x05, 0xea, 0xda, 0x8c, 0x99, 0x6a, 0xb6, 0xed,
+	0x33, 0xc9, 0xc4, 0x68, 0xc9, 0x2b, 0x6b, 0x38, 0xa1, 0x92, 0xcb, 0xd7, 0x18, 0xe4, 0x31, 0x03,
+	0xa0, 0xbb, 0xb0, 0x95, 0x2a, 0x82, 0x04, 0xa1, 0xef, 0xb8, 0xa7, 0x92, 0x01, 0x37, 0x12, 0x25,
+	0x19, 0x1c, 0x51, 0xfd, 0xdd, 0x12, 0xec, 0x26, 0x26, 0xa4, 0xed, 0x85, 0xec, 0xc7, 0x0a, 0xd9,
+	0x6c, 0x7f, 0x08, 0xe5, 0xb1, 0x3d, 0x89, 0x87, 0x23, 0x6e, 0x6d, 0x71, 0x6c, 0x4f, 0x64, 0x2f,
+	0x75, 0x1b, 0x3d, 0x80, 0xa2, 0x2f, 0x44, 0x84, 0x60, 0xde, 0x2c, 0xe7, 0xc2, 0x9d, 0x24, 0xf3,
+	0x0a, 0x34, 0x67, 0xe0, 0x82, 0x3f, 0x4d, 0xa0, 0xfb, 0x50, 0xb0, 0xfa, 0x7d, 0x1a, 0x04, 0x22,
+	0xe7, 0x12, 0xcf, 0x99, 0x14, 0x6f, 0x35, 0x8e, 0xe5, 0x19, 0xc1, 0x8a, 0xbf, 0x91, 0x0a, 0x4a,
+	0xb2, 0x61, 0x3c, 0xf3, 0x32, 0xcf, 0xbc, 0x97, 0xc8, 0xdc, 0x8d, 0x5b, 0xc9, 0x0b, 0x28, 0x8f,
+	0x53, 0x69, 0xd4, 0x80, 0x8d, 0xd1, 0xbd, 0x53, 0x12, 0x8c, 0x48, 0xdf, 0x1a, 0x5b, 0xcf, 0x9c,
+	0xa1, 0x13, 0x9e, 0xf3, 0x35, 0x59, 0x38, 0xdc, 0x9f, 0x9d, 0x6a, 0x35, 0xa6, 0xc0, 0xeb, 0xa3,
+	0x7b, 0xa7, 0xc6, 0x68, 0x0a, 0x60, 0x9d, 0x10, 0x6c, 0xd3, 0xb7, 0x26, 0x41, 0xb4, 0x76, 0xb7,
+	0xe7, 0x4b, 0x98, 0x04, 0x14, 0x03, 0xa7, 0xe4, 0xdf, 0xa8, 0x06, 0xeb, 0x2e, 0x1b, 0xed, 0x73,
+	0x32, 0xa1, 0x84, 0xbe, 0xa2, 0x6e, 0x28, 0x17, 0x70, 0xb2, 0x0f, 0x7c, 0x3e, 0xce, 0x7b, 0x54,
+	0x63, 0xf8, 0x00, 0x97, 0xdc, 0x64, 0xba, 0xfa, 0x6f, 0x33, 0x50, 0x31, 0x68, 0x68, 0x8c, 0x92,
+	0xd3, 0x16, 0xb1, 0xf3, 0xbc, 0xbc, 0xce, 0xbc, 0x93, 0xbc, 0xfe, 0x03, 0xd8, 0x4b, 0xc9, 0x6b,
+	0x37, 0x51, 0x17, 0x9f, 0xec, 0xc2, 0x61, 0x75, 0xb1, 0xd0, 0x4e, 0xb6, 0x0a, 0xef, 0xfa, 0x8b,
+	0x11, 0xd5, 0x7f, 0x9d, 0x85, 0x8d, 0xb9, 0xe5, 0x8d, 0xde, 0x83, 0xb5, 0x60, 0x7c, 0xfa, 0x5a,
+	0xc8, 0x54, 0x61, 0x39, 0xe4, 0x19, 0x80, 0x4b, 0x55, 0x04, 0xcb, 0xce, 0x88, 0x3a, 0x72, 0x7d,
+	0xf0, 0x6f, 0x26, 0x9a, 0xc6, 0xc3, 0x11, 0xe7, 0x52, 0x29, 0x82, 0x59, 0x52, 0xb7, 0xd1, 0x0d,
+	0x28, 0x3a, 0xa3, 0xc0, 0x21, 0x11, 0x56, 0x2c, 0x05, 0x60, 0xb0, 0xae, 0xa0, 0xb8, 0x09, 0xa5,
+	0x49, 0x40, 0x7d, 0x32, 0xf4, 0x64, 0xaf, 0x84, 0x64, 0x2e, 0x32, 0x60, 0x53, 0xc2, 0xd0, 0xd7,
+	0x90, 0x7f, 0xe9, 0x05, 0xc4, 0x71, 0x07, 0x1e, 0x9f, 0xe3, 0xc2, 0xe1, 0x8d, 0x44, 0xaf, 0x1f,
+	0x79, 0x81, 0xee, 0x0e, 0x3c, 0x7f, 0x24, 0x3a, 0x2b, 0x78, 0x1c, 0xe7, 0x5e, 0x0a, 0x30, 0xeb,
+	0xcd, 0x33, 0x6a, 0xf9, 0xd4, 0x67, 0x0d, 0xc8, 0xf1, 0x45, 0x94, 0x17, 0x00, 0xbe, 0x80, 0x2a,
+	0xfd, 0xe7, 0x96, 0x7f, 0xea, 0xb8, 0xa7, 0x84, 0x7d, 0x58, 0xfd, 0x90, 0xfa, 0x4e, 0x10, 0x3a,
+	0xfd, 0x80, 0x9b, 0x1e, 0x6b, 0x78, 0x37, 0xc2, 0xab, 0x69, 0x74, 0xf5, 0xb7, 0x19, 0x40, 0xf3,
+	0x82, 0x0d, 0x7d, 0x04, 0xeb, 0x23, 0xab, 0x2f, 0x04, 0xc0, 0x33, 0xc7, 0xb5, 0xfc, 0x73, 0x3e,
+	0x84, 0x45, 0x5c, 0x1a, 0x59, 0x7d, 0xb6, 0xf8, 0x8f, 0x38, 0x90, 0x69, 0xc5, 0x88, 0x4e, 0x8e,
+	0x65, 0x4e, 0x12, 0xa0, 0x3b, 0xb0, 0xe1, 0x5b, 0xb6, 0x33, 0x09, 0x92, 0xcb, 0x5f, 0x0c, 0xec,
+	0xba, 0x40, 0xc4, 0x12, 0xa0, 0xfa, 0x35, 0xec, 0x2f, 0x32, 0x1b, 0x82, 0xb1, 0xe7, 0x06, 0x94,
+	0x49, 0xac, 0x19, 0x09, 0xb2, 0x86, 0xd7, 0x82, 0x38, 0x73, 0x0f, 0x76, 0x78, 0x66, 0xcd, 0xb5,
+	0x67, 0x0c, 0x8e, 0xef, 0xa1, 0x7f, 0xa5, 0x9a, 0xcd, 0xc6, 0x6a, 0xb6, 0xba, 0x07, 0xbb, 0x73,
+	0xc5, 0x8a, 0x06, 0x55, 0xff, 0x24, 0x03, 0x3b, 0xc2, 0xe2, 0x31, 0x27, 0xae, 0x4b, 0x87, 0xba,
+	0x1d, 0xbc, 0x43, 0x95, 0xa9, 0x29, 0xcd, 0xce, 0x4c, 0xe9, 0x3b, 0x59, 0x22, 0x33, 0x23, 0xb5,
+	0x32, 0x3b, 0x52, 0x7b, 0xb0, 0x3b, 0xd7, 0x6c, 0xd9, 0xa5, 0xff, 0x9a, 0x81, 0xfd, 0x2e, 0xb7,
+	0xe1, 0x8f, 0x78, 0x13, 0x8e, 0x1c, 0xd7, 0x76, 0xdc, 0xd3, 0x77, 0xe8, 0xd6, 0x6d, 0x50, 0x86,
+	0x8e, 0xfb, 0x82, 0xda, 0x64, 0xb6, 0x77, 0x65, 0x01, 0x3f, 0x8a, 0xfa, 0xc8, 0xb4, 0x03, 0xaf,
+	0x92, 0x44, 0xa6, 0xbc, 0x60, 0x8f, 0xa2, 0x80, 0x62, 0x61, 0xd0, 0xa7, 0x86, 0x69, 0x79, 0x66,
+	0x98, 0x62, 0xab, 0x61, 0xe5, 0x72, 0xab, 0xe1, 0x1a, 0xbc, 0xb7, 0xb0, 0x77, 0xb2, 0xf7, 0x7f,
+	0x9c, 0x85, 0x6d, 0x55, 0xae, 0x10, 0x4c, 0x6b, 0x93, 0xf0, 0x79, 0xd4, 0xf1, 0xcb, 0x79, 0x8f,
+	0xd9, 0xc4, 0xf1, 0xca, 0x7b, 0x41, 0xcf, 0x65, 0x47, 0x0b, 0x11, 0xec, 0x21, 0x3d, 0x8f, 0xf6,
+	0x2e, 0x4b, 0xd3, 0xbd, 0xcb, 0x03, 0x58, 0x4e, 0x28, 0x9c, 0x5b, 0x49, 0x69, 0xba, 0xa8, 0x0d,
+	0x07, 0x5c, 0xf9, 0xf0, 0x2c, 0xe8, 0x21, 0xa0, 0x80, 0xfa, 0xaf, 0x9c, 0x3e, 0x1b, 0x2e, 0xea,
+	0x32, 0x21, 0x48, 0x7d, 0xd9, 0xf9, 0x94, 0xd9, 0x26, 0x88, 0xf4, 0x98, 0x06, 0x6f, 0x04, 0xb3,
+	0xa0, 0xea, 0x01, 0x2c, 0x73, 0x3d, 0x86, 0xa0, 0x6c, 0xe8, 0xed, 0xe3, 0xa6, 0x46, 0x0c, 0x0d,
+	0x3f, 0xd6, 0x55, 0x4d, 0xb9, 0xc2, 0x60, 0x5a, 0xdb, 0xd4, 0x31, 0x83, 0x19, 0x86, 0xde, 0x69,
+	0x2b, 0x99, 0xea, 0x31, 0x6c, 0xa5, 0x1b, 0x58, 0x73, 0x83, 0xd7, 0xd4, 0x47, 0x77, 0x61, 0xd5,
+	0xa7, 0xc1, 0x64, 0x28, 0xf4, 0x43, 0x39, 0xc5, 0x1f, 0x51, 0x4f, 0x18, 0x1a, 0x4b, 0xb2, 0xea,
+	0x3f, 0x5b, 0x86, 0x4d, 0x31, 0x1d, 0xdf, 0x6b, 0xb0, 0xb9, 0xd0, 0x0e, 0x12, 0x42, 0x3b, 0x70,
+	0x98, 0xa0, 0x62, 0xcc, 0x13, 0x90, 0xd0, 0x23, 0x3e, 0x1d, 0x79, 0xaf, 0x98, 0x11, 0xb0, 0x74,
+	0x7b, 0x0d, 0x97, 0x38, 0xd8, 0xf4, 0x30, 0x07, 0x32, 0x6b, 0x37, 0xa6, 0x73, 0xdc, 0x20, 0xb4,
+	0x86, 0xc3, 0xca, 0x2a, 0xdf, 0x0c, 0xa5, 0x86, 0x2d, 0xb4, 0x42, 0xa7, 0xcf, 0x19, 0x4f, 0xd0,
+	0xe0, 0xb2, 0x2c, 0x46, 0xa6, 0xd1, 0x63, 0xa8, 0xd8, 0xe7, 0xae, 0x35, 0x72, 0xfa, 0x64, 0xae,
+	0xbc, 0x1c, 0x2f, 0x2f, 0x69, 0x32, 0xd6, 0x05, 0x69, 0xb2, 0xc0, 0x6d, 0x7b, 0x0a, 0x4b, 0x94,
+	0xfb, 0x2b, 0x28, 0x73, 0x0d, 0x4e, 0x42, 0xdf, 0x39, 0x3d, 0xa5, 0x3e, 0x13, 0xdc, 0x4b, 0x33,
+	0x63, 0xc9, 0x55, 0xb6, 0x29, 0xf0, 0xb8, 0x44, 0x13, 0xa9, 0x00, 0x1d, 0xc3, 0x86, 0x4f, 0x5f,
+	0x59, 0x43, 0xc7, 0xe6, 0xfa, 0x83, 0xb0, 0x0d, 0x35, 0x37, 0xc2, 0x99, 0x2d, 0x22, 0x76, 0xdb,
+	0x07, 0xd1, 0x6e, 0xfb, 0xc0, 0x8c, 0x76, 0xdb, 0x58, 0x49, 0x66, 0x62, 0x60, 0xf4, 0x1d, 0x54,
+	0x26, 0x81, 0x75, 0x4a, 0xc9, 0xc8, 0x73, 0x9d, 0xd0, 0xf3, 0xb9, 0x4e, 0xf1, 0xa9, 0xed, 0x84,
+	0x41, 0x05, 0x78, 0x07, 0x93, 0x5a, 0xab, 0xc7, 0x48, 0x5b, 0x31, 0xa5, 0xca, 0x09, 0xf1, 0xce,
+	0x64, 0x11, 0x38, 0x40, 0x5f, 0x24, 0x34, 0xa0, 0x30, 0xf3, 0xf7, 0x52, 0x1a, 0xd0, 0x48, 0x6a,
+	0xc0, 0x48, 0xf5, 0x55, 0x3b, 0x50, 0x4e, 0xa3, 0xd2, 0x22, 0x41, 0xaa, 0xf6, 0x58, 0x24, 0xdc,
+	0x80, 0xa5, 0x97, 0x7d, 0x47, 0x1a, 0x91, 0xe5, 0x64, 0xf9, 0xaa, 0x8e, 0x19, 0xaa, 0xfa, 0x0f,
+	0xf2, 0x80, 0x92, 0xec, 0x27, 0xd9, 0xf8, 0x0d, 0xdc, 0x37, 0xe5, 0xf2, 0xec, 0x5b, 0x71, 0x39,
+	0x7a, 0x04, 0xc5, 0x81, 0xe5, 0x0c, 0xa9, 0x2d, 0x38, 0x85, 0xf3, 0x65, 0xe1, 0xf0, 0x20, 0x69,
+	0x5f, 0xce, 0x35, 0xe2, 0xa0, 0xc1, 0x73, 0x70, 0xe6, 0xd0, 0xdc, 0xd0, 0x3f, 0xc7, 0x85, 0xc1,
+	0x14, 0xb2, 0xef, 0x80, 0x32, 0x4b, 0xc0, 0xe4, 0x0b, 0x93, 0x3c, 0xd2, 0x37, 0xf2, 0x82, 0x9e,
+	0xa3, 0x6f, 0x60, 0x45, 0x18, 0xf7, 0xa2, 0xa1, 0x3f, 0x79, 0x73, 0x8d, 0x13, 0x9f, 0xaa, 0x9e,
+	0x4d, 0xb1, 0xc8, 0xf7, 0xf3, 0xec, 0x57, 0x99, 0xea, 0x5f, 0xad, 0x40, 0x21, 0x81, 0x42, 0x00,
+	0xab, 0xbd, 0x76, 0xcf, 0xd0, 0xea, 0xca, 0x15, 0xb4, 0x0d, 0x1b, 0xbd, 0xf6, 0xc3, 0x76, 0xe7,
+	0x49, 0x9b, 0xe0, 0x5e, 0x53, 0x23, 0xed, 0x5a, 0x4b, 0x53, 0x32, 0x68, 0x07, 0x10, 0xae, 0x99,
+	0x7a, 0xfb, 0x98, 0x1c, 0xe3, 0x4e, 0xaf, 0x4b, 0x34, 0x8c, 0x3b, 0x58, 0xc9, 0xa2, 0xab, 0x50,
+	0x91, 0x82, 0x85, 0xe8, 0x75, 0x26, 0x55, 0x1a, 0xba, 0x86, 0x25, 0x76, 0x09, 0xed, 0xc2, 0xe6,
+	0xf1, 0x13, 0xd2, 0x55, 0xb5, 0x06, 0x69, 0xd5, 0x9a, 0x8d, 0x5e, 0x5b, 0x35, 0x99, 0xb8, 0x59,
+	0x46, 0x15, 0xd8, 0xc2, 0x9a, 0xd1, 0xe9, 0x61, 0x55, 0x33, 0x48, 0x53, 0x6f, 0xe9, 0x66, 0x8d,
+	0x63, 0x56, 0xd0, 0x3e, 0xec, 0xb4, 0x6a, 0xdf, 0x92, 0x36, 0x26, 0x47, 0x5a, 0x0d, 0x6b, 0xd8,
+	0x20, 0x58, 0xab, 0xa9, 0x27, 0x5a, 0x5d, 0x59, 0x4d, 0xb6, 0x4d, 0x20, 0x89, 0x5e, 0x57, 0x72,
+	0x0c, 0xdc, 0xd2, 0x0d, 0x26, 0xe6, 0x12, 0xe0, 0x3c, 0x6b, 0x5a, 0x04, 0x6e, 0x34, 0x3b, 0x4f,
+	0x88, 0xde, 0x6e, 0x74, 0x70, 0x4b, 0xd4, 0xb3, 0x86, 0xae, 0xc3, 0x7b, 0x51, 0x0b, 0x48, 0xad,
+	0xd9, 0xec, 0xa8, 0x1c, 0x41, 0x1a, 0x35, 0xbd, 0xd9, 0xc3, 0x9a, 0x02, 0x8c, 0xa0, 0xd7, 0x36,
+	0x7a, 0xaa, 0xaa, 0x19, 0x46, 0xa3, 0xd7, 0x24, 0x8f, 0x3a, 0x06, 0x79, 0x5c, 0x6b, 0xea, 0x75,
+	0x51, 0x42, 0x01, 0xbd, 0x0f, 0xfb, 0x7a, 0x5b, 0xed, 0x60, 0xac, 0xa9, 0xe6, 0x7c, 0x0d, 0x45,
+	0xd6, 0xac, 0xae, 0x41, 0xcc, 0x0e, 0x51, 0x0d, 0x72, 0x52, 0x6b, 0xd7, 0x3b, 0x8f, 0x35, 0xac,
+	0x94, 0xd0, 0x87, 0x70, 0xc3, 0xac, 0x37, 0x48, 0xad, 0xdb, 0x6d, 0xea, 0xb2, 0xd2, 0xb9, 0x91,
+	0x2b, 0xa3, 0x4d, 0x58, 0x6f, 0x77, 0xa2, 0xee, 0x34, 0x3a, 0xbd, 0x76, 0x5d, 0x59, 0x67, 0xc3,
+	0xd9, 0xd0, 0x9b, 0xa6, 0x86, 0x09, 0xd6, 0x0c, 0x13, 0xeb, 0x7c, 0x34, 0x0d, 0x45, 0x41, 0x0a,
+	0x14, 0x6b, 0x6d, 0x72, 0xfc, 0x84, 0x37, 0x5f, 0xab, 0x2b, 0x1b, 0xe8, 0x26, 0x5c, 0x8f, 0x3a,
+	0x8f, 0xb5, 0xba, 0xce, 0xdb, 0xc8, 0x26, 0x4a, 0xc3, 0xa4, 0x56, 0xaf, 0x63, 0xcd, 0x30, 0x14,
+	0xc4, 0x7a, 0xa0, 0xb6, 0x88, 0xd6, 0xae, 0x93, 0x9e, 0xa1, 0xe1, 0x48, 0x43, 0x90, 0xba, 0xd6,
+	0xd6, 0xb5, 0xba, 0xb2, 0xc9, 0x9a, 0xaa, 0xb6, 0x88, 0xca, 0x0a, 0x30, 0x89, 0xda, 0x69, 0x9b,
+	0xb8, 0xd3, 0x24, 0xed, 0x8e, 0x19, 0x35, 0xfe, 0xa8, 0xa9, 0x29, 0x5b, 0xe8, 0x1a, 0xec, 0xa9,
+	0x2d, 0x52, 0xeb, 0x99, 0x27, 0x1d, 0xac, 0x7f, 0x27, 0x7a, 0x84, 0xb5, 0x5f, 0x6b, 0xaa, 0xa9,
+	0xd5, 0x95, 0x6d, 0xd6, 0x13, 0xb5, 0x25, 0x2a, 0x90, 0x93, 0xa7, 0xec, 0xa0, 0x2d, 0x50, 0xd4,
+	0x16, 0x91, 0x1c, 0x25, 0x1b, 0xbd, 0xcb, 0xe6, 0x1e, 0x77, 0x7a, 0x1c, 0xc6, 0x79, 0x4f, 0x94,
+	0xc2, 0x46, 0xb3, 0x82, 0x3e, 0x82, 0x6a, 0xcc, 0x97, 0x92, 0xa6, 0xc6, 0xe7, 0x26, 0x35, 0xea,
+	0x7b, 0x6c, 0xd4, 0xdb, 0x1d, 0xd2, 0x3e, 0xd2, 0x1b, 0x9d, 0x16, 0x31, 0x7a, 0xdd, 0x6e, 0x07,
+	0x9b, 0xca, 0x7e, 0xf5, 0x3f, 0x65, 0x20, 0xc7, 0x16, 0x16, 0xdb, 0x5d, 0x1f, 0xc2, 0xb6, 0x35,
+	0x1e, 0x0f, 0xcf, 0xc9, 0xd4, 0x7b, 0x49, 0x5e, 0x3b, 0x36, 0xe5, 0xeb, 0x2c, 0x8f, 0x37, 0x39,
+	0x72, 0x6a, 0xfc, 0x3c, 0x71, 0x6c, 0x3a, 0x6f, 0x43, 0xa2, 0x6f, 0xa0, 0x18, 0x70, 0x95, 0x92,
+	0x12, 0x01, 0x97, 0x6b, 0x9c, 0x42, 0x10, 0x83, 0x02, 0x74, 0x04, 0xa5, 0x94, 0xba, 0xa9, 0x2c,
+	0xbf, 0x8d, 0x8e, 0x29, 0x26, 0x75, 0x4c, 0xf5, 0x09, 0x20, 0xfe, 0xd1, 0xa5, 0xfe, 0xb4, 0xc1,
+	0xb1, 0x32, 0xcd, 0x24, 0x94, 0xe9, 0x27, 0x90, 0xe7, 0x96, 0x58, 0x40, 0x43, 0xd9, 0x54, 0x34,
+	0xe3, 0x29, 0x34, 0x68, 0x88, 0xb9, 0xe3, 0xd5, 0xa0, 0x61, 0x95, 0x40, 0x31, 0xb2, 0x8c, 0x79,
+	0x63, 0x3b, 0xb0, 0x25, 0x74, 0xe2, 0x98, 0xfa, 0x89, 0x71, 0x93, 0x4e, 0xc7, 0x6b, 0x33, 0x45,
+	0xa5, 0xdb, 0x83, 0x91, 0x3f, 0x07, 0xab, 0x7e, 0x06, 0x79, 0xa6, 0x93, 0x7e, 0xe3, 0xb9, 0x14,
+	0xdd, 0x82, 0xb2, 0x37, 0x18, 0x04, 0x34, 0x24, 0x23, 0xc7, 0x9d, 0x84, 0x34, 0xe0, 0x2d, 0x5f,
+	0xc1, 0x25, 0x01, 0x6d, 0x09, 0x60, 0xf5, 0x1b, 0x00, 0xa1, 0x6d, 0x7a, 0xae, 0x13, 0x32, 0x53,
+	0xd9, 0x09, 0x08, 0xd7, 0x70, 0x72, 0xe2, 0x72, 0x4e, 0xf0, 0x98, 0x25, 0xd1, 0x0e, 0xac, 0xbe,
+	0xf2, 0x86, 0x93, 0x11, 0x95, 0x4e, 0x4e, 0x99, 0xaa, 0xfe, 0xdd, 0x0c, 0x14, 0x8f, 0x7d, 0xcb,
+	0x0d, 0xa9, 0xcd, 0x8a, 0x08, 0xd0, 0x4f, 0x61, 0x25, 0xf4, 0x42, 0x6b, 0x28, 0x8d, 0xdf, 0xe4,
+	0xbe, 0x7c, 0x5a, 0x13, 0x16, 0x34, 0xe8, 0x16, 0x64, 0xc3, 0x33, 0xb9, 0xa7, 0xbd, 0x80, 0x32,
+	0x1b, 0x9e, 0x31, 0x32, 0x5f, 0xb8, 0xa7, 0x2f, 0x26, 0xf3, 0xcf, 0xaa, 0xff, 0x3b, 0x03, 0x65,
+	0x4c, 0x6d, 0xc7, 0xa7, 0xfd, 0x90, 0x59, 0x74, 0xd4, 0x47, 0x16, 0x6c, 0xfb, 0x12, 0xc2, 0x77,
+	0x5d, 0xb1, 0xeb, 0x43, 0x98, 0x5e, 0x9f, 0xa4, 0x94, 0x52, 0x32, 0x67, 0x9c, 0xac, 0x89, 0x5c,
+	0xdc, 0xa8, 0xdc, 0xf4, 0xe7, 0x81, 0xe8, 0x3e, 0xec, 0xc6, 0x55, 0x04, 0x3c, 0x6f, 0x54, 0x93,
+	0x64, 0xed, 0xb8, 0x05, 0xa2, 0x64, 0x99, 0xb7, 0xfa, 0x0d, 0x6c, 0x2e, 0xa8, 0x03, 0xe5, 0x61,
+	0x59, 0xef, 0x3e, 0xfe, 0x42, 0xb9, 0x22, 0xbf, 0xee, 0x2b, 0x19, 0x94, 0x83, 0xa5, 0x1e, 0x6e,
+	0x2a, 0x59, 0x54, 0x80, 0x9c, 0xa1, 0x77, 0x49, 0x0f, 0xeb, 0xca, 0x52, 0xf5, 0xbf, 0x2f, 0x41,
+	0x39, 0x32, 0x30, 0xc5, 0x48, 0xa0, 0xfb, 0xd2, 0x54, 0x16, 0x9a, 0xac, 0xba, 0xc0, 0x54, 0x16,
+	0x84, 0x07, 0x6c, 0xcc, 0x12, 0x76, 0xf2, 0x4d, 0x28, 0xf1, 0x59, 0x77, 0xc2, 0x73, 0x61, 0x0a,
+	0x89, 0x3d, 0x54, 0x31, 0x02, 0x72, 0x53, 0x47, 0x70, 0x07, 0x77, 0x9e, 0x73, 0x5b, 0x9c, 0x73,
+	0x47, 0x83, 0x25, 0xd1, 0x49, 0xe4, 0x68, 0xb7, 0xfa, 0xf1, 0x7e, 0x7e, 0xb1, 0xa9, 0x2e, 0xeb,
+	0xe7, 0xd9, 0x6a, 0x9c, 0x58, 0xfa, 0xe3, 0x45, 0x02, 0xfd, 0x02, 0x4a, 0xa7, 0x82, 0x9d, 0xc8,
+	0x84, 0xf1, 0x93, 0xdc, 0xfa, 0x27, 0xad, 0x87, 0x24, 0xbb, 0xe1, 0xe2, 0x69, 0x92, 0xf9, 0x8e,
+	0x60, 0x7d, 0x66, 0x2e, 0xf8, 0xe6, 0x3f, 0x6d, 0x38, 0xa5, 0x27, 0x1a, 0x97, 0xd3, 0xd3, 0xc3,
+	0x56, 0x8e, 0x4f, 0x83, 0xd0, 0x77, 0xfa, 0xa1, 0x14, 0x22, 0x79, 0x69, 0x21, 0x4b, 0xa8, 0x10,
+	0x13, 0x55, 0xc8, 0x47, 0x83, 0x88, 0xd6, 0x60, 0xe5, 0xe8, 0xa9, 0xa9, 0x19, 0xca, 0x15, 0x3e,
+	0x43, 0x9a, 0xda, 0x69, 0xd7, 0x0d, 0x25, 0x53, 0xfd, 0x06, 0x0a, 0x89, 0x8e, 0xa2, 0x12, 0xac,
+	0x99, 0x1a, 0x6e, 0xe9, 0xed, 0x9a, 0xc9, 0xf6, 0x0c, 0x45, 0xc8, 0x47, 0x7a, 0x44, 0xc9, 0x30,
+	0x99, 0x1e, 0x69, 0x20, 0x29, 0x85, 0x95, 0x6c, 0xb5, 0xc1, 0x18, 0x9a, 0x1b, 0xfb, 0x51, 0x0f,
+	0xb7, 0x92, 0xcb, 0x6b, 0x39, 0x5a, 0x47, 0xe5, 0x78, 0x1d, 0x2d, 0xf3, 0x05, 0x53, 0x8e, 0x17,
+	0xcc, 0x32, 0x5f, 0x19, 0x7f, 0xb4, 0x0c, 0x05, 0xb9, 0x58, 0x98, 0xa9, 0x99, 0x3a, 0xf5, 0xc9,
+	0x5c, 0x7c, 0xea, 0x93, 0x4d, 0x9f, 0xfa, 0xcc, 0xee, 0xde, 0x96, 0xe7, 0x77, 0x6f, 0xf7, 0x24,
+	0x03, 0x0a, 0x06, 0xf8, 0x60, 0x7e, 0xad, 0xb2, 0xea, 0x0f, 0xe4, 0xae, 0x7a, 0xca, 0x7f, 0xb7,
+	0xa0, 0x9c, 0xb0, 0x9f, 0x59, 0xd9, 0xab, 0xd2, 0x7d, 0x12, 0x43, 0x59, 0xe9, 0x8b, 0xb7, 0x73,
+	0xb9, 0x77, 0xda, 0xce, 0x09, 0x5e, 0x91, 0x63, 0x2b, 0x79, 0x2d, 0xbf, 0x80, 0x57, 0x92, 0xa3,
+	0xcf, 0x78, 0x25, 0x99, 0xae, 0xfe, 0x79, 0x06, 0x60, 0xda, 0x19, 0x3e, 0xc1, 0x27, 0x58, 0x33,
+	0x4e, 0x3a, 0x4d, 0x66, 0xf7, 0xe5, 0x60, 0xe9, 0xd1, 0x09, 0x9b, 0xdb, 0x32, 0x40, 0x3c, 0xf1,
+	0x75, 0x25, 0xcb, 0xe6, 0xfa, 0x51, 0xaf, 0x63, 0xd6, 0x88, 0xf6, 0xed, 0x49, 0xad, 0x67, 0x30,
+	0xe0, 0x12, 0xd3, 0xd4, 0xdc, 0x16, 0xd2, 0xcd, 0xa7, 0xc4, 0xd4, 0x5b, 0xcc, 0x70, 0xf9, 0xb6,
+	0xab, 0x63, 0xad, 0xae, 0x2c, 0x33, 0xdd, 0xde, 0x31, 0x4f, 0x34, 0x4c, 0x44, 0x36, 0xf3, 0x69,
+	0x57, 0x53, 0x56, 0xd0, 0x7b, 0xb0, 0x2b, 0xd5, 0x3d, 0x63, 0x38, 0x9d, 0x5b, 0x09, 0xea, 0x49,
+	0xad, 0x7d, 0xac, 0x29, 0xab, 0x82, 0x9f, 0x98, 0x05, 0x41, 0xb0, 0xf6, 0xa8, 0xc7, 0xcb, 0xc9,
+	0xb1, 0x6d, 0x6a, 0xb7, 0xd3, 0x69, 0x26, 0xea, 0xcd, 0x57, 0xff, 0x62, 0x19, 0x36, 0x12, 0x93,
+	0x23, 0xba, 0x83, 0x7e, 0x06, 0x2b, 0x7c, 0x57, 0x22, 0xc5, 0xf8, 0xce, 0xe2, 0x99, 0xc4, 0x82,
+	0x68, 0x66, 0x2f, 0x90, 0x9d, 0xdd, 0x0b, 0xf0, 0x25, 0x25, 0x3c, 0xd6, 0xee, 0x64, 0xc4, 0x74,
+	0x9c, 0x90, 0x2f, 0x25, 0x09, 0x6d, 0x73, 0x60, 0xda, 0x05, 0x99, 0xbb, 0xc0, 0x05, 0xb9, 0xb6,
+	0xd8, 0x05, 0x09, 0x97, 0xba, 0x20, 0x0b, 0x6f, 0x76, 0x41, 0x16, 0x17, 0xb8, 0x20, 0x6f, 0x42,
+	0xe9, 0xb9, 0xe5, 0xdb, 0xaf, 0x2d, 0x9f, 0x0a, 0x9f, 0x5d, 0x59, 0x10, 0x45, 0x40, 0xee, 0xb8,
+	0xfb, 0x0c, 0xf2, 0xe1, 0xe9, 0x78, 0x4c, 0xfa, 0xe1, 0x59, 0x65, 0x7d, 0x6e, 0xb0, 0xcc, 0xd3,
+	0xf1, 0x38, 0xf2, 0xf3, 0xe6, 0x18, 0x9d, 0x1a, 0x9e, 0xfd, 0xde, 0x9e, 0xec, 0x5d, 0xea, 0x19,
+	0x45, 0x97, 0x7b, 0x46, 0xff, 0x70, 0x09, 0xb6, 0x24, 0x67, 0x70, 0x0e, 0x8a, 0xdd, 0x91, 0x15,
+	0xc8, 0x05, 0x13, 0x7e, 0x94, 0x10, 0xd9, 0x14, 0x32, 0x19, 0xb9, 0x7a, 0xb2, 0x53, 0x57, 0xcf,
+	0xac, 0x84, 0x59, 0x9a, 0x97, 0x30, 0x9f, 0xc1, 0xaa, 0xd8, 0x5f, 0x73, 0xf1, 0x93, 0x5e, 0xad,
+	0x69, 0x25, 0x83, 0x25, 0x21, 0xba, 0x0e, 0x05, 0xb1, 0xc7, 0x24, 0x7d, 0xcf, 0x16, 0x07, 0x06,
+	0x25, 0x0c, 0x02, 0xc4, 0x37, 0x6b, 0x3f, 0xaa, 0x5c, 0x79, 0x00, 0x30, 0x74, 0x46, 0x8e, 0x3c,
+	0x9c, 0x59, 0xe3, 0x82, 0x70, 0x7f, 0x6e, 0xf9, 0x34, 0x19, 0x09, 0x97, 0x80, 0x6b, 0xc3, 0xe8,
+	0x33, 0xc5, 0x4a, 0xf0, 0x76, 0xac, 0x94, 0x5e, 0x79, 0x85, 0x59, 0x17, 0xe6, 0x1f, 0x67, 0x00,
+	0x25, 0x9d, 0x0e, 0x72, 0x75, 0xcf, 0xcb, 0xdb, 0xcc, 0x22, 0x79, 0xfb, 0x29, 0xac, 0x0c, 0xe9,
+	0x2b, 0x3a, 0x94, 0xf6, 0x44, 0xea, 0x94, 0x26, 0x26, 0x6c, 0x32, 0x0a, 0x2c, 0x08, 0xdf, 0xed,
+	0x3a, 0x41, 0xf5, 0x1f, 0x67, 0x61, 0x7b, 0xa1, 0x6b, 0x04, 0x7d, 0x03, 0xab, 0xd2, 0xa4, 0x10,
+	0x06, 0xdb, 0xc7, 0x6f, 0x72, 0xa6, 0x1c, 0x48, 0xa3, 0x42, 0x66, 0x5b, 0xd0, 0xd3, 0xec, 0xa5,
+	0x3d, 0x5d, 0x7a, 0xdb, 0x9e, 0xce, 0x19, 0x2a, 0x2b, 0xdf, 0xc3, 0x50, 0xa9, 0x1e, 0xc0, 0xaa,
+	0x34, 0x0a, 0x8a, 0x90, 0x67, 0xdb, 0x40, 0xbd, 0xdd, 0xd3, 0x84, 0xf9, 0x50, 0xd7, 0x0d, 0xbe,
+	0x0b, 0xcc, 0x30, 0xb3, 0xa2, 0xd1, 0xc1, 0xaa, 0xa6, 0x64, 0xab, 0xff, 0x6e, 0x09, 0xae, 0xce,
+	0xf4, 0x37, 0x5a, 0x66, 0xc2, 0x17, 0x78, 0x0f, 0x56, 0xe5, 0x3d, 0x83, 0xcc, 0xdc, 0xe2, 0x9f,
+	0x67, 0x00, 0x2c, 0x89, 0x7f, 0x24, 0xc1, 0x2d, 0x17, 0xf2, 0x72, 0xea, 0xbe, 0xc9, 0xe2, 0x0b,
+	0x22, 0x73, 0x22, 0x75, 0x75, 0x81, 0x48, 0x4d, 0x1e, 0xcd, 0xe7, 0xde, 0x7c, 0x34, 0x9f, 0x5c,
+	0x36, 0xf9, 0xb7, 0x5b, 0x36, 0xbf, 0x80, 0x52, 0xca, 0x7f, 0x28, 0xd7, 0xe9, 0x85, 0xee, 0xc3,
+	0x62, 0xd2, 0x7d, 0x78, 0xa9, 0x98, 0x84, 0xcb, 0xc5, 0xe4, 0x7f, 0x5e, 0x86, 0x6b, 0x17, 0x4c,
+	0xa4, 0x94, 0x97, 0x5f, 0xc5, 0x02, 0x2e, 0x33, 0x77, 0xea, 0xb5, 0xd8, 0x7f, 0x18, 0xc9, 0xb9,
+	0x37, 0x4c, 0xe6, 0xbc, 0x67, 0x3d, 0x21, 0x9a, 0x97, 0xd3, 0xa2, 0x79, 0xde, 0xbf, 0xba, 0xf2,
+	0xc3, 0xfd, 0xab, 0xab, 0xef, 0xe0, 0x5f, 0x9d, 0x91, 0xdd, 0xb9, 0x39, 0xd9, 0xbd, 0xc0, 0xa3,
+	0x9d, 0x5f, 0xe4, 0xd1, 0x36, 0x60, 0x37, 0xe9, 0x5b, 0x48, 0x3a, 0xa2, 0xd7, 0xde, 0xc2, 0xcd,
+	0xb0, 0x95, 0x70, 0x33, 0xbc, 0x9d, 0x7b, 0x1b, 0x7e, 0x80, 0x7b, 0x3b, 0xc9, 0xd1, 0x85, 0xb7,
+	0xe2, 0xe8, 0xea, 0x6f, 0x97, 0x60, 0x7b, 0xe1, 0xa1, 0x28, 0x7a, 0x1f, 0x0a, 0xd6, 0xd8, 0x25,
+	0xd6, 0xe8, 0x99, 0x4f, 0xec, 0xa1, 0xbc, 0x52, 0xb0, 0x66, 0x8d, 0xdd, 0xda, 0xe8, 0x99, 0x5f,
+	0x1f, 0xa6, 0xf0, 0x93, 0xa1, 0x3c, 0x93, 0x89, 0xf0, 0x3d, 0xb6, 0x49, 0x2f, 0x8f, 0x7d, 0xc7,
+	0xf3, 0xd9, 0xe6, 0x70, 0x2a, 0x24, 0x4b, 0xb8, 0x14, 0x41, 0xb9, 0x5c, 0x44, 0x9f, 0xc3, 0xf6,
+	0xd8, 0xa7, 0x74, 0x34, 0xe6, 0x13, 0x9e, 0x38, 0xe2, 0x17, 0xdb, 0x84, 0xad, 0x29, 0x32, 0x71,
+	0x96, 0xff, 0x00, 0x2a, 0x89, 0x4c, 0xaf, 0x26, 0x43, 0x97, 0xfa, 0xc9, 0xab, 0x01, 0x25, 0xbc,
+	0x3b, 0xc5, 0x3f, 0x4e, 0xa2, 0x99, 0x8d, 0xf7, 0xd2, 0x0b, 0x48, 0x7f, 0x68, 0x05, 0x01, 0xe3,
+	0x77, 0xa9, 0xd6, 0x5f, 0x7a, 0x81, 0xca, 0x40, 0xba, 0x8d, 0x7e, 0x0d, 0x39, 0xd6, 0x25, 0xd7,
+	0x89, 0x0e, 0xfa, 0x3f, 0x7b, 0xd3, 0x01, 0xf2, 0xc1, 0x91, 0x13, 0xfa, 0x56, 0x48, 0xb9, 0x90,
+	0xae, 0xb5, 0x8e, 0x30, 0x5e, 0x7d, 0xe6, 0xb3, 0x44, 0xf5, 0x16, 0x28, 0xb3, 0x38, 0x66, 0xdf,
+	0x1f, 0x75, 0x0d, 0xb1, 0x53, 0x7f, 0xc8, 0xbe, 0x32, 0xd5, 0x47, 0x50, 0x48, 0xcc, 0x0e, 0x6b,
+	0xe3, 0xe9, 0x19, 0xb1, 0x99, 0xfc, 0x7c, 0xee, 0x05, 0xa1, 0xf4, 0x1e, 0xc1, 0xe9, 0x59, 0x9d,
+	0x06, 0xe1, 0x89, 0x17, 0x08, 0x8a, 0xf3, 0x04, 0x45, 0x56, 0x52, 0x9c, 0x47, 0x14, 0xd5, 0xff,
+	0x98, 0xe5, 0x86, 0xd5, 0xfc, 0xfd, 0xb0, 0x5f, 0xc0, 0x7a, 0x74, 0x99, 0x43, 0x7a, 0x7d, 0xa4,
+	0xc4, 0xd8, 0x4c, 0xf2, 0x8a, 0x44, 0xe1, 0xb2, 0xbc, 0xce, 0x11, 0x39, 0x88, 0xde, 0x20, 0x2c,
+	0x16, 0xec, 0x8e, 0x96, 0xbe, 0xe7, 0xee, 0xe8, 0xf7, 0xf7, 0x02, 0xdb, 0x9f, 0x2c, 0xc3, 0xf6,
+	0xe2, 0xb3, 0xf3, 0x07, 0x90, 0x8b, 0x4e, 0x6f, 0x84, 0x1b, 0xee, 0xfa, 0xfc, 0xc6, 0x27, 0x25,
+	0xae, 0x71, 0x44, 0x8f, 0x3a, 0x50, 0x4e, 0x9d, 0x04, 0x05, 0xf2, 0xc0, 0xec, 0xf6, 0xc5, 0xf2,
+	0x7b, 0xa6, 0xa8, 0x52, 0xf2, 0x1c, 0x28, 0x98, 0xf3, 0x86, 0xe6, 0x7e, 0xb0, 0x37, 0x34, 0xff,
+	0xbd, 0xbd, 0xa1, 0x33, 0x6c, 0xb2, 0x36, 0xcb, 0x26, 0xef, 0x60, 0xb1, 0xce, 0xab, 0x96, 0xc2,
+	0x0f, 0x57, 0x2d, 0xc5, 0x77, 0x50, 0x2d, 0x3b, 0xb0, 0xea, 0xb9, 0x43, 0xc7, 0xa5, 0x95, 0x12,
+	0x57, 0x7e, 0x32, 0xc5, 0xb4, 0xa2, 0x37, 0x18, 0x70, 0xc4, 0xba, 0xd0, 0x8a, 0x32, 0x59, 0xfd,
+	0x5d, 0x06, 0x36, 0xe6, 0xc6, 0x3c, 0x79, 0xb7, 0x36, 0x93, 0xba, 0x5b, 0xab, 0xb2, 0x05, 0x1a,
+	0x3a, 0xaf, 0x12, 0xed, 0xcc, 0xbe, 0xb1, 0x9d, 0xe5, 0x69, 0x16, 0xde, 0xca, 0x63, 0xd8, 0xb0,
+	0xe9, 0x6c, 0x31, 0x4b, 0x6f, 0xee, 0x6e, 0x32, 0x13, 0x03, 0x57, 0xff, 0x4b, 0x06, 0xd0, 0xfc,
+	0x74, 0xa3, 0xfb, 0x50, 0x48, 0xdc, 0x2a, 0x58, 0xe0, 0xb5, 0xed, 0xc6, 0xb7, 0x0b, 0x30, 0x4c,
+	0x6f, 0x1a, 0xfc, 0x9e, 0x75, 0xee, 0x1f, 0x65, 0x60, 0x4b, 0xac, 0xa6, 0x19, 0x21, 0x79, 0x1f,
+	0x72, 0xc2, 0xd4, 0x8d, 0x16, 0xf4, 0xd5, 0xc5, 0x9e, 0x0c, 0xb9, 0x14, 0x23, 0x62, 0xd4, 0x9e,
+	0x5b, 0xcd, 0xc2, 0xc3, 0xff, 0xf1, 0x9b, 0x57, 0xb3, 0xb8, 0x8a, 0x94, 0x5e, 0xcc, 0xd5, 0x7f,
+	0x95, 0x81, 0xed, 0x99, 0x06, 0x4a, 0x91, 0xf3, 0x4b, 0x58, 0xf3, 0xe5, 0xf7, 0x5b, 0x0b, 0x9d,
+	0x69, 0x0e, 0xf4, 0x37, 0x61, 0x37, 0xd5, 0x50, 0x32, 0x2d, 0x6c, 0xe9, 0x7b, 0xca, 0x9f, 0xed,
+	0x64, 0x93, 0x23, 0x68, 0x50, 0x7d, 0x08, 0x95, 0xe8, 0x1a, 0x1f, 0xf5, 0x47, 0x8e, 0x9b, 0x34,
+	0x56, 0xe7, 0x6f, 0x9a, 0x5f, 0xae, 0x57, 0xaa, 0xff, 0x61, 0x19, 0x76, 0xe7, 0x4b, 0x5b, 0x74,
+	0x9f, 0xe1, 0x2d, 0x36, 0x23, 0xcb, 0x8b, 0x36, 0x23, 0x5f, 0x43, 0x49, 0x88, 0x64, 0xc2, 0xbb,
+	0x23, 0x2c, 0xd7, 0x8b, 0x3d, 0x58, 0xc5, 0xfe, 0x34, 0x11, 0xa0, 0x7a, 0xbc, 0x5d, 0x8c, 0x72,
+	0xaf, 0xce, 0xc9, 0xcc, 0x05, 0xdb, 0xa9, 0x68, 0x37, 0x29, 0x4b, 0x49, 0x39, 0xb2, 0xd6, 0x2e,
+	0x70, 0x64, 0xc1, 0x62, 0x47, 0x56, 0xe1, 0x52, 0x47, 0x56, 0xf1, 0xcd, 0x8e, 0xac, 0xd2, 0xdb,
+	0x38, 0xb2, 0xd6, 0xdf, 0xe0, 0xc8, 0x52, 0xde, 0xd5, 0x91, 0xb5, 0xf1, 0x4e, 0x1a, 0xfe, 0x07,
+	0xf8, 0x9d, 0xfe, 0x5e, 0x06, 0x56, 0xdb, 0x9e, 0x4d, 0xf5, 0x3a, 0xfa, 0x15, 0x14, 0x5d, 0xcf,
+	0x66, 0x82, 0x38, 0x79, 0xc6, 0x73, 0x35, 0x75, 0xbb, 0x93, 0x11, 0xca, 0x1f, 0x71, 0xcb, 0x95,
+	0xe5, 0xd0, 0x6d, 0xbe, 0x8f, 0xdc, 0x85, 0x9c, 0xcc, 0x1f, 0x05, 0x49, 0x08, 0x64, 0xf5, 0x0e,
+	0xc0, 0x34, 0x8b, 0x38, 0x97, 0x79, 0x15, 0x9f, 0xd0, 0xbc, 0xba, 0xaf, 0x64, 0xd8, 0x57, 0xe3,
+	0x51, 0xbd, 0xad, 0x64, 0xab, 0x67, 0xb0, 0x3e, 0x73, 0x83, 0x55, 0x30, 0xee, 0x60, 0x48, 0x99,
+	0xc8, 0xa2, 0xe4, 0xa5, 0x17, 0x39, 0xc2, 0x4a, 0x53, 0xe8, 0x23, 0x8f, 0xed, 0xb9, 0xae, 0x8e,
+	0x26, 0xc3, 0xd0, 0x21, 0xcf, 0xbd, 0x11, 0xe5, 0x57, 0x8a, 0xef, 0x93, 0xc4, 0xad, 0x5b, 0xde,
+	0xa6, 0x3c, 0xae, 0x70, 0x9a, 0x13, 0x46, 0xa2, 0x8f, 0x5f, 0xdd, 0x9f, 0xde, 0xb9, 0xad, 0xfe,
+	0x79, 0x16, 0xf2, 0x8f, 0xbc, 0x40, 0xe8, 0xed, 0x03, 0xd8, 0x64, 0xd6, 0xb1, 0x54, 0x4c, 0xb1,
+	0x4f, 0x4b, 0x18, 0xff, 0x1b, 0x2f, 0x05, 0x59, 0xc2, 0x6b, 0xa5, 0xc0, 0x92, 0xfd, 0xd2, 0x97,
+	0x75, 0xb0, 0x4f, 0xf4, 0x25, 0x54, 0xc4, 0x32, 0x23, 0xde, 0x80, 0x8c, 0xad, 0xfe, 0x0b, 0x1a,
+	0x92, 0x81, 0x33, 0x0c, 0xa9, 0x1f, 0xc8, 0x0d, 0xc0, 0xb6, 0xc0, 0x77, 0x06, 0x5d, 0x8e, 0x6d,
+	0x08, 0x24, 0xfa, 0x0a, 0x2a, 0x29, 0xf2, 0x64, 0xfd, 0xcb, 0x37, 0x96, 0x6e, 0xaf, 0xe0, 0x9d,
+	0x71, 0x22, 0x43, 0xa2, 0x11, 0xc9, 0x46, 0x8f, 0x7d, 0xda, 0xa7, 0x36, 0x75, 0xfb, 0x54, 0x6e,
+	0x04, 0xa2, 0x46, 0x77, 0x63, 0x04, 0xba, 0x01, 0x85, 0x80, 0x9e, 0xfa, 0xf4, 0x54, 0x70, 0xfe,
+	0xaa, 0x88, 0xb0, 0x48, 0x80, 0xa2, 0x12, 0x07, 0x43, 0xef, 0xf5, 0xac, 0x6b, 0x4f, 0x94, 0xd8,
+	0x18, 0x7a, 0xaf, 0x13, 0x77, 0xbc, 0xce, 0x60, 0xbd, 0x69, 0xd9, 0xae, 0x74, 0xf4, 0xd5, 0x7c,
+	0x6a, 0xb1, 0xc5, 0x6c, 0xbb, 0xae, 0xbc, 0xff, 0x2d, 0x6f, 0xcf, 0xd8, 0xae, 0x2b, 0xae, 0x7f,
+	0x9f, 0x40, 0x49, 0x14, 0xcb, 0xf6, 0x46, 0x0e, 0xb7, 0xdf, 0x99, 0xb8, 0xb8, 0x99, 0x5c, 0x38,
+	0xbe, 0xd5, 0x7f, 0xe1, 0xb8, 0xa7, 0xac, 0x30, 0x5d, 0xd2, 0x36, 0x9d, 0x20, 0xc4, 0x45, 0x27,
+	0x91, 0xaa, 0xfe, 0x69, 0x06, 0x2a, 0x17, 0x91, 0xa2, 0x2f, 0xa1, 0xc8, 0x38, 0x9a, 0xcd, 0x04,
+	0xaf, 0x25, 0xc3, 0x2d, 0xa6, 0xa4, 0x96, 0x66, 0x9c, 0xd9, 0x19, 0xf0, 0x72, 0x21, 0x8c, 0xbf,
+	0xd1, 0xcf, 0x00, 0x4d, 0x27, 0x91, 0x0e, 0xe9, 0x88, 0xba, 0x61, 0xc0, 0x1b, 0xb9, 0x82, 0x95,
+	0x68, 0xfa, 0x34, 0x09, 0x67, 0x4c, 0xd0, 0x52, 0xd5, 0xc8, 0x43, 0xd0, 0x52, 0x55, 0x0e, 0x69,
+	0xab, 0x91, 0x67, 0xa7, 0xd5, 0xe6, 0x10, 0xb3, 0xa6, 0x4a, 0xaf, 0x0e, 0xfb, 0xac, 0xfe, 0x15,
+	0xc0, 0xe6, 0x82, 0xfb, 0xf9, 0xff, 0xff, 0x6f, 0xb3, 0xff, 0x1c, 0x0a, 0xac, 0x82, 0xe8, 0xb4,
+	0x75, 0xe9, 0x4d, 0x27, 0x7d, 0x30, 0xb6, 0x27, 0xf2, 0xa8, 0x95, 0xed, 0x6f, 0xe2, 0x4d, 0xad,
+	0x35, 0x75, 0x81, 0xa4, 0x2f, 0x83, 0x47, 0x14, 0x82, 0x00, 0xc7, 0xdb, 0x60, 0x71, 0x4b, 0x7e,
+	0xf6, 0x36, 0xfd, 0xca, 0xdb, 0xde, 0xa6, 0x8f, 0x34, 0xc0, 0x6a, 0x42, 0x03, 0x20, 0x58, 0x3e,
+	0x1d, 0x07, 0x8e, 0x3c, 0xf6, 0xe0, 0xdf, 0x6c, 0xf2, 0x52, 0xa2, 0x5d, 0xdc, 0x04, 0x13, 0x37,
+	0x94, 0x95, 0xa4, 0x7c, 0xe7, 0x57, 0x9e, 0xb7, 0x61, 0x75, 0xdc, 0x1f, 0x4c, 0xad, 0xf4, 0x95,
+	0x71, 0x7f, 0xa0, 0xdb, 0xa8, 0x01, 0x1b, 0x43, 0xcb, 0x76, 0x49, 0xe4, 0xe0, 0xb6, 0x7c, 0x6a,
+	0x49, 0xdf, 0x44, 0xd2, 0xcb, 0x39, 0xc3, 0xf5, 0x78, 0x7d, 0x38, 0xb3, 0x0c, 0x9a, 0x70, 0x33,
+	0x39, 0x9b, 0x6c, 0x9f, 0x31, 0x09, 0x52, 0x77, 0xd3, 0x49, 0x30, 0x79, 0x26, 0x43, 0xac, 0xae,
+	0x4f, 0xa7, 0xd8, 0xe0, 0x84, 0xc9, 0x0b, 0xe8, 0xc6, 0xe4, 0x19, 0xd2, 0x01, 0xb1, 0x45, 0x15,
+	0x50, 0x2e, 0xff, 0x3c, 0x97, 0x8c, 0x3c, 0x5b, 0x58, 0xf1, 0xe5, 0xc3, 0xf7, 0x92, 0xfb, 0x13,
+	0xd7, 0x35, 0x22, 0x9a, 0x96, 0x67, 0x53, 0xac, 0xd8, 0x33, 0x10, 0xf4, 0x53, 0xd8, 0x08, 0x7d,
+	0xab, 0x4f, 0x09, 0x63, 0x0d, 0xc7, 0xe7, 0xac, 0xcc, 0x95, 0xe0, 0x1a, 0x56, 0x38, 0x02, 0x4f,
+	0xe1, 0xe8, 0xd7, 0x50, 0x75, 0xdc, 0x90, 0x9e, 0xf2, 0x79, 0x67, 0x96, 0x65, 0x54, 0xbd, 0x75,
+	0x46, 0x6c, 0x2b, 0xb4, 0x08, 0xdb, 0xe1, 0xcb, 0x63, 0x9e, 0xf7, 0x63, 0xca, 0x6e, 0x4c, 0xd8,
+	0xb2, 0xce, 0xea, 0x56, 0x68, 0x61, 0x2b, 0x5c, 0x1c, 0x14, 0xb1, 0xfe, 0x7d, 0x83, 0x22, 0x3e,
+	0x81, 0x7c, 0x10, 0xf4, 0x45, 0xf7, 0x95, 0x39, 0x57, 0xa7, 0x11, 0xf4, 0x79, 0xaf, 0x73, 0x81,
+	0xf8, 0x58, 0x1c, 0x43, 0xb1, 0xf1, 0xfd, 0x63, 0x28, 0xbe, 0x84, 0x0a, 0xeb, 0xf2, 0xf8, 0x45,
+	0x2c, 0xa4, 0x83, 0xc9, 0x78, 0xec, 0xf9, 0x21, 0xb5, 0xb9, 0xc2, 0x2d, 0xe1, 0xed, 0x91, 0x75,
+	0xd6, 0x7d, 0x21, 0x65, 0xb4, 0x11, 0x21, 0xd1, 0x57, 0xb0, 0x97, 0xec, 0xb4, 0x4f, 0x5f, 0x12,
+	0x6b, 0xf8, 0xda, 0x3a, 0x0f, 0x88, 0xe7, 0xf2, 0xb8, 0x9d, 0x3c, 0xde, 0x9e, 0x76, 0x11, 0xd3,
+	0x97, 0x35, 0x8e, 0xed, 0xb8, 0xe8, 0x03, 0x28, 0x05, 0x23, 0xae, 0xd0, 0x6c, 0x9e, 0xaf, 0xb2,
+	0x25, 0x6c, 0x99, 0x60, 0xd4, 0xb5, 0x27, 0x75, 0x46, 0x3a, 0x1b, 0xd9, 0xb1, 0xfd, 0xb6, 0x91,
+	0x1d, 0x2a, 0x6c, 0x4e, 0x9d, 0x15, 0x91, 0x06, 0x09, 0x2a, 0x3b, 0x73, 0xde, 0x90, 0x48, 0x3d,
+	0xe2, 0x8d, 0x98, 0x3e, 0xd6, 0x98, 0x0f, 0xa0, 0x7c, 0xca, 0xd5, 0x3f, 0x75, 0xed, 0xb1, 0xe7,
+	0xb8, 0x61, 0x65, 0x97, 0xe7, 0x47, 0x33, 0x97, 0xa4, 0x0d, 0x1a, 0xe2, 0x12, 0xa7, 0xd4, 0x24,
+	0x21, 0xba, 0x07, 0xc5, 0xc9, 0x78, 0x30, 0xcd, 0x58, 0xb9, 0x30, 0x63, 0x61, 0x32, 0x1e, 0xc4,
+	0xd9, 0x98, 0xa2, 0xf4, 0xbd, 0x3e, 0xb5, 0x27, 0x3e, 0x25, 0xa1, 0x6f, 0xb9, 0x01, 0x89, 0x54,
+	0x42, 0x65, 0x8f, 0xb3, 0xe0, 0x4e, 0x8c, 0x37, 0x19, 0x3a, 0xd2, 0x09, 0xd5, 0x7f, 0x9e, 0x81,
+	0x4d, 0x83, 0x86, 0x73, 0x22, 0xf7, 0xc7, 0x0a, 0x41, 0xb9, 0xc8, 0xe3, 0x92, 0x7d, 0x57, 0x8f,
+	0xcb, 0xc7, 0x50, 0x32, 0x46, 0x32, 0xf1, 0xd8, 0x13, 0xf7, 0x89, 0xbc, 0x49, 0x38, 0x9e, 0x44,
+	0x3e, 0x31, 0x99, 0xaa, 0xbe, 0x86, 0xca, 0x7c, 0x91, 0x52, 0xde, 0xfe, 0x75, 0xd8, 0xe5, 0xcc,
+	0x9f, 0x8e, 0x16, 0x23, 0x7e, 0x30, 0x96, 0x0d, 0xfb, 0xf0, 0xf2, 0x88, 0x31, 0x51, 0x0c, 0xde,
+	0x62, 0x8b, 0x21, 0xdd, 0xfd, 0x60, 0x5c, 0xfd, 0x27, 0x19, 0xc8, 0x73, 0x87, 0xa7, 0xeb, 0xf0,
+	0x71, 0x14, 0xee, 0x50, 0x37, 0x3a, 0xc7, 0x13, 0xb6, 0x64, 0xd2, 0x17, 0x1f, 0x11, 0xc7, 0x1f,
+	0x7c, 0x7d, 0x17, 0xad, 0x44, 0xaa, 0xda, 0x84, 0x62, 0x12, 0x8b, 0x00, 0x56, 0x1f, 0x3e, 0x1b,
+	0x07, 0xe4, 0x53, 0xe5, 0x4a, 0xfc, 0xfd, 0x99, 0x92, 0x89, 0xbf, 0xbf, 0x10, 0x77, 0x7c, 0x04,
+	0xfc, 0xbe, 0xb2, 0x14, 0x27, 0xee, 0x7f, 0xa1, 0x2c, 0x57, 0x7f, 0x97, 0x83, 0xbd, 0x0b, 0xbb,
+	0xf5, 0x96, 0xea, 0x76, 0x91, 0xd0, 0xca, 0x7e, 0x5f, 0xa1, 0xf5, 0x2b, 0xd8, 0x10, 0x92, 0x9b,
+	0xda, 0x24, 0x96, 0x5e, 0x4b, 0x17, 0x4a, 0xaf, 0xf5, 0x88, 0x58, 0x02, 0x90, 0x06, 0x5b, 0xd6,
+	0x24, 0x7c, 0xee, 0xf9, 0xce, 0x6f, 0x52, 0x0b, 0x56, 0xdc, 0xd6, 0x5b, 0xb8, 0x60, 0xd1, 0x34,
+	0x43, 0xbc, 0x62, 0x6b, 0x80, 0x6c, 0xef, 0xb5, 0x3b, 0x74, 0xdc, 0x17, 0x89, 0x99, 0x5a, 0x99,
+	0x5b, 0xf5, 0xd1, 0x14, 0x60, 0x25, 0x22, 0x8f, 0x27, 0xe4, 0x16, 0x94, 0x53, 0x45, 0x04, 0xd2,
+	0x8d, 0x5c, 0x4a, 0x52, 0x06, 0xe8, 0x97, 0xa0, 0x4c, 0xc6, 0x33, 0xf5, 0xe4, 0x2e, 0xae, 0xa7,
+	0x2c, 0x88, 0xe3, 0x5a, 0x3e, 0x60, 0xf2, 0x21, 0x51, 0x47, 0x5e, 0x1c, 0x6b, 0x4f, 0xa9, 0xb8,
+	0x2d, 0xd1, 0x4a, 0x88, 0xbe, 0xb5, 0x4b, 0x45, 0x5f, 0x6b, 0x2a, 0xfa, 0x1a, 0x70, 0x23, 0x96,
+	0xbf, 0x24, 0x35, 0xff, 0xae, 0x1d, 0xc5, 0x8c, 0x01, 0x17, 0xcb, 0x57, 0x2d, 0x29, 0x89, 0xa7,
+	0x93, 0xab, 0xc7, 0x34, 0xe8, 0x17, 0xa0, 0x58, 0xc3, 0xa1, 0xf7, 0x3a, 0x39, 0xa3, 0x85, 0x0b,
+	0x67, 0xb4, 0x2c, 0x69, 0xa3, 0x09, 0x6d, 0xc3, 0x87, 0xb2, 0xf5, 0x9e, 0x7b, 0x4a, 0x43, 0xa1,
+	0x19, 0x88, 0x15, 0x86, 0x74, 0x34, 0x0e, 0xa3, 0xa6, 0x78, 0x3e, 0x57, 0xf0, 0x79, 0x7c, 0x43,
+	0xb4, 0x3f, 0x22, 0xc5, 0xb4, 0x26, 0x08, 0xf5, 0x88, 0x6e, 0xd6, 0xb2, 0x2b, 0x7d, 0x1f, 0xcb,
+	0x6e, 0x56, 0x18, 0x97, 0x7f, 0xb8, 0x30, 0x5e, 0xbf, 0x4c, 0x18, 0xa3, 0x0f, 0x61, 0x89, 0xed,
+	0xe9, 0x94, 0xb9, 0x7a, 0xd8, 0xde, 0x82, 0x31, 0x2b, 0x43, 0x57, 0x7f, 0x97, 0x81, 0xbd, 0x05,
+	0x22, 0x5b, 0x2e, 0xde, 0x1f, 0x4b, 0x70, 0xf7, 0x2e, 0x15, 0xdc, 0x37, 0x2f, 0x15, 0xdc, 0x52,
+	0x3c, 0x2e, 0x12, 0xdf, 0x7f, 0x91, 0x81, 0x62, 0xaf, 0xdb, 0x60, 0x9b, 0x60, 0x11, 0xc5, 0xbc,
+	0x0d, 0xab, 0x6c, 0x90, 0x63, 0xd7, 0xcf, 0xca, 0x64, 0xcc, 0x8c, 0xcd, 0x87, 0xa0, 0x58, 0x41,
+	0xe0, 0xf5, 0x1d, 0x2b, 0x8c, 0x83, 0xa4, 0xb3, 0x73, 0xc1, 0xbc, 0xbd, 0x6e, 0xa3, 0x26, 0xa9,
+	0xa2, 0xb0, 0xe8, 0x93, 0x2b, 0x78, 0x7d, 0x9a, 0x53, 0xd4, 0xf1, 0x35, 0x14, 0xb8, 0x3e, 0xf6,
+	0x29, 0xb3, 0x3d, 0xa4, 0x79, 0x5f, 0x49, 0x97, 0xc3, 0x5a, 0x84, 0x39, 0xfe, 0xe4, 0x8a, 0xd8,
+	0xcb, 0x8b, 0xd4, 0xd1, 0x26, 0x6c, 0xb0, 0x06, 0xf2, 0x02, 0x46, 0x34, 0xe0, 0x7e, 0x99, 0xea,
+	0xff, 0xc8, 0xc2, 0x5e, 0x2f, 0xa0, 0x7e, 0x77, 0x68, 0xb9, 0x54, 0xef, 0x62, 0x1a, 0x78, 0x13,
+	0xbf, 0x4f, 0x8d, 0xfe, 0x73, 0x3a, 0xb2, 0xd8, 0x2a, 0x8d, 0xc3, 0x78, 0xa3, 0xdb, 0x2a, 0x6b,
+	0xb8, 0xe0, 0xc8, 0xf8, 0x5d, 0x36, 0x4d, 0x82, 0xe4, 0xfe, 0xcc, 0x05, 0x4f, 0x46, 0x72, 0x3f,
+	0x22, 0x39, 0x84, 0x6d, 0x1e, 0x2f, 0xec, 0x5b, 0xee, 0x29, 0x4d, 0xae, 0x42, 0xb1, 0x67, 0xde,
+	0x64, 0x48, 0xcc, 0x70, 0x89, 0xc5, 0x17, 0xc5, 0x18, 0xf3, 0x3c, 0xd2, 0xab, 0xb5, 0x16, 0x13,
+	0xa2, 0x2f, 0x60, 0x87, 0x8f, 0x0d, 0x71, 0x69, 0xf8, 0xda, 0xf3, 0x5f, 0x88, 0x23, 0xc6, 0x68,
+	0x67, 0xbc, 0x86, 0xb7, 0x38, 0xb6, 0x2d, 0x90, 0xba, 0xc4, 0x4d, 0x73, 0x89, 0x4e, 0x12, 0x66,
+	0xcd, 0xfa, 0x03, 0xab, 0x1f, 0x5d, 0x80, 0x11, 0xb9, 0x0c, 0x8e, 0xd4, 0x23, 0x5c, 0xf5, 0xaf,
+	0x41, 0x39, 0x4e, 0x88, 0x2d, 0x2e, 0xc0, 0xaa, 0xbc, 0x8f, 0xc8, 0x1d, 0x1e, 0x6a, 0x07, 0x6b,
+	0xe2, 0x4a, 0x6a, 0xb3, 0xd6, 0x56, 0xb2, 0x68, 0x1d, 0x0a, 0x6a, 0x97, 0xc4, 0x71, 0x08, 0x4b,
+	0xd5, 0x7f, 0xb8, 0x0c, 0x9b, 0x0b, 0x66, 0x18, 0xdd, 0x84, 0x12, 0x67, 0x88, 0x38, 0xe6, 0x5d,
+	0x1c, 0x34, 0xf2, 0x33, 0x8e, 0xf8, 0x15, 0x87, 0x2e, 0x14, 0x64, 0xa3, 0xc3, 0xe8, 0xcd, 0x84,
+	0xf2, 0xe1, 0xdd, 0xcb, 0x79, 0xe7, 0x60, 0x16, 0x80, 0x41, 0x74, 0x8d, 0x57, 0xfb, 0x6b, 0x66,
+	0x1b, 0xf6, 0xbd, 0x57, 0xd4, 0x17, 0x57, 0x5b, 0x09, 0x77, 0x21, 0xcb, 0xcb, 0x43, 0x97, 0x39,
+	0x99, 0x37, 0xa2, 0x6c, 0x0c, 0x64, 0x30, 0x10, 0x7a, 0x00, 0x85, 0x01, 0xb5, 0x42, 0x26, 0x21,
+	0x02, 0x1a, 0x4a, 0x4d, 0x33, 0xc3, 0x91, 0x0d, 0x41, 0xc0, 0xe4, 0x0b, 0x0c, 0xe2, 0x6f, 0x84,
+	0x01, 0x39, 0x63, 0xe2, 0x4b, 0x8e, 0x23, 0x01, 0x67, 0x39, 0xe9, 0x5c, 0xfc, 0x30, 0xe5, 0x5c,
+	0xbc, 0x80, 0x3d, 0xb1, 0xe2, 0x8c, 0x67, 0x18, 0x16, 0xc3, 0xee, 0x29, 0xdb, 0xe0, 0x0c, 0x26,
+	0x43, 0xe2, 0xd3, 0x21, 0xb5, 0x02, 0x4a, 0xc6, 0xd4, 0x77, 0x3c, 0x5b, 0x2a, 0xa7, 0xcb, 0xba,
+	0xb7, 0x1d, 0x65, 0xc5, 0x22, 0x67, 0x97, 0x67, 0xac, 0x7e, 0x07, 0xca, 0xdc, 0xcc, 0x15, 0x20,
+	0x67, 0x98, 0x35, 0x6c, 0xf2, 0x60, 0x96, 0x12, 0xac, 0xe9, 0x6d, 0xdd, 0xd4, 0xf9, 0x55, 0xc6,
+	0x0c, 0x9b, 0x7e, 0xcd, 0x30, 0x6b, 0x47, 0x4d, 0xdd, 0x38, 0xe1, 0x77, 0x1b, 0x8b, 0x90, 0x6f,
+	0x75, 0xea, 0x7a, 0x43, 0xe7, 0x97, 0x1a, 0x0b, 0x90, 0xc3, 0x5a, 0x53, 0xab, 0x19, 0x9a, 0xb2,
+	0x5c, 0xfd, 0x3f, 0x2b, 0x50, 0x4a, 0x8d, 0x10, 0xfa, 0x1a, 0xf6, 0x63, 0xf5, 0xcb, 0xb7, 0x5f,
+	0xcf, 0x26, 0x83, 0x01, 0x15, 0x41, 0x54, 0x63, 0xe9, 0x25, 0xdb, 0x8d, 0x28, 0xd8, 0xc6, 0xeb,
+	0x28, 0xc2, 0xab, 0x63, 0x74, 0x0c, 0x37, 0xd2, 0x99, 0x53, 0x9b, 0x51, 0x9b, 0x0e, 0xad, 0x73,
+	0xe9, 0xcf, 0xba, 0x96, 0x2c, 0x22, 0xb9, 0x15, 0xad, 0x33, 0x22, 0xb6, 0x64, 0xed, 0x61, 0xa2,
+	0x6a, 0x7b, 0xe2, 0x4f, 0x97, 0x6c, 0x1e, 0x6f, 0xda, 0xc3, 0xb8, 0xda, 0xba, 0x44, 0xa1, 0x9f,
+	0x00, 0xdb, 0x5c, 0x0e, 0x98, 0x8c, 0x0d, 0x42, 0x4a, 0xe3, 0x98, 0xff, 0x3c, 0x5e, 0x97, 0x70,
+	0x43, 0x82, 0x99, 0xac, 0x1c, 0x88, 0xf0, 0xd3, 0x15, 0x4e, 0xb0, 0x32, 0xe0, 0xc1, 0xa7, 0xb7,
+	0xa0, 0x3c, 0x1e, 0xd8, 0xf2, 0x25, 0x19, 0xbe, 0x69, 0x15, 0xfe, 0xab, 0xd2, 0x78, 0x60, 0xb7,
+	0x62, 0x20, 0xd3, 0x4b, 0xcf, 0xa9, 0x65, 0x53, 0x9f, 0x50, 0xd7, 0x77, 0xfa, 0xcf, 0x19, 0x90,
+	0x08, 0xcb, 0x81, 0xcf, 0x72, 0x1e, 0xef, 0x08, 0xbc, 0x16, 0xa3, 0x7b, 0x1c, 0x8b, 0x1a, 0x70,
+	0x3d, 0x6a, 0x62, 0x74, 0xc5, 0x99, 0x0d, 0x0c, 0x75, 0x07, 0x9e, 0xdf, 0x17, 0x35, 0xe6, 0xc5,
+	0xf0, 0x48, 0x32, 0x3c, 0xa5, 0xd2, 0xa6, 0x44, 0xd1, 0x13, 0x07, 0xde, 0x80, 0x8c, 0x2c, 0xff,
+	0x05, 0xf5, 0xa5, 0x33, 0x90, 0xdb, 0x28, 0x79, 0xfe, 0xc4, 0x41, 0x67, 0xd0, 0xe2, 0x18, 0xe1,
+	0x07, 0x44, 0xbf, 0x82, 0xf7, 0xc6, 0xb6, 0x43, 0xbc, 0x71, 0xe8, 0x8c, 0x9c, 0xdf, 0x48, 0xdf,
+	0x80, 0x73, 0xea, 0x5a, 0xc3, 0x21, 0x1b, 0x26, 0x61, 0x8e, 0xec, 0x8d, 0x6d, 0xa7, 0x93, 0xa0,
+	0x30, 0x62, 0x02, 0x74, 0x0f, 0x76, 0x27, 0x43, 0x92, 0x9a, 0x12, 0xa6, 0xc7, 0x7c, 0x6f, 0x28,
+	0xdd, 0x0b, 0x5b, 0x93, 0x61, 0x7d, 0x3a, 0x27, 0xaa, 0xc0, 0x31, 0x66, 0x7a, 0x39, 0xf1, 0x42,
+	0x8b, 0x58, 0xe3, 0xf1, 0x30, 0x62, 0x83, 0xd0, 0xe3, 0xc9, 0x73, 0x69, 0x7a, 0xec, 0x72, 0x8a,
+	0xda, 0x94, 0xc0, 0xf4, 0x58, 0xe2, 0x9c, 0xdf, 0xab, 0x66, 0x0b, 0x42, 0x9e, 0x05, 0x8a, 0x04,
+	0x93, 0x59, 0x03, 0xdf, 0x1a, 0x51, 0xe2, 0x7b, 0x93, 0x90, 0xb5, 0xbd, 0xcc, 0xb1, 0x45, 0x0e,
+	0xc4, 0x02, 0xc6, 0x94, 0x02, 0x9b, 0x48, 0xae, 0x6a, 0xdd, 0x30, 0x90, 0x87, 0x86, 0x85, 0xf1,
+	0xc0, 0x56, 0x25, 0xa8, 0xfa, 0xdf, 0x32, 0x9c, 0xf3, 0xa7, 0xda, 0xea, 0xed, 0xa4, 0x61, 0x0b,
+	0x36, 0x86, 0x9e, 0x65, 0x47, 0xbd, 0x17, 0xfe, 0x1f, 0xa1, 0x07, 0x93, 0x57, 0xab, 0x9b, 0x9e,
+	0x65, 0xcb, 0x41, 0x48, 0x5e, 0x69, 0x58, 0x1f, 0xa6, 0xe1, 0xe8, 0x29, 0x6c, 0x33, 0x81, 0x36,
+	0x5f, 0xa4, 0x10, 0x86, 0xc9, 0xeb, 0xfa, 0x1d, 0x49, 0xb7, 0xa0, 0xd8, 0x4d, 0x6f, 0x1e, 0x57,
+	0x1d, 0xc3, 0xce, 0xe2, 0x56, 0xb0, 0xc9, 0x4c, 0x55, 0x18, 0xd0, 0x97, 0xd1, 0xf1, 0x8d, 0xd8,
+	0x9f, 0x6c, 0x25, 0xca, 0x32, 0xe8, 0x4b, 0x79, 0x8a, 0x73, 0x1d, 0x0a, 0x3c, 0xdb, 0x88, 0x86,
+	0xbe, 0xd3, 0x97, 0xa3, 0x03, 0x0c, 0xd4, 0xe2, 0x90, 0x6a, 0x07, 0x4a, 0x51, 0x23, 0x99, 0x50,
+	0x13, 0x0f, 0x75, 0xb0, 0x0f, 0x71, 0xe1, 0x43, 0xde, 0x72, 0xe1, 0x10, 0xbe, 0xa5, 0xbb, 0x0e,
+	0x05, 0x81, 0x9e, 0xc6, 0xfa, 0x95, 0xb0, 0xc8, 0xc1, 0xf5, 0x5c, 0xf5, 0x7f, 0x66, 0x60, 0xff,
+	0xe2, 0x6e, 0xa3, 0x03, 0xd8, 0x9c, 0x0e, 0x5e, 0xe8, 0xf3, 0x8e, 0xb8, 0x5e, 0xe4, 0x50, 0x8f,
+	0xc7, 0x24, 0xf4, 0x59, 0x27, 0x5c, 0x0f, 0xfd, 0x1c, 0xf6, 0x62, 0x7a, 0x9f, 0xda, 0x13, 0xe9,
+	0x67, 0x4a, 0x76, 0x67, 0x37, 0x22, 0xc0, 0x11, 0x5e, 0xf4, 0x0d, 0x35, 0x00, 0x09, 0x39, 0xce,
+	0x16, 0x5d, 0x14, 0x83, 0xb1, 0xc0, 0x00, 0x4a, 0x0d, 0x00, 0x56, 0x44, 0x9e, 0xce, 0xe0, 0xb1,
+	0xcc, 0xc1, 0x98, 0x7a, 0x30, 0xb4, 0x4e, 0x03, 0x69, 0x52, 0x88, 0x44, 0xf5, 0xef, 0x64, 0x60,
+	0xbd, 0xd7, 0x6d, 0xa4, 0x5e, 0xa5, 0x61, 0xec, 0x38, 0x8d, 0xdc, 0x8a, 0xcd, 0xba, 0xe2, 0x14,
+	0xa8, 0xdb, 0xe8, 0x63, 0x58, 0x9f, 0x7d, 0xb7, 0x46, 0x46, 0xaa, 0x07, 0xe9, 0x57, 0x6b, 0x6e,
+	0x40, 0x71, 0xe8, 0xf5, 0xad, 0x21, 0x19, 0x24, 0x23, 0xf2, 0x81, 0xc3, 0x1a, 0xfc, 0x0d, 0x20,
+	0x02, 0xdb, 0xd3, 0x26, 0xa8, 0x9e, 0x3b, 0x70, 0x4e, 0x45, 0x43, 0x1a, 0xc2, 0x6e, 0x4b, 0xbf,
+	0xb3, 0x93, 0x99, 0x73, 0x57, 0xce, 0xb4, 0x1f, 0xaf, 0x4f, 0xc6, 0x83, 0x24, 0x80, 0xb1, 0x47,
+	0xaf, 0xdb, 0xe8, 0x5a, 0xa7, 0x8e, 0x7b, 0xca, 0x99, 0x7f, 0xb6, 0x4d, 0x99, 0xd9, 0x36, 0xa1,
+	0xab, 0x00, 0xfc, 0xce, 0x62, 0xf2, 0x79, 0x86, 0xfc, 0x84, 0xea, 0x63, 0x66, 0xda, 0xdd, 0xf9,
+	0x1c, 0x72, 0xf2, 0xe2, 0x21, 0x53, 0x71, 0xe6, 0x71, 0xb7, 0x4b, 0x9a, 0x3c, 0x8c, 0xa3, 0x04,
+	0x6b, 0x3c, 0xf5, 0x84, 0xd9, 0x43, 0x19, 0xa6, 0xf1, 0x78, 0xb2, 0x8d, 0x95, 0xec, 0x9d, 0x7f,
+	0x9f, 0x81, 0x72, 0xfa, 0x45, 0x11, 0x74, 0x1d, 0xde, 0xeb, 0xd6, 0x7b, 0x51, 0x98, 0x38, 0xd1,
+	0xdb, 0x35, 0xd5, 0xd4, 0x1f, 0x6b, 0xa4, 0xdd, 0x31, 0xf5, 0xc6, 0x53, 0xe5, 0x0a, 0xda, 0x85,
+	0xcd, 0x9e, 0x46, 0xf4, 0x7a, 0x53, 0x23, 0xad, 0x4e, 0x3d, 0x46, 0x64, 0xd0, 0x16, 0x28, 0x3d,
+	0x8d, 0x74, 0x6b, 0xc7, 0x7a, 0xfb, 0x38, 0x82, 0x66, 0x79, 0x10, 0x9f, 0x46, 0xba, 0x1a, 0xd6,
+	0x3b, 0x75, 0x5d, 0x25, 0x58, 0x3b, 0x26, 0xb2, 0xc4, 0x64, 0xee, 0x25, 0x74, 0x15, 0x2a, 0xc9,
+	0x7a, 0x0d, 0xb3, 0x66, 0xc6, 0xd8, 0x65, 0x74, 0x03, 0xae, 0xf6, 0xe2, 0x78, 0x76, 0x1e, 0x31,
+	0xa0, 0x19, 0x26, 0xe9, 0xb4, 0x65, 0x75, 0xca, 0xca, 0x9d, 0x7f, 0xb1, 0x06, 0xc5, 0xe4, 0xb5,
+	0x0c, 0xa6, 0xf9, 0x8d, 0x63, 0x23, 0x8e, 0x38, 0xb8, 0x82, 0xca, 0x00, 0x8f, 0x3a, 0x46, 0x94,
+	0xe6, 0x51, 0x0f, 0xb8, 0x66, 0x46, 0xe9, 0x2c, 0x8f, 0x82, 0x68, 0xc4, 0xe9, 0x25, 0x56, 0x40,
+	0xb7, 0xd9, 0x8a, 0x0b, 0x58, 0x46, 0x08, 0xca, 0xcd, 0x8e, 0x61, 0x90, 0x4e, 0x43, 0x46, 0x69,
+	0x2a, 0x2b, 0x3c, 0x48, 0x56, 0x53, 0x3b, 0x8f, 0x35, 0xfc, 0x34, 0x01, 0x5f, 0x45, 0x1b, 0x50,
+	0xd2, 0xbb, 0x44, 0xad, 0xc5, 0xd9, 0x73, 0x6c, 0x24, 0xa6, 0xf5, 0x13, 0xed, 0x5b, 0x55, 0xd3,
+	0xea, 0x3c, 0xa6, 0x31, 0x19, 0x46, 0xa9, 0x14, 0x44, 0xbb, 0xf4, 0x28, 0x5f, 0x11, 0x55, 0x60,
+	0x8b, 0x87, 0x52, 0xc6, 0x01, 0xab, 0x12, 0x53, 0x92, 0x81, 0x8f, 0xda, 0x63, 0xad, 0x6d, 0x12,
+	0x13, 0xeb, 0xc7, 0xc7, 0x1a, 0x36, 0x94, 0x32, 0xab, 0xbb, 0xd3, 0x33, 0x59, 0x73, 0x44, 0x1c,
+	0xa7, 0xb2, 0xce, 0xc3, 0x2c, 0xb5, 0x44, 0xcc, 0xeb, 0x14, 0xa7, 0x88, 0xc0, 0xdc, 0x69, 0x98,
+	0x2b, 0x0f, 0xee, 0xe8, 0xf4, 0x4c, 0x65, 0x83, 0xe5, 0x62, 0x53, 0xdd, 0x8d, 0xe2, 0x47, 0xa3,
+	0xa8, 0x59, 0x4d, 0x41, 0x68, 0x0f, 0xb6, 0xd3, 0xb8, 0xc8, 0x8e, 0xda, 0x44, 0x1f, 0xc0, 0xb5,
+	0xba, 0xd6, 0xa8, 0xf5, 0x9a, 0x26, 0xd1, 0xba, 0x46, 0x14, 0xd1, 0x9a, 0x18, 0xfb, 0xad, 0x69,
+	0xf4, 0xaa, 0x84, 0x6c, 0xa3, 0x2a, 0xbc, 0x9f, 0x88, 0xbc, 0x5d, 0x10, 0xa7, 0xab, 0xec, 0xb0,
+	0x82, 0x63, 0x84, 0x30, 0xe2, 0xd4, 0x28, 0xf6, 0x94, 0x33, 0x84, 0xb2, 0xcb, 0x23, 0x70, 0x8f,
+	0x9f, 0x10, 0x13, 0xd7, 0x54, 0x2d, 0x8a, 0x5f, 0x55, 0x2a, 0x92, 0x69, 0x59, 0xcf, 0xc8, 0x77,
+	0x9d, 0xb6, 0x16, 0x55, 0xbb, 0xc7, 0x27, 0x7d, 0x3a, 0xd8, 0xfb, 0xdc, 0x5e, 0x54, 0x8f, 0x63,
+	0xc0, 0x7b, 0xac, 0x4e, 0xf5, 0xa4, 0x86, 0x8f, 0x45, 0x18, 0x0b, 0xc6, 0x5a, 0x53, 0x54, 0xa9,
+	0x7d, 0x2b, 0x49, 0xae, 0x32, 0x92, 0x5a, 0xb7, 0x4d, 0x6a, 0xad, 0x23, 0x9c, 0x6e, 0x56, 0x14,
+	0x59, 0x7c, 0x8d, 0x47, 0x16, 0xb3, 0x39, 0x54, 0x8d, 0xe3, 0x64, 0xf0, 0x6a, 0x54, 0xcd, 0xfb,
+	0x6c, 0x40, 0x7a, 0x46, 0xed, 0x98, 0xf1, 0x36, 0x0f, 0x5f, 0xfd, 0x00, 0xdd, 0x85, 0x9f, 0x5e,
+	0x30, 0x8a, 0x0b, 0xeb, 0xa8, 0xa2, 0xcf, 0xe0, 0x93, 0xb8, 0x8e, 0x93, 0xa7, 0x47, 0x58, 0xaf,
+	0x13, 0xa3, 0x77, 0x64, 0xa8, 0x58, 0x3f, 0xd2, 0xea, 0x8b, 0x6a, 0xbd, 0x89, 0x3e, 0x87, 0xbb,
+	0xb3, 0x59, 0x7a, 0xed, 0xcb, 0x33, 0x7d, 0xc8, 0xc6, 0x32, 0x15, 0xb2, 0x2b, 0x11, 0xb7, 0xd8,
+	0xd8, 0x27, 0x43, 0x9c, 0xb9, 0x4d, 0xae, 0x7c, 0xcc, 0xe4, 0x42, 0x1a, 0xdc, 0xe9, 0x2a, 0xb7,
+	0x19, 0xb1, 0xca, 0x43, 0xa5, 0xbb, 0x89, 0x50, 0xe9, 0x3b, 0xe8, 0x7d, 0xd8, 0xef, 0x69, 0x9c,
+	0xd5, 0x9b, 0x49, 0xe6, 0x92, 0x75, 0xfc, 0x94, 0x09, 0x82, 0x13, 0xad, 0x7d, 0x74, 0x21, 0xc5,
+	0xcf, 0x58, 0x09, 0x32, 0x4a, 0xb8, 0xad, 0x99, 0x4f, 0x3a, 0xf8, 0x21, 0xef, 0x45, 0x34, 0xae,
+	0x9f, 0xa0, 0x5b, 0xf0, 0x81, 0x0c, 0x6f, 0x6e, 0xd5, 0xda, 0xb5, 0x63, 0xad, 0xc5, 0x56, 0x4f,
+	0x24, 0x76, 0xa2, 0xd1, 0x3c, 0x60, 0x0b, 0x3b, 0x1a, 0xfe, 0x04, 0xe7, 0xde, 0x45, 0x5f, 0xc3,
+	0x97, 0x72, 0x05, 0x77, 0x1a, 0x84, 0x49, 0x36, 0xac, 0x19, 0x5a, 0x5b, 0xd5, 0x88, 0xde, 0x9e,
+	0x7e, 0x8b, 0xca, 0xf8, 0xe2, 0xc6, 0x5a, 0x2d, 0xaa, 0xfb, 0x53, 0xc6, 0x5d, 0x6c, 0x7c, 0x79,
+	0x84, 0xb2, 0x56, 0x57, 0x3e, 0xbb, 0xf3, 0x6f, 0x32, 0xb0, 0xf4, 0x48, 0xd5, 0xd1, 0x1a, 0xac,
+	0x3c, 0x52, 0x75, 0xee, 0x77, 0x95, 0x9f, 0x9f, 0x89, 0x0b, 0xf6, 0xec, 0xf3, 0x50, 0xc9, 0x46,
+	0x9f, 0x9f, 0x2b, 0x4b, 0xd1, 0xe7, 0x17, 0xca, 0x72, 0xf4, 0x79, 0x4f, 0x59, 0x89, 0x3e, 0xef,
+	0x2b, 0xab, 0xd1, 0xe7, 0x97, 0x4a, 0x2e, 0xfa, 0xfc, 0x4a, 0xc9, 0x47, 0x9f, 0x0f, 0x94, 0x35,
+	0xb6, 0x65, 0xe6, 0xb4, 0xf7, 0x94, 0x5a, 0xfc, 0x7d, 0x5f, 0x39, 0x8a, 0xbf, 0xbf, 0x54, 0xd4,
+	0xe8, 0xfb, 0xcb, 0x4f, 0x95, 0x46, 0xfc, 0x7d, 0x4f, 0x79, 0x18, 0x7f, 0x3f, 0x50, 0x3a, 0x77,
+	0x28, 0x14, 0x93, 0x4f, 0x25, 0x70, 0x0d, 0xd0, 0xad, 0x33, 0xc1, 0x3d, 0xdd, 0x82, 0x89, 0xe7,
+	0x05, 0x04, 0xb4, 0xdd, 0x31, 0x49, 0x5b, 0xd3, 0xea, 0x7c, 0x67, 0xb6, 0x0d, 0x1b, 0xd1, 0xa8,
+	0x33, 0xb8, 0x08, 0x78, 0xcf, 0x72, 0xe1, 0xc5, 0x43, 0xc9, 0xa2, 0xa9, 0x58, 0xba, 0xf3, 0x10,
+	0xd6, 0x67, 0x82, 0x52, 0x58, 0x2b, 0x1a, 0xac, 0x0e, 0x26, 0xd7, 0x77, 0x00, 0xe9, 0x6d, 0x91,
+	0x22, 0xbd, 0x76, 0x4b, 0x33, 0x35, 0xcc, 0x2b, 0xd8, 0x02, 0x25, 0x86, 0x47, 0xd0, 0xec, 0x9d,
+	0xaf, 0x60, 0x7d, 0x26, 0x62, 0x82, 0x55, 0x19, 0xb5, 0xa4, 0xa9, 0x3d, 0xd6, 0x9a, 0xe2, 0xbd,
+	0x94, 0xae, 0xaa, 0x0a, 0xfe, 0x16, 0xb0, 0xcc, 0x9d, 0x3a, 0x94, 0xd3, 0x7e, 0xe7, 0x85, 0xb1,
+	0xb0, 0x45, 0xc8, 0x33, 0x18, 0x4f, 0x65, 0xf9, 0xb2, 0x6e, 0x1b, 0x26, 0xee, 0xa9, 0x66, 0x8f,
+	0xd5, 0xbf, 0x74, 0xe7, 0x01, 0xe4, 0x22, 0xaf, 0x64, 0x19, 0xc0, 0x30, 0x54, 0xa1, 0x07, 0x3f,
+	0x13, 0x0a, 0x2a, 0x4e, 0x1f, 0x0a, 0x05, 0x15, 0xa7, 0x3f, 0x57, 0xb2, 0x77, 0xfe, 0xac, 0x00,
+	0x30, 0x75, 0xb3, 0x32, 0x99, 0xd2, 0xe9, 0x6a, 0xb8, 0x66, 0x76, 0x30, 0xa9, 0x6b, 0x22, 0x80,
+	0x4f, 0xab, 0x93, 0xa3, 0x1a, 0xc6, 0x4c, 0x25, 0x5e, 0x61, 0xe2, 0x5b, 0x6f, 0x1b, 0xbd, 0x46,
+	0x43, 0x57, 0x75, 0xc6, 0xe4, 0xf1, 0xf3, 0x0b, 0x4a, 0x86, 0xbf, 0xb9, 0x20, 0x1f, 0x0b, 0xe8,
+	0xc4, 0x51, 0xfa, 0xa4, 0xde, 0x6e, 0x8b, 0x07, 0x1e, 0x22, 0x40, 0x52, 0x25, 0xf3, 0xa8, 0xbe,
+	0x25, 0x26, 0x97, 0xb8, 0xcc, 0x60, 0x6a, 0x4b, 0x6b, 0x9b, 0xd1, 0xb2, 0xee, 0xe0, 0x99, 0xf7,
 	0x00, 0x64, 0x88, 0x3f, 0xd7, 0xdd, 0x91, 0xc2, 0x8e, 0xde, 0x08, 0x60, 0x52, 0xa6, 0xab, 0xa9,
-	0x62, 0x17, 0xbe, 0xcc, 0x28, 0x22, 0xd5, 0xde, 0xe9, 0x9a, 0x11, 0x47, 0x4c, 0xd7, 0xc9, 0x0a,
-	0xfa, 0x29, 0x7c, 0x2c, 0xcb, 0xd0, 0xea, 0x64, 0x21, 0x6d, 0x24, 0xb3, 0x94, 0x55, 0x46, 0x3c,
-	0x43, 0x62, 0x6a, 0xad, 0x6e, 0x07, 0xd7, 0xb0, 0xde, 0x7c, 0x4a, 0xa4, 0x6a, 0xec, 0xe0, 0xba,
-	0x86, 0x95, 0xbc, 0xd0, 0x7e, 0xc7, 0xbd, 0x66, 0x8d, 0x0d, 0x22, 0xb7, 0x4c, 0x84, 0xb6, 0x01,
-	0xfe, 0x1e, 0x83, 0x94, 0x20, 0x11, 0x2f, 0x16, 0xa4, 0x22, 0x8d, 0xc9, 0x48, 0xdc, 0x2a, 0xa5,
-	0xc8, 0xba, 0xa1, 0xb7, 0xb9, 0x22, 0x4d, 0x8d, 0x9b, 0x78, 0xea, 0xc1, 0x7c, 0x2a, 0x1e, 0x82,
-	0x30, 0xb4, 0x56, 0x8d, 0x8d, 0x9a, 0x78, 0xf6, 0xc1, 0xe0, 0x62, 0xa3, 0xa6, 0x3e, 0xd4, 0x4c,
-	0x22, 0xde, 0x79, 0x50, 0xca, 0xcc, 0x50, 0x30, 0x9e, 0xb6, 0x4d, 0x56, 0x0b, 0x13, 0x72, 0x9c,
-	0x70, 0x9e, 0x6e, 0x9d, 0xcd, 0x93, 0xec, 0x4c, 0xb3, 0x56, 0x6f, 0xc7, 0xc3, 0xc2, 0x44, 0x8e,
-	0x78, 0x20, 0xa2, 0x6b, 0xea, 0xa4, 0xa5, 0x1b, 0xad, 0x9a, 0xa9, 0x9e, 0x28, 0x1b, 0xac, 0xdc,
-	0xd9, 0xf9, 0x24, 0x8c, 0x57, 0x49, 0xa7, 0xdd, 0x7c, 0xca, 0x35, 0xed, 0x13, 0xad, 0xae, 0xa0,
-	0x8b, 0xe8, 0xee, 0xa7, 0xe9, 0x36, 0x99, 0xa4, 0x4d, 0xd2, 0xd5, 0x3b, 0x9a, 0xc1, 0x27, 0x43,
-	0xfb, 0x56, 0x37, 0x4c, 0x65, 0x0b, 0xdd, 0x83, 0xcf, 0x16, 0xf3, 0x1f, 0x69, 0x74, 0x30, 0x91,
-	0x0c, 0xa0, 0x12, 0xa3, 0xc9, 0x5b, 0xdd, 0xae, 0x73, 0xf6, 0xdb, 0x66, 0x43, 0x9c, 0x9a, 0x7e,
-	0x12, 0x2d, 0x02, 0x65, 0x07, 0x7d, 0x02, 0x3f, 0x79, 0xeb, 0x22, 0x95, 0x5d, 0x26, 0xeb, 0x17,
-	0x73, 0x39, 0x1b, 0xce, 0x9a, 0x24, 0xab, 0x30, 0x51, 0x14, 0x4f, 0x9c, 0xa9, 0x93, 0xc7, 0xb5,
-	0x66, 0x8f, 0xd9, 0x06, 0x0f, 0xe1, 0xb8, 0x55, 0xfb, 0x56, 0x6f, 0xf5, 0x5a, 0xa4, 0x5e, 0x33,
-	0x6b, 0x04, 0x33, 0x19, 0xd6, 0xd5, 0x30, 0x13, 0xfb, 0xac, 0x3a, 0xbe, 0x0c, 0xba, 0xcd, 0x5a,
-	0x9b, 0xc9, 0x3b, 0x53, 0x3b, 0xc6, 0xba, 0xf9, 0x94, 0x74, 0x71, 0xc7, 0x14, 0x2f, 0x58, 0x10,
-	0x9d, 0xe9, 0xb7, 0x0e, 0x69, 0x76, 0x9e, 0x28, 0xfb, 0xe8, 0x63, 0xb8, 0x99, 0x9e, 0x7a, 0xd6,
-	0x04, 0xf3, 0x44, 0xe3, 0xda, 0x45, 0xac, 0x63, 0xc6, 0x76, 0xef, 0xa1, 0x3b, 0xf0, 0xd1, 0xc2,
-	0xd9, 0x9f, 0xa7, 0xbd, 0xca, 0x66, 0x2a, 0x6a, 0x78, 0xab, 0xd6, 0xed, 0x6a, 0xf5, 0xa4, 0xa9,
-	0x10, 0xf3, 0xdd, 0x35, 0x6e, 0x5c, 0xc9, 0xca, 0x6b, 0xcd, 0xe6, 0x53, 0x32, 0x7d, 0xc4, 0xa4,
-	0xa5, 0x19, 0xcc, 0xec, 0x50, 0xde, 0x67, 0x56, 0xcc, 0xb4, 0xac, 0x76, 0x9d, 0x89, 0x95, 0xa7,
-	0xa9, 0x87, 0x36, 0xae, 0xa3, 0x4f, 0xe1, 0x67, 0x92, 0x5e, 0x30, 0x45, 0x9b, 0xdb, 0x41, 0xba,
-	0x61, 0xb2, 0xa9, 0xe8, 0x60, 0x3e, 0xf9, 0x7a, 0xab, 0xdb, 0xe4, 0x3a, 0x55, 0xab, 0x2b, 0x37,
-	0xd0, 0x97, 0xf0, 0xf9, 0x4c, 0x0e, 0x93, 0xa8, 0x9d, 0x56, 0xb7, 0x66, 0xea, 0x47, 0x4d, 0x8d,
-	0x3c, 0xd1, 0xcd, 0x13, 0xde, 0x31, 0x36, 0x6a, 0x1d, 0xb5, 0xd3, 0x14, 0x76, 0xbf, 0xf2, 0x01,
-	0xcb, 0x98, 0x34, 0x3e, 0x34, 0x51, 0xe6, 0x1b, 0x6b, 0xac, 0xb2, 0xf5, 0x1c, 0x47, 0x1b, 0x33,
-	0x0b, 0x41, 0x93, 0xef, 0xab, 0xdc, 0x44, 0x87, 0x70, 0x10, 0xb5, 0xe5, 0x2d, 0x9b, 0xf1, 0x21,
-	0x67, 0xf1, 0x08, 0x26, 0x66, 0x22, 0x29, 0xb9, 0x6e, 0x31, 0xdd, 0xc3, 0x38, 0xa6, 0xd6, 0xc4,
-	0x5a, 0xad, 0xce, 0x86, 0x8b, 0x31, 0x85, 0xf2, 0x11, 0xe3, 0xa8, 0x78, 0x9e, 0x88, 0xb4, 0x6b,
-	0x95, 0xdb, 0x77, 0xfe, 0x28, 0x03, 0x85, 0xc4, 0x75, 0x21, 0x26, 0x62, 0x84, 0xa6, 0x6c, 0xc6,
-	0x26, 0xec, 0x15, 0xd6, 0x03, 0xde, 0x45, 0xc6, 0xb5, 0x89, 0xf5, 0xa5, 0x64, 0xd0, 0x35, 0xd8,
-	0x8b, 0xc8, 0xb5, 0x96, 0x86, 0x8f, 0xb5, 0xb6, 0xfa, 0x34, 0xce, 0x98, 0x65, 0xb3, 0x1c, 0x67,
-	0x9c, 0xe2, 0x93, 0x45, 0xe4, 0x58, 0xe1, 0x0b, 0x2d, 0xe7, 0xa5, 0x3b, 0x0f, 0x00, 0xa6, 0xf7,
+	0x62, 0x17, 0xbe, 0xc2, 0x28, 0x22, 0xd5, 0xde, 0xe9, 0x9a, 0x11, 0x47, 0x4c, 0xd7, 0xc9, 0x2a,
+	0xfa, 0x29, 0x7c, 0x2c, 0xcb, 0xd0, 0xea, 0x64, 0x21, 0x6d, 0x24, 0xb3, 0x94, 0x1c, 0x23, 0x9e,
+	0x21, 0x31, 0xb5, 0x56, 0xb7, 0x83, 0x6b, 0x58, 0x6f, 0x3e, 0x25, 0x52, 0x35, 0x76, 0x70, 0x5d,
+	0xc3, 0x4a, 0x5e, 0x68, 0xbf, 0xe3, 0x5e, 0xb3, 0xc6, 0x06, 0x91, 0x5b, 0x26, 0x42, 0xdb, 0x00,
+	0x7f, 0x8f, 0x41, 0x4a, 0x90, 0x88, 0x17, 0x0b, 0x52, 0x91, 0xc6, 0x64, 0x24, 0x6e, 0x95, 0x52,
+	0x64, 0xdd, 0xd0, 0xdb, 0x5c, 0x91, 0xa6, 0xc6, 0x4d, 0x3c, 0xf5, 0x60, 0x3e, 0x15, 0x0f, 0x41,
+	0x18, 0x5a, 0xab, 0xc6, 0x46, 0x4d, 0x3c, 0xfb, 0x60, 0x70, 0xb1, 0x51, 0x53, 0x1f, 0x6a, 0x26,
+	0x11, 0xef, 0x3c, 0x28, 0x65, 0x66, 0x28, 0x18, 0x4f, 0xdb, 0x26, 0xab, 0x85, 0x09, 0x39, 0x4e,
+	0x38, 0x4f, 0xb7, 0xce, 0xe6, 0x49, 0x76, 0xa6, 0x59, 0xab, 0xb7, 0xe3, 0x61, 0x61, 0x22, 0x47,
+	0x3c, 0x10, 0xd1, 0x35, 0x75, 0xd2, 0xd2, 0x8d, 0x56, 0xcd, 0x54, 0x4f, 0x94, 0x0d, 0x56, 0xee,
+	0xec, 0x7c, 0x12, 0xc6, 0xab, 0xa4, 0xd3, 0x6e, 0x3e, 0xe5, 0x9a, 0xf6, 0x89, 0x56, 0x57, 0xd0,
+	0x45, 0x74, 0xf7, 0xd3, 0x74, 0x9b, 0x4c, 0xd2, 0x26, 0xe9, 0xea, 0x1d, 0xcd, 0xe0, 0x93, 0xa1,
+	0x7d, 0xab, 0x1b, 0xa6, 0xb2, 0x85, 0xee, 0xc1, 0x67, 0x8b, 0xf9, 0x8f, 0x34, 0x3a, 0x98, 0x48,
+	0x06, 0x50, 0x89, 0xd1, 0xe4, 0xad, 0x6e, 0xd7, 0x39, 0xfb, 0x6d, 0xb3, 0x21, 0x4e, 0x4d, 0x3f,
+	0x89, 0x16, 0x81, 0xb2, 0x83, 0x3e, 0x81, 0x9f, 0xbc, 0x75, 0x91, 0xca, 0x2e, 0x93, 0xf5, 0x8b,
+	0xb9, 0x9c, 0x0d, 0x67, 0x4d, 0x92, 0x55, 0x98, 0x28, 0x8a, 0x27, 0xce, 0xd4, 0xc9, 0xe3, 0x5a,
+	0xb3, 0xc7, 0x6c, 0x83, 0x87, 0x70, 0xdc, 0xaa, 0x7d, 0xab, 0xb7, 0x7a, 0x2d, 0x52, 0xaf, 0x99,
+	0x35, 0x82, 0x99, 0x0c, 0xeb, 0x6a, 0x98, 0x89, 0x7d, 0x56, 0x1d, 0x5f, 0x06, 0xdd, 0x66, 0xad,
+	0xcd, 0xe4, 0x9d, 0xa9, 0x1d, 0x63, 0xdd, 0x7c, 0x4a, 0xba, 0xb8, 0x63, 0x8a, 0x17, 0x2c, 0x88,
+	0xce, 0xf4, 0x5b, 0x87, 0x34, 0x3b, 0x4f, 0x94, 0x7d, 0xf4, 0x31, 0xdc, 0x4c, 0x4f, 0x3d, 0x6b,
+	0x82, 0x79, 0xa2, 0x71, 0xed, 0x22, 0xd6, 0x31, 0x63, 0xbb, 0xf7, 0xd0, 0x1d, 0xf8, 0x68, 0xe1,
+	0xec, 0xcf, 0xd3, 0x5e, 0x65, 0x33, 0x15, 0x35, 0xbc, 0x55, 0xeb, 0x76, 0xb5, 0x7a, 0xd2, 0x54,
+	0x88, 0xf9, 0xee, 0x1a, 0x37, 0xae, 0x64, 0xe5, 0xb5, 0x66, 0xf3, 0x29, 0x99, 0x3e, 0x62, 0xd2,
+	0xd2, 0x0c, 0x66, 0x76, 0x28, 0xef, 0x33, 0x2b, 0x66, 0x5a, 0x56, 0xbb, 0xce, 0xc4, 0xca, 0xd3,
+	0xd4, 0x43, 0x1b, 0xd7, 0xd1, 0xa7, 0xf0, 0x33, 0x49, 0x2f, 0x98, 0xa2, 0xcd, 0xed, 0x20, 0xdd,
+	0x30, 0xd9, 0x54, 0x74, 0x30, 0x9f, 0x7c, 0xbd, 0xd5, 0x6d, 0x72, 0x9d, 0xaa, 0xd5, 0x95, 0x1b,
+	0xe8, 0x4b, 0xf8, 0x7c, 0x26, 0x87, 0x49, 0xd4, 0x4e, 0xab, 0x5b, 0x33, 0xf5, 0xa3, 0xa6, 0x46,
+	0x9e, 0xe8, 0xe6, 0x09, 0xef, 0x18, 0x1b, 0xb5, 0x8e, 0xda, 0x69, 0x0a, 0xbb, 0x5f, 0xf9, 0x80,
+	0x65, 0x4c, 0x1a, 0x1f, 0x9a, 0x28, 0xf3, 0x8d, 0x35, 0x56, 0xd9, 0x7a, 0x8e, 0xa3, 0x8d, 0x99,
+	0x85, 0xa0, 0xc9, 0xf7, 0x55, 0x6e, 0xa2, 0x43, 0x38, 0x88, 0xda, 0xf2, 0x96, 0xcd, 0xf8, 0x90,
+	0xb3, 0x78, 0x04, 0x13, 0x33, 0x91, 0x94, 0x5c, 0xb7, 0x98, 0xee, 0x61, 0x1c, 0x53, 0x6b, 0x62,
+	0xad, 0x56, 0x67, 0xc3, 0xc5, 0x98, 0x42, 0xf9, 0x88, 0x71, 0x54, 0x3c, 0x4f, 0x44, 0xda, 0xb5,
+	0xca, 0xed, 0x3b, 0x7f, 0x94, 0x81, 0x42, 0xe2, 0xba, 0x10, 0x13, 0x31, 0x42, 0x53, 0x36, 0x63,
+	0x13, 0xf6, 0x0a, 0xeb, 0x01, 0xef, 0x22, 0xe3, 0xda, 0xc4, 0xfa, 0x52, 0x32, 0xe8, 0x1a, 0xec,
+	0x45, 0xe4, 0x5a, 0x4b, 0xc3, 0xc7, 0x5a, 0x5b, 0x7d, 0x1a, 0x67, 0xcc, 0xb2, 0x59, 0x8e, 0x33,
+	0x4e, 0xf1, 0xc9, 0x22, 0x96, 0x58, 0xe1, 0x0b, 0x2d, 0xe7, 0xe5, 0x3b, 0x0f, 0x00, 0xa6, 0xf7,
 	0x81, 0x58, 0xc7, 0x5a, 0xe4, 0x73, 0xb6, 0x51, 0x94, 0xc6, 0x14, 0xfb, 0x56, 0xae, 0x88, 0x47,
 	0x6a, 0xda, 0x49, 0x8c, 0x92, 0xb9, 0x83, 0x41, 0x99, 0xbd, 0x08, 0xc3, 0xf4, 0xe0, 0x63, 0x0d,
 	0x8b, 0x71, 0x8a, 0x36, 0x8d, 0x6c, 0xe1, 0xb1, 0xa1, 0x8f, 0x11, 0x19, 0x86, 0x68, 0x3f, 0x99,
@@ -6918,9 +6930,9 @@ var fileDescriptor_85add0446af78174 = []byte{
 	0x1c, 0xb2, 0xb7, 0x3d, 0x7f, 0x64, 0x0d, 0xe5, 0x91, 0x85, 0xf7, 0x5a, 0xc9, 0xde, 0x21, 0xb0,
 	0x31, 0xf7, 0x4e, 0x2f, 0x33, 0x06, 0x54, 0xac, 0x89, 0x70, 0xfa, 0x4f, 0xc5, 0xeb, 0x0c, 0x3c,
 	0xad, 0x71, 0x4b, 0xb1, 0x08, 0x79, 0xb9, 0xab, 0x3e, 0x14, 0x3b, 0xd9, 0x78, 0xdf, 0xce, 0x2c,
-	0x46, 0xb6, 0xa3, 0x14, 0xbb, 0xb3, 0x3a, 0x33, 0x1b, 0x0f, 0xff, 0x70, 0x09, 0x36, 0xf9, 0x63,
+	0x46, 0xb6, 0xa3, 0x14, 0xbb, 0xb3, 0x3a, 0x33, 0x1b, 0x0f, 0xff, 0x70, 0x19, 0x36, 0xf9, 0x63,
 	0x88, 0xb2, 0x12, 0xe1, 0xce, 0xe5, 0x4f, 0x0e, 0x08, 0xf7, 0x1f, 0x7f, 0x1b, 0x26, 0xb4, 0xc2,
-	0x00, 0xed, 0x2f, 0x7c, 0x38, 0x9a, 0xbf, 0x32, 0xbd, 0xbf, 0x21, 0x71, 0xfc, 0xbd, 0xf0, 0x83,
+	0x00, 0xed, 0x2f, 0x7c, 0x5b, 0x9a, 0x3f, 0x44, 0xbd, 0xbf, 0x21, 0x71, 0xfc, 0x49, 0xf1, 0x83,
 	0xc7, 0x9e, 0x63, 0x57, 0xaf, 0xa0, 0x3f, 0x80, 0x52, 0x2a, 0x74, 0x05, 0x7d, 0x98, 0xf2, 0x04,
 	0x5e, 0xf0, 0x98, 0xf4, 0xfe, 0xad, 0x37, 0x50, 0xc9, 0x97, 0xfd, 0xae, 0xa0, 0x1e, 0xc0, 0xf4,
 	0x09, 0x47, 0xf4, 0xc1, 0x6c, 0xb6, 0xb9, 0x57, 0x23, 0xf7, 0xab, 0x97, 0x91, 0xc4, 0xc5, 0xda,
@@ -6931,11 +6943,11 @@ var fileDescriptor_85add0446af78174 = []byte{
 	0xb6, 0x65, 0x0b, 0xba, 0xbe, 0x77, 0x76, 0x2e, 0x50, 0x36, 0xf5, 0x51, 0x6f, 0xfa, 0x90, 0x8b,
 	0xb0, 0xf7, 0xd1, 0x8d, 0x37, 0xbd, 0x72, 0xb8, 0x7f, 0xfd, 0x42, 0x0a, 0xf1, 0x50, 0x59, 0xf5,
 	0x0a, 0xea, 0x40, 0x31, 0xf9, 0x80, 0x19, 0x7a, 0xff, 0x82, 0x97, 0xcd, 0xa2, 0x22, 0xaf, 0x5d,
-	0xfa, 0xf2, 0x59, 0xf5, 0xca, 0xe1, 0x3f, 0xcb, 0x42, 0x45, 0xa5, 0x6e, 0xe8, 0xc7, 0x9c, 0x2d,
+	0xfa, 0xf2, 0x59, 0xf5, 0xca, 0xe1, 0x3f, 0xcd, 0x42, 0x45, 0xa5, 0x6e, 0xe8, 0xc7, 0x9c, 0x2d,
 	0x1d, 0xa5, 0x43, 0xea, 0x23, 0x73, 0x96, 0x31, 0x67, 0xa2, 0x18, 0xe6, 0x79, 0xf2, 0xc6, 0xc5,
 	0x04, 0xf1, 0x8c, 0x9a, 0x50, 0x4a, 0x85, 0x4d, 0xa4, 0x4a, 0x5d, 0x14, 0xf1, 0x91, 0x2a, 0x75,
-	0x61, 0xc4, 0x45, 0xf5, 0x0a, 0xfa, 0x5b, 0xa0, 0xc4, 0xd1, 0x07, 0x51, 0xc1, 0xd5, 0x79, 0x46,
-	0x99, 0x8d, 0x50, 0xd8, 0xbf, 0x79, 0x29, 0x4d, 0x3c, 0xd3, 0x7f, 0x07, 0x76, 0x6a, 0xa3, 0xc1,
+	0x61, 0xc4, 0x45, 0xf5, 0x0a, 0xfa, 0x1b, 0xa0, 0xc4, 0xd1, 0x07, 0x51, 0xc1, 0xd5, 0x79, 0x46,
+	0x99, 0x8d, 0x50, 0xd8, 0xbf, 0x79, 0x29, 0x4d, 0x3c, 0xd3, 0x7f, 0x0b, 0x76, 0x6a, 0xa3, 0xc1,
 	0x74, 0x33, 0x13, 0x5f, 0x7d, 0x42, 0x5d, 0xd8, 0x32, 0x68, 0x58, 0x1b, 0x0d, 0x66, 0x2e, 0x6e,
 	0xbd, 0x9f, 0x2a, 0x78, 0xee, 0x96, 0xc0, 0x7e, 0xd2, 0xeb, 0x9b, 0xba, 0x48, 0x75, 0xf8, 0xdb,
 	0x2c, 0x7f, 0x92, 0x38, 0x3e, 0xb4, 0x6d, 0x78, 0x7e, 0x7c, 0x86, 0x88, 0x1a, 0x7c, 0x3d, 0xa4,
@@ -6946,8 +6958,8 @@ var fileDescriptor_85add0446af78174 = []byte{
 	0x33, 0xe0, 0x8b, 0x5e, 0x74, 0xbe, 0xb4, 0xf1, 0x8f, 0xf9, 0x90, 0x18, 0x73, 0x33, 0xf9, 0xe1,
 	0xe5, 0x33, 0x29, 0x4c, 0x80, 0x4b, 0xe6, 0xf3, 0x05, 0x6c, 0x31, 0xf6, 0x60, 0x7f, 0xa9, 0x06,
 	0x1b, 0xbc, 0x1b, 0xc6, 0x8f, 0xda, 0x8d, 0xa3, 0xf7, 0xbe, 0xdb, 0xe3, 0xa8, 0xbb, 0xc3, 0x90,
-	0xde, 0xed, 0x0f, 0xbd, 0x89, 0x7d, 0xf7, 0xd4, 0x93, 0xff, 0x65, 0xe2, 0xd9, 0x0a, 0xff, 0xfd,
-	0xfc, 0xff, 0x07, 0x00, 0x00, 0xff, 0xff, 0xea, 0xcd, 0xc4, 0xc1, 0xdd, 0x62, 0x00, 0x00,
+	0xde, 0xed, 0x0f, 0xbd, 0x89, 0x7d, 0xf7, 0xd4, 0x93, 0xff, 0x88, 0xe2, 0xd9, 0x2a, 0xff, 0xfd,
+	0xfc, 0xff, 0x05, 0x00, 0x00, 0xff, 0xff, 0xc9, 0xa7, 0xba, 0x81, 0x00, 0x63, 0x00, 0x00,
 }
 
 // Reference imports to suppress errors if they are not otherwise used.
@@ -352,9 +352,14 @@ void LocalEnforcer::sync_sessions_on_restart(std::time_t current_time) {
 void LocalEnforcer::aggregate_records(
     SessionMap& session_map, const RuleRecordTable& records,
     SessionUpdate& session_update) {
-  // Insert the IMSI+SessionID for sessions we received a rule record into a set
-  // for easy access
-  std::unordered_set<ImsiAndSessionID> sessions_with_reporting_flows;
+  // A full report holds a record for every rule with flows in PipelineD. A
+  // delta update only holds the records that changed, and final records for
+  // the rules whose flows ended, so the rules with flows are kept between
+  // reports.
+  if (!records.delta_update()) {
+    rules_with_active_flows_.clear();
+    received_full_report_ = true;
+  }
   // In some failure cases, PipelineD may still hold onto flows for sessions
   // that do not exist in SessionD. In this case, send DeactivateFlowsRequest
   RuleRecordSet dead_sessions_to_cleanup;
@@ -373,7 +378,20 @@ void LocalEnforcer::aggregate_records(
 
     auto& session                 = **session_it;
     const std::string& session_id = session->get_session_id();
-    sessions_with_reporting_flows.insert(ImsiAndSessionID(imsi, session_id));
+    const ImsiAndSessionID imsi_and_session_id(imsi, session_id);
+    const std::string rule_key =
+        record.rule_id() + "|" + std::to_string(record.rule_version());
+    if (records.delta_update() && record.final_record()) {
+      auto rules_it = rules_with_active_flows_.find(imsi_and_session_id);
+      if (rules_it != rules_with_active_flows_.end()) {
+        rules_it->second.erase(rule_key);
+        if (rules_it->second.empty()) {
+          rules_with_active_flows_.erase(rules_it);
+        }
+      }
+    } else {
+      rules_with_active_flows_[imsi_and_session_id].insert(rule_key);
+    }
     if (record.bytes_tx() > 0 || record.bytes_rx() > 0) {
       MLOG(MDEBUG) << session_id << " used " << record.bytes_tx()
                    << " tx bytes and " << record.bytes_rx()
@@ -385,13 +403,23 @@ void LocalEnforcer::aggregate_records(
         record.bytes_rx(), record.dropped_tx(), record.dropped_rx(),
         &session_update[imsi][session_id]);
   }
+  // Insert the IMSI+SessionID for sessions with flows into a set for easy
+  // access
+  std::unordered_set<ImsiAndSessionID> sessions_with_reporting_flows;
+  for (const auto& rules_pair : rules_with_active_flows_) {
+    sessions_with_reporting_flows.insert(rules_pair.first);
+  }
   if (records.records().size() > 0) {
     MLOG(MINFO) << "Received stats for " << sessions_with_reporting_flows.size()
                 << " active sessions and " << dead_sessions_to_cleanup.size()
                 << " stale sessions";
   }
-  complete_termination_for_released_sessions(
-      session_map, sessions_with_reporting_flows, session_update);
+  // Until the first full report (e.g. after a restart) the rules with flows
+  // are not known
+  if (received_full_report_) {
+    complete_termination_for_released_sessions(
+        session_map, sessions_with_reporting_flows, session_update);
+  }
   cleanup_dead_sessions(dead_sessions_to_cleanup);
 }
 
@@ -149,7 +149,8 @@ class LocalEnforcer {
   /**
    * Insert a group of rule usage into the monitor and update credit manager
    * Assumes records are aggregates, as in the usages sent are cumulative and
-   * not differences.
+   * not differences. If records is a delta update, the rules of unchanged
+   * flows are left out of it and rules whose flows ended have a final record.
    *
    * @param records - a RuleRecordTable protobuf with a vector of RuleRecords
    */
@@ -354,6 +355,11 @@ class LocalEnforcer {
   std::chrono::milliseconds retry_timeout_;
   magma::mconfig::SessionD mconfig_;
   std::unique_ptr<Timezone> access_timezone_;
+  // Rules (rule_id|rule_version) with flows in PipelineD, by session, as of
+  // the last full report and the delta updates received since
+  std::unordered_map<ImsiAndSessionID, std::unordered_set<std::string>>
+      rules_with_active_flows_;
+  bool received_full_report_ = false;
 
  private:
   /**
@@ -690,6 +690,59 @@ TEST_F(LocalEnforcerTest, test_aggregate_records_for_termination) {
   local_enforcer->aggregate_records(session_map, empty_table, update);
 }
 
+TEST_F(LocalEnforcerTest, test_aggregate_records_delta_update) {
+  CreateSessionResponse response;
+  create_credit_update_response(
+      IMSI1, SESSION_ID_1, 1, 1024, response.mutable_credits()->Add());
+  local_enforcer->init_session(
+      session_map, IMSI1, SESSION_ID_1, get_default_config(IMSI1), response);
+  local_enforcer->update_tunnel_ids(
+      session_map,
+      create_update_tunnel_ids_request(IMSI1, BEARER_ID_1, teids1));
+
+  insert_static_rule(1, "", "rule1");
+  insert_static_rule(1, "", "rule2");
+
+  auto update = SessionStore::get_default_session_update(session_map);
+  local_enforcer->handle_termination_from_access(
+      session_map, IMSI1, APN1, update);
+  auto uc = get_default_update_criteria();
+  session_map[IMSI1][0]->increment_rule_stats("rule1", &uc);
+  session_map[IMSI1][0]->increment_rule_stats("rule2", &uc);
+
+  // Which sessions have flows is not known before the first full report
+  EXPECT_CALL(*reporter, report_terminate_session(_, _)).Times(0);
+  RuleRecordTable empty_delta_table;
+  empty_delta_table.set_delta_update(true);
+  local_enforcer->aggregate_records(session_map, empty_delta_table, update);
+
+  RuleRecordTable table;
+  create_rule_record(IMSI1, "rule1", 10, 20, table.mutable_records()->Add());
+  create_rule_record(IMSI1, "rule2", 5, 15, table.mutable_records()->Add());
+  local_enforcer->aggregate_records(session_map, table, update);
+
+  // A delta update without records for the session should not complete the
+  // termination, as the session still has unchanged flows
+  local_enforcer->aggregate_records(session_map, empty_delta_table, update);
+
+  RuleRecordTable delta_table;
+  delta_table.set_delta_update(true);
+  auto record = delta_table.mutable_records()->Add();
+  create_rule_record(IMSI1, "rule1", 10, 20, record);
+  record->set_final_record(true);
+  local_enforcer->aggregate_records(session_map, delta_table, update);
+  ::testing::Mock::VerifyAndClearExpectations(reporter.get());
+
+  // The termination completes once the flows of all rules ended
+  EXPECT_CALL(*reporter, report_terminate_session(_, _)).Times(1);
+  RuleRecordTable final_delta_table;
+  final_delta_table.set_delta_update(true);
+  record = final_delta_table.mutable_records()->Add();
+  create_rule_record(IMSI1, "rule2", 5, 15, record);
+  record->set_final_record(true);
+  local_enforcer->aggregate_records(session_map, final_delta_table, update);
+}
+
 TEST_F(LocalEnforcerTest, test_collect_updates) {
   insert_static_rule(1, "", "rule1");
   CreateSessionResponse response;
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Micro-benchmark of the subscriberdb S6a Diameter codec. It decodes the
+Authentication-Information and Update-Location requests sent by the OAI
+MME, and encodes the answers of the S6a application. It only uses the
+codec API, so it can be run against two builds of subscriberdb to compare
+them.
+"""
+import argparse
+import time
+
+from lte.protos.mconfig.mconfigs_pb2 import SubscriberDB
+from magma.subscriberdb.processor import LTEProcessor
+from magma.subscriberdb.protocols.diameter import avp, message
+from magma.subscriberdb.protocols.diameter.application import s6a
+
+SESSION_ID = 'enb-Lenovo-Product.openair4G.eur;1475864727;1;apps6a'
+IMSI = '208950000000001'
+VECTOR = (
+    b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f',
+    b'\x2d\xaf\x87\x3d\x73\xf3\x10\xc6',
+    b'o\xbf\xa3\x80\x1fW\x80\x00{\xdeY\x88n\x96\xe4\xfe',
+    b'\x87H\xc1\xc0\xa2\x82o\xa4\x05\xb1\xe2~\xa1\x04CJ\xe5V\xc7e'
+    b'\xe8\xf0a\xeb\xdb\x8a\xe2\x86\xc4F\x16\xc2',
+)
+
+
+class _Processor(LTEProcessor):
+    """ Returns the same auth vectors and profile for every subscriber """
+
+    def generate_lte_auth_vector(self, imsi, plmn):
+        return VECTOR
+
+    def generate_lte_auth_vectors(self, imsi, plmn, num_vectors):
+        return num_vectors * [VECTOR]
+
+    def resync_lte_auth_seq(self, imsi, rand, auts):
+        pass
+
+    def get_next_lte_auth_seq(self, imsi):
+        pass
+
+    def set_next_lte_auth_seq(self, imsi, seq):
+        pass
+
+    def get_sub_profile(self, imsi):
+        return SubscriberDB.SubscriptionProfile(
+            max_ul_bit_rate=10000,
+            max_dl_bit_rate=50000,
+        )
+
+
+class _Writer:
+    """ Encodes the answers like the server writer, without a transport """
+
+    def send_msg(self, msg):
+        buf = bytearray(msg.length)
+        msg.encode(buf, 0)
+
+
+def _request(command_code, avps):
+    msg = message.Message()
+    msg.header.application_id = s6a.S6AApplication.APP_ID
+    msg.header.command_code = command_code
+    msg.header.request = True
+    msg.append_avp(avp.AVP('Session-Id', SESSION_ID))
+    msg.append_avp(avp.AVP('Auth-Session-State', 1))
+    msg.append_avp(avp.AVP('User-Name', IMSI))
+    msg.append_avp(avp.AVP('Visited-PLMN-Id', b'(Y'))
+    for avp_ in avps:
+        msg.append_avp(avp_)
+    buf = bytearray(msg.length)
+    msg.encode(buf, 0)
+    return bytes(buf)
+
+
+def _air(num_vectors):
+    return _request(
+        s6a.S6AApplicationCommands.AUTHENTICATION_INFORMATION, [
+            avp.AVP(
+                'Requested-EUTRAN-Authentication-Info', [
+                    avp.AVP('Number-Of-Requested-Vectors', num_vectors),
+                    avp.AVP('Immediate-Response-Preferred', 0),
+                ],
+            ),
+        ],
+    )
+
+
+def _ulr():
+    return _request(
+        s6a.S6AApplicationCommands.UPDATE_LOCATION, [
+            avp.AVP('RAT-Type', 1004),
+            avp.AVP('ULR-Flags', 34),
+        ],
+    )
+
+
+def _run(name, func, num):
+    start = time.perf_counter()
+    for _ in range(num):
+        func()
+    elapsed = time.perf_counter() - start
+    print('%-16s %10.0f msgs/s' % (name, num / elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        '--num', help='Number of messages to process per test', type=int,
+        default=20000,
+    )
+    parser.add_argument(
+        '--num_vectors', help='Number of vectors requested per AIR',
+        type=int, default=1,
+    )
+    args = parser.parse_args()
+
+    app = s6a.S6AApplication(
+        _Processor(), 'mai.facebook.com', 'hss.mai.facebook.com', '127.0.0.1',
+    )
+    app.set_writer(_Writer())
+    air = _air(args.num_vectors)
+    ulr = _ulr()
+
+    _run('decode AIR', lambda: message.decode(air), args.num)
+    _run('decode ULR', lambda: message.decode(ulr), args.num)
+    _run(
+        'AIR -> AIA',
+        lambda: app.handle_msg(0, message.decode(air)), args.num,
+    )
+    _run(
+        'ULR -> ULA',
+        lambda: app.handle_msg(0, message.decode(ulr)), args.num,
+    )
+
+
+if __name__ == "__main__":
+    main()
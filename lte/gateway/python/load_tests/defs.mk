@@ -14,4 +14,7 @@
 LOAD_TESTS=loadtest_mobilityd.py:allocate \
 loadtest_mobilityd.py:release \
 loadtest_pipelined.py:activate_flows \
-loadtest_pipelined.py:deactivate_flows
+loadtest_pipelined.py:deactivate_flows \
+loadtest_pipelined.py:activate_flows_batch \
+loadtest_pipelined.py:deactivate_flows_batch \
+loadtest_subscriberdb.py:air
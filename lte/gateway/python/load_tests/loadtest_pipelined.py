@@ -22,7 +22,9 @@ from collections import namedtuple
 
 from google.protobuf import json_format
 from lte.protos.pipelined_pb2 import (
+    ActivateFlowsBatchRequest,
     ActivateFlowsRequest,
+    DeactivateFlowsBatchRequest,
     DeactivateFlowsRequest,
     RequestOriginType,
     VersionedPolicy,
@@ -38,90 +40,124 @@ from scripts.pipelined_cli import UEInfo, _gen_ue_set
 PROTO_DIR = 'lte/protos'
 IMPORT_PATH = '/home/vagrant/magma'
 RESULTS_PATH = '/var/tmp'
+REQUEST_FILES = {
+    'ActivateFlows': 'activate_flows.json',
+    'DeactivateFlows': 'deactivate_flows.json',
+    'ActivateFlowsBatch': 'activate_flows_batch.json',
+    'DeactivateFlowsBatch': 'deactivate_flows_batch.json',
+}
 
 
-def _build_activate_flows_data(ue_dict, disable_qos):
-    activate_flow_reqs = []
-
+def _get_apn_ambr(disable_qos):
     if disable_qos:
         print("QOS Disabled")
-        apn_ambr = None
-    else:
-        print("QOS Enabled")
-        apn_ambr = AggregatedMaximumBitrate(
-            max_bandwidth_ul=1000000000,
-            max_bandwidth_dl=1000000000,
-        )
-    for ue in ue_dict:
-        request = ActivateFlowsRequest(
-            sid=SIDUtils.to_pb(ue.imsi_str),
-            ip_addr=ue.ipv4_src,
-            policies=[
-                VersionedPolicy(
-                rule=PolicyRule(
-                    id=ue.rule_id,
-                    priority=10,
-                    flow_list=[
-                        FlowDescription(
-                            match=FlowMatch(
-                            ip_dst=convert_ipv4_str_to_ip_proto(ue.ipv4_src),
-                            direction=FlowMatch.UPLINK,
-                            ),
+        return None
+    print("QOS Enabled")
+    return AggregatedMaximumBitrate(
+        max_bandwidth_ul=1000000000,
+        max_bandwidth_dl=1000000000,
+    )
+
+
+def _get_activate_flows_request(ue, apn_ambr):
+    return ActivateFlowsRequest(
+        sid=SIDUtils.to_pb(ue.imsi_str),
+        ip_addr=ue.ipv4_src,
+        policies=[
+            VersionedPolicy(
+            rule=PolicyRule(
+                id=ue.rule_id,
+                priority=10,
+                flow_list=[
+                    FlowDescription(
+                        match=FlowMatch(
+                        ip_dst=convert_ipv4_str_to_ip_proto(ue.ipv4_src),
+                        direction=FlowMatch.UPLINK,
                         ),
-                        FlowDescription(
-                            match=FlowMatch(
-                            ip_src=convert_ipv4_str_to_ip_proto(ue.ipv4_dst),
-                            direction=FlowMatch.DOWNLINK,
-                            ),
+                    ),
+                    FlowDescription(
+                        match=FlowMatch(
+                        ip_src=convert_ipv4_str_to_ip_proto(ue.ipv4_dst),
+                        direction=FlowMatch.DOWNLINK,
                         ),
-                    ],
-                ),
+                    ),
+                ],
+            ),
+            version=1,
+            ),
+        ],
+        request_origin=RequestOriginType(type=RequestOriginType.GX),
+        apn_ambr=apn_ambr,
+    )
+
+
+def _get_deactivate_flows_request(ue):
+    return DeactivateFlowsRequest(
+        sid=SIDUtils.to_pb(ue.imsi_str),
+        ip_addr=ue.ipv4_src,
+        policies=[
+            VersionedPolicyID(
+                rule_id=ue.rule_id,
                 version=1,
-                ),
-            ],
-            request_origin=RequestOriginType(type=RequestOriginType.GX),
-            apn_ambr=apn_ambr,
-        )
-        request_dict = json_format.MessageToDict(request)
-        # Dumping ActivateFlows request into json
-        activate_flow_reqs.append(request_dict)
-    with open('activate_flows.json', 'w') as file:
-        json.dump(activate_flow_reqs, file, separators=(',', ':'))
+            ),
+        ],
+        request_origin=RequestOriginType(type=RequestOriginType.GX),
+        remove_default_drop_flows=True,
+    )
+
+
+def _dump_requests(requests, file_name):
+    request_dicts = [json_format.MessageToDict(req) for req in requests]
+    with open(file_name, 'w') as file:
+        json.dump(request_dicts, file, separators=(',', ':'))
+
+
+def _build_activate_flows_data(ue_dict, disable_qos):
+    apn_ambr = _get_apn_ambr(disable_qos)
+    requests = [_get_activate_flows_request(ue, apn_ambr) for ue in ue_dict]
+    # Dumping ActivateFlows request into json
+    _dump_requests(requests, REQUEST_FILES['ActivateFlows'])
 
 
 def _build_deactivate_flows_data(ue_dict):
-    deactivate_flow_reqs = []
-
-    for ue in ue_dict:
-        request = DeactivateFlowsRequest(
-            sid=SIDUtils.to_pb(ue.imsi_str),
-            ip_addr=ue.ipv4_src,
-            policies=[
-                VersionedPolicyID(
-                    rule_id=ue.rule_id,
-                    version=1,
-                ),
-            ],
-            request_origin=RequestOriginType(type=RequestOriginType.GX),
-            remove_default_drop_flows=True,
-        )
-        request_dict = json_format.MessageToDict(request)
-        # Dumping ActivateFlows request into json
-        deactivate_flow_reqs.append(request_dict)
-    with open('deactivate_flows.json', 'w') as file:
-        json.dump(deactivate_flow_reqs, file, separators=(',', ':'))
+    requests = [_get_deactivate_flows_request(ue) for ue in ue_dict]
+    # Dumping DeactivateFlows request into json
+    _dump_requests(requests, REQUEST_FILES['DeactivateFlows'])
+
+
+def _build_activate_flows_batch_data(ue_dict, disable_qos, batch_size):
+    apn_ambr = _get_apn_ambr(disable_qos)
+    ues = list(ue_dict)
+    batches = [
+        ActivateFlowsBatchRequest(requests=[
+            _get_activate_flows_request(ue, apn_ambr)
+            for ue in ues[i:i + batch_size]
+        ]) for i in range(0, len(ues), batch_size)
+    ]
+    _dump_requests(batches, REQUEST_FILES['ActivateFlowsBatch'])
+    return len(batches)
+
+
+def _build_deactivate_flows_batch_data(ue_dict, batch_size):
+    ues = list(ue_dict)
+    batches = [
+        DeactivateFlowsBatchRequest(requests=[
+            _get_deactivate_flows_request(ue)
+            for ue in ues[i:i + batch_size]
+        ]) for i in range(0, len(ues), batch_size)
+    ]
+    _dump_requests(batches, REQUEST_FILES['DeactivateFlowsBatch'])
+    return len(batches)
 
 
 # Building gHZ cmd and call subprocess with given params
 def _get_ghz_cmd_params(req_type: str, num_reqs: int):
     req_name = 'magma.lte.Pipelined/%s' % req_type
-    file_name = ''
-    if req_type == 'ActivateFlows':
-        file_name = 'activate_flows.json'
-    elif req_type == 'DeactivateFlows':
-        file_name = 'deactivate_flows.json'
-    else:
-        print('Use valid request type (ActivateFlows/DeactivateFlows)')
+    file_name = REQUEST_FILES.get(req_type)
+    if file_name is None:
+        print(
+            'Use valid request type (%s)' % '/'.join(REQUEST_FILES.keys()),
+        )
         return
     cmd_list = [
         'ghz', '--insecure', '--proto',
@@ -148,10 +184,26 @@ def deactivate_flows_test(args):
     _benchmark_grpc_request(args, 'DeactivateFlows')
 
 
-def _benchmark_grpc_request(args, req_name):
+def activate_flows_batch_test(args):
+    ue_dict = _gen_ue_set(args.num_of_ues)
+    num_reqs = _build_activate_flows_batch_data(
+        ue_dict, args.disable_qos, args.batch_size,
+    )
+    _benchmark_grpc_request(args, 'ActivateFlowsBatch', num_reqs)
+
+
+def deactivate_flows_batch_test(args):
+    ue_dict = _gen_ue_set(args.num_of_ues)
+    num_reqs = _build_deactivate_flows_batch_data(ue_dict, args.batch_size)
+    _benchmark_grpc_request(args, 'DeactivateFlowsBatch', num_reqs)
+
+
+def _benchmark_grpc_request(args, req_name, num_reqs=None):
+    if num_reqs is None:
+        num_reqs = args.num_of_ues
     try:
         # call grpc GHZ load test tool
-        _get_ghz_cmd_params(req_name, args.num_of_ues),
+        _get_ghz_cmd_params(req_name, num_reqs),
     except subprocess.CalledProcessError as e:
         print(e.output)
         print('Check if gRPC GHZ tool is installed')
@@ -174,9 +226,19 @@ def create_parser():
         "deactivate_flows",
         help="DeactivateFlows load test",
     )
+    parser_activate_batch = subparsers.add_parser(
+        "activate_flows_batch",
+        help="ActivateFlowsBatch load test",
+    )
+    parser_deactivate_batch = subparsers.add_parser(
+        "deactivate_flows_batch",
+        help="DeactivateFlowsBatch load test",
+    )
     for subcmd in [
         parser_activate,
         parser_deactivate,
+        parser_activate_batch,
+        parser_deactivate_batch,
     ]:
         subcmd.add_argument(
             '--num_of_ues', help='Number of total UEs to atach',
@@ -186,8 +248,15 @@ def create_parser():
             '--disable_qos', help='If we want to disable QOS',
             action="store_true",
         )
+    for subcmd in [parser_activate_batch, parser_deactivate_batch]:
+        subcmd.add_argument(
+            '--batch_size', help='Number of UEs in each batch request',
+            type=int, default=100,
+        )
     parser_activate.set_defaults(func=activate_flows_test)
     parser_deactivate.set_defaults(func=deactivate_flows_test)
+    parser_activate_batch.set_defaults(func=activate_flows_batch_test)
+    parser_deactivate_batch.set_defaults(func=deactivate_flows_batch_test)
 
     return parser
 
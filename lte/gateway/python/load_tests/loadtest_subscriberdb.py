@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import argparse
+import json
+import os
+import subprocess
+
+from feg.protos.s6a_proxy_pb2 import AuthenticationInformationRequest
+from google.protobuf import json_format
+from lte.protos.subscriberdb_pb2 import (
+    LTESubscription,
+    SubscriberData,
+    SubscriberID,
+)
+from lte.protos.subscriberdb_pb2_grpc import SubscriberDBStub
+from magma.common.service_registry import ServiceRegistry
+from magma.subscriberdb.sid import SIDUtils
+
+PROTO_DIR = 'feg/protos'
+IMPORT_PATH = '/home/vagrant/magma'
+RESULTS_PATH = '/var/tmp'
+AIR_DATA_FILE = 'air_data.json'
+
+# Test key and OPc from the Milenage test sets
+LTE_AUTH_KEY = bytes.fromhex('465B5CE8B199B49FAA5F0A2EE238A6BC')
+LTE_AUTH_OPC = bytes.fromhex('CD63CB71954A9F4E48A5994E37A02BAF')
+VISITED_PLMN = bytes.fromhex('02F859')
+
+
+def _get_subscriberdb_client():
+    return SubscriberDBStub(
+        ServiceRegistry.get_rpc_channel('subscriberdb', ServiceRegistry.LOCAL),
+    )
+
+
+def _load_subs(client, num_subs: int):
+    imsis = []
+    for i in range(1, num_subs + 1):
+        imsi = '001010' + str(i).zfill(9)
+        data = SubscriberData(
+            sid=SubscriberID(id=imsi),
+            lte=LTESubscription(
+                state=LTESubscription.ACTIVE,
+                auth_algo=LTESubscription.MILENAGE,
+                auth_key=LTE_AUTH_KEY,
+                auth_opc=LTE_AUTH_OPC,
+            ),
+        )
+        client.AddSubscriber(data)
+        imsis.append(imsi)
+    return imsis
+
+
+def _cleanup_subs(client, imsis):
+    for imsi in imsis:
+        client.DeleteSubscriber(SIDUtils.to_pb('IMSI%s' % imsi))
+
+
+def _build_air_data(imsis):
+    air_reqs = []
+    for imsi in imsis:
+        air_req = AuthenticationInformationRequest(
+            user_name=imsi,
+            visited_plmn=VISITED_PLMN,
+            num_requested_eutran_vectors=1,
+            immediate_response_preferred=True,
+        )
+        air_reqs.append(json_format.MessageToDict(air_req))
+    # Dumping AIR requests into json
+    with open(AIR_DATA_FILE, 'w') as file:
+        json.dump(air_reqs, file, separators=(',', ':'))
+
+
+def _benchmark_air(num_reqs: int, concurrency: int):
+    ghz_cmds = [
+        'ghz',
+        '--insecure', '--proto', '%s/s6a_proxy.proto' % PROTO_DIR,
+        '-i', IMPORT_PATH, '--total', str(num_reqs),
+        '--concurrency', str(concurrency),
+        '--call', 'magma.feg.S6aProxy/AuthenticationInformation',
+        '-D', AIR_DATA_FILE, '-O', 'json',
+        '-o', '%s/result_AuthenticationInformation.json' % RESULTS_PATH,
+        '0.0.0.0:50051',
+    ]
+    try:
+        print('Launching load test...')
+        # call grpc GHZ load test tool
+        subprocess.call(ghz_cmds)
+    except subprocess.CalledProcessError as e:
+        print(e.output)
+        print('Check if gRPC GHZ tool is installed')
+    finally:
+        os.remove(AIR_DATA_FILE)
+
+
+def air_test(args):
+    """
+    Run Authentication-Information requests over the S6a gRPC interface.
+    Each AIR reads the subscriber and writes back its SQN, so the result
+    reflects the throughput of the subscriber store. Run it against two
+    builds of subscriberdb to compare the store implementations.
+    """
+    client = _get_subscriberdb_client()
+    imsis = _load_subs(client, args.num_of_subs)
+    try:
+        _build_air_data(imsis)
+        _benchmark_air(args.num, args.concurrency)
+    finally:
+        _cleanup_subs(client, imsis)
+
+
+def create_parser():
+    """
+    Creates the argparse parser with all the arguments.
+    """
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # Add subcommands
+    subparsers = parser.add_subparsers(title="subcommands", dest="cmd")
+    parser_air = subparsers.add_parser(
+        "air",
+        help="Authentication-Information load test",
+    )
+    parser_air.add_argument(
+        '--num', help='Number of AIRs to send', type=int, default=20000,
+    )
+    parser_air.add_argument(
+        '--num_of_subs', help='Number of subscribers to authenticate',
+        type=int, default=2000,
+    )
+    parser_air.add_argument(
+        '--concurrency', help='Number of concurrent AIRs',
+        type=int, default=50,
+    )
+    parser_air.set_defaults(func=air_test)
+    return parser
+
+
+def main():
+    parser = create_parser()
+
+    # Parse the args
+    args = parser.parse_args()
+    if not args.cmd:
+        parser.print_usage()
+        exit(1)
+
+    # Execute the subcommand function
+    args.func(args)
+    print('Done')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+FREE IP addresses are not materialized as IP descriptors. Instead, each IP
+block keeps disjoint, inclusive [first, last] ranges of free addresses (as
+integers), indexed in memory by a sorted list of their last addresses.
+
+Every range is written through to its own entry of the backing store,
+keyed by IP block and last address, so that allocating or freeing an
+address is a bisect plus a write of the one or two ranges it splits or
+merges, regardless of the number of free ranges.
+"""
+
+from bisect import bisect_left, insort
+from ipaddress import ip_address, ip_network
+from typing import Dict, Iterable, List, MutableMapping, Optional
+
+from magma.mobilityd.ip_descriptor import IPDesc, IPState, IPType
+
+
+class FreeIpRanges:
+
+    def __init__(self, ranges: MutableMapping[str, List[int]]):
+        """
+
+        Args:
+            ranges: Dictionary the free ranges are written through to. Keys
+                are "<IP block>,<last address>" and values are
+                [first address, IP type of the block]
+        """
+        self._ranges = ranges
+        self._blocks = {}  # type: Dict[str, _BlockRanges]
+        for key, (first, ip_type) in ranges.items():
+            block_key, last = key.rsplit(',', 1)
+            block = self._get_block(ip_network(block_key), IPType(ip_type))
+            block.set(first, int(last))
+
+    def add_range(
+        self, ip_block: ip_network, first: int, last: int,
+        ip_type: IPType = IPType.IP_POOL,
+    ):
+        """ Mark all addresses in [first, last] of ip_block as free """
+        if first > last:
+            return
+        block = self._get_block(ip_block, ip_type)
+        containing = block.find(first)
+        if containing is not None and containing >= last:
+            # already free
+            return
+
+        # Merge with the ranges overlapping or adjacent to [first, last]
+        merged = []
+        idx = bisect_left(block.lasts, first - 1)
+        while idx + len(merged) < len(block.lasts):
+            merged_last = block.lasts[idx + len(merged)]
+            merged_first = block.firsts[merged_last]
+            if merged_first > last + 1:
+                break
+            merged.append(merged_last)
+            first = min(first, merged_first)
+            last = max(last, merged_last)
+        self._write(
+            block, [end for end in merged if end != last], [(first, last)],
+        )
+
+    def add_ips(
+        self, ip_block: ip_network, ips: Iterable[ip_address],
+        ip_type: IPType = IPType.IP_POOL,
+    ):
+        """ Mark a batch of addresses of ip_block as free """
+        for first, last in _to_ranges(int(ip) for ip in ips):
+            self.add_range(ip_block, first, last, ip_type)
+
+    def add_ip(
+        self, ip: ip_address, ip_block: ip_network,
+        ip_type: IPType = IPType.IP_POOL,
+    ):
+        """ Mark a single address of ip_block as free """
+        self.add_range(ip_block, int(ip), int(ip), ip_type)
+
+    def remove_ip(self, ip: ip_address) -> Optional[IPDesc]:
+        """
+        Remove an address from the free ranges.
+
+        Returns: FREE IPDesc of the address, None if it was not free
+        """
+        block = self._find_block(ip)
+        if block is None:
+            return None
+        value = int(ip)
+        last = block.find(value)
+        first = block.firsts[last]
+        if first == last:
+            self._write(block, [last], [])
+        elif value == last:
+            self._write(block, [last], [(first, value - 1)])
+        elif value == first:
+            self._write(block, [], [(value + 1, last)])
+        else:
+            self._write(block, [], [(value + 1, last), (first, value - 1)])
+        return _free_ip_desc(ip, block)
+
+    def pop_ip(self) -> Optional[IPDesc]:
+        """ Pop the lowest free address of the first non-empty block """
+        # Blocks are dropped once empty, so the first one has free addresses
+        block = next(iter(self._blocks.values()), None)
+        if block is None:
+            return None
+        last = block.lasts[0]
+        value = block.firsts[last]
+        if value == last:
+            self._write(block, [last], [])
+        else:
+            self._write(block, [], [(value + 1, last)])
+        return _free_ip_desc(ip_address(value), block)
+
+    def remove_ip_block(self, ip_block: ip_network):
+        """ Drop all free addresses of ip_block """
+        block = self._blocks.get(str(ip_block))
+        if block is not None:
+            self._write(block, list(block.lasts), [])
+
+    def contains(self, ip: ip_address) -> bool:
+        """ check if IP is free """
+        return self._find_block(ip) is not None
+
+    def get_ip_desc(self, ip: ip_address) -> Optional[IPDesc]:
+        """ return the FREE IPDesc of an IP, None if IP is not free """
+        block = self._find_block(ip)
+        return _free_ip_desc(ip, block) if block else None
+
+    def is_empty(self) -> bool:
+        """ True if no address is free """
+        return not self._blocks
+
+    def list_ips(self) -> List[ip_address]:
+        """ return a list of all free IPs """
+        return [
+            ip_address(value)
+            for block in self._blocks.values()
+            for last in block.lasts
+            for value in range(block.firsts[last], last + 1)
+        ]
+
+    def _find_block(self, ip: ip_address) -> Optional['_BlockRanges']:
+        value = int(ip)
+        for block in self._blocks.values():
+            if ip in block.network and block.find(value) is not None:
+                return block
+        return None
+
+    def _get_block(
+        self, ip_block: ip_network,
+        ip_type: IPType,
+    ) -> '_BlockRanges':
+        key = str(ip_block)
+        block = self._blocks.get(key)
+        if block is None:
+            block = _BlockRanges(ip_network(key), ip_type)
+            self._blocks[key] = block
+        return block
+
+    def _write(self, block: '_BlockRanges', removed_lasts, ranges):
+        """
+        Remove the ranges ending at removed_lasts and set the [first, last]
+        ranges of a block, in memory and in the backing store
+        """
+        key = str(block.network)
+        for last in removed_lasts:
+            block.remove(last)
+            del self._ranges[_range_key(key, last)]
+        for first, last in ranges:
+            block.set(first, last)
+        if ranges:
+            self._ranges.update({
+                _range_key(key, last): [first, block.ip_type.value]
+                for first, last in ranges
+            })
+        # Drop blocks without free addresses, so that addresses freed from
+        # single-IP blocks (static, DHCP) do not leave entries behind.
+        if not block.lasts:
+            del self._blocks[key]
+
+    def __str__(self) -> str:
+        ret_str = "{}:".format(self.__class__.__name__)
+        for key, block in self._blocks.items():
+            ret_str = ret_str + "\n{}: {}".format(
+                key,
+                ", ".join(
+                    "{}-{}".format(
+                        ip_address(block.firsts[last]), ip_address(last),
+                    )
+                    for last in block.lasts
+                ),
+            )
+        return ret_str
+
+
+class _BlockRanges:
+    """ Free ranges of an IP block, indexed by their last address """
+
+    def __init__(self, network: ip_network, ip_type: IPType):
+        self.network = network
+        self.ip_type = ip_type
+        self.lasts = []  # type: List[int]
+        self.firsts = {}  # type: Dict[int, int]
+
+    def find(self, value: int) -> Optional[int]:
+        """ Last address of the range containing value, None if none """
+        idx = bisect_left(self.lasts, value)
+        if idx < len(self.lasts) and self.firsts[self.lasts[idx]] <= value:
+            return self.lasts[idx]
+        return None
+
+    def set(self, first: int, last: int):
+        if last not in self.firsts:
+            insort(self.lasts, last)
+        self.firsts[last] = first
+
+    def remove(self, last: int):
+        del self.lasts[bisect_left(self.lasts, last)]
+        del self.firsts[last]
+
+
+def _range_key(block_key: str, last: int) -> str:
+    return '{},{}'.format(block_key, last)
+
+
+def _free_ip_desc(ip: ip_address, block: _BlockRanges) -> IPDesc:
+    return IPDesc(
+        ip=ip, state=IPState.FREE, ip_block=block.network, sid=None,
+        ip_type=block.ip_type,
+    )
+
+
+def _to_ranges(values: Iterable[int]) -> List[List[int]]:
+    """ Sort values and group the consecutive ones into ranges """
+    ranges = []
+    for value in sorted(values):
+        if ranges and ranges[-1][1] + 1 >= value:
+            ranges[-1][1] = max(ranges[-1][1], value)
+        else:
+            ranges.append([value, value])
+    return ranges
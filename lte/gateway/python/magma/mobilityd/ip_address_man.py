@@ -105,7 +105,8 @@ class IPAddressManager:
         and associated structure:
             - self._assigned_ip_blocks: {ip_block}
             - self.ip_state_map: {state=>{ip=>ip_desc}}
-            - self.sid_ips_map: {SID=>[IPDesc]}
+            - self.sid_ips_map: {SID=>[IPDesc]}, with a reverse {IP=>SID}
+              index kept alongside it
 
         The utilized redis_containers store a cache of state in local memory,
         so reads are the same speed as without persistence. For writes, state
@@ -381,10 +382,17 @@ class IPAddressManager:
 
     def get_sid_for_ip(self, requested_ip: ip_address) -> Optional[str]:
         """ If ip is associated with an sid, return the sid, else None """
-        for sid, ip_desc in self._store.sid_ips_map.items():
-            if requested_ip == ip_desc.ip:
-                return sid
-        return None
+        with self._lock:
+            return self._store.sid_ips_map.get_sid(requested_ip)
+
+    def get_sids_for_ips(
+        self, requested_ips: List[ip_address],
+    ) -> List[Optional[str]]:
+        """ Return the sid of each ip, None for unassigned ips """
+        with self._lock:
+            return [
+                self._store.sid_ips_map.get_sid(ip) for ip in requested_ips
+            ]
 
     def is_ip_in_state(self, ip_addr: ip_address, state: IPState):
         """
@@ -25,7 +25,7 @@ from __future__ import (
 import logging
 from copy import deepcopy
 from ipaddress import ip_address, ip_network
-from typing import List
+from typing import List, Tuple
 
 from magma.mobilityd.ip_descriptor import IPDesc, IPState, IPType
 
@@ -66,20 +66,27 @@ class IpAllocatorPool(IPAllocator):
                 raise OverlappedIPBlocksError(ipblock)
 
         self._store.assigned_ip_blocks.add(ipblock)
+        first_host, last_host = _get_host_range(ipblock)
         # TODO(oramadan) t23793559 HACK reserve the GW address for
         #  gtp_br0 iface and test VM
         num_reserved_addresses = 11
-        for ip in ipblock.hosts():
-            state = IPState.RESERVED if num_reserved_addresses > 0 \
-                else IPState.FREE
+        first_free = min(first_host + num_reserved_addresses, last_host + 1)
+        for ip in range(first_host, first_free):
+            ip = ip_address(ip)
             ip_desc = IPDesc(
-                ip=ip, state=state,
+                ip=ip, state=IPState.RESERVED,
                 ip_block=ipblock, sid=None,
                 ip_type=IPType.IP_POOL,
             )
-            self._store.ip_state_map.add_ip_to_state(ip, ip_desc, state)
-            if num_reserved_addresses > 0:
-                num_reserved_addresses -= 1
+            self._store.ip_state_map.add_ip_to_state(
+                ip, ip_desc,
+                IPState.RESERVED,
+            )
+        # FREE IPs are kept as a single range instead of one IPDesc each
+        self._store.ip_state_map.free_ip_ranges.add_range(
+            ipblock,
+            first_free, last_host,
+        )
 
     def remove_ip_blocks(
         self, ipblocks: List[ip_network],
@@ -132,26 +139,26 @@ class IpAllocatorPool(IPAllocator):
             remove_blocks -= allocated_ip_block_set
             del allocated_ip_block_set
 
-        # Remove the associated IP addresses
-        remove_ips = \
-            (ip for block in remove_blocks for ip in block.hosts())
-        for ip in remove_ips:
-            for state in (IPState.FREE, IPState.RELEASED, IPState.REAPED):
-                self._store.ip_state_map.remove_ip_from_state(ip, state)
-            if force:
-                self._store.ip_state_map.remove_ip_from_state(
-                    ip,
-                    IPState.ALLOCATED,
-                )
-            else:
-                assert not self._store.ip_state_map.test_ip_state(
-                    ip,
-                    IPState.ALLOCATED,
-                ), \
-                    "Unexpected ALLOCATED IP %s from a soft IP block " \
-                    "removal "
-
-            # Clean up SID maps
+        # Remove the associated IP addresses. Only the used IPs are
+        # materialized, the FREE ones are dropped with the block's ranges.
+        for block in remove_blocks:
+            self._store.ip_state_map.free_ip_ranges.remove_ip_block(block)
+        for state in (IPState.RELEASED, IPState.REAPED, IPState.ALLOCATED):
+            remove_ips = [
+                ip for ip in self._store.ip_state_map.list_ips(state)
+                if any(ip in block for block in remove_blocks)
+            ]
+            for ip in remove_ips:
+                if state != IPState.ALLOCATED or force:
+                    self._store.ip_state_map.remove_ip_from_state(ip, state)
+                else:
+                    raise AssertionError(
+                        "Unexpected ALLOCATED IP %s from a soft IP block "
+                        "removal " % ip,
+                    )
+
+        # Clean up SID maps
+        if remove_blocks:
             for sid in list(self._store.sid_ips_map):
                 self._store.sid_ips_map.pop(sid)
 
@@ -197,10 +204,10 @@ class IpAllocatorPool(IPAllocator):
             raise IPBlockNotFoundError(ipblock)
 
         res = [
-            ip for ip in ipblock
-            if self._store.ip_state_map.test_ip_state(ip, IPState.ALLOCATED)
+            ip for ip in self._store.ip_state_map.list_ips(IPState.ALLOCATED)
+            if ip in ipblock
         ]
-        return res
+        return sorted(res)
 
     def alloc_ip_address(self, sid: str, vlan: int) -> IPDesc:
         """ Allocate an IP address from the free list
@@ -230,4 +237,19 @@ class IpAllocatorPool(IPAllocator):
             raise NoAvailableIPError("No available IP addresses")
 
     def release_ip(self, ip_desc: IPDesc):
+        """
+        Nothing to do, the IP went back to the free ranges when it was
+        marked FREE in the IP state map
+        """
         pass
+
+
+def _get_host_range(ipblock: ip_network) -> Tuple[int, int]:
+    """ Return the first and last host address of ipblock as integers """
+    first = int(ipblock.network_address)
+    last = int(ipblock.broadcast_address)
+    if ipblock.num_addresses > 2:
+        # skip the network and broadcast addresses
+        first += 1
+        last -= 1
+    return first, last
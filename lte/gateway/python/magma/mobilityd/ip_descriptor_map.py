@@ -30,6 +30,9 @@ during it's life cycle in the IP allocator:
         REAPED state, and at the same time a timer is set. All REAPED state
         IPs are freed once the time goes off. The purpose of this state is
         to age IPs for a certain period of time before freeing.
+
+When constructed with FreeIpRanges, FREE IPs are not kept as IP descriptors
+but as compact ranges per IP block, see free_ip_ranges.py.
 """
 
 from __future__ import (
@@ -42,20 +45,30 @@ from __future__ import (
 from ipaddress import ip_address, ip_network
 from typing import Dict, List, MutableMapping, Optional, Set
 
-from magma.mobilityd.ip_descriptor import IPDesc, IPState
+from magma.mobilityd.free_ip_ranges import FreeIpRanges
+from magma.mobilityd.ip_descriptor import IPDesc, IPState, IPType
 
 DEFAULT_IP_RECYCLE_INTERVAL = 15
 
 
 class IpDescriptorMap:
 
-    def __init__(self, ip_states: MutableMapping[IPState, Dict[str, IPDesc]]):
+    def __init__(
+        self, ip_states: MutableMapping[IPState, Dict[str, IPDesc]],
+        free_ip_ranges: Optional[FreeIpRanges] = None,
+    ):
         """
 
         Args:
             ip_states: Dictionary containing IPDesc keyed by current state
+            free_ip_ranges: if set, FREE IPs are tracked as ranges instead
+                of IPDesc entries in ip_states
         """
         self.ip_states = ip_states
+        self.free_ip_ranges = free_ip_ranges
+
+    def _is_free_state_implicit(self, state: IPState) -> bool:
+        return state == IPState.FREE and self.free_ip_ranges is not None
 
     def add_ip_to_state(
         self, ip: ip_address, ip_desc: IPDesc,
@@ -67,12 +80,20 @@ class IpDescriptorMap:
             % (ip_desc.state, state)
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            ip_block = ip_desc.ip_block or ip_network(ip)
+            self.free_ip_ranges.add_ip(
+                ip, ip_block, ip_desc.type or IPType.IP_POOL,
+            )
+            return
         self.ip_states[state][ip.exploded] = ip_desc
 
     def remove_ip_from_state(self, ip: ip_address, state: IPState) -> IPDesc:
         """ Remove an IP from a internal dict """
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            return self.free_ip_ranges.remove_ip(ip)
         ip_desc = self.ip_states[state].pop(ip.exploded, None)
         return ip_desc
 
@@ -80,6 +101,8 @@ class IpDescriptorMap:
         """ Pop an IP from a internal dict """
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            return self.free_ip_ranges.pop_ip()
         try:
             _, ip_desc = self.ip_states[state].popitem()
             return ip_desc
@@ -95,17 +118,23 @@ class IpDescriptorMap:
         """
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            return self.free_ip_ranges.is_empty()
         return bool(self.ip_states[state]) == False
 
     def test_ip_state(self, ip: ip_address, state: IPState) -> bool:
         """ check if IP is in state X """
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            return self.free_ip_ranges.contains(ip)
         return ip.exploded in self.ip_states[state]
 
     def get_ip_state(self, ip: ip_address) -> IPState:
         """ return the state of an IP """
-        for state in IPState:
+        # Check the materialized states first, FREE may be the costly one
+        states = sorted(IPState, key=lambda state: state == IPState.FREE)
+        for state in states:
             if self.test_ip_state(ip, state):
                 return state
         raise AssertionError("IP %s not found in any states" % ip)
@@ -114,6 +143,8 @@ class IpDescriptorMap:
         """ return a list of IPs in state X """
         assert state in IPState, "unknown state %s" % state
 
+        if self._is_free_state_implicit(state):
+            return self.free_ip_ranges.list_ips()
         return [ip_address(ip) for ip in self.ip_states[state]]
 
     def mark_ip_state(self, ip: ip_address, state: IPState) -> IPDesc:
@@ -121,7 +152,10 @@ class IpDescriptorMap:
         assert state in IPState, "unknown state %s" % state
 
         old_state = self.get_ip_state(ip)
-        ip_desc = self.ip_states[old_state][ip.exploded]
+        if self._is_free_state_implicit(old_state):
+            ip_desc = self.free_ip_ranges.get_ip_desc(ip)
+        else:
+            ip_desc = self.ip_states[old_state][ip.exploded]
 
         # some internal checks
         assert ip_desc.state != state, \
@@ -151,6 +185,9 @@ class IpDescriptorMap:
         ret_str = "{}:".format(self.__class__.__name__)
         for state in IPState:
             ret_str = ret_str + "\n{}".format(state)
+            if self._is_free_state_implicit(state):
+                ret_str = ret_str + "\n{}".format(str(self.free_ip_ranges))
+                continue
             for _ip, ip_desc in self.ip_states[state].items():
                 ret_str = ret_str + "\n{}".format(str(ip_desc))
         return ret_str
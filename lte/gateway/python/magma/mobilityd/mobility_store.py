@@ -10,7 +10,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import logging
 from collections import defaultdict
+from ipaddress import ip_address
+from typing import Iterator, MutableMapping, Optional
 
 import redis
 from lte.protos.mobilityd_pb2 import GWInfo
@@ -22,13 +25,16 @@ from magma.common.redis.serializers import (
     get_json_serializer,
 )
 from magma.mobilityd import serialize_utils
-from magma.mobilityd.ip_descriptor import IPDesc
+from magma.mobilityd.free_ip_ranges import FreeIpRanges
+from magma.mobilityd.ip_descriptor import IPDesc, IPState, IPType
 from magma.mobilityd.ip_descriptor_map import IpDescriptorMap
 from magma.mobilityd.uplink_gw import UplinkGatewayInfo
 
 IPDESC_REDIS_TYPE = "mobilityd_ipdesc_record"
 IPSTATES_REDIS_TYPE = "mobilityd:ip_states:{}"
 IPBLOCKS_REDIS_TYPE = "mobilityd:assigned_ip_blocks"
+FREE_IP_RANGES_REDIS_TYPE = "mobilityd:free_ip_ranges"
+IP_TO_SID_REDIS_TYPE = "mobilityd:ip_to_sid"
 MAC_TO_IP_REDIS_TYPE = "mobilityd_mac_to_ip"
 DHCP_GW_INFO_REDIS_TYPE = "mobilityd_gw_info"
 ALLOCATED_IID_REDIS_TYPE = "mobilityd_allocated_iid"
@@ -47,10 +53,16 @@ class MobilityStore(object):
         redis_port: int,
     ):
         if not persist_to_redis:
-            self.ip_state_map = IpDescriptorMap(defaultdict(dict))
+            self.ip_state_map = IpDescriptorMap(
+                defaultdict(dict),
+                FreeIpRanges({}),
+            )
             self.ipv6_state_map = IpDescriptorMap(defaultdict(dict))
             self.assigned_ip_blocks = set()  # {ip_block}
-            self.sid_ips_map = defaultdict(IPDesc)  # {SID=>IPDesc}
+            self.sid_ips_map = SidIpsMap(  # {SID=>IPDesc}
+                defaultdict(IPDesc),
+                {},
+            )
             self.dhcp_gw_info = UplinkGatewayInfo(defaultdict(GWInfo))
             self.dhcp_store = {}  # mac => DHCP_State
             self.allocated_iid = {}  # {ipv6 interface identifiers}
@@ -62,12 +74,17 @@ class MobilityStore(object):
                 )
             self.ip_state_map = IpDescriptorMap(
                 defaultdict_key(lambda key: ip_states(client, key)),
+                FreeIpRanges(FreeIpRangesDict(client)),
             )
+            migrate_free_ip_states(client, self.ip_state_map)
             self.ipv6_state_map = IpDescriptorMap(
                 defaultdict_key(lambda key: ip_states(client, key)),
             )
             self.assigned_ip_blocks = AssignedIpBlocksSet(client)
-            self.sid_ips_map = IPDescDict(client)
+            self.sid_ips_map = SidIpsMap(
+                IPDescDict(client),
+                IPToSidDict(client),
+            )
             self.dhcp_gw_info = UplinkGatewayInfo(GatewayInfoMap())
             self.dhcp_store = MacToIP()  # mac => DHCP_State
             self.allocated_iid = AllocatedIID()
@@ -94,6 +111,132 @@ class IPDescDict(RedisFlatDict):
         super().__init__(client, serde, writethrough=True)
 
 
+class IPToSidDict(RedisHashDict):
+    """
+    Reverse IP => SID index of IPDescDict
+    """
+
+    def __init__(self, client):
+        super().__init__(
+            client,
+            IP_TO_SID_REDIS_TYPE,
+            get_json_serializer(),
+            get_json_deserializer(),
+        )
+
+
+class SidIpsMap(MutableMapping):
+    """
+    SID => IPDesc map which keeps a reverse IP => SID index up to date, so
+    that looking up the SID of an IP does not need to scan all SIDs.
+
+    Like the other store containers this is not thread safe, callers hold
+    the IP address manager lock.
+    """
+
+    def __init__(
+        self, sid_ips: MutableMapping[str, IPDesc],
+        ip_sid: MutableMapping[str, str],
+    ):
+        self._sid_ips = sid_ips
+        self._ip_sid = ip_sid
+        # SIDs without an IP are not indexed
+        num_ips = sum(
+            1 for ip_desc in self._sid_ips.values() if ip_desc.ip is not None
+        )
+        if len(self._ip_sid) != num_ips:
+            # Index is missing (e.g. state written by an older version) or
+            # out of sync, rebuild it from the forward map.
+            self._rebuild_index()
+
+    def get_sid(self, ip: ip_address) -> Optional[str]:
+        """ Return the SID an IP is assigned to, None if unassigned """
+        return self._ip_sid.get(ip.exploded)
+
+    def __getitem__(self, sid: str) -> IPDesc:
+        return self._sid_ips[sid]
+
+    def get(self, sid: str, default=None) -> Optional[IPDesc]:
+        # Read the forward map directly, MutableMapping.get goes through
+        # __getitem__ which inserts an empty IPDesc into a defaultdict.
+        return self._sid_ips.get(sid, default)
+
+    def __setitem__(self, sid: str, ip_desc: IPDesc):
+        old_ip_desc = self._sid_ips.get(sid)
+        if old_ip_desc is not None:
+            self._remove_from_index(sid, old_ip_desc)
+        self._sid_ips[sid] = ip_desc
+        if ip_desc.ip is not None:
+            self._ip_sid[ip_desc.ip.exploded] = sid
+
+    def __delitem__(self, sid: str):
+        ip_desc = self._sid_ips[sid]
+        del self._sid_ips[sid]
+        self._remove_from_index(sid, ip_desc)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sid_ips)
+
+    def __len__(self) -> int:
+        return len(self._sid_ips)
+
+    def __contains__(self, sid) -> bool:
+        return sid in self._sid_ips
+
+    def items(self):
+        return self._sid_ips.items()
+
+    def _remove_from_index(self, sid: str, ip_desc: IPDesc):
+        if ip_desc.ip is None:
+            return
+        key = ip_desc.ip.exploded
+        if self._ip_sid.get(key) == sid:
+            del self._ip_sid[key]
+
+    def _rebuild_index(self):
+        self._ip_sid.clear()
+        for sid, ip_desc in self._sid_ips.items():
+            if ip_desc.ip is not None:
+                self._ip_sid[ip_desc.ip.exploded] = sid
+        logging.info("Rebuilt IP to SID index with %d IPs", len(self._ip_sid))
+
+
+class FreeIpRangesDict(RedisHashDict):
+    """
+    Free IP ranges of the IPv4 pool, one field per range keyed by its IP
+    block and last address
+    """
+
+    def __init__(self, client):
+        super().__init__(
+            client,
+            FREE_IP_RANGES_REDIS_TYPE,
+            get_json_serializer(),
+            get_json_deserializer(),
+        )
+
+
+def migrate_free_ip_states(client, ip_state_map: IpDescriptorMap):
+    """
+    Older versions stored every FREE IP as an IPDesc in its own Redis hash.
+    Fold them into the free ranges and drop the legacy hash.
+    """
+    legacy_free_ips = ip_states(client, IPState.FREE)
+    if not legacy_free_ips:
+        return
+    ips_by_block = defaultdict(list)
+    for ip_desc in legacy_free_ips.values():
+        ip_type = ip_desc.type or IPType.IP_POOL
+        ips_by_block[(ip_desc.ip_block, ip_type)].append(ip_desc.ip)
+    for (ip_block, ip_type), ips in ips_by_block.items():
+        ip_state_map.free_ip_ranges.add_ips(ip_block, ips, ip_type)
+    logging.info(
+        "Migrated %d FREE IPs of %d IP blocks to free IP ranges",
+        len(legacy_free_ips), len(ips_by_block),
+    )
+    legacy_free_ips.clear()
+
+
 def ip_states(client, key):
     """ Get Redis view of IP states. """
     redis_dict = RedisHashDict(
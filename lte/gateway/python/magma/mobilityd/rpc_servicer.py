@@ -329,6 +329,25 @@ class MobilityServiceRpcServicer(MobilityServiceServicer):
         self._print_grpc(resp)
         return resp
 
+    def GetSubscriberIDsFromIPs(self, request, context):
+        """ Get the subscriber IDs of a list of IPs """
+        logging.debug("Received GetSubscriberIDsFromIPs")
+        self._print_grpc(request)
+
+        resp = SubscriberIPTable()
+
+        ips = [ipaddress.ip_address(ip.address) for ip in request.ip_list]
+        sids = self._ip_address_man.get_sids_for_ips(ips)
+        for ip_msg, composite_sid in zip(request.ip_list, sids):
+            if composite_sid is None:
+                continue
+            # handle composite sid to sid and apn mapping
+            sid, _, apn_part = composite_sid.partition('.')
+            apn, _, _ = apn_part.partition(',')
+            resp.entries.add(sid=SIDUtils.to_pb(sid), ip=ip_msg, apn=apn)
+        self._print_grpc(resp)
+        return resp
+
     def GetSubscriberIPTable(self, void, context):
         """ Get the full subscriber table """
         logging.debug("Received GetSubscriberIPTable")
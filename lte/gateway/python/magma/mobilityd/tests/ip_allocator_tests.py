@@ -33,6 +33,7 @@ from magma.mobilityd.ip_allocator_pool import (
     IPBlockNotFoundError,
     NoAvailableIPError,
 )
+from magma.mobilityd.ip_descriptor import IPState
 from magma.mobilityd.ipv6_allocator_pool import IPv6AllocatorPool
 from magma.mobilityd.mobility_store import MobilityStore
 
@@ -53,6 +54,7 @@ class IPAllocatorTests(unittest.TestCase):
         """
         store = MobilityStore(get_default_client(), False, 3980)
         store.dhcp_gw_info.read_default_gw()
+        self._store = store
         ip_allocator = IpAllocatorPool(store)
         ipv6_allocator = IPv6AllocatorPool(
             store,
@@ -93,6 +95,32 @@ class IPAllocatorTests(unittest.TestCase):
         with self.assertRaises(IPBlockNotFoundError):
             self._allocator.list_allocated_ips(block)
 
+    def test_free_ips_not_materialized(self):
+        """ test FREE IPs of a large block are kept as ranges """
+        block = ipaddress.ip_network('10.0.0.0/16')
+        self._allocator.add_ip_block(block)
+        ip_state_map = self._store.ip_state_map
+        self.assertFalse(ip_state_map.ip_states[IPState.FREE])
+        self.assertTrue(
+            ip_state_map.test_ip_state(
+                ipaddress.ip_address('10.0.255.254'), IPState.FREE,
+            ),
+        )
+        self.assertTrue(
+            ip_state_map.test_ip_state(
+                ipaddress.ip_address('10.0.0.1'), IPState.RESERVED,
+            ),
+        )
+        self.assertEqual(
+            [block],
+            self._allocator.remove_ip_blocks(block, force=False),
+        )
+        self.assertFalse(
+            ip_state_map.test_ip_state(
+                ipaddress.ip_address('10.0.255.254'), IPState.FREE,
+            ),
+        )
+
     def test_alloc_ip_address(self):
         """ test alloc_ip_address """
         ip0, _ = self._allocator.alloc_ip_address('SID0')
@@ -174,6 +202,14 @@ class IPAllocatorTests(unittest.TestCase):
         """ Getting ip for non existent subscriber should return None """
         self.assertIsNone(self._allocator.get_ip_for_sid('SID0'))
 
+    def test_alloc_after_get_ip_for_unknown_subscriber(self):
+        """ Looking up an unknown subscriber shouldn't break allocation """
+        self.assertIsNone(self._allocator.get_ip_for_sid('SID0'))
+        self.assertNotIn('SID0', self._store.sid_ips_map)
+
+        ip0, _ = self._allocator.alloc_ip_address('SID0')
+        self.assertEqual(self._allocator.get_ip_for_sid('SID0'), ip0)
+
     def test_get_sid_for_ip(self):
         """ test get_sid_for_ip """
         ip0, _ = self._allocator.alloc_ip_address('SID0')
@@ -185,6 +221,24 @@ class IPAllocatorTests(unittest.TestCase):
         self.assertEqual('SID0', sid0_returned)
         self.assertEqual('SID1', sid1_returned)
 
+    def test_get_sids_for_ips(self):
+        """ test get_sids_for_ips after allocate and release """
+        self._new_ip_allocator(0)  # Immediately recycle
+        ip0, _ = self._allocator.alloc_ip_address('SID0')
+        ip1, _ = self._allocator.alloc_ip_address('SID1')
+        unknown_ip = ipaddress.ip_address('1.1.1.1')
+
+        self.assertEqual(
+            ['SID0', 'SID1', None],
+            self._allocator.get_sids_for_ips([ip0, ip1, unknown_ip]),
+        )
+
+        self._allocator.release_ip_address('SID0', ip0)
+        self.assertEqual(
+            [None, 'SID1'],
+            self._allocator.get_sids_for_ips([ip0, ip1]),
+        )
+
     def test_get_sid_for_unknown_ip(self):
         """ Getting sid for non allocated ip address should return None """
         self.assertIsNone(
@@ -29,6 +29,7 @@ from lte.protos.mobilityd_pb2 import (
     ReleaseIPRequest,
     RemoveIPBlockRequest,
     RemoveIPBlockResponse,
+    SubscriberIDsFromIPsRequest,
     SubscriberIPTableEntry,
 )
 from lte.protos.mobilityd_pb2_grpc import MobilityServiceStub
@@ -524,6 +525,31 @@ class RpcTests(unittest.TestCase):
             grpc.StatusCode.NOT_FOUND,
         )
 
+    def test_get_subscriber_ids_from_ips(self):
+        """ test GetSubscriberIDsFromIPs """
+        self._stub.AddIPBlock(self._block_msg)
+        alloc_request0 = AllocateIPRequest(
+            sid=self._sid0,
+            version=AllocateIPRequest.IPV4,
+            apn=self._apn0,
+        )
+        ip_msg0 = self._stub.AllocateIPAddress(alloc_request0)
+        unknown_ip = IPAddress(
+            version=IPAddress.IPV4,
+            address=ipaddress.ip_address('1.1.1.1').packed,
+        )
+        request = SubscriberIDsFromIPsRequest(
+            ip_list=[ip_msg0.ip_list[0], unknown_ip],
+        )
+
+        resp = self._stub.GetSubscriberIDsFromIPs(request)
+        expect = SubscriberIPTableEntry(
+            sid=self._sid0,
+            ip=ip_msg0.ip_list[0],
+            apn=self._apn0,
+        )
+        self.assertEqual(list(resp.entries), [expect])
+
     def test_get_subscriber_ip_table(self):
         """ test GetSubscriberIPTable """
         self._stub.AddIPBlock(self._block_msg)
@@ -0,0 +1,148 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import ipaddress
+import unittest
+from unittest import mock
+
+from magma.mobilityd.free_ip_ranges import FreeIpRanges
+from magma.mobilityd.ip_descriptor import IPState, IPType
+
+
+class FreeIpRangesTests(unittest.TestCase):
+    """
+    Test class for the free IP ranges of the IP pool
+    """
+
+    def setUp(self):
+        self._ranges = {}
+        self._free_ips = FreeIpRanges(self._ranges)
+        self._block = ipaddress.ip_network('10.0.0.0/24')
+        self._free_ips.add_range(
+            self._block,
+            int(ipaddress.ip_address('10.0.0.10')),
+            int(ipaddress.ip_address('10.0.0.20')),
+        )
+
+    def test_add_range_is_single_entry(self):
+        """ test adding a block stores one range """
+        self.assertEqual(
+            self._ranges,
+            {'10.0.0.0/24,167772180': [167772170, IPType.IP_POOL.value]},
+        )
+        self.assertEqual(len(self._free_ips.list_ips()), 11)
+
+    def test_pop_lowest_ip(self):
+        """ test IPs are popped in ascending order """
+        ip_desc0 = self._free_ips.pop_ip()
+        ip_desc1 = self._free_ips.pop_ip()
+        self.assertEqual(ip_desc0.ip, ipaddress.ip_address('10.0.0.10'))
+        self.assertEqual(ip_desc1.ip, ipaddress.ip_address('10.0.0.11'))
+        self.assertEqual(ip_desc0.ip_block, self._block)
+        self.assertEqual(ip_desc0.state, IPState.FREE)
+        self.assertFalse(self._free_ips.contains(ip_desc0.ip))
+
+    def test_remove_and_add_ip(self):
+        """ test removing an IP splits the range and adding merges it """
+        ip = ipaddress.ip_address('10.0.0.15')
+        self.assertEqual(self._free_ips.remove_ip(ip).ip_block, self._block)
+        self.assertEqual(len(self._ranges), 2)
+        self.assertFalse(self._free_ips.contains(ip))
+        self.assertIsNone(self._free_ips.remove_ip(ip))
+
+        self._free_ips.add_ip(ip, self._block)
+        self.assertEqual(len(self._ranges), 1)
+        self.assertTrue(self._free_ips.contains(ip))
+
+    def test_writes_touch_changed_ranges(self):
+        """ test allocating and freeing only write the ranges they change """
+        for value in range(30, 250, 2):
+            self._free_ips.add_ip(
+                ipaddress.ip_address('10.0.0.{}'.format(value)), self._block,
+            )
+        ranges = mock.MagicMock(wraps=self._ranges)
+        self._free_ips._ranges = ranges
+
+        self._free_ips.pop_ip()
+        self.assertEqual(ranges.update.call_count, 1)
+        self.assertEqual(len(ranges.update.call_args[0][0]), 1)
+        ranges.__delitem__.assert_not_called()
+
+        ranges.reset_mock()
+        self._free_ips.remove_ip(ipaddress.ip_address('10.0.0.15'))
+        self.assertEqual(len(ranges.update.call_args[0][0]), 2)
+        ranges.__delitem__.assert_not_called()
+
+        ranges.reset_mock()
+        self._free_ips.add_ip(ipaddress.ip_address('10.0.0.31'), self._block)
+        self.assertEqual(len(ranges.update.call_args[0][0]), 1)
+        self.assertEqual(ranges.__delitem__.call_count, 1)
+        ranges.items.assert_not_called()
+        ranges.keys.assert_not_called()
+
+    def test_ip_type_kept(self):
+        """ test IPs freed from a static block keep their IP type """
+        ip = ipaddress.ip_address('192.168.0.1')
+        self._free_ips.add_ip(ip, ipaddress.ip_network(ip), IPType.STATIC)
+        self.assertEqual(self._free_ips.get_ip_desc(ip).type, IPType.STATIC)
+        self.assertEqual(self._free_ips.pop_ip().type, IPType.IP_POOL)
+        self.assertEqual(self._free_ips.remove_ip(ip).type, IPType.STATIC)
+        self.assertFalse(self._free_ips.contains(ip))
+
+    def test_load_from_store(self):
+        """ test ranges are reloaded from the backing store """
+        self._free_ips.remove_ip(ipaddress.ip_address('10.0.0.15'))
+        ip = ipaddress.ip_address('192.168.0.1')
+        self._free_ips.add_ip(ip, ipaddress.ip_network(ip), IPType.DHCP)
+
+        free_ips = FreeIpRanges(dict(self._ranges))
+        self.assertEqual(free_ips.list_ips(), self._free_ips.list_ips())
+        self.assertEqual(free_ips.get_ip_desc(ip).type, IPType.DHCP)
+        self.assertFalse(
+            free_ips.contains(ipaddress.ip_address('10.0.0.15')),
+        )
+
+    def test_pop_from_empty(self):
+        """ test popping after all IPs are taken """
+        for _ in range(11):
+            self.assertIsNotNone(self._free_ips.pop_ip())
+        self.assertIsNone(self._free_ips.pop_ip())
+        self.assertTrue(self._free_ips.is_empty())
+
+    def test_add_ips(self):
+        """ test batch add merges adjacent IPs """
+        ips = [
+            ipaddress.ip_address('10.0.0.21'),
+            ipaddress.ip_address('10.0.0.22'),
+            ipaddress.ip_address('10.0.0.30'),
+        ]
+        self._free_ips.add_ips(self._block, ips)
+        self.assertEqual(
+            self._ranges,
+            {
+                '10.0.0.0/24,167772182': [167772170, IPType.IP_POOL.value],
+                '10.0.0.0/24,167772190': [167772190, IPType.IP_POOL.value],
+            },
+        )
+
+    def test_remove_ip_block(self):
+        """ test removing a block drops its ranges """
+        self._free_ips.remove_ip_block(self._block)
+        self.assertTrue(self._free_ips.is_empty())
+        self.assertFalse(
+            self._free_ips.contains(ipaddress.ip_address('10.0.0.10')),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
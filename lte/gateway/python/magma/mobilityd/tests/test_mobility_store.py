@@ -0,0 +1,61 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import ipaddress
+import unittest
+from unittest import mock
+
+from magma.mobilityd.ip_descriptor import IPDesc
+from magma.mobilityd.mobility_store import SidIpsMap
+
+
+class SidIpsMapTests(unittest.TestCase):
+    """
+    Test class for the IP to SID index of the SID map
+    """
+
+    def setUp(self):
+        self._ip = ipaddress.ip_address('10.0.0.1')
+        self._sid_ips = {
+            'SID0': IPDesc(ip=self._ip, sid='SID0'),
+            'SID1': IPDesc(sid='SID1'),
+        }
+        self._ip_sid = {}
+
+    def test_index_rebuilt_when_missing(self):
+        """ test a missing index is rebuilt from the SID map """
+        sid_ips_map = SidIpsMap(self._sid_ips, self._ip_sid)
+        self.assertEqual(self._ip_sid, {'10.0.0.1': 'SID0'})
+        self.assertEqual(sid_ips_map.get_sid(self._ip), 'SID0')
+
+    def test_index_not_rebuilt_when_in_sync(self):
+        """ test SIDs without an IP don't trigger a rebuild """
+        self._ip_sid['10.0.0.1'] = 'SID0'
+        with mock.patch.object(SidIpsMap, '_rebuild_index') as rebuild:
+            SidIpsMap(self._sid_ips, self._ip_sid)
+            rebuild.assert_not_called()
+
+    def test_index_updates(self):
+        """ test the index follows updates of the SID map """
+        sid_ips_map = SidIpsMap(self._sid_ips, self._ip_sid)
+        ip1 = ipaddress.ip_address('10.0.0.2')
+        sid_ips_map['SID1'] = IPDesc(ip=ip1, sid='SID1')
+        self.assertEqual(sid_ips_map.get_sid(ip1), 'SID1')
+
+        del sid_ips_map['SID0']
+        self.assertIsNone(sid_ips_map.get_sid(self._ip))
+        self.assertEqual(self._ip_sid, {'10.0.0.2': 'SID1'})
+
+
+if __name__ == "__main__":
+    unittest.main()
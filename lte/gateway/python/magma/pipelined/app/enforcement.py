@@ -194,19 +194,10 @@ class EnforcementController(PolicyMixin, RestartMixin, MagmaController):
             ip_addr (string): subscriber session ipv4 address
             rule (PolicyRule): policy rule proto
         """
-        if rule.redirect.support == rule.redirect.ENABLED:
-            return self._install_redirect_flow(imsi, ip_addr, rule, version)
-
-        if not rule.flow_list:
-            self.logger.error('The flow list for imsi %s, rule.id - %s'
-                              'is empty, this shoudn\'t happen', imsi, rule.id)
-            return RuleModResult.FAILURE
-
-        flow_adds = []
-        try:
-            flow_adds = self._get_rule_match_flow_msgs(imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
-        except FlowMatchError:
-            return RuleModResult.FAILURE
+        flow_adds, res = self._get_rule_install_msgs(
+            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
+        if res is not None:
+            return res
 
         try:
             chan = self._msg_hub.send(flow_adds, self._datapath)
@@ -216,6 +207,20 @@ class EnforcementController(PolicyMixin, RestartMixin, MagmaController):
             return RuleModResult.FAILURE
         return self._wait_for_rule_responses(imsi, ip_addr, rule, chan)
 
+    def _get_rule_install_msgs(self, imsi, msisdn: bytes, uplink_tunnel: int,
+                               ip_addr, apn_ambr, rule, version):
+        if rule.redirect.support == rule.redirect.ENABLED:
+            return [], self._install_redirect_flow(imsi, ip_addr, rule,
+                                                   version)
+
+        if not rule.flow_list:
+            self.logger.error('The flow list for imsi %s, rule.id - %s'
+                              'is empty, this shoudn\'t happen', imsi, rule.id)
+            return [], RuleModResult.FAILURE
+
+        return super(EnforcementController, self)._get_rule_install_msgs(
+            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
+
     def _install_redirect_flow(self, imsi, ip_addr, rule, version):
         rule_num = self._rule_mapper.get_or_create_rule_num(rule.id)
         priority = Utils.get_of_priority(rule.priority)
@@ -243,6 +248,9 @@ class EnforcementController(PolicyMixin, RestartMixin, MagmaController):
     def _install_default_flow_for_subscriber(self, *_):
         pass
 
+    def _handle_rule_install_failure(self, imsi, ip_addr, rule_id):
+        self._deactivate_flow_for_rule(imsi, ip_addr, rule_id)
+
     def _deactivate_flow_for_rule(self, imsi, ip_addr, rule_id):
         """
         Deactivate a specific rule using the flow cookie for a subscriber
@@ -13,6 +13,7 @@ limitations under the License.
 import os
 from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
 
 from lte.protos.pipelined_pb2 import RuleModResult
 from lte.protos.policydb_pb2 import FlowDescription
@@ -45,6 +46,31 @@ from ryu.app.ofctl.exception import (InvalidDatapath, OFError, UnexpectedMultiRe
 
 ETH_FRAME_SIZE_BYTES = 14
 
+# (cookie, priority, imsi reg, direction, rule version, policy type, ue ip)
+FlowKey = Tuple[int, int, Optional[int], Optional[int], Optional[int],
+                Optional[int], Optional[str]]
+
+
+class _FlowStatEntry:
+    """
+    Cached state of a single stats flow: the rule record it contributes to,
+    and the counters seen for it in the last poll.
+
+    record_key is None for flows whose stats are never reported (pass
+    through app flows, flows without an IMSI), so they are decoded only once.
+    """
+    __slots__ = ('record_key', 'is_downlink', 'process_stats', 'byte_count',
+                 'packet_count', 'usage', 'cycle')
+
+    def __init__(self, record_key, is_downlink, process_stats):
+        self.record_key = record_key
+        self.is_downlink = is_downlink
+        self.process_stats = process_stats
+        self.byte_count = 0
+        self.packet_count = 0
+        self.usage = 0
+        self.cycle = 0
+
 
 class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
     """
@@ -81,8 +107,25 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
         # Create a rpc channel to sessiond
         self.sessiond = kwargs['rpc_stubs']['sessiond']
         self._msg_hub = MessageHub(self.logger)
-        self.unhandled_stats_msgs = []  # Store multi-part responses from ovs
-        self.total_usage = {}  # Store total usage
+        # Rule records aggregated from the flow index, keyed on
+        # 'sid|rule_id|ip|version'. Records are kept across polls and only
+        # the counters of flows that changed are updated.
+        self._rule_records = {}  # type: Dict[str, RuleRecord]
+        self._rule_record_flows = defaultdict(int)  # type: Dict[str, int]
+        self._flow_index = {}  # type: Dict[FlowKey, _FlowStatEntry]
+        # Multi-part stats replies are processed as they arrive, the poll
+        # cycle is finished on the last part
+        self._stats_cycle = 0
+        self._stats_cycle_stats = 0
+        self._stats_cycle_flows = 0
+        self._stats_cycle_failed = False
+        self._stats_cycle_started = False
+        # Delta reporting state: records changed since the last report and
+        # tombstones of records whose flows ended
+        self._dirty_records = set()
+        self._ended_records = {}  # type: Dict[str, RuleRecord]
+        self._force_full_report = True
+        self._last_full_report = datetime.now()
         self._clean_restart = kwargs['config']['clean_restart']
         self._redis_enabled = kwargs['config'].get('redis_enabled', False)
         self._unmatched_bytes = 0  # Store bytes matched by default rule if any
@@ -94,6 +137,10 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
         self._last_report_timestamp = datetime.now()
         self._bridge_name = kwargs['config']['bridge_name']
         self._periodic_stats_reporting = kwargs['config']['enforcement'].get('periodic_stats_reporting', True)
+        self._delta_stats_reporting = \
+            kwargs['config']['enforcement'].get('delta_stats_reporting', False)
+        self._full_stats_report_interval = \
+            kwargs['config']['enforcement'].get('full_stats_report_interval', 60)
         if self._print_grpc_payload is None:
             self._print_grpc_payload = \
                 kwargs['config'].get('magma_print_grpc_payload', False)
@@ -106,8 +153,16 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
         When we remove/reinsert flows we need to remove old usage maps as new
         flows will have reset stat counters
         """
-        self.unhandled_stats_msgs = []
-        self.total_usage = {}
+        self._rule_records = {}
+        self._rule_record_flows = defaultdict(int)
+        self._flow_index = {}
+        self._stats_cycle_stats = 0
+        self._stats_cycle_flows = 0
+        self._stats_cycle_failed = False
+        self._stats_cycle_started = False
+        self._dirty_records = set()
+        self._ended_records = {}
+        self._force_full_report = True
         self._unmatched_bytes = 0
 
     def initialize_on_connect(self, datapath):
@@ -289,7 +344,7 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
 
     def get_policy_usage(self, fut):
         record_table = RuleRecordTable(
-            records=self.total_usage.values(),
+            records=self._rule_records.values(),
             epoch=global_epoch)
         fut.set_result(record_table)
 
@@ -354,42 +409,203 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
             self.logger.debug('Ignoring stats from different bridge')
             return
 
-        self.unhandled_stats_msgs.append(ev.msg.body)
-        if ev.msg.flags == OFPMPF_REPLY_MORE:
-            # Wait for more multi-part responses thats received for the
-            # single stats request.
-            return
-        self.loop.call_soon_threadsafe(
-            self._handle_flow_stats, self.unhandled_stats_msgs)
-        self.unhandled_stats_msgs = []
+        self.loop.call_soon_threadsafe(self._handle_flow_stats, ev.msg)
 
-    def _handle_flow_stats(self, stats_msgs):
+    def _handle_flow_stats(self, stats_msg):
         """
-        Aggregate flow stats by rule, and report to session manager
+        Aggregate one part of a flow stats reply into the rule records. Once
+        the last part of the reply is processed, drop the flows that are
+        gone and report usage to session manager.
         """
-        stat_count = sum(len(flow_stats) for flow_stats in stats_msgs)
-        if stat_count == 0:
-            return
+        if not self._stats_cycle_started:
+            self._stats_cycle_started = True
+            self._stats_cycle += 1
+            self._stats_cycle_stats = 0
+            self._stats_cycle_flows = 0
+            self._stats_cycle_failed = False
 
-        self.logger.debug("Processing %s stats responses", len(stats_msgs))
-        # Aggregate flows into rule records
-        aggregated_msgs = []
-        for flow_stats in stats_msgs:
-            aggregated_msgs += flow_stats
+        self._stats_cycle_stats += len(stats_msg.body)
+        if not self._stats_cycle_failed:
+            try:
+                self._update_usage_from_flow_stats(stats_msg.body)
+            except ConnectionError:
+                self.logger.error('Failed processing stats, redis unavailable')
+                self._stats_cycle_failed = True
 
-        self.logger.debug("Processing stats of %d flows", len(aggregated_msgs))
-        try:
-            current_usage = self._get_usage_from_flow_stat(aggregated_msgs)
-        except ConnectionError:
-            self.logger.error('Failed processing stats, redis unavailable')
-            self.unhandled_stats_msgs.append(stats_msgs)
+        if stats_msg.flags == OFPMPF_REPLY_MORE:
+            # Wait for more multi-part responses thats received for the
+            # single stats request.
             return
+        self._stats_cycle_started = False
+        if self._stats_cycle_failed or self._stats_cycle_stats == 0:
+            return
+
+        self.logger.debug("Processed stats of %d flows",
+                          self._stats_cycle_stats)
+        if self._stats_cycle_flows != len(self._flow_index):
+            self._remove_stale_flows()
         # Send report even if usage is empty. Sessiond uses empty reports to
         # recognize when flows have ended
-        self._report_usage(current_usage)
+        usage, delta_update = self._get_usage_to_report()
+        self._report_usage(usage, delta_update)
+
+    def _get_usage_to_report(self):
+        """
+        Return the rule records to report and whether they are a delta
+        update. In delta mode only the records that changed since the last
+        report are sent, plus tombstones (final_record set) of records whose
+        flows ended. A full report goes out every full_stats_report_interval
+        seconds and after a report failed.
+        """
+        now = datetime.now()
+        since_full_report = (now - self._last_full_report).total_seconds()
+        if not self._delta_stats_reporting or self._force_full_report or \
+                since_full_report >= self._full_stats_report_interval:
+            self._force_full_report = False
+            self._last_full_report = now
+            self._dirty_records.clear()
+            self._ended_records.clear()
+            return dict(self._rule_records), False
+
+        usage = {key: self._rule_records[key] for key in self._dirty_records}
+        for key, record in self._ended_records.items():
+            # A new flow could have been added for the record since it ended
+            usage.setdefault(key, record)
+        self._dirty_records.clear()
+        self._ended_records.clear()
+        return usage, True
+
+    def _update_usage_from_flow_stats(self, flow_stats):
+        """
+        Update the rule records with the counters of the flows that changed
+        since the last poll. Flows are only decoded the first time they show
+        up in a stats reply.
+        """
+        cycle = self._stats_cycle
+        for flow_stat in flow_stats:
+            if flow_stat.table_id != self.tbl_num:
+                # this update is not intended for policy
+                continue
+            if flow_stat.cookie == self.DEFAULT_FLOW_COOKIE:
+                if flow_stat.byte_count != 0 and \
+                   self._unmatched_bytes != flow_stat.byte_count:
+                    self.logger.debug('%s bytes total not reported.',
+                                      flow_stat.byte_count)
+                    self._unmatched_bytes = flow_stat.byte_count
+                continue
 
-        # This is done primarily for CWF integration tests, TODO rm
-        self.total_usage = current_usage
+            match = dict(flow_stat.match.items())
+            flow_key = _get_flow_key(flow_stat, match)
+            entry = self._flow_index.get(flow_key)
+            if entry is None:
+                entry = self._index_flow(flow_key, flow_stat, match)
+            if entry.cycle != cycle:
+                entry.cycle = cycle
+                self._stats_cycle_flows += 1
+
+            if entry.record_key is None or \
+                    (entry.byte_count == flow_stat.byte_count and
+                     entry.packet_count == flow_stat.packet_count):
+                continue
+            entry.byte_count = flow_stat.byte_count
+            entry.packet_count = flow_stat.packet_count
+            usage = self._get_flow_usage(entry, flow_stat)
+            self._add_flow_usage(entry, usage - entry.usage)
+            entry.usage = usage
+
+    def _index_flow(self, flow_key, flow_stat, match) -> _FlowStatEntry:
+        """
+        Decode a flow seen for the first time and link it to its rule record,
+        creating the record if this is the first flow for it.
+        """
+        entry, record = self._decode_flow(flow_stat, match)
+        self._flow_index[flow_key] = entry
+        if record is None:
+            return entry
+        if entry.record_key not in self._rule_records:
+            self._rule_records[entry.record_key] = record
+            self._dirty_records.add(entry.record_key)
+        self._rule_record_flows[entry.record_key] += 1
+        return entry
+
+    def _decode_flow(self, flow_stat, match) \
+            -> Tuple[_FlowStatEntry, Optional[RuleRecord]]:
+        """
+        Return the stats entry of a flow and an empty rule record for it.
+        The record is None for flows whose stats are never reported.
+        """
+        rule_id = self._get_rule_id(flow_stat)
+        # Rule not found, must be the default drop flow
+        if rule_id == "":
+            rule_id = self._default_drop_flow_name
+        policy_type = _get_policy_type(match)
+        is_downlink = match.get(DIRECTION_REG) == Direction.IN
+        sid = None
+        if policy_type != IGNORE_STATS and IMSI_REG in match:
+            sid = decode_imsi(match[IMSI_REG])
+        if not sid:
+            # If this is a pass through app name flow ignore stats
+            return _FlowStatEntry(None, is_downlink, False), None
+
+        ip_addr = None
+        if DIRECTION_REG in match:
+            ip_addr = _get_ipv4_from_match(match) or \
+                _get_ipv6_from_match(match)
+        rule_version = match.get(RULE_VERSION_REG) or 0
+        # use a compound key to separate flows for the same rule but for
+        # different subscribers
+        record_key = sid + "|" + rule_id
+        if ip_addr:
+            record_key += "|" + ip_addr
+        record_key += "|" + str(rule_version)
+
+        record = RuleRecord(sid=sid, rule_id=rule_id,
+                            rule_version=rule_version)
+        if ip_addr and ip_addr == _get_ipv4_from_match(match):
+            record.ue_ipv4 = ip_addr
+        elif ip_addr:
+            record.ue_ipv6 = ip_addr
+        entry = _FlowStatEntry(record_key, is_downlink,
+                               policy_type == PROCESS_STATS)
+        return entry, record
+
+    def _get_flow_usage(self, entry, flow_stat):
+        if entry.is_downlink:
+            # HACK decrement byte count for downlink packets by the length
+            # of an ethernet frame. Only IP and below should be counted
+            # towards a user's data. Uplink does this already because the
+            # GTP port is an L3 port.
+            return _get_downlink_byte_count(flow_stat)
+        return flow_stat.byte_count
+
+    def _add_flow_usage(self, entry, usage):
+        self._dirty_records.add(entry.record_key)
+        _add_usage(self._rule_records[entry.record_key], entry, usage)
+
+    def _remove_stale_flows(self):
+        """
+        Remove flows that were not part of the last stats reply, along with
+        their usage. Rule records without any flows left are dropped, and
+        kept as tombstones for the next delta report.
+        """
+        cycle = self._stats_cycle
+        stale_keys = [flow_key for flow_key, entry in self._flow_index.items()
+                      if entry.cycle != cycle]
+        for flow_key in stale_keys:
+            entry = self._flow_index.pop(flow_key)
+            record_key = entry.record_key
+            if record_key is None:
+                continue
+            self._rule_record_flows[record_key] -= 1
+            if self._rule_record_flows[record_key] > 0:
+                self._add_flow_usage(entry, -entry.usage)
+                continue
+            del self._rule_record_flows[record_key]
+            record = self._rule_records.pop(record_key)
+            self._dirty_records.discard(record_key)
+            if self._delta_stats_reporting:
+                record.final_record = True
+                self._ended_records[record_key] = record
 
     def deactivate_default_flow(self, imsi, ip_addr):
         if self._datapath is None:
@@ -402,12 +618,13 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
         flows.delete_flow(self._datapath, self.tbl_num, match_in)
         flows.delete_flow(self._datapath, self.tbl_num, match_out)
 
-    def _report_usage(self, usage):
+    def _report_usage(self, usage, delta_update=False):
         """
         Report usage to sessiond using rpc
         """
         record_table = RuleRecordTable(records=usage.values(),
-                                       epoch=global_epoch)
+                                       epoch=global_epoch,
+                                       delta_update=delta_update)
         if self._print_grpc_payload:
             record_msg = 'Sending RPC payload: {0}{{\n{1}}}'.format(
                 record_table.DESCRIPTOR.name, str(record_table))
@@ -416,7 +633,9 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
             record_table, self.SESSIOND_RPC_TIMEOUT)
         future.add_done_callback(
             lambda future: self.loop.call_soon_threadsafe(
-                self._report_usage_done, future, usage.values()))
+                self._report_usage_done, future,
+                [record for record in usage.values()
+                 if not record.final_record]))
 
     def _report_usage_done(self, future, records):
         """
@@ -428,6 +647,8 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
         err = future.exception()
         if err:
             self.logger.error('Couldnt send flow records to sessiond: %s', err)
+            # Usage in the lost report is only covered by a full report
+            self._force_full_report = True
             return
         try:
             self._delete_old_flows(records)
@@ -435,83 +656,6 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
             self.logger.error('Failed remove old flows, redis unavailable')
             return
 
-    def _get_usage_from_flow_stat(self, flow_stats):
-        """
-        Update the rule record map with the flow stat and return the
-        updated map.
-        """
-        current_usage = defaultdict(RuleRecord)
-        for flow_stat in flow_stats:
-            if flow_stat.table_id != self.tbl_num:
-                # this update is not intended for policy
-                continue
-            rule_id = self._get_rule_id(flow_stat)
-            # Rule not found, must be default flow
-            if rule_id == "":
-                default_flow_matched = \
-                    flow_stat.cookie == self.DEFAULT_FLOW_COOKIE
-                if default_flow_matched:
-                    if flow_stat.byte_count != 0 and \
-                       self._unmatched_bytes != flow_stat.byte_count:
-                        self.logger.debug('%s bytes total not reported.',
-                                          flow_stat.byte_count)
-                        self._unmatched_bytes = flow_stat.byte_count
-                    continue
-                else:
-                    # This must be the default drop flow
-                    rule_id = self._default_drop_flow_name
-            # If this is a pass through app name flow ignore stats
-            if _get_policy_type(flow_stat.match) == IGNORE_STATS:
-                continue
-            sid = _get_sid(flow_stat)
-            if not sid:
-                continue
-            ipv4_addr = _get_ipv4(flow_stat)
-            ipv6_addr = _get_ipv6(flow_stat)
-
-            # use a compound key to separate flows for the same rule but for
-            # different subscribers
-            key = sid + "|" + rule_id
-
-            if ipv4_addr:
-                key += "|" + ipv4_addr
-            elif ipv6_addr:
-                key += "|" + ipv6_addr
-
-            rule_version = _get_version(flow_stat)
-            if not rule_version:
-                rule_version = 0
-
-            key += "|" + str(rule_version)
-
-            current_usage[key].rule_id = rule_id
-            current_usage[key].sid = sid
-
-            current_usage[key].rule_version = rule_version
-
-            if ipv4_addr:
-                current_usage[key].ue_ipv4 = ipv4_addr
-            elif ipv6_addr:
-                current_usage[key].ue_ipv6 = ipv6_addr
-            bytes_rx = 0
-            bytes_tx = 0
-            if flow_stat.match[DIRECTION_REG] == Direction.IN:
-                # HACK decrement byte count for downlink packets by the length
-                # of an ethernet frame. Only IP and below should be counted towards
-                # a user's data. Uplink does this already because the GTP port is
-                # an L3 port.
-                bytes_rx = _get_downlink_byte_count(flow_stat)
-            else:
-                bytes_tx = flow_stat.byte_count
-
-            if _get_policy_type(flow_stat.match) == PROCESS_STATS:
-                current_usage[key].bytes_rx += bytes_rx
-                current_usage[key].bytes_tx += bytes_tx
-            else:
-                current_usage[key].dropped_rx += bytes_rx
-                current_usage[key].dropped_tx += bytes_tx
-        return current_usage
-
     def _delete_old_flows(self, records):
         """
         Check if the version of any record is older than the current version.
@@ -589,7 +733,7 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
                 self.logger.error("No rule records match the specified cookie and cookie mask")
                 return RuleRecordTable()
             else:
-                usage = self._get_usage_from_flow_stat(response.body)
+                usage = self._get_usage_from_flows(response.body)
                 self.loop.call_soon_threadsafe(self._delete_old_flows, usage.values())
                 record_table = RuleRecordTable(
                     records=usage.values(),
@@ -599,6 +743,50 @@ class EnforcementStatsController(PolicyMixin, RestartMixin, MagmaController):
             self.logger.error("Could not obtain rule records due to either InvalidDatapath, OFError or UnexpectedMultiReply")
             return RuleRecordTable()
 
+    def _get_usage_from_flows(self, flow_stats):
+        """
+        Aggregate the rule records of the flows of a stats reply, e.g. for
+        a filtered stats request, without updating the polled usage. The
+        flow index is owned by the event loop, it is only read to avoid
+        decoding known flows again.
+        """
+        usage = {}
+        for flow_stat in flow_stats:
+            if flow_stat.table_id != self.tbl_num or \
+                    flow_stat.cookie == self.DEFAULT_FLOW_COOKIE:
+                continue
+            match = dict(flow_stat.match.items())
+            entry = self._flow_index.get(_get_flow_key(flow_stat, match))
+            record = None
+            if entry is not None and entry.record_key is not None:
+                record = self._rule_records.get(entry.record_key)
+            if entry is None or (entry.record_key is not None and
+                                 record is None):
+                entry, record = self._decode_flow(flow_stat, match)
+            if entry.record_key is None:
+                continue
+            if entry.record_key not in usage:
+                usage[entry.record_key] = RuleRecord(
+                    sid=record.sid, rule_id=record.rule_id,
+                    rule_version=record.rule_version,
+                    ue_ipv4=record.ue_ipv4, ue_ipv6=record.ue_ipv6)
+            _add_usage(usage[entry.record_key], entry,
+                       self._get_flow_usage(entry, flow_stat))
+        return usage
+
+
+def _add_usage(record, entry, usage):
+    if entry.process_stats:
+        if entry.is_downlink:
+            record.bytes_rx += usage
+        else:
+            record.bytes_tx += usage
+    elif entry.is_downlink:
+        record.dropped_rx += usage
+    else:
+        record.dropped_tx += usage
+
+
 def _generate_rule_match(imsi, ip_addr, rule_num, version, direction):
     """
     Return a MagmaMatch that matches on the rule num and the version.
@@ -608,40 +796,29 @@ def _generate_rule_match(imsi, ip_addr, rule_num, version, direction):
                       direction=direction, rule_num=rule_num,
                       rule_version=version, **ip_match)
 
-def _get_sid(flow):
-    if IMSI_REG not in flow.match:
-        return None
-    return decode_imsi(flow.match[IMSI_REG])
+def _get_ipv4_from_match(match):
+    if match.get(DIRECTION_REG) == Direction.OUT:
+        return match.get('ipv4_src')
+    return match.get('ipv4_dst')
 
 
-def _get_ipv4(flow):
-    if DIRECTION_REG not in flow.match:
-        return None
-    if flow.match[DIRECTION_REG] == Direction.OUT:
-        ip_register = 'ipv4_src'
-    else:
-        ip_register = 'ipv4_dst'
-    if ip_register not in flow.match:
-        return None
-    return flow.match[ip_register]
+def _get_ipv6_from_match(match):
+    if match.get(DIRECTION_REG) == Direction.OUT:
+        return match.get('ipv6_src')
+    return match.get('ipv6_dst')
 
 
-def _get_ipv6(flow):
-    if DIRECTION_REG not in flow.match:
-        return None
-    if flow.match[DIRECTION_REG] == Direction.OUT:
-        ip_register = 'ipv6_src'
-    else:
-        ip_register = 'ipv6_dst'
-    if ip_register not in flow.match:
-        return None
-    return flow.match[ip_register]
-
-
-def _get_version(flow):
-    if RULE_VERSION_REG not in flow.match:
-        return None
-    return flow.match[RULE_VERSION_REG]
+def _get_flow_key(flow_stat, match) -> FlowKey:
+    """
+    Key a stats flow on its cookie (the rule num) and the registers and ue ip
+    address it matches on, without decoding any of them.
+    """
+    ip_addr = None
+    if DIRECTION_REG in match:
+        ip_addr = _get_ipv4_from_match(match) or _get_ipv6_from_match(match)
+    return (flow_stat.cookie, flow_stat.priority, match.get(IMSI_REG),
+            match.get(DIRECTION_REG), match.get(RULE_VERSION_REG),
+            match.get(SCRATCH_REGS[1]), ip_addr)
 
 
 def _get_downlink_byte_count(flow_stat):
@@ -168,23 +168,30 @@ class GYController(PolicyMixin, RestartMixin, MagmaController):
             apn_ambr (integer): maximum bandwidth for non-GBR EPS bearers
             rule (PolicyRule): policy rule proto
         """
+        flow_adds, res = self._get_rule_install_msgs(
+            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
+        if res is not None:
+            return res
+
+        chan = self._msg_hub.send(flow_adds, self._datapath)
+        return self._wait_for_rule_responses(imsi, ip_addr, rule, chan)
+
+    def _get_rule_install_msgs(self, imsi, msisdn: bytes, uplink_tunnel: int,
+                               ip_addr, apn_ambr, rule, version):
         if rule.redirect.support == rule.redirect.ENABLED:
             self._install_redirect_flow(imsi, ip_addr, rule, version)
-            return RuleModResult.SUCCESS
+            return [], RuleModResult.SUCCESS
 
         if not rule.flow_list:
             self.logger.error('The flow list for imsi %s, rule.id - %s'
                               'is empty, this shoudn\'t happen', imsi, rule.id)
-            return RuleModResult.FAILURE
+            return [], RuleModResult.FAILURE
 
-        flow_adds = []
-        try:
-            flow_adds = self._get_rule_match_flow_msgs(imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
-        except FlowMatchError:
-            return RuleModResult.FAILURE
+        return super(GYController, self)._get_rule_install_msgs(
+            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version)
 
-        chan = self._msg_hub.send(flow_adds, self._datapath)
-        return self._wait_for_rule_responses(imsi, ip_addr, rule, chan)
+    def _handle_rule_install_failure(self, imsi, ip_addr, rule_id):
+        self._deactivate_flow_for_rule(imsi, ip_addr, rule_id)
 
     def _get_default_flow_msgs_for_subscriber(self, *_):
         return None
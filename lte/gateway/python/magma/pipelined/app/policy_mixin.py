@@ -11,18 +11,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import List, NamedTuple, Optional, Tuple
 
+from lte.protos.apn_pb2 import AggregatedMaximumBitrate
 from lte.protos.mobilityd_pb2 import IPAddress
 from lte.protos.pipelined_pb2 import (
     ActivateFlowsRequest,
     ActivateFlowsResult,
     RuleModResult,
+    VersionedPolicy,
 )
 from lte.protos.policydb_pb2 import PolicyRule
 from magma.pipelined.app.dpi import UNCLASSIFIED_PROTO_ID, get_app_id
 from magma.pipelined.imsi import encode_imsi
 from magma.pipelined.openflow import flows
+from magma.pipelined.openflow.exceptions import MagmaDPDisconnectedError
 from magma.pipelined.openflow.messages import MsgChannel
 from magma.pipelined.openflow.registers import (
     RULE_NUM_REG,
@@ -44,6 +47,16 @@ from magma.pipelined.utils import Utils
 PROCESS_STATS = 0x0
 IGNORE_STATS = 0x1
 DROP_FLOW_STATS = 0x2
+# Max number of flow msgs sent to OVS before waiting on a barrier, when
+# activating rules in batch
+BATCH_MSG_CHUNK_SIZE = 1000
+
+RuleActivation = NamedTuple(
+    'RuleActivation',
+    [('imsi', str), ('msisdn', bytes), ('uplink_tunnel', int),
+     ('ip_addr', IPAddress), ('apn_ambr', AggregatedMaximumBitrate),
+     ('policies', List[VersionedPolicy])],
+)
 
 
 class PolicyMixin(metaclass=ABCMeta):
@@ -98,6 +111,131 @@ class PolicyMixin(metaclass=ABCMeta):
             policy_results=policy_results,
         )
 
+    def activate_rules_batch(
+        self, activations: List[RuleActivation],
+    ) -> List[ActivateFlowsResult]:
+        """
+        Activate the flows for many subscriber sessions at once. The flow
+        msgs of all rules are sent together, with a single barrier per chunk
+        of BATCH_MSG_CHUNK_SIZE msgs, instead of waiting for a barrier per
+        rule.
+
+        Args:
+            activations (RuleActivation []): subscriber sessions and their
+                versioned policies to activate
+        Returns:
+            The ActivateFlowsResult of each session, in the same order
+        """
+        if self._datapath is None:
+            self.logger.error('Datapath not initialized for adding flows')
+            return [
+                ActivateFlowsResult(
+                    policy_results=[RuleModResult(
+                        rule_id=policy.rule.id,
+                        version=policy.version,
+                        result=RuleModResult.FAILURE,
+                    ) for policy in activation.policies],
+                ) for activation in activations
+            ]
+
+        msgs = []
+        # (activation, policy, result, index of first msg, msg count)
+        pending_rules = []
+        policy_results = []
+        for activation in activations:
+            results = []
+            for policy in activation.policies:
+                rule_msgs, res = self._get_rule_install_msgs(
+                    activation.imsi, activation.msisdn,
+                    activation.uplink_tunnel, activation.ip_addr,
+                    activation.apn_ambr, policy.rule, policy.version)
+                result = RuleModResult(rule_id=policy.rule.id,
+                                       version=policy.version)
+                if res is None:
+                    pending_rules.append((activation, policy, result,
+                                          len(msgs), len(rule_msgs)))
+                    msgs.extend(rule_msgs)
+                else:
+                    result.result = res
+                results.append(result)
+            policy_results.append(results)
+            # Install a base flow for when no rule is matched.
+            default_msgs = self._get_default_flow_msgs_for_subscriber(
+                activation.imsi, activation.ip_addr)
+            if default_msgs:
+                msgs.extend(default_msgs)
+
+        errors = self._send_msgs_in_chunks(msgs)
+        for activation, policy, result, start, count in pending_rules:
+            err = next((e for e in errors[start:start + count]
+                        if e is not None), None)
+            if err is None:
+                result.result = RuleModResult.SUCCESS
+                continue
+            self.logger.error(
+                "Failed to install rule %s for subscriber %s: %s",
+                policy.rule.id, activation.imsi, err)
+            self._handle_rule_install_failure(
+                activation.imsi, activation.ip_addr, policy.rule.id)
+            result.result = RuleModResult.FAILURE
+
+        return [ActivateFlowsResult(policy_results=results)
+                for results in policy_results]
+
+    def _send_msgs_in_chunks(self, msgs) -> List[Optional[Exception]]:
+        """
+        Send flow msgs with a single barrier per chunk, and wait for all of
+        the replies.
+
+        Returns:
+            The error of each msg, None if the msg was successful
+        """
+        errors = [None] * len(msgs)
+        chan = MsgChannel()
+        sent = 0
+        try:
+            for start in range(0, len(msgs), BATCH_MSG_CHUNK_SIZE):
+                chunk = msgs[start:start + BATCH_MSG_CHUNK_SIZE]
+                self._msg_hub.send(chunk, self._datapath, channel=chan)
+                sent = start + len(chunk)
+        except MagmaDPDisconnectedError as err:
+            self.logger.error("Datapath disconnected, failed to install "
+                              "%d flows", len(msgs) - sent)
+            errors[sent:] = [err] * (len(msgs) - sent)
+
+        for i in range(sent):
+            try:
+                result = chan.get()
+            except MsgChannel.Timeout:
+                errors[i:sent] = ["No response from OVS"] * (sent - i)
+                break
+            if not result.ok():
+                errors[i] = result.exception()
+        return errors
+
+    def _get_rule_install_msgs(
+        self, imsi, msisdn: bytes, uplink_tunnel: int, ip_addr, apn_ambr,
+        rule, version,
+    ) -> Tuple[List, Optional[int]]:
+        """
+        Returns the flow msgs that install a rule. If the rule can't be
+        installed through flow msgs (e.g. it is invalid), the RuleModResult of
+        its install is returned instead.
+        """
+        try:
+            return self._get_rule_match_flow_msgs(
+                imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule,
+                version), None
+        except FlowMatchError:
+            return [], RuleModResult.FAILURE
+
+    def _handle_rule_install_failure(self, imsi, ip_addr, rule_id):
+        """
+        Called when flow msgs of a batched rule install failed, so that
+        partially installed flows can be removed.
+        """
+        pass
+
     def _remove_he_flows(self, ip_addr: IPAddress, rule_id: str = "",
                          rule_num: int = -1):
         if self.proxy_controller:
@@ -15,6 +15,7 @@ from typing import Dict, List
 
 from lte.protos.pipelined_pb2 import SetupFlowsResult
 from magma.pipelined.app.base import ControllerNotReadyException
+from magma.pipelined.metrics import RESTART_FLOWS_RECONCILED
 from magma.pipelined.openflow import flows
 from magma.pipelined.policy_converters import ovs_flow_match_to_magma_match
 from ryu.ofproto.ofproto_v1_4_parser import OFPFlowStats
@@ -72,6 +73,8 @@ class RestartMixin(metaclass=ABCMeta):
                               tbl,
                               [flow.match for flow in startup_flows_map[tbl]])
 
+        added_flows = 0
+        kept_flows = 0
         default_msgs = self._get_default_flow_msgs(dp)
         for table, msgs_to_install in default_msgs.items():
             msgs, remaining_flows = self._msg_hub \
@@ -81,6 +84,8 @@ class RestartMixin(metaclass=ABCMeta):
                 chan = self._msg_hub.send(msgs, dp)
                 self._wait_for_responses(chan, len(msgs))
             startup_flows_map[table] = remaining_flows
+            added_flows += len(msgs)
+            kept_flows += len(msgs_to_install) - len(msgs)
 
         ue_msgs = self._get_ue_specific_flow_msgs(requests)
         for table, msgs_to_install in ue_msgs.items():
@@ -91,18 +96,33 @@ class RestartMixin(metaclass=ABCMeta):
                 chan = self._msg_hub.send(msgs, dp)
                 self._wait_for_responses(chan, len(msgs))
             startup_flows_map[table] = remaining_flows
+            added_flows += len(msgs)
+            kept_flows += len(msgs_to_install) - len(msgs)
 
         for tbl in startup_flows_map:
             self.logger.debug('Startup flows to be deleted: tbl %d -> %s',
                               tbl,
                               [flow.match for flow in startup_flows_map[tbl]])
+        removed_flows = sum(len(flows_to_remove) for flows_to_remove
+                            in startup_flows_map.values())
         self._remove_extra_flows(startup_flows_map)
+        self._report_reconciliation(added_flows, kept_flows, removed_flows)
 
         self.finish_init(requests)
         self.init_finished = True
 
         return SetupFlowsResult(result=SetupFlowsResult.SUCCESS)
 
+    def _report_reconciliation(self, added, kept, removed):
+        self.logger.info('Restart reconciliation: %d flows added, %d kept, '
+                         '%d removed', added, kept, removed)
+        RESTART_FLOWS_RECONCILED.labels(
+            app_name=self.APP_NAME, action='added').set(added)
+        RESTART_FLOWS_RECONCILED.labels(
+            app_name=self.APP_NAME, action='kept').set(kept)
+        RESTART_FLOWS_RECONCILED.labels(
+            app_name=self.APP_NAME, action='removed').set(removed)
+
     def _remove_extra_flows(self, extra_flows):
         msg_list = []
         for tbl in extra_flows:
@@ -57,3 +57,9 @@ GTP_PORT_USER_PLANE_DL_BYTES = Gauge('gtp_port_user_plane_dl_bytes',
                                        'GTP port user plane downlink bytes',
                                        ['ip_addr'],
                                        )
+RESTART_FLOWS_RECONCILED = Gauge(
+    'restart_flows_reconciled',
+    'Number of flows added, kept and removed by the last restart '
+    'reconciliation of a controller',
+    ['app_name', 'action'],
+)
@@ -11,7 +11,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import logging
-from typing import Any, List, Optional
+from collections import defaultdict
+from typing import Any, Hashable, List, Optional
 
 # there's a cyclic dependency in ryu
 import ryu.base.app_manager  # pylint: disable=unused-import
@@ -28,6 +29,9 @@ from ryu.ofproto.ofproto_parser import MsgBase
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_SEC = 10
+MATCH_ATTRIBUTES_SET = frozenset(MATCH_ATTRIBUTES)
+# ('0.0.0.0', '0.0.0.0') is the same as unset
+UNSET_IP_MATCH = ('0.0.0.0', '0.0.0.0')
 
 
 def send_msg(datapath, msg, retries=3):
@@ -184,15 +188,27 @@ class MessageHub(object):
         """
         Returns a list of messages not found in the provided flow_list, also
         returns a list of remaining flows(not found in the msg_list)
+
+        Flows and messages are compared by their fingerprint, so this is
+        linear in the number of flows and messages.
         """
+        # Indices are stored in reverse so the first matching flow is popped
+        flow_indices_by_fingerprint = defaultdict(list)
+        for index in range(len(flow_list) - 1, -1, -1):
+            fingerprint = self._get_flow_fingerprint(dp, flow_list[index])
+            flow_indices_by_fingerprint[fingerprint].append(index)
+
         msgs_to_send = []
-        remaining_flows = flow_list.copy()
+        found_indices = set()
         for msg in msg_list:
-            index = self._get_msg_index_in_flow_list(dp, msg, remaining_flows)
-            if index >= 0:
-                remaining_flows.pop(index)
+            indices = flow_indices_by_fingerprint.get(
+                self._get_flow_fingerprint(dp, msg))
+            if indices:
+                found_indices.add(indices.pop())
             else:
                 msgs_to_send.append(msg)
+        remaining_flows = [flow for index, flow in enumerate(flow_list)
+                           if index not in found_indices]
         return msgs_to_send, remaining_flows
 
     @staticmethod
@@ -240,65 +256,40 @@ class MessageHub(object):
         # for now, result is unused. Just return if there's an exception
         switch.results_by_msg[msg.xid] = MagmaOFError(ev.msg)
 
-    def _flow_matches_flowmsg(self, dp, flow, msg):
+    @staticmethod
+    def _get_flow_fingerprint(dp, flow) -> Hashable:
         """
-        Compare the flow and flow message based on match/instructions
+        Return a hashable fingerprint of a flow (OFPFlowStats) or a flow
+        message (OFPFlowMod) based on its match and instructions. A flow and
+        a flow message with the same fingerprint install the same flow.
         """
-        reg_loads_match = True
-        resubmits_match = True
-        outputs_match = True
-        if len(flow.instructions) != len(msg.instructions):
-            return False
-        for j in range(0, len(flow.instructions)):
+        parser = dp.ofproto_parser
+        match = frozenset(
+            (key, value) for key, value in flow.match.items()
+            if key in MATCH_ATTRIBUTES_SET and value != UNSET_IP_MATCH
+        )
+        instructions = []
+        for instruction in flow.instructions:
             # TODO add support for OFPInstructionMeter and others
-            if type(flow.instructions[j]) != dp.ofproto_parser.OFPInstructionActions:
-                continue
-            if type(msg.instructions[j]) != dp.ofproto_parser.OFPInstructionActions:
+            if type(instruction) != parser.OFPInstructionActions:
+                instructions.append(None)
                 continue
             # Strip _nxm to handle nicira as eth_dst_nxm is same as eth_dst
-            reg_loads_flow = {i.dst.replace('_nxm', ''): i.value for i in flow.instructions[j].actions
-                              if type(i) == dp.ofproto_parser.NXActionRegLoad2}
-            reg_loads_msg = {i.dst.replace('_nxm', ''): i.value for i in msg.instructions[j].actions
-                             if type(i) == dp.ofproto_parser.NXActionRegLoad2}
-
-            reg_loads_match = reg_loads_msg == reg_loads_flow
-
-            resubmits_flow = [i.table_id for i in flow.instructions[j].actions
-                              if type(i) == dp.ofproto_parser.NXActionResubmitTable]
-            resubmits_msg = [i.table_id for i in msg.instructions[j].actions
-                             if type(i) == dp.ofproto_parser.NXActionResubmitTable]
-            resubmits_match = sorted(resubmits_flow) == sorted(resubmits_msg)
-
-            outputs_flow = [i.port for i in flow.instructions[j].actions
-                            if type(i) == dp.ofproto_parser.OFPActionOutput]
-            outputs_msg = [i.port for i in msg.instructions[j].actions
-                           if type(i) == dp.ofproto_parser.OFPActionOutput]
-            outputs_match = sorted(outputs_flow) == sorted(outputs_msg)
-
-        match_flow = {key: flow.match.get(key) for key in MATCH_ATTRIBUTES
-                      if key in flow.match}
-        match_msg = {key: msg.match.get(key, None) for key in MATCH_ATTRIBUTES
-                     if key in msg.match}
-
-        def strip_common(match_dict):
-            """
-            Filter out args that break equality
-                - ('0.0.0.0', '0.0.0.0') is the same as unset
-            """
-            for key in list(match_dict.keys()):
-                if match_dict[key] == ('0.0.0.0', '0.0.0.0'):
-                    del match_dict[key]
-            return match_dict
-        flow_match = strip_common(match_flow) == strip_common(match_msg)
-
-        return flow_match and reg_loads_match and resubmits_match and \
-               outputs_match
-
-    def _get_msg_index_in_flow_list(self, dp, msg, flow_list):
-        for i in range(len(flow_list)):
-            if self._flow_matches_flowmsg(dp, msg, flow_list[i]):
-                return i
-        return -1
+            reg_loads = frozenset(
+                (i.dst.replace('_nxm', ''), i.value)
+                for i in instruction.actions
+                if type(i) == parser.NXActionRegLoad2
+            )
+            resubmits = tuple(sorted(
+                i.table_id for i in instruction.actions
+                if type(i) == parser.NXActionResubmitTable
+            ))
+            outputs = tuple(sorted(
+                i.port for i in instruction.actions
+                if type(i) == parser.OFPActionOutput
+            ))
+            instructions.append((reg_loads, resubmits, outputs))
+        return match, tuple(instructions)
 
     class _MsgRequest(object):
         def __init__(self, txn_id, msg_xids, channel=None):
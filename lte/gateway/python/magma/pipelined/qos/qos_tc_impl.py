@@ -12,10 +12,12 @@ limitations under the License.
 """
 import logging
 import subprocess
-from typing import Optional  # noqa
+from collections import deque
+from typing import List, Optional, Tuple  # noqa
 
 from lte.protos.policydb_pb2 import FlowMatch
 
+from .tc_ops import HtbClass
 from .tc_ops_cmd import TcOpsCmd, argSplit, run_cmd
 from .tc_ops_pyroute2 import TcOpsPyRoute2
 from .types import QosInfo
@@ -47,8 +49,18 @@ class TrafficClass:
         return TrafficClass.tc_ops.del_htb(intf, qid_hex)
 
     @staticmethod
-    def create_class(intf: str, qid: int, max_bw: int, rate=None,
-                     parent_qid=None, skip_filter=False) -> int:
+    def delete_classes(intf: str, qids: List[int],
+                       skip_filter=False) -> List[int]:
+        """
+        Delete classes in one batch, children must come before their parent.
+        Returns the error code of each class.
+        """
+        return TrafficClass.tc_ops.delete_batch(
+            intf, [hex(qid) for qid in qids], skip_filter)
+
+    @staticmethod
+    def _htb_class(qid: int, max_bw: int, rate=None, parent_qid=None,
+                   skip_filter=False) -> HtbClass:
         if not rate:
             rate = DEFAULT_RATE
 
@@ -61,17 +73,35 @@ class TrafficClass:
             LOG.error('parent and self qid equal, setting parent_qid to root')
             parent_qid = ROOT_QID
 
-        qid_hex = hex(qid)
-        parent_qid_hex = '1:' + hex(parent_qid)
-        err = TrafficClass.tc_ops.create_htb(intf, qid_hex, max_bw, rate, parent_qid_hex)
+        return HtbClass(hex(qid), max_bw, rate, '1:' + hex(parent_qid),
+                        skip_filter)
+
+    @staticmethod
+    def create_class(intf: str, qid: int, max_bw: int, rate=None,
+                     parent_qid=None, skip_filter=False) -> int:
+        htb = TrafficClass._htb_class(qid, max_bw, rate, parent_qid,
+                                      skip_filter)
+        err = TrafficClass.tc_ops.create_htb(intf, htb.qid, htb.max_bw,
+                                             htb.rate, htb.parent_qid)
         if err < 0 or skip_filter:
             return err
 
         # add filter
-        return TrafficClass.tc_ops.create_filter(intf, qid_hex, qid_hex)
+        return TrafficClass.tc_ops.create_filter(intf, htb.qid, htb.qid)
 
     @staticmethod
-    def init_qdisc(intf: str, show_error=False, enable_pyroute2=False) -> int:
+    def create_classes(intf: str, classes: List[Tuple]) -> List[int]:
+        """
+        Create classes in one batch, a parent must come before its children.
+        Each class is given as the create_class arguments after intf:
+        (qid, max_bw, rate, parent_qid, skip_filter).
+        Returns the error code of each class.
+        """
+        return TrafficClass.tc_ops.create_batch(
+            intf, [TrafficClass._htb_class(*args) for args in classes])
+
+    @staticmethod
+    def init_tc_ops(enable_pyroute2=False):
         # TODO: Convert this class into an object.
         if TrafficClass.tc_ops is None:
             if enable_pyroute2:
@@ -79,6 +109,18 @@ class TrafficClass:
             else:
                 TrafficClass.tc_ops = TcOpsCmd()
 
+    @staticmethod
+    def _netlink_ops() -> Optional[TcOpsPyRoute2]:
+        # the pyroute2 backend reads the tc state with netlink dumps
+        # instead of parsing the tc command output
+        if isinstance(TrafficClass.tc_ops, TcOpsPyRoute2):
+            return TrafficClass.tc_ops
+        return None
+
+    @staticmethod
+    def init_qdisc(intf: str, show_error=False, enable_pyroute2=False) -> int:
+        TrafficClass.init_tc_ops(enable_pyroute2)
+
         cmd_list = []
         speed = DEFAULT_INTF_SPEED
         qid_hex = hex(ROOT_QID)
@@ -109,6 +151,10 @@ class TrafficClass:
 
     @staticmethod
     def read_all_classes(intf: str):
+        netlink_ops = TrafficClass._netlink_ops()
+        if netlink_ops:
+            return netlink_ops.read_classes(intf)
+
         qid_list = []
         # example output of this command
         # b'class htb 1:1 parent 1:fffe prio 0 rate 12Kbit ceil 1Gbit burst \
@@ -169,6 +215,10 @@ class TrafficClass:
 
     @staticmethod
     def get_class_rate(intf: str, qid: int) -> Optional[str]:
+        netlink_ops = TrafficClass._netlink_ops()
+        if netlink_ops:
+            return netlink_ops.get_class_rate(intf, qid)
+
         qid_hex = hex(qid)
         tc_cmd = "tc class show dev {} classid 1:{}".format(intf, qid_hex)
         args = argSplit(tc_cmd)
@@ -187,6 +237,10 @@ class TrafficClass:
 
     @staticmethod
     def _get_qdisc_type(intf: str) -> Optional[str]:
+        netlink_ops = TrafficClass._netlink_ops()
+        if netlink_ops:
+            return netlink_ops.get_qdisc_type(intf)
+
         tc_cmd = "tc qdisc show dev {}".format(intf)
         args = argSplit(tc_cmd)
         try:
@@ -227,6 +281,9 @@ class TCManager(object):
         self._start_idx, self._max_idx = (config['qos']['linux_tc']['min_idx'],
                                           config['qos']['linux_tc']['max_idx'])
         self._id_manager = IdManager(self._start_idx, self._max_idx)
+        # classes to create, queued by add_qos and created in batches on
+        # the event loop
+        self._pending_classes = deque()
         self._initialized = True
         LOG.info("Init LinuxTC module uplink:%s downlink:%s",
                  config['nat_iface'], config['enodeb_iface'])
@@ -235,16 +292,27 @@ class TCManager(object):
         LOG.info("destroying existing qos classes")
         # ensure ordering during deletion of classes, children should be deleted
         # prior to the parent class ids
+        TrafficClass.init_tc_ops(self._enable_pyroute2)
         for intf in [self._uplink, self._downlink]:
             qid_list = TrafficClass.read_all_classes(intf)
+            del_qids = []
             for qid_tuple in qid_list:
                 (qid, pqid) = qid_tuple
                 if self._start_idx <= qid < (self._max_idx - 1):
-                    LOG.info("Attemting to delete class idx %d", qid)
-                    TrafficClass.delete_class(intf, qid)
+                    del_qids.append(qid)
                 if self._start_idx <= pqid < (self._max_idx - 1):
-                    LOG.info("Attemting to delete parent class idx %d", pqid)
-                    TrafficClass.delete_class(intf, pqid)
+                    del_qids.append(pqid)
+            # a parent class is listed once with each of its children and
+            # can only be deleted after all of them, so keep the last
+            # occurrence of each qid and drop the earlier ones
+            last_pos = {}
+            for pos, qid in enumerate(del_qids):
+                last_pos[qid] = pos
+            del_qids = [qid for pos, qid in enumerate(del_qids)
+                        if last_pos[qid] == pos]
+            if del_qids:
+                LOG.info("Attemting to delete class idx %s", del_qids)
+                TrafficClass.delete_classes(intf, del_qids)
 
     def setup(self, ):
         # initialize new qdisc
@@ -260,31 +328,40 @@ class TCManager(object):
         parser = self._datapath.ofproto_parser
         return parser.OFPActionSetField(pkt_mark=qid), None
 
-    def create_class_async(self, d: FlowMatch.Direction, qos_info: QosInfo,
-                           qid,
-                           parent, skip_filter, cleanup_rule):
-        intf = self._uplink if d == FlowMatch.UPLINK else self._downlink
-
-        err = TrafficClass.create_class(intf, qid, qos_info.mbr,
-                                        rate=qos_info.gbr,
-                                        parent_qid=parent,
-                                        skip_filter=skip_filter)
-        # typecast to int to avoid MagicMock related error in unit test
-        err_no = int(err)
-        if err_no < 0:
-            if cleanup_rule:
-                cleanup_rule()
-            LOG.error("qos create error: qid %d err %d", qid, err_no)
-            return
+    def create_pending_classes(self):
+        # all the classes queued since the last run are created in one batch
+        # per interface, in the order they were queued
+        pending = {}
+        while self._pending_classes:
+            d, qos_info, qid, parent, skip_filter, cleanup_rule = \
+                self._pending_classes.popleft()
+            intf = self._uplink if d == FlowMatch.UPLINK else self._downlink
+            pending.setdefault(intf, []).append(
+                (qid, qos_info, parent, skip_filter, cleanup_rule))
+
+        for intf, classes in pending.items():
+            errs = TrafficClass.create_classes(intf, [
+                (qid, qos_info.mbr, qos_info.gbr, parent, skip_filter)
+                for qid, qos_info, parent, skip_filter, _ in classes
+            ])
+            for (qid, _, _, _, cleanup_rule), err in zip(classes, errs):
+                # typecast to int to avoid MagicMock related error in unit test
+                err_no = int(err)
+                if err_no < 0:
+                    if cleanup_rule:
+                        cleanup_rule()
+                    LOG.error("qos create error: qid %d err %d", qid, err_no)
+                    continue
 
-        LOG.debug("create done: qid %d err %s", qid, err_no)
+                LOG.debug("create done: qid %d err %s", qid, err_no)
 
     def add_qos(self, d: FlowMatch.Direction, qos_info: QosInfo,
                 cleanup_rule=None, parent=None, skip_filter=False) -> int:
         LOG.debug("add QoS: %s", qos_info)
         qid = self._id_manager.allocate_idx()
-        self._loop.call_soon_threadsafe(self.create_class_async, d, qos_info,
-                                        qid, parent, skip_filter, cleanup_rule)
+        self._pending_classes.append((d, qos_info, qid, parent, skip_filter,
+                                      cleanup_rule))
+        self._loop.call_soon_threadsafe(self.create_pending_classes)
         LOG.debug("assigned qid: %d", qid)
         return qid
 
@@ -19,6 +19,11 @@ from __future__ import (
 )
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from typing import List
+
+# HTB class to create, qids are hex strings as passed to create_htb
+HtbClass = namedtuple('HtbClass', 'qid max_bw rate parent_qid skip_filter')
 
 
 class TcOpsBase(ABC):
@@ -56,3 +61,35 @@ class TcOpsBase(ABC):
         Delete FW filter
         """
         ...
+
+    def create_batch(self, iface: str, classes: List[HtbClass]) -> List[int]:
+        """
+        Create HTB classes, and their filters unless skip_filter is set.
+        Classes are created in order, so a parent class can be created
+        in the same batch as its children.
+
+        Returns the error code of each class, zero on success.
+        """
+        errs = []
+        for htb in classes:
+            err = self.create_htb(iface, htb.qid, htb.max_bw, htb.rate,
+                                  htb.parent_qid)
+            if err == 0 and not htb.skip_filter:
+                err = self.create_filter(iface, htb.qid, htb.qid)
+            errs.append(err)
+        return errs
+
+    def delete_batch(self, iface: str, qids: List[str],
+                     skip_filter: bool = False) -> List[int]:
+        """
+        Delete HTB classes, and their filters unless skip_filter is set.
+        Children must come before their parent class.
+
+        Returns the error code of each class delete, zero on success.
+        """
+        errs = []
+        for qid in qids:
+            if not skip_filter:
+                self.del_filter(iface, qid, qid)
+            errs.append(self.del_htb(iface, qid))
+        return errs
@@ -12,18 +12,52 @@ limitations under the License.
 """
 
 
+import errno
 import logging
 import pprint
-
-from pyroute2 import IPRoute, NetlinkError
-
-from .tc_ops import TcOpsBase
+import select
+import socket
+import struct
+import threading
+from socket import AF_UNSPEC
+from typing import List, Optional, Tuple
+
+from pyroute2 import IPBatch, IPRoute, NetlinkError
+from pyroute2.netlink import NLM_F_ACK, NLM_F_REQUEST, NLMSG_DONE
+from pyroute2.netlink.rtnl import (
+    RTM_DELTCLASS,
+    RTM_DELTFILTER,
+    RTM_GETQDISC,
+    RTM_GETTCLASS,
+    TC_H_ROOT,
+)
+from pyroute2.netlink.rtnl.tcmsg import tcmsg
+
+from .tc_ops import HtbClass, TcOpsBase
 
 LOG = logging.getLogger('pipelined.qos.tc_pyroute2')
 
 QUEUE_PREFIX = '1:'
 PROTOCOL = 0x0800
 PARENT_ID = 0x10000
+# Deletes are sent without the create flags pyroute2 sets by default,
+# newer kernels reject class deletes with them (EOPNOTSUPP)
+DEL_CLASS = (RTM_DELTCLASS, NLM_F_REQUEST | NLM_F_ACK)
+DEL_FILTER = (RTM_DELTFILTER, NLM_F_REQUEST | NLM_F_ACK)
+# Max number of requests sent in one batch. The ack of a failed request
+# echoes the request (about 2KB for a class), so a batch of acks must fit
+# in the socket receive buffer.
+MAX_BATCH_SIZE = 200
+RECV_BUFFER_SIZE = 1024 * 1024
+# Seconds to wait for the next reply of a batch or dump. The replies are
+# read with the lock held, a kernel that stops answering must not block the
+# other tc operations.
+REPLY_TIMEOUT = 5
+# Offset of the sequence number in the netlink message header
+NLMSG_SEQ_OFFSET = 8
+
+# A tc request: IPRoute.tc() positional and keyword arguments
+TcRequest = Tuple[tuple, dict]
 
 
 class TcOpsPyRoute2(TcOpsBase):
@@ -32,6 +66,10 @@ class TcOpsPyRoute2(TcOpsBase):
     """
     def __init__(self):
         self._ipr = IPRoute()
+        self._batch = IPBatch()
+        # Replies are read from the socket directly for batches, so requests
+        # must not be interleaved
+        self._lock = threading.Lock()
         self._iface_if_index = {}
         LOG.info("initialized")
 
@@ -53,13 +91,11 @@ class TcOpsPyRoute2(TcOpsBase):
 
         LOG.debug("Create HTB iface %s qid %s max_bw %s rate %s", iface, qid, max_bw, rate)
         try:
-            # API needs ceiling in bytes per sec.
-            max_bw = max_bw / 8
             if_index = self._get_if_index(iface)
-            htb_queue = QUEUE_PREFIX + qid
-            ret = self._ipr.tc("add-class", "htb", if_index,
-                               htb_queue, parent=parent_qid,
-                               rate=str(rate).lower(), ceil=max_bw, prio=1)
+            args, kwargs = self._htb_request(if_index, qid, max_bw, rate,
+                                             parent_qid)
+            with self._lock:
+                ret = self._ipr.tc(*args, **kwargs)
             LOG.debug("Return: %s", ret)
         except (ValueError, NetlinkError) as ex:
             LOG.error("create-htb error : %s", ex.code)
@@ -83,7 +119,8 @@ class TcOpsPyRoute2(TcOpsBase):
             if_index = self._get_if_index(iface)
             htb_queue = QUEUE_PREFIX + qid
 
-            ret = self._ipr.tc("del-class", "htb", if_index, htb_queue)
+            with self._lock:
+                ret = self._ipr.tc(DEL_CLASS, "htb", if_index, htb_queue)
             LOG.debug("Return: %s", ret)
         except (ValueError, NetlinkError) as ex:
             LOG.error("del-htb  error error : %s", ex.code)
@@ -100,12 +137,10 @@ class TcOpsPyRoute2(TcOpsBase):
         try:
             if_index = self._get_if_index(iface)
 
-            class_id = int(PARENT_ID) | int(qid, 16)
-            ret = self._ipr.tc("add-filter", "fw", if_index, int(mark, 16),
-                               parent=PARENT_ID,
-                               prio=1,
-                               protocol=proto,
-                               classid=class_id)
+            args, kwargs = self._filter_request("add-filter", if_index,
+                                                mark, qid, proto)
+            with self._lock:
+                ret = self._ipr.tc(*args, **kwargs)
             LOG.debug("Return: %s", ret)
 
         except (ValueError, NetlinkError) as ex:
@@ -123,13 +158,10 @@ class TcOpsPyRoute2(TcOpsBase):
         try:
             if_index = self._get_if_index(iface)
 
-            class_id = int(PARENT_ID) | int(qid, 16)
-
-            ret = self._ipr.tc("del-filter", "fw", if_index, int(mark, 16),
-                               parent=PARENT_ID,
-                               prio=1,
-                               protocol=proto,
-                               classid=class_id)
+            args, kwargs = self._filter_request(DEL_FILTER, if_index,
+                                                mark, qid, proto)
+            with self._lock:
+                ret = self._ipr.tc(*args, **kwargs)
             LOG.debug("Return: %s", ret)
         except (ValueError, NetlinkError) as ex:
             LOG.error("del-filter error : %s", ex.code)
@@ -158,10 +190,257 @@ class TcOpsPyRoute2(TcOpsBase):
 
         return 0
 
+    def create_batch(self, iface: str, classes: List[HtbClass]) -> List[int]:
+        """
+        Create HTB classes and their filters with batched netlink requests.
+        A filter created for a class that failed is deleted again.
+        """
+        try:
+            if_index = self._get_if_index(iface)
+        except NetlinkError as ex:
+            LOG.error("create-htb error : %s", ex.code)
+            return [ex.code] * len(classes)
+        requests = []
+        for htb in classes:
+            requests.append(self._htb_request(if_index, htb.qid, htb.max_bw,
+                                              htb.rate, htb.parent_qid))
+            if not htb.skip_filter:
+                requests.append(self._filter_request(
+                    "add-filter", if_index, htb.qid, htb.qid, PROTOCOL))
+        req_errs = iter(self._run_batch(requests))
+
+        errs = []
+        stale_filters = []
+        for htb in classes:
+            err = next(req_errs)
+            if not htb.skip_filter:
+                filter_err = next(req_errs)
+                if err and not filter_err:
+                    stale_filters.append(self._filter_request(
+                        DEL_FILTER, if_index, htb.qid, htb.qid, PROTOCOL))
+                err = err or filter_err
+            if err:
+                LOG.error("create-htb %s error : %s", htb.qid, err)
+            errs.append(err)
+        if stale_filters:
+            self._run_batch(stale_filters)
+        return errs
+
+    def delete_batch(self, iface: str, qids: List[str],
+                     skip_filter: bool = False) -> List[int]:
+        """
+        Delete HTB classes and their filters with batched netlink requests.
+        """
+        try:
+            if_index = self._get_if_index(iface)
+        except NetlinkError as ex:
+            LOG.error("del-htb error : %s", ex.code)
+            return [ex.code] * len(qids)
+        requests = []
+        for qid in qids:
+            if not skip_filter:
+                requests.append(self._filter_request(
+                    DEL_FILTER, if_index, qid, qid, PROTOCOL))
+            requests.append(((DEL_CLASS, "htb", if_index, QUEUE_PREFIX + qid),
+                             {}))
+        req_errs = self._run_batch(requests)
+        # Like del_htb, only errors of the class deletes are reported
+        step = 1 if skip_filter else 2
+        return req_errs[step - 1::step]
+
+    def read_classes(self, iface: str) -> List[Tuple[int, int]]:
+        """
+        Dump the HTB classes of an interface.
+
+        Returns:
+            (qid, parent qid) of each class but the root class.
+        """
+        try:
+            classes = self._get_classes(iface)
+        except NetlinkError as ex:
+            LOG.error("dump classes error : %s", ex.code)
+            return []
+        return [
+            (msg['handle'] & 0xFFFF, msg['parent'] & 0xFFFF)
+            for msg in classes
+            if msg.get_attr('TCA_KIND') == 'htb' and
+            msg['parent'] != TC_H_ROOT
+        ]
+
+    def get_class_rate(self, iface: str, qid: int) -> Optional[str]:
+        """
+        Returns the rate and ceiling of an HTB class, None if not found.
+        """
+        handle = PARENT_ID | qid
+        try:
+            classes = self._get_classes(iface)
+        except NetlinkError as ex:
+            LOG.error("dump classes error : %s", ex.code)
+            return None
+        for msg in classes:
+            if msg['handle'] != handle or msg.get_attr('TCA_KIND') != 'htb':
+                continue
+            parms = msg.get_nested('TCA_OPTIONS', 'TCA_HTB_PARMS')
+            # the API reports rates in bytes per sec.
+            return "{}bit ceil {}bit".format(parms['rate'] * 8,
+                                             parms['ceil'] * 8)
+        return None
+
+    def get_qdisc_type(self, iface: str) -> Optional[str]:
+        """
+        Returns the kind of the root qdisc of an interface.
+        """
+        try:
+            if_index = self._get_if_index(iface)
+            qdiscs = self._dump(RTM_GETQDISC, if_index)
+        except NetlinkError as ex:
+            LOG.error("dump qdiscs error : %s", ex.code)
+            return None
+        for msg in qdiscs:
+            # qdisc dumps are not filtered by interface
+            if msg['index'] == if_index and msg['parent'] == TC_H_ROOT:
+                return msg.get_attr('TCA_KIND')
+        return None
+
+    def _get_classes(self, iface: str):
+        return self._dump(RTM_GETTCLASS, self._get_if_index(iface))
+
+    def _dump(self, msg_type: int, if_index: int) -> list:
+        # IPRoute reads dumps with a 16KB buffer, which is too small for the
+        # dump messages of large class tables on recent kernels
+        request = tcmsg()
+        request['family'] = AF_UNSPEC
+        request['index'] = if_index
+        with self._lock:
+            # the socket is replaced if the dump times out
+            addr_pool = self._ipr.addr_pool
+            seq = addr_pool.alloc()
+            try:
+                self._batch.reset()
+                self._batch.nlm_request(request, msg_type)
+                struct.pack_into('=I', self._batch.batch, NLMSG_SEQ_OFFSET,
+                                 seq)
+                self._ipr.sendto(bytes(self._batch.batch), (0, 0))
+                msgs = []
+                while True:
+                    data = self._recv()
+                    for msg in self._ipr.marshal.parse(data):
+                        if msg['header']['sequence_number'] != seq:
+                            continue
+                        if msg['header']['type'] == NLMSG_DONE:
+                            return msgs
+                        err = msg['header'].get('error')
+                        if err is not None:
+                            raise err
+                        msgs.append(msg)
+            except socket.timeout:
+                self._reopen()
+                raise NetlinkError(errno.ETIMEDOUT, "No reply to tc dump")
+            finally:
+                addr_pool.free(seq, ban=0xff)
+                self._batch.reset()
+
+    def _htb_request(self, if_index, qid: str, max_bw: int, rate: str,
+                     parent_qid: str) -> TcRequest:
+        # API needs ceiling in bytes per sec.
+        return (("add-class", "htb", if_index, QUEUE_PREFIX + qid),
+                {'parent': parent_qid, 'rate': str(rate).lower(),
+                 'ceil': max_bw / 8, 'prio': 1})
+
+    def _filter_request(self, command, if_index, mark: str, qid: str,
+                        proto: int) -> TcRequest:
+        class_id = int(PARENT_ID) | int(qid, 16)
+        return ((command, "fw", if_index, int(mark, 16)),
+                {'parent': PARENT_ID, 'prio': 1, 'protocol': proto,
+                 'classid': class_id})
+
+    def _run_batch(self, requests: List[TcRequest]) -> List[int]:
+        """
+        Send tc requests over the netlink socket, MAX_BATCH_SIZE requests
+        per send. The kernel handles the requests in order and acks each of
+        them, a failed request doesn't stop the following ones.
+
+        Returns the error code of each request, zero on success.
+        """
+        errs = []
+        with self._lock:
+            for start in range(0, len(requests), MAX_BATCH_SIZE):
+                errs.extend(self._send_batch(
+                    requests[start:start + MAX_BATCH_SIZE]))
+        return errs
+
+    def _send_batch(self, requests: List[TcRequest]) -> List[int]:
+        errs = [0] * len(requests)
+        seqs = []
+        pending = {}
+        # the socket is replaced if the batch times out
+        addr_pool = self._ipr.addr_pool
+        self._batch.reset()
+        try:
+            for i, (args, kwargs) in enumerate(requests):
+                offset = len(self._batch.batch)
+                try:
+                    self._batch.tc(*args, **kwargs)
+                except ValueError as ex:
+                    LOG.debug(ex, exc_info=True)
+                    del self._batch.batch[offset:]
+                    errs[i] = -1
+                    continue
+                # IPBatch gives all the requests the same sequence number,
+                # set a unique one to match the acks
+                seq = addr_pool.alloc()
+                struct.pack_into('=I', self._batch.batch,
+                                 offset + NLMSG_SEQ_OFFSET, seq)
+                seqs.append(seq)
+                pending[seq] = i
+
+            if pending:
+                self._ipr.sendto(bytes(self._batch.batch), (0, 0))
+            while pending:
+                data = self._recv()
+                for msg in self._ipr.marshal.parse(data):
+                    i = pending.pop(msg['header']['sequence_number'], None)
+                    if i is None:
+                        continue
+                    err = msg['header'].get('error')
+                    if err is not None:
+                        errs[i] = err.code
+        except socket.timeout:
+            LOG.error("tc batch error : no reply to %d requests",
+                      len(pending))
+            for i in pending.values():
+                errs[i] = errno.ETIMEDOUT
+            self._reopen()
+        except OSError as ex:
+            LOG.error("tc batch error : %s", ex)
+            for i in pending.values():
+                errs[i] = ex.errno or -1
+        finally:
+            for seq in seqs:
+                addr_pool.free(seq, ban=0xff)
+            self._batch.reset()
+        return errs
+
+    def _recv(self) -> bytes:
+        ready, _, _ = select.select([self._ipr], [], [], REPLY_TIMEOUT)
+        if not ready:
+            raise socket.timeout("No netlink reply")
+        return self._ipr.recv(RECV_BUFFER_SIZE)
+
+    def _reopen(self):
+        # Late replies, or the rest of a dump the kernel keeps running
+        # (further dumps fail with EBUSY), are left on the timed out socket
+        self._ipr.close()
+        self._ipr = IPRoute()
+
     def _get_if_index(self, iface: str):
         if_index = self._iface_if_index.get(iface, -1)
         if if_index == -1:
-            if_index = self._ipr.link_lookup(ifname=iface)
+            if_indexes = self._ipr.link_lookup(ifname=iface)
+            if not if_indexes:
+                raise NetlinkError(errno.ENODEV,
+                                   "No such interface: {}".format(iface))
+            if_index = if_indexes[0]
             self._iface_if_index[iface] = if_index
 
         return if_index
@@ -20,9 +20,9 @@ from typing import List, Tuple
 
 import grpc
 from lte.protos import pipelined_pb2_grpc
-from lte.protos.apn_pb2 import AggregatedMaximumBitrate
 from lte.protos.mobilityd_pb2 import IPAddress
 from lte.protos.pipelined_pb2 import (
+    ActivateFlowsBatchResult,
     ActivateFlowsRequest,
     ActivateFlowsResult,
     AllTableAssignments,
@@ -53,6 +53,7 @@ from magma.pipelined.app.enforcement import EnforcementController
 from magma.pipelined.app.enforcement_stats import EnforcementStatsController
 from magma.pipelined.app.ipfix import IPFIXController
 from magma.pipelined.app.ng_services import NGServiceController
+from magma.pipelined.app.policy_mixin import RuleActivation
 from magma.pipelined.app.tunnel_learn import TunnelLearnController
 from magma.pipelined.app.ue_mac import UEMacAddressController
 from magma.pipelined.app.vlan_learn import VlanLearnController
@@ -73,6 +74,7 @@ from magma.pipelined.policy_converters import (
 
 grpc_msg_queue = queue.Queue()
 DEFAULT_CALL_TIMEOUT = 5
+DEFAULT_BATCH_CALL_TIMEOUT = 30
 
 
 class PipelinedRpcServicer(pipelined_pb2_grpc.PipelinedServicer):
@@ -106,6 +108,10 @@ class PipelinedRpcServicer(pipelined_pb2_grpc.PipelinedServicer):
             'call_timeout',
             DEFAULT_CALL_TIMEOUT,
         )
+        self._batch_call_timeout = service_config.get(
+            'batch_call_timeout',
+            DEFAULT_BATCH_CALL_TIMEOUT,
+        )
         self._print_grpc_payload = os.environ.get('MAGMA_PRINT_GRPC_PAYLOAD')
         if self._print_grpc_payload is None:
             self._print_grpc_payload = \
@@ -224,6 +230,43 @@ class PipelinedRpcServicer(pipelined_pb2_grpc.PipelinedServicer):
                                             deactivate_req)
             return ActivateFlowsResult()
 
+    def ActivateFlowsBatch(self, request, context):
+        """
+        Activate flows for many subscribers at once. Flows of all the
+        subscribers are installed together, with a single barrier per chunk
+        of flows.
+        """
+        self._log_grpc_payload(request)
+        if not self._service_manager.is_app_enabled(
+                EnforcementController.APP_NAME,
+        ):
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details('Service not enabled!')
+            return None
+
+        for controller in [
+            self._gy_app, self._enforcer_app,
+            self._enforcement_stats,
+        ]:
+            if not controller.is_controller_ready():
+                context.set_code(grpc.StatusCode.UNAVAILABLE)
+                context.set_details('Enforcement service not initialized!')
+                return ActivateFlowsBatchResult()
+
+        fut = Future()  # type: Future[ActivateFlowsBatchResult]
+        self._loop.call_soon_threadsafe(
+            self._activate_flows_batch, request.requests, fut,
+        )
+        try:
+            return fut.result(timeout=self._batch_call_timeout)
+        except concurrent.futures.TimeoutError:
+            logging.error("ActivateFlowsBatch request processing timed out")
+            deactivate_reqs = [get_deactivate_req(req)
+                               for req in request.requests]
+            self._loop.call_soon_threadsafe(self._deactivate_flows_batch,
+                                            deactivate_reqs)
+            return ActivateFlowsBatchResult()
+
     def _update_ipv6_prefix_store(self, ipv6_addr: bytes):
         ipv6_str = ipv6_addr.decode('utf-8')
         interface = get_ipv6_interface_id(ipv6_str)
@@ -270,157 +313,149 @@ class PipelinedRpcServicer(pipelined_pb2_grpc.PipelinedServicer):
                 policy.version,
             )
 
-    def _activate_flows(
+    def _get_rule_activations(
         self, request: ActivateFlowsRequest,
-        fut: 'Future[ActivateFlowsResult]',
-    ) -> None:
+    ) -> List[RuleActivation]:
         """
-        Activate flows for ipv4 / ipv6 or both
+        Returns a RuleActivation for ipv4 / ipv6 or both, and saves the rule
+        versions, ipv6 prefix and tunnels of the session
 
         CWF won't have an ip_addr passed
         """
-        ret = ActivateFlowsResult()
+        ip_addrs = []
         if self._service_config['setup_type'] == 'CWF' or request.ip_addr:
-            ipv4 = convert_ipv4_str_to_ip_proto(request.ip_addr)
-            if request.request_origin.type == RequestOriginType.GX:
-                ret_ipv4 = self._install_flows_gx(request, ipv4)
-            else:
-                ret_ipv4 = self._install_flows_gy(request, ipv4)
-            ret.policy_results.extend(ret_ipv4.policy_results)
+            ip_addrs.append(convert_ipv4_str_to_ip_proto(request.ip_addr))
         if request.ipv6_addr:
-            ipv6 = convert_ipv6_bytes_to_ip_proto(request.ipv6_addr)
+            ip_addrs.append(convert_ipv6_bytes_to_ip_proto(request.ipv6_addr))
             self._update_ipv6_prefix_store(request.ipv6_addr)
-            if request.request_origin.type == RequestOriginType.GX:
-                ret_ipv6 = self._install_flows_gx(request, ipv6)
-            else:
-                ret_ipv6 = self._install_flows_gy(request, ipv6)
-            ret.policy_results.extend(ret_ipv6.policy_results)
         if request.uplink_tunnel and request.downlink_tunnel:
             self._update_tunnel_map_store(
                 request.uplink_tunnel,
                 request.downlink_tunnel,
             )
 
-        fut.set_result(ret)
+        activations = []
+        for ip_addr in ip_addrs:
+            self._update_version(request, ip_addr)
+            activations.append(RuleActivation(
+                request.sid.id, request.msisdn, request.uplink_tunnel,
+                ip_addr, request.apn_ambr, request.policies,
+            ))
+        return activations
 
-    def _install_flows_gx(
+    def _activate_flows(
         self, request: ActivateFlowsRequest,
-        ip_address: IPAddress,
-    ) -> ActivateFlowsResult:
+        fut: 'Future[ActivateFlowsResult]',
+    ) -> None:
         """
         Ensure that the RuleModResult is only successful if the flows are
-        successfully added in both the enforcer app and enforcement_stats.
-        Install enforcement_stats flows first because even if the enforcement
-        flow install fails after, no traffic will be directed to the
-        enforcement_stats flows.
+        successfully added in both the enforcer app (or gy app) and
+        enforcement_stats. Install enforcement_stats flows first because even
+        if the enforcement flow install fails after, no traffic will be
+        directed to the enforcement_stats flows.
         """
-        logging.debug('Activating GX flows for %s', request.sid.id)
-        self._update_version(request, ip_address)
-        # Install rules in enforcement stats
-        enforcement_stats_res = self._activate_rules_in_enforcement_stats(
-            request.sid.id, request.msisdn, request.uplink_tunnel, ip_address, request.apn_ambr,
-            request.policies,
-        )
-
-        failed_policies_results = \
-            _retrieve_failed_results(enforcement_stats_res)
-        # Do not install any rules that failed to install in enforcement_stats.
-        policies = \
-            _filter_failed_policies(request, failed_policies_results)
-
-        enforcement_res = self._activate_rules_in_enforcement(
-            request.sid.id, request.msisdn, request.uplink_tunnel, ip_address, request.apn_ambr,
-            policies,
-        )
+        is_gx = request.request_origin.type == RequestOriginType.GX
+        ret = ActivateFlowsResult()
+        for activation in self._get_rule_activations(request):
+            logging.debug(
+                'Activating %s flows for %s', 'GX' if is_gx else 'GY',
+                activation.imsi,
+            )
+            stats_res = self._activate_rules_in_enforcement_stats(activation)
+            activation, failed_policies_results = \
+                _skip_failed_stats_rules(activation, stats_res)
+            if is_gx:
+                res = self._activate_rules_in_enforcement(activation)
+            else:
+                res = self._activate_rules_in_gy(activation)
+            ret.policy_results.extend(res.policy_results)
+            # Include the failed rules from enforcement_stats in the response.
+            ret.policy_results.extend(failed_policies_results)
 
-        # Include the failed rules from enforcement_stats in the response.
-        enforcement_res.policy_results.extend(
-            failed_policies_results,
-        )
-        return enforcement_res
+        fut.set_result(ret)
 
-    def _install_flows_gy(
-        self, request: ActivateFlowsRequest,
-        ip_address: IPAddress,
-    ) -> ActivateFlowsResult:
+    def _activate_flows_batch(
+        self, requests: List[ActivateFlowsRequest],
+        fut: 'Future[ActivateFlowsBatchResult]',
+    ) -> None:
         """
-        Ensure that the RuleModResult is only successful if the flows are
-        successfully added in both the enforcer app and enforcement_stats.
-        Install enforcement_stats flows first because even if the enforcement
-        flow install fails after, no traffic will be directed to the
-        enforcement_stats flows.
+        Activate flows for ipv4 / ipv6 or both of many subscribers. As in
+        _activate_flows, rules are installed in enforcement_stats first, and
+        only the rules that succeeded there are installed in enforcement (GX)
+        or gy (GY).
         """
-        logging.debug('Activating GY flows for %s', request.sid.id)
-        self._update_version(request, ip_address)
-        # Install rules in enforcement stats
-        enforcement_stats_res = self._activate_rules_in_enforcement_stats(
-            request.sid.id, request.msisdn, request.uplink_tunnel, ip_address, request.apn_ambr,
-            request.policies,
-        )
-
-        failed_policies_results = \
-            _retrieve_failed_results(enforcement_stats_res)
-        # Do not install any rules that failed to install in enforcement_stats.
-        policies = \
-            _filter_failed_policies(request, failed_policies_results)
+        ret = [ActivateFlowsResult() for _ in requests]
+        # (request index, RuleActivation, is gx)
+        activations = []
+        for i, request in enumerate(requests):
+            is_gx = request.request_origin.type == RequestOriginType.GX
+            for activation in self._get_rule_activations(request):
+                activations.append((i, activation, is_gx))
+
+        if self._service_manager.is_app_enabled(
+                EnforcementStatsController.APP_NAME,
+        ):
+            stats_results = self._enforcement_stats.activate_rules_batch(
+                [activation for _, activation, _ in activations],
+            )
+        else:
+            stats_results = [ActivateFlowsResult() for _ in activations]
+
+        gx_activations = []
+        gy_activations = []
+        for (i, activation, is_gx), stats_res in \
+                zip(activations, stats_results):
+            activation, failed_policies_results = \
+                _skip_failed_stats_rules(activation, stats_res)
+            if is_gx:
+                gx_activations.append((i, activation, failed_policies_results))
+            else:
+                gy_activations.append((i, activation, failed_policies_results))
 
-        gy_res = self._activate_rules_in_gy(
-            request.sid.id, request.msisdn, request.uplink_tunnel,
-            ip_address, request.apn_ambr,
-            policies,
-        )
+        for app, app_activations in [
+            (self._enforcer_app, gx_activations),
+            (self._gy_app, gy_activations),
+        ]:
+            if not app_activations:
+                continue
+            app_results = app.activate_rules_batch(
+                [activation for _, activation, _ in app_activations],
+            )
+            for (i, activation, failed_policies_results), res in \
+                    zip(app_activations, app_results):
+                if app is self._enforcer_app:
+                    _report_enforcement_failures(res, activation.imsi)
+                ret[i].policy_results.extend(res.policy_results)
+                # Include the failed rules from enforcement_stats in the
+                # response.
+                ret[i].policy_results.extend(failed_policies_results)
 
-        # Include the failed rules from enforcement_stats in the response.
-        gy_res.policy_results.extend(failed_policies_results)
-        return gy_res
+        fut.set_result(ActivateFlowsBatchResult(results=ret))
 
     def _activate_rules_in_enforcement_stats(
-        self, imsi: str,
-        msisdn: bytes,
-        uplink_tunnel: int,
-        ip_addr: IPAddress,
-        apn_ambr: AggregatedMaximumBitrate,
-        policies: List[VersionedPolicy],
+        self, activation: RuleActivation,
     ) -> ActivateFlowsResult:
         if not self._service_manager.is_app_enabled(
                 EnforcementStatsController.APP_NAME,
         ):
             return ActivateFlowsResult()
 
-        enforcement_stats_res = self._enforcement_stats.activate_rules(
-            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, policies,
-        )
-        _report_enforcement_stats_failures(enforcement_stats_res, imsi)
-        return enforcement_stats_res
+        return self._enforcement_stats.activate_rules(*activation)
 
     def _activate_rules_in_enforcement(
-        self, imsi: str, msisdn: bytes,
-        uplink_tunnel: int,
-        ip_addr: IPAddress,
-        apn_ambr: AggregatedMaximumBitrate,
-        policies: List[VersionedPolicy],
+        self, activation: RuleActivation,
     ) -> ActivateFlowsResult:
         # TODO: this will crash pipelined if called with both static rules
         # and dynamic rules at the same time
-        enforcement_res = self._enforcer_app.activate_rules(
-            imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, policies,
-        )
+        enforcement_res = self._enforcer_app.activate_rules(*activation)
         # TODO ?? Should the enforcement failure be reported per imsi session
-        _report_enforcement_failures(enforcement_res, imsi)
+        _report_enforcement_failures(enforcement_res, activation.imsi)
         return enforcement_res
 
     def _activate_rules_in_gy(
-        self, imsi: str, msisdn: bytes,
-        uplink_tunnel: int,
-        ip_addr: IPAddress,
-        apn_ambr: AggregatedMaximumBitrate,
-        policies: List[VersionedPolicy],
+        self, activation: RuleActivation,
     ) -> ActivateFlowsResult:
-        gy_res = self._gy_app.activate_rules(
-            imsi, msisdn, uplink_tunnel,
-            ip_addr, apn_ambr,
-            policies,
-        )
+        gy_res = self._gy_app.activate_rules(*activation)
         # TODO: add metrics
         return gy_res
 
@@ -448,6 +483,42 @@ class PipelinedRpcServicer(pipelined_pb2_grpc.PipelinedServicer):
         self._loop.call_soon_threadsafe(self._deactivate_flows, request)
         return DeactivateFlowsResult()
 
+    def DeactivateFlowsBatch(self, request, context):
+        """
+        Deactivate flows for many subscribers at once
+
+        This saves the gRPC round trip and event loop hop of each request.
+        The flow deletes are sent without waiting for a barrier, and flows
+        of different subscribers can't be matched by one delete, so they
+        are sent as for DeactivateFlows.
+        """
+        self._log_grpc_payload(request)
+        if not self._service_manager.is_app_enabled(
+                EnforcementController.APP_NAME,
+        ):
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details('Service not enabled!')
+            return None
+
+        for controller in [
+            self._gy_app, self._enforcer_app,
+            self._enforcement_stats,
+        ]:
+            if not controller.is_controller_ready():
+                context.set_code(grpc.StatusCode.UNAVAILABLE)
+                context.set_details('Enforcement service not initialized!')
+                return DeactivateFlowsResult()
+
+        self._loop.call_soon_threadsafe(
+            self._deactivate_flows_batch, request.requests,
+        )
+        return DeactivateFlowsResult()
+
+    def _deactivate_flows_batch(self, requests):
+        # One event loop callback for the whole batch
+        for request in requests:
+            self._deactivate_flows(request)
+
     def _deactivate_flows(self, request):
         """
         Deactivate flows for ipv4 / ipv6 or both
@@ -986,16 +1057,31 @@ def _retrieve_failed_results(
 
 
 def _filter_failed_policies(
-    request: ActivateFlowsRequest,
+    activation: RuleActivation,
     failed_results: List[RuleModResult],
 ) -> List[VersionedPolicy]:
     failed_policies = [result.rule_id for result in failed_results]
     return [
-        policy for policy in request.policies if
+        policy for policy in activation.policies if
         policy.rule.id not in failed_policies
     ]
 
 
+def _skip_failed_stats_rules(
+    activation: RuleActivation,
+    enforcement_stats_res: ActivateFlowsResult,
+) -> Tuple[RuleActivation, List[RuleModResult]]:
+    """
+    Do not install any rules that failed to install in enforcement_stats.
+    Returns the activation without those rules, and their failed results.
+    """
+    _report_enforcement_stats_failures(enforcement_stats_res, activation.imsi)
+    failed_policies_results = _retrieve_failed_results(enforcement_stats_res)
+    return activation._replace(
+        policies=_filter_failed_policies(activation, failed_policies_results),
+    ), failed_policies_results
+
+
 def _report_enforcement_failures(
     activate_flow_result: ActivateFlowsResult,
     imsi: str,
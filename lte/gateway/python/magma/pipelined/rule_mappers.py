@@ -10,9 +10,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import json
 import threading
-from collections import namedtuple
+from typing import Dict
 
 from lte.protos.mobilityd_pb2 import IPAddress
 from magma.common.redis.client import get_default_client
@@ -24,8 +23,6 @@ from magma.common.redis.serializers import (
 )
 from magma.pipelined.imsi import encode_imsi
 
-SubscriberRuleKey = namedtuple('SubscriberRuleKey', 'key_type imsi ip_addr rule_id')
-
 
 class RuleIDToNumMapper:
     """
@@ -33,6 +30,11 @@ class RuleIDToNumMapper:
 
     This class assigns integers to rule ids so that they can be identified in
     an openflow register. The methods can be called from multiple threads
+
+    Rule numbers are never reassigned, so both directions of the mapping are
+    kept in memory and read without locking. When Redis is enabled, the
+    mapping is loaded from Redis once on setup and new rules are written
+    through to Redis.
     """
 
     def __init__(self):
@@ -40,11 +42,30 @@ class RuleIDToNumMapper:
         self._curr_rule_num = 1
         self._rule_nums_by_rule = {}
         self._rules_by_rule_num = {}
+        self._rule_nums_by_rule_store = None
+        self._rules_by_rule_num_store = None
         self._lock = threading.Lock()  # write lock
 
     def setup_redis(self):
-        self._rule_nums_by_rule = RuleIDDict()
-        self._rules_by_rule_num = RuleNameDict()
+        rule_nums_by_rule_store = RuleIDDict()
+        rules_by_rule_num_store = RuleNameDict()
+        with self._lock:
+            # Rules are written to both dicts, but a rule could be missing
+            # from one if pipelined stopped in between
+            for rule_num, rule_id in rules_by_rule_num_store.items():
+                self._add_rule(rule_id, int(rule_num))
+            for rule_id, rule_num in rule_nums_by_rule_store.items():
+                self._add_rule(rule_id, rule_num)
+            self._rule_nums_by_rule_store = rule_nums_by_rule_store
+            self._rules_by_rule_num_store = rules_by_rule_num_store
+
+    def _add_rule(self, rule_id, rule_num):
+        """ NOT thread safe """
+        # The rule number is mapped first so that a rule number read by
+        # another thread can always be mapped back to its rule
+        self._rules_by_rule_num[rule_num] = rule_id
+        self._rule_nums_by_rule.setdefault(rule_id, rule_num)
+        self._curr_rule_num = max(self._curr_rule_num, rule_num + 1)
 
     def _register_rule(self, rule_id):
         """ NOT thread safe """
@@ -52,27 +73,25 @@ class RuleIDToNumMapper:
         if rule_num is not None:
             return rule_num
         rule_num = self._curr_rule_num
-        self._rule_nums_by_rule[rule_id] = rule_num
-        self._rules_by_rule_num[rule_num] = rule_id
-        self._curr_rule_num += 1
+        if self._rules_by_rule_num_store is not None:
+            self._rules_by_rule_num_store[rule_num] = rule_id
+            self._rule_nums_by_rule_store[rule_id] = rule_num
+        self._add_rule(rule_id, rule_num)
 
         return rule_num
 
     def get_rule_num(self, rule_id):
-        with self._lock:
-            return self._rule_nums_by_rule[rule_id]
+        return self._rule_nums_by_rule[rule_id]
 
     def get_or_create_rule_num(self, rule_id):
-        with self._lock:
-            rule_num = self._rule_nums_by_rule.get(rule_id)
-
-            if rule_num is None:
-                return self._register_rule(rule_id)
+        rule_num = self._rule_nums_by_rule.get(rule_id)
+        if rule_num is not None:
             return rule_num
+        with self._lock:
+            return self._register_rule(rule_id)
 
     def get_rule_id(self, rule_num):
-        with self._lock:
-            return self._rules_by_rule_num[rule_num]
+        return self._rules_by_rule_num[rule_num]
 
 
 class SessionRuleToVersionMapper:
@@ -82,49 +101,49 @@ class SessionRuleToVersionMapper:
     This class assigns version numbers to rule id & subscriber id combinations
     that can be used in an openflow register. The methods can be called from
     multiple threads.
+
+    Versions are indexed by subscriber, then by ip address and then by rule
+    id, so that the versions of a subscriber are removed without going
+    through the versions of the other subscribers.
     """
 
     def __init__(self):
-        self._version_by_imsi_and_rule = {}
+        # imsi -> ip address -> rule id -> version
+        self._version_by_imsi_and_rule = \
+            {}  # type: Dict[str, Dict[str, Dict[str, int]]]
         self._lock = threading.Lock()  # write lock
 
     def _save_version_unsafe(self, imsi: str, ip_addr: str, rule_id: str,
                              version):
-        key = self._get_json_key(encode_imsi(imsi), ip_addr, rule_id)
-        self._version_by_imsi_and_rule[key] = version
+        versions_by_ip = self._version_by_imsi_and_rule.setdefault(
+            encode_imsi(imsi), {})
+        versions_by_ip.setdefault(ip_addr, {})[rule_id] = version
 
     def remove_all_ue_versions(self, imsi: str, ip_addr: IPAddress):
         """
-        Increment the version number for a given subscriber and rule. If the
-        rule id is not specified, then all rules for the subscriber will be
-        incremented.
+        Remove the versions of all the rules of a subscriber. If the ip
+        address is not specified, the versions for all the ip addresses of
+        the subscriber are removed.
         """
         encoded_imsi = encode_imsi(imsi)
-        if ip_addr is None or ip_addr.address is None:
-            ip_addr_str = ""
-        else:
-            ip_addr_str = ip_addr.address.decode('utf-8').strip()
-        del_list = []
+        ip_addr_str = _get_ip_addr_str(ip_addr)
         with self._lock:
-            for k in self._version_by_imsi_and_rule.keys():
-                _, cur_imsi, cur_ip_addr_str, _ = SubscriberRuleKey(*json.loads(k))
-                if cur_imsi == encoded_imsi and (ip_addr_str == "" or
-                                                 ip_addr_str == cur_ip_addr_str):
-                    del_list.append(k)
-            for k in del_list:
-                del self._version_by_imsi_and_rule[k]
+            if ip_addr_str == "":
+                self._version_by_imsi_and_rule.pop(encoded_imsi, None)
+                return
+            versions_by_ip = self._version_by_imsi_and_rule.get(encoded_imsi)
+            if versions_by_ip is None:
+                return
+            versions_by_ip.pop(ip_addr_str, None)
+            if not versions_by_ip:
+                del self._version_by_imsi_and_rule[encoded_imsi]
 
     def save_version(self, imsi: str, ip_addr: IPAddress,
                      rule_id: [str], version: int):
         """
-        Increment the version number for a given subscriber and rule. If the
-        rule id is not specified, then all rules for the subscriber will be
-        incremented.
+        Save the version number for a given subscriber and rule.
         """
-        if ip_addr is None or ip_addr.address is None:
-            ip_addr_str = ""
-        else:
-            ip_addr_str = ip_addr.address.decode('utf-8').strip()
+        ip_addr_str = _get_ip_addr_str(ip_addr)
         with self._lock:
             self._save_version_unsafe(imsi, ip_addr_str, rule_id, version)
 
@@ -132,37 +151,40 @@ class SessionRuleToVersionMapper:
         """
         Returns the version number given a subscriber and a rule.
         """
-        if ip_addr is None or ip_addr.address is None:
-            ip_addr_str = ""
-        else:
-            ip_addr_str = ip_addr.address.decode('utf-8').strip()
-        key = self._get_json_key(encode_imsi(imsi), ip_addr_str, rule_id)
+        ip_addr_str = _get_ip_addr_str(ip_addr)
+        encoded_imsi = encode_imsi(imsi)
         with self._lock:
-            version = self._version_by_imsi_and_rule.get(key)
-            if version is None:
-                version = -1
-        return version
+            versions = self._version_by_imsi_and_rule.get(
+                encoded_imsi, {}).get(ip_addr_str, {})
+            return versions.get(rule_id, -1)
 
     def remove(self, imsi: str, ip_addr: IPAddress, rule_id: str, version: int):
         """
         Removed the element from redis if the passed version matches the
         current one
         """
-        if ip_addr is None or ip_addr.address is None:
-            ip_addr_str = ""
-        else:
-            ip_addr_str = ip_addr.address.decode('utf-8').strip()
-        key = self._get_json_key(encode_imsi(imsi), ip_addr_str, rule_id)
+        if version is None:
+            return
+        ip_addr_str = _get_ip_addr_str(ip_addr)
+        encoded_imsi = encode_imsi(imsi)
         with self._lock:
-            cur_version = self._version_by_imsi_and_rule.get(key)
-            if version is None:
+            versions_by_ip = self._version_by_imsi_and_rule.get(encoded_imsi)
+            if versions_by_ip is None:
                 return
-            if cur_version == version:
-                del self._version_by_imsi_and_rule[key]
+            versions = versions_by_ip.get(ip_addr_str)
+            if versions is None or versions.get(rule_id) != version:
+                return
+            del versions[rule_id]
+            if not versions:
+                del versions_by_ip[ip_addr_str]
+                if not versions_by_ip:
+                    del self._version_by_imsi_and_rule[encoded_imsi]
+
 
-    def _get_json_key(self, imsi: str, ip_addr: str, rule_id: str):
-        return json.dumps(SubscriberRuleKey('imsi_rule', imsi, ip_addr,
-                                            rule_id))
+def _get_ip_addr_str(ip_addr: IPAddress) -> str:
+    if ip_addr is None or ip_addr.address is None:
+        return ""
+    return ip_addr.address.decode('utf-8').strip()
 
 
 class RuleIDDict(RedisFlatDict):
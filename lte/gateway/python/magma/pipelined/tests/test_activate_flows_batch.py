@@ -0,0 +1,345 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from lte.protos.pipelined_pb2 import (
+    ActivateFlowsBatchRequest,
+    ActivateFlowsRequest,
+    ActivateFlowsResult,
+    DeactivateFlowsBatchRequest,
+    DeactivateFlowsRequest,
+    RequestOriginType,
+    RuleModResult,
+    VersionedPolicy,
+    VersionedPolicyID,
+)
+from lte.protos.policydb_pb2 import PolicyRule
+from lte.protos.subscriberdb_pb2 import SubscriberID
+from magma.pipelined.app import policy_mixin
+from magma.pipelined.app.policy_mixin import PolicyMixin, RuleActivation
+from magma.pipelined.openflow.messages import MsgChannel
+from magma.pipelined.policy_converters import (
+    FlowMatchError,
+    convert_ipv4_str_to_ip_proto,
+)
+from magma.pipelined.rpc_servicer import PipelinedRpcServicer
+
+
+class _PolicyApp(PolicyMixin):
+    """
+    Policy app whose rules are installed with one flow msg per flow of the
+    rule, and which fails to build the msgs of rules without flows
+    """
+
+    def __init__(self):
+        self._datapath = MagicMock()
+        self._msg_hub = MagicMock()
+        self._handle_rule_install_failure = MagicMock()
+        self.logger = MagicMock()
+
+    def _get_rule_match_flow_msgs(
+        self, imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version,
+    ):
+        if not rule.flow_list:
+            raise FlowMatchError("No flows")
+        return [(rule.id, i) for i in range(len(rule.flow_list))]
+
+    def _get_default_flow_msgs_for_subscriber(self, imsi, ip_addr):
+        return []
+
+    def _install_flow_for_rule(
+        self, imsi, msisdn, uplink_tunnel, ip_addr, apn_ambr, rule, version,
+    ):
+        pass
+
+    def _install_default_flow_for_subscriber(self, imsi, ip_addr):
+        pass
+
+    def _install_redirect_flow(self, imsi, ip_addr, rule, version):
+        pass
+
+
+def _policy(rule_id, flow_count):
+    rule = PolicyRule(id=rule_id)
+    for _ in range(flow_count):
+        rule.flow_list.add()
+    return VersionedPolicy(rule=rule, version=1)
+
+
+def _activation(imsi, policies):
+    return RuleActivation(
+        imsi, b'', 0, convert_ipv4_str_to_ip_proto('192.168.128.1'), None,
+        policies,
+    )
+
+
+def _msg_result(ok=True):
+    result = MagicMock()
+    result.ok.return_value = ok
+    result.exception.return_value = None if ok else "Flow mod failed"
+    return result
+
+
+class ActivateRulesBatchTest(unittest.TestCase):
+    """
+    Tests for the chunked flow msgs sent by PolicyMixin.activate_rules_batch
+    """
+
+    def setUp(self):
+        self._app = _PolicyApp()
+        self._chan = MagicMock()
+        chunk_size_patcher = patch.object(
+            policy_mixin, 'BATCH_MSG_CHUNK_SIZE', 3,
+        )
+        chan_patcher = patch.object(
+            policy_mixin, 'MsgChannel', return_value=self._chan,
+            Timeout=MsgChannel.Timeout,
+        )
+        chunk_size_patcher.start()
+        chan_patcher.start()
+        self.addCleanup(chunk_size_patcher.stop)
+        self.addCleanup(chan_patcher.stop)
+
+    def _sent_chunks(self):
+        return [args[0] for args, _ in self._app._msg_hub.send.call_args_list]
+
+    def test_chunk_boundary(self):
+        """ test msgs filling exactly one chunk are sent in one chunk """
+        self._chan.get.side_effect = [_msg_result()] * 3
+        results = self._app.activate_rules_batch([
+            _activation('IMSI001', [_policy('rule1', 2)]),
+            _activation('IMSI002', [_policy('rule2', 1)]),
+        ])
+
+        self.assertEqual(
+            self._sent_chunks(),
+            [[('rule1', 0), ('rule1', 1), ('rule2', 0)]],
+        )
+        self.assertEqual(self._chan.get.call_count, 3)
+        self.assertEqual(
+            [[r.result for r in res.policy_results] for res in results],
+            [[RuleModResult.SUCCESS], [RuleModResult.SUCCESS]],
+        )
+
+    def test_chunk_boundary_overflow(self):
+        """ test one msg over the chunk size is sent in a second chunk """
+        self._chan.get.side_effect = [_msg_result()] * 4
+        self._app.activate_rules_batch([
+            _activation('IMSI001', [_policy('rule1', 2)]),
+            _activation('IMSI002', [_policy('rule2', 2)]),
+        ])
+
+        self.assertEqual(
+            self._sent_chunks(),
+            [
+                [('rule1', 0), ('rule1', 1), ('rule2', 0)],
+                [('rule2', 1)],
+            ],
+        )
+        self.assertEqual(self._chan.get.call_count, 4)
+
+    def test_single_rule_failure(self):
+        """ test a failed msg only fails the rule it belongs to """
+        self._chan.get.side_effect = [
+            _msg_result(), _msg_result(), _msg_result(),
+            _msg_result(ok=False), _msg_result(),
+        ]
+        results = self._app.activate_rules_batch([
+            _activation('IMSI001', [_policy('rule1', 2), _policy('rule2', 2)]),
+            _activation('IMSI002', [_policy('rule3', 1), _policy('rule4', 0)]),
+        ])
+
+        self.assertEqual(
+            [[(r.rule_id, r.result) for r in res.policy_results]
+             for res in results],
+            [
+                [('rule1', RuleModResult.SUCCESS),
+                 ('rule2', RuleModResult.FAILURE)],
+                [('rule3', RuleModResult.SUCCESS),
+                 ('rule4', RuleModResult.FAILURE)],
+            ],
+        )
+        # rule4 had no msgs to send, so there are no flows to clean up
+        self._app._handle_rule_install_failure.assert_called_once_with(
+            'IMSI001', convert_ipv4_str_to_ip_proto('192.168.128.1'),
+            'rule2',
+        )
+
+    def test_no_response(self):
+        """ test rules whose msgs got no response fail """
+        self._chan.get.side_effect = [
+            _msg_result(), MsgChannel.Timeout(),
+        ]
+        results = self._app.activate_rules_batch([
+            _activation('IMSI001', [_policy('rule1', 1)]),
+            _activation('IMSI002', [_policy('rule2', 1)]),
+        ])
+
+        self.assertEqual(
+            [[r.result for r in res.policy_results] for res in results],
+            [[RuleModResult.SUCCESS], [RuleModResult.FAILURE]],
+        )
+
+
+class PipelinedRpcServicerBatchTest(unittest.TestCase):
+    """
+    Tests for the batched ActivateFlows/DeactivateFlows RPCs
+    """
+
+    def setUp(self):
+        loop = MagicMock()
+        loop.call_soon_threadsafe.side_effect = lambda f, *args: f(*args)
+        self._gy_app = MagicMock()
+        self._enforcer_app = MagicMock()
+        self._enforcement_stats = MagicMock()
+        self._service_manager = MagicMock()
+        self._service_manager.is_app_enabled.return_value = True
+        self._servicer = PipelinedRpcServicer(
+            loop, self._gy_app, self._enforcer_app, self._enforcement_stats,
+            *[MagicMock()] * 9, {'setup_type': 'LTE'}, self._service_manager,
+        )
+
+    def _activate_req(self, imsi, origin_type, rule_ids):
+        return ActivateFlowsRequest(
+            sid=SubscriberID(id=imsi),
+            ip_addr='192.168.128.1',
+            policies=[
+                VersionedPolicy(rule=PolicyRule(id=rule_id), version=1)
+                for rule_id in rule_ids
+            ],
+            request_origin=RequestOriginType(type=origin_type),
+        )
+
+    def _deactivate_req(self, imsi, origin_type, rule_ids):
+        return DeactivateFlowsRequest(
+            sid=SubscriberID(id=imsi),
+            ip_addr='192.168.128.1',
+            policies=[
+                VersionedPolicyID(rule_id=rule_id, version=1)
+                for rule_id in rule_ids
+            ],
+            request_origin=RequestOriginType(type=origin_type),
+        )
+
+    def test_activate_flows_batch(self):
+        """
+        test rules failing in enforcement_stats aren't installed in
+        enforcement, and GY rules go to the gy app
+        """
+        self._enforcement_stats.activate_rules_batch.return_value = [
+            ActivateFlowsResult(policy_results=[
+                RuleModResult(rule_id='rule1', version=1,
+                              result=RuleModResult.SUCCESS),
+                RuleModResult(rule_id='rule2', version=1,
+                              result=RuleModResult.FAILURE),
+            ]),
+            ActivateFlowsResult(policy_results=[
+                RuleModResult(rule_id='rule3', version=1,
+                              result=RuleModResult.SUCCESS),
+            ]),
+        ]
+        self._enforcer_app.activate_rules_batch.side_effect = \
+            lambda activations: [
+                ActivateFlowsResult(policy_results=[
+                    RuleModResult(rule_id=p.rule.id, version=p.version,
+                                  result=RuleModResult.SUCCESS)
+                    for p in activation.policies
+                ]) for activation in activations
+            ]
+        self._gy_app.activate_rules_batch.side_effect = \
+            self._enforcer_app.activate_rules_batch.side_effect
+
+        res = self._servicer.ActivateFlowsBatch(
+            ActivateFlowsBatchRequest(requests=[
+                self._activate_req('IMSI001', RequestOriginType.GX,
+                                   ['rule1', 'rule2']),
+                self._activate_req('IMSI002', RequestOriginType.GY,
+                                   ['rule3']),
+            ]),
+            MagicMock(),
+        )
+
+        gx_activations, = \
+            self._enforcer_app.activate_rules_batch.call_args[0]
+        self.assertEqual(
+            [p.rule.id for p in gx_activations[0].policies], ['rule1'],
+        )
+        gy_activations, = self._gy_app.activate_rules_batch.call_args[0]
+        self.assertEqual(gy_activations[0].imsi, 'IMSI002')
+        self.assertEqual(
+            [[(r.rule_id, r.result) for r in result.policy_results]
+             for result in res.results],
+            [
+                [('rule1', RuleModResult.SUCCESS),
+                 ('rule2', RuleModResult.FAILURE)],
+                [('rule3', RuleModResult.SUCCESS)],
+            ],
+        )
+
+    def test_activate_flows(self):
+        """ test ActivateFlows shares the enforcement_stats filtering """
+        self._enforcement_stats.activate_rules.return_value = \
+            ActivateFlowsResult(policy_results=[
+                RuleModResult(rule_id='rule2', version=1,
+                              result=RuleModResult.FAILURE),
+            ])
+        self._enforcer_app.activate_rules.return_value = \
+            ActivateFlowsResult(policy_results=[
+                RuleModResult(rule_id='rule1', version=1,
+                              result=RuleModResult.SUCCESS),
+            ])
+
+        res = self._servicer.ActivateFlows(
+            self._activate_req('IMSI001', RequestOriginType.GX,
+                               ['rule1', 'rule2']),
+            MagicMock(),
+        )
+
+        policies = self._enforcer_app.activate_rules.call_args[0][-1]
+        self.assertEqual([p.rule.id for p in policies], ['rule1'])
+        self._gy_app.activate_rules.assert_not_called()
+        self.assertEqual(
+            [(r.rule_id, r.result) for r in res.policy_results],
+            [('rule1', RuleModResult.SUCCESS),
+             ('rule2', RuleModResult.FAILURE)],
+        )
+
+    def test_deactivate_flows_batch(self):
+        """ test each request is deactivated in the apps of its origin """
+        self._servicer.DeactivateFlowsBatch(
+            DeactivateFlowsBatchRequest(requests=[
+                self._deactivate_req('IMSI001', RequestOriginType.GX,
+                                     ['rule1']),
+                self._deactivate_req('IMSI002', RequestOriginType.GY,
+                                     ['rule2']),
+                self._deactivate_req('IMSI003', RequestOriginType.WILDCARD,
+                                     []),
+            ]),
+            MagicMock(),
+        )
+
+        ipv4 = convert_ipv4_str_to_ip_proto('192.168.128.1')
+        self.assertEqual(
+            self._enforcer_app.deactivate_rules.call_args_list,
+            [call('IMSI001', ipv4, ['rule1']), call('IMSI003', ipv4, [])],
+        )
+        self.assertEqual(
+            self._gy_app.deactivate_rules.call_args_list,
+            [call('IMSI002', ipv4, ['rule2']), call('IMSI003', ipv4, [])],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
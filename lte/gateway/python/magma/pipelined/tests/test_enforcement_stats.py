@@ -14,7 +14,8 @@ limitations under the License.
 import unittest
 import warnings
 from concurrent.futures import Future
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from lte.protos.mconfig.mconfigs_pb2 import PipelineD
 from lte.protos.pipelined_pb2 import VersionedPolicy
@@ -25,7 +26,11 @@ from lte.protos.policydb_pb2 import (
     RedirectInformation,
 )
 from magma.pipelined.app.enforcement import EnforcementController
+from magma.pipelined.app.enforcement_stats import EnforcementStatsController
+from magma.pipelined.app.policy_mixin import PROCESS_STATS
 from magma.pipelined.bridge_util import BridgeTools
+from magma.pipelined.imsi import encode_imsi
+from magma.pipelined.openflow.registers import Direction
 from magma.pipelined.policy_converters import (
     convert_ipv4_str_to_ip_proto,
     convert_ipv6_bytes_to_ip_proto,
@@ -56,6 +61,8 @@ from magma.pipelined.tests.pipelined_test_util import (
     wait_for_enforcement_stats,
 )
 from magma.pipelined.openflow import flows
+from ryu.ofproto import ofproto_v1_4_parser
+from ryu.ofproto.ofproto_v1_4 import OFPMPF_REPLY_MORE
 from scapy.all import IP
 
 
@@ -731,5 +738,215 @@ class EnforcementStatsTest(unittest.TestCase):
         self.assertEqual(len(stats), 1)
         
         
+class EnforcementStatsUsageTest(unittest.TestCase):
+    """
+    Tests the usage aggregation of EnforcementStatsController on hand built
+    flow stats replies, without a datapath.
+    """
+    TBL_NUM = 5
+    IMSI = 'IMSI010000000088888'
+    UE_IP = '192.168.128.74'
+
+    def setUp(self):
+        service_manager = MagicMock()
+        service_manager.get_table_num.return_value = self.TBL_NUM
+        self.rule_mapper = MagicMock()
+        self.rule_mapper.get_rule_id.side_effect = \
+            lambda rule_num: 'rule%d' % rule_num
+        version_mapper = MagicMock()
+        version_mapper.get_version.return_value = 1
+        loop = MagicMock()
+        loop.call_soon_threadsafe = lambda cmd, *args: cmd(*args)
+        self.sessiond = MagicMock()
+        config = {
+            'bridge_name': 'testing_br',
+            'clean_restart': True,
+            'setup_type': 'LTE',
+            'enforcement': {
+                'poll_interval': 2,
+                'default_drop_flow_name': 'drop_flow',
+                'delta_stats_reporting': False,
+            },
+        }
+        with patch('magma.pipelined.app.base.BridgeTools.get_datapath_id',
+                   return_value=1), \
+                patch('magma.pipelined.app.enforcement_stats.hub.spawn'):
+            self.controller = EnforcementStatsController(
+                service_manager,
+                config=config,
+                app_futures={'startup_flows': Future()},
+                dpset=MagicMock(),
+                loop=loop,
+                rpc_stubs={'sessiond': self.sessiond},
+                rule_id_mapper=self.rule_mapper,
+                session_rule_version_mapper=version_mapper,
+            )
+        self.controller.init_finished = True
+
+    def _flow(self, rule_num, direction, byte_count, packet_count=0):
+        ip_field = 'ipv4_src' if direction == Direction.OUT else 'ipv4_dst'
+        match = ofproto_v1_4_parser.OFPMatch(
+            **{'metadata': encode_imsi(self.IMSI), 'reg1': direction.value,
+               'reg3': PROCESS_STATS, 'reg4': 1, 'eth_type': 0x0800,
+               ip_field: self.UE_IP})
+        return ofproto_v1_4_parser.OFPFlowStats(
+            table_id=self.TBL_NUM, priority=10, cookie=rule_num,
+            packet_count=packet_count, byte_count=byte_count, match=match)
+
+    def _record_key(self, rule_num):
+        return '{}|rule{}|{}|1'.format(self.IMSI, rule_num, self.UE_IP)
+
+    def _poll(self, *parts):
+        """ Handle a stats reply of one or more parts """
+        for i, body in enumerate(parts):
+            flags = OFPMPF_REPLY_MORE if i < len(parts) - 1 else 0
+            self.controller._handle_flow_stats(
+                SimpleNamespace(body=body, flags=flags))
+
+    def _last_report(self):
+        args, _ = self.sessiond.ReportRuleStats.future.call_args
+        return args[0]
+
+    def _last_report_records(self):
+        return {record.rule_id: record
+                for record in self._last_report().records}
+
+    def test_multipart_reply(self):
+        """ Parts of a reply are aggregated, the report is sent last """
+        self._poll([self._flow(1, Direction.OUT, 100)],
+                   [self._flow(1, Direction.IN, 240, packet_count=10)])
+        self.sessiond.ReportRuleStats.future.assert_called_once()
+        records = self._last_report_records()
+        self.assertEqual(list(records), ['rule1'])
+        self.assertEqual(records['rule1'].bytes_tx, 100)
+        self.assertEqual(records['rule1'].bytes_rx, 100)
+        self.assertEqual(records['rule1'].ue_ipv4, self.UE_IP)
+
+        # Known flows are not decoded again
+        self._poll([self._flow(1, Direction.OUT, 150)],
+                   [self._flow(1, Direction.IN, 240, packet_count=10)])
+        self.assertEqual(self.rule_mapper.get_rule_id.call_count, 2)
+        self.assertEqual(self._last_report_records()['rule1'].bytes_tx, 150)
+
+    def test_stale_flow_removal(self):
+        """ Flows missing from a reply are removed along with their usage """
+        self._poll([self._flow(1, Direction.OUT, 100),
+                    self._flow(1, Direction.IN, 240, packet_count=10),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertEqual(set(self._last_report_records()),
+                         {'rule1', 'rule2'})
+
+        self._poll([self._flow(1, Direction.OUT, 100)])
+        records = self._last_report_records()
+        self.assertEqual(list(records), ['rule1'])
+        self.assertEqual(records['rule1'].bytes_tx, 100)
+        self.assertEqual(records['rule1'].bytes_rx, 0)
+        self.assertEqual(len(self.controller._flow_index), 1)
+        self.assertEqual(list(self.controller._rule_records),
+                         [self._record_key(1)])
+
+    def test_counter_reset(self):
+        """ Usage follows the flow counters when they reset or wrap """
+        self._poll([self._flow(1, Direction.OUT, 1000)])
+        self.assertEqual(self._last_report_records()['rule1'].bytes_tx, 1000)
+
+        # The flow was reinstalled, its counters start over
+        self._poll([self._flow(1, Direction.OUT, 100)])
+        self.assertEqual(self._last_report_records()['rule1'].bytes_tx, 100)
+        self._poll([self._flow(1, Direction.OUT, 300)])
+        self.assertEqual(self._last_report_records()['rule1'].bytes_tx, 300)
+
+        # Wrapped 64 bit counter
+        self._poll([self._flow(1, Direction.OUT, 2 ** 64 - 1)])
+        self._poll([self._flow(1, Direction.OUT, 5)])
+        self.assertEqual(self._last_report_records()['rule1'].bytes_tx, 5)
+
+    def test_get_stats(self):
+        """ Filtered stats requests don't change the polled usage """
+        self._poll([self._flow(1, Direction.OUT, 100),
+                    self._flow(2, Direction.OUT, 500)])
+        self.controller._datapath = MagicMock()
+        reply = SimpleNamespace(body=[self._flow(2, Direction.OUT, 800),
+                                      self._flow(3, Direction.OUT, 50)])
+        with patch('magma.pipelined.app.enforcement_stats.ofctl_api.send_msg',
+                   return_value=reply):
+            record_table = self.controller.get_stats(2, 2)
+
+        records = {record.rule_id: record for record in record_table.records}
+        self.assertEqual(set(records), {'rule2', 'rule3'})
+        self.assertEqual(records['rule2'].bytes_tx, 800)
+        self.assertEqual(records['rule3'].bytes_tx, 50)
+        # Only the unknown flow is decoded, and it is not indexed
+        self.assertEqual(self.rule_mapper.get_rule_id.call_count, 3)
+        self.assertEqual(len(self.controller._flow_index), 2)
+        self.assertEqual(
+            self.controller._rule_records[self._record_key(2)].bytes_tx, 500)
+
+    def test_delta_report(self):
+        """ Delta reports hold only the records that changed """
+        self.controller._delta_stats_reporting = True
+        self._poll([self._flow(1, Direction.OUT, 100),
+                    self._flow(2, Direction.OUT, 500)])
+        # The first report is a full one
+        self.assertFalse(self._last_report().delta_update)
+        self.assertEqual(set(self._last_report_records()),
+                         {'rule1', 'rule2'})
+
+        self._poll([self._flow(1, Direction.OUT, 200),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertTrue(self._last_report().delta_update)
+        records = self._last_report_records()
+        self.assertEqual(list(records), ['rule1'])
+        self.assertEqual(records['rule1'].bytes_tx, 200)
+
+        self._poll([self._flow(1, Direction.OUT, 200),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertTrue(self._last_report().delta_update)
+        self.assertEqual(self._last_report_records(), {})
+
+    def test_delta_report_tombstones(self):
+        """ Records whose flows ended are sent once as final records """
+        self.controller._delta_stats_reporting = True
+        self._poll([self._flow(1, Direction.OUT, 100),
+                    self._flow(2, Direction.OUT, 500)])
+
+        self._poll([self._flow(1, Direction.OUT, 100)])
+        self.assertTrue(self._last_report().delta_update)
+        records = self._last_report_records()
+        self.assertEqual(list(records), ['rule2'])
+        self.assertTrue(records['rule2'].final_record)
+        self.assertEqual(records['rule2'].bytes_tx, 500)
+
+        self._poll([self._flow(1, Direction.OUT, 100)])
+        self.assertEqual(self._last_report_records(), {})
+
+    def test_delta_report_after_failure(self):
+        """ The report after a failed one is a full report """
+        self.controller._delta_stats_reporting = True
+        self._poll([self._flow(1, Direction.OUT, 100),
+                    self._flow(2, Direction.OUT, 500)])
+
+        self._poll([self._flow(1, Direction.OUT, 200),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertTrue(self._last_report().delta_update)
+        failed_future = MagicMock()
+        failed_future.exception.return_value = Exception('sessiond is down')
+        future = self.sessiond.ReportRuleStats.future.return_value
+        done_callback, = future.add_done_callback.call_args[0]
+        done_callback(failed_future)
+
+        self._poll([self._flow(1, Direction.OUT, 200),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertFalse(self._last_report().delta_update)
+        records = self._last_report_records()
+        self.assertEqual(set(records), {'rule1', 'rule2'})
+        self.assertEqual(records['rule1'].bytes_tx, 200)
+
+        self._poll([self._flow(1, Direction.OUT, 200),
+                    self._flow(2, Direction.OUT, 500)])
+        self.assertTrue(self._last_report().delta_update)
+        self.assertEqual(self._last_report_records(), {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+import unittest
+
+from magma.pipelined.openflow.messages import MessageHub
+from ryu.ofproto import ofproto_v1_4
+from ryu.ofproto.ofproto_protocol import ProtocolDesc
+
+
+class MessageHubFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.dp = ProtocolDesc(ofproto_v1_4.OFP_VERSION)
+        self.parser = self.dp.ofproto_parser
+        self.msg_hub = MessageHub(logging.getLogger(__name__))
+
+    def _instructions(self, reg_value, table_id):
+        actions = [
+            self.parser.NXActionRegLoad2(dst='reg1', value=reg_value),
+            self.parser.NXActionResubmitTable(table_id=table_id),
+        ]
+        return [self.parser.OFPInstructionActions(
+            self.dp.ofproto.OFPIT_APPLY_ACTIONS, actions)]
+
+    def _flow(self, imsi, reg_value=1, table_id=20):
+        return self.parser.OFPFlowStats(
+            table_id=5,
+            match=self.parser.OFPMatch(metadata=imsi, eth_type=0x0800),
+            instructions=self._instructions(reg_value, table_id))
+
+    def _msg(self, imsi, reg_value=1, table_id=20):
+        return self.parser.OFPFlowMod(
+            datapath=self.dp, table_id=5,
+            match=self.parser.OFPMatch(eth_type=0x0800, metadata=imsi),
+            instructions=self._instructions(reg_value, table_id))
+
+    def test_filter_msgs(self):
+        flows = [self._flow(1), self._flow(2), self._flow(3, table_id=21),
+                 self._flow(4, reg_value=2)]
+        msgs = [self._msg(1), self._msg(3), self._msg(4), self._msg(5)]
+
+        msgs_to_send, remaining_flows = \
+            self.msg_hub.filter_msgs_if_not_in_flow_list(self.dp, msgs, flows)
+
+        self.assertEqual(msgs_to_send, msgs[1:])
+        self.assertEqual(remaining_flows, flows[1:])
+
+    def test_filter_duplicate_flows(self):
+        flows = [self._flow(1), self._flow(1)]
+        msgs = [self._msg(1)]
+
+        msgs_to_send, remaining_flows = \
+            self.msg_hub.filter_msgs_if_not_in_flow_list(self.dp, msgs, flows)
+
+        self.assertEqual(msgs_to_send, [])
+        self.assertEqual(remaining_flows, [flows[1]])
+
+    def test_unset_ip_match_ignored(self):
+        flow = self._flow(1)
+        msg = self.parser.OFPFlowMod(
+            datapath=self.dp, table_id=5,
+            match=self.parser.OFPMatch(
+                eth_type=0x0800, metadata=1,
+                ipv4_dst=('0.0.0.0', '0.0.0.0')),
+            instructions=self._instructions(1, 20))
+
+        msgs_to_send, remaining_flows = \
+            self.msg_hub.filter_msgs_if_not_in_flow_list(self.dp, [msg],
+                                                         [flow])
+
+        self.assertEqual(msgs_to_send, [])
+        self.assertEqual(remaining_flows, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
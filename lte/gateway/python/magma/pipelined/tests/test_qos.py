@@ -120,15 +120,14 @@ class TestQosManager(unittest.TestCase):
         mock_traffic_cls.init_qdisc.assert_any_call(self.dl_intf, enable_pyroute2=False)
 
     def verifyTcCleanRestart(self, prior_qids, mock_traffic_cls):
-        for qid_tuple in prior_qids[self.ul_intf]:
-            qid, _ = qid_tuple
-            mock_traffic_cls.delete_class.assert_any_call(
-                self.ul_intf, qid)
-
-        for qid_tuple in prior_qids[self.dl_intf]:
-            qid, _ = qid_tuple
-            mock_traffic_cls.delete_class.assert_any_call(
-                self.dl_intf, qid)
+        for intf in (self.ul_intf, self.dl_intf):
+            deleted_qids = []
+            for args, _ in mock_traffic_cls.delete_classes.call_args_list:
+                if args[0] == intf:
+                    deleted_qids.extend(args[1])
+            for qid_tuple in prior_qids[intf]:
+                qid, _ = qid_tuple
+                self.assertIn(qid, deleted_qids)
 
     def verifyTcRemoveQos(self, mock_traffic_cls, d, qid, skip_filter=False):
         intf = self.ul_intf if d == FlowMatch.UPLINK else self.dl_intf
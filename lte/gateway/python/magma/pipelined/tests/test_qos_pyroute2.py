@@ -1,3 +1,4 @@
+import errno
 import logging
 import pprint
 import socket
@@ -5,10 +6,12 @@ import subprocess
 import time
 import traceback
 import unittest
+from unittest import mock
 
 from magma.pipelined.bridge_util import BridgeTools
 from magma.pipelined.qos.qos_tc_impl import TrafficClass
-from magma.pipelined.qos.tc_ops_cmd import TcOpsCmd
+from magma.pipelined.qos.tc_ops import HtbClass
+from magma.pipelined.qos.tc_ops_cmd import TcOpsCmd, run_cmd
 from magma.pipelined.qos.tc_ops_pyroute2 import TcOpsPyRoute2
 from pyroute2 import IPRoute, NetlinkError, protocols
 
@@ -167,5 +170,81 @@ class TcSetypTest(unittest.TestCase):
         self.assertEqual(err1, 0)
 
 
+class TcBatchTest(unittest.TestCase):
+    IFACE = 'veth_qos0'
+    PEER = 'veth_qos1'
+
+    @classmethod
+    def setUpClass(cls):
+        run_cmd(["ip link add {} type veth peer name {}".format(cls.IFACE,
+                                                                cls.PEER),
+                 "tc qdisc add dev {} root handle 1: htb".format(cls.IFACE),
+                 "tc class add dev {} parent 1: classid 1:fffe htb "
+                 "rate 1000Mbit".format(cls.IFACE)])
+
+    @classmethod
+    def tearDownClass(cls):
+        run_cmd(["ip link del {}".format(cls.IFACE)])
+
+    def test_batch(self):
+        cls = self.__class__
+        t1 = TcOpsPyRoute2()
+        iface = cls.IFACE
+        self.assertEqual(t1.get_qdisc_type(iface), 'htb')
+
+        classes = [HtbClass("0x%x" % qid, 80000, '8Kbit', '1:0xae', False)
+                   for qid in range(0x100, 0x180)]
+        # parent first, the failed class doesn't leave its filter behind
+        classes.insert(0, HtbClass("0xae", 80000, '8Kbit', '1:fffe', True))
+        classes.append(HtbClass("0xaf", 80000, '8Kbit', '2:0x5', False))
+        errs = t1.create_batch(iface, classes)
+        self.assertEqual(errs[:-1], [0] * (len(classes) - 1))
+        self.assertNotEqual(errs[-1], 0)
+        self.assertFalse(self.check_filter(iface, "0xaf"))
+        self.assertTrue(self.check_filter(iface, "0x17f"))
+
+        qid_list = t1.read_classes(iface)
+        self.assertEqual(len(qid_list), len(classes) - 1)
+        self.assertIn((0x17f, 0xae), qid_list)
+        self.assertIn((0xae, 0xfffe), qid_list)
+        self.assertEqual(t1.get_class_rate(iface, 0x100),
+                         "8000bit ceil 80000bit")
+        self.assertIsNone(t1.get_class_rate(iface, 0xaf))
+
+        qids = [htb.qid for htb in classes[1:-1]]
+        errs = t1.delete_batch(iface, qids)
+        self.assertEqual(errs, [0] * len(qids))
+        errs = t1.delete_batch(iface, ["0xae", "0xae"], skip_filter=True)
+        self.assertEqual(errs[0], 0)
+        self.assertNotEqual(errs[1], 0)
+        self.assertEqual(t1.read_classes(iface), [])
+        self.assertFalse(self.check_filter(iface, "0x17f"))
+
+    def test_batch_timeout(self):
+        cls = self.__class__
+        t1 = TcOpsPyRoute2()
+        iface = cls.IFACE
+        classes = [HtbClass("0x%x" % qid, 80000, '8Kbit', '1:fffe', True)
+                   for qid in range(0x200, 0x204)]
+        # the kernel replies are never read, the requests fail
+        with mock.patch('magma.pipelined.qos.tc_ops_pyroute2.select.select',
+                        return_value=([], [], [])):
+            errs = t1.create_batch(iface, classes)
+            self.assertEqual(errs, [errno.ETIMEDOUT] * len(classes))
+            self.assertEqual(t1.read_classes(iface), [])
+
+        # the lock is released and the late replies are skipped
+        qids = [htb.qid for htb in classes]
+        self.assertEqual(len(t1.read_classes(iface)), len(classes))
+        errs = t1.delete_batch(iface, qids, skip_filter=True)
+        self.assertEqual(errs, [0] * len(qids))
+        self.assertEqual(t1.read_classes(iface), [])
+
+    def check_filter(self, iface, qid):
+        output = subprocess.check_output(["tc", "filter", "show", "dev",
+                                          iface])
+        return "classid 1:{}".format(qid[2:]) in output.decode('utf-8')
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -17,19 +17,48 @@ from unittest.mock import MagicMock
 
 import fakeredis
 from magma.pipelined.policy_converters import convert_ipv4_str_to_ip_proto
-from magma.pipelined.rule_mappers import SessionRuleToVersionMapper
+from magma.pipelined.rule_mappers import (
+    RuleIDToNumMapper,
+    SessionRuleToVersionMapper,
+)
 
 
 class RuleMappersTest(unittest.TestCase):
     def setUp(self):
         # mock the get_default_client function used to return a fakeredis object
-        func_mock = MagicMock(return_value=fakeredis.FakeStrictRedis())
+        self._client_mock = MagicMock(return_value=fakeredis.FakeStrictRedis())
         with mock.patch(
                 'magma.pipelined.rule_mappers.get_default_client',
-                func_mock):
+                self._client_mock):
             self._session_rule_version_mapper = SessionRuleToVersionMapper()
         self._session_rule_version_mapper._version_by_imsi_and_rule = {}
 
+    def test_rule_id_to_num_mapper(self):
+        with mock.patch(
+                'magma.pipelined.rule_mappers.get_default_client',
+                self._client_mock):
+            rule_mapper = RuleIDToNumMapper()
+            rule_mapper.setup_redis()
+            self.assertEqual(rule_mapper.get_or_create_rule_num('rule1'), 1)
+            self.assertEqual(rule_mapper.get_or_create_rule_num('rule2'), 2)
+            self.assertEqual(rule_mapper.get_or_create_rule_num('rule1'), 1)
+
+            # A restarted mapper loads the rules and doesn't reuse numbers
+            restarted_mapper = RuleIDToNumMapper()
+            restarted_mapper.setup_redis()
+        self.assertEqual(restarted_mapper.get_rule_num('rule2'), 2)
+        self.assertEqual(restarted_mapper.get_rule_id(1), 'rule1')
+        self.assertEqual(
+            restarted_mapper.get_or_create_rule_num('rule3'), 3)
+        with self.assertRaises(KeyError):
+            restarted_mapper.get_rule_id(4)
+
+        # Lookups don't go to redis
+        restarted_mapper._rules_by_rule_num_store = None
+        restarted_mapper._rule_nums_by_rule_store = None
+        self.assertEqual(restarted_mapper.get_rule_id(3), 'rule3')
+        self.assertEqual(restarted_mapper.get_rule_num('rule1'), 1)
+
     def test_session_rule_version_mapper(self):
         rule_ids = ['rule1', 'rule2']
         imsi = 'IMSI12345'
@@ -104,5 +133,33 @@ class RuleMappersTest(unittest.TestCase):
                 imsi, None, rule_ids[1]),
             -1)
 
+    def test_session_rule_version_mapper_per_ue(self):
+        mapper = self._session_rule_version_mapper
+        imsi = 'IMSI12345'
+        ip_addr = convert_ipv4_str_to_ip_proto('1.2.3.4')
+        ip_addr2 = convert_ipv4_str_to_ip_proto('1.2.3.5')
+        mapper.save_version(imsi, ip_addr, 'rule1', 1)
+        mapper.save_version(imsi, ip_addr2, 'rule1', 2)
+        mapper.save_version('IMSI12346', ip_addr, 'rule1', 3)
+
+        # Only the versions of the given ip address are removed
+        mapper.remove_all_ue_versions(imsi, ip_addr)
+        self.assertEqual(mapper.get_version(imsi, ip_addr, 'rule1'), -1)
+        self.assertEqual(mapper.get_version(imsi, ip_addr2, 'rule1'), 2)
+        self.assertEqual(
+            mapper.get_version('IMSI12346', ip_addr, 'rule1'), 3)
+
+        # Versions are only removed if they match
+        mapper.remove(imsi, ip_addr2, 'rule1', 1)
+        self.assertEqual(mapper.get_version(imsi, ip_addr2, 'rule1'), 2)
+        mapper.remove(imsi, ip_addr2, 'rule1', 2)
+        self.assertEqual(mapper.get_version(imsi, ip_addr2, 'rule1'), -1)
+        # Subscribers without versions are dropped
+        self.assertEqual(len(mapper._version_by_imsi_and_rule), 1)
+
+        mapper.remove_all_ue_versions('IMSI12346', None)
+        self.assertEqual(mapper._version_by_imsi_and_rule, {})
+
+
 if __name__ == "__main__":
     unittest.main()
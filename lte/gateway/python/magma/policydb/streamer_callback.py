@@ -39,17 +39,16 @@ from magma.policydb.rule_store import PolicyRuleDict
 from orc8r.protos.streamer_pb2 import DataUpdate
 
 
-class PolicyDBStreamerCallback(StreamerClient.Callback):
+class PolicyDBStreamerCallback(StreamerClient.DigestCallback):
     """
     Callback implementation for the PolicyDB StreamerClient instance.
+    Policy resyncs are full snapshots, so most unchanged ones are skipped.
     """
 
     def __init__(self):
+        super().__init__()
         self._policy_dict = PolicyRuleDict()
 
-    def get_request_args(self, stream_name: str) -> Any:
-        return None
-
     def process_update(self, stream_name, updates, resync):
         logging.info(
             "Processing %d policy updates (resync=%s)",
@@ -68,6 +67,10 @@ class PolicyDBStreamerCallback(StreamerClient.Callback):
         else:
             pass
 
+    def process_unchanged_resync(self, stream_name):
+        # Subscribers still expect a notification for every resync
+        self._policy_dict.send_update_notification()
+
     def _store_policy_rule(self, policy):
         self._policy_dict[policy.id] = policy
 
@@ -13,7 +13,7 @@ limitations under the License.
 
 import unittest
 from typing import Callable, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from lte.protos.policydb_pb2 import (
     ApnPolicySet,
@@ -30,7 +30,10 @@ from lte.protos.session_manager_pb2 import (
     SessionRules,
     StaticRuleInstall,
 )
-from magma.policydb.streamer_callback import ApnRuleMappingsStreamerCallback
+from magma.policydb.streamer_callback import (
+    ApnRuleMappingsStreamerCallback,
+    PolicyDBStreamerCallback,
+)
 from magma.policydb.tests.mock_stubs import MockLocalSessionManagerStub
 from orc8r.protos.common_pb2 import Void
 from orc8r.protos.streamer_pb2 import DataUpdate
@@ -45,6 +48,19 @@ def get_SetSessionRules_side_effect(
     return side_effect
 
 
+class PolicyDBStreamerCallbackTest(unittest.TestCase):
+    @patch('magma.policydb.streamer_callback.PolicyRuleDict')
+    def test_unchanged_resync(self, policy_dict_mock):
+        """
+        Test sessiond is still notified of resyncs skipped because their
+        policies didn't change.
+        """
+        callback = PolicyDBStreamerCallback()
+        callback.process_unchanged_resync('policydb')
+        policy_dict_mock.return_value.send_update_notification \
+            .assert_called_once_with()
+
+
 class ApnRuleMappingsStreamerCallbackTest(unittest.TestCase):
     def test_Update(self):
         """
@@ -12,12 +12,23 @@ limitations under the License.
 """
 
 import hmac
+from functools import lru_cache
 
 from Crypto.Cipher import AES
-from Crypto.Random import random
+from Crypto.Random import get_random_bytes
 
 from .lte import BaseLTEAuthAlgo
 
+# Number of per-key AES ciphers kept for reuse
+CIPHER_CACHE_SIZE = 4096
+
+# Constants from 3GPP 35.206 4.1, as 128 bit integers. The rotations are
+# in bits.
+C1, C2, C3, C4, C5 = 0, 1, 2, 4, 8
+R1, R2, R3, R4, R5 = 64, 0, 32, 64, 96
+
+_MASK_128 = (1 << 128) - 1
+
 
 class Milenage(BaseLTEAuthAlgo):
     """
@@ -42,13 +53,21 @@ class Milenage(BaseLTEAuthAlgo):
             autn (bytes): 128 bit authentication token
             kasme (bytes): 256 bit base network authentication code
         """
-        sqn_bytes = bytearray.fromhex('{:012x}'.format(sqn))
+        sqn_bytes = sqn.to_bytes(6, 'big')
         rand = Milenage.generate_rand()
 
-        mac_a, _ = Milenage.f1(key, sqn_bytes, rand, opc, self.amf)
-        xres, ak = Milenage.f2_f5(key, rand, opc)
-        ck = Milenage.f3(key, rand, opc)
-        ik = Milenage.f4(key, rand, opc)
+        # TEMP is shared by f1-f5, so it is encrypted only once
+        cipher = _get_cipher(bytes(key))
+        opc_int = _to_int(opc)
+        temp = _milenage_temp(cipher, rand, opc_int)
+
+        mac_a = _to_bytes(
+            _milenage_out1(cipher, temp, opc_int, sqn_bytes, self.amf),
+        )[:8]
+        out2 = _to_bytes(_milenage_out(cipher, temp, opc_int, R2, C2))
+        xres, ak = out2[8:16], out2[0:6]
+        ck = _to_bytes(_milenage_out(cipher, temp, opc_int, R3, C3))
+        ik = _to_bytes(_milenage_out(cipher, temp, opc_int, R4, C4))
 
         autn = Milenage.generate_autn(sqn_bytes, ak, mac_a, self.amf)
         kasme = Milenage.generate_kasme(ck, ik, plmn, sqn_bytes, ak)
@@ -66,9 +85,14 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             auts (bytes): 112 bit authentication token
         """
-        ak = self.f5_star(key, rand, opc)
-        sqn_bytes = bytearray.fromhex('{:012x}'.format(sqn))
-        _, mac_s = self.f1(key, sqn_bytes, rand, opc, self.amf)
+        cipher = _get_cipher(bytes(key))
+        opc_int = _to_int(opc)
+        temp = _milenage_temp(cipher, rand, opc_int)
+        ak = _to_bytes(_milenage_out(cipher, temp, opc_int, R5, C5))[:6]
+        sqn_bytes = sqn.to_bytes(6, 'big')
+        mac_s = _to_bytes(
+            _milenage_out1(cipher, temp, opc_int, sqn_bytes, self.amf),
+        )[8:]
         return xor(sqn_bytes, ak) + mac_s
 
     def generate_resync(self, auts, key, opc, rand):
@@ -84,10 +108,15 @@ class Milenage(BaseLTEAuthAlgo):
             sqn_ms (int), 48 bit sequence number from client
             mac_s (bytes), 64 bit resync authentication code
         """
-        ak = self.f5_star(key, rand, opc)
+        cipher = _get_cipher(bytes(key))
+        opc_int = _to_int(opc)
+        temp = _milenage_temp(cipher, rand, opc_int)
+        ak = _to_bytes(_milenage_out(cipher, temp, opc_int, R5, C5))[:6]
         sqn_ms = xor(auts[:6], ak)
         sqn_ms_int = int.from_bytes(sqn_ms, byteorder='big')
-        _, mac_s = self.f1(key, sqn_ms, rand, opc, self.amf)
+        mac_s = _to_bytes(
+            _milenage_out1(cipher, temp, opc_int, sqn_ms, self.amf),
+        )[8:]
         return sqn_ms_int, mac_s
 
     @classmethod
@@ -106,19 +135,10 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             (64 bit Network auth code, 64 bit Resynch auth code)
         """
-        # TEMP = E_K(RAND XOR OP_C)
-        temp = cls.encrypt(key, xor(rand, opc))
-
-        # IN1 = SQN || AMF || SQN || AMF
-        in1 = (sqn[0:6] + amf[0:2]) * 2
-
-        # Constants from 3GPP 35.206 4.1
-        c1 = 16 * b'\x00'  # some constant
-        r1 = 8  # rotate by 8 bytes
-
-        # OUT1 = E_K(TEMP XOR rotate(IN1 XOR OP_C, r1) XOR c1) XOR OP_C
-        out1_ = cls.encrypt(key, xor(temp, rotate(xor(in1, opc), r1)), c1)
-        out1 = xor(opc, out1_)
+        cipher = _get_cipher(bytes(key))
+        opc_int = _to_int(opc)
+        temp = _milenage_temp(cipher, rand, opc_int)
+        out1 = _to_bytes(_milenage_out1(cipher, temp, opc_int, sqn, amf))
 
         #  MAC-A = f1 = OUT1[0] .. OUT1[63]
         #  MAC-S = f1* = OUT1[64] .. OUT1[127]
@@ -137,14 +157,7 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             (xres, ak) = (64 bit response to challenge, 48 bit anonymity key)
         """
-        # Constants from 3GPP 35.206 4.1
-        c2 = 15 * b'\x00' + b'\x01'  # some constant
-        r2 = 0  # rotate by 0 bytes
-
-        # TEMP = E_K(RAND XOR OP_C)
-        # OUT2 = E_K(rotate(TEMP XOR OP_C, r2) XOR c2) XOR OP_C
-        temp_x_opc = xor(cls.encrypt(key, xor(rand, opc)), opc)
-        out2 = xor(cls.encrypt(key, xor(rotate(temp_x_opc, r2), c2)), opc)
+        out2 = _to_bytes(cls._out(key, rand, opc, R2, C2))
         # res = f2 = OUT2[64] ... OUT2[127]
         # ak = f5 = OUT2[0] ... OUT2[47]
         return out2[8:16], out2[0:6]
@@ -162,16 +175,8 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             ck, 128 bit confidentiality key
         """
-        # Constants from 3GPP 35.206 4.1
-        c3 = 15 * b'\x00' + b'\x02'  # some constant
-        r3 = 4  # rotate by 4 bytes
-
-        # TEMP = E_K(RAND XOR OP_C)
-        # OUT3 = E_K(rotate(TEMP XOR OP_C, r3) XOR c3) XOR OP_C
-        temp_x_opc = xor(cls.encrypt(key, xor(rand, opc)), opc)
-        out3 = xor(cls.encrypt(key, xor(rotate(temp_x_opc, r3), c3)), opc)
         # ck = f3 = OUT3
-        return out3
+        return _to_bytes(cls._out(key, rand, opc, R3, C3))
 
     @classmethod
     def f4(cls, key, rand, opc):
@@ -186,16 +191,8 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             ik, 128 bit integrity key
         """
-        # Constants from 3GPP 35.206 4.1
-        c4 = 15 * b'\x00' + b'\x04'  # some constant
-        r4 = 8  # rotate by 8 bytes
-
-        # TEMP = E_K(RAND XOR OP_C)
-        # OUT4 = E_K(rotate(TEMP XOR OP_C, r4) XOR c4) XOR OP_C
-        temp_x_opc = xor(cls.encrypt(key, xor(rand, opc)), opc)
-        out4 = xor(cls.encrypt(key, xor(rotate(temp_x_opc, r4), c4)), opc)
         # ik = f4 = OUT4
-        return out4
+        return _to_bytes(cls._out(key, rand, opc, R4, C4))
 
     @classmethod
     def f5_star(cls, key, rand, opc):
@@ -210,16 +207,18 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             ak, 48 bit anonymity key
         """
-        # Constants from 3GPP 35.206 4.1
-        c5 = 15 * b'\x00' + b'\x08'  # some constant
-        r5 = 12  # rotate by 12 bytes
-
-        # TEMP = E_K(RAND XOR OP_C)
-        # OUT5 = E_K(rotate(TEMP XOR OP_C, r5 XOR c5) XOR OP_C
-        temp_x_opc = xor(cls.encrypt(key, xor(rand, opc)), opc)
-        out5 = xor(cls.encrypt(key, xor(rotate(temp_x_opc, r5), c5)), opc)
         # ak = f5* = OUT5[0] . OUT5[47]
-        return out5[:6]
+        return _to_bytes(cls._out(key, rand, opc, R5, C5))[:6]
+
+    @classmethod
+    def _out(cls, key, rand, opc, r, c):
+        """
+        Compute OUT2 .. OUT5 as an integer, for the single function callers
+        """
+        cipher = _get_cipher(bytes(key))
+        opc_int = _to_int(opc)
+        temp = _milenage_temp(cipher, rand, opc_int)
+        return _milenage_out(cipher, temp, opc_int, r, c)
 
     @classmethod
     def generate_kasme(cls, ck, ik, plmn, sqn, ak):
@@ -259,7 +258,7 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             (bytes) 128 random bits
         """
-        return bytearray.fromhex('{:032x}'.format(random.getrandbits(128)))
+        return get_random_bytes(16)
 
     @classmethod
     def generate_opc(cls, key, op):
@@ -314,8 +313,10 @@ class Milenage(BaseLTEAuthAlgo):
         Returns:
             encrypted output
         """
-        aes_cipher = AES.new(k, AES.MODE_CBC, IV)
-        return aes_cipher.encrypt(buf)
+        if len(buf) != 16:
+            return AES.new(k, AES.MODE_CBC, IV).encrypt(buf)
+        # A single CBC block is the ECB encryption of buf XOR IV
+        return _get_cipher(bytes(k)).encrypt(xor(buf, IV))
 
 
 def xor(s1, s2):
@@ -332,7 +333,7 @@ def xor(s1, s2):
     """
     if len(s1) != len(s2):
         raise ValueError('Input not equal length: %d %d' % (len(s1), len(s2)))
-    return bytes(a ^ b for a, b in zip(s1, s2))
+    return (_to_int(s1) ^ _to_int(s2)).to_bytes(len(s1), 'big')
 
 
 def rotate(input_s, bytes_):
@@ -345,10 +346,56 @@ def rotate(input_s, bytes_):
     Returns:
         (bytes) s1 rotated by n bytes
     """
-    return bytes(
-        input_s[(i + bytes_) % len(input_s)] for i in range(
-            len(
-            input_s,
-            ),
-        )
-    )
+    if not input_s:
+        return bytes(input_s)
+    bytes_ %= len(input_s)
+    return bytes(input_s[bytes_:] + input_s[:bytes_])
+
+
+@lru_cache(maxsize=CIPHER_CACHE_SIZE)
+def _get_cipher(key):
+    """
+    Return the AES-128 ECB cipher of a subscriber key. ECB ciphers keep no
+    state between blocks, so they can be reused across calls.
+    """
+    return AES.new(key, AES.MODE_ECB)
+
+
+def _to_int(buf):
+    return int.from_bytes(buf, 'big')
+
+
+def _to_bytes(value):
+    return value.to_bytes(16, 'big')
+
+
+def _encrypt_int(cipher, value):
+    return _to_int(cipher.encrypt(_to_bytes(value)))
+
+
+def _rotate_int(value, bits):
+    """ Rotate a 128 bit integer left by a number of bits """
+    if not bits:
+        return value
+    return ((value << bits) | (value >> (128 - bits))) & _MASK_128
+
+
+def _milenage_temp(cipher, rand, opc_int):
+    # TEMP = E_K(RAND XOR OP_C)
+    return _encrypt_int(cipher, _to_int(rand) ^ opc_int)
+
+
+def _milenage_out1(cipher, temp, opc_int, sqn, amf):
+    # IN1 = SQN || AMF || SQN || AMF
+    in1 = _to_int((bytes(sqn[0:6]) + bytes(amf[0:2])) * 2)
+    # OUT1 = E_K(TEMP XOR rotate(IN1 XOR OP_C, r1) XOR c1) XOR OP_C
+    return _encrypt_int(
+        cipher, temp ^ _rotate_int(in1 ^ opc_int, R1) ^ C1,
+    ) ^ opc_int
+
+
+def _milenage_out(cipher, temp, opc_int, r, c):
+    # OUTn = E_K(rotate(TEMP XOR OP_C, rn) XOR cn) XOR OP_C, for n = 2 .. 5
+    return _encrypt_int(
+        cipher, _rotate_int(temp ^ opc_int, r) ^ c,
+    ) ^ opc_int
@@ -13,6 +13,7 @@ limitations under the License.
 import asyncio
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import snowflake
 from lte.protos.mconfig import mconfigs_pb2
@@ -23,9 +24,13 @@ from magma.common.service import MagmaService
 from magma.subscriberdb.client import SubscriberDBCloudClient
 from magma.subscriberdb.processor import Processor
 from magma.subscriberdb.protocols.diameter.application import base, s6a
-from magma.subscriberdb.protocols.diameter.server import S6aServer
+from magma.subscriberdb.protocols.diameter.server import (
+    DEFAULT_MAX_PENDING,
+    S6aServer,
+)
 from magma.subscriberdb.protocols.s6a_proxy_servicer import S6aProxyRpcServicer
 from magma.subscriberdb.rpc_servicer import SubscriberDBRpcServicer
+from magma.subscriberdb.store.cached_store import CachedStore
 from magma.subscriberdb.store.sqlite import SqliteStore
 from magma.subscriberdb.subscription_profile import get_default_sub_profile
 
@@ -38,9 +43,19 @@ def main():
     sentry_init(service_name=service.name)
 
     # Initialize a store to keep all subscriber data.
-    store = SqliteStore(
+    sqlite_store = SqliteStore(
         service.config.get('db_path'), loop=service.loop,
         sid_digits=service.config.get('sid_last_n'),
+        synchronous=service.config.get('db_synchronous', 'NORMAL'),
+        pool_size=service.config.get('db_pool_size', 4),
+    )
+    # Cache the subscribers and keep the auth sequence numbers in memory
+    store = CachedStore(
+        sqlite_store,
+        cache_capacity=service.config.get('cache_capacity', 100000),
+        loop=service.loop,
+        sqn_flush_interval=service.config.get('sqn_flush_interval', 0),
+        sqn_recovery_jump=service.config.get('sqn_recovery_jump', 0),
     )
 
     # Initialize the processor
@@ -85,6 +100,15 @@ def main():
             'disabled!',
         )
 
+    # Optionally handle Diameter S6a requests off the event loop
+    s6a_executor = None
+    s6a_workers = service.config.get('s6a_workers', 0)
+    if s6a_workers > 0:
+        s6a_executor = ThreadPoolExecutor(
+            max_workers=s6a_workers,
+            thread_name_prefix='s6a',
+        )
+
     # Wait until the datastore is populated by addition or resync before
     # listening for clients.
     async def serve():  # noqa: WPS430
@@ -117,6 +141,10 @@ def main():
                     service.config.get('mme_realm'),
                     service.config.get('mme_host_name'),
                     loop=service.loop,
+                    executor=s6a_executor,
+                    max_pending=service.config.get(
+                        's6a_max_pending', DEFAULT_MAX_PENDING,
+                    ),
                 ),
                 service.config.get('host_address'), service.config.get('mme_port'),
             )
@@ -127,6 +155,10 @@ def main():
     service.run()
 
     # Cleanup the service
+    if s6a_executor is not None:
+        s6a_executor.shutdown()
+    store.close()
+    sqlite_store.close()
     service.close()
 
 
@@ -26,6 +26,10 @@ S6A_LUR_TOTAL = Counter(
     's6a_location_update',
     'Total S6a location update requests',
 )
+S6A_TOO_BUSY_TOTAL = Counter(
+    's6a_too_busy',
+    'Total S6a requests rejected because too many were in progress',
+)
 
 DIAMETER_AUTHENTICATION_REJECTED = 4001
 DIAMETER_ERROR_USER_UNKNOWN = 5001
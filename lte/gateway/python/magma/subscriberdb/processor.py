@@ -25,6 +25,10 @@ from .crypto.gsm import UnsafePreComputedA3A8
 from .crypto.milenage import Milenage
 from .crypto.utils import CryptoError
 
+# Maximum number of E-UTRAN vectors returned for a single auth request
+# (Number-Of-Requested-Vectors, TS 29.272)
+MAX_EUTRAN_VECTORS = 5
+
 
 class GSMProcessor(metaclass=abc.ABCMeta):
     """
@@ -101,6 +105,23 @@ class LTEProcessor(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def generate_lte_auth_vectors(self, imsi, plmn, num_vectors):
+        """
+        Returns up to num_vectors E-UTRAN key vectors for the subscriber,
+        using consecutive sequence numbers.
+        Args:
+            imsi: the subscriber identifier
+            plmn (bytes): 24 bit network identifer
+            num_vectors (int): number of vectors requested
+        Returns:
+            list of (rand, xres, autn, kasme) tuples
+        Raises:
+            SubscriberNotFoundError if the subscriber is not present
+            CryptoError if the auth vectors couldn't be generated
+        """
+        raise NotImplementedError()
+
 
 class Processor(GSMProcessor, LTEProcessor):
     """
@@ -180,34 +201,34 @@ class Processor(GSMProcessor, LTEProcessor):
         Returns the lte auth vector for the subscriber by querying the store
         for the crypto algo and secret keys.
         """
-        sid = SIDUtils.to_str(SubscriberID(id=imsi, type=SubscriberID.IMSI))
-        subs = self._store.get_subscriber_data(sid)
-
-        if subs.lte.state != LTESubscription.ACTIVE:
-            raise CryptoError("LTE service not active for %s" % sid)
+        return self.generate_lte_auth_vectors(imsi, plmn, 1)[0]
 
-        if subs.lte.auth_algo != LTESubscription.MILENAGE:
-            raise CryptoError(
-                "Unknown crypto (%s) for %s" %
-                (subs.lte.auth_algo, sid),
-            )
-
-        if len(subs.lte.auth_key) != 16:
-            raise CryptoError("Subscriber key not valid for %s" % sid)
+    def generate_lte_auth_vectors(self, imsi, plmn, num_vectors):
+        """
+        Returns the lte auth vectors for the subscriber. The sequence numbers
+        of all the vectors are reserved in a single store transaction, and
+        the vectors are then computed with the same keys.
+        """
+        num_vectors = max(1, min(num_vectors, MAX_EUTRAN_VECTORS))
+        sid = SIDUtils.to_str(SubscriberID(id=imsi, type=SubscriberID.IMSI))
 
-        if len(subs.lte.auth_opc) == 0:
-            opc = Milenage.generate_opc(subs.lte.auth_key, self._op)
-        elif len(subs.lte.auth_opc) != 16:
-            raise CryptoError("Subscriber OPc is invalid length for %s" % sid)
-        else:
-            opc = subs.lte.auth_opc
+        # Reserve the SEQ range. An invalid subscriber raises before the
+        # update is written, so no sequence number is consumed.
+        # The 3GPP TS 33.102 spec allows wrapping around the maximum value.
+        # The re-synchronization mechanism would be used to sync the counter
+        # between USIM and HSS when it happens.
+        with self._store.edit_subscriber(sid) as subs:
+            key, opc = self._get_lte_keys(sid, subs)
+            seq = subs.state.lte_auth_next_seq
+            subs.state.lte_auth_next_seq += num_vectors
 
-        sqn = self.seq_to_sqn(self.get_next_lte_auth_seq(imsi))
         milenage = Milenage(self._amf)
-        return milenage.generate_eutran_vector(
-            subs.lte.auth_key,
-            opc, sqn, plmn,
-        )
+        return [
+            milenage.generate_eutran_vector(
+                key, opc, self.seq_to_sqn(seq + i), plmn,
+            )
+            for i in range(num_vectors)
+        ]
 
     def resync_lte_auth_seq(self, imsi, rand, auts):
         """
@@ -216,30 +237,12 @@ class Processor(GSMProcessor, LTEProcessor):
         """
         sid = SIDUtils.to_str(SubscriberID(id=imsi, type=SubscriberID.IMSI))
         subs = self._store.get_subscriber_data(sid)
-
-        if subs.lte.state != LTESubscription.ACTIVE:
-            raise CryptoError("LTE service not active for %s" % sid)
-
-        if subs.lte.auth_algo != LTESubscription.MILENAGE:
-            raise CryptoError(
-                "Unknown crypto (%s) for %s" %
-                (subs.lte.auth_algo, sid),
-            )
-
-        if len(subs.lte.auth_key) != 16:
-            raise CryptoError("Subscriber key not valid for %s" % sid)
-
-        if len(subs.lte.auth_opc) == 0:
-            opc = Milenage.generate_opc(subs.lte.auth_key, self._op)
-        elif len(subs.lte.auth_opc) != 16:
-            raise CryptoError("Subscriber OPc is invalid length for %s" % sid)
-        else:
-            opc = subs.lte.auth_opc
+        key, opc = self._get_lte_keys(sid, subs)
 
         dummy_amf = b'\x00\x00'  # Use dummy AMF for re-synchronization
         milenage = Milenage(dummy_amf)
         sqn_ms, mac_s = \
-            milenage.generate_resync(auts, subs.lte.auth_key, opc, rand)
+            milenage.generate_resync(auts, key, opc, rand)
 
         if mac_s != auts[6:]:
             raise CryptoError("Invalid resync authentication code")
@@ -262,6 +265,31 @@ class Processor(GSMProcessor, LTEProcessor):
                     "auth: %d" % seq_delta,
                 )
 
+    def _get_lte_keys(self, sid, subs):
+        """
+        Validates the LTE subscription and returns the subscriber key and
+        OPc, computing the OPc from the OP if it isn't provisioned.
+        """
+        if subs.lte.state != LTESubscription.ACTIVE:
+            raise CryptoError("LTE service not active for %s" % sid)
+
+        if subs.lte.auth_algo != LTESubscription.MILENAGE:
+            raise CryptoError(
+                "Unknown crypto (%s) for %s" %
+                (subs.lte.auth_algo, sid),
+            )
+
+        if len(subs.lte.auth_key) != 16:
+            raise CryptoError("Subscriber key not valid for %s" % sid)
+
+        if len(subs.lte.auth_opc) == 0:
+            opc = Milenage.generate_opc(subs.lte.auth_key, self._op)
+        elif len(subs.lte.auth_opc) != 16:
+            raise CryptoError("Subscriber OPc is invalid length for %s" % sid)
+        else:
+            opc = subs.lte.auth_opc
+        return subs.lte.auth_key, opc
+
     def get_next_lte_auth_seq(self, imsi):
         """
         Returns the sequence number for the next auth operation.
@@ -13,6 +13,7 @@ limitations under the License.
 
 import logging
 from enum import IntEnum, unique
+from functools import lru_cache
 
 from magma.subscriberdb.crypto.utils import CryptoError
 from magma.subscriberdb.metrics import (
@@ -25,6 +26,16 @@ from magma.subscriberdb.store.base import SubscriberNotFoundError
 
 from . import abc
 
+# Encoder of the E-UTRAN-Vector AVPs of an Authentication-Information-Answer
+EUTRAN_VECTOR = avp.GroupedAVPTemplate(
+    'E-UTRAN-Vector', ['RAND', 'XRES', 'AUTN', 'KASME'],
+)
+# Auth-Session-State is NO_STATE_MAINTAINED (1)
+AUTH_SESSION_STATE = avp.AVP('Auth-Session-State', 1)
+# The number of distinct subscription profiles to cache the encoded
+# Subscription-Data for
+SUBSCRIPTION_DATA_CACHE_SIZE = 64
+
 
 @unique
 class S6AApplicationCommands(IntEnum):
@@ -87,6 +98,11 @@ class S6AApplication(abc.Application):
         """
         super(S6AApplication, self).__init__(realm, host, host_ip, loop)
         self.lte_processor = lte_processor
+        # The host identifiers are the same for every answer
+        self._origin_avps = [
+            avp.AVP('Origin-Host', host),
+            avp.AVP('Origin-Realm', realm),
+        ]
 
     def handle_msg(self, state_id, msg):
         """
@@ -160,12 +176,11 @@ class S6AApplication(abc.Application):
         for body_avp in body_avps:
             resp_msg.append_avp(body_avp)
 
-        # Auth-Session-State is NO_STATE_MAINTAINED (1)
-        resp_msg.append_avp(avp.AVP('Auth-Session-State', 1))
+        resp_msg.append_avp(AUTH_SESSION_STATE)
 
         # Host identifiers
-        resp_msg.append_avp(avp.AVP('Origin-Host', self.host))
-        resp_msg.append_avp(avp.AVP('Origin-Realm', self.realm))
+        for origin_avp in self._origin_avps:
+            resp_msg.append_avp(origin_avp)
         resp_msg.append_avp(avp.AVP('Origin-State-Id', state_id))
 
         # Response result
@@ -204,20 +219,18 @@ class S6AApplication(abc.Application):
                 auts = re_sync_info.value[16:]
                 self.lte_processor.resync_lte_auth_seq(imsi, rand, auts)
 
-            rand, xres, autn, kasme = \
-                self.lte_processor.generate_lte_auth_vector(imsi, plmn)
+            num_vectors_avp = request_eutran_info.find_avp(
+                *avp.resolve('Number-Of-Requested-Vectors'),
+            )
+            num_vectors = num_vectors_avp.value if num_vectors_avp else 1
+
+            vectors = self.lte_processor.generate_lte_auth_vectors(
+                imsi, plmn, num_vectors,
+            )
 
             auth_info = avp.AVP(
-                'Authentication-Info', [
-                avp.AVP(
-                    'E-UTRAN-Vector', [
-                    avp.AVP('RAND', rand),
-                    avp.AVP('XRES', xres),
-                    avp.AVP('AUTN', autn),
-                    avp.AVP('KASME', kasme),
-                    ],
-                ),
-                ],
+                'Authentication-Info',
+                [EUTRAN_VECTOR(*vector) for vector in vectors],
             )
 
             S6A_AUTH_SUCCESS_TOTAL.inc()
@@ -273,57 +286,8 @@ class S6AApplication(abc.Application):
             logging.warning('Subscriber not found for ULR: %s', e)
             return
 
-        # Stubbed out Subscription Data from OAI
-        subscription_data = avp.AVP(
-            'Subscription-Data', [
-                avp.AVP('MSISDN', b'333608050011'),
-                avp.AVP('Access-Restriction-Data', 47),
-                avp.AVP('Subscriber-Status', 0),
-                avp.AVP('Network-Access-Mode', 2),
-                avp.AVP(
-                    'AMBR', [
-                        avp.AVP('Max-Requested-Bandwidth-UL', profile.max_ul_bit_rate),
-                        avp.AVP('Max-Requested-Bandwidth-DL', profile.max_dl_bit_rate),
-                    ],
-                ),
-                avp.AVP(
-                    'APN-Configuration-Profile', [
-                        avp.AVP('Context-Identifier', 0),
-                        avp.AVP('All-APN-Configurations-Included-Indicator', 0),
-                        avp.AVP(
-                            'APN-Configuration', [
-                                avp.AVP('Context-Identifier', 0),
-                                avp.AVP('PDN-Type', 0),
-                                avp.AVP('Service-Selection', 'oai.ipv4'),
-                                avp.AVP(
-                                    'EPS-Subscribed-QoS-Profile', [
-                                        avp.AVP('QoS-Class-Identifier', 9),
-                                        avp.AVP(
-                                            'Allocation-Retention-Priority', [
-                                                avp.AVP('Priority-Level', 15),
-                                                avp.AVP('Pre-emption-Capability', 1),
-                                                avp.AVP('Pre-emption-Vulnerability', 0),
-                                            ],
-                                        ),
-                                    ],
-                                ),
-                                avp.AVP(
-                                    'AMBR', [
-                                        avp.AVP(
-                                            'Max-Requested-Bandwidth-UL',
-                                            profile.max_ul_bit_rate,
-                                        ),
-                                        avp.AVP(
-                                            'Max-Requested-Bandwidth-DL',
-                                            profile.max_dl_bit_rate,
-                                        ),
-                                    ],
-                                ),
-                            ],
-                        ),
-                    ],
-                ),
-            ],
+        subscription_data = _subscription_data(
+            profile.max_ul_bit_rate, profile.max_dl_bit_rate,
         )
 
         S6A_LUR_TOTAL.inc()
@@ -333,3 +297,70 @@ class S6AApplication(abc.Application):
             [ula_flags, subscription_data],
         )
         self.writer.send_msg(resp)
+
+
+@lru_cache(maxsize=SUBSCRIPTION_DATA_CACHE_SIZE)
+def _subscription_data(max_ul_bit_rate, max_dl_bit_rate):
+    """
+    Build the Subscription-Data AVP of an Update-Location-Answer. Only the
+    AMBR differs between subscribers, so the encoded AVP is shared by the
+    answers to subscribers with the same profile.
+
+    Args:
+        max_ul_bit_rate: the subscriber UL AMBR
+        max_dl_bit_rate: the subscriber DL AMBR
+    Returns:
+        a Subscription-Data AVP
+    """
+    # Stubbed out Subscription Data from OAI
+    return avp.AVP(
+        'Subscription-Data', [
+            avp.AVP('MSISDN', b'333608050011'),
+            avp.AVP('Access-Restriction-Data', 47),
+            avp.AVP('Subscriber-Status', 0),
+            avp.AVP('Network-Access-Mode', 2),
+            avp.AVP(
+                'AMBR', [
+                    avp.AVP('Max-Requested-Bandwidth-UL', max_ul_bit_rate),
+                    avp.AVP('Max-Requested-Bandwidth-DL', max_dl_bit_rate),
+                ],
+            ),
+            avp.AVP(
+                'APN-Configuration-Profile', [
+                    avp.AVP('Context-Identifier', 0),
+                    avp.AVP('All-APN-Configurations-Included-Indicator', 0),
+                    avp.AVP(
+                        'APN-Configuration', [
+                            avp.AVP('Context-Identifier', 0),
+                            avp.AVP('PDN-Type', 0),
+                            avp.AVP('Service-Selection', 'oai.ipv4'),
+                            avp.AVP(
+                                'EPS-Subscribed-QoS-Profile', [
+                                    avp.AVP('QoS-Class-Identifier', 9),
+                                    avp.AVP(
+                                        'Allocation-Retention-Priority', [
+                                            avp.AVP('Priority-Level', 15),
+                                            avp.AVP('Pre-emption-Capability', 1),
+                                            avp.AVP('Pre-emption-Vulnerability', 0),
+                                        ],
+                                    ),
+                                ],
+                            ),
+                            avp.AVP(
+                                'AMBR', [
+                                    avp.AVP(
+                                        'Max-Requested-Bandwidth-UL',
+                                        max_ul_bit_rate,
+                                    ),
+                                    avp.AVP(
+                                        'Max-Requested-Bandwidth-DL',
+                                        max_dl_bit_rate,
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
@@ -26,7 +26,7 @@ from magma.subscriberdb.metrics import (
 )
 from magma.subscriberdb.protocols.diameter import avp
 
-from .s6a import S6AApplication
+from .s6a import EUTRAN_VECTOR, S6AApplication
 
 
 class S6ARelayApplication(S6AApplication):
@@ -160,14 +160,10 @@ class S6ARelayApplication(S6AApplication):
             else:
                 auth_info = avp.AVP(
                     'Authentication-Info', [
-                    avp.AVP(
-                        'E-UTRAN-Vector', [
-                        avp.AVP('RAND', vector.rand),
-                        avp.AVP('XRES', vector.xres),
-                        avp.AVP('AUTN', vector.autn),
-                        avp.AVP('KASME', vector.kasme),
-                        ],
-                    ) for vector in answer.eutran_vectors
+                        EUTRAN_VECTOR(
+                            vector.rand, vector.xres,
+                            vector.autn, vector.kasme,
+                        ) for vector in answer.eutran_vectors
                     ],
                 )
 
@@ -12,6 +12,7 @@ limitations under the License.
 """
 
 import abc
+import copy
 import socket
 import struct
 from enum import IntEnum, unique
@@ -325,6 +326,11 @@ class Unsigned32AVP(BaseAVP):
 class GroupedAVP(BaseAVP):
     """Implements a Grouped AVP"""
 
+    # The payload the AVP index was built from, and the index of the
+    # decoded AVPs keyed by (vendor, code)
+    _indexed_payload = None
+    _index = None
+
     @staticmethod
     def decode_payload(payload):
         """Returns a list of AVPs from the decoded payload"""
@@ -356,10 +362,7 @@ class GroupedAVP(BaseAVP):
         Return:
             an iterator on all AVPs that match
         """
-        return filter(
-            lambda element: element.vendor == vendor
-            and element.code == code, self.value,
-        )
+        return iter(self._get_index().get((vendor, code), ()))
 
     def find_avp(self, vendor, code):
         """
@@ -371,9 +374,19 @@ class GroupedAVP(BaseAVP):
         Return:
             the first AVP that matches or None if no match exists
         """
-        result = list(self.filter_avps(vendor, code))
-        if len(result):
-            return result[0]
+        matches = self._get_index().get((vendor, code))
+        if matches:
+            return matches[0]
+
+    def _get_index(self):
+        """
+        Return the index of the decoded AVPs. The payload is only decoded
+        again if it was replaced since the index was built
+        """
+        if self._indexed_payload is not self.payload:
+            self._index = index_avps(self.value or [])
+            self._indexed_payload = self.payload
+        return self._index
 
 
 class AddressAVP(BaseAVP):
@@ -426,6 +439,7 @@ class ResultCode(IntEnum):
     """
     DIAMETER_SUCCESS = 2001
     DIAMETER_COMMAND_UNSUPPORTED = 3001
+    DIAMETER_TOO_BUSY = 3004
     DIAMETER_APPLICATION_UNSUPPORTED = 3007
     DIAMETER_ERROR_USER_UNKNOWN = 5001
     DIAMETER_MISSING_AVP = 5005
@@ -524,11 +538,90 @@ def resolve(name):
     Raises:
         ValueError if not found
     """
-    for vendor in AVPDict.keys():
-        for code in AVPDict[vendor].keys():
-            if AVPDict[vendor][code][0] == name:
-                return vendor, code
-    raise ValueError('AVP not found')
+    try:
+        return AVPNameIndex[name]
+    except KeyError:
+        raise ValueError('AVP not found')
+
+
+def index_avps(avps):
+    """
+    Index a list of AVPs by vendor and code
+
+    Args:
+        avps: a list of AVP instances
+    Returns:
+        a dict of (vendor, code) tuples to the list of matching AVPs,
+        in the order they appear in the list
+    """
+    index = {}
+    for avp_ in avps:
+        index.setdefault((avp_.vendor, avp_.code), []).append(avp_)
+    return index
+
+
+class GroupedAVPTemplate(object):
+    """
+    Encoder for a Grouped AVP with a fixed list of member AVPs, like the
+    E-UTRAN-Vector of an Authentication-Information-Answer. The member
+    definitions are resolved once and their headers are encoded once per
+    payload length, so only the member values are encoded per message.
+    """
+
+    def __init__(self, ident, members):
+        """
+        Args:
+            ident: the identifier of the Grouped AVP, as accepted by AVP()
+            members: the identifiers of the member AVPs, in encoding order
+        """
+        self._ident = ident
+        self._members = [AVP(member) for member in members]
+        # (member position, payload length) -> encoded member header
+        self._headers = {}
+
+    def __call__(self, *values):
+        """
+        Encode the member values into a new Grouped AVP
+
+        Args:
+            values: the member values, in the order of the members
+        Returns:
+            a GroupedAVP instance
+        Raises:
+            CodecException: if a value could not be encoded
+        """
+        if len(values) != len(self._members):
+            raise exception.CodecException(
+                'Expected %d values' % len(self._members),
+            )
+        chunks = []
+        for pos, value in enumerate(values):
+            payload = self._members[pos].encode_value(value)
+            header = self._headers.get((pos, len(payload)))
+            if header is None:
+                header = self._encode_header(pos, len(payload))
+            chunks.append(header)
+            chunks.append(payload)
+            chunks.append(b'\x00' * (-len(payload) % 4))
+        grouped = AVP(self._ident)
+        grouped.payload = b''.join(chunks)
+        return grouped
+
+    def _encode_header(self, pos, payload_length):
+        """Encode and cache the header of a member for a payload length"""
+        # The template is shared between threads, so set the dummy payload
+        # on a copy of the member rather than on the member itself
+        member = copy.copy(self._members[pos])
+        member.payload = bytes(payload_length)
+        member.validate()
+        header = struct.pack(
+            '!II', member.code,
+            member.flags << 24 | member._encoded_length(),
+        )
+        if member.vendor_specific:
+            header += struct.pack('!I', member.vendor)
+        self._headers[(pos, payload_length)] = header
+        return header
 
 
 def decode(payload):
@@ -725,3 +818,20 @@ AVPDict = {
         ),
     },
 }
+
+
+def _build_name_index():
+    """
+    Build the index of the AVPDict by AVP name. If a name is defined more
+    than once, the first definition is used.
+    """
+    index = {}
+    for vendor, avps in AVPDict.items():
+        for code, avp_def in avps.items():
+            index.setdefault(avp_def[0], (vendor, code))
+    return index
+
+
+# Index of the AVPDict by AVP name to resolve AVP identifiers without
+# scanning the dictionary
+AVPNameIndex = _build_name_index()
@@ -227,6 +227,8 @@ class Message(object):
     def __init__(self, header=None):
         self.header = header if header else MessageHeader()
         self._avps = []
+        # Index of the AVPs by (vendor, code), built as AVPs are appended
+        self._avp_index = {}
 
     @classmethod
     def create_response_msg(cls, msg):
@@ -284,6 +286,7 @@ class Message(object):
             avp_: an AVP instance
         """
         self._avps.append(avp_)
+        self._avp_index.setdefault((avp_.vendor, avp_.code), []).append(avp_)
 
     def filter_avps(self, vendor, code):
         """
@@ -295,10 +298,7 @@ class Message(object):
         Return:
             an iterator on all AVPs that match
         """
-        return filter(
-            lambda element: element.vendor == vendor
-            and element.code == code, self._avps,
-        )
+        return iter(self._avp_index.get((vendor, code), ()))
 
     def find_avp(self, vendor, code):
         """
@@ -310,9 +310,9 @@ class Message(object):
         Return:
             the first AVP that matches or None if no match exists
         """
-        result = list(self.filter_avps(vendor, code))
-        if len(result):
-            return result[0]
+        matches = self._avp_index.get((vendor, code))
+        if matches:
+            return matches[0]
 
     def has_fields(self, fields):
         """
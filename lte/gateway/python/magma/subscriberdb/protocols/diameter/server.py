@@ -14,10 +14,19 @@ limitations under the License.
 import asyncio
 import logging
 import random
+import struct
+import threading
 
+from magma.subscriberdb.metrics import S6A_TOO_BUSY_TOTAL
 from magma.subscriberdb.protocols.diameter.application import base, s6a
 
-from . import exception, message
+from . import avp, exception, message
+
+# Initial size of the receive buffer of a connection
+READBUF_SIZE = 64 * 1024
+# Default number of S6a requests of a connection that can be waiting for
+# or running on the worker pool
+DEFAULT_MAX_PENDING = 128
 
 
 class S6aServer(asyncio.Protocol):
@@ -25,9 +34,19 @@ class S6aServer(asyncio.Protocol):
     This is a Diameter 3GPP S6A Server. It sits between the MME and
     subscriberdb to exchange auth information. This class handles TCP
     connection initialization and handling incoming data from the network
+
+    By default messages are handled on the event loop. If an executor is
+    given, S6a requests are handled on it instead, so a slow request does
+    not stall the loop. Answers are then written as requests complete, and
+    matched to their request by the hop-by-hop identifier copied into the
+    answer. Requests beyond max_pending are answered with
+    DIAMETER_TOO_BUSY.
     """
 
-    def __init__(self, base_manager, s6a_manager, realm, host, loop=None):
+    def __init__(
+        self, base_manager, s6a_manager, realm, host, loop=None,
+        executor=None, max_pending=DEFAULT_MAX_PENDING,
+    ):
         self.realm = realm
         self.host = host
         self.state_id = random.randint(0, 100000000)
@@ -36,6 +55,10 @@ class S6aServer(asyncio.Protocol):
         self._base_manager = base_manager
         self.writer = None
         self.loop = loop
+        self._executor = executor
+        self._max_pending = max_pending
+        # hop-by-hop id -> future of the S6a requests on the executor
+        self._pending = {}
 
     def connection_made(self, transport):
         """
@@ -47,11 +70,12 @@ class S6aServer(asyncio.Protocol):
             None
         """
         logging.info("Connection received, state id: %d", self.state_id)
-        # bytesarray is more efficient to append fragments of reads
-        self._readbuf = bytearray()
+        if self.loop is None:
+            self.loop = asyncio.get_event_loop()
+        self._readbuf = ReadBuffer(READBUF_SIZE)
         self.writer = Writer(
             self.realm, self.host,
-            self.state_id, transport,
+            self.state_id, transport, self.loop,
         )
         self._base_manager.set_writer(self.writer)
         self._s6a_manager.set_writer(self.writer)
@@ -71,34 +95,21 @@ class S6aServer(asyncio.Protocol):
         logging.debug("Bytes read: %s", data)
         self._readbuf.extend(data)
 
-        # Use memoryview to prevent copies when slicing
-        memview = memoryview(self._readbuf)
-        remain = len(memview)
-        begin = 0  # beginning of message
-
-        while remain >= message.HEADER_LEN:
+        while len(self._readbuf) >= message.HEADER_LEN:
             try:
-                msg = message.decode(memview[begin:])
+                msg = self._readbuf.read_msg()
+                if msg is None:
+                    logging.error("Diameter message too short to decode")
+                    return
                 logging.debug("Handling diameter message:\n%s", msg)
-                self._handle_msg(msg.header.application_id, msg)
-                # Get ready for the next message
-                begin += msg.length
-                remain -= msg.length
-            except exception.TooShortException:
-                logging.error("Diameter message too short to decode")
-                return
+                self._dispatch_msg(msg)
             except Exception as exc:  # pylint: disable=broad-except
                 # Handle any exceptions with message handling, without
                 # affecting other messages/users
                 logging.exception(exc)
 
                 # Clear past garbage
-                length = len(memview[begin:])
-                begin += length
-                remain -= length
-
-        # Get the unparsed bytes
-        self._readbuf = bytearray(memview[begin:])
+                self._readbuf.clear()
 
     def connection_lost(self, exc):
         """
@@ -110,6 +121,81 @@ class S6aServer(asyncio.Protocol):
             None
         """
         logging.warning("Connection lost!")
+        # Drop the requests that did not start, their answers can't be sent
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def _dispatch_msg(self, msg):
+        """
+        Handles a message on the event loop, or submits it to the executor
+        if it is an S6a request and an executor is configured.
+
+        Args:
+            msg: the decoded message
+        Returns:
+            None
+        """
+        application_id = msg.header.application_id
+        if self._executor is None or \
+                application_id != s6a.S6AApplication.APP_ID or \
+                not msg.header.request:
+            self._handle_msg(application_id, msg)
+            return
+
+        hop_by_hop_id = msg.header.hop_by_hop_id
+        if hop_by_hop_id in self._pending:
+            # Retransmission of a request that is still being handled, the
+            # answer to the original request will be sent
+            logging.debug("Request 0x%x already in progress", hop_by_hop_id)
+            return
+        if len(self._pending) >= self._max_pending:
+            S6A_TOO_BUSY_TOTAL.inc()
+            logging.warning(
+                "Too many S6a requests in progress, rejecting 0x%x",
+                hop_by_hop_id,
+            )
+            self._send_too_busy(msg)
+            return
+
+        future = self._executor.submit(self._handle_msg, application_id, msg)
+        self._pending[hop_by_hop_id] = future
+        future.add_done_callback(
+            lambda f: self.loop.call_soon_threadsafe(
+                self._request_done, hop_by_hop_id, f,
+            ),
+        )
+
+    def _request_done(self, hop_by_hop_id, future):
+        """
+        Callback on the event loop when a request on the executor is done
+        """
+        if self._pending.get(hop_by_hop_id) is future:
+            del self._pending[hop_by_hop_id]
+        if not future.cancelled() and future.exception() is not None:
+            logging.exception(future.exception())
+
+    def _send_too_busy(self, msg):
+        """
+        Answers a request with the DIAMETER_TOO_BUSY protocol error
+
+        Args:
+            msg: the request to reject
+        Returns:
+            None
+        """
+        resp = message.Message.create_response_msg(msg)
+        resp.header.error = True
+        session_id = msg.find_avp(*avp.resolve('Session-Id'))
+        if session_id:
+            resp.append_avp(session_id)
+        resp.append_avp(avp.AVP('Origin-Host', self.host))
+        resp.append_avp(avp.AVP('Origin-Realm', self.realm))
+        resp.append_avp(avp.AVP('Origin-State-Id', self.state_id))
+        resp.append_avp(
+            avp.AVP('Result-Code', avp.ResultCode.DIAMETER_TOO_BUSY),
+        )
+        self.writer.send_msg(resp)
 
     def _handle_msg(self, application_id, msg):
         """
@@ -133,16 +219,87 @@ class S6aServer(asyncio.Protocol):
             )
 
 
+class ReadBuffer:
+    """
+    Reusable receive buffer of a connection. Reads are appended after the
+    unread bytes, which are only moved to the front of the buffer when
+    there is no room left after them. So a partial message is not copied
+    on every read.
+    """
+
+    def __init__(self, size):
+        self._buf = bytearray(size)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def extend(self, data):
+        """
+        Append data after the unread bytes, growing the buffer if needed.
+        The buffer is never resized in place, so views of it stay valid.
+        """
+        size = len(data)
+        if self._end + size > len(self._buf):
+            unread = len(self)
+            if unread + size > len(self._buf):
+                buf = bytearray(max(2 * len(self._buf), unread + size))
+            else:
+                buf = self._buf
+            buf[:unread] = self._buf[self._start:self._end]
+            self._buf = buf
+            self._start = 0
+            self._end = unread
+        self._buf[self._end:self._end + size] = data
+        self._end += size
+
+    def read_msg(self):
+        """
+        Decode and consume the first message in the buffer. The message is
+        copied out of the buffer first, since its AVPs reference the
+        memory they are decoded from and can outlive this read.
+
+        Returns:
+            the decoded message, or None if it wasn't fully received
+        Raises:
+            CodecException if the message could not be decoded
+        """
+        length = struct.unpack_from(
+            '!I', self._buf, self._start,
+        )[0] & 0x00FFFFFF
+        if length < message.HEADER_LEN or length % 4 != 0:
+            raise exception.CodecException("Received garbage")
+        if len(self) < length:
+            return None
+        data = bytes(self._buf[self._start:self._start + length])
+        msg = message.decode(memoryview(data))
+        self._consume(length)
+        return msg
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def _consume(self, length):
+        self._start += length
+        if self._start == self._end:
+            self.clear()
+
+
 class Writer:
     """The writer abstracts away a client connection for an
     application to be able to send messages to.
     """
 
-    def __init__(self, realm, host, state_id, transport):
+    def __init__(self, realm, host, state_id, transport, loop=None):
         self.realm = realm
         self.host = host
         self.state_id = state_id
         self._transport = transport
+        self._loop = loop
+        # Messages sent from other threads are written on the loop thread
+        self._loop_thread = threading.get_ident()
 
     def send_msg(self, msg):
         """
@@ -186,4 +343,8 @@ class Writer:
         Returns:
             None
         """
+        if self._loop is not None and \
+                threading.get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(self._transport.write, buf)
+            return
         self._transport.write(buf)
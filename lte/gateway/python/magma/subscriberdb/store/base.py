@@ -81,6 +81,8 @@ class BaseStore(metaclass=abc.ABCMeta):
 
         Args:
             subscribers - list of subscribers to be in the store.
+        Returns:
+            the ids of the subscribers which were added, changed or removed
         """
         raise NotImplementedError()
 
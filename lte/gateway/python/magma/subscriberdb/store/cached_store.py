@@ -12,28 +12,64 @@ limitations under the License.
 """
 
 import copy
+import logging
 import threading
 from collections import OrderedDict
 from contextlib import contextmanager
 
+from lte.protos.subscriberdb_pb2 import SubscriberData
 from magma.subscriberdb.sid import SIDUtils
 
 from .base import BaseStore, DuplicateSubscriberError
 from .onready import OnDataReady
 
+# Number of subscribers whose SQN recovery is remembered, per cached
+# subscriber
+RECOVERED_SQNS_PER_CACHE_ENTRY = 2
+
 
 class CachedStore(BaseStore):
     """
     A thread-safe cached persistent store of the subscriber database.
     Prerequisite: persistent_store need to be thread safe
+
+    If sqn_flush_interval is set, edits which only advance the LTE auth
+    sequence number are kept in the cache and written behind to the
+    persistent store in batches, every sqn_flush_interval seconds, so that
+    auth requests don't hit the disk. Increments that weren't flushed are
+    lost on a crash. To never reuse a sequence number, the SEQ of each
+    subscriber is advanced by sqn_recovery_jump the first time it is read
+    from the persistent store. 3GPP TS 33.102 Annex C allows such jumps as
+    long as they stay well below the USIM limit (delta = 2^28).
+    Subscribers read again after falling out of the bounded set of
+    recovered subscribers are advanced once more, which only skips more
+    sequence numbers.
     """
 
-    def __init__(self, persistent_store, cache_capacity=512, loop=None):
+    def __init__(
+        self, persistent_store, cache_capacity=100000, loop=None,
+        sqn_flush_interval=0, sqn_recovery_jump=0,
+    ):
         self._lock = threading.Lock()
         self._cache = OrderedDict()
         self._cache_capacity = cache_capacity
         self._persistent_store = persistent_store
         self._on_ready = OnDataReady(loop=loop)
+        self._sqn_flush_interval = sqn_flush_interval
+        self._sqn_recovery_jump = sqn_recovery_jump
+        # Subscribers whose sequence number is ahead of the persistent store
+        self._dirty_sqns = set()
+        # LRU of the subscribers whose sequence number was already guarded
+        self._recovered_sqns = OrderedDict()
+        self._recovered_sqns_capacity = \
+            RECOVERED_SQNS_PER_CACHE_ENTRY * cache_capacity
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        if sqn_flush_interval:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, daemon=True,
+            )
+            self._flush_thread.start()
 
     def add_subscriber(self, subscriber_data):
         """
@@ -46,6 +82,7 @@ class CachedStore(BaseStore):
 
             self._persistent_store.add_subscriber(subscriber_data)
             self._cache_put(sid, subscriber_data)
+            self._set_sqn_recovered(sid)
         self._on_ready.add_subscriber(subscriber_data)
 
     @contextmanager
@@ -54,14 +91,15 @@ class CachedStore(BaseStore):
         Context manager to modify the subscriber data.
         """
         with self._lock:
-            if subscriber_id in self._cache:
-                data = self._cache_get(subscriber_id)
-                subscriber_data = copy.deepcopy(data)
-            else:
-                subscriber_data = \
-                    self._persistent_store.get_subscriber_data(subscriber_id)
+            data = self._load(subscriber_id)
+            subscriber_data = copy.deepcopy(data)
             yield subscriber_data
-            self._persistent_store.update_subscriber(subscriber_data)
+            if self._sqn_flush_interval and \
+                    _only_sqn_changed(data, subscriber_data):
+                self._dirty_sqns.add(subscriber_id)
+            else:
+                self._persistent_store.update_subscriber(subscriber_data)
+                self._dirty_sqns.discard(subscriber_id)
             self._cache_put(subscriber_id, subscriber_data)
 
     def delete_subscriber(self, subscriber_id):
@@ -71,6 +109,8 @@ class CachedStore(BaseStore):
         with self._lock:
             if subscriber_id in self._cache:
                 del self._cache[subscriber_id]
+            self._dirty_sqns.discard(subscriber_id)
+            self._recovered_sqns.pop(subscriber_id, None)
 
             self._persistent_store.delete_subscriber(subscriber_id)
 
@@ -80,6 +120,8 @@ class CachedStore(BaseStore):
         """
         with self._lock:
             self._cache_clear()
+            self._dirty_sqns.clear()
+            self._recovered_sqns.clear()
             self._persistent_store.delete_all_subscribers()
 
     def resync(self, subscribers):
@@ -88,26 +130,34 @@ class CachedStore(BaseStore):
         subscribers. The resync leaves the current state of subscribers
         intact.
 
+        Only the subscribers added, changed or removed by the resync are
+        dropped from the cache.
+
         Args:
             subscribers - list of subscribers to be in the store.
+        Returns:
+            the ids of the subscribers which were added, changed or removed
         """
         with self._lock:
-            self._cache_clear()
-            self._persistent_store.resync(subscribers)
+            # The persistent store keeps the state it has, so the sequence
+            # numbers must be written before the cache is invalidated
+            self._flush_sqns()
+            changed = self._persistent_store.resync(subscribers)
+            self._invalidate(changed)
+            removed = set(changed).difference(
+                SIDUtils.to_str(sub.sid) for sub in subscribers
+            )
+            for subscriber_id in removed:
+                self._recovered_sqns.pop(subscriber_id, None)
         self._on_ready.resync(subscribers)
+        return changed
 
     def get_subscriber_data(self, subscriber_id):
         """
         Method that returns the subscriber data for the subscriber.
         """
         with self._lock:
-            if subscriber_id in self._cache:
-                return self._cache_get(subscriber_id)
-            else:
-                subscriber_data = \
-                    self._persistent_store.get_subscriber_data(subscriber_id)
-                self._cache_put(subscriber_id, subscriber_data)
-                return subscriber_data
+            return self._load(subscriber_id)
 
     def list_subscribers(self):
         """
@@ -117,9 +167,110 @@ class CachedStore(BaseStore):
         """
         return self._persistent_store.list_subscribers()
 
+    def get_current_digest(self):
+        """
+        Method that returns the subscriber digest of the persistent store.
+        """
+        return self._persistent_store.get_current_digest()
+
+    def update_digest(self, new_digest):
+        """
+        Method that updates the subscriber digest of the persistent store.
+        """
+        self._persistent_store.update_digest(new_digest)
+
+    def invalidate(self, subscriber_ids):
+        """
+        Drop subscribers from the cache, so that they are read again from the
+        persistent store. Pending sequence numbers are written first.
+        """
+        with self._lock:
+            self._invalidate(subscriber_ids)
+
+    def flush(self):
+        """
+        Write the pending sequence numbers to the persistent store.
+        """
+        with self._lock:
+            self._flush_sqns()
+
+    def close(self):
+        """
+        Stop the write-behind and flush the pending sequence numbers.
+        """
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        self.flush()
+
     async def on_ready(self):
         return await self._on_ready.event.wait()
 
+    def _invalidate(self, subscriber_ids):
+        """
+        Drop subscribers from the cache. Must be called with the lock held.
+        """
+        for subscriber_id in subscriber_ids:
+            if subscriber_id not in self._cache:
+                continue
+            if subscriber_id in self._dirty_sqns:
+                self._persistent_store.update_subscriber(
+                    self._cache[subscriber_id],
+                )
+                self._dirty_sqns.discard(subscriber_id)
+            del self._cache[subscriber_id]
+
+    def _load(self, subscriber_id):
+        """
+        Get the subscriber from the cache, or from the persistent store on a
+        miss. Must be called with the lock held.
+        """
+        if subscriber_id in self._cache:
+            return self._cache_get(subscriber_id)
+        subscriber_data = \
+            self._persistent_store.get_subscriber_data(subscriber_id)
+        if self._sqn_recovery_jump and \
+                subscriber_id not in self._recovered_sqns:
+            # Skip the sequence numbers that might have been handed out but
+            # not flushed before the last shutdown
+            subscriber_data.state.lte_auth_next_seq += self._sqn_recovery_jump
+            self._persistent_store.update_subscriber(subscriber_data)
+            self._set_sqn_recovered(subscriber_id)
+        self._cache_put(subscriber_id, subscriber_data)
+        return subscriber_data
+
+    def _set_sqn_recovered(self, subscriber_id):
+        """
+        Remember that the sequence number of a subscriber was guarded,
+        forgetting the least recently guarded subscriber if full.
+        """
+        self._recovered_sqns[subscriber_id] = True
+        self._recovered_sqns.move_to_end(subscriber_id)
+        if len(self._recovered_sqns) > self._recovered_sqns_capacity:
+            self._recovered_sqns.popitem(last=False)
+
+    def _flush_sqns(self):
+        """
+        Write the subscribers with pending sequence numbers in a batch.
+        Must be called with the lock held.
+        """
+        if not self._dirty_sqns:
+            return
+        subscribers = [
+            self._cache[subscriber_id] for subscriber_id in self._dirty_sqns
+        ]
+        self._persistent_store.update_subscribers(subscribers)
+        logging.debug("Flushed %d subscriber SQNs", len(subscribers))
+        self._dirty_sqns.clear()
+
+    def _flush_loop(self):
+        while not self._flush_stop.wait(self._sqn_flush_interval):
+            try:
+                self.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                # Keep the SQNs dirty, they are retried on the next flush
+                logging.error("Failed to flush subscriber SQNs: %s", e)
+
     def _cache_get(self, k):
         """
         Get from the LRU cache. Move the last hit entry to the end.
@@ -131,8 +282,15 @@ class CachedStore(BaseStore):
         """
         Put to the LRU cache. Evict the first item if full.
         """
+        if k in self._cache:
+            self._cache[k] = v
+            self._cache.move_to_end(k)
+            return
         if self._cache_capacity == len(self._cache):
-            self._cache.popitem(last=False)
+            evicted_k, evicted_v = self._cache.popitem(last=False)
+            if evicted_k in self._dirty_sqns:
+                self._persistent_store.update_subscriber(evicted_v)
+                self._dirty_sqns.discard(evicted_k)
         self._cache[k] = v
 
     def _cache_list(self):
@@ -140,3 +298,18 @@ class CachedStore(BaseStore):
 
     def _cache_clear(self):
         self._cache.clear()
+
+
+def _only_sqn_changed(old, new):
+    """
+    Check if an edit only changed the LTE auth sequence number
+    """
+    if old.state.lte_auth_next_seq == new.state.lte_auth_next_seq:
+        return False
+    old_probe, new_probe = SubscriberData(), SubscriberData()
+    old_probe.CopyFrom(old)
+    new_probe.CopyFrom(new)
+    # Setting the field on both also marks state as present on both
+    old_probe.state.lte_auth_next_seq = 0
+    new_probe.state.lte_auth_next_seq = 0
+    return old_probe == new_probe
@@ -12,6 +12,7 @@ limitations under the License.
 """
 
 import logging
+import queue
 import sqlite3
 from collections import defaultdict
 from contextlib import contextmanager
@@ -23,20 +24,96 @@ from magma.subscriberdb.sid import SIDUtils
 from .base import BaseStore, DuplicateSubscriberError, SubscriberNotFoundError
 from .onready import OnDataReady
 
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+DEFAULT_SYNCHRONOUS = 'NORMAL'
+DEFAULT_POOL_SIZE = 4
+# Max number of subscribers written per transaction by a resync
+RESYNC_CHUNK_SIZE = 500
+
+
+class _ConnectionPool(object):
+    """
+    Pool of persistent connections to a single sqlite database.
+
+    Connections are opened lazily and kept open between operations, so that
+    the per-connection statement cache of the sqlite3 module keeps the
+    subscriber queries prepared. A connection is only used by one thread at
+    a time, at most pool_size idle connections are kept.
+    """
+
+    def __init__(self, db_location: str, pool_size: int, synchronous: str):
+        self._db_location = db_location
+        self._synchronous = synchronous
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_location, uri=True, check_same_thread=False,
+        )
+        # WAL lets readers proceed while the SQN update of another auth
+        # request is being written. The journal mode is persistent, so this
+        # is a no-op for all but the first connection to a database.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=%s" % self._synchronous)
+        return conn
+
 
 class SqliteStore(BaseStore):
     """
     A thread-safe sqlite based implementation of the subscriber database.
 
+    Each shard keeps a pool of persistent connections with the database in
+    WAL mode. The durability of the commits is controlled by the sqlite
+    synchronous level: with NORMAL (the default) in WAL mode, a power loss
+    can roll back the last transactions, but never corrupts the database.
+
     Processes using this store shouldn't be forked since the sqlite connections
     can't be shared by multiple processes.
     """
 
-    def __init__(self, db_location, loop=None, sid_digits=2):
+    def __init__(
+        self, db_location, loop=None, sid_digits=2,
+        synchronous=DEFAULT_SYNCHRONOUS, pool_size=DEFAULT_POOL_SIZE,
+    ):
         self._sid_digits = sid_digits  # last digits to be included from subscriber id
         self._n_shards = 10**sid_digits
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                "Invalid sqlite synchronous level: %s" % synchronous,
+            )
         self._db_locations, self._digest_db_location = \
             self._create_db_locations(db_location, self._n_shards)
+        self._pools = [
+            _ConnectionPool(location, pool_size, synchronous)
+            for location in self._db_locations
+        ]
+        self._digest_pool = _ConnectionPool(
+            self._digest_db_location, pool_size, synchronous,
+        )
         self._create_store()
         self._on_ready = OnDataReady(loop=loop)
 
@@ -47,7 +124,9 @@ class SqliteStore(BaseStore):
             db_location = "/var/opt/magma/"
 
         # construct db_location items as:
-        # file:<path>subscriber<shard>.db?cache=shared
+        # file:<path>subscriber<shard>.db
+        # The shared cache is not used: it serializes the connections of a
+        # shard with table locks, which defeats the connection pool and WAL.
         db_location_list = []
 
         # file name is passed, use it as a base
@@ -57,12 +136,12 @@ class SqliteStore(BaseStore):
                 + db_location
                 + 'subscriber'
                 + str(shard)
-                + ".db?cache=shared",
+                + ".db",
             )
             logging.info("db location: %s", db_location_list[shard])
 
         digest_db_location = 'file:' + db_location + \
-                             'subscriber-digest.db?cache=shared'
+                             'subscriber-digest.db'
         logging.info("digest db location: %s", digest_db_location)
 
         return db_location_list, digest_db_location
@@ -72,26 +151,20 @@ class SqliteStore(BaseStore):
         Create the sqlite table for subscribers and digest if they don't exist
         already.
         """
-        for db_location in self._db_locations:
-            conn = sqlite3.connect(db_location, uri=True)
-            try:
+        for pool in self._pools:
+            with pool.connection() as conn:
                 with conn:
                     conn.execute(
                         "CREATE TABLE IF NOT EXISTS subscriberdb"
                         "(subscriber_id text PRIMARY KEY, data text)",
                     )
-            finally:
-                conn.close()
 
-        conn = sqlite3.connect(self._digest_db_location, uri=True)
-        try:
+        with self._digest_pool.connection() as conn:
             with conn:
                 conn.execute(
                     "CREATE TABLE IF NOT EXISTS subscriber_digest"
                     "(digest string PRIMARY KEY, updated_at timestamp)",
                 )
-        finally:
-            conn.close()
 
     def add_subscriber(self, subscriber_data: SubscriberData):
         """
@@ -99,9 +172,8 @@ class SqliteStore(BaseStore):
         """
         sid = SIDUtils.to_str(subscriber_data.sid)
         data_str = subscriber_data.SerializeToString()
-        db_location = self._db_locations[self._sid2bucket(sid)]
-        conn = sqlite3.connect(db_location, uri=True)
-        try:
+        pool = self._pools[self._sid2bucket(sid)]
+        with pool.connection() as conn:
             with conn:
                 res = conn.execute(
                     "SELECT data FROM subscriberdb WHERE "
@@ -114,8 +186,6 @@ class SqliteStore(BaseStore):
                     "INSERT INTO subscriberdb(subscriber_id, data) "
                     "VALUES (?, ?)", (sid, data_str),
                 )
-        finally:
-            conn.close()
         self._on_ready.add_subscriber(subscriber_data)
 
     @contextmanager
@@ -123,10 +193,12 @@ class SqliteStore(BaseStore):
         """
         Context manager to modify the subscriber data.
         """
-        db_location = self._db_locations[self._sid2bucket(subscriber_id)]
-        conn = sqlite3.connect(db_location, uri=True)
-        try:
+        pool = self._pools[self._sid2bucket(subscriber_id)]
+        with pool.connection() as conn:
             with conn:
+                # Take the write lock before reading, so that concurrent
+                # edits on other connections of the pool are serialized
+                conn.execute("BEGIN IMMEDIATE")
                 res = conn.execute(
                     "SELECT data FROM subscriberdb WHERE " "subscriber_id = ?",
                     (subscriber_id,),
@@ -143,43 +215,34 @@ class SqliteStore(BaseStore):
                     "WHERE subscriber_id = ?",
                     (data_str, subscriber_id),
                 )
-        finally:
-            conn.close()
 
     def delete_subscriber(self, subscriber_id):
         """
         Delete a subscriber, if present.
         """
-        db_location = self._db_locations[self._sid2bucket(subscriber_id)]
-        conn = sqlite3.connect(db_location, uri=True)
-        try:
+        pool = self._pools[self._sid2bucket(subscriber_id)]
+        with pool.connection() as conn:
             with conn:
                 conn.execute(
                     "DELETE FROM subscriberdb WHERE " "subscriber_id = ?",
                     (subscriber_id,),
                 )
-        finally:
-            conn.close()
 
     def delete_all_subscribers(self):
         """
         Remove all the subscribers from the store
         """
-        for db_location in self._db_locations:
-            conn = sqlite3.connect(db_location, uri=True)
-            try:
+        for pool in self._pools:
+            with pool.connection() as conn:
                 with conn:
                     conn.execute("DELETE FROM subscriberdb")
-            finally:
-                conn.close()
 
     def get_subscriber_data(self, subscriber_id):
         """
         Return the auth key for the subscriber.
         """
-        db_location = self._db_locations[self._sid2bucket(subscriber_id)]
-        conn = sqlite3.connect(db_location, uri=True)
-        try:
+        pool = self._pools[self._sid2bucket(subscriber_id)]
+        with pool.connection() as conn:
             with conn:
                 res = conn.execute(
                     "SELECT data FROM subscriberdb WHERE "
@@ -188,8 +251,6 @@ class SqliteStore(BaseStore):
                 row = res.fetchone()
                 if not row:
                     raise SubscriberNotFoundError(subscriber_id)
-        finally:
-            conn.close()
         subscriber_data = SubscriberData()
         subscriber_data.ParseFromString(row[0])
         return subscriber_data
@@ -199,16 +260,13 @@ class SqliteStore(BaseStore):
         Return the list of subscribers stored
         """
         sub_list = []
-        for db_location in self._db_locations:
-            conn = sqlite3.connect(db_location, uri=True)
-            try:
+        for pool in self._pools:
+            with pool.connection() as conn:
                 with conn:
                     res = conn.execute(
                         "SELECT subscriber_id FROM subscriberdb",
                     )
                     sub_list.extend([row[0] for row in res])
-            finally:
-                conn.close()
         return sub_list
 
     def update_subscriber(self, subscriber_data):
@@ -226,9 +284,8 @@ class SqliteStore(BaseStore):
         """
         sid = SIDUtils.to_str(subscriber_data.sid)
         data_str = subscriber_data.SerializeToString()
-        db_location = self._db_locations[self._sid2bucket(sid)]
-        conn = sqlite3.connect(db_location, uri=True)
-        try:
+        pool = self._pools[self._sid2bucket(sid)]
+        with pool.connection() as conn:
             with conn:
                 res = conn.execute(
                     "UPDATE subscriberdb SET data = ? "
@@ -236,8 +293,30 @@ class SqliteStore(BaseStore):
                 )
                 if not res.rowcount:
                     raise SubscriberNotFoundError(sid)
-        finally:
-            conn.close()
+
+    def update_subscribers(self, subscribers):
+        """
+        Method that updates a batch of subscribers, with a single
+        transaction per shard. Subscribers which aren't present are
+        skipped.
+
+        Args:
+            subscribers - list of SubscriberData protobuf messages
+        """
+        bucket_rows = defaultdict(list)
+        for sub in subscribers:
+            sid = SIDUtils.to_str(sub.sid)
+            bucket_rows[self._sid2bucket(sid)].append(
+                (sub.SerializeToString(), sid),
+            )
+
+        for bucket, rows in bucket_rows.items():
+            with self._pools[bucket].connection() as conn:
+                with conn:
+                    conn.executemany(
+                        "UPDATE subscriberdb SET data = ? "
+                        "WHERE subscriber_id = ?", rows,
+                    )
 
     def resync(self, subscribers):
         """
@@ -245,51 +324,82 @@ class SqliteStore(BaseStore):
         subscribers. The resync leaves the current state of subscribers
         intact.
 
+        Only the subscribers which were added, changed or removed are
+        written, in transactions of at most RESYNC_CHUNK_SIZE rows, so that
+        a large resync doesn't hold the write lock of a shard for long.
+
         Args:
             subscribers - list of subscribers to be in the store.
+        Returns:
+            the ids of the subscribers which were added, changed or removed
         """
-        bucket_subs = defaultdict(list)
+        bucket_subs = defaultdict(dict)
         for sub in subscribers:
             sid = SIDUtils.to_str(sub.sid)
-            bucket_subs[self._sid2bucket(sid)].append(sub)
-
-        for i, db_location in enumerate(self._db_locations):
-            conn = sqlite3.connect(db_location, uri=True)
-            try:
-                with conn:
-                    # Capture the current state of the subscribers
-                    res = conn.execute(
-                        "SELECT subscriber_id, data FROM subscriberdb",
-                    )
-                    current_state = {}
-                    for row in res:
-                        sub = SubscriberData()
-                        sub.ParseFromString(row[1])
-                        current_state[row[0]] = sub.state
-
-                    # Clear all subscribers
-                    conn.execute("DELETE FROM subscriberdb")
+            bucket_subs[self._sid2bucket(sid)][sid] = sub
 
-                    # Add the subscribers with the current state
-                    for sub in bucket_subs[i]:
-                        sid = SIDUtils.to_str(sub.sid)
-                        if sid in current_state:
-                            sub.state.CopyFrom(current_state[sid])
-                        data_str = sub.SerializeToString()
-                        conn.execute(
-                            "INSERT INTO subscriberdb(subscriber_id, data) "
-                            "VALUES (?, ?)", (sid, data_str),
-                        )
-            finally:
-                conn.close()
+        changed = []
+        for i, pool in enumerate(self._pools):
+            with pool.connection() as conn:
+                changed.extend(self._resync_shard(conn, bucket_subs[i]))
         self._on_ready.resync(subscribers)
+        return changed
+
+    def _resync_shard(self, conn, subs):
+        """
+        Apply the difference between the subscribers of a shard and subs,
+        a dict of subscriber id to SubscriberData. Returns the ids of the
+        subscribers written or deleted.
+        """
+        with conn:
+            res = conn.execute("SELECT subscriber_id, data FROM subscriberdb")
+            current = dict(res.fetchall())
+
+        to_write = []
+        for sid, sub in subs.items():
+            data_str = current.get(sid)
+            if data_str is not None:
+                if _with_state(sub, data_str).SerializeToString() == data_str:
+                    continue
+            to_write.append(sid)
+        to_delete = [(sid,) for sid in current.keys() - subs.keys()]
+
+        for start in range(0, len(to_write), RESYNC_CHUNK_SIZE):
+            sids = to_write[start:start + RESYNC_CHUNK_SIZE]
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                # Read the state again under the write lock, the sequence
+                # numbers could have been updated since the diff
+                res = conn.execute(
+                    "SELECT subscriber_id, data FROM subscriberdb WHERE "
+                    "subscriber_id IN (%s)" % ','.join('?' * len(sids)),
+                    sids,
+                )
+                for sid, data_str in res:
+                    _with_state(subs[sid], data_str)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO subscriberdb(subscriber_id, data) "
+                    "VALUES (?, ?)",
+                    [(sid, subs[sid].SerializeToString()) for sid in sids],
+                )
+        for start in range(0, len(to_delete), RESYNC_CHUNK_SIZE):
+            with conn:
+                conn.executemany(
+                    "DELETE FROM subscriberdb WHERE subscriber_id = ?",
+                    to_delete[start:start + RESYNC_CHUNK_SIZE],
+                )
+        if to_write or to_delete:
+            logging.debug(
+                "Resync wrote %d and deleted %d subscribers, %d unchanged",
+                len(to_write), len(to_delete), len(subs) - len(to_write),
+            )
+        return to_write + [sid for sid, in to_delete]
 
     def get_current_digest(self) -> str:
         """
         Return the current subscriber digest stored in the db.
         """
-        conn = sqlite3.connect(self._digest_db_location, uri=True)
-        try:
+        with self._digest_pool.connection() as conn:
             with conn:
                 res = conn.execute(
                     "SELECT digest, updated_at FROM subscriber_digest",
@@ -297,8 +407,6 @@ class SqliteStore(BaseStore):
                 row = res.fetchone()
                 if not row:
                     row = ["", None]
-        finally:
-            conn.close()
 
         digest = str(row[0])
         logging.info("get digest stored in gateway: %s", digest)
@@ -308,8 +416,7 @@ class SqliteStore(BaseStore):
         """
         Replace the old digest in the db with the new digest.
         """
-        conn = sqlite3.connect(self._digest_db_location, uri=True)
-        try:
+        with self._digest_pool.connection() as conn:
             with conn:
                 conn.execute("DELETE FROM subscriber_digest")
 
@@ -317,11 +424,17 @@ class SqliteStore(BaseStore):
                     "INSERT INTO subscriber_digest(digest, updated_at) "
                     "VALUES (?, ?)", (new_digest, datetime.now()),
                 )
-        finally:
-            conn.close()
 
         logging.info("update digest stored in gateway: %s", new_digest)
 
+    def close(self):
+        """
+        Close the pooled connections of all the shards.
+        """
+        for pool in self._pools:
+            pool.close()
+        self._digest_pool.close()
+
     async def on_ready(self):
         return await self._on_ready.event.wait()
 
@@ -356,3 +469,13 @@ class SqliteStore(BaseStore):
             )
             bucket = 0
         return bucket
+
+
+def _with_state(sub: SubscriberData, data_str: bytes) -> SubscriberData:
+    """
+    Copy the state of the stored subscriber data_str to sub, and return sub
+    """
+    stored = SubscriberData()
+    stored.ParseFromString(data_str)
+    sub.state.CopyFrom(stored.state)
+    return sub
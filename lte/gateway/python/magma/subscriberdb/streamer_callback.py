@@ -65,6 +65,8 @@ class SubscriberDBStreamerCallback(StreamerClient.Callback):
             # what to detach.
             self.detach_deleted_subscribers(old_sub_ids, active_subscriber_ids)
             logging.debug("Resync with subscribers: %s", ','.join(keys))
+            # With a CachedStore, the resync also writes the pending SQNs
+            # and invalidates the cached profiles of the changed subscribers
             self._store.resync(subscribers)
         else:
             # TODO: implement updates
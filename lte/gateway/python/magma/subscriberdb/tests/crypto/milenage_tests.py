@@ -13,7 +13,7 @@ limitations under the License.
 
 import unittest
 
-from magma.subscriberdb.crypto.milenage import Milenage
+from magma.subscriberdb.crypto.milenage import Milenage, rotate, xor
 
 
 class MilenageRandomTests(unittest.TestCase):
@@ -125,6 +125,48 @@ class MilenageTests(unittest.TestCase):
         self.assertEqual(Milenage.generate_opc(k, op), opc)
         self.assertEqual(Milenage.f5_star(k, self.rand, opc), ak)
 
+    def test_eutran_vector_test_set(self):
+        """ Tests that the vector computed from a single TEMP matches
+        the test set 1 from 3GPP 35.207
+        """
+        self.rand = b'#U<\xbe\x967\xa8\x9d!\x8a\xe6M\xaeG\xbf5'
+
+        # Inputs
+        k = b'\x46\x5b\x5c\xe8\xb1\x99\xb4\x9f\xaa\x5f\x0a\x2e\xe2\x38\xa6\xbc'
+        opc = b'\xcdc\xcbq\x95J\x9fNH\xa5\x99N7\xa0+\xaf'
+        sqn = 0xff9bb4d0b607
+        amf = b'\xb9\xb9'
+        plmn = b'\x02\xf8\x59'
+
+        # Outputs
+        f2 = b'\xa5\x42\x11\xd5\xe3\xba\x50\xbf'
+        f5 = b'\xaa\x68\x9c\x64\x83\x70'
+        sqn_x_ak = b'\x55\xf3\x28\xb4\x35\x77'
+        mac_a = b'\x4a\x9f\xfa\xc3\x54\xdf\xaf\xb3'
+        f3 = b'\xb4\x0b\xa9\xa3\xc5\x8b\x2a\x05\xbb\xf0\xd9\x87\xb2\x1b\xf8\xcb'
+        f4 = b'\xf7\x69\xbc\xd7\x51\x04\x46\x04\x12\x76\x72\x71\x1c\x6d\x34\x41'
+
+        crypto = Milenage(amf)
+        (rand_, xres_, autn_, kasme_) = \
+            crypto.generate_eutran_vector(k, opc, sqn, plmn)
+        self.assertEqual(self.rand, rand_)
+        self.assertEqual(f2, xres_)
+        self.assertEqual(sqn_x_ak + amf + mac_a, autn_)
+        self.assertEqual(
+            Milenage.generate_kasme(
+                f3, f4, plmn, sqn.to_bytes(6, 'big'), f5,
+            ),
+            kasme_,
+        )
+
+    def test_xor_rotate(self):
+        """ Tests the byte string helpers """
+        self.assertEqual(xor(b'\x0f\xf0', bytearray(b'\xff\xff')), b'\xf0\x0f')
+        with self.assertRaises(ValueError):
+            xor(b'\x00', b'\x00\x00')
+        self.assertEqual(rotate(b'\x01\x02\x03\x04', 1), b'\x02\x03\x04\x01')
+        self.assertEqual(rotate(b'\x01\x02\x03\x04', 0), b'\x01\x02\x03\x04')
+
     def test_generate_resync(self):
         """ Tests that that we compute the seq and mac_s correctly given
         an auts during re-synchronisation.
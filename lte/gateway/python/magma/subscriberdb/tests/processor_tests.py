@@ -228,6 +228,33 @@ class ProcessorTests(unittest.TestCase):
             eutran_vector,
         )
 
+    def test_lte_auth_multiple_vectors(self):
+        """
+        Test if we get several auth vectors with a reserved SEQ range
+        """
+        vectors = self._processor.generate_lte_auth_vectors(
+            '11111', 3 * b'\x00', 3,
+        )
+        self.assertEqual(vectors, 3 * [_dummy_eutran_vector()])
+        self.assertEqual(self._processor.get_next_lte_auth_seq('11111'), 4)
+
+        # Requests are capped to the maximum number of vectors
+        vectors = self._processor.generate_lte_auth_vectors(
+            '11111', 3 * b'\x00', 10,
+        )
+        self.assertEqual(len(vectors), processor.MAX_EUTRAN_VECTORS)
+        self.assertEqual(
+            self._processor.get_next_lte_auth_seq('11111'),
+            5 + processor.MAX_EUTRAN_VECTORS,
+        )
+
+        # No SEQ is consumed if the vectors can't be generated
+        with self.assertRaises(CryptoError):
+            self._processor.generate_lte_auth_vectors(
+                '55555', 3 * b'\x00', 3,
+            )
+        self.assertEqual(self._processor.get_next_lte_auth_seq('55555'), 1)
+
     def test_lte_auth_fail_opc_short(self):
         """
         Test if we get the a crypto error if the OPc is too short
@@ -11,7 +11,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from magma.subscriberdb.protocols.diameter import avp
 from magma.subscriberdb.protocols.diameter.exception import CodecException
@@ -387,6 +389,11 @@ class AVPValueTests(unittest.TestCase):
         self.assertEqual(grouped_avp.find_avp(0, 1).value, 'Hello')
         self.assertEqual(grouped_avp.find_avp(0, 2), None)
 
+        # Test the lookups follow a new value
+        grouped_avp.value = [avp.UTF8StringAVP(1, 'Bye')]
+        self.assertEqual(grouped_avp.find_avp(0, 1).value, 'Bye')
+        self.assertEqual(len(list(grouped_avp.filter_avps(0, 1))), 1)
+
 
 class AVPConstructorTests(unittest.TestCase):
     """
@@ -504,6 +511,83 @@ class AVPConstructorTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             avp.AVP('Wut', 'error')
 
+    def test_name_index(self):
+        """
+        Tests every AVP in the dictionary resolves by name
+        """
+        for vendor, avps in avp.AVPDict.items():
+            for avp_def in avps.values():
+                name = avp_def[0]
+                resolved_vendor, resolved_code = avp.resolve(name)
+                self.assertEqual(resolved_vendor, vendor)
+                self.assertEqual(
+                    avp.AVPDict[resolved_vendor][resolved_code][0], name,
+                )
+
+        with self.assertRaises(ValueError):
+            avp.resolve('Wut')
+
+    def test_grouped_template(self):
+        """
+        Tests a grouped AVP template encodes the same bytes as the AVPs
+        """
+        template = avp.GroupedAVPTemplate(
+            'E-UTRAN-Vector', ['RAND', 'XRES', 'AUTN', 'KASME'],
+        )
+        for values in [
+            (16 * b'\x01', 8 * b'\x02', 16 * b'\x03', 32 * b'\x04'),
+            # Member payloads that need padding
+            (16 * b'\x01', 5 * b'\x02', 16 * b'\x03', 31 * b'\x04'),
+        ]:
+            expected = avp.AVP(
+                'E-UTRAN-Vector', [
+                    avp.AVP('RAND', values[0]),
+                    avp.AVP('XRES', values[1]),
+                    avp.AVP('AUTN', values[2]),
+                    avp.AVP('KASME', values[3]),
+                ],
+            )
+            encoded = template(*values)
+            self._compare_avp(encoded, expected)
+            out_buf = bytearray(encoded.length)
+            encoded.encode(out_buf, 0)
+            self._decode_check(expected, out_buf)
+
+        with self.assertRaises(CodecException):
+            template(16 * b'\x01')
+
+    def test_grouped_template_concurrent(self):
+        """
+        Tests a grouped AVP template can encode from several threads while
+        the member headers are being cached
+        """
+        template = avp.GroupedAVPTemplate(
+            'E-UTRAN-Vector', ['RAND', 'XRES', 'AUTN', 'KASME'],
+        )
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        def encode(length):
+            values = (
+                16 * b'\x01', length * b'\x02', 16 * b'\x03', 32 * b'\x04',
+            )
+            encoded = template(*values)
+            expected = avp.AVP(
+                'E-UTRAN-Vector', [
+                    avp.AVP('RAND', values[0]),
+                    avp.AVP('XRES', values[1]),
+                    avp.AVP('AUTN', values[2]),
+                    avp.AVP('KASME', values[3]),
+                ],
+            )
+            self.assertEqual(encoded.payload, expected.payload)
+
+        # Each XRES length needs a new header, so the threads race on
+        # encoding headers rather than reading them from the cache
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(encode, range(1, 4000)))
+
     def test_result_code(self):
         """
         Tests we can create an AVP with a code and it defaults to the defaults
@@ -56,6 +56,9 @@ class MockProcessor(LTEProcessor):
         else:
             raise SubscriberNotFoundError
 
+    def generate_lte_auth_vectors(self, imsi, plmn, num_vectors):
+        return num_vectors * [self.generate_lte_auth_vector(imsi, plmn)]
+
     def resync_lte_auth_seq(self, auts, key, rand):
         pass
 
@@ -216,6 +219,76 @@ class S6AApplicationTests(unittest.TestCase):
 
         self._check_reply(req_buf, resp_buf)
 
+    def test_auth_multiple_vectors(self):
+        """
+        Test that we respond with the number of vectors requested
+        """
+        msg = message.Message()
+        msg.header.application_id = s6a.S6AApplication.APP_ID
+        msg.header.command_code = s6a.S6AApplicationCommands.AUTHENTICATION_INFORMATION
+        msg.header.request = True
+        msg.append_avp(
+            avp.AVP(
+                'Session-Id',
+                'enb-Lenovo-Product.openair4G.eur;1475864727;1;apps6a',
+            ),
+        )
+        msg.append_avp(avp.AVP('Auth-Session-State', 1))
+        msg.append_avp(avp.AVP('User-Name', '1'))
+        msg.append_avp(avp.AVP('Visited-PLMN-Id', b'(Y'))
+        msg.append_avp(
+            avp.AVP(
+                'Requested-EUTRAN-Authentication-Info', [
+                    avp.AVP('Number-Of-Requested-Vectors', 3),
+                    avp.AVP('Immediate-Response-Preferred', 0),
+                ],
+            ),
+        )
+        # Encode request message into buffer
+        req_buf = bytearray(msg.length)
+        msg.encode(req_buf, 0)
+
+        rand, xres, autn, kasme = _dummy_eutran_vector()
+        msg = message.Message()
+        msg.header.application_id = s6a.S6AApplication.APP_ID
+        msg.header.command_code = \
+            s6a.S6AApplicationCommands.AUTHENTICATION_INFORMATION
+        msg.header.request = False
+        msg.append_avp(
+            avp.AVP(
+                'Session-Id',
+                'enb-Lenovo-Product.openair4G.eur;1475864727;1;apps6a',
+            ),
+        )
+        msg.append_avp(
+            avp.AVP(
+                'Authentication-Info', [
+                avp.AVP(
+                    'E-UTRAN-Vector', [
+                    avp.AVP('RAND', rand),
+                    avp.AVP('XRES', xres),
+                    avp.AVP('AUTN', autn),
+                    avp.AVP('KASME', kasme),
+                    ],
+                ) for _ in range(3)
+                ],
+            ),
+        )
+        msg.append_avp(avp.AVP('Auth-Session-State', 1))
+
+        # Host identifiers
+        msg.append_avp(avp.AVP('Origin-Host', self._server.host))
+        msg.append_avp(avp.AVP('Origin-Realm', self._server.realm))
+        msg.append_avp(avp.AVP('Origin-State-Id', self._server.state_id))
+
+        # Response result
+        msg.append_avp(avp.AVP('Result-Code', avp.ResultCode.DIAMETER_SUCCESS))
+        # Encode response into buffer
+        resp_buf = bytearray(msg.length)
+        msg.encode(resp_buf, 0)
+
+        self._check_reply(req_buf, resp_buf)
+
     def test_resync(self):
         """
         Test that we can respond to auth requests with an auth
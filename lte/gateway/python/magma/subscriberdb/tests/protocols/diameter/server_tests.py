@@ -13,14 +13,46 @@ limitations under the License.
 
 # pylint:disable=protected-access
 
+import asyncio
+import threading
 import unittest
+from concurrent.futures import Future
 from unittest.mock import Mock
 
-from magma.subscriberdb.protocols.diameter import message, server
+from magma.subscriberdb.protocols.diameter import avp, message, server
+from magma.subscriberdb.protocols.diameter.application import s6a
 
 from .common import MockTransport
 
 
+def _encode_request(application_id, hop_by_hop_id, session_id='session'):
+    msg = message.Message()
+    msg.header.application_id = application_id
+    msg.header.hop_by_hop_id = hop_by_hop_id
+    msg.header.request = True
+    msg.append_avp(avp.AVP('Session-Id', session_id))
+    buf = bytearray(msg.length)
+    msg.encode(buf, 0)
+    return bytes(buf)
+
+
+class ManualExecutor:
+    """ Executor that runs the submitted calls when asked to """
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, func, *args):
+        future = Future()
+        self.calls.append((future, func, args))
+        return future
+
+    def run_all(self):
+        for future, func, args in self.calls:
+            future.set_result(func(*args))
+        self.calls = []
+
+
 class ServerTests(unittest.TestCase):
     """
     Test class for Diameter Server dispatch to Applications
@@ -104,6 +136,120 @@ class ServerTests(unittest.TestCase):
         self.assertEqual(len(self._server._readbuf), 0)
 
 
+class ReadBufferTests(unittest.TestCase):
+    """
+    Tests for the reusable receive buffer
+    """
+
+    def test_partial_messages(self):
+        """Check partial messages are kept, and the buffer is reused
+        or grown as needed"""
+        req1 = _encode_request(1, 1)
+        req2 = _encode_request(2, 2, 'a longer session id')
+        readbuf = server.ReadBuffer(len(req1) + 4)
+
+        readbuf.extend(req1 + req2[:4])
+        self.assertEqual(readbuf.read_msg().header.application_id, 1)
+        self.assertIsNone(readbuf.read_msg())
+        self.assertEqual(len(readbuf), 4)
+
+        # The rest of the message doesn't fit after the partial one
+        readbuf.extend(req2[4:])
+        msg = readbuf.read_msg()
+        self.assertEqual(msg.header.application_id, 2)
+        self.assertEqual(len(readbuf), 0)
+
+        # Decoded messages don't reference the buffer
+        readbuf.extend(len(req2) * b'\x00')
+        self.assertEqual(
+            msg.find_avp(*avp.resolve('Session-Id')).value,
+            'a longer session id',
+        )
+
+
+class ExecutorDispatchTests(unittest.TestCase):
+    """
+    Tests for handling S6a requests on an executor
+    """
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        self._executor = ManualExecutor()
+        self._base_manager = Mock()
+        self._s6a_manager = Mock()
+        self._server = server.S6aServer(
+            self._base_manager,
+            self._s6a_manager,
+            "mai.facebook.com",
+            "hss.mai.facebook.com",
+            loop=self._loop,
+            executor=self._executor,
+            max_pending=1,
+        )
+
+        self._writes = Mock()
+
+        def convert_memview_to_bytes(memview):
+            """ Deep copy the memoryview for checking later  """
+            return self._writes(memview.tobytes())
+
+        self._transport = MockTransport()
+        self._transport.write = Mock(side_effect=convert_memview_to_bytes)
+        self._server.connection_made(self._transport)
+
+    def tearDown(self):
+        self._loop.close()
+
+    def test_dispatch_and_shed(self):
+        """Check S6a requests go to the executor, and are rejected
+        when too many are in progress"""
+        app_id = s6a.S6AApplication.APP_ID
+        self._server.data_received(_encode_request(app_id, 1))
+        self.assertEqual(len(self._executor.calls), 1)
+        self._s6a_manager.handle_msg.assert_not_called()
+
+        # A retransmission of the request in progress is dropped
+        self._server.data_received(_encode_request(app_id, 1))
+        self.assertEqual(len(self._executor.calls), 1)
+        self._writes.assert_not_called()
+
+        # The next request is over the limit
+        self._server.data_received(_encode_request(app_id, 2))
+        self.assertEqual(len(self._executor.calls), 1)
+        self._writes.assert_called_once()
+        resp = message.decode(self._writes.call_args[0][0])
+        self.assertFalse(resp.header.request)
+        self.assertTrue(resp.header.error)
+        self.assertEqual(resp.header.hop_by_hop_id, 2)
+        self.assertEqual(
+            resp.find_avp(*avp.resolve('Session-Id')).value, 'session',
+        )
+        self.assertEqual(
+            resp.find_avp(*avp.resolve('Result-Code')).value,
+            avp.ResultCode.DIAMETER_TOO_BUSY,
+        )
+
+        # Base application requests are still handled on the loop
+        self._server.data_received(_encode_request(0, 3))
+        self._base_manager.handle_msg.assert_called_once()
+
+        # Once the request completes, new ones are accepted
+        self._executor.run_all()
+        self._loop.run_until_complete(asyncio.sleep(0))
+        self._s6a_manager.handle_msg.assert_called_once()
+        self._server.data_received(_encode_request(app_id, 2))
+        self.assertEqual(len(self._executor.calls), 1)
+
+    def test_connection_lost(self):
+        """Check requests that did not start are cancelled"""
+        self._server.data_received(
+            _encode_request(s6a.S6AApplication.APP_ID, 1),
+        )
+        future = self._executor.calls[0][0]
+        self._server.connection_lost(None)
+        self.assertTrue(future.cancelled())
+
+
 class WriterTests(unittest.TestCase):
     """
     Test the Writer class for the diameter server
@@ -153,6 +299,26 @@ class WriterTests(unittest.TestCase):
         self._writes.assert_called_once_with(msg)
         self._writes.reset_mock()
 
+    def test_write_from_thread(self):
+        """Test that writes from other threads are done on the loop"""
+        loop = asyncio.new_event_loop()
+        writer = server.Writer(
+            "mai.facebook.com",
+            "hss.mai.facebook.com",
+            "127.0.0.1",
+            self._transport,
+            loop,
+        )
+        msg = memoryview(b'helloworld')
+        thread = threading.Thread(target=writer._write, args=(msg,))
+        thread.start()
+        thread.join()
+        self._writes.assert_not_called()
+
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+        self._writes.assert_called_once_with(msg)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -163,6 +163,28 @@ class StoreTests(unittest.TestCase):
             # sub2 was removed during resync
             self._store.get_subscriber_data(sid2)
 
+    def test_resync_invalidation(self):
+        """
+        Test if resync only drops the changed subscribers from the cache
+        """
+        (sid1, sub1) = self._add_subscriber('IMSI11111')
+        (sid2, sub2) = self._add_subscriber('IMSI11112')
+        (sid3, _) = self._add_subscriber('IMSI11113')
+        for sid in (sid1, sid2, sid3):
+            with self._store.edit_subscriber(sid) as subs:
+                subs.state.lte_auth_next_seq = 1000
+        self.assertEqual(self._store._cache_list(), [sid1, sid2, sid3])
+
+        sub1.lte.auth_key = b'5678'
+        self._store.resync([sub1, sub2])
+
+        self.assertEqual(self._store._cache_list(), [sid2])
+        self.assertEqual(
+            self._store.get_subscriber_data(sid1).lte.auth_key, b'5678',
+        )
+        with self.assertRaises(SubscriberNotFoundError):
+            self._store.get_subscriber_data(sid3)
+
     def test_lru_cache_invl(self):
         """
         Test if LRU eviction works as expected
@@ -196,3 +218,112 @@ class StoreTests(unittest.TestCase):
         self._store.delete_all_subscribers()
         self.assertEqual(self._store.list_subscribers(), [])
         self.assertEqual(self._store._cache_list(), [])
+
+
+class SqnWriteBehindTests(unittest.TestCase):
+    """
+    Test class for the write-behind of the LTE auth sequence numbers
+    """
+
+    def setUp(self):
+        self._tmpfile = tempfile.TemporaryDirectory()
+        self._sqlite = SqliteStore(self._tmpfile.name + '/')
+        # Long interval, the tests flush explicitly
+        self._store = CachedStore(
+            self._sqlite, 3, sqn_flush_interval=3600, sqn_recovery_jump=1000,
+        )
+        self._sid = 'IMSI11111'
+        self._store.add_subscriber(
+            SubscriberData(sid=SIDUtils.to_pb(self._sid)),
+        )
+
+    def tearDown(self):
+        self._store.close()
+        self._tmpfile.cleanup()
+
+    def _bump_sqn(self):
+        with self._store.edit_subscriber(self._sid) as subs:
+            subs.state.lte_auth_next_seq += 1
+
+    def _cached_sqn(self):
+        return self._store.get_subscriber_data(
+            self._sid,
+        ).state.lte_auth_next_seq
+
+    def _persisted_sqn(self):
+        return self._sqlite.get_subscriber_data(
+            self._sid,
+        ).state.lte_auth_next_seq
+
+    def test_sqn_write_behind(self):
+        """
+        Test if SQN increments are only written on flush
+        """
+        self._bump_sqn()
+        self._bump_sqn()
+        self.assertEqual(self._cached_sqn(), 2)
+        self.assertEqual(self._persisted_sqn(), 0)
+
+        self._store.flush()
+        self.assertEqual(self._persisted_sqn(), 2)
+
+        # Other changes are written through
+        self._bump_sqn()
+        with self._store.edit_subscriber(self._sid) as subs:
+            subs.lte.auth_key = b'5678'
+        self.assertEqual(self._persisted_sqn(), 3)
+
+    def test_sqn_flushed_on_eviction_and_resync(self):
+        """
+        Test if pending SQNs survive cache evictions and resyncs
+        """
+        self._bump_sqn()
+        for sid in ('IMSI22222', 'IMSI33333', 'IMSI44444'):
+            self._store.add_subscriber(
+                SubscriberData(sid=SIDUtils.to_pb(sid)),
+            )
+        self.assertEqual(self._persisted_sqn(), 1)
+
+        self._bump_sqn()
+        self._store.resync([SubscriberData(sid=SIDUtils.to_pb(self._sid))])
+        self.assertEqual(self._persisted_sqn(), 2)
+        self.assertEqual(self._cached_sqn(), 2)
+
+    def test_sqn_recovery_jump(self):
+        """
+        Test if the SQN jumps once when read after a restart
+        """
+        self._bump_sqn()
+        self._store.close()
+
+        self._store = CachedStore(
+            self._sqlite, 3, sqn_flush_interval=3600, sqn_recovery_jump=1000,
+        )
+        self._bump_sqn()
+        self.assertEqual(self._cached_sqn(), 1002)
+        self.assertEqual(self._persisted_sqn(), 1001)
+
+        # No jump when reloaded after an invalidation
+        self._store.invalidate([self._sid])
+        self.assertEqual(self._persisted_sqn(), 1002)
+        self._bump_sqn()
+        self._store.flush()
+        self.assertEqual(self._persisted_sqn(), 1003)
+
+    def test_sqn_recovery_bounded(self):
+        """
+        Test if the recovered subscribers are bounded and forgotten when
+        removed by a resync
+        """
+        sids = ['IMSI2222%d' % i for i in range(8)]
+        for sid in sids:
+            self._store.add_subscriber(
+                SubscriberData(sid=SIDUtils.to_pb(sid)),
+            )
+        # Twice the cache capacity
+        self.assertEqual(list(self._store._recovered_sqns), sids[2:])
+
+        self._store.resync([
+            SubscriberData(sid=SIDUtils.to_pb(sid)) for sid in sids[:4]
+        ])
+        self.assertEqual(list(self._store._recovered_sqns), sids[2:4])
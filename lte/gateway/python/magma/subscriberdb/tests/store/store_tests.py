@@ -12,9 +12,11 @@ limitations under the License.
 """
 
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
-from lte.protos.subscriberdb_pb2 import SubscriberData
+from lte.protos.subscriberdb_pb2 import LTESubscription, SubscriberData
 from magma.subscriberdb.sid import SIDUtils
 from magma.subscriberdb.store.base import (
     DuplicateSubscriberError,
@@ -34,6 +36,7 @@ class StoreTests(unittest.TestCase):
         self._store = SqliteStore(self._tmpfile.name + '/')
 
     def tearDown(self):
+        self._store.close()
         self._tmpfile.cleanup()
 
     def _add_subscriber(self, sid):
@@ -119,6 +122,49 @@ class StoreTests(unittest.TestCase):
             with self._store.edit_subscriber('IMSI3000') as subs:
                 pass
 
+    @mock.patch('magma.subscriberdb.store.sqlite.RESYNC_CHUNK_SIZE', 2)
+    def test_resync(self):
+        """
+        Test if resync applies the difference and keeps the state. The
+        subscribers are in the same shard.
+        """
+        for sid in ('IMSI11101', 'IMSI12101', 'IMSI13101', 'IMSI14101'):
+            self._add_subscriber(sid)
+        with self._store.edit_subscriber('IMSI11101') as sub:
+            sub.state.lte_auth_next_seq = 5
+        with self._store.edit_subscriber('IMSI12101') as sub:
+            sub.state.lte_auth_next_seq = 7
+
+        subs = [
+            # Unchanged
+            SubscriberData(sid=SIDUtils.to_pb('IMSI11101')),
+            # Changed
+            SubscriberData(
+                sid=SIDUtils.to_pb('IMSI12101'),
+                lte=LTESubscription(auth_key=b'1234'),
+            ),
+            # Added
+            SubscriberData(sid=SIDUtils.to_pb('IMSI15101')),
+            SubscriberData(sid=SIDUtils.to_pb('IMSI16101')),
+            SubscriberData(sid=SIDUtils.to_pb('IMSI17101')),
+        ]
+        changed = self._store.resync(subs)
+
+        self.assertEqual(
+            sorted(changed),
+            ['IMSI12101', 'IMSI13101', 'IMSI14101', 'IMSI15101', 'IMSI16101',
+             'IMSI17101'],
+        )
+        self.assertEqual(
+            sorted(self._store.list_subscribers()),
+            ['IMSI11101', 'IMSI12101', 'IMSI15101', 'IMSI16101', 'IMSI17101'],
+        )
+        sub1 = self._store.get_subscriber_data('IMSI11101')
+        self.assertEqual(sub1.state.lte_auth_next_seq, 5)
+        sub2 = self._store.get_subscriber_data('IMSI12101')
+        self.assertEqual(sub2.state.lte_auth_next_seq, 7)
+        self.assertEqual(sub2.lte.auth_key, b'1234')
+
     def test_digest(self):
         """
         Test if digest gets & updates work as expected
@@ -129,6 +175,49 @@ class StoreTests(unittest.TestCase):
         self._store.update_digest("digest_banana")
         self.assertEqual(self._store.get_current_digest(), "digest_banana")
 
+    def test_wal_connection_pool(self):
+        """
+        Test if connections are reused and the shards are in WAL mode
+        """
+        (sid1, _) = self._add_subscriber('IMSI11111')
+        pool = self._store._pools[self._store._sid2bucket(sid1)]
+        with pool.connection() as conn:
+            first_conn = conn
+            self.assertEqual(
+                conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal',
+            )
+            # NORMAL
+            self.assertEqual(
+                conn.execute("PRAGMA synchronous").fetchone()[0], 1,
+            )
+        self._store.get_subscriber_data(sid1)
+        with pool.connection() as conn:
+            self.assertIs(conn, first_conn)
+
+        with self.assertRaises(ValueError):
+            SqliteStore(self._tmpfile.name + '/', synchronous='SOMETIMES')
+
+    def test_concurrent_edits(self):
+        """
+        Test if edits from several threads are serialized
+        """
+        (sid1, _) = self._add_subscriber('IMSI11111')
+
+        def bump_seq():
+            for _ in range(20):
+                with self._store.edit_subscriber(sid1) as subs:
+                    subs.state.lte_auth_next_seq += 1
+
+        threads = [threading.Thread(target=bump_seq) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(
+            self._store.get_subscriber_data(sid1).state.lte_auth_next_seq,
+            80,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
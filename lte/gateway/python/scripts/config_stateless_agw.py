@@ -91,6 +91,8 @@ def clear_redis_state():
         "IMSI*mobilityd*",
         "mobilityd:assigned_ip_blocks",
         "mobilityd:ip_states:*",
+        "mobilityd:free_ip_ranges",
+        "mobilityd:ip_to_sid",
         "NO_VLAN:mobilityd_gw_info",
         "QosManager",
         "s1ap_imsi_map",
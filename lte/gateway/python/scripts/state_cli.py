@@ -88,6 +88,8 @@ class StateCLI(object):
     STATE_DESERIALIZERS = {
         'assigned_ip_blocks': deserialize_ip_block,
         'ip_states': deserialize_ip_desc,
+        'free_ip_ranges': get_json_deserializer(),
+        'ip_to_sid': get_json_deserializer(),
         'sessions': _deserialize_session_json,
         'rule_names': get_json_deserializer(),
         'rule_ids': get_json_deserializer(),
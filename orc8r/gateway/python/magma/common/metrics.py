@@ -10,7 +10,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge
 
 STREAMER_RESPONSES = Counter(
     'streamer_responses',
@@ -18,6 +18,26 @@ STREAMER_RESPONSES = Counter(
     ['result'],
 )
 
+STREAMER_UPDATE_BYTES = Counter(
+    'streamer_update_bytes',
+    'Size of the update batches received by stream',
+    ['stream'],
+)
+
+STREAMER_UPDATE_LAG = Gauge(
+    'streamer_update_lag_seconds',
+    'Time from receiving the last update batch of a stream to the end of '
+    'its processing',
+    ['stream'],
+)
+
+STREAMER_UNCHANGED_RESYNCS = Counter(
+    'streamer_unchanged_resyncs',
+    'The number of resync batches skipped because their digest was '
+    'unchanged, by stream',
+    ['stream'],
+)
+
 SERVICE_ERRORS = Counter(
     'service_errors',
     'The number of errors logged',
@@ -13,6 +13,8 @@ limitations under the License.
 import redis
 from magma.configuration.service_configs import get_service_config_value
 
+NOTIFY_KEYSPACE_EVENTS = "notify-keyspace-events"
+
 
 def get_default_client():
     """
@@ -21,3 +23,20 @@ def get_default_client():
     redis_port = get_service_config_value('redis', 'port', 6379)
     redis_addr = get_service_config_value('redis', 'bind', 'localhost')
     return redis.Redis(host=redis_addr, port=redis_port)
+
+
+def enable_keyspace_events(client: redis.Redis, events: str):
+    """
+    Enable the keyspace notification classes *events*, in addition to the
+    ones already enabled in the Redis configuration
+    """
+    current = client.config_get(NOTIFY_KEYSPACE_EVENTS).get(
+        NOTIFY_KEYSPACE_EVENTS, "",
+    )
+    # 'A' is an alias for all the event classes other than K, E, m and n
+    missing = [
+        flag for flag in events
+        if flag not in current and (flag in 'KEmn' or 'A' not in current)
+    ]
+    if missing:
+        client.config_set(NOTIFY_KEYSPACE_EVENTS, current + "".join(missing))
@@ -10,12 +10,25 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import logging
 from copy import deepcopy
-from typing import Any, Iterator, List, MutableMapping, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import redis
 import redis_collections
 import redis_lock
+from magma.common.redis.client import enable_keyspace_events
 from magma.common.redis.serializers import RedisSerde
 from orc8r.protos.redis_pb2 import RedisState
 from redis.lock import Lock
@@ -27,6 +40,96 @@ from redis.lock import Lock
 
 T = TypeVar('T')
 
+# Number of keys requested per SCAN call and fetched per MGET
+REDIS_SCAN_BATCH_SIZE = 1000
+# Number of attempts of a WATCH/MULTI transaction on keys which keep changing
+MAX_TRANSACTION_RETRIES = 10
+# Keyspace events invalidating the read cache of a RedisHashDict:
+# K (keyspace channel), h (hash commands), g (generic commands, e.g. DEL)
+# and x (expired keys)
+HASH_KEYSPACE_EVENTS = "Khgx"
+# Seconds to wait for Redis to confirm a keyspace subscription
+SUBSCRIBE_TIMEOUT = 5
+
+# Sets the fields of the hash KEYS[1] to the values serialized without a
+# version (ARGV holds field, value pairs), incrementing the version of each
+# field. The version is field 2 of the RedisState protobuf message: it is
+# parsed from the current value and appended to the new value, as the last
+# occurrence of a field wins when a protobuf message is parsed.
+VERSIONED_HSET_SCRIPT = """
+local function read_varint(s, pos)
+    local result, mult = 0, 1
+    while true do
+        local b = string.byte(s, pos)
+        if b == nil then
+            return nil, pos
+        end
+        pos = pos + 1
+        result = result + (b % 128) * mult
+        if b < 128 then
+            return result, pos
+        end
+        mult = mult * 128
+    end
+end
+
+local function get_version(s)
+    local version, pos = 0, 1
+    while pos <= #s do
+        local tag, value
+        tag, pos = read_varint(s, pos)
+        if tag == nil then
+            break
+        end
+        local field, wire_type = math.floor(tag / 8), tag % 8
+        if wire_type == 0 then
+            value, pos = read_varint(s, pos)
+            if value == nil then
+                break
+            end
+            if field == 2 then
+                version = value
+            end
+        elseif wire_type == 2 then
+            value, pos = read_varint(s, pos)
+            if value == nil then
+                break
+            end
+            pos = pos + value
+        elseif wire_type == 1 then
+            pos = pos + 8
+        elseif wire_type == 5 then
+            pos = pos + 4
+        else
+            break
+        end
+    end
+    return version
+end
+
+local function encode_varint(value)
+    local bytes = {}
+    while value >= 128 do
+        bytes[#bytes + 1] = string.char(value % 128 + 128)
+        value = math.floor(value / 128)
+    end
+    bytes[#bytes + 1] = string.char(value)
+    return table.concat(bytes)
+end
+
+for i = 1, #ARGV, 2 do
+    local current = redis.call('HGET', KEYS[1], ARGV[i])
+    local version = 1
+    if current then
+        version = get_version(current) + 1
+    end
+    -- '\\16' is the tag of field 2 with the varint wire type
+    local value = ARGV[i + 1] .. '\\16' .. encode_varint(version)
+    redis.call('HSET', KEYS[1], ARGV[i], value)
+end
+return #ARGV / 2
+"""
+
 
 class RedisList(redis_collections.List):
     """
@@ -114,6 +217,8 @@ class RedisHashDict(redis_collections.DefaultDict):
         - Mutable elements handled correctly
         - Not expected to be thread safe, but could be extended
         - Keys are serialized in plaintext
+        - Values are versioned: the version is incremented by Redis in the
+          same call as the write, so concurrent writers don't race
     """
 
     @staticmethod
@@ -128,7 +233,7 @@ class RedisHashDict(redis_collections.DefaultDict):
 
     def __init__(
             self, client, key, serialize, deserialize,
-            default_factory=None, writeback=False,
+            default_factory=None, writeback=False, read_cache=False,
     ):
         """
         Initialize instance.
@@ -136,8 +241,9 @@ class RedisHashDict(redis_collections.DefaultDict):
         Args:
             client (redis.Redis): Redis client object
             key (str): key where this container's elements are stored in Redis
-            serialize (function (any) -> bytes):
-                function called to serialize a value
+            serialize (function (any, int) -> bytes):
+                function called to serialize a value with its version. The
+                value must be serialized as a RedisState proto.
             deserialize (function (bytes) -> any):
                 function called to deserialize a value
             default_factory: function that provides default value for a
@@ -146,6 +252,12 @@ class RedisHashDict(redis_collections.DefaultDict):
                 local cache of values and the `sync` method can be called to
                 store these values. NOTE: only use this option if syncing
                 between services is not important.
+            read_cache (bool): if read_cache is set to true, dict maintains a
+                local cache of the values read, which is invalidated by the
+                Redis keyspace notifications of the hash, so that values
+                written by other services are read again. NOTE: the cached
+                values are shared between reads, so they must not be
+                updated in-place.
 
         Returns:
             redis_dict (redis_collections.Dict): persistent dict-like interface
@@ -156,22 +268,47 @@ class RedisHashDict(redis_collections.DefaultDict):
         # Value serialization
         self._pickle_value = serialize
         self._unpickle = deserialize
+        self._read_cache = {}
+        self._cache_pubsub = None
         super().__init__(
             default_factory, redis=client, key=key, writeback=writeback,
         )
+        self._versioned_hset = self.redis.register_script(
+            VERSIONED_HSET_SCRIPT,
+        )
+        if read_cache:
+            self._start_read_cache()
+
+    def __getitem__(self, key):
+        """Return the item of dictionary with key *key*, from the read cache
+        if it is enabled
+        """
+        if self._cache_pubsub is None or key in self.cache:
+            return super().__getitem__(key)
+        self._poll_cache_invalidations()
+        try:
+            return self._read_cache[key]
+        except KeyError:
+            pass
+
+        pickled_value = self.redis.hget(self.key, self._pickle_key(key))
+        if pickled_value is None:
+            return self.__missing__(key)
+        value = self._unpickle(pickled_value)
+        if self._cache_pubsub is not None:
+            self._read_cache[key] = value
+        return value
 
     def __setitem__(self, key, value):
         """Set ``d[key]`` to *value*.
 
         Override in order to increment version on each update
         """
-        version = self.get_version(key)
-        pickled_key = self._pickle_key(key)
-        pickled_value = self._pickle_value(value, version + 1)
-        self.redis.hset(self.key, pickled_key, pickled_value)
+        self.update({key: value})
 
-        if self.writeback:
-            self.cache[key] = value
+    def __delitem__(self, key):
+        self._read_cache.pop(key, None)
+        super().__delitem__(key)
 
     def __copy__(self):
         return {key: self[key] for key in self}
@@ -179,6 +316,45 @@ class RedisHashDict(redis_collections.DefaultDict):
     def __deepcopy__(self, memo):
         return {key: deepcopy(self[key], memo) for key in self}
 
+    def update(self, other=None, **kwargs):
+        """Update the dictionary with the key/value pairs from *other* and
+        *kwargs*, incrementing the version of each value.
+
+        The values are written by a script run by Redis, which sets up to
+        REDIS_SCAN_BATCH_SIZE values atomically. Larger updates are split
+        across several script calls sent in one pipeline.
+        """
+        data = dict(other or {}, **kwargs)
+        if not data:
+            return
+        args = []
+        for key, value in data.items():
+            self._read_cache.pop(key, None)
+            args += [self._pickle_key(key), self._pickle_value(value, 0)]
+
+        batch_size = 2 * REDIS_SCAN_BATCH_SIZE
+        if len(args) <= batch_size:
+            self._versioned_hset(keys=[self.key], args=args)
+        else:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for i in range(0, len(args), batch_size):
+                    self._versioned_hset(
+                        keys=[self.key], args=args[i:i + batch_size],
+                        client=pipe,
+                    )
+                pipe.execute()
+
+        if self.writeback:
+            self.cache.update(data)
+
+    def pop(self, key, *args):
+        self._read_cache.pop(key, None)
+        return super().pop(key, *args)
+
+    def clear(self, pipe=None):
+        self._read_cache.clear()
+        super().clear(pipe)
+
     def get_version(self, key):
         """Return the version of the value for key *key*. Returns 0 if
         key is not in the map
@@ -195,6 +371,47 @@ class RedisHashDict(redis_collections.DefaultDict):
         proto_wrapper.ParseFromString(value)
         return proto_wrapper.version
 
+    def _start_read_cache(self):
+        try:
+            enable_keyspace_events(self.redis, HASH_KEYSPACE_EVENTS)
+            db = self.redis.connection_pool.connection_kwargs.get('db', 0)
+            pubsub = self.redis.pubsub()
+            pubsub.subscribe("__keyspace@{}__:{}".format(db, self.key))
+            # Values must not be cached before the subscription is active,
+            # or changes made in between would be missed
+            msg = pubsub.get_message(timeout=SUBSCRIBE_TIMEOUT)
+            if msg is None or msg['type'] != 'subscribe':
+                raise redis.exceptions.TimeoutError(
+                    "Keyspace subscription not confirmed",
+                )
+        except redis.exceptions.RedisError as err:
+            logging.warning(
+                "Keyspace notifications unavailable, not caching values "
+                "of %s: %s", self.key, err,
+            )
+            return
+        self._cache_pubsub = pubsub
+
+    def _poll_cache_invalidations(self):
+        try:
+            while True:
+                msg = self._cache_pubsub.get_message(timeout=0)
+                if msg is None:
+                    return
+                if msg['type'] == 'message':
+                    self._read_cache.clear()
+        except redis.exceptions.RedisError as err:
+            logging.warning(
+                "Lost keyspace notifications, not caching values of %s: %s",
+                self.key, err,
+            )
+            self._read_cache.clear()
+            try:
+                self._cache_pubsub.close()
+            except redis.exceptions.RedisError:
+                pass
+            self._cache_pubsub = None
+
 
 class RedisFlatDict(MutableMapping[str, T]):
     """
@@ -231,27 +448,19 @@ class RedisFlatDict(MutableMapping[str, T]):
 
     def __iter__(self) -> Iterator[str]:
         """Return an iterator over the keys of the dictionary."""
-        type_pattern = self._get_redis_type_pattern()
-
         if self._writethrough:
             for k in self.cache:
                 split_key, _ = k.split(":", 1)
                 yield split_key
         else:
-            for k in self.redis.keys(pattern=type_pattern):
-                try:
-                    deserialized_key = k.decode('utf-8')
-                    split_key = deserialized_key.split(":", 1)
-                except AttributeError:
-                    split_key = k.split(":", 1)
-                # There could be a delete key in between KEYS and GET, so ignore
-                # invalid values for now
-                try:
-                    if self.is_garbage(split_key[0]):
+            for composite_keys in self._scan_composite_keys():
+                # There could be a delete key in between SCAN and MGET, so
+                # missing values are skipped by _fetch_states
+                for composite_key, _, state in \
+                        self._fetch_states(composite_keys):
+                    if state.is_garbage:
                         continue
-                except KeyError:
-                    continue
-                yield split_key[0]
+                    yield self._split_composite_key(composite_key)
 
     def __contains__(self, key: str) -> bool:
         """Return ``True`` if *key* is present and not garbage,
@@ -331,9 +540,107 @@ class RedisFlatDict(MutableMapping[str, T]):
         """
         if self._writethrough:
             self.cache.clear()
-        for key in self.keys():
+        for composite_keys in self._scan_composite_keys():
+            to_delete = [
+                composite_key for composite_key, _, state
+                in self._fetch_states(composite_keys)
+                if not state.is_garbage
+            ]
+            if to_delete:
+                self.redis.delete(*to_delete)
+
+    def items(self) -> List[Tuple[str, T]]:
+        """Return a list of the (key, value) pairs of the dictionary.
+        Values are fetched in batches instead of one GET per key.
+        """
+        if self._writethrough:
+            return [
+                (self._split_composite_key(composite_key), value)
+                for composite_key, value in self.cache.items()
+            ]
+        return [(key, value) for key, value, _ in self.versioned_items()]
+
+    def versioned_items(self) -> Iterator[Tuple[str, T, int]]:
+        """Return an iterator over the (key, value, version) triples of the
+        dictionary, skipping garbage. Value and version come from the same
+        fetch.
+        """
+        for composite_keys in self._scan_composite_keys():
+            for composite_key, serialized_value, state in \
+                    self._fetch_states(composite_keys):
+                if state.is_garbage:
+                    continue
+                yield (
+                    self._split_composite_key(composite_key),
+                    self.serde.deserialize(serialized_value),
+                    state.version,
+                )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, T]:
+        """Get the values of *keys* with pipelined MGETs. Keys that are
+        not in the map or are garbage are left out of the result.
+        """
+        result = {}
+        to_fetch = []
+        for key in keys:
+            if ':' in key:
+                raise ValueError("Key %s cannot contain ':' char" % key)
             composite_key = self._make_composite_key(key)
-            self.redis.delete(composite_key)
+            cached_value = self.cache.get(composite_key) \
+                if self._writethrough else None
+            if cached_value is not None:
+                result[key] = cached_value
+            else:
+                to_fetch.append(composite_key)
+
+        for composite_key, serialized_value, state in \
+                self._fetch_states(to_fetch):
+            if state.is_garbage:
+                continue
+            result[self._split_composite_key(composite_key)] = \
+                self.serde.deserialize(serialized_value)
+        return result
+
+    def get_many_with_version(
+        self, keys: Iterable[str],
+    ) -> Dict[str, Tuple[T, int]]:
+        """Get the values and versions of *keys* with pipelined MGETs.
+        Keys that are not in the map or are garbage are left out of the
+        result.
+        """
+        composite_keys = []
+        for key in keys:
+            if ':' in key:
+                raise ValueError("Key %s cannot contain ':' char" % key)
+            composite_keys.append(self._make_composite_key(key))
+
+        result = {}
+        for composite_key, serialized_value, state in \
+                self._fetch_states(composite_keys):
+            if state.is_garbage:
+                continue
+            result[self._split_composite_key(composite_key)] = (
+                self.serde.deserialize(serialized_value),
+                state.version,
+            )
+        return result
+
+    def get_with_version(self, key: str) -> Tuple[Optional[T], int]:
+        """Return the value and version for key *key:type* from a single
+        fetch. Returns (None, 0) if *key:type* is not in the map or the
+        object is garbage.
+        """
+        if ':' in key:
+            raise ValueError("Key %s cannot contain ':' char" % key)
+        serialized_value = self.redis.get(self._make_composite_key(key))
+        if serialized_value is None:
+            return None, 0
+
+        proto_wrapper = RedisState()
+        proto_wrapper.ParseFromString(serialized_value)
+        if proto_wrapper.is_garbage:
+            return None, 0
+        return self.serde.deserialize(serialized_value), proto_wrapper.version
 
     def get_version(self, key: str) -> int:
         """Return the version of the value for key *key:type*. Returns 0 if
@@ -357,20 +664,95 @@ class RedisFlatDict(MutableMapping[str, T]):
 
         return list(self.__iter__())
 
+    def update_many(
+        self, keys: Iterable[str],
+        update_fn: Callable[[str, Optional[T]], T],
+        max_retries: int = MAX_TRANSACTION_RETRIES,
+    ) -> Dict[str, T]:
+        """Set each of *keys* to ``update_fn(key, value)`` in one
+        transaction, where value is the current value of the key, or None if
+        the key is not in the map or is garbage. Return the new values.
+
+        Instead of locking the keys, they are watched while the values are
+        read, and the update is tried again if one of them was changed
+        meanwhile. Raises WatchError if they kept changing for
+        *max_retries* attempts.
+        """
+        composite_keys = {}
+        for key in keys:
+            if ':' in key:
+                raise ValueError("Key %s cannot contain ':' char" % key)
+            composite_keys[key] = self._make_composite_key(key)
+        if not composite_keys:
+            return {}
+
+        with self.redis.pipeline() as pipe:
+            for _ in range(max_retries):
+                try:
+                    pipe.watch(*composite_keys.values())
+                    serialized_values = pipe.mget(
+                        list(composite_keys.values()),
+                    )
+                    new_values = {}
+                    to_set = []
+                    for (key, composite_key), serialized_value in \
+                            zip(composite_keys.items(), serialized_values):
+                        value, version = None, 0
+                        if serialized_value is not None:
+                            proto_wrapper = RedisState()
+                            proto_wrapper.ParseFromString(serialized_value)
+                            version = proto_wrapper.version
+                            if not proto_wrapper.is_garbage:
+                                value = self.serde.deserialize(
+                                    serialized_value,
+                                )
+                        new_values[key] = update_fn(key, value)
+                        to_set.append((
+                            composite_key,
+                            self.serde.serialize(new_values[key], version + 1),
+                        ))
+                    pipe.multi()
+                    for composite_key, serialized_value in to_set:
+                        pipe.set(composite_key, serialized_value)
+                    pipe.execute()
+                except redis.WatchError:
+                    continue
+                if self._writethrough:
+                    for key, value in new_values.items():
+                        self.cache[composite_keys[key]] = value
+                return new_values
+        raise redis.WatchError(
+            "Keys kept changing during %d attempts to update them"
+            % max_retries,
+        )
+
     def mark_as_garbage(self, key: str) -> Any:
         """Mark ``d[key:type]`` for garbage collection
         Raises a KeyError if *key:type* is not in the map.
         """
         composite_key = self._make_composite_key(key)
-        value = self.redis.get(composite_key)
-        if value is None:
-            raise KeyError(composite_key)
-
-        proto_wrapper = RedisState()
-        proto_wrapper.ParseFromString(value)
-        proto_wrapper.is_garbage = True
-        garbage_serialized = proto_wrapper.SerializeToString()
-        return self.redis.set(composite_key, garbage_serialized)
+        with self.redis.pipeline() as pipe:
+            for _ in range(MAX_TRANSACTION_RETRIES):
+                try:
+                    # Don't overwrite an update made since the value is read
+                    pipe.watch(composite_key)
+                    value = pipe.get(composite_key)
+                    if value is None:
+                        raise KeyError(composite_key)
+
+                    proto_wrapper = RedisState()
+                    proto_wrapper.ParseFromString(value)
+                    proto_wrapper.is_garbage = True
+                    garbage_serialized = proto_wrapper.SerializeToString()
+                    pipe.multi()
+                    pipe.set(composite_key, garbage_serialized)
+                    return pipe.execute()[0]
+                except redis.WatchError:
+                    continue
+        raise redis.WatchError(
+            "Key %s kept changing during %d attempts to mark it as garbage"
+            % (composite_key, MAX_TRANSACTION_RETRIES),
+        )
 
     def is_garbage(self, key: str) -> bool:
         """Return if d[key:type] has been marked for garbage collection.
@@ -385,35 +767,51 @@ class RedisFlatDict(MutableMapping[str, T]):
         proto_wrapper.ParseFromString(value)
         return proto_wrapper.is_garbage
 
-    def garbage_keys(self) -> List[str]:
-        """Return a copy of the dictionary's list of keys that are garbage
+    def garbage_keys(self, keys: Optional[Iterable[str]] = None) -> List[str]:
+        """Return a copy of the dictionary's list of keys that are garbage.
+        If *keys* is set, only those keys are read instead of all the keys
+        of the dictionary.
         Note: for redis *key:type* key is returned
         """
+        if keys is not None:
+            scanned_keys = [[self._make_composite_key(key) for key in keys]]
+        else:
+            scanned_keys = self._scan_composite_keys()
         garbage_keys = []
-        type_pattern = self._get_redis_type_pattern()
-        for k in self.redis.keys(pattern=type_pattern):
-            try:
-                deserialized_key = k.decode('utf-8')
-                split_key = deserialized_key.split(":", 1)
-            except AttributeError:
-                split_key = k.split(":", 1)
-            # There could be a delete key in between KEYS and GET, so ignore
-            # invalid values for now
-            try:
-                if not self.is_garbage(split_key[0]):
-                    continue
-            except KeyError:
-                continue
-            garbage_keys.append(split_key[0])
+        for composite_keys in scanned_keys:
+            for composite_key, _, state in \
+                    self._fetch_states(composite_keys):
+                if state.is_garbage:
+                    garbage_keys.append(
+                        self._split_composite_key(composite_key),
+                    )
         return garbage_keys
 
     def delete_garbage(self, key) -> bool:
         """Remove ``d[key:type]`` from dictionary iff the object is garbage
-        Returns False if *key:type* is not in the map
+        Returns False if the object is not garbage, or was updated while it
+        was being deleted. Raises a KeyError if *key:type* is not in the map.
         """
-        if not self.is_garbage(key):
-            return False
-        count = self.__delitem__(key)
+        if ':' in key:
+            raise ValueError("Key %s cannot contain ':' char" % key)
+        composite_key = self._make_composite_key(key)
+        with self.redis.pipeline() as pipe:
+            try:
+                pipe.watch(composite_key)
+                value = pipe.get(composite_key)
+                if value is None:
+                    raise KeyError(composite_key)
+                proto_wrapper = RedisState()
+                proto_wrapper.ParseFromString(value)
+                if not proto_wrapper.is_garbage:
+                    return False
+                pipe.multi()
+                pipe.delete(composite_key)
+                count = pipe.execute()[0]
+            except redis.WatchError:
+                return False
+        if self._writethrough:
+            self.cache.pop(composite_key, None)
         return count > 0
 
     def lock(self, key: str) -> Lock:
@@ -430,12 +828,62 @@ class RedisFlatDict(MutableMapping[str, T]):
         """
         Syncs write-through cache with redis data on store.
         """
-        type_pattern = self._get_redis_type_pattern()
-        for k in self.redis.keys(pattern=type_pattern):
-            composite_key = k.decode('utf-8')
-            serialized_value = self.redis.get(composite_key)
-            value = self.serde.deserialize(serialized_value)
-            self.cache[composite_key] = value
+        for composite_keys in self._scan_composite_keys():
+            for composite_key, serialized_value, _ in \
+                    self._fetch_states(composite_keys):
+                value = self.serde.deserialize(serialized_value)
+                self.cache[composite_key] = value
+
+    def _scan_composite_keys(self) -> Iterator[List[str]]:
+        """
+        Yield the *key:type* keys of this dictionary in batches, using SCAN
+        so that Redis is not blocked for the whole keyspace as with KEYS.
+        """
+        # SCAN may return a key more than once
+        seen = set()
+        batch = []
+        for k in self.redis.scan_iter(
+            match=self._get_redis_type_pattern(),
+            count=REDIS_SCAN_BATCH_SIZE,
+        ):
+            try:
+                composite_key = k.decode('utf-8')
+            except AttributeError:
+                composite_key = k
+            if composite_key in seen:
+                continue
+            seen.add(composite_key)
+            batch.append(composite_key)
+            if len(batch) >= REDIS_SCAN_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _fetch_states(
+        self, composite_keys: List[str],
+    ) -> Iterator[Tuple[str, bytes, RedisState]]:
+        """
+        Fetch the serialized values of *composite_keys* with MGETs sent in
+        one pipeline. Yield (composite_key, serialized_value, RedisState)
+        for each key that exists.
+        """
+        if not composite_keys:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for i in range(0, len(composite_keys), REDIS_SCAN_BATCH_SIZE):
+            pipe.mget(composite_keys[i:i + REDIS_SCAN_BATCH_SIZE])
+        values = (value for chunk in pipe.execute() for value in chunk)
+        for composite_key, serialized_value in zip(composite_keys, values):
+            if serialized_value is None:
+                continue
+            proto_wrapper = RedisState()
+            proto_wrapper.ParseFromString(serialized_value)
+            yield composite_key, serialized_value, proto_wrapper
+
+    def _split_composite_key(self, composite_key: str) -> str:
+        split_key, _ = composite_key.split(":", 1)
+        return split_key
 
     def _get_redis_type_pattern(self):
         return "*:" + self.redis_type
@@ -31,3 +31,15 @@ class MockUnavailableRedis(object):
     def keys(self, pattern=".*"):
         """ Mock keys with regex pattern matching."""
         raise RedisError("mock redis error")
+
+    def get(self, key, default=None):
+        raise RedisError("mock redis error")
+
+    def items(self):
+        raise RedisError("mock redis error")
+
+    def update_many(self, keys, update_fn, max_retries=None):
+        raise RedisError("mock redis error")
+
+    def __contains__(self, key):
+        raise RedisError("mock redis error")
@@ -10,12 +10,14 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from unittest import TestCase, main
+from unittest import TestCase, main, mock
 
 import fakeredis
 from magma.common.redis.containers import RedisFlatDict, RedisHashDict
 from magma.common.redis.serializers import (
     RedisSerde,
+    get_json_deserializer,
+    get_json_serializer,
     get_proto_deserializer,
     get_proto_serializer,
 )
@@ -29,6 +31,11 @@ class RedisDictTests(TestCase):
 
     def setUp(self):
         client = fakeredis.FakeStrictRedis()
+        client.config_get = mock.MagicMock(
+            return_value={'notify-keyspace-events': ''},
+        )
+        client.config_set = mock.MagicMock()
+        self._client = client
         # Use arbitrary orc8r proto to test with
         self._hash_dict = RedisHashDict(
             client,
@@ -66,6 +73,68 @@ class RedisDictTests(TestCase):
         missing_version = self._hash_dict.get_version("key2")
         self.assertEqual(0, missing_version)
 
+    def test_hash_bulk_update(self):
+        expected = LogVerbosity(verbosity=1)
+        expected2 = LogVerbosity(verbosity=2)
+        self._hash_dict['key1'] = expected
+        # Versions written by other services are incremented as well
+        self._client.hset(
+            "unittest", "key2", get_proto_serializer()(expected, 41),
+        )
+
+        self._hash_dict.update({'key1': expected2, 'key2': expected2})
+        self._hash_dict.update(key3=expected)
+        self.assertEqual(2, self._hash_dict.get_version('key1'))
+        self.assertEqual(42, self._hash_dict.get_version('key2'))
+        self.assertEqual(1, self._hash_dict.get_version('key3'))
+        self.assertEqual(
+            {'key1': expected2, 'key2': expected2, 'key3': expected},
+            dict(self._hash_dict.items()),
+        )
+
+        with mock.patch(
+            "magma.common.redis.containers.REDIS_SCAN_BATCH_SIZE", 2,
+        ):
+            self._hash_dict.update(
+                {"key%d" % i: expected for i in range(1, 6)},
+            )
+        self.assertEqual(3, self._hash_dict.get_version('key1'))
+        self.assertEqual(1, self._hash_dict.get_version('key5'))
+        self.assertEqual(expected, self._hash_dict['key5'])
+
+    def test_hash_read_cache(self):
+        expected = LogVerbosity(verbosity=1)
+        expected2 = LogVerbosity(verbosity=2)
+        cached_dict = RedisHashDict(
+            self._client,
+            "unittest",
+            get_proto_serializer(),
+            get_proto_deserializer(LogVerbosity),
+            read_cache=True,
+        )
+        self._client.config_set.assert_called_once_with(
+            'notify-keyspace-events', 'Khgx',
+        )
+        self._hash_dict['key1'] = expected
+        self.assertEqual(expected, cached_dict['key1'])
+        self.assertEqual({'key1': expected}, cached_dict._read_cache)
+
+        # Writes from other dicts invalidate the cache
+        self._hash_dict['key1'] = expected2
+        self.assertEqual(expected2, cached_dict['key1'])
+        del self._hash_dict['key1']
+        with self.assertRaises(KeyError):
+            cached_dict['key1']
+
+        # Own writes are read back
+        cached_dict['key2'] = expected
+        self.assertEqual(expected, cached_dict['key2'])
+        cached_dict['key2'] = expected2
+        self.assertEqual(expected2, cached_dict['key2'])
+        cached_dict.pop('key2')
+        with self.assertRaises(KeyError):
+            cached_dict['key2']
+
     def test_hash_delete(self):
         expected = LogVerbosity(verbosity=2)
         self._hash_dict['key3'] = expected
@@ -174,6 +243,79 @@ class RedisDictTests(TestCase):
         with self.assertRaises(KeyError):
             self._flat_dict.mark_as_garbage(bad_key)
 
+    def test_flat_bulk_reads(self):
+        expected = LogVerbosity(verbosity=2)
+        expected2 = LogVerbosity(verbosity=3)
+
+        self._flat_dict["k1"] = expected
+        self._flat_dict["k2"] = expected2
+        self._flat_dict["k2"] = expected2
+        self._flat_dict["k3"] = expected
+        self._flat_dict.mark_as_garbage("k3")
+
+        self.assertEqual(
+            {"k1": expected, "k2": expected2},
+            dict(self._flat_dict.items()),
+        )
+        self.assertEqual(
+            [("k1", expected, 1), ("k2", expected2, 2)],
+            sorted(
+                self._flat_dict.versioned_items(),
+                key=lambda item: item[0],
+            ),
+        )
+        self.assertEqual(
+            {"k2": expected2},
+            self._flat_dict.get_many(["k2", "k3", "missing"]),
+        )
+
+        self.assertEqual(
+            {"k1": (expected, 1), "k2": (expected2, 2)},
+            self._flat_dict.get_many_with_version(["k1", "k2", "k3"]),
+        )
+        self.assertEqual(
+            (expected2, 2), self._flat_dict.get_with_version("k2"),
+        )
+        self.assertEqual(
+            (None, 0), self._flat_dict.get_with_version("k3"),
+        )
+        self.assertEqual(
+            (None, 0), self._flat_dict.get_with_version("missing"),
+        )
+
+    def test_flat_bulk_reads_cached(self):
+        serde = RedisSerde(
+            'json_value',
+            get_json_serializer(),
+            get_json_deserializer(),
+        )
+        flat_dict = RedisFlatDict(self._client, serde, writethrough=True)
+        # Falsy values are still cache hits
+        flat_dict["k1"] = {}
+        flat_dict["k2"] = {"a": 1}
+
+        with mock.patch.object(flat_dict, '_fetch_states') as fetch_states:
+            fetch_states.return_value = []
+            self.assertEqual(
+                {"k1": {}, "k2": {"a": 1}},
+                flat_dict.get_many(["k1", "k2"]),
+            )
+            fetch_states.assert_called_once_with([])
+
+    def test_flat_scan_batches(self):
+        expected = LogVerbosity(verbosity=2)
+        keys = {"key%d" % i for i in range(25)}
+        for key in keys:
+            self._flat_dict[key] = expected
+
+        with mock.patch(
+            "magma.common.redis.containers.REDIS_SCAN_BATCH_SIZE", 10,
+        ):
+            self.assertEqual(keys, set(self._flat_dict.keys()))
+            self.assertEqual(keys, set(self._flat_dict.get_many(keys)))
+            self._flat_dict.clear()
+        self.assertEqual(0, len(self._flat_dict.keys()))
+
 
 if __name__ == "__main__":
     main()
@@ -12,19 +12,32 @@ limitations under the License.
 """
 
 import abc
+import hashlib
 import logging
+import random
+import struct
 import threading
 import time
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 import grpc
 import snowflake
 from google.protobuf import any_pb2
 from magma.common import serialization_utils
-from magma.common.metrics import STREAMER_RESPONSES
+from magma.common.metrics import (
+    STREAMER_RESPONSES,
+    STREAMER_UNCHANGED_RESYNCS,
+    STREAMER_UPDATE_BYTES,
+    STREAMER_UPDATE_LAG,
+)
 from magma.common.service_registry import ServiceRegistry
 from magma.configuration.service_configs import get_service_config_value
-from orc8r.protos.streamer_pb2 import DataUpdate, StreamRequest
+from orc8r.protos.mconfig_pb2 import GatewayConfigsDigest
+from orc8r.protos.streamer_pb2 import (
+    DataUpdate,
+    DataUpdateBatch,
+    StreamRequest,
+)
 from orc8r.protos.streamer_pb2_grpc import StreamerStub
 
 
@@ -33,12 +46,14 @@ class StreamerClient(threading.Thread):
     StreamerClient provides an interface to communicate with the Streamer
     service in the cloud to get updates for a stream.
 
-    The StreamerClient spawns a thread which listens to updates and
-    schedules a callback in the asyncio event loop when an update
-    is received from the cloud.
+    The StreamerClient spawns a thread per stream which listens to updates
+    and schedules a callback in the asyncio event loop when an update
+    is received from the cloud, so a slow stream doesn't hold up the
+    others.
 
     If the connection to the cloud gets terminated, the StreamerClient
-    would retry (TBD: with exponential backoff) to connect back to the cloud.
+    retries to connect back to the cloud, with an exponential backoff and
+    jitter while the stream keeps failing.
     """
 
     class Callback:
@@ -74,6 +89,45 @@ class StreamerClient(threading.Thread):
             """
             raise NotImplementedError()
 
+    class DigestCallback(Callback):
+        """
+        Callback for streams whose resync batches are full snapshots.
+
+        The digest of the last processed snapshot is sent up with every
+        request, so that a stream provider can leave out a snapshot that
+        didn't change. A snapshot with the same digest as the last processed
+        one is not processed again, unless max_skipped_resyncs snapshots in
+        a row were skipped, so that local state which drifted from the
+        snapshot is still fixed periodically. process_unchanged_resync is
+        called for the skipped snapshots instead.
+        """
+
+        def __init__(self):
+            # stream name -> digest of the last processed snapshot
+            self._digests = {}  # type: Dict[str, str]
+
+        def get_request_args(self, stream_name: str) -> Any:
+            digest = self.get_digest(stream_name)
+            if digest is None:
+                return None
+            return GatewayConfigsDigest(md5_hex_digest=digest)
+
+        def get_digest(self, stream_name: str) -> Optional[str]:
+            return self._digests.get(stream_name)
+
+        def set_digest(self, stream_name: str, digest: str):
+            self._digests[stream_name] = digest
+
+        def process_unchanged_resync(self, stream_name: str):
+            """
+            Called in the event loop instead of process_update for a resync
+            that was skipped because its snapshot didn't change.
+
+            Args:
+                stream_name: Name of the stream
+            """
+            pass
+
     def __init__(self, stream_callbacks, loop):
         """
         Args:
@@ -95,42 +149,91 @@ class StreamerClient(threading.Thread):
         )
         self._reconnect_pause = max(5, self._reconnect_pause)
         logging.info("Streamer reconnect pause: %d", self._reconnect_pause)
+        self._max_reconnect_pause = max(
+            self._reconnect_pause,
+            get_service_config_value('streamer', 'max_reconnect_sec', 600),
+        )
         self._stream_timeout = get_service_config_value(
             'streamer', 'stream_timeout', 150,
         )
         logging.info("Streamer timeout: %d", self._stream_timeout)
+        self._max_skipped_resyncs = get_service_config_value(
+            'streamer', 'max_skipped_resyncs', 10,
+        )
+        # stream name -> unchanged resyncs skipped in a row
+        self._skipped_resyncs = {}  # type: Dict[str, int]
 
     def run(self):
+        threads = [
+            threading.Thread(
+                target=self._run_stream,
+                args=(stream_name, callback),
+                name='streamer-%s' % stream_name,
+                daemon=True,
+            )
+            for stream_name, callback in self._stream_callbacks.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_stream(self, stream_name, callback):
+        failures = 0
         while True:
-            try:
-                channel = ServiceRegistry.get_rpc_channel(
-                    'streamer', ServiceRegistry.CLOUD,
-                )
-                client = StreamerStub(channel)
-                self.process_all_streams(client)
-            except Exception as exp:  # pylint: disable=broad-except
-                logging.error("Error with streamer: %s", exp)
-
-            # If the connection is terminated, wait for a period of time
-            # before connecting back to the cloud.
-            # TODO: make this more intelligent (exponential backoffs, etc.)
-            time.sleep(self._reconnect_pause)
-
-    def process_all_streams(self, client):
-        for stream_name, callback in self._stream_callbacks.items():
-            try:
-                self.process_stream_updates(client, stream_name, callback)
-
-                STREAMER_RESPONSES.labels(result='Success').inc()
-            except grpc.RpcError as err:
-                logging.error(
-                    "Error! Streaming from the cloud failed! [%s] %s",
-                    err.code(), err.details(),
-                )
-                STREAMER_RESPONSES.labels(result='RpcError').inc()
-            except ValueError as err:
-                logging.error("Error! Streaming from cloud failed! %s", err)
-                STREAMER_RESPONSES.labels(result='ValueError').inc()
+            if self._process_stream(stream_name, callback):
+                failures = 0
+            else:
+                failures += 1
+            # Wait for a period of time before connecting back to the cloud
+            time.sleep(self._get_reconnect_pause(failures))
+
+    def _get_reconnect_pause(self, failures: int) -> float:
+        """
+        Returns the pause before the next request of a stream which failed
+        failures times in a row. The pause doubles with every failure, up
+        to max_reconnect_sec, and is picked at random from the reconnect
+        pause to that value so gateways don't retry in lockstep.
+        """
+        if failures <= 1:
+            return self._reconnect_pause
+        backoff = min(
+            self._max_reconnect_pause,
+            self._reconnect_pause * 2 ** min(failures - 1, 16),
+        )
+        return random.uniform(self._reconnect_pause, backoff)
+
+    def _process_stream(self, stream_name, callback) -> bool:
+        """
+        Request the updates of a stream once. Returns False if the request
+        failed.
+        """
+        try:
+            channel = ServiceRegistry.get_rpc_channel(
+                'streamer', ServiceRegistry.CLOUD,
+            )
+            client = StreamerStub(channel)
+            self.process_stream_updates(client, stream_name, callback)
+
+            STREAMER_RESPONSES.labels(result='Success').inc()
+        except grpc.RpcError as err:
+            logging.error(
+                "Error! Streaming %s from the cloud failed! [%s] %s",
+                stream_name, err.code(), err.details(),
+            )
+            STREAMER_RESPONSES.labels(result='RpcError').inc()
+            # The stream was open until it timed out
+            return err.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        except ValueError as err:
+            logging.error(
+                "Error! Streaming %s from cloud failed! %s", stream_name, err,
+            )
+            STREAMER_RESPONSES.labels(result='ValueError').inc()
+            return False
+        except Exception as exp:  # pylint: disable=broad-except
+            logging.error("Error with streamer %s: %s", stream_name, exp)
+            return False
+        return True
 
     def process_stream_updates(self, client, stream_name, callback):
         extra_args = self._get_extra_args_any(callback, stream_name)
@@ -142,13 +245,56 @@ class StreamerClient(threading.Thread):
         for update_batch in client.GetUpdates(
                 request, timeout=self._stream_timeout,
         ):
+            received = time.monotonic()
+            STREAMER_UPDATE_BYTES.labels(stream=stream_name).inc(
+                update_batch.ByteSize(),
+            )
+            digest = None
+            if update_batch.resync and \
+                    isinstance(callback, StreamerClient.DigestCallback):
+                digest = get_update_batch_digest(update_batch)
+                if self._skip_unchanged_resync(stream_name, callback, digest):
+                    STREAMER_UNCHANGED_RESYNCS.labels(stream=stream_name).inc()
+                    self._loop.call_soon_threadsafe(
+                        callback.process_unchanged_resync, stream_name,
+                    )
+                    continue
             self._loop.call_soon_threadsafe(
-                callback.process_update,
+                self._process_update,
                 stream_name,
-                update_batch.updates,
-                update_batch.resync,
+                callback,
+                update_batch,
+                received,
+                digest,
             )
 
+    def _skip_unchanged_resync(self, stream_name, callback, digest) -> bool:
+        """
+        Returns True if a resync should be skipped because its snapshot is
+        the last processed one. At most max_skipped_resyncs resyncs in a row
+        are skipped.
+        """
+        skipped = self._skipped_resyncs.get(stream_name, 0)
+        if digest != callback.get_digest(stream_name) or \
+                skipped >= self._max_skipped_resyncs:
+            self._skipped_resyncs[stream_name] = 0
+            return False
+        self._skipped_resyncs[stream_name] = skipped + 1
+        return True
+
+    @staticmethod
+    def _process_update(stream_name, callback, update_batch, received, digest):
+        callback.process_update(
+            stream_name,
+            update_batch.updates,
+            update_batch.resync,
+        )
+        if digest is not None:
+            callback.set_digest(stream_name, digest)
+        STREAMER_UPDATE_LAG.labels(stream=stream_name).set(
+            time.monotonic() - received,
+        )
+
     @staticmethod
     def _get_extra_args_any(callback, stream_name):
         extra_args = callback.get_request_args(stream_name)
@@ -160,6 +306,19 @@ class StreamerClient(threading.Thread):
             return extra_any
 
 
+def get_update_batch_digest(update_batch: DataUpdateBatch) -> str:
+    """
+    Returns the MD5 hex digest of the keys and values of an update batch
+    """
+    digest = hashlib.md5()
+    for update in update_batch.updates:
+        key = update.key.encode()
+        digest.update(struct.pack('!II', len(key), len(update.value)))
+        digest.update(key)
+        digest.update(update.value)
+    return digest.hexdigest()
+
+
 def get_stream_serialize_filename(stream_name):
     return '/var/opt/magma/streams/{}'.format(stream_name)
 
@@ -0,0 +1,159 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest import TestCase, main, mock
+
+import grpc
+from magma.common.streamer import StreamerClient, get_update_batch_digest
+from orc8r.protos.mconfig_pb2 import GatewayConfigsDigest
+from orc8r.protos.streamer_pb2 import DataUpdate, DataUpdateBatch
+
+
+class _Callback(StreamerClient.DigestCallback):
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+        self.unchanged_resyncs = 0
+
+    def process_update(self, stream_name, updates, resync):
+        self.updates.append((stream_name, [u.key for u in updates], resync))
+
+    def process_unchanged_resync(self, stream_name):
+        self.unchanged_resyncs += 1
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return ''
+
+
+def _batch(keys, resync=True):
+    return DataUpdateBatch(
+        updates=[DataUpdate(key=key, value=key.encode()) for key in keys],
+        resync=resync,
+    )
+
+
+@mock.patch('snowflake.snowflake', mock.Mock(return_value='gw'))
+class StreamerClientTests(TestCase):
+    """
+    Tests for the StreamerClient
+    """
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        self._callback = _Callback()
+        self._client = StreamerClient({'rules': self._callback}, self._loop)
+        self._stub = mock.Mock()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _stream(self, *batches):
+        self._stub.GetUpdates.return_value = iter(batches)
+        self._client.process_stream_updates(
+            self._stub, 'rules', self._callback,
+        )
+        self._loop.run_until_complete(asyncio.sleep(0))
+
+    def test_unchanged_resync_skipped(self):
+        """A resync with the digest of the last one isn't processed, and the
+        digest is sent with the next requests"""
+        self._stream(_batch(['a', 'b']))
+        request = self._stub.GetUpdates.call_args[0][0]
+        self.assertFalse(request.HasField('extra_args'))
+
+        self._stream(
+            _batch(['a', 'b']), _batch(['c'], resync=False),
+            _batch(['a', 'b', 'c']),
+        )
+        request = self._stub.GetUpdates.call_args[0][0]
+        digest = GatewayConfigsDigest()
+        request.extra_args.Unpack(digest)
+        self.assertEqual(
+            digest.md5_hex_digest, get_update_batch_digest(_batch(['a', 'b'])),
+        )
+        self.assertEqual(
+            self._callback.updates, [
+                ('rules', ['a', 'b'], True),
+                ('rules', ['c'], False),
+                ('rules', ['a', 'b', 'c'], True),
+            ],
+        )
+
+    def test_unchanged_resync_applied_periodically(self):
+        """At most max_skipped_resyncs unchanged resyncs in a row are
+        skipped, and the callback is told about the skipped ones"""
+        self._client._max_skipped_resyncs = 2
+        for _ in range(7):
+            self._stream(_batch(['a']))
+        self.assertEqual(self._callback.unchanged_resyncs, 4)
+        self.assertEqual(
+            self._callback.updates, [('rules', ['a'], True)] * 3,
+        )
+
+        # A changed snapshot resets the count
+        self._stream(_batch(['b']))
+        self._stream(_batch(['a']))
+        self.assertEqual(self._callback.unchanged_resyncs, 4)
+        self.assertEqual(len(self._callback.updates), 5)
+
+    def test_batch_digest(self):
+        """The digest depends on the boundaries of keys and values"""
+        self.assertNotEqual(
+            get_update_batch_digest(
+                DataUpdateBatch(updates=[DataUpdate(key='ab', value=b'c')]),
+            ),
+            get_update_batch_digest(
+                DataUpdateBatch(updates=[DataUpdate(key='a', value=b'bc')]),
+            ),
+        )
+
+    @mock.patch('magma.common.streamer.ServiceRegistry')
+    def test_process_stream_result(self, _registry_mock):
+        """Stream timeouts are not failures, other errors are"""
+        with mock.patch('magma.common.streamer.StreamerStub') as stub_mock:
+            stub_mock.return_value.GetUpdates.side_effect = _RpcError(
+                grpc.StatusCode.UNAVAILABLE,
+            )
+            self.assertFalse(
+                self._client._process_stream('rules', self._callback),
+            )
+            stub_mock.return_value.GetUpdates.side_effect = _RpcError(
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+            )
+            self.assertTrue(
+                self._client._process_stream('rules', self._callback),
+            )
+
+    def test_reconnect_backoff(self):
+        """The pause grows with failures, up to the max"""
+        self._client._reconnect_pause = 10
+        self._client._max_reconnect_pause = 100
+        self.assertEqual(self._client._get_reconnect_pause(0), 10)
+        self.assertEqual(self._client._get_reconnect_pause(1), 10)
+        for failures in range(2, 50):
+            pause = self._client._get_reconnect_pause(failures)
+            self.assertGreaterEqual(pause, 10)
+            self.assertLessEqual(pause, min(100, 10 * 2 ** (failures - 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ limitations under the License.
 
 
 import logging
+from collections import defaultdict
 from typing import Dict, List
 
 import grpc
@@ -31,7 +32,7 @@ from orc8r.protos.directoryd_pb2_grpc import (
     GatewayDirectoryServiceServicer,
     add_GatewayDirectoryServiceServicer_to_server,
 )
-from redis.exceptions import LockError, RedisError
+from redis.exceptions import RedisError
 
 DIRECTORYD_REDIS_TYPE = "directory_record"
 LOCATION_MAX_LEN = 5
@@ -63,6 +64,9 @@ class GatewayDirectoryServiceRpcServicer(GatewayDirectoryServiceServicer):
         )
         self._redis_dict = RedisFlatDict(get_default_client(), serde)
         self._print_grpc_payload = print_grpc_payload
+        # The hwid of the gateway doesn't change while directoryd runs, so
+        # it is looked up once
+        self._hwid = None
 
         if self._print_grpc_payload:
             logging.info("Printing GRPC messages")
@@ -87,28 +91,60 @@ class GatewayDirectoryServiceRpcServicer(GatewayDirectoryServiceServicer):
                 "UpdateRecordRequest",
             )
             return
+        self._update_records([request], context)
 
+    @return_void
+    def UpdateRecords(self, request, context):
+        """ Update the directory records of several objects in one
+        transaction
+
+        Args:
+            request (UpdateRecordsRequest): update records request
+        """
+        logging.debug("UpdateRecords request received")
+        self._print_grpc(request)
+        if any(len(record.id) == 0 for record in request.records):
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                "ID argument cannot be empty in "
+                "UpdateRecordsRequest",
+            )
+            return
+        self._update_records(request.records, context)
+
+    def _get_hwid(self) -> str:
+        if self._hwid is None:
+            self._hwid = get_gateway_hwid()
+        return self._hwid
+
+    def _update_records(self, requests, context):
+        fields_by_id = defaultdict(list)
+        for request in requests:
+            fields_by_id[request.id].append(request.fields)
+
+        hwid = self._get_hwid()
+
+        def update_record(record_id, record):
+            if record is None:
+                record = DirectoryRecord(
+                    location_history=[hwid],
+                    identifiers={},
+                )
+            if record.location_history[0] != hwid:
+                record.location_history = [hwid] + record.location_history
+            for fields in fields_by_id[record_id]:
+                record.identifiers.update(fields)
+
+            # Truncate location history to the five most recent hwid's
+            record.location_history = \
+                record.location_history[:LOCATION_MAX_LEN]
+            return record
+
+        # The records are updated optimistically rather than locked: the
+        # update is retried if a record changes while it is updated
         try:
-            # Lock Redis for requested key until update is complete
-            with self._redis_dict.lock(request.id):
-                hwid = get_gateway_hwid()
-                record = self._redis_dict.get(request.id) or \
-                    DirectoryRecord(
-                        location_history=[hwid],
-                        identifiers={},
-                    )
-
-                if record.location_history[0] != hwid:
-                    record.location_history = [hwid] + record.location_history
-
-                for field_key in request.fields:
-                    record.identifiers[field_key] = request.fields[field_key]
-
-                # Truncate location history to the five most recent hwid's
-                record.location_history = \
-                    record.location_history[:LOCATION_MAX_LEN]
-                self._redis_dict[request.id] = record
-        except (RedisError, LockError) as e:
+            self._redis_dict.update_many(fields_by_id.keys(), update_record)
+        except RedisError as e:
             logging.error(e)
             context.set_code(grpc.StatusCode.UNAVAILABLE)
             context.set_details("Could not connect to redis: %s" % e)
@@ -130,18 +166,17 @@ class GatewayDirectoryServiceRpcServicer(GatewayDirectoryServiceServicer):
             )
             return
 
-        # Lock Redis for requested key until delete is complete
         try:
-            with self._redis_dict.lock(request.id):
-                if request.id not in self._redis_dict:
-                    context.set_code(grpc.StatusCode.NOT_FOUND)
-                    context.set_details(
-                        "Record for ID %s was not found." %
-                        request.id,
-                    )
-                    return
-                self._redis_dict.mark_as_garbage(request.id)
-        except (RedisError, LockError) as e:
+            if request.id not in self._redis_dict:
+                raise KeyError(request.id)
+            self._redis_dict.mark_as_garbage(request.id)
+        except KeyError:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(
+                "Record for ID %s was not found." %
+                request.id,
+            )
+        except RedisError as e:
             logging.error(e)
             context.set_code(grpc.StatusCode.UNAVAILABLE)
             context.set_details("Could not connect to redis: %s" % e)
@@ -171,24 +206,24 @@ class GatewayDirectoryServiceRpcServicer(GatewayDirectoryServiceServicer):
             self._print_grpc(response)
             return response
 
-        # Lock Redis for requested key until get is complete
+        # Records are written whole with a single SET, so they are read
+        # without a lock
         try:
-            with self._redis_dict.lock(request.id):
-                if request.id not in self._redis_dict:
-                    context.set_code(grpc.StatusCode.NOT_FOUND)
-                    context.set_details(
-                        "Record for ID %s was not found." %
-                        request.id,
-                    )
-                    return DirectoryField()
-                record = self._redis_dict[request.id]
-        except (RedisError, LockError) as e:
+            record = self._redis_dict.get(request.id)
+        except RedisError as e:
             logging.error(e)
             context.set_code(grpc.StatusCode.UNAVAILABLE)
             context.set_details("Could not connect to redis: %s" % e)
             response = DirectoryField()
             self._print_grpc(response)
             return response
+        if record is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(
+                "Record for ID %s was not found." %
+                request.id,
+            )
+            return DirectoryField()
 
         if request.field_key not in record.identifiers:
             context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -214,30 +249,18 @@ class GatewayDirectoryServiceRpcServicer(GatewayDirectoryServiceServicer):
         logging.debug("GetAllDirectoryRecords request received")
         self._print_grpc(request)
         response = AllDirectoryRecords()
+        # The records are fetched in batches of pipelined MGETs, without
+        # locks
         try:
-            redis_keys = self._redis_dict.keys()
+            stored_records = self._redis_dict.items()
         except RedisError as e:
             logging.error(e)
             context.set_code(grpc.StatusCode.UNAVAILABLE)
             context.set_details("Could not connect to redis: %s" % e)
-            self._print_grpc(request)
+            self._print_grpc(response)
             return response
 
-        for key in redis_keys:
-            try:
-                with self._redis_dict.lock(key):
-                    # Lookup may produce an exception if the key has been
-                    # deleted between the call to __iter__ and lock
-                    stored_record = self._redis_dict[key]
-            except (RedisError, LockError) as e:
-                logging.error(e)
-                context.set_code(grpc.StatusCode.UNAVAILABLE)
-                context.set_details("Could not connect to redis: %s" % e)
-                self._print_grpc(response)
-                return response
-            except KeyError:
-                continue
-
+        for key, stored_record in stored_records:
             directory_record = response.records.add()
             directory_record.id = key
             directory_record.location_history[:] = \
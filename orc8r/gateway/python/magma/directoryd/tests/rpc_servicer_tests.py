@@ -22,6 +22,7 @@ from orc8r.protos.directoryd_pb2 import (
     DeleteRecordRequest,
     GetDirectoryFieldRequest,
     UpdateRecordRequest,
+    UpdateRecordsRequest,
 )
 from orc8r.protos.directoryd_pb2_grpc import GatewayDirectoryServiceStub
 
@@ -86,6 +87,43 @@ class DirectorydRpcServiceTests(TestCase):
             "192.168.172.12",
         )
 
+    @mock.patch('snowflake.snowflake', get_mock_snowflake)
+    def test_update_records(self):
+        self._servicer._redis_dict.clear()
+
+        req = UpdateRecordsRequest()
+        record = req.records.add(id="IMSI555")
+        record.fields["mac_addr"] = "aa:aa:bb:bb:cc:cc"
+        record = req.records.add(id="IMSI556")
+        record.fields["ipv4_addr"] = "192.168.172.13"
+        record = req.records.add(id="IMSI555")
+        record.fields["ipv4_addr"] = "192.168.172.12"
+        self._stub.UpdateRecords(req)
+
+        actual_record = self._servicer._redis_dict["IMSI555"]
+        self.assertEqual(actual_record.location_history, ['aaa-bbb'])
+        self.assertEqual(
+            dict(actual_record.identifiers), {
+                "mac_addr": "aa:aa:bb:bb:cc:cc",
+                "ipv4_addr": "192.168.172.12",
+            },
+        )
+        actual_record2 = self._servicer._redis_dict["IMSI556"]
+        self.assertEqual(
+            dict(actual_record2.identifiers),
+            {"ipv4_addr": "192.168.172.13"},
+        )
+
+        req = UpdateRecordsRequest()
+        req.records.add(id="IMSI557")
+        req.records.add(id="")
+        with self.assertRaises(grpc.RpcError) as err:
+            self._stub.UpdateRecords(req)
+        self.assertEqual(
+            err.exception.code(), grpc.StatusCode.INVALID_ARGUMENT,
+        )
+        self.assertFalse("IMSI557" in self._servicer._redis_dict)
+
     @mock.patch('snowflake.snowflake', get_mock_snowflake)
     def test_update_record_bad_location(self):
         self._servicer._redis_dict.clear()
@@ -19,7 +19,7 @@ from typing import Any, Dict
 import pkg_resources
 import yaml
 from bravado_core.spec import Spec
-from bravado_core.validate import validate_object as bravado_validate
+from bravado_core.swagger20_validator import get_validator_type
 
 EVENT_REGISTRY = 'event_registry'
 SWAGGER_SPEC = 'swagger_spec'
@@ -37,6 +37,7 @@ class EventValidator(object):
     def __init__(self, config: Dict[str, Any]):
         self.event_registry = config[EVENT_REGISTRY]
         self.specs_by_filename = self._load_specs_from_registry()
+        self._validators = self._build_validators()
 
     def validate_event(self, raw_event: str, event_type: str) -> None:
         """
@@ -61,12 +62,23 @@ class EventValidator(object):
                 'Event type {} not registered, '
                 'please add it to the EventD config'.format(event_type),
             )
-        filename = self.event_registry[event_type][FILENAME]
-        bravado_validate(
-            self.specs_by_filename[filename][BRAVADO_SPEC],
-            self.specs_by_filename[filename][SWAGGER_SPEC][event_type],
-            event,
-        )
+        self._validators[event_type].validate(event)
+
+    def _build_validators(self) -> Dict[str, Any]:
+        """
+        Creates the schema validator of each registered event type, like
+        bravado_core.validate.validate_object does on every call.
+        """
+        validators = {}
+        for event_type, info in self.event_registry.items():
+            specs = self.specs_by_filename[info[FILENAME]]
+            bravado_spec = specs[BRAVADO_SPEC]
+            validators[event_type] = get_validator_type(bravado_spec)(
+                specs[SWAGGER_SPEC][event_type],
+                format_checker=bravado_spec.format_checker,
+                resolver=bravado_spec.resolver,
+            )
+        return validators
 
     def _load_specs_from_registry(self) -> Dict[str, Any]:
         """
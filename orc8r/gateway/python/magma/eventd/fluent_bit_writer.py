@@ -0,0 +1,195 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import List, Optional, Tuple
+
+from magma.eventd.metrics import (
+    EVENTS_DROPPED,
+    EVENTS_QUEUED,
+    EVENTS_REJECTED,
+    EVENTS_SENT,
+)
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 100
+# Delay in seconds before connecting again to FluentBit after a failure
+RECONNECT_INTERVAL = 5
+
+# A JSON-encoded event, and whether it must be retried on failure
+Record = Tuple[bytes, bool]
+
+
+class FluentBitWriter(object):
+    """
+    Sends events to the FluentBit TCP input over a long-lived connection.
+
+    Events are queued by the gRPC workers and written in batches by a task
+    of the event loop. The queue is bounded: when it is full, events with
+    retry on failure are rejected so the sender can retry them later, and
+    other events are dropped. Likewise, when FluentBit can't be reached,
+    events with retry on failure stay queued until it is back, and other
+    events are dropped.
+    """
+
+    def __init__(
+        self, port: int, timeout: float,
+        loop: asyncio.AbstractEventLoop,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._port = port
+        self._timeout = timeout
+        self._loop = loop
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._queue = deque()  # type: deque
+        self._lock = threading.Lock()
+        self._wakeup = None  # type: Optional[asyncio.Event]
+        self._reader = None  # type: Optional[asyncio.StreamReader]
+        self._writer = None  # type: Optional[asyncio.StreamWriter]
+        self._connect_failed = False
+        self._task = None  # type: Optional[asyncio.Future]
+
+    def start(self) -> None:
+        """
+        Start the task sending the queued events
+        """
+        self._task = asyncio.ensure_future(self._run(), loop=self._loop)
+
+    async def stop(self) -> None:
+        """
+        Stop the task sending the queued events and close the connection
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def put(self, records: List[Record]) -> bool:
+        """
+        Queue events to send. Thread-safe.
+
+        Returns False if the events with retry on failure don't fit in the
+        queue, in which case none of the events are queued.
+        """
+        num_retried = sum(1 for _, retry in records if retry)
+        with self._lock:
+            room = self._max_queue_size - len(self._queue)
+            if num_retried > room:
+                EVENTS_REJECTED.inc(num_retried)
+                return False
+            room -= num_retried
+            for record in records:
+                if record[1]:
+                    self._queue.append(record)
+                elif room > 0:
+                    self._queue.append(record)
+                    room -= 1
+                else:
+                    EVENTS_DROPPED.labels(reason='queue_full').inc()
+            EVENTS_QUEUED.set(len(self._queue))
+        self._loop.call_soon_threadsafe(self._notify)
+        return True
+
+    def _notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                if not self._queue:
+                    await self._wakeup.wait()
+                    self._wakeup.clear()
+                    continue
+                if not await self._ensure_connected():
+                    self._drop_unretried('fluent_bit_unavailable')
+                    await asyncio.sleep(RECONNECT_INTERVAL)
+                    continue
+                await self._send_batch()
+        finally:
+            self._close()
+
+    async def _ensure_connected(self) -> bool:
+        # FluentBit doesn't send anything, so EOF means it closed the
+        # connection
+        if self._writer is not None and \
+                (self._writer.is_closing() or self._reader.at_eof()):
+            self._close()
+        if self._writer is not None:
+            return True
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection('localhost', self._port),
+                self._timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            if not self._connect_failed:
+                logging.error('Connection to FluentBit failed: %s', e)
+                logging.info(
+                    'FluentBit (td-agent-bit) may not be enabled '
+                    'or configured correctly',
+                )
+            self._connect_failed = True
+            return False
+        if self._connect_failed:
+            logging.info('Connected to FluentBit')
+        self._connect_failed = False
+        return True
+
+    async def _send_batch(self):
+        with self._lock:
+            batch = [
+                self._queue.popleft() for _ in
+                range(min(self._max_batch_size, len(self._queue)))
+            ]
+        try:
+            self._writer.write(b''.join(record for record, _ in batch))
+            await asyncio.wait_for(self._writer.drain(), self._timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            logging.error('Sending events to FluentBit failed: %s', e)
+            self._close()
+            retried = [record for record in batch if record[1]]
+            EVENTS_DROPPED.labels(reason='fluent_bit_error').inc(
+                len(batch) - len(retried),
+            )
+            with self._lock:
+                self._queue.extendleft(reversed(retried))
+        else:
+            logging.debug('Sent %d events to FluentBit', len(batch))
+            EVENTS_SENT.inc(len(batch))
+        EVENTS_QUEUED.set(len(self._queue))
+
+    def _drop_unretried(self, reason: str):
+        with self._lock:
+            retried = deque(record for record in self._queue if record[1])
+            EVENTS_DROPPED.labels(reason=reason).inc(
+                len(self._queue) - len(retried),
+            )
+            self._queue = retried
+            EVENTS_QUEUED.set(len(self._queue))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
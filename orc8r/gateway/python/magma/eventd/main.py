@@ -14,6 +14,11 @@ limitations under the License.
 from magma.common.sentry import sentry_init
 from magma.common.service import MagmaService
 from magma.eventd.event_validator import EventValidator
+from magma.eventd.fluent_bit_writer import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_QUEUE_SIZE,
+    FluentBitWriter,
+)
 from magma.eventd.rpc_servicer import EventDRpcServicer
 from orc8r.protos.mconfig.mconfigs_pb2 import EventD
 
@@ -26,7 +31,22 @@ def main():
     sentry_init(service_name=service.name)
 
     event_validator = EventValidator(service.config)
-    eventd_servicer = EventDRpcServicer(service.config, event_validator)
+    # Events are sent to FluentBit in batches over a long-lived connection
+    writer = FluentBitWriter(
+        service.config['fluent_bit_port'],
+        service.config['tcp_timeout'],
+        service.loop,
+        max_queue_size=service.config.get(
+            'max_queue_size', DEFAULT_MAX_QUEUE_SIZE,
+        ),
+        max_batch_size=service.config.get(
+            'max_batch_size', DEFAULT_MAX_BATCH_SIZE,
+        ),
+    )
+    writer.start()
+    eventd_servicer = EventDRpcServicer(
+        service.config, event_validator, writer,
+    )
     eventd_servicer.add_to_server(service.rpc_server)
 
     # Run the service loop
@@ -0,0 +1,35 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from prometheus_client import Counter, Gauge
+
+EVENTS_QUEUED = Gauge(
+    'eventd_events_queued',
+    'The number of events waiting to be sent to FluentBit',
+)
+
+EVENTS_SENT = Counter(
+    'eventd_events_sent',
+    'The number of events sent to FluentBit',
+)
+
+EVENTS_DROPPED = Counter(
+    'eventd_events_dropped',
+    'The number of events dropped without retry on failure',
+    ['reason'],
+)
+
+EVENTS_REJECTED = Counter(
+    'eventd_events_rejected',
+    'The number of events with retry on failure rejected because the '
+    'queue was full',
+)
@@ -13,14 +13,13 @@ limitations under the License.
 
 import json
 import logging
-import socket
-from contextlib import closing
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import grpc
 import jsonschema
 from magma.common.rpc_utils import return_void
 from magma.eventd.event_validator import EventValidator
+from magma.eventd.fluent_bit_writer import FluentBitWriter, Record
 from orc8r.protos import eventd_pb2, eventd_pb2_grpc
 
 RETRY_ON_FAILURE = 'retry_on_failure'
@@ -31,11 +30,13 @@ class EventDRpcServicer(eventd_pb2_grpc.EventServiceServicer):
     gRPC based server for EventD.
     """
 
-    def __init__(self, config: Dict[str, Any], validator: EventValidator):
-        self._fluent_bit_port = config['fluent_bit_port']
-        self._tcp_timeout = config['tcp_timeout']
+    def __init__(
+        self, config: Dict[str, Any], validator: EventValidator,
+        writer: FluentBitWriter,
+    ):
         self._event_registry = config['event_registry']
         self._validator = validator
+        self._writer = writer
 
     def add_to_server(self, server):
         """
@@ -49,47 +50,48 @@ class EventDRpcServicer(eventd_pb2_grpc.EventServiceServicer):
         Logs an event.
         """
         logging.debug("Logging event: %s", request)
+        self._log_events([request], context)
 
-        try:
-            self._validator.validate_event(request.value, request.event_type)
-        except (KeyError, jsonschema.ValidationError) as e:
-            logging.error("KeyError for log: %s. Error: %s", request, e)
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(
-                'Event validation failed, Details: {}'.format(e),
-            )
-            return
+    @return_void
+    def LogEvents(self, request: eventd_pb2.Events, context):
+        """
+        Logs a batch of events. None of them is logged if one is invalid.
+        """
+        logging.debug("Logging %d events", len(request.events))
+        self._log_events(request.events, context)
 
-        value = {
-            'stream_name': request.stream_name,
-            'event_type': request.event_type,
-            'event_tag': request.tag,
-            'value': request.value,
-            'retry_on_failure': self._needs_retries(request.event_type),
-        }
-        try:
-            with closing(
-                socket.create_connection(
-                ('localhost', self._fluent_bit_port),
-                timeout=self._tcp_timeout,
-                ),
-            ) as sock:
-                logging.debug('Sending log to FluentBit')
-                sock.sendall(json.dumps(value).encode('utf-8'))
-        except socket.error as e:
-            logging.error('Connection to FluentBit failed: %s', e)
-            logging.info(
-                'FluentBit (td-agent-bit) may not be enabled '
-                'or configured correctly',
-            )
-            context.set_code(grpc.StatusCode.UNAVAILABLE)
-            context.set_details(
-                'Could not connect to FluentBit locally, Details: {}'
-                .format(e),
+    def _log_events(self, events: List[eventd_pb2.Event], context):
+        records = []  # type: List[Record]
+        for event in events:
+            try:
+                self._validator.validate_event(event.value, event.event_type)
+            except (KeyError, jsonschema.ValidationError) as e:
+                logging.error("KeyError for log: %s. Error: %s", event, e)
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(
+                    'Event validation failed, Details: {}'.format(e),
+                )
+                return
+
+            retry = self._needs_retries(event.event_type)
+            value = {
+                'stream_name': event.stream_name,
+                'event_type': event.event_type,
+                'event_tag': event.tag,
+                'value': event.value,
+                'retry_on_failure': retry,
+            }
+            records.append(
+                (json.dumps(value).encode('utf-8'), retry == 'True'),
             )
+
+        if not self._writer.put(records):
+            logging.warning('Event queue is full, rejecting events')
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details('Too many events waiting for FluentBit')
             return
 
-        logging.debug("Successfully logged event: %s", request)
+        logging.debug("Successfully queued %d events", len(records))
 
     def _needs_retries(self, event_type: str) -> str:
         if event_type not in self._event_registry:
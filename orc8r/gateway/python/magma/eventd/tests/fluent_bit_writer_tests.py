@@ -0,0 +1,105 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import socket
+from unittest import TestCase, mock
+
+from magma.eventd.fluent_bit_writer import FluentBitWriter
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+class FluentBitWriterTests(TestCase):
+    """
+    Tests for the batched writer to FluentBit
+    """
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._connections = 0
+        self._received = b''
+        self._writers = []
+
+    def tearDown(self):
+        for writer in self._writers:
+            self._loop.run_until_complete(writer.stop())
+        self._loop.close()
+
+    def _start(self, writer):
+        writer.start()
+        self._writers.append(writer)
+
+    async def _handle_connection(self, reader, writer):
+        self._connections += 1
+        while True:
+            data = await reader.read(1024)
+            if not data:
+                break
+            self._received += data
+        writer.close()
+
+    def _run_until(self, predicate):
+        async def wait():
+            while not predicate():
+                await asyncio.sleep(0.01)
+        self._loop.run_until_complete(asyncio.wait_for(wait(), 5))
+
+    def test_batches_on_one_connection(self):
+        """Events queued from several calls share a connection"""
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, 'localhost', 0),
+        )
+        port = server.sockets[0].getsockname()[1]
+        writer = FluentBitWriter(port, 5, self._loop, max_batch_size=2)
+        self._start(writer)
+
+        self.assertTrue(
+            writer.put([(b'{"a": 1}', False), (b'{"b": 2}', True)]),
+        )
+        self.assertTrue(writer.put([(b'{"c": 3}', False)]))
+        self._run_until(lambda: len(self._received) == 24)
+        self.assertEqual(self._received, b'{"a": 1}{"b": 2}{"c": 3}')
+        self.assertEqual(self._connections, 1)
+        server.close()
+
+    def test_queue_bound(self):
+        """Retried events are rejected when the queue is full, others are
+        dropped"""
+        writer = FluentBitWriter(_unused_port(), 5, self._loop, 2)
+        self.assertTrue(writer.put([(b'1', True), (b'2', False)]))
+        self.assertTrue(writer.put([(b'3', False)]))
+        self.assertEqual(list(writer._queue), [(b'1', True), (b'2', False)])
+        self.assertFalse(writer.put([(b'4', True)]))
+        self.assertEqual(len(writer._queue), 2)
+
+    @mock.patch('magma.eventd.fluent_bit_writer.RECONNECT_INTERVAL', 0.01)
+    def test_unavailable(self):
+        """Only retried events are kept while FluentBit is unavailable"""
+        port = _unused_port()
+        writer = FluentBitWriter(port, 5, self._loop)
+        self._start(writer)
+        writer.put([(b'{"a": 1}', False), (b'{"b": 2}', True)])
+        self._run_until(lambda: len(writer._queue) == 1)
+
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, 'localhost', port),
+        )
+        self._run_until(lambda: self._received)
+        self.assertEqual(self._received, b'{"b": 2}')
+        server.close()
@@ -37,7 +37,14 @@ from magma.magmad.metrics import (
     metrics_collection_loop,
     monitor_unattended_upgrade_status,
 )
-from magma.magmad.metrics_collector import MetricsCollector, ScrapeTarget
+from magma.magmad.metrics_collector import (
+    DEFAULT_MAX_RETRY_INTERVAL,
+    DEFAULT_SPOOL_MAX_BYTES,
+    MetricsCollector,
+    ScrapeTarget,
+)
+from magma.magmad.metrics_delta import MetricsDeltaFilter
+from magma.magmad.metrics_spool import MetricsSpool
 from magma.magmad.rpc_servicer import MagmadRpcServicer
 from magma.magmad.service_health_watchdog import ServiceHealthWatchdog
 from magma.magmad.service_manager import ServiceManager
@@ -92,9 +99,30 @@ def main():
     grpc_msg_size = metrics_config.get('max_grpc_msg_size_mb', 4)
     metrics_post_processor_fn = metrics_config.get('post_processing_fn')
 
-    metric_scrape_targets = [ScrapeTarget(t['url'], t['name'], t['interval'])
-                             for t in
-                             metrics_config.get('metric_scrape_targets', [])]
+    metric_scrape_targets = [
+        ScrapeTarget(t['url'], t['name'], t['interval'], t.get('timeout'))
+        for t in metrics_config.get('metric_scrape_targets', [])
+    ]
+
+    # Failed uploads are kept in memory, and optionally on disk, for retry
+    spool_max_mb = metrics_config.get('retry_spool_max_mb')
+    metrics_spool = MetricsSpool(
+        spool_max_mb * 1024 * 1024 if spool_max_mb is not None
+        else DEFAULT_SPOOL_MAX_BYTES,
+        spill_dir=metrics_config.get('retry_spool_dir'),
+        max_spill_bytes=metrics_config.get(
+            'retry_spool_dir_max_mb', 0,
+        ) * 1024 * 1024,
+    )
+
+    # In delta upload mode, only the samples that changed are uploaded,
+    # with all of them every keyframe_interval seconds
+    delta_filter = None
+    if metrics_config.get('delta_upload', False):
+        delta_filter = MetricsDeltaFilter(
+            metrics_config.get('keyframe_interval', 300),
+            metrics_config.get('max_series_per_service', 0),
+        )
 
     # Create local metrics collector
     metrics_collector = MetricsCollector(
@@ -108,6 +136,12 @@ def main():
             metrics_post_processor_fn,
         ),
         scrape_targets=metric_scrape_targets,
+        spool=metrics_spool,
+        max_retry_interval=metrics_config.get(
+            'max_retry_interval', DEFAULT_MAX_RETRY_INTERVAL,
+        ),
+        delta_filter=delta_filter,
+        grpc_compression=metrics_config.get('grpc_compression'),
     )
 
     # Poll and sync the metrics collector loops
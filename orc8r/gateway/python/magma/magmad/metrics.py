@@ -19,7 +19,7 @@ from collections import OrderedDict
 import psutil
 from magma.common.health.service_state_wrapper import ServiceStateWrapper
 from magma.magmad.check.network_check import ping
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 POLL_INTERVAL_SECONDS = 10
 
@@ -73,6 +73,29 @@ UNEXPECTED_SERVICE_RESTARTS = Counter(
     'Count of unexpected restarts',
     ['service_name'],
 )
+METRICS_SPOOL_BYTES = Gauge(
+    'metrics_spool_bytes',
+    'Size of the metrics waiting to be uploaded again after a failure',
+)
+METRICS_SPOOL_DROPPED = Counter(
+    'metrics_spool_dropped',
+    'Count of metric families dropped because the retry spool was full',
+)
+SERVICE303_CALL_LATENCY = Histogram(
+    'service303_call_latency_seconds',
+    'Latency of the Service303 calls to the local services',
+    ['service', 'method'],
+)
+METRICS_SAMPLES_SUPPRESSED = Counter(
+    'metrics_samples_suppressed',
+    'Count of unchanged samples not uploaded in delta upload mode',
+    ['service'],
+)
+METRICS_SERIES_OVERFLOW = Counter(
+    'metrics_series_overflow',
+    'Count of samples dropped because their service had too many series',
+    ['service'],
+)
 UNATTENDED_UPGRADE_STATUS = Gauge(
     'unattended_upgrade_status',
     'Unattended Upgrade update status'
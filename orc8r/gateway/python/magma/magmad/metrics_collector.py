@@ -16,11 +16,13 @@ import logging
 import time
 from typing import Callable, Dict, List, NamedTuple, Optional, Union
 
+import aiohttp
 import metrics_pb2
 import prometheus_client.core
-import requests
 import snowflake
 from magma.common.service_registry import ServiceRegistry
+from magma.magmad.metrics_delta import MetricsDeltaFilter
+from magma.magmad.metrics_spool import MetricsSpool
 from orc8r.protos import metricsd_pb2
 from orc8r.protos.common_pb2 import Void
 from orc8r.protos.metricsd_pb2 import MetricsContainer
@@ -28,14 +30,23 @@ from orc8r.protos.metricsd_pb2_grpc import MetricsControllerStub
 from orc8r.protos.service303_pb2_grpc import Service303Stub
 from prometheus_client.parser import text_string_to_metric_families
 
+# Default size of the in-memory spool of failed uploads
+DEFAULT_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+# Initial and maximum delay in seconds between retries of failed uploads
+DEFAULT_RETRY_INTERVAL = 10
+DEFAULT_MAX_RETRY_INTERVAL = 300
+# Values of the grpc.default_compression_algorithm channel option
+GRPC_COMPRESSION_ALGORITHMS = {'none': 0, 'deflate': 1, 'gzip': 2}
+
+
 # ScrapeTarget Holds information required to scrape and process metrics from a
-# prometheus target
-ScrapeTarget = NamedTuple(
-    'ScrapeTarget', [
-        ('url', str), ('name', str),
-        ('interval', int),
-    ],
-)
+# prometheus target. The scrape times out after timeout seconds, or after
+# interval seconds if no timeout is set.
+class ScrapeTarget(NamedTuple):
+    url: str
+    name: str
+    interval: int
+    timeout: Optional[int] = None
 
 
 class MetricsCollector(object):
@@ -53,6 +64,10 @@ class MetricsCollector(object):
         loop: Optional[asyncio.AbstractEventLoop] = None,
         post_processing_fn: Optional[Callable] = None,
         scrape_targets: [ScrapeTarget] = None,
+        spool: Optional[MetricsSpool] = None,
+        max_retry_interval: int = DEFAULT_MAX_RETRY_INTERVAL,
+        delta_filter: Optional[MetricsDeltaFilter] = None,
+        grpc_compression: Optional[str] = None,
     ):
         self.sync_interval = sync_interval
         self.collect_interval = collect_interval
@@ -64,11 +79,20 @@ class MetricsCollector(object):
         for s in self._services:
             self._samples_for_service[s] = []
         self._grpc_options = _get_metrics_chan_grpc_options(
-            grpc_max_msg_size_mb,
+            grpc_max_msg_size_mb, grpc_compression,
         )
         self.scrape_targets = scrape_targets if scrape_targets else []
         # @see example_metrics_postprocessor_fn
         self.post_processing_fn = post_processing_fn
+        # If set, only the samples that changed are uploaded
+        self._delta_filter = delta_filter
+        # Chunks whose upload failed, retried one at a time with backoff
+        self._spool = spool if spool is not None \
+            else MetricsSpool(DEFAULT_SPOOL_MAX_BYTES)
+        self._retry_interval = DEFAULT_RETRY_INTERVAL
+        self._max_retry_interval = max_retry_interval
+        self._retrying = False
+        self._http_session = None
 
     def run(self):
         """
@@ -86,6 +110,7 @@ class MetricsCollector(object):
                 self.scrape_prometheus_target,
                 target,
             )
+        self._schedule_retry()
 
     def sync(self, service_name):
         """
@@ -94,12 +119,7 @@ class MetricsCollector(object):
         """
         if service_name in self._samples_for_service and \
            self._samples_for_service[service_name]:
-            chan = ServiceRegistry.get_rpc_channel(
-                'metricsd',
-                ServiceRegistry.CLOUD,
-                grpc_options=self._grpc_options,
-            )
-            client = MetricsControllerStub(chan)
+            client = self._get_metricsd_client()
             if self.post_processing_fn:
                 # If services wants to, let it run a postprocessing function
                 # If we throw an exception here, we'll have no idea whether
@@ -110,21 +130,15 @@ class MetricsCollector(object):
                 )
 
             samples = self._samples_for_service[service_name]
-            sample_chunks = self._chunk_samples(samples)
-            for idx, chunk in enumerate(sample_chunks):
-                metrics_container = MetricsContainer(
-                    gatewayId=snowflake.snowflake(),
-                    family=chunk,
-                )
-                future = client.Collect.future(
-                    metrics_container,
-                    self.grpc_timeout,
-                )
-                future.add_done_callback(
-                    self._make_sync_done_func(
-                        service_name, idx,
-                    ),
+            if self._delta_filter:
+                samples = self._delta_filter.filter(service_name, samples)
+            sample_chunks = self._chunk_samples_with_size(samples)
+            for idx, (chunk, size) in enumerate(sample_chunks):
+                self._upload(
+                    client, chunk, size,
+                    self._make_sync_done_func(service_name, idx),
                 )
+            # Chunks that fail to upload are kept in the spool
             self._samples_for_service[service_name].clear()
         self._loop.call_later(self.sync_interval, self.sync, service_name)
 
@@ -210,49 +224,165 @@ class MetricsCollector(object):
             self._samples_for_service[service_name].append(uptime)
 
     def _make_sync_done_func(self, service_name, chunk):
-        return lambda future: self._loop.call_soon_threadsafe(
-            self.sync_done, service_name, chunk,
-            future,
-        )
+        return lambda future: self.sync_done(service_name, chunk, future)
 
     def _chunk_samples(self, samples):
+        for chunk, _ in self._chunk_samples_with_size(samples):
+            yield chunk
+
+    def _chunk_samples_with_size(self, samples):
+        """
+        Split samples into chunks that fit in a gRPC message. Yields each
+        chunk with its size in bytes.
+        """
         # Add 1kiB for gRPC overhead
         max_msg_bytes = self.grpc_max_msg_size_bytes - 1000
 
         chunked_samples = []
         chunked_samples_size = 0
         for s in samples:
-            if chunked_samples_size + s.ByteSize() <= max_msg_bytes:
+            # ByteSize() walks the whole message, only compute it once
+            size = s.ByteSize()
+            if chunked_samples_size + size <= max_msg_bytes:
                 chunked_samples.append(s)
-                chunked_samples_size += s.ByteSize()
+                chunked_samples_size += size
             else:
-                yield chunked_samples
+                yield chunked_samples, chunked_samples_size
                 chunked_samples = [s]
-                chunked_samples_size = s.ByteSize()
+                chunked_samples_size = size
         # Send leftover samples
-        if chunked_samples_size > 0:
-            yield chunked_samples
+        if chunked_samples:
+            yield chunked_samples, chunked_samples_size
+
+    def _get_metricsd_client(self):
+        chan = ServiceRegistry.get_rpc_channel(
+            'metricsd',
+            ServiceRegistry.CLOUD,
+            grpc_options=self._grpc_options,
+        )
+        return MetricsControllerStub(chan)
+
+    def _upload(self, client, chunk, size, done_func):
+        """
+        Upload a chunk of samples to the cloud. done_func is called on the
+        loop with the Collect future. If the upload fails, the chunk is
+        spooled to be retried.
+        """
+        metrics_container = MetricsContainer(
+            gatewayId=snowflake.snowflake(),
+            family=chunk,
+        )
+        future = client.Collect.future(
+            metrics_container,
+            self.grpc_timeout,
+        )
+        future.add_done_callback(
+            lambda future: self._loop.call_soon_threadsafe(
+                self._upload_done, chunk, size, done_func, future,
+            ),
+        )
+
+    def _upload_done(self, chunk, size, done_func, collect_future):
+        done_func(collect_future)
+        if collect_future.exception():
+            self._spool.put(chunk, size)
+            self._schedule_retry()
+
+    def _schedule_retry(self, delay=None):
+        """
+        Schedule the retry of the oldest spooled chunk, unless one is
+        already scheduled or in progress
+        """
+        if self._retrying or not len(self._spool):
+            return
+        self._retrying = True
+        self._loop.call_later(
+            self._retry_interval if delay is None else delay,
+            self._retry_spooled,
+        )
+
+    def _retry_spooled(self):
+        item = self._spool.pop()
+        if item is None:
+            self._retrying = False
+            return
+        chunk, size = item
+        metrics_container = MetricsContainer(
+            gatewayId=snowflake.snowflake(),
+            family=chunk,
+        )
+        future = self._get_metricsd_client().Collect.future(
+            metrics_container,
+            self.grpc_timeout,
+        )
+        future.add_done_callback(
+            lambda future: self._loop.call_soon_threadsafe(
+                self._retry_done, chunk, size, future,
+            ),
+        )
+
+    def _retry_done(self, chunk, size, collect_future):
+        """
+        Retry callback. Back off while uploads fail, and retry the next
+        spooled chunk right away once one succeeds.
+        """
+        self._retrying = False
+        err = collect_future.exception()
+        if err:
+            logging.warning(
+                "Metrics upload retry error! [%s] %s, "
+                "%d chunks spooled", err.code(), err.details(),
+                len(self._spool) + 1,
+            )
+            self._spool.put_back(chunk, size)
+            self._retry_interval = min(
+                2 * self._retry_interval, self._max_retry_interval,
+            )
+            self._schedule_retry()
+        else:
+            logging.debug("Metrics upload retry success")
+            self._retry_interval = DEFAULT_RETRY_INTERVAL
+            self._schedule_retry(delay=0)
 
     def scrape_prometheus_target(self, target: ScrapeTarget) -> None:
+        """
+        Start an asynchronous scrape of a prometheus metrics target
+        """
+        asyncio.ensure_future(
+            self._scrape_prometheus_target(target),
+            loop=self._loop,
+        )
+
+    async def _scrape_prometheus_target(self, target: ScrapeTarget) -> None:
         """
         Scrape a prometheus metrics target, convert to protobuf, send results
-        to cloud. Reschedule collection if error.
+        to cloud, and reschedule collection.
         """
         try:
-            r = requests.get(target.url)
-            metrics = _parse_metrics_response(r.text)
+            text = await asyncio.wait_for(
+                self._fetch_metrics_text(target.url),
+                target.timeout or target.interval,
+            )
+            metrics = _parse_metrics_response(text)
             _add_scrape_label_to_metrics(metrics, target.name)
             self._package_and_send_metrics(metrics, target)
-
         except Exception as e:  # pylint: disable=broad-except
             logging.error(
-                "Error scraping prometheus target: %s", str(e),
+                "Error scraping prometheus target %s: %r", target.name, e,
             )
+        finally:
             self._loop.call_later(
                 target.interval,
                 self.scrape_prometheus_target, target,
             )
 
+    async def _fetch_metrics_text(self, url: str) -> str:
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession()
+        async with self._http_session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+
     def _package_and_send_metrics(
             self, metrics: [metrics_pb2.MetricFamily],
             target: ScrapeTarget,
@@ -260,32 +390,18 @@ class MetricsCollector(object):
         """
         Send parsed and protobuf-converted metrics to cloud.
         """
-        chan = ServiceRegistry.get_rpc_channel(
-            'metricsd',
-            ServiceRegistry.CLOUD,
-            grpc_options=self._grpc_options,
-        )
-
-        client = MetricsControllerStub(chan)
-        for chunk in self._chunk_samples(metrics):
-            metrics_container = MetricsContainer(
-                gatewayId=snowflake.snowflake(),
-                family=chunk,
-            )
-            future = client.Collect.future(
-                metrics_container,
-                self.grpc_timeout,
-            )
-            future.add_done_callback(
-                lambda future:
-                self._loop.call_soon_threadsafe(
-                    self.scrape_done, future, target,
-                ),
+        if self._delta_filter:
+            metrics = self._delta_filter.filter(target.name, metrics)
+        client = self._get_metricsd_client()
+        for chunk, size in self._chunk_samples_with_size(metrics):
+            self._upload(
+                client, chunk, size,
+                lambda future: self.scrape_done(future, target),
             )
 
     def scrape_done(self, collect_future, target):
         """
-        Log error if send fails, otherwise reschedule collection
+        Log the result of a scraped metrics upload
         """
         err = collect_future.exception()
         if err:
@@ -299,11 +415,6 @@ class MetricsCollector(object):
                 target.name,
             )
 
-        self._loop.call_later(
-            target.interval,
-            self.scrape_prometheus_target, target,
-        )
-
 
 def _parse_metrics_response(response_text: str) -> [metrics_pb2.MetricFamily]:
     parsed_families = list(text_string_to_metric_families(response_text))
@@ -360,10 +471,15 @@ def _get_uptime_metric(service_name, start_time):
     return family_proto
 
 
-def _get_metrics_chan_grpc_options(msg_size_mb: int):
+def _get_metrics_chan_grpc_options(
+    msg_size_mb: int,
+    compression: Optional[str] = None,
+):
     """
     Returns a list of gRPC options for metricsd cloud grpc channel
     :param msg_size_mb: msg size in MBs
+    :param compression: name of the compression algorithm of the uploads,
+        one of GRPC_COMPRESSION_ALGORITHMS
     :return: list of tuples containing grpc options for channel
     """
     grpc_max_msg_size_bytes = msg_size_mb * 1024 * 1024
@@ -371,7 +487,17 @@ def _get_metrics_chan_grpc_options(msg_size_mb: int):
         'Setting metricsd gRPC chan Max Message Size to: %s bytes',
         grpc_max_msg_size_bytes,
     )
-    return [('grpc.max_send_message_length', grpc_max_msg_size_bytes)]
+    options = [('grpc.max_send_message_length', grpc_max_msg_size_bytes)]
+    if compression:
+        if compression not in GRPC_COMPRESSION_ALGORITHMS:
+            raise ValueError(
+                'Unknown metricsd gRPC compression: %s' % compression,
+            )
+        options.append((
+            'grpc.default_compression_algorithm',
+            GRPC_COMPRESSION_ALGORITHMS[compression],
+        ))
+    return options
 
 
 def example_metrics_postprocessor_fn(
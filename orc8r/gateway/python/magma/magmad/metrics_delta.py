@@ -0,0 +1,122 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import time
+from typing import Dict, List, Tuple
+
+import metrics_pb2
+from magma.magmad.metrics import (
+    METRICS_SAMPLES_SUPPRESSED,
+    METRICS_SERIES_OVERFLOW,
+)
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsDeltaFilter(object):
+    """
+    Reduces the samples uploaded for a service to the series that changed
+    since they were last uploaded. Unchanged gauges are suppressed, and
+    counters are only sent when they were incremented. Counters are still
+    sent with their cumulative value, since metricsd stores the samples
+    as they are.
+
+    Every keyframe_interval seconds all the series of a service are
+    uploaded, so the cloud keeps receiving series that don't change and
+    series that disappeared are forgotten.
+
+    A service can have at most max_series series. Samples of new series
+    beyond it are dropped and counted in metrics_series_overflow, until
+    the next keyframe.
+    """
+
+    def __init__(self, keyframe_interval: int, max_series: int = 0):
+        self._keyframe_interval = keyframe_interval
+        self._max_series = max_series
+        # service -> series key -> value of the last uploaded sample
+        self._last_values = {}  # type: Dict[str, Dict[SeriesKey, tuple]]
+        # service -> time of the last keyframe
+        self._last_keyframe = {}  # type: Dict[str, float]
+
+    def filter(
+        self, service_name: str,
+        families: List[metrics_pb2.MetricFamily],
+    ) -> List[metrics_pb2.MetricFamily]:
+        """
+        Return the metric families with only the samples to upload. The
+        samples are recorded as uploaded.
+        """
+        now = time.monotonic()
+        last_keyframe = self._last_keyframe.get(service_name)
+        keyframe = last_keyframe is None or \
+            now - last_keyframe >= self._keyframe_interval
+        if keyframe:
+            self._last_keyframe[service_name] = now
+            self._last_values[service_name] = {}
+        last_values = self._last_values[service_name]
+
+        filtered = []
+        suppressed = 0
+        overflow = 0
+        for family in families:
+            changed = []
+            for metric in family.metric:
+                key = _series_key(family, metric)
+                value = _series_value(metric)
+                last_value = last_values.get(key)
+                if last_value is None:
+                    if self._max_series and \
+                            len(last_values) >= self._max_series:
+                        overflow += 1
+                        continue
+                elif last_value == value:
+                    suppressed += 1
+                    continue
+                last_values[key] = value
+                changed.append(metric)
+
+            if len(changed) == len(family.metric):
+                filtered.append(family)
+            elif changed:
+                changed_family = metrics_pb2.MetricFamily(
+                    name=family.name,
+                    help=family.help,
+                    type=family.type,
+                )
+                changed_family.metric.extend(changed)
+                filtered.append(changed_family)
+
+        if suppressed:
+            METRICS_SAMPLES_SUPPRESSED.labels(service=service_name).inc(
+                suppressed,
+            )
+        if overflow:
+            METRICS_SERIES_OVERFLOW.labels(service=service_name).inc(overflow)
+        return filtered
+
+
+def _series_key(family, metric) -> SeriesKey:
+    return (
+        family.name,
+        tuple((label.name, label.value) for label in metric.label),
+    )
+
+
+def _series_value(metric) -> tuple:
+    """ The value of a sample, without its labels and timestamp """
+    return (
+        metric.gauge.value,
+        metric.counter.value,
+        metric.untyped.value,
+        metric.summary.SerializeToString(),
+        metric.histogram.SerializeToString(),
+    )
@@ -0,0 +1,154 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import logging
+import os
+from collections import deque
+from typing import List, Optional, Tuple
+
+import metrics_pb2
+from magma.magmad.metrics import METRICS_SPOOL_BYTES, METRICS_SPOOL_DROPPED
+from orc8r.protos.metricsd_pb2 import MetricsContainer
+
+SPILL_FILE_SUFFIX = '.pb'
+
+
+class MetricsSpool(object):
+    """
+    Bounded store of metric chunks whose upload failed, to be retried.
+
+    Chunks are kept in memory up to max_bytes. Beyond that, the oldest
+    chunks are spilled to files in spill_dir if one is configured, up to
+    max_spill_bytes, and dropped otherwise. Chunks are returned oldest
+    first. Spilled chunks are picked up again after a restart.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = 0,
+    ):
+        self._max_bytes = max_bytes
+        self._spill_dir = spill_dir
+        self._max_spill_bytes = max_spill_bytes
+        # (chunk, size) of the in-memory chunks, oldest first
+        self._chunks = deque()
+        self._bytes = 0
+        # (sequence number, size) of the spilled chunks, oldest first
+        self._spilled = deque()
+        self._spilled_bytes = 0
+        self._next_seq = 0
+        if spill_dir:
+            self._load_spilled()
+        self._update_gauge()
+
+    def __len__(self):
+        return len(self._chunks) + len(self._spilled)
+
+    def put(self, chunk: List[metrics_pb2.MetricFamily], size: int):
+        """
+        Add a chunk to retry, after the other chunks
+        """
+        self._chunks.append((chunk, size))
+        self._bytes += size
+        self._evict()
+        self._update_gauge()
+
+    def put_back(self, chunk: List[metrics_pb2.MetricFamily], size: int):
+        """
+        Return a chunk that failed again, so it is retried first
+        """
+        self._chunks.appendleft((chunk, size))
+        self._bytes += size
+        self._evict()
+        self._update_gauge()
+
+    def pop(self) -> Optional[Tuple[List[metrics_pb2.MetricFamily], int]]:
+        """
+        Remove and return the oldest chunk and its size, or None if the
+        spool is empty
+        """
+        item = None
+        while item is None and self._spilled:
+            item = self._read_spilled()
+        if item is None and self._chunks:
+            item = self._chunks.popleft()
+            self._bytes -= item[1]
+        self._update_gauge()
+        return item
+
+    def _evict(self):
+        while self._bytes > self._max_bytes and self._chunks:
+            chunk, size = self._chunks.popleft()
+            self._bytes -= size
+            if not self._spill(chunk, size):
+                METRICS_SPOOL_DROPPED.inc(len(chunk))
+
+    def _spill(self, chunk, size) -> bool:
+        if not self._spill_dir or \
+                self._spilled_bytes + size > self._max_spill_bytes:
+            return False
+        seq = self._next_seq
+        try:
+            os.makedirs(self._spill_dir, exist_ok=True)
+            with open(self._spill_path(seq), 'wb') as spill_file:
+                spill_file.write(
+                    MetricsContainer(family=chunk).SerializeToString(),
+                )
+        except OSError as err:
+            logging.error("Failed to spill metrics to disk: %s", err)
+            return False
+        self._next_seq += 1
+        self._spilled.append((seq, size))
+        self._spilled_bytes += size
+        return True
+
+    def _read_spilled(self):
+        seq, size = self._spilled.popleft()
+        self._spilled_bytes -= size
+        path = self._spill_path(seq)
+        try:
+            with open(path, 'rb') as spill_file:
+                container = MetricsContainer.FromString(spill_file.read())
+            os.remove(path)
+        except Exception as err:  # pylint: disable=broad-except
+            logging.error("Failed to read spilled metrics %s: %s", path, err)
+            return None
+        chunk = list(container.family)
+        # Spilled files from a previous run are accounted by file size
+        return chunk, sum(family.ByteSize() for family in chunk)
+
+    def _load_spilled(self):
+        try:
+            names = os.listdir(self._spill_dir)
+        except OSError:
+            return
+        seqs = sorted(
+            int(name[:-len(SPILL_FILE_SUFFIX)]) for name in names
+            if name.endswith(SPILL_FILE_SUFFIX)
+            and name[:-len(SPILL_FILE_SUFFIX)].isdigit()
+        )
+        for seq in seqs:
+            size = os.path.getsize(self._spill_path(seq))
+            self._spilled.append((seq, size))
+            self._spilled_bytes += size
+        if seqs:
+            self._next_seq = seqs[-1] + 1
+
+    def _spill_path(self, seq):
+        return os.path.join(
+            self._spill_dir, '%d%s' % (seq, SPILL_FILE_SUFFIX),
+        )
+
+    def _update_gauge(self):
+        METRICS_SPOOL_BYTES.set(self._bytes + self._spilled_bytes)
@@ -11,6 +11,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 import time
 from typing import List
@@ -19,7 +20,10 @@ import grpc
 from magma.common.job import Job
 from magma.common.rpc_utils import grpc_async_wrapper
 from magma.common.service_registry import ServiceRegistry
-from magma.magmad.metrics import UNEXPECTED_SERVICE_RESTARTS
+from magma.magmad.metrics import (
+    SERVICE303_CALL_LATENCY,
+    UNEXPECTED_SERVICE_RESTARTS,
+)
 from orc8r.protos.common_pb2 import Void
 from orc8r.protos.service303_pb2_grpc import Service303Stub
 
@@ -83,6 +87,8 @@ class ServicePoller(Job):
     GET_STATUS_INTERVAL = 10
     # Timeout when getting status from other local services, in seconds
     GET_STATUS_TIMEOUT = 8
+    # Default max number of services queried at the same time
+    MAX_CONCURRENT_CALLS = 8
 
     def __init__(self, loop, config, dynamic_services: List[str] = None):
         """
@@ -98,6 +104,9 @@ class ServicePoller(Job):
             loop=loop,
         )
         self._config = config
+        self._max_concurrent_calls = config.get(
+            'max_concurrent_service_calls', self.MAX_CONCURRENT_CALLS,
+        )
         # Holds a map of service name -> ServiceInfo
         self._service_info = {}
         for service in config['magma_services']:
@@ -150,32 +159,35 @@ class ServicePoller(Job):
     async def _get_service_info(self):
         """
         Make RPC calls to 'GetServiceInfo' functions of other services, to
-        get current status.
+        get current status. The services are queried concurrently, at most
+        max_concurrent_service_calls at a time.
         """
-        for service in self._service_info:
+        semaphore = asyncio.Semaphore(self._max_concurrent_calls)
+        await asyncio.gather(*[
+            self._get_one_service_info(service, semaphore)
+            for service in list(self._service_info)
             # Check whether service provides service303 interface
-            if service in self._config['non_service303_services']:
-                continue
-            try:
-                chan = ServiceRegistry.get_rpc_channel(
-                    service, ServiceRegistry.LOCAL,
-                )
-            except ValueError:
-                # Service can't be contacted
-                logging.error('Cant get RPC channel to %s', service)
-                continue
-            client = Service303Stub(chan)
+            if service not in self._config['non_service303_services']
+        ])
+
+    async def _get_one_service_info(self, service, semaphore):
+        try:
+            chan = ServiceRegistry.get_rpc_channel(
+                service, ServiceRegistry.LOCAL,
+            )
+        except ValueError:
+            # Service can't be contacted
+            logging.error('Cant get RPC channel to %s', service)
+            return
+        client = Service303Stub(chan)
+        async with semaphore:
+            start = time.monotonic()
             try:
                 future = client.GetServiceInfo.future(
                     Void(),
                     self.GET_STATUS_TIMEOUT,
                 )
                 info = await grpc_async_wrapper(future, self._loop)
-                self._service_info[service].update(
-                    info.start_time_secs,
-                    info.status,
-                )
-                self._service_info[service].continuous_timeouts = 0
             except grpc.RpcError as err:
                 logging.error(
                     "GetServiceInfo Error for %s! [%s] %s",
@@ -183,5 +195,17 @@ class ServicePoller(Job):
                     err.code(),
                     err.details(),
                 )
-                if err.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                # The service may have been disabled in the meantime
+                if err.code() == grpc.StatusCode.DEADLINE_EXCEEDED and \
+                        service in self._service_info:
                     self._service_info[service].continuous_timeouts += 1
+                return
+            finally:
+                SERVICE303_CALL_LATENCY.labels(
+                    service=service, method='GetServiceInfo',
+                ).observe(time.monotonic() - start)
+        if service in self._service_info:
+            self._service_info[service].update(
+                info.start_time_secs,
+                info.status,
+            )
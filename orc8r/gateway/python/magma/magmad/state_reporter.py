@@ -14,6 +14,7 @@ limitations under the License.
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 import grpc
@@ -26,8 +27,8 @@ from magma.common.service import get_service303_client
 from magma.common.service_registry import ServiceRegistry
 from magma.magmad.bootstrap_manager import BootstrapManager
 from magma.magmad.gateway_status import GatewayStatusFactory
-from magma.magmad.metrics import CHECKIN_STATUS
-from magma.magmad.service_poller import ServiceInfo
+from magma.magmad.metrics import CHECKIN_STATUS, SERVICE303_CALL_LATENCY
+from magma.magmad.service_poller import ServiceInfo, ServicePoller
 from orc8r.protos.common_pb2 import Void
 from orc8r.protos.service303_pb2 import State
 from orc8r.protos.state_pb2 import ReportStatesRequest
@@ -162,6 +163,11 @@ class StateReporter(SDWatchdogTask):
         self._service_info_by_name = self._construct_service_info_by_name(
             config=config,
         )
+        # Max number of services queried for their states at the same time
+        self._max_concurrent_calls = config.get(
+            'max_concurrent_service_calls',
+            ServicePoller.MAX_CONCURRENT_CALLS,
+        )
 
         # Initially set status to 1, otherwise on the first round we report a
         # failure. This is particularly an issue if magmad restarts frequenty.
@@ -180,10 +186,14 @@ class StateReporter(SDWatchdogTask):
         self.set_interval(max(self._mconfig.checkin_interval, 5))
 
     async def _collect_states(self) -> Optional[ReportStatesRequest]:
-        states = []
-        for service in self._service_info_by_name:
-            result = await self._get_operational_states(service=service)
-            states.extend(result)
+        # The services are queried concurrently. The states of the services
+        # which fail or time out are left out of the report.
+        semaphore = asyncio.Semaphore(self._max_concurrent_calls)
+        results = await asyncio.gather(*[
+            self._get_operational_states(service=service, semaphore=semaphore)
+            for service in self._service_info_by_name
+        ])
+        states = [state for result in results for state in result]
 
         gw_state = self._get_gw_state()
         if gw_state is not None:
@@ -225,26 +235,32 @@ class StateReporter(SDWatchdogTask):
             # reset timeout to config-specified + some buffer
             self.set_timeout(self._interval * 2)
 
-    async def _get_operational_states(self, service: str) -> List[States]:
+    async def _get_operational_states(
+        self, service: str,
+        semaphore: asyncio.Semaphore,
+    ) -> States:
         client = get_service303_client(service, ServiceRegistry.LOCAL)
         if client is None:
             return []
-        try:
-            states = []
-            future = client.GetOperationalStates.future(
-                Void(),
-                self._mconfig.checkin_timeout,
-            )
-            result = await grpc_async_wrapper(future, self._loop)
-            for i in range(len(result.states)):
-                states.append(result.states[i])
-            return states
-        except Exception as err:
-            logging.error(
-                "GetOperationalStates Error for %s! [%s] %s",
-                service, err.code(), err.details(),
-            )
-            return []
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                future = client.GetOperationalStates.future(
+                    Void(),
+                    self._mconfig.checkin_timeout,
+                )
+                result = await grpc_async_wrapper(future, self._loop)
+                return list(result.states)
+            except Exception as err:
+                logging.error(
+                    "GetOperationalStates Error for %s! [%s] %s",
+                    service, err.code(), err.details(),
+                )
+                return []
+            finally:
+                SERVICE303_CALL_LATENCY.labels(
+                    service=service, method='GetOperationalStates',
+                ).observe(time.monotonic() - start)
 
     def _get_gw_state(self) -> Optional[State]:
         gw_type = "gw_state"
@@ -24,6 +24,7 @@ from magma.common.service_registry import ServiceRegistry
 # pylint: disable=protected-access
 from magma.magmad.metrics_collector import (
     MetricsCollector,
+    ScrapeTarget,
     _counter_to_proto,
     _gauge_to_proto,
     _histogram_to_proto,
@@ -149,6 +150,86 @@ class MetricsCollectorTests(unittest.TestCase):
             [],
         )
 
+    @unittest.mock.patch('snowflake.snowflake')
+    @unittest.mock.patch('magma.magmad.metrics_collector.MetricsControllerStub')
+    def test_sync_failure_retry(self, controller_mock, snowflake_mock):
+        """
+        Test failed uploads are spooled and retried with backoff
+        """
+        snowflake_mock.return_value = self.gateway_id
+        collect_future = unittest.mock.Mock()
+        controller_mock.return_value.Collect.future.return_value = \
+            collect_future
+
+        service_name = "test"
+        samples = [MetricFamily(name="1234")]
+        self._collector._samples_for_service[service_name].extend(samples)
+        self._collector.sync(service_name)
+        self.assertEqual(
+            self._collector._samples_for_service[service_name], [],
+        )
+
+        # The upload fails, the chunk is spooled
+        done_callback = collect_future.add_done_callback.call_args[0][0]
+        done_callback(MockFuture(is_error=True))
+        self._run_pending_callbacks()
+        self.assertEqual(len(self._collector._spool), 1)
+        self.assertTrue(self._collector._retrying)
+
+        # The retry fails too, the chunk is kept and the interval doubles
+        interval = self._collector._retry_interval
+        self._collector._retry_spooled()
+        self.assertEqual(len(self._collector._spool), 0)
+        self.assertEqual(
+            list(
+                controller_mock.return_value.Collect.future.call_args[0][0]
+                .family,
+            ),
+            samples,
+        )
+        done_callback = collect_future.add_done_callback.call_args[0][0]
+        done_callback(MockFuture(is_error=True))
+        self._run_pending_callbacks()
+        self.assertEqual(len(self._collector._spool), 1)
+        self.assertEqual(self._collector._retry_interval, 2 * interval)
+
+        # Once the retry succeeds, the interval is reset
+        self._collector._retry_spooled()
+        done_callback = collect_future.add_done_callback.call_args[0][0]
+        done_callback(MockFuture(is_error=False))
+        self._run_pending_callbacks()
+        self.assertEqual(len(self._collector._spool), 0)
+        self.assertEqual(self._collector._retry_interval, interval)
+
+    def test_scrape_prometheus_target(self):
+        """
+        Test scrapes are parsed, labeled and sent, and time out
+        """
+        target = ScrapeTarget('http://target/metrics', 'target', 60, 0.01)
+        self._collector._package_and_send_metrics = unittest.mock.Mock()
+
+        async def fetch(_url):
+            return '# TYPE requests counter\nrequests 3\n'
+        self._collector._fetch_metrics_text = fetch
+        self._collector._loop.run_until_complete(
+            self._collector._scrape_prometheus_target(target),
+        )
+        metrics = self._collector._package_and_send_metrics.call_args[0][0]
+        self.assertEqual(metrics[0].name, 'requests')
+        self.assertEqual(metrics[0].metric[0].label[0].value, 'target')
+        self._collector._package_and_send_metrics.reset_mock()
+
+        async def slow_fetch(_url):
+            await asyncio.sleep(1)
+        self._collector._fetch_metrics_text = slow_fetch
+        self._collector._loop.run_until_complete(
+            self._collector._scrape_prometheus_target(target),
+        )
+        self._collector._package_and_send_metrics.assert_not_called()
+
+    def _run_pending_callbacks(self):
+        self._collector._loop.run_until_complete(asyncio.sleep(0))
+
     def test_collect(self):
         """
         Test if the collector syncs our sample.
@@ -0,0 +1,97 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from unittest import mock
+
+import metrics_pb2
+from magma.magmad.metrics_collector import _get_metrics_chan_grpc_options
+from magma.magmad.metrics_delta import MetricsDeltaFilter
+
+
+def _gauge_family(name, values):
+    family = metrics_pb2.MetricFamily(name=name, type=metrics_pb2.GAUGE)
+    for label, value in values.items():
+        metric = family.metric.add()
+        metric.label.add(name='key', value=label)
+        metric.gauge.value = value
+    return family
+
+
+def _values(families):
+    return {
+        (family.name, metric.label[0].value): metric.gauge.value
+        for family in families for metric in family.metric
+    }
+
+
+class MetricsDeltaFilterTests(unittest.TestCase):
+    """
+    Tests for the delta upload mode of the metrics collector
+    """
+
+    @mock.patch('time.monotonic')
+    def test_unchanged_suppressed(self, monotonic_mock):
+        """Only the changed samples are kept until the next keyframe"""
+        monotonic_mock.return_value = 0
+        delta_filter = MetricsDeltaFilter(keyframe_interval=60)
+        families = [
+            _gauge_family('m1', {'a': 1, 'b': 2}),
+            _gauge_family('m2', {'a': 3}),
+        ]
+        self.assertEqual(delta_filter.filter('svc', families), families)
+
+        monotonic_mock.return_value = 30
+        families = [
+            _gauge_family('m1', {'a': 1, 'b': 5}),
+            _gauge_family('m2', {'a': 3}),
+        ]
+        self.assertEqual(
+            _values(delta_filter.filter('svc', families)),
+            {('m1', 'b'): 5},
+        )
+        # Services are tracked separately
+        self.assertEqual(delta_filter.filter('other', families), families)
+
+        monotonic_mock.return_value = 60
+        self.assertEqual(delta_filter.filter('svc', families), families)
+
+    @mock.patch('time.monotonic')
+    def test_series_cap(self, monotonic_mock):
+        """New series beyond the cap are dropped until the next keyframe"""
+        monotonic_mock.return_value = 0
+        delta_filter = MetricsDeltaFilter(keyframe_interval=60, max_series=2)
+        families = [_gauge_family('m1', {'a': 1, 'b': 2, 'c': 3})]
+        self.assertEqual(
+            _values(delta_filter.filter('svc', families)),
+            {('m1', 'a'): 1, ('m1', 'b'): 2},
+        )
+
+        families = [_gauge_family('m1', {'a': 4, 'b': 2, 'c': 3})]
+        self.assertEqual(
+            _values(delta_filter.filter('svc', families)),
+            {('m1', 'a'): 4},
+        )
+
+    def test_grpc_compression(self):
+        """The compression is set as a channel option"""
+        self.assertIn(
+            ('grpc.default_compression_algorithm', 2),
+            _get_metrics_chan_grpc_options(4, 'gzip'),
+        )
+        self.assertEqual(len(_get_metrics_chan_grpc_options(4)), 1)
+        with self.assertRaises(ValueError):
+            _get_metrics_chan_grpc_options(4, 'lz4')
+
+
+if __name__ == "__main__":
+    unittest.main()
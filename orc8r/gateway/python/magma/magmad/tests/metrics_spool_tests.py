@@ -0,0 +1,74 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import tempfile
+import unittest
+
+from magma.magmad.metrics_spool import MetricsSpool
+from metrics_pb2 import MetricFamily
+
+
+def _chunk(name):
+    chunk = [MetricFamily(name=name)]
+    return chunk, chunk[0].ByteSize()
+
+
+class MetricsSpoolTests(unittest.TestCase):
+    """
+    Tests for the spool of failed metrics uploads
+    """
+
+    def test_memory_bound(self):
+        """The oldest chunks are dropped when the spool is full"""
+        chunk1, size = _chunk('1')
+        chunk2, _ = _chunk('2')
+        chunk3, _ = _chunk('3')
+        spool = MetricsSpool(2 * size)
+        spool.put(chunk1, size)
+        spool.put(chunk2, size)
+        spool.put(chunk3, size)
+        self.assertEqual(len(spool), 2)
+
+        # A chunk put back is retried first
+        self.assertEqual(spool.pop(), (chunk2, size))
+        spool.put_back(chunk2, size)
+        self.assertEqual(spool.pop(), (chunk2, size))
+        self.assertEqual(spool.pop(), (chunk3, size))
+        self.assertIsNone(spool.pop())
+
+    def test_spill_to_disk(self):
+        """Chunks beyond the memory bound are spilled, and reloaded after
+        a restart"""
+        chunk1, size = _chunk('1')
+        chunk2, _ = _chunk('2')
+        chunk3, _ = _chunk('3')
+        chunk4, _ = _chunk('4')
+        with tempfile.TemporaryDirectory() as spill_dir:
+            spool = MetricsSpool(size, spill_dir, 2 * size)
+            spool.put(chunk1, size)
+            spool.put(chunk2, size)
+            spool.put(chunk3, size)
+            # Memory and disk are full, so chunk3 can't be spilled
+            spool.put(chunk4, size)
+            self.assertEqual(len(spool), 3)
+
+            restarted = MetricsSpool(size, spill_dir, 2 * size)
+            self.assertEqual(len(restarted), 2)
+            self.assertEqual(restarted.pop(), (chunk1, size))
+            restarted.put(chunk4, size)
+            self.assertEqual(restarted.pop(), (chunk2, size))
+            self.assertEqual(restarted.pop(), (chunk4, size))
+            self.assertIsNone(restarted.pop())
+
+
+if __name__ == "__main__":
+    unittest.main()
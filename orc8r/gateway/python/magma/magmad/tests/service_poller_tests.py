@@ -88,6 +88,50 @@ class ServicePollerTests(unittest.TestCase):
             )
         self._loop.run_until_complete(test())
 
+    @unittest.mock.patch('%s.Service303Stub' % SP)
+    def test_poll_concurrent(self, service303_mock):
+        """
+        Test if services are queried concurrently, and a failed query
+        doesn't affect the others.
+        """
+        ServiceRegistry.add_service('test3', '0.0.0.0', 0)
+        self._service_poller = ServicePoller(
+            self._loop, {
+                'magma_services': ['test1', 'test3'],
+                'non_service303_services': [],
+            },
+        )
+
+        async def test():
+            futures = [asyncio.Future(), asyncio.Future()]
+            mocks = [unittest.mock.Mock(), unittest.mock.Mock()]
+            for mock, future in zip(mocks, futures):
+                mock.GetServiceInfo.future.side_effect = [future]
+            service303_mock.side_effect = mocks
+
+            poll = self._loop.create_task(
+                self._service_poller._get_service_info(),
+            )
+            for _ in range(3):
+                await asyncio.sleep(0)
+            # Both services are queried before any of them answers
+            for mock in mocks:
+                mock.GetServiceInfo.future.assert_called_once_with(
+                    Void(), self._service_poller.GET_STATUS_TIMEOUT,
+                )
+
+            grpc_err = grpc.RpcError()
+            grpc_err.code = lambda: grpc.StatusCode.DEADLINE_EXCEEDED
+            grpc_err.details = lambda: "Test Exception"
+            futures[0].set_exception(grpc_err)
+            futures[1].set_result(ServiceInfo(status=ServiceInfo().status))
+            await poll
+
+            service_info = self._service_poller.service_info
+            self.assertEqual(service_info['test1'].continuous_timeouts, 1)
+            self.assertIsNotNone(service_info['test3'].status)
+        self._loop.run_until_complete(test())
+
 
 if __name__ == "__main__":
     unittest.main()
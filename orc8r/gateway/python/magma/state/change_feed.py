@@ -0,0 +1,116 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List, Set
+
+import redis
+from magma.common.redis.client import enable_keyspace_events
+
+# Keyspace events: K (keyspace channel), $ (string commands),
+# g (generic commands, e.g. DEL) and x (expired keys)
+KEYSPACE_EVENTS = "K$gx"
+
+
+class KeyspaceChangeFeed:
+    """
+    KeyspaceChangeFeed tracks which keys of the replicated state types have
+    changed in Redis, using Redis keyspace notifications. State is written
+    by both Python services and the C/C++ services, so the notifications
+    are taken from Redis itself rather than from the Python containers.
+
+    Notifications are fire-and-forget: if the subscription is lost, changes
+    may have been missed and the caller is expected to fall back to a full
+    scan of the state.
+    """
+
+    def __init__(self, client: redis.Redis, redis_types: List[str]):
+        self._client = client
+        self._redis_types = redis_types
+        self._pubsub = None
+        self._channel_prefix = None
+        # redis_type -> set of changed keys
+        self._changed_keys = defaultdict(set)  # type: Dict[str, Set[str]]
+
+    @property
+    def is_running(self) -> bool:
+        return self._pubsub is not None
+
+    def start(self) -> bool:
+        """
+        Enable keyspace notifications and subscribe to the state types.
+        Returns False if notifications can't be used.
+        """
+        self.stop()
+        try:
+            enable_keyspace_events(self._client, KEYSPACE_EVENTS)
+            db = self._client.connection_pool.connection_kwargs.get('db', 0)
+            self._channel_prefix = "__keyspace@{}__:".format(db)
+            pubsub = self._client.pubsub()
+            pubsub.psubscribe(*[
+                self._channel_prefix + "*:" + redis_type
+                for redis_type in self._redis_types
+            ])
+        except redis.exceptions.RedisError as err:
+            logging.warning(
+                "Keyspace notifications unavailable, replicating state "
+                "with full scans: %s", err,
+            )
+            return False
+        self._pubsub = pubsub
+        return True
+
+    def stop(self):
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except redis.exceptions.RedisError:
+                pass
+        self._pubsub = None
+        self._changed_keys.clear()
+
+    def poll(self) -> bool:
+        """
+        Drain the pending notifications into the changed key sets.
+        Returns False if the feed is not running or the subscription was
+        lost, in which case changes may have been missed.
+        """
+        if self._pubsub is None:
+            return False
+        try:
+            while True:
+                msg = self._pubsub.get_message(timeout=0)
+                if msg is None:
+                    return True
+                if msg['type'] == 'pmessage':
+                    self._add_changed_key(msg['channel'])
+        except redis.exceptions.RedisError as err:
+            logging.warning("Lost keyspace notifications: %s", err)
+            self.stop()
+            return False
+
+    def mark_changed(self, redis_type: str, key: str):
+        """ Mark a key to be read again on the next poll """
+        self._changed_keys[redis_type].add(key)
+
+    def pop_changed_keys(self, redis_type: str) -> Set[str]:
+        """ Return and reset the changed keys of a state type """
+        return self._changed_keys.pop(redis_type, set())
+
+    def _add_changed_key(self, channel):
+        if isinstance(channel, bytes):
+            channel = channel.decode('utf-8')
+        composite_key = channel[len(self._channel_prefix):]
+        key, _, redis_type = composite_key.partition(":")
+        self._changed_keys[redis_type].add(key)
@@ -11,6 +11,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import logging
+import time
+from collections import defaultdict
+from typing import Iterable
 
 import grpc
 from magma.common.grpc_client_manager import GRPCClientManager
@@ -22,13 +25,19 @@ from magma.state.redis_dicts import get_json_redis_dicts, get_proto_redis_dicts
 from orc8r.protos.state_pb2 import DeleteStatesRequest, StateID
 
 DEFAULT_GRPC_TIMEOUT = 10
+DEFAULT_FULL_SCAN_INTERVAL = 600
 
 
 class GarbageCollector:
     """
-    GarbageCollector periodically fetches all state in Redis that is marked as
+    GarbageCollector periodically fetches the state in Redis that is marked as
     garbage and deletes that state from the Orchestrator State service. If the
     RPC call succeeds, it then deletes the state from Redis
+
+    Only the keys reported as changed with add_changed_keys are checked for
+    garbage. All state is scanned only as a fallback: on the first
+    collection, when request_full_scan is called because changes may have
+    been missed, and every garbage_collection_full_scan_interval seconds.
     """
 
     def __init__(
@@ -45,19 +54,53 @@ class GarbageCollector:
         # _grpc_client_manager to manage grpc client recyclings
         self._grpc_client_manager = grpc_client_manager
 
+        self._full_scan_interval = service.config.get(
+            'garbage_collection_full_scan_interval',
+            DEFAULT_FULL_SCAN_INTERVAL,
+        )
+        # Monotonic time of the last full scan, None if one is needed
+        self._last_full_scan = None
+        # redis_type -> keys changed since the last collection
+        self._changed_keys = defaultdict(set)
+        # (redis_dict, key) of the garbage states being deleted
+        self._garbage_keys = []
+
+    def add_changed_keys(self, redis_type: str, keys: Iterable[str]):
+        """ Check keys of a state type for garbage on the next collection """
+        self._changed_keys[redis_type].update(keys)
+
+    def request_full_scan(self):
+        """ Scan all state for garbage on the next collection """
+        self._last_full_scan = None
+
     async def run_garbage_collection(self):
         request = await self._collect_states_to_delete()
         if request is not None:
             await self._send_to_state_service(request)
 
     async def _collect_states_to_delete(self):
+        full_scan = self._last_full_scan is None or \
+            time.monotonic() - self._last_full_scan >= \
+            self._full_scan_interval
+        if full_scan:
+            logging.debug("Scanning all state for garbage")
+            self._last_full_scan = time.monotonic()
         states_to_delete = []
+        self._garbage_keys = []
         for redis_dict in self._redis_dicts:
-            for key in redis_dict.garbage_keys():
+            changed_keys = self._changed_keys.pop(redis_dict.redis_type, set())
+            if full_scan:
+                garbage_keys = redis_dict.garbage_keys()
+            elif changed_keys:
+                garbage_keys = redis_dict.garbage_keys(changed_keys)
+            else:
+                continue
+            for key in garbage_keys:
                 state_scope = redis_dict.state_scope
                 device_id = make_scoped_device_id(key, state_scope)
                 sid = StateID(deviceID=device_id, type=redis_dict.redis_type)
                 states_to_delete.append(sid)
+                self._garbage_keys.append((redis_dict, key))
         if len(states_to_delete) == 0:
             logging.debug("Not garbage collecting state. No state to delete!")
             return None
@@ -76,28 +119,35 @@ class GarbageCollector:
 
         except grpc.RpcError as err:
             logging.error("GRPC call failed for state deletion: %s", err)
+            # Check the states again on the next collection
+            for redis_dict, key in self._garbage_keys:
+                self.add_changed_keys(redis_dict.redis_type, [key])
         else:
-            for redis_dict in self._redis_dicts:
-                for key in redis_dict.garbage_keys():
-                    await self._delete_state_from_redis(redis_dict, key)
+            for redis_dict, key in self._garbage_keys:
+                await self._delete_state_from_redis(redis_dict, key)
+        self._garbage_keys = []
 
     async def _delete_state_from_redis(
         self,
         redis_dict: RedisFlatDict,
         key: str,
     ) -> None:
-        # Ensure that the object isn't updated before deletion
-        with redis_dict.lock(key):
+        # delete_garbage doesn't delete the object if it is updated
+        # concurrently, so no lock is needed
+        try:
             deleted = redis_dict.delete_garbage(key)
-            if deleted:
-                logging.debug(
-                    "Successfully garbage collected "
-                    "state for key: %s", key,
-                )
-            else:
-                logging.debug(
-                    "Successfully garbage collected "
-                    "state in cloud for key %s. "
-                    "Didn't delete locally as the "
-                    "object is no longer garbage", key,
-                )
+        except KeyError:
+            logging.debug("State for key %s was already deleted", key)
+            return
+        if deleted:
+            logging.debug(
+                "Successfully garbage collected "
+                "state for key: %s", key,
+            )
+        else:
+            logging.debug(
+                "Successfully garbage collected "
+                "state in cloud for key %s. "
+                "Didn't delete locally as the "
+                "object is no longer garbage", key,
+            )
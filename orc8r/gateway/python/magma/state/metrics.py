@@ -0,0 +1,29 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from prometheus_client import Counter
+
+STATE_KEYS_SCANNED = Counter(
+    'state_replication_keys_scanned',
+    'The number of state keys read from Redis for replication',
+    ['sync_type'],
+)
+
+STATE_KEYS_SHIPPED = Counter(
+    'state_replication_keys_shipped',
+    'The number of states sent to the Orchestrator',
+)
+
+STATE_FULL_SYNCS = Counter(
+    'state_replication_full_syncs',
+    'The number of replication iterations that scanned all state',
+)
@@ -22,8 +22,14 @@ from magma.common.grpc_client_manager import GRPCClientManager
 from magma.common.rpc_utils import grpc_async_wrapper
 from magma.common.sdwatchdog import SDWatchdogTask
 from magma.common.service import MagmaService
+from magma.state.change_feed import KeyspaceChangeFeed
 from magma.state.garbage_collector import GarbageCollector
 from magma.state.keys import make_mem_key, make_scoped_device_id
+from magma.state.metrics import (
+    STATE_FULL_SYNCS,
+    STATE_KEYS_SCANNED,
+    STATE_KEYS_SHIPPED,
+)
 from magma.state.redis_dicts import (
     PROTO_FORMAT,
     get_json_redis_dicts,
@@ -41,12 +47,22 @@ from orc8r.protos.state_pb2 import (
 DEFAULT_SYNC_INTERVAL = 60
 DEFAULT_GRPC_TIMEOUT = 10
 GARBAGE_COLLECTION_ITERATION_INTERVAL = 2
+DEFAULT_FULL_SYNC_ITERATION_INTERVAL = 10
+DEFAULT_CHANGE_FEED_POLL_INTERVAL = 1
 
 
 class StateReplicator(SDWatchdogTask):
     """
     StateReplicator periodically fetches all configured state from Redis,
     reporting any updates to the Orchestrator State service.
+
+    If keyspace notifications are enabled, only the keys reported as changed
+    since the last iteration are read. The notifications are drained every
+    change_feed_poll_interval seconds, so that they don't pile up in Redis
+    between iterations. All state is still scanned every
+    full_sync_iteration_interval iterations, and whenever notifications may
+    have been missed. If the subscription is lost, state is also resynced
+    with the Orchestrator before the next scan.
     """
 
     def __init__(
@@ -82,6 +98,42 @@ class StateReplicator(SDWatchdogTask):
         # collection
         self._replication_iteration = 0
 
+        # Change feed to only read the state keys that changed
+        self._change_feed = None
+        if service.config.get('use_keyspace_notifications', False) and \
+                self._redis_dicts:
+            self._change_feed = KeyspaceChangeFeed(
+                self._redis_dicts[0].redis,
+                [redis_dict.redis_type for redis_dict in self._redis_dicts],
+            )
+        self._full_sync_interval = service.config.get(
+            'full_sync_iteration_interval',
+            DEFAULT_FULL_SYNC_ITERATION_INTERVAL,
+        )
+        self._change_feed_poll_interval = service.config.get(
+            'change_feed_poll_interval',
+            DEFAULT_CHANGE_FEED_POLL_INTERVAL,
+        )
+        self._change_feed_poll_timer = None
+        self._iterations_since_full_sync = 0
+        self._feed_start_backoff = 0
+        self._is_full_sync_iteration = True
+        # (state type, device ID) => redis key of the states being reported,
+        # used to read failed states again on the next iteration
+        self._reported_keys = {}
+
+    def start(self) -> None:
+        super().start()
+        if self._change_feed is not None and \
+                self._change_feed_poll_timer is None:
+            self._schedule_change_feed_poll()
+
+    def stop(self) -> None:
+        if self._change_feed_poll_timer is not None:
+            self._change_feed_poll_timer.cancel()
+            self._change_feed_poll_timer = None
+        super().stop()
+
     async def _run(self):
         logging.debug("Check state")
         if not self._has_resync_completed:
@@ -108,8 +160,7 @@ class StateReplicator(SDWatchdogTask):
     async def _resync(self):
         states_to_sync = []
         for redis_dict in self._redis_dicts:
-            for key in redis_dict:
-                version = redis_dict.get_version(key)
+            for key, _, version in redis_dict.versioned_items():
                 device_id = make_scoped_device_id(key, redis_dict.state_scope)
                 state_id = StateID(
                     type=redis_dict.redis_type,
@@ -146,61 +197,169 @@ class StateReplicator(SDWatchdogTask):
         logging.info("Successfully resynced state with Orchestrator!")
 
     async def _collect_states_to_replicate(self):
+        self._is_full_sync_iteration = self._needs_full_sync()
+        self._reported_keys = {}
+        if self._is_full_sync_iteration:
+            states_to_report = self._collect_all_states()
+            STATE_FULL_SYNCS.inc()
+            self._iterations_since_full_sync = 0
+            if self._change_feed is not None:
+                # Changes drained so far were covered by the scan, but may
+                # still be garbage to collect
+                for redis_dict in self._redis_dicts:
+                    self._garbage_collector.add_changed_keys(
+                        redis_dict.redis_type,
+                        self._change_feed.pop_changed_keys(
+                            redis_dict.redis_type,
+                        ),
+                    )
+        else:
+            states_to_report = self._collect_changed_states()
+            self._iterations_since_full_sync += 1
+
+        if len(states_to_report) == 0:
+            logging.debug("Not replicating state. No state has changed!")
+            return None
+        STATE_KEYS_SHIPPED.inc(len(states_to_report))
+        return ReportStatesRequest(states=states_to_report)
+
+    def _needs_full_sync(self) -> bool:
+        if self._change_feed is None:
+            # Garbage can only be found by scanning all state
+            self._garbage_collector.request_full_scan()
+            return True
+        if self._poll_change_feed():
+            return self._iterations_since_full_sync >= \
+                self._full_sync_interval
+        # Changes may have been missed. Subscribe again before scanning, so
+        # that changes made during the scan are read on the next iteration.
+        self._garbage_collector.request_full_scan()
+        if self._feed_start_backoff > 0:
+            self._feed_start_backoff -= 1
+        elif not self._change_feed.start():
+            self._feed_start_backoff = self._full_sync_interval
+        return True
+
+    def _schedule_change_feed_poll(self):
+        self._change_feed_poll_timer = self._loop.call_later(
+            self._change_feed_poll_interval, self._poll_change_feed_periodic,
+        )
+
+    def _poll_change_feed_periodic(self):
+        self._poll_change_feed()
+        self._schedule_change_feed_poll()
+
+    def _poll_change_feed(self) -> bool:
+        """
+        Drain the pending keyspace notifications into the change feed.
+        Returns False if changes may have been missed.
+        """
+        was_running = self._change_feed.is_running
+        if self._change_feed.poll():
+            return True
+        if was_running:
+            logging.warning(
+                "Keyspace subscription lost, resyncing all state",
+            )
+            self._has_resync_completed = False
+        return False
+
+    def _collect_all_states(self):
         states_to_report = []
         for redis_dict in self._redis_dicts:
-            for key in redis_dict:
-                redis_state = redis_dict.get(key)
-                device_id = make_scoped_device_id(key, redis_dict.state_scope)
-
-                in_mem_key = make_mem_key(device_id, redis_dict.redis_type)
-                if redis_state is None:
-                    logging.debug(
-                        "Content of key %s is empty, skipping", in_mem_key,
-                    )
-                    continue
+            num_scanned = 0
+            for key, redis_state, redis_version in \
+                    redis_dict.versioned_items():
+                num_scanned += 1
+                state_proto = self._get_state_to_report(
+                    redis_dict, key, redis_state, redis_version,
+                )
+                if state_proto is not None:
+                    states_to_report.append(state_proto)
+            STATE_KEYS_SCANNED.labels(sync_type='full').inc(num_scanned)
+        return states_to_report
 
-                redis_version = redis_dict.get_version(key)
-                self._state_keys_from_current_iteration.add(in_mem_key)
-                if in_mem_key in self._state_versions and \
-                        self._state_versions[in_mem_key] == redis_version:
-                    logging.debug(
-                        "key %s already read on this iteration, skipping", in_mem_key,
+    def _collect_changed_states(self):
+        states_to_report = []
+        for redis_dict in self._redis_dicts:
+            changed_keys = self._change_feed.pop_changed_keys(
+                redis_dict.redis_type,
+            )
+            if not changed_keys:
+                continue
+            STATE_KEYS_SCANNED.labels(sync_type='changed').inc(
+                len(changed_keys),
+            )
+            self._garbage_collector.add_changed_keys(
+                redis_dict.redis_type, changed_keys,
+            )
+            versioned_states = redis_dict.get_many_with_version(changed_keys)
+            for key in changed_keys:
+                if key not in versioned_states:
+                    # Deleted or garbage, stop tracking its version
+                    device_id = make_scoped_device_id(
+                        key, redis_dict.state_scope,
                     )
+                    in_mem_key = make_mem_key(device_id, redis_dict.redis_type)
+                    self._state_versions.pop(in_mem_key, None)
                     continue
+                redis_state, redis_version = versioned_states[key]
+                state_proto = self._get_state_to_report(
+                    redis_dict, key, redis_state, redis_version,
+                )
+                if state_proto is not None:
+                    states_to_report.append(state_proto)
+        return states_to_report
 
-                try:
-                    if redis_dict.state_format == PROTO_FORMAT:
-                        state_to_serialize = MessageToDict(redis_state)
-                        serialized_json_state = json.dumps(state_to_serialize)
-                    else:
-                        serialized_json_state = jsonpickle.encode(redis_state)
-                except Exception as e:  # pylint: disable=broad-except
-                    logging.error(
-                        "Found bad state for %s for %s, not "
-                        "replicating this state: %s",
-                        key, device_id, e,
-                    )
-                    continue
+    def _get_state_to_report(
+        self, redis_dict, key, redis_state, redis_version,
+    ):
+        device_id = make_scoped_device_id(key, redis_dict.state_scope)
 
-                state_proto = State(
-                    type=redis_dict.redis_type,
-                    deviceID=device_id,
-                    value=serialized_json_state.encode(
-                        "utf-8",
-                    ),
-                    version=redis_version,
-                )
+        in_mem_key = make_mem_key(device_id, redis_dict.redis_type)
+        if redis_state is None:
+            logging.debug(
+                "Content of key %s is empty, skipping", in_mem_key,
+            )
+            return None
 
-                logging.debug(
-                    "key with version, %s contains: %s", in_mem_key,
-                    serialized_json_state,
-                )
-                states_to_report.append(state_proto)
+        self._state_keys_from_current_iteration.add(in_mem_key)
+        if in_mem_key in self._state_versions and \
+                self._state_versions[in_mem_key] == redis_version:
+            logging.debug(
+                "key %s already read on this iteration, skipping", in_mem_key,
+            )
+            return None
 
-        if len(states_to_report) == 0:
-            logging.debug("Not replicating state. No state has changed!")
+        try:
+            if redis_dict.state_format == PROTO_FORMAT:
+                state_to_serialize = MessageToDict(redis_state)
+                serialized_json_state = json.dumps(state_to_serialize)
+            else:
+                serialized_json_state = jsonpickle.encode(redis_state)
+        except Exception as e:  # pylint: disable=broad-except
+            logging.error(
+                "Found bad state for %s for %s, not "
+                "replicating this state: %s",
+                key, device_id, e,
+            )
             return None
-        return ReportStatesRequest(states=states_to_report)
+
+        state_proto = State(
+            type=redis_dict.redis_type,
+            deviceID=device_id,
+            value=serialized_json_state.encode(
+                "utf-8",
+            ),
+            version=redis_version,
+        )
+
+        logging.debug(
+            "key with version, %s contains: %s", in_mem_key,
+            serialized_json_state,
+        )
+        self._reported_keys[(state_proto.type, device_id)] = key
+        return state_proto
 
     async def _send_to_state_service(self, request: ReportStatesRequest):
         state_client = self._grpc_client_manager.get_client()
@@ -215,6 +374,8 @@ class StateReplicator(SDWatchdogTask):
 
         except grpc.RpcError as err:
             logging.error("GRPC call failed for state replication: %s", err)
+            for state in request.states:
+                self._mark_changed(state.type, state.deviceID)
         else:
             unreplicated_states = set()
             for idAndError in response.unreportedStates:
@@ -223,6 +384,7 @@ class StateReplicator(SDWatchdogTask):
                     idAndError.type, idAndError.deviceID, idAndError.error,
                 )
                 unreplicated_states.add((idAndError.type, idAndError.deviceID))
+                self._mark_changed(idAndError.type, idAndError.deviceID)
             # Update in-memory map for successfully reported states
             for state in request.states:
                 if (state.type, state.deviceID) in unreplicated_states:
@@ -241,7 +403,17 @@ class StateReplicator(SDWatchdogTask):
             # reset timeout to config-specified + some buffer
             self.set_timeout(self._interval * 2)
 
+    def _mark_changed(self, state_type: str, device_id: str):
+        """ Read a state that failed to replicate again next iteration """
+        key = self._reported_keys.get((state_type, device_id))
+        if self._change_feed is not None and key is not None:
+            self._change_feed.mark_changed(state_type, key)
+
     async def _cleanup_deleted_keys(self):
+        if not self._is_full_sync_iteration:
+            # Deleted keys were already dropped from the changed keys
+            self._state_keys_from_current_iteration = set()
+            return
         deleted_keys = set(self._state_versions) - \
             self._state_keys_from_current_iteration
         for key in deleted_keys:
@@ -0,0 +1,75 @@
+"""
+Copyright 2020 The Magma Authors.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree.
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import fakeredis
+import redis
+from magma.state.change_feed import KeyspaceChangeFeed
+
+FOO_TYPE = 'foo'
+BAR_TYPE = 'bar'
+
+
+class KeyspaceChangeFeedTests(TestCase):
+    def setUp(self):
+        self.mock_redis = fakeredis.FakeStrictRedis()
+        self.mock_redis.config_get = MagicMock(
+            return_value={'notify-keyspace-events': 'Ex'},
+        )
+        self.mock_redis.config_set = MagicMock()
+        self.feed = KeyspaceChangeFeed(self.mock_redis, [FOO_TYPE, BAR_TYPE])
+
+    def tearDown(self):
+        self.feed.stop()
+
+    def test_changed_keys(self):
+        self.assertFalse(self.feed.poll())
+        self.assertTrue(self.feed.start())
+        self.mock_redis.config_set.assert_called_once_with(
+            'notify-keyspace-events', 'ExK$g',
+        )
+
+        self.mock_redis.set('id1:' + FOO_TYPE, 'a')
+        self.mock_redis.set('id2:' + FOO_TYPE, 'b')
+        self.mock_redis.delete('id1:' + BAR_TYPE)
+        self.mock_redis.set('id1:' + BAR_TYPE, 'c')
+        self.mock_redis.set('id1:other', 'd')
+
+        self.assertTrue(self.feed.poll())
+        self.assertEqual({'id1', 'id2'}, self.feed.pop_changed_keys(FOO_TYPE))
+        self.assertEqual({'id1'}, self.feed.pop_changed_keys(BAR_TYPE))
+        self.assertEqual(set(), self.feed.pop_changed_keys(FOO_TYPE))
+        self.assertEqual(set(), self.feed.pop_changed_keys('other'))
+
+        self.mock_redis.delete('id2:' + FOO_TYPE)
+        self.feed.mark_changed(BAR_TYPE, 'id3')
+        self.assertTrue(self.feed.poll())
+        self.assertEqual({'id2'}, self.feed.pop_changed_keys(FOO_TYPE))
+        self.assertEqual({'id3'}, self.feed.pop_changed_keys(BAR_TYPE))
+
+    def test_all_events_enabled(self):
+        self.mock_redis.config_get.return_value = {
+            'notify-keyspace-events': 'AE',
+        }
+        self.assertTrue(self.feed.start())
+        self.mock_redis.config_set.assert_called_once_with(
+            'notify-keyspace-events', 'AEK',
+        )
+
+    def test_notifications_unavailable(self):
+        self.mock_redis.config_get.side_effect = \
+            redis.exceptions.ResponseError("unknown command 'config'")
+        self.assertFalse(self.feed.start())
+        self.assertFalse(self.feed.is_running)
+        self.assertFalse(self.feed.poll())
@@ -27,7 +27,10 @@ from magma.common.redis.serializers import (
     get_proto_deserializer,
     get_proto_serializer,
 )
-from magma.state.garbage_collector import GarbageCollector
+from magma.state.garbage_collector import (
+    DEFAULT_FULL_SCAN_INTERVAL,
+    GarbageCollector,
+)
 from orc8r.protos.common_pb2 import NetworkID, Void
 from orc8r.protos.service303_pb2 import LogVerbosity
 from orc8r.protos.state_pb2_grpc import StateServiceStub
@@ -160,6 +163,12 @@ class GarbageCollectorTests(TestCase):
 
             self.nid_client.mark_as_garbage(key)
             self.foo_client.mark_as_garbage(key)
+            # Only the changed keys are read after the first full scan
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertIsNone(req)
+
+            self.garbage_collector.add_changed_keys(NID_TYPE, [key])
+            self.garbage_collector.add_changed_keys(FOO_TYPE, [key, 'id2'])
             req = await self.garbage_collector._collect_states_to_delete()
             self.assertEqual(2, len(req.ids))
             for state_id in req.ids:
@@ -176,6 +185,41 @@ class GarbageCollectorTests(TestCase):
 
         self.loop.run_until_complete(test())
 
+    @mock.patch('snowflake.snowflake', get_mock_snowflake)
+    @mock.patch('magma.state.garbage_collector.time.monotonic')
+    def test_full_scan_fallback(self, monotonic_mock):
+        async def test():
+            self.nid_client.clear()
+            self.foo_client.clear()
+            self.log_client.clear()
+
+            monotonic_mock.return_value = 1000
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertIsNone(req)
+
+            key = 'id1'
+            self.nid_client[key] = NetworkID(id='foo')
+            self.nid_client.mark_as_garbage(key)
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertIsNone(req)
+
+            # Changes may have been missed
+            self.garbage_collector.request_full_scan()
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertEqual(1, len(req.ids))
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertIsNone(req)
+
+            # Periodic full scan
+            monotonic_mock.return_value = 1000 + DEFAULT_FULL_SCAN_INTERVAL
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertEqual(1, len(req.ids))
+
+            # Cleanup
+            del self.nid_client[key]
+
+        self.loop.run_until_complete(test())
+
     @mock.patch('snowflake.snowflake', get_mock_snowflake)
     @mock.patch('magma.magmad.state_reporter.ServiceRegistry.get_rpc_channel')
     def test_garbage_collect_success(self, get_rpc_mock):
@@ -228,6 +272,10 @@ class GarbageCollectorTests(TestCase):
             self.assertEqual(1, len(self.nid_client.garbage_keys()))
             self.assertEqual(1, len(self.log_client.garbage_keys()))
 
+            # Ensure the states are collected again on the next collection
+            req = await self.garbage_collector._collect_states_to_delete()
+            self.assertEqual(2, len(req.ids))
+
             # Cleanup
             del self.log_client[key]
             del self.nid_client[key]
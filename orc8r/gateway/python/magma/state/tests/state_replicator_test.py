@@ -19,6 +19,7 @@ from unittest.mock import MagicMock
 import fakeredis
 import grpc
 import jsonpickle
+import redis
 import orc8r.protos.state_pb2_grpc as state_pb2_grpc
 from google.protobuf.json_format import MessageToDict
 from magma.common.grpc_client_manager import GRPCClientManager
@@ -30,6 +31,7 @@ from magma.common.redis.serializers import (
     get_proto_deserializer,
     get_proto_serializer,
 )
+from magma.state.change_feed import KeyspaceChangeFeed
 from magma.state.garbage_collector import GarbageCollector
 from magma.state.keys import make_mem_key
 from magma.state.state_replicator import StateReplicator
@@ -476,3 +478,125 @@ class StateReplicatorTests(TestCase):
         # Cancel the replicator's loop so there are no other activities
         self.state_replicator._periodic_task.cancel()
         self.loop.run_until_complete(test())
+
+    @mock.patch('snowflake.snowflake', get_mock_snowflake)
+    @mock.patch('magma.magmad.state_reporter.ServiceRegistry.get_rpc_channel')
+    def test_replicate_changed_states(self, get_grpc_mock):
+        async def test():
+            get_grpc_mock.return_value = self.channel
+            self.nid_client.clear()
+            self.idlist_client.clear()
+            self.log_client.clear()
+            self.foo_client.clear()
+
+            self.mock_redis.config_get = MagicMock(
+                return_value={'notify-keyspace-events': ''},
+            )
+            self.mock_redis.config_set = MagicMock()
+            self.state_replicator._change_feed = KeyspaceChangeFeed(
+                self.mock_redis,
+                [NID_TYPE, IDList_TYPE, LOG_TYPE, FOO_TYPE],
+            )
+
+            key = 'id1'
+            key2 = 'id2'
+            self.nid_client[key] = NetworkID(id='foo')
+            self.foo_client[key] = Foo("boo", 3)
+
+            # First iteration scans all state
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertTrue(self.state_replicator._is_full_sync_iteration)
+            self.assertEqual(2, len(req.states))
+            await self.state_replicator._send_to_state_service(req)
+
+            # Only the changed keys are read afterwards
+            self.nid_client[key2] = NetworkID(id='bar')
+            self.log_client[key2] = LogVerbosity(verbosity=5)
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertFalse(self.state_replicator._is_full_sync_iteration)
+            self.assertEqual(
+                {(NID_TYPE, 'id2'), (LOG_TYPE, 'aaa-bbb:id2')},
+                {(state.type, state.deviceID) for state in req.states},
+            )
+            await self.state_replicator._send_to_state_service(req)
+
+            # LOG_TYPE states fail to replicate, so they are read again
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertFalse(self.state_replicator._is_full_sync_iteration)
+            self.assertEqual(1, len(req.states))
+            self.assertEqual(LOG_TYPE, req.states[0].type)
+
+            # Deleted keys are dropped from the in-memory map
+            del self.nid_client[key]
+            self.log_client.clear()
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertIsNone(req)
+            self.assertNotIn(
+                make_mem_key(key, NID_TYPE),
+                self.state_replicator._state_versions,
+            )
+
+        # Cancel the replicator's loop so there are no other activities
+        self.state_replicator._periodic_task.cancel()
+        self.loop.run_until_complete(test())
+
+    @mock.patch('snowflake.snowflake', get_mock_snowflake)
+    @mock.patch('magma.magmad.state_reporter.ServiceRegistry.get_rpc_channel')
+    def test_change_feed_drained_and_lost(self, get_grpc_mock):
+        async def test():
+            get_grpc_mock.return_value = self.channel
+            self.nid_client.clear()
+            self.idlist_client.clear()
+            self.log_client.clear()
+            self.foo_client.clear()
+
+            self.mock_redis.config_get = MagicMock(
+                return_value={'notify-keyspace-events': ''},
+            )
+            self.mock_redis.config_set = MagicMock()
+            change_feed = KeyspaceChangeFeed(
+                self.mock_redis,
+                [NID_TYPE, IDList_TYPE, LOG_TYPE, FOO_TYPE],
+            )
+            self.state_replicator._change_feed = change_feed
+            garbage_collector = self.state_replicator._garbage_collector
+
+            key = 'id1'
+            self.nid_client[key] = NetworkID(id='foo')
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertTrue(self.state_replicator._is_full_sync_iteration)
+            await self.state_replicator._send_to_state_service(req)
+            await garbage_collector.run_garbage_collection()
+
+            # Notifications are drained between iterations
+            self.nid_client.mark_as_garbage(key)
+            self.state_replicator._poll_change_feed_periodic()
+            self.assertIsNotNone(self.state_replicator._change_feed_poll_timer)
+            self.assertEqual({key}, change_feed.pop_changed_keys(NID_TYPE))
+            change_feed.mark_changed(NID_TYPE, key)
+
+            # Changed keys are checked for garbage without a full scan
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertFalse(self.state_replicator._is_full_sync_iteration)
+            self.assertIsNone(req)
+            with mock.patch.object(
+                RedisFlatDict, '_scan_composite_keys',
+                side_effect=AssertionError("Unexpected full scan"),
+            ):
+                req = await garbage_collector._collect_states_to_delete()
+            self.assertEqual(1, len(req.ids))
+
+            # A lost subscription forces a resync and full scans
+            change_feed._pubsub.get_message = MagicMock(
+                side_effect=redis.exceptions.ConnectionError(),
+            )
+            self.state_replicator._poll_change_feed_periodic()
+            self.assertFalse(self.state_replicator._has_resync_completed)
+            req = await self.state_replicator._collect_states_to_replicate()
+            self.assertTrue(self.state_replicator._is_full_sync_iteration)
+            self.assertTrue(change_feed.is_running)
+            self.assertIsNone(garbage_collector._last_full_scan)
+
+        # Cancel the replicator's loop so there are no other activities
+        self.state_replicator._periodic_task.cancel()
+        self.loop.run_until_complete(test())
@@ -462,6 +462,45 @@ func (m *UpdateRecordRequest) GetFields() map[string]string {
 	return nil
 }
 
+type UpdateRecordsRequest struct {
+	Records              []*UpdateRecordRequest `protobuf:"bytes,1,rep,name=records,proto3" json:"records,omitempty"`
+	XXX_NoUnkeyedLiteral struct{}               `json:"-"`
+	XXX_unrecognized     []byte                 `json:"-"`
+	XXX_sizecache        int32                  `json:"-"`
+}
+
+func (m *UpdateRecordsRequest) Reset()         { *m = UpdateRecordsRequest{} }
+func (m *UpdateRecordsRequest) String() string { return proto.CompactTextString(m) }
+func (*UpdateRecordsRequest) ProtoMessage()    {}
+func (*UpdateRecordsRequest) Descriptor() ([]byte, []int) {
+	return fileDescriptor_f02336ef077163fd, []int{10}
+}
+
+func (m *UpdateRecordsRequest) XXX_Unmarshal(b []byte) error {
+	return xxx_messageInfo_UpdateRecordsRequest.Unmarshal(m, b)
+}
+func (m *UpdateRecordsRequest) XXX_Marshal(b []byte, deterministic bool) ([]byte, error) {
+	return xxx_messageInfo_UpdateRecordsRequest.Marshal(b, m, deterministic)
+}
+func (m *UpdateRecordsRequest) XXX_Merge(src proto.Message) {
+	xxx_messageInfo_UpdateRecordsRequest.Merge(m, src)
+}
+func (m *UpdateRecordsRequest) XXX_Size() int {
+	return xxx_messageInfo_UpdateRecordsRequest.Size(m)
+}
+func (m *UpdateRecordsRequest) XXX_DiscardUnknown() {
+	xxx_messageInfo_UpdateRecordsRequest.DiscardUnknown(m)
+}
+
+var xxx_messageInfo_UpdateRecordsRequest proto.InternalMessageInfo
+
+func (m *UpdateRecordsRequest) GetRecords() []*UpdateRecordRequest {
+	if m != nil {
+		return m.Records
+	}
+	return nil
+}
+
 type DirectoryField struct {
 	Key                  string   `protobuf:"bytes,1,opt,name=key,proto3" json:"key,omitempty"`
 	Value                string   `protobuf:"bytes,2,opt,name=value,proto3" json:"value,omitempty"`
@@ -474,7 +513,7 @@ func (m *DirectoryField) Reset()         { *m = DirectoryField{} }
 func (m *DirectoryField) String() string { return proto.CompactTextString(m) }
 func (*DirectoryField) ProtoMessage()    {}
 func (*DirectoryField) Descriptor() ([]byte, []int) {
-	return fileDescriptor_f02336ef077163fd, []int{10}
+	return fileDescriptor_f02336ef077163fd, []int{11}
 }
 
 func (m *DirectoryField) XXX_Unmarshal(b []byte) error {
@@ -520,7 +559,7 @@ func (m *DeleteRecordRequest) Reset()         { *m = DeleteRecordRequest{} }
 func (m *DeleteRecordRequest) String() string { return proto.CompactTextString(m) }
 func (*DeleteRecordRequest) ProtoMessage()    {}
 func (*DeleteRecordRequest) Descriptor() ([]byte, []int) {
-	return fileDescriptor_f02336ef077163fd, []int{11}
+	return fileDescriptor_f02336ef077163fd, []int{12}
 }
 
 func (m *DeleteRecordRequest) XXX_Unmarshal(b []byte) error {
@@ -560,7 +599,7 @@ func (m *GetDirectoryFieldRequest) Reset()         { *m = GetDirectoryFieldReque
 func (m *GetDirectoryFieldRequest) String() string { return proto.CompactTextString(m) }
 func (*GetDirectoryFieldRequest) ProtoMessage()    {}
 func (*GetDirectoryFieldRequest) Descriptor() ([]byte, []int) {
-	return fileDescriptor_f02336ef077163fd, []int{12}
+	return fileDescriptor_f02336ef077163fd, []int{13}
 }
 
 func (m *GetDirectoryFieldRequest) XXX_Unmarshal(b []byte) error {
@@ -608,7 +647,7 @@ func (m *DirectoryRecord) Reset()         { *m = DirectoryRecord{} }
 func (m *DirectoryRecord) String() string { return proto.CompactTextString(m) }
 func (*DirectoryRecord) ProtoMessage()    {}
 func (*DirectoryRecord) Descriptor() ([]byte, []int) {
-	return fileDescriptor_f02336ef077163fd, []int{13}
+	return fileDescriptor_f02336ef077163fd, []int{14}
 }
 
 func (m *DirectoryRecord) XXX_Unmarshal(b []byte) error {
@@ -661,7 +700,7 @@ func (m *AllDirectoryRecords) Reset()         { *m = AllDirectoryRecords{} }
 func (m *AllDirectoryRecords) String() string { return proto.CompactTextString(m) }
 func (*AllDirectoryRecords) ProtoMessage()    {}
 func (*AllDirectoryRecords) Descriptor() ([]byte, []int) {
-	return fileDescriptor_f02336ef077163fd, []int{14}
+	return fileDescriptor_f02336ef077163fd, []int{15}
 }
 
 func (m *AllDirectoryRecords) XXX_Unmarshal(b []byte) error {
@@ -704,6 +743,7 @@ func init() {
 	proto.RegisterMapType((map[string]string)(nil), "magma.orc8r.MapSgwCTeidToHWIDRequest.TeidToHwidEntry")
 	proto.RegisterType((*UpdateRecordRequest)(nil), "magma.orc8r.UpdateRecordRequest")
 	proto.RegisterMapType((map[string]string)(nil), "magma.orc8r.UpdateRecordRequest.FieldsEntry")
+	proto.RegisterType((*UpdateRecordsRequest)(nil), "magma.orc8r.UpdateRecordsRequest")
 	proto.RegisterType((*DirectoryField)(nil), "magma.orc8r.DirectoryField")
 	proto.RegisterType((*DeleteRecordRequest)(nil), "magma.orc8r.DeleteRecordRequest")
 	proto.RegisterType((*GetDirectoryFieldRequest)(nil), "magma.orc8r.GetDirectoryFieldRequest")
@@ -715,58 +755,60 @@ func init() {
 func init() { proto.RegisterFile("orc8r/protos/directoryd.proto", fileDescriptor_f02336ef077163fd) }
 
 var fileDescriptor_f02336ef077163fd = []byte{
-	// 808 bytes of a gzipped FileDescriptorProto
-	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0xac, 0x56, 0xdf, 0x6f, 0x12, 0x4b,
-	0x14, 0x66, 0x29, 0xb7, 0xf7, 0x72, 0xda, 0x94, 0x76, 0x68, 0xae, 0xb0, 0xd4, 0xa4, 0xd9, 0xa4,
-	0x8a, 0x89, 0x59, 0xb4, 0x46, 0x43, 0x35, 0x26, 0xb6, 0xd2, 0x02, 0x51, 0x62, 0x04, 0x6a, 0xd5,
-	0x97, 0x66, 0xcb, 0x8e, 0x74, 0x2d, 0xec, 0xe0, 0xce, 0xb6, 0x84, 0xff, 0xce, 0xf8, 0xa4, 0x2f,
-	0xbe, 0xf8, 0x2f, 0xf8, 0x87, 0x98, 0x9d, 0x99, 0x5d, 0xf6, 0xc7, 0x50, 0x68, 0xe2, 0x13, 0x33,
-	0x67, 0xbe, 0xf3, 0xcd, 0x39, 0x1f, 0x33, 0xdf, 0x2c, 0xdc, 0x26, 0x4e, 0xaf, 0xea, 0x54, 0x46,
-	0x0e, 0x71, 0x09, 0xad, 0x98, 0x96, 0x83, 0x7b, 0x2e, 0x71, 0x26, 0xa6, 0xce, 0x22, 0x68, 0x65,
-	0x68, 0xf4, 0x87, 0x86, 0xce, 0x40, 0x6a, 0x31, 0x82, 0xed, 0x91, 0xe1, 0x90, 0xd8, 0x1c, 0xa7,
-	0x55, 0xa0, 0x58, 0xc7, 0x6e, 0x83, 0x50, 0xd7, 0x36, 0x86, 0xf8, 0x88, 0x38, 0x8d, 0x93, 0x66,
-	0xad, 0x8d, 0xbf, 0x5c, 0x62, 0xea, 0x22, 0x04, 0x99, 0xf3, 0xb1, 0x65, 0x16, 0x94, 0x6d, 0xa5,
-	0x9c, 0x6d, 0xb3, 0xb1, 0x56, 0x05, 0x55, 0x96, 0x40, 0x47, 0xc4, 0xa6, 0x18, 0xa9, 0xf0, 0xdf,
-	0xb9, 0x58, 0x12, 0x59, 0xc1, 0x5c, 0xfb, 0xaa, 0x40, 0xa1, 0x65, 0x8c, 0x3c, 0x7c, 0x97, 0xf8,
-	0x04, 0xfe, 0x56, 0x06, 0xac, 0x79, 0xf4, 0xd3, 0x85, 0x82, 0xb2, 0xbd, 0x54, 0x5e, 0xd9, 0xdd,
-	0xd3, 0x43, 0x8d, 0xe8, 0xb3, 0xd2, 0xf5, 0x46, 0x24, 0xf7, 0xd0, 0x76, 0x9d, 0x49, 0x3b, 0x46,
-	0xa8, 0xee, 0x43, 0x5e, 0x02, 0x43, 0xeb, 0xb0, 0x74, 0x81, 0x27, 0xa2, 0x5a, 0x6f, 0x88, 0x36,
-	0xe1, 0x9f, 0x2b, 0x63, 0x70, 0x89, 0x0b, 0x69, 0x16, 0xe3, 0x93, 0xa7, 0xe9, 0xaa, 0xa2, 0xbd,
-	0x67, 0xcd, 0x37, 0x5b, 0x9d, 0xe6, 0x11, 0x71, 0x3a, 0x98, 0x52, 0x8b, 0xd8, 0x53, 0xb9, 0xb6,
-	0x20, 0x6b, 0x63, 0x77, 0x4c, 0x9c, 0x8b, 0x66, 0x4d, 0xf0, 0x4d, 0x03, 0xde, 0x2a, 0xf5, 0x33,
-	0x04, 0xf3, 0x34, 0xa0, 0x3d, 0x84, 0x92, 0x94, 0x59, 0xe8, 0x8a, 0x20, 0x63, 0x0d, 0xa9, 0xe5,
-	0xff, 0x13, 0xde, 0x58, 0xfb, 0xad, 0x40, 0xb1, 0x65, 0x8c, 0x02, 0x70, 0x97, 0x78, 0xe9, 0x8b,
-	0x15, 0x83, 0x21, 0x47, 0xa3, 0x79, 0x85, 0x34, 0xd3, 0xfb, 0x59, 0x5c, 0x6f, 0x39, 0xbd, 0x1e,
-	0x0b, 0x73, 0xc5, 0xe3, 0x9c, 0xea, 0x01, 0x6c, 0xca, 0x80, 0x37, 0xd2, 0xbc, 0xc5, 0x4f, 0xe8,
-	0x49, 0xb3, 0xe6, 0x29, 0xd3, 0x1f, 0xbf, 0xec, 0x62, 0xcb, 0x5c, 0xac, 0x4b, 0x04, 0x19, 0x17,
-	0x5b, 0xa6, 0xe0, 0x64, 0x63, 0xed, 0x01, 0x3f, 0xbf, 0x71, 0xba, 0xa9, 0xce, 0x89, 0x13, 0xff,
-	0x93, 0x9f, 0x5b, 0x1f, 0xdb, 0x25, 0xe1, 0x2b, 0x72, 0x7d, 0x01, 0xc7, 0x00, 0x2e, 0x4f, 0x19,
-	0xb3, 0x32, 0x3c, 0x85, 0x1f, 0x27, 0x14, 0x96, 0x11, 0xeb, 0xdd, 0x20, 0x8f, 0x6b, 0x1b, 0x22,
-	0x52, 0x9f, 0x43, 0x2e, 0xb6, 0x7c, 0x23, 0x45, 0xbf, 0x29, 0x90, 0x3f, 0x1e, 0x99, 0x86, 0x8b,
-	0xdb, 0xb8, 0x47, 0x9c, 0x40, 0xcc, 0x35, 0x48, 0x07, 0xad, 0xa7, 0x2d, 0xd3, 0xbb, 0xcc, 0x03,
-	0xd2, 0x33, 0x5c, 0x8b, 0xd8, 0x82, 0x24, 0x98, 0xa3, 0x1a, 0x2c, 0x7f, 0xb2, 0xf0, 0xc0, 0xa4,
-	0x85, 0x25, 0xd6, 0xd5, 0xfd, 0x48, 0x57, 0x12, 0x76, 0xfd, 0x88, 0xc1, 0x79, 0x33, 0x22, 0x57,
-	0xdd, 0x83, 0x95, 0x50, 0xf8, 0x46, 0x4d, 0x54, 0x61, 0xad, 0xe6, 0x9b, 0x1e, 0xe3, 0x58, 0x34,
-	0x5b, 0xdb, 0x81, 0x7c, 0x0d, 0x0f, 0xf0, 0x9c, 0xee, 0xb5, 0x3a, 0x14, 0xea, 0xd8, 0x8d, 0xee,
-	0x31, 0x4b, 0xa9, 0x12, 0x64, 0x59, 0x47, 0xa7, 0x5e, 0x01, 0x42, 0x2a, 0x16, 0x78, 0x85, 0x27,
-	0xda, 0x0f, 0x05, 0x72, 0x01, 0x0d, 0xdf, 0x33, 0x41, 0x70, 0x0f, 0xd6, 0x7d, 0x69, 0x4f, 0xcf,
-	0x2d, 0xea, 0x21, 0xd9, 0x71, 0xc9, 0xb6, 0x73, 0x7e, 0xbc, 0xc1, 0xc3, 0xe8, 0x45, 0x4c, 0xf9,
-	0x72, 0x44, 0xf9, 0xd8, 0x46, 0x7f, 0x5b, 0xf5, 0x16, 0xe4, 0xf7, 0x07, 0x83, 0xd8, 0x26, 0x14,
-	0x3d, 0x81, 0x7f, 0x1d, 0x3e, 0x14, 0xb6, 0xbd, 0x75, 0x5d, 0x51, 0x6d, 0x1f, 0xbc, 0xfb, 0x3d,
-	0x13, 0x92, 0xe6, 0x35, 0x21, 0x17, 0x97, 0x23, 0xd4, 0x07, 0x94, 0x7c, 0x60, 0xd0, 0x9d, 0x08,
-	0xe1, 0xcc, 0x27, 0x4b, 0xbd, 0x3b, 0x17, 0xc7, 0x6f, 0xba, 0x96, 0x42, 0x6f, 0x21, 0x2f, 0xde,
-	0x13, 0x3a, 0x7d, 0x13, 0x28, 0xda, 0x59, 0xe8, 0xc5, 0x51, 0x37, 0x22, 0xb0, 0x77, 0xc4, 0x32,
-	0xb5, 0x14, 0xfa, 0x0c, 0x79, 0x89, 0x8b, 0xa3, 0x44, 0x51, 0x33, 0x5e, 0x10, 0xb5, 0x3c, 0x1f,
-	0x18, 0x94, 0xdf, 0x81, 0xcd, 0xb0, 0x3d, 0x53, 0xee, 0xaf, 0x34, 0xa6, 0xd4, 0x4c, 0x07, 0x97,
-	0x37, 0x20, 0xc4, 0x8f, 0xba, 0xa3, 0x44, 0x7c, 0xa9, 0x1b, 0x4b, 0xc4, 0x97, 0xdb, 0xac, 0x96,
-	0x42, 0x6f, 0x60, 0x23, 0x61, 0x7d, 0x49, 0xe9, 0xa5, 0xd6, 0x28, 0xad, 0x7c, 0xf7, 0x57, 0x1a,
-	0x6e, 0xd5, 0x0d, 0x17, 0x8f, 0x8d, 0x49, 0x70, 0xa2, 0x3a, 0xd8, 0xb9, 0xb2, 0x7a, 0x18, 0x1d,
-	0xc2, 0x6a, 0xd8, 0x91, 0xd0, 0xf6, 0x3c, 0xb3, 0x92, 0x8b, 0x73, 0x08, 0xab, 0x61, 0xe3, 0x88,
-	0xd1, 0x48, 0x3c, 0x45, 0x4e, 0xf3, 0x01, 0x36, 0x12, 0xc6, 0x12, 0x6b, 0x7d, 0x96, 0xf1, 0xa8,
-	0x25, 0xf9, 0xbd, 0x62, 0x18, 0xa6, 0xea, 0xff, 0x75, 0xec, 0xca, 0x6e, 0x68, 0xb2, 0x12, 0x35,
-	0x5a, 0xbe, 0x24, 0x49, 0x4b, 0x1d, 0x94, 0x3e, 0x16, 0x19, 0xa8, 0xc2, 0xbf, 0x20, 0x07, 0xd6,
-	0x59, 0xa5, 0x4f, 0xc4, 0x87, 0xe4, 0xd9, 0x32, 0xfb, 0x7d, 0xf4, 0x27, 0x00, 0x00, 0xff, 0xff,
-	0x65, 0x94, 0x11, 0x9c, 0x8b, 0x0a, 0x00, 0x00,
+	// 841 bytes of a gzipped FileDescriptorProto
+	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0xac, 0x56, 0xdd, 0x6e, 0xda, 0x48,
+	0x14, 0xc6, 0xc0, 0x66, 0x97, 0x93, 0x6c, 0x48, 0x06, 0xb4, 0x0b, 0x26, 0x2b, 0x65, 0x47, 0xca,
+	0x2e, 0x95, 0x2a, 0xd3, 0xa6, 0x6a, 0x45, 0x52, 0x55, 0x6a, 0x52, 0x12, 0x40, 0x2d, 0xaa, 0x0a,
+	0xa4, 0x69, 0x7b, 0x13, 0x39, 0x78, 0x4a, 0xdc, 0x00, 0x43, 0x3d, 0x4e, 0x10, 0xef, 0xd2, 0x87,
+	0xa9, 0x7a, 0xd5, 0xde, 0xf4, 0x29, 0xfa, 0x20, 0x95, 0x67, 0x6c, 0xe3, 0x9f, 0x21, 0x10, 0xa9,
+	0x57, 0xd8, 0xc7, 0xe7, 0x7c, 0xf3, 0x9d, 0x6f, 0x66, 0xbe, 0x03, 0xfc, 0x43, 0xad, 0x5e, 0xd5,
+	0xaa, 0x8c, 0x2d, 0x6a, 0x53, 0x56, 0x31, 0x4c, 0x8b, 0xf4, 0x6c, 0x6a, 0x4d, 0x0d, 0x8d, 0x47,
+	0xd0, 0xea, 0x50, 0xef, 0x0f, 0x75, 0x8d, 0x27, 0xa9, 0xc5, 0x50, 0x6e, 0x8f, 0x0e, 0x87, 0x74,
+	0x24, 0xf2, 0x70, 0x05, 0x8a, 0x75, 0x62, 0x37, 0x28, 0xb3, 0x47, 0xfa, 0x90, 0x1c, 0x53, 0xab,
+	0x71, 0xda, 0xac, 0xb5, 0xc9, 0xc7, 0x2b, 0xc2, 0x6c, 0x84, 0x20, 0x7d, 0x31, 0x31, 0x8d, 0x82,
+	0xb2, 0xad, 0x94, 0x33, 0x6d, 0xfe, 0x8c, 0xab, 0xa0, 0xca, 0x0a, 0xd8, 0x98, 0x8e, 0x18, 0x41,
+	0x2a, 0xfc, 0x71, 0xe1, 0x7e, 0x72, 0xab, 0xfc, 0x77, 0xfc, 0x59, 0x81, 0x42, 0x4b, 0x1f, 0x3b,
+	0xf9, 0x5d, 0xea, 0x01, 0x78, 0x4b, 0xe9, 0xb0, 0xee, 0xc0, 0xcf, 0x3e, 0x14, 0x94, 0xed, 0x54,
+	0x79, 0x75, 0x77, 0x4f, 0x0b, 0x34, 0xa2, 0xcd, 0x2b, 0xd7, 0x1a, 0xa1, 0xda, 0xa3, 0x91, 0x6d,
+	0x4d, 0xdb, 0x11, 0x40, 0xf5, 0x00, 0x72, 0x92, 0x34, 0xb4, 0x01, 0xa9, 0x4b, 0x32, 0x75, 0xd9,
+	0x3a, 0x8f, 0x28, 0x0f, 0xbf, 0x5d, 0xeb, 0x83, 0x2b, 0x52, 0x48, 0xf2, 0x98, 0x78, 0xd9, 0x4f,
+	0x56, 0x15, 0xfc, 0x86, 0x37, 0xdf, 0x6c, 0x75, 0x9a, 0xc7, 0xd4, 0xea, 0x10, 0xc6, 0x4c, 0x3a,
+	0x9a, 0xc9, 0xb5, 0x05, 0x99, 0x11, 0xb1, 0x27, 0xd4, 0xba, 0x6c, 0xd6, 0x5c, 0xbc, 0x59, 0xc0,
+	0xf9, 0xca, 0xbc, 0x0a, 0x17, 0x79, 0x16, 0xc0, 0xf7, 0xa1, 0x24, 0x45, 0x76, 0x75, 0x45, 0x90,
+	0x36, 0x87, 0xcc, 0xf4, 0x76, 0xc2, 0x79, 0xc6, 0x3f, 0x14, 0x28, 0xb6, 0xf4, 0xb1, 0x9f, 0xdc,
+	0xa5, 0x4e, 0xf9, 0x72, 0x64, 0x08, 0x64, 0x59, 0xb8, 0xae, 0x90, 0xe4, 0x7a, 0x3f, 0x8e, 0xea,
+	0x2d, 0x87, 0xd7, 0x22, 0x61, 0xa1, 0x78, 0x14, 0x53, 0x3d, 0x84, 0xbc, 0x2c, 0xf1, 0x56, 0x9a,
+	0xb7, 0xc4, 0x09, 0x3d, 0x6d, 0xd6, 0x1c, 0x65, 0xfa, 0x93, 0x67, 0x5d, 0x62, 0x1a, 0xcb, 0x75,
+	0x89, 0x20, 0x6d, 0x13, 0xd3, 0x70, 0x31, 0xf9, 0x33, 0xbe, 0x27, 0xce, 0x6f, 0x14, 0x6e, 0xa6,
+	0x73, 0xec, 0xc4, 0x7f, 0x17, 0xe7, 0xd6, 0xcb, 0xed, 0xd2, 0xe0, 0x15, 0xb9, 0x99, 0xc0, 0x09,
+	0x80, 0x2d, 0x4a, 0x26, 0x9c, 0x86, 0xa3, 0xf0, 0xc3, 0x98, 0xc2, 0x32, 0x60, 0xad, 0xeb, 0xd7,
+	0x09, 0x6d, 0x03, 0x40, 0xea, 0x13, 0xc8, 0x46, 0x3e, 0xdf, 0x4a, 0xd1, 0x2f, 0x0a, 0xe4, 0x4e,
+	0xc6, 0x86, 0x6e, 0x93, 0x36, 0xe9, 0x51, 0xcb, 0x17, 0x73, 0x1d, 0x92, 0x7e, 0xeb, 0x49, 0xd3,
+	0x70, 0x2e, 0xf3, 0x80, 0xf6, 0x74, 0xdb, 0xa4, 0x23, 0x17, 0xc4, 0x7f, 0x47, 0x35, 0x58, 0x79,
+	0x6f, 0x92, 0x81, 0xc1, 0x0a, 0x29, 0xde, 0xd5, 0xdd, 0x50, 0x57, 0x12, 0x74, 0xed, 0x98, 0xa7,
+	0x8b, 0x66, 0xdc, 0x5a, 0x75, 0x0f, 0x56, 0x03, 0xe1, 0x5b, 0x35, 0xd1, 0x86, 0x7c, 0x70, 0x15,
+	0xe6, 0x35, 0xb1, 0x0f, 0xbf, 0x5b, 0x22, 0xe2, 0x3a, 0xc8, 0xf6, 0x22, 0x66, 0x6d, 0xaf, 0x00,
+	0x57, 0x61, 0xbd, 0xe6, 0x19, 0x29, 0xe7, 0xb5, 0x2c, 0x23, 0xbc, 0x03, 0xb9, 0x1a, 0x19, 0x90,
+	0x05, 0x8a, 0xe2, 0x3a, 0x14, 0xea, 0xc4, 0x0e, 0xaf, 0x31, 0x4f, 0xfd, 0x12, 0x64, 0xb8, 0x4a,
+	0x67, 0x0e, 0x01, 0x57, 0x7e, 0x1e, 0x78, 0x4e, 0xa6, 0xf8, 0x9b, 0x02, 0x59, 0x1f, 0x46, 0xac,
+	0x19, 0x03, 0xb8, 0x03, 0x1b, 0xde, 0x76, 0x9d, 0x5d, 0x98, 0xcc, 0xc9, 0xe4, 0x47, 0x30, 0xd3,
+	0xce, 0x7a, 0xf1, 0x86, 0x08, 0xa3, 0xa7, 0x91, 0xdd, 0x2c, 0x87, 0x34, 0x8b, 0x2c, 0xf4, 0xab,
+	0x77, 0xb2, 0x05, 0xb9, 0x83, 0xc1, 0x20, 0xb2, 0x08, 0x43, 0x8f, 0xa2, 0x1b, 0xb9, 0x75, 0x13,
+	0x29, 0x7f, 0x13, 0x77, 0xbf, 0xa6, 0x03, 0xd2, 0xbc, 0xa0, 0xf4, 0xf2, 0x6a, 0x8c, 0xfa, 0x80,
+	0xe2, 0x43, 0x0b, 0xfd, 0x17, 0x02, 0x9c, 0x3b, 0x06, 0xd5, 0xff, 0x17, 0xe6, 0x09, 0xf7, 0xc0,
+	0x09, 0xf4, 0x0a, 0x72, 0xee, 0x8c, 0x62, 0xb3, 0x39, 0xc3, 0xd0, 0xce, 0x52, 0x53, 0x4c, 0xdd,
+	0x0c, 0xa5, 0xbd, 0xa6, 0xa6, 0x81, 0x13, 0xe8, 0x03, 0xe4, 0x24, 0x93, 0x01, 0xc5, 0x48, 0xcd,
+	0x99, 0x4a, 0x6a, 0x79, 0x71, 0xa2, 0x4f, 0xbf, 0x03, 0xf9, 0xa0, 0xe5, 0x33, 0xe1, 0xd9, 0x2c,
+	0xa2, 0xd4, 0xdc, 0xa9, 0x20, 0x6f, 0xc0, 0x15, 0x3f, 0xec, 0xb8, 0x12, 0xf1, 0xa5, 0x0e, 0x2f,
+	0x11, 0x5f, 0x6e, 0xdd, 0x38, 0x81, 0x5e, 0xc2, 0x66, 0xcc, 0x4e, 0xe3, 0xd2, 0x4b, 0xed, 0x56,
+	0xca, 0x7c, 0xf7, 0x53, 0x0a, 0xfe, 0xae, 0xeb, 0x36, 0x99, 0xe8, 0x53, 0xff, 0x44, 0x75, 0x88,
+	0x75, 0x6d, 0xf6, 0x08, 0x3a, 0x82, 0xb5, 0xa0, 0x97, 0xa0, 0x85, 0x36, 0x23, 0x17, 0xa7, 0x0e,
+	0x7f, 0x86, 0x6c, 0x0c, 0xfd, 0x3b, 0x17, 0x87, 0xdd, 0x08, 0x74, 0x04, 0x6b, 0x41, 0x07, 0x8a,
+	0xf0, 0x91, 0x98, 0x93, 0x1c, 0xe6, 0x2d, 0x6c, 0xc6, 0x1c, 0x2a, 0xa2, 0xe1, 0x3c, 0x07, 0x53,
+	0x4b, 0xf2, 0x0b, 0xca, 0x73, 0xf8, 0xf6, 0xfc, 0x55, 0x27, 0xb6, 0xec, 0xaa, 0xc7, 0x99, 0xa8,
+	0x61, 0xfa, 0x92, 0x22, 0x9c, 0x38, 0x2c, 0xbd, 0x2b, 0xf2, 0xa4, 0x8a, 0xf8, 0x7b, 0x3b, 0x30,
+	0xcf, 0x2b, 0x7d, 0xea, 0xfe, 0xcb, 0x3d, 0x5f, 0xe1, 0xbf, 0x0f, 0x7e, 0x06, 0x00, 0x00, 0xff,
+	0xff, 0xe4, 0x10, 0x4e, 0x99, 0x28, 0x0b, 0x00, 0x00,
 }
 
 // Reference imports to suppress errors if they are not otherwise used.
@@ -1047,6 +1089,8 @@ var _DirectoryLookup_serviceDesc = grpc.ServiceDesc{
 type GatewayDirectoryServiceClient interface {
 	// Update the directory record of an object in the directory service
 	UpdateRecord(ctx context.Context, in *UpdateRecordRequest, opts ...grpc.CallOption) (*Void, error)
+	// Update the directory records of several objects in one transaction
+	UpdateRecords(ctx context.Context, in *UpdateRecordsRequest, opts ...grpc.CallOption) (*Void, error)
 	// Delete directory record of an object from the directory service
 	// Throws UNKNOWN if object ID does not exist
 	DeleteRecord(ctx context.Context, in *DeleteRecordRequest, opts ...grpc.CallOption) (*Void, error)
@@ -1073,6 +1117,15 @@ func (c *gatewayDirectoryServiceClient) UpdateRecord(ctx context.Context, in *Up
 	return out, nil
 }
 
+func (c *gatewayDirectoryServiceClient) UpdateRecords(ctx context.Context, in *UpdateRecordsRequest, opts ...grpc.CallOption) (*Void, error) {
+	out := new(Void)
+	err := c.cc.Invoke(ctx, "/magma.orc8r.GatewayDirectoryService/UpdateRecords", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *gatewayDirectoryServiceClient) DeleteRecord(ctx context.Context, in *DeleteRecordRequest, opts ...grpc.CallOption) (*Void, error) {
 	out := new(Void)
 	err := c.cc.Invoke(ctx, "/magma.orc8r.GatewayDirectoryService/DeleteRecord", in, out, opts...)
@@ -1104,6 +1157,8 @@ func (c *gatewayDirectoryServiceClient) GetAllDirectoryRecords(ctx context.Conte
 type GatewayDirectoryServiceServer interface {
 	// Update the directory record of an object in the directory service
 	UpdateRecord(context.Context, *UpdateRecordRequest) (*Void, error)
+	// Update the directory records of several objects in one transaction
+	UpdateRecords(context.Context, *UpdateRecordsRequest) (*Void, error)
 	// Delete directory record of an object from the directory service
 	// Throws UNKNOWN if object ID does not exist
 	DeleteRecord(context.Context, *DeleteRecordRequest) (*Void, error)
@@ -1120,6 +1175,9 @@ type UnimplementedGatewayDirectoryServiceServer struct {
 func (*UnimplementedGatewayDirectoryServiceServer) UpdateRecord(ctx context.Context, req *UpdateRecordRequest) (*Void, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method UpdateRecord not implemented")
 }
+func (*UnimplementedGatewayDirectoryServiceServer) UpdateRecords(ctx context.Context, req *UpdateRecordsRequest) (*Void, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method UpdateRecords not implemented")
+}
 func (*UnimplementedGatewayDirectoryServiceServer) DeleteRecord(ctx context.Context, req *DeleteRecordRequest) (*Void, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method DeleteRecord not implemented")
 }
@@ -1152,6 +1210,24 @@ func _GatewayDirectoryService_UpdateRecord_Handler(srv interface{}, ctx context.
 	return interceptor(ctx, in, info, handler)
 }
 
+func _GatewayDirectoryService_UpdateRecords_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(UpdateRecordsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(GatewayDirectoryServiceServer).UpdateRecords(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/magma.orc8r.GatewayDirectoryService/UpdateRecords",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(GatewayDirectoryServiceServer).UpdateRecords(ctx, req.(*UpdateRecordsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _GatewayDirectoryService_DeleteRecord_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(DeleteRecordRequest)
 	if err := dec(in); err != nil {
@@ -1214,6 +1290,10 @@ var _GatewayDirectoryService_serviceDesc = grpc.ServiceDesc{
 			MethodName: "UpdateRecord",
 			Handler:    _GatewayDirectoryService_UpdateRecord_Handler,
 		},
+		{
+			MethodName: "UpdateRecords",
+			Handler:    _GatewayDirectoryService_UpdateRecords_Handler,
+		},
 		{
 			MethodName: "DeleteRecord",
 			Handler:    _GatewayDirectoryService_DeleteRecord_Handler,
@@ -95,28 +95,71 @@ func (m *Event) GetValue() string {
 	return ""
 }
 
+// A batch of events, logged with LogEvents
+type Events struct {
+	Events               []*Event `protobuf:"bytes,1,rep,name=events,proto3" json:"events,omitempty"`
+	XXX_NoUnkeyedLiteral struct{} `json:"-"`
+	XXX_unrecognized     []byte   `json:"-"`
+	XXX_sizecache        int32    `json:"-"`
+}
+
+func (m *Events) Reset()         { *m = Events{} }
+func (m *Events) String() string { return proto.CompactTextString(m) }
+func (*Events) ProtoMessage()    {}
+func (*Events) Descriptor() ([]byte, []int) {
+	return fileDescriptor_846669bfe2c4d9e2, []int{1}
+}
+
+func (m *Events) XXX_Unmarshal(b []byte) error {
+	return xxx_messageInfo_Events.Unmarshal(m, b)
+}
+func (m *Events) XXX_Marshal(b []byte, deterministic bool) ([]byte, error) {
+	return xxx_messageInfo_Events.Marshal(b, m, deterministic)
+}
+func (m *Events) XXX_Merge(src proto.Message) {
+	xxx_messageInfo_Events.Merge(m, src)
+}
+func (m *Events) XXX_Size() int {
+	return xxx_messageInfo_Events.Size(m)
+}
+func (m *Events) XXX_DiscardUnknown() {
+	xxx_messageInfo_Events.DiscardUnknown(m)
+}
+
+var xxx_messageInfo_Events proto.InternalMessageInfo
+
+func (m *Events) GetEvents() []*Event {
+	if m != nil {
+		return m.Events
+	}
+	return nil
+}
+
 func init() {
 	proto.RegisterType((*Event)(nil), "magma.orc8r.Event")
+	proto.RegisterType((*Events)(nil), "magma.orc8r.Events")
 }
 
 func init() { proto.RegisterFile("orc8r/protos/eventd.proto", fileDescriptor_846669bfe2c4d9e2) }
 
 var fileDescriptor_846669bfe2c4d9e2 = []byte{
-	// 214 bytes of a gzipped FileDescriptorProto
-	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x54, 0x8f, 0xb1, 0x4b, 0xc6, 0x30,
-	0x14, 0xc4, 0xfd, 0xfc, 0xfc, 0xc4, 0xbe, 0x3a, 0x68, 0x70, 0x48, 0x2b, 0xa2, 0x74, 0x72, 0x4a,
-	0xc0, 0x2e, 0xce, 0x8a, 0x9b, 0x38, 0xa8, 0x38, 0xb8, 0x94, 0xb4, 0x7d, 0x84, 0x42, 0xd3, 0x57,
-	0xd2, 0x58, 0xe8, 0x7f, 0x2f, 0x7d, 0x71, 0xb0, 0x53, 0x72, 0xbf, 0x5c, 0xb8, 0x3b, 0xc8, 0xc8,
-	0x37, 0x8f, 0x5e, 0x8f, 0x9e, 0x02, 0x4d, 0x1a, 0x67, 0x1c, 0x42, 0xab, 0x58, 0x89, 0xd4, 0x19,
-	0xeb, 0x8c, 0x62, 0x43, 0xbe, 0xf5, 0x35, 0xe4, 0x1c, 0x0d, 0xd1, 0x57, 0x10, 0x1c, 0x5e, 0xd6,
-	0x7f, 0xe2, 0x16, 0xd2, 0x29, 0x78, 0x34, 0xae, 0x1a, 0x8c, 0x43, 0xb9, 0xbb, 0xdb, 0xdd, 0x27,
-	0xef, 0x10, 0xd1, 0x9b, 0x71, 0x28, 0x6e, 0x00, 0x38, 0xa1, 0x0a, 0xcb, 0x88, 0xf2, 0x98, 0xdf,
-	0x13, 0x26, 0x9f, 0xcb, 0x88, 0xe2, 0x02, 0xf6, 0xc1, 0x58, 0xb9, 0x67, 0xbe, 0x5e, 0xc5, 0x15,
-	0x1c, 0x66, 0xd3, 0xff, 0xa0, 0x3c, 0x61, 0x16, 0xc5, 0xc3, 0x33, 0x9c, 0x73, 0xe0, 0x07, 0xfa,
-	0xb9, 0x6b, 0x50, 0x94, 0x70, 0xf6, 0x4a, 0x36, 0x76, 0x10, 0xea, 0x5f, 0x6b, 0xc5, 0x2c, 0xbf,
-	0xdc, 0xb0, 0x2f, 0xea, 0xda, 0xe2, 0xe8, 0xe9, 0xfa, 0x3b, 0x63, 0xaa, 0xe3, 0xb0, 0xbe, 0xab,
-	0xb5, 0xa5, 0xbf, 0x7d, 0xf5, 0x29, 0x9f, 0xe5, 0x6f, 0x00, 0x00, 0x00, 0xff, 0xff, 0x4f, 0x9a,
-	0x20, 0x92, 0x1e, 0x01, 0x00, 0x00,
+	// 250 bytes of a gzipped FileDescriptorProto
+	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x6c, 0x90, 0x41, 0x4b, 0xc3, 0x40,
+	0x10, 0x46, 0x8d, 0xb1, 0xc1, 0x4c, 0x3c, 0xe8, 0xe8, 0x61, 0x5b, 0x11, 0x4b, 0x4e, 0xc5, 0x43,
+	0x02, 0xad, 0x82, 0x67, 0xc1, 0x9b, 0x78, 0xa8, 0xe2, 0xc1, 0x4b, 0xd9, 0xa6, 0x43, 0x08, 0x74,
+	0x33, 0x61, 0x77, 0x0d, 0xd4, 0x5f, 0x2f, 0x9d, 0xad, 0x60, 0xb1, 0xa7, 0xdd, 0x79, 0xf3, 0x3d,
+	0x66, 0x18, 0x18, 0xb2, 0xad, 0x1e, 0x6d, 0xd9, 0x59, 0xf6, 0xec, 0x4a, 0xea, 0xa9, 0xf5, 0xab,
+	0x42, 0x2a, 0xcc, 0x8c, 0xae, 0x8d, 0x2e, 0x24, 0x30, 0xda, 0xcf, 0x55, 0x6c, 0x0c, 0xb7, 0x21,
+	0x97, 0x33, 0x0c, 0x9e, 0xb7, 0x1e, 0xde, 0x42, 0xe6, 0xbc, 0x25, 0x6d, 0x16, 0xad, 0x36, 0xa4,
+	0xa2, 0x71, 0x34, 0x49, 0xe7, 0x10, 0xd0, 0xab, 0x36, 0x84, 0x37, 0x00, 0x32, 0x61, 0xe1, 0x37,
+	0x1d, 0xa9, 0x63, 0xe9, 0xa7, 0x42, 0xde, 0x37, 0x1d, 0xe1, 0x39, 0xc4, 0x5e, 0xd7, 0x2a, 0x16,
+	0xbe, 0xfd, 0xe2, 0x15, 0x0c, 0x7a, 0xbd, 0xfe, 0x22, 0x75, 0x22, 0x2c, 0x14, 0xf9, 0x3d, 0x24,
+	0x32, 0xd0, 0xe1, 0x1d, 0x24, 0xa2, 0x3b, 0x15, 0x8d, 0xe3, 0x49, 0x36, 0xc5, 0xe2, 0xcf, 0xce,
+	0x85, 0x84, 0xe6, 0xbb, 0xc4, 0xf4, 0x1b, 0xce, 0x04, 0xbc, 0x91, 0xed, 0x9b, 0x8a, 0x70, 0x06,
+	0xa7, 0x2f, 0x5c, 0x87, 0xcd, 0x0f, 0x78, 0xa3, 0x8b, 0x3d, 0xf6, 0xc1, 0xcd, 0x2a, 0x3f, 0xc2,
+	0x07, 0x48, 0x7f, 0x25, 0x87, 0x97, 0xff, 0x2d, 0x77, 0x50, 0x7b, 0xba, 0xfe, 0x1c, 0x0a, 0x2d,
+	0xc3, 0x15, 0xd7, 0xcd, 0xb2, 0xac, 0x79, 0x77, 0xcc, 0x65, 0x22, 0xef, 0xec, 0x27, 0x00, 0x00,
+	0xff, 0xff, 0x85, 0xeb, 0xb3, 0xe8, 0x8b, 0x01, 0x00, 0x00,
 }
 
 // Reference imports to suppress errors if they are not otherwise used.
@@ -133,6 +176,8 @@ const _ = grpc.SupportPackageIsVersion6
 type EventServiceClient interface {
 	// Logs an event to FluentBit.
 	LogEvent(ctx context.Context, in *Event, opts ...grpc.CallOption) (*Void, error)
+	// Logs a batch of events to FluentBit.
+	LogEvents(ctx context.Context, in *Events, opts ...grpc.CallOption) (*Void, error)
 }
 
 type eventServiceClient struct {
@@ -152,10 +197,21 @@ func (c *eventServiceClient) LogEvent(ctx context.Context, in *Event, opts ...gr
 	return out, nil
 }
 
+func (c *eventServiceClient) LogEvents(ctx context.Context, in *Events, opts ...grpc.CallOption) (*Void, error) {
+	out := new(Void)
+	err := c.cc.Invoke(ctx, "/magma.orc8r.EventService/LogEvents", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // EventServiceServer is the server API for EventService service.
 type EventServiceServer interface {
 	// Logs an event to FluentBit.
 	LogEvent(context.Context, *Event) (*Void, error)
+	// Logs a batch of events to FluentBit.
+	LogEvents(context.Context, *Events) (*Void, error)
 }
 
 // UnimplementedEventServiceServer can be embedded to have forward compatible implementations.
@@ -165,6 +221,9 @@ type UnimplementedEventServiceServer struct {
 func (*UnimplementedEventServiceServer) LogEvent(ctx context.Context, req *Event) (*Void, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method LogEvent not implemented")
 }
+func (*UnimplementedEventServiceServer) LogEvents(ctx context.Context, req *Events) (*Void, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method LogEvents not implemented")
+}
 
 func RegisterEventServiceServer(s *grpc.Server, srv EventServiceServer) {
 	s.RegisterService(&_EventService_serviceDesc, srv)
@@ -188,6 +247,24 @@ func _EventService_LogEvent_Handler(srv interface{}, ctx context.Context, dec fu
 	return interceptor(ctx, in, info, handler)
 }
 
+func _EventService_LogEvents_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(Events)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(EventServiceServer).LogEvents(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/magma.orc8r.EventService/LogEvents",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(EventServiceServer).LogEvents(ctx, req.(*Events))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 var _EventService_serviceDesc = grpc.ServiceDesc{
 	ServiceName: "magma.orc8r.EventService",
 	HandlerType: (*EventServiceServer)(nil),
@@ -196,6 +273,10 @@ var _EventService_serviceDesc = grpc.ServiceDesc{
 			MethodName: "LogEvent",
 			Handler:    _EventService_LogEvent_Handler,
 		},
+		{
+			MethodName: "LogEvents",
+			Handler:    _EventService_LogEvents_Handler,
+		},
 	},
 	Streams:  []grpc.StreamDesc{},
 	Metadata: "orc8r/protos/eventd.proto",
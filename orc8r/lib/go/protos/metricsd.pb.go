@@ -43,6 +43,7 @@ const (
 	MetricName_diameter_capabilities_exchange MetricName = 9
 	MetricName_diameter_watchdog              MetricName = 10
 	MetricName_diameter_disconnect            MetricName = 11
+	MetricName_s6a_too_busy                   MetricName = 12
 	// More prometheus metrics
 	MetricName_python_info MetricName = 50
 	// Metricsd metrics
@@ -86,31 +87,36 @@ const (
 	MetricName_enodeb_reboots                                      MetricName = 229
 	MetricName_enodeb_rf_tx_desired                                MetricName = 230
 	// Magmad metrics
-	MetricName_magmad_ping_rtt_ms          MetricName = 300
-	MetricName_cpu_percent                 MetricName = 301
-	MetricName_swap_memory_percent         MetricName = 302
-	MetricName_virtual_memory_percent      MetricName = 303
-	MetricName_disk_percent                MetricName = 304
-	MetricName_bytes_sent                  MetricName = 305
-	MetricName_bytes_received              MetricName = 306
-	MetricName_temperature                 MetricName = 307
-	MetricName_checkin_status              MetricName = 308
-	MetricName_streamer_responses          MetricName = 309
-	MetricName_mem_total                   MetricName = 310
-	MetricName_mem_available               MetricName = 311
-	MetricName_mem_used                    MetricName = 312
-	MetricName_mem_free                    MetricName = 313
-	MetricName_bootstrap_exception         MetricName = 314
-	MetricName_upgrader2_time_taken        MetricName = 315
-	MetricName_upgrader2_error             MetricName = 316
-	MetricName_upgrader2_prepared          MetricName = 317
-	MetricName_upgrader2_downloaded        MetricName = 318
-	MetricName_upgrader2_canary            MetricName = 319
-	MetricName_upgrader2_stable            MetricName = 320
-	MetricName_upgrader2_idle              MetricName = 321
-	MetricName_unexpected_service_restarts MetricName = 322
-	MetricName_unattended_upgrade_status   MetricName = 323
-	MetricName_service_restart_status      MetricName = 324
+	MetricName_magmad_ping_rtt_ms              MetricName = 300
+	MetricName_cpu_percent                     MetricName = 301
+	MetricName_swap_memory_percent             MetricName = 302
+	MetricName_virtual_memory_percent          MetricName = 303
+	MetricName_disk_percent                    MetricName = 304
+	MetricName_bytes_sent                      MetricName = 305
+	MetricName_bytes_received                  MetricName = 306
+	MetricName_temperature                     MetricName = 307
+	MetricName_checkin_status                  MetricName = 308
+	MetricName_streamer_responses              MetricName = 309
+	MetricName_mem_total                       MetricName = 310
+	MetricName_mem_available                   MetricName = 311
+	MetricName_mem_used                        MetricName = 312
+	MetricName_mem_free                        MetricName = 313
+	MetricName_bootstrap_exception             MetricName = 314
+	MetricName_upgrader2_time_taken            MetricName = 315
+	MetricName_upgrader2_error                 MetricName = 316
+	MetricName_upgrader2_prepared              MetricName = 317
+	MetricName_upgrader2_downloaded            MetricName = 318
+	MetricName_upgrader2_canary                MetricName = 319
+	MetricName_upgrader2_stable                MetricName = 320
+	MetricName_upgrader2_idle                  MetricName = 321
+	MetricName_unexpected_service_restarts     MetricName = 322
+	MetricName_unattended_upgrade_status       MetricName = 323
+	MetricName_service_restart_status          MetricName = 324
+	MetricName_metrics_spool_bytes             MetricName = 325
+	MetricName_metrics_spool_dropped           MetricName = 326
+	MetricName_metrics_samples_suppressed      MetricName = 327
+	MetricName_metrics_series_overflow         MetricName = 328
+	MetricName_service303_call_latency_seconds MetricName = 329
 	// Pipelined metrics
 	MetricName_dp_send_msg_error                   MetricName = 350
 	MetricName_arp_default_gw_mac_error            MetricName = 351
@@ -119,6 +125,7 @@ const (
 	MetricName_network_iface_status                MetricName = 354
 	MetricName_enforcement_rule_install_fail       MetricName = 355
 	MetricName_enforcement_stats_rule_install_fail MetricName = 356
+	MetricName_restart_flows_reconciled            MetricName = 357
 	///////////////////////////////
 	// GATEWAY FAILURES & ALERTS //
 	///////////////////////////////
@@ -172,6 +179,19 @@ const (
 	MetricName_s1_setup             MetricName = 508
 	// Generic service metrics
 	MetricName_service_errors MetricName = 550
+	// Streamer metrics
+	MetricName_streamer_update_bytes       MetricName = 560
+	MetricName_streamer_update_lag_seconds MetricName = 561
+	MetricName_streamer_unchanged_resyncs  MetricName = 562
+	// Eventd metrics
+	MetricName_eventd_events_queued   MetricName = 570
+	MetricName_eventd_events_sent     MetricName = 571
+	MetricName_eventd_events_dropped  MetricName = 572
+	MetricName_eventd_events_rejected MetricName = 573
+	// State replication metrics
+	MetricName_state_replication_keys_scanned MetricName = 580
+	MetricName_state_replication_keys_shipped MetricName = 581
+	MetricName_state_replication_full_syncs   MetricName = 582
 )
 
 var MetricName_name = map[int32]string{
@@ -187,6 +207,7 @@ var MetricName_name = map[int32]string{
 	9:   "diameter_capabilities_exchange",
 	10:  "diameter_watchdog",
 	11:  "diameter_disconnect",
+	12:  "s6a_too_busy",
 	50:  "python_info",
 	60:  "service_metrics_collected",
 	61:  "process_uptime_seconds",
@@ -250,6 +271,11 @@ var MetricName_name = map[int32]string{
 	322: "unexpected_service_restarts",
 	323: "unattended_upgrade_status",
 	324: "service_restart_status",
+	325: "metrics_spool_bytes",
+	326: "metrics_spool_dropped",
+	327: "metrics_samples_suppressed",
+	328: "metrics_series_overflow",
+	329: "service303_call_latency_seconds",
 	350: "dp_send_msg_error",
 	351: "arp_default_gw_mac_error",
 	352: "openflow_error_msg",
@@ -257,6 +283,7 @@ var MetricName_name = map[int32]string{
 	354: "network_iface_status",
 	355: "enforcement_rule_install_fail",
 	356: "enforcement_stats_rule_install_fail",
+	357: "restart_flows_reconciled",
 	400: "mme_restarted",
 	401: "s1_reset_from_enb",
 	410: "sctp_reset",
@@ -294,6 +321,16 @@ var MetricName_name = map[int32]string{
 	507: "tracking_area_update",
 	508: "s1_setup",
 	550: "service_errors",
+	560: "streamer_update_bytes",
+	561: "streamer_update_lag_seconds",
+	562: "streamer_unchanged_resyncs",
+	570: "eventd_events_queued",
+	571: "eventd_events_sent",
+	572: "eventd_events_dropped",
+	573: "eventd_events_rejected",
+	580: "state_replication_keys_scanned",
+	581: "state_replication_keys_shipped",
+	582: "state_replication_full_syncs",
 }
 
 var MetricName_value = map[string]int32{
@@ -309,6 +346,7 @@ var MetricName_value = map[string]int32{
 	"diameter_capabilities_exchange":                      9,
 	"diameter_watchdog":                                   10,
 	"diameter_disconnect":                                 11,
+	"s6a_too_busy":                                        12,
 	"python_info":                                         50,
 	"service_metrics_collected":                           60,
 	"process_uptime_seconds":                              61,
@@ -372,6 +410,11 @@ var MetricName_value = map[string]int32{
 	"unexpected_service_restarts":                         322,
 	"unattended_upgrade_status":                           323,
 	"service_restart_status":                              324,
+	"metrics_spool_bytes":                                 325,
+	"metrics_spool_dropped":                               326,
+	"metrics_samples_suppressed":                          327,
+	"metrics_series_overflow":                             328,
+	"service303_call_latency_seconds":                     329,
 	"dp_send_msg_error":                                   350,
 	"arp_default_gw_mac_error":                            351,
 	"openflow_error_msg":                                  352,
@@ -379,6 +422,7 @@ var MetricName_value = map[string]int32{
 	"network_iface_status":                                354,
 	"enforcement_rule_install_fail":                       355,
 	"enforcement_stats_rule_install_fail":                 356,
+	"restart_flows_reconciled":                            357,
 	"mme_restarted":                                       400,
 	"s1_reset_from_enb":                                   401,
 	"sctp_reset":                                          410,
@@ -416,6 +460,16 @@ var MetricName_value = map[string]int32{
 	"tracking_area_update":                                507,
 	"s1_setup":                                            508,
 	"service_errors":                                      550,
+	"streamer_update_bytes":                               560,
+	"streamer_update_lag_seconds":                         561,
+	"streamer_unchanged_resyncs":                          562,
+	"eventd_events_queued":                                570,
+	"eventd_events_sent":                                  571,
+	"eventd_events_dropped":                               572,
+	"eventd_events_rejected":                              573,
+	"state_replication_keys_scanned":                      580,
+	"state_replication_keys_shipped":                      581,
+	"state_replication_full_syncs":                        582,
 }
 
 func (x MetricName) String() string {
@@ -721,137 +775,150 @@ func init() {
 func init() { proto.RegisterFile("orc8r/protos/metricsd.proto", fileDescriptor_65dcd99ac93a06b7) }
 
 var fileDescriptor_65dcd99ac93a06b7 = []byte{
-	// 2065 bytes of a gzipped FileDescriptorProto
-	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x84, 0x58, 0x59, 0x8f, 0x25, 0x37,
-	0x15, 0x4e, 0x55, 0xf5, 0xf4, 0x4c, 0xbb, 0x67, 0xa6, 0xdd, 0x9e, 0xad, 0xbb, 0x67, 0x49, 0xa7,
-	0xb3, 0xd0, 0x4c, 0xa0, 0x87, 0x99, 0x11, 0x28, 0x42, 0x44, 0x42, 0x44, 0x42, 0x42, 0x62, 0x50,
-	0xd4, 0x48, 0x3c, 0xf0, 0x62, 0xf9, 0x96, 0xcf, 0xbd, 0xd7, 0xe9, 0x2a, 0xdb, 0xb1, 0x5d, 0x7d,
-	0xfb, 0xfe, 0x08, 0x24, 0x40, 0x88, 0x07, 0x78, 0x05, 0x9e, 0x20, 0xfb, 0xca, 0x4e, 0x12, 0x24,
-	0xf6, 0x7d, 0x5f, 0x92, 0xd9, 0xe0, 0x17, 0xb0, 0xc3, 0x03, 0x3a, 0xae, 0xaa, 0xbb, 0x71, 0x33,
-	0xbc, 0xcc, 0x74, 0x9d, 0xef, 0xf3, 0xb1, 0xfd, 0xf9, 0x2c, 0xf6, 0x25, 0x67, 0x8d, 0xcb, 0x1f,
-	0x72, 0x97, 0xac, 0x33, 0xc1, 0xf8, 0x4b, 0x25, 0x04, 0xa7, 0x72, 0x2f, 0x77, 0xe2, 0x37, 0x5b,
-	0x2e, 0x45, 0xaf, 0x14, 0x3b, 0x91, 0xb2, 0x71, 0xac, 0x01, 0x6b, 0x6c, 0x63, 0x7d, 0x6a, 0x60,
-	0x6e, 0xca, 0xd2, 0xe8, 0x1a, 0xda, 0x2a, 0x08, 0xbd, 0x56, 0x73, 0x1f, 0x31, 0x3a, 0x08, 0xa5,
-	0xc1, 0xb1, 0x73, 0x64, 0xa9, 0x27, 0x02, 0x0c, 0xc4, 0xf0, 0x03, 0x72, 0x2d, 0xd9, 0x4c, 0xb6,
-	0x97, 0x76, 0xc7, 0x06, 0xf6, 0x6e, 0xb2, 0xd8, 0x15, 0xa5, 0x2a, 0x86, 0x6b, 0xe9, 0x66, 0xb6,
-	0xbd, 0x7c, 0x65, 0x6b, 0x47, 0x19, 0x74, 0x56, 0x42, 0xe8, 0x43, 0xe5, 0x77, 0xf2, 0x42, 0x81,
-	0x0e, 0x3b, 0xb5, 0xd7, 0xf7, 0x47, 0xe6, 0x6e, 0x33, 0x62, 0xeb, 0xd3, 0x09, 0x39, 0xfa, 0x68,
-	0xe5, 0xfb, 0x20, 0x6b, 0x98, 0x5d, 0x20, 0xa4, 0x5e, 0xea, 0x87, 0x44, 0x09, 0xcd, 0x5c, 0x13,
-	0x16, 0x76, 0x92, 0x1c, 0xda, 0x17, 0x45, 0x05, 0x6b, 0xe9, 0x66, 0xb2, 0x9d, 0xec, 0xd6, 0x1f,
-	0x6c, 0x93, 0x2c, 0x07, 0x55, 0x82, 0x0f, 0xa2, 0xb4, 0xd7, 0x3e, 0xbc, 0x96, 0x6d, 0x26, 0xdb,
-	0xd9, 0xee, 0xa4, 0x89, 0xed, 0x90, 0xc5, 0x42, 0x74, 0xa0, 0xf0, 0x6b, 0x0b, 0x71, 0x91, 0xa7,
-	0x77, 0x26, 0xe4, 0xd9, 0xf9, 0x20, 0x42, 0x8f, 0x0a, 0xe5, 0x76, 0x1b, 0xd6, 0xd6, 0x3b, 0xc9,
-	0xd2, 0xc8, 0xc8, 0x18, 0x59, 0xd0, 0xe3, 0xe5, 0xc4, 0xbf, 0xa7, 0x17, 0xb2, 0xd4, 0x2c, 0x64,
-	0x6b, 0x8f, 0x9c, 0x9e, 0xdc, 0xce, 0xb4, 0x86, 0x1a, 0xc2, 0xc0, 0xb8, 0xbd, 0xb1, 0x86, 0x23,
-	0x03, 0xbb, 0x4a, 0x0e, 0x37, 0x27, 0xd4, 0x88, 0xb8, 0x3e, 0xb5, 0xbe, 0x49, 0x9f, 0xbb, 0x2d,
-	0xf3, 0xe2, 0xc7, 0xce, 0x12, 0x72, 0x6d, 0x2c, 0xcd, 0x05, 0xb2, 0x61, 0x9d, 0xc9, 0xc1, 0x7b,
-	0xee, 0x83, 0x70, 0x81, 0xe3, 0xfe, 0xb9, 0x87, 0xdc, 0x68, 0xe9, 0xe9, 0x5d, 0x6c, 0x93, 0x9c,
-	0x6b, 0xf1, 0x7d, 0xe5, 0x42, 0x25, 0x0a, 0x5e, 0x42, 0x69, 0xdc, 0x90, 0x77, 0x86, 0x01, 0x3c,
-	0x4d, 0xd8, 0x3d, 0xe4, 0x7c, 0xcb, 0x70, 0xe0, 0x95, 0x04, 0x1d, 0xa6, 0x29, 0x29, 0x3b, 0x4f,
-	0xd6, 0x5b, 0x4a, 0x6e, 0xab, 0xd6, 0x3b, 0x0f, 0x26, 0x88, 0x82, 0x66, 0xec, 0x24, 0xa1, 0x2d,
-	0x6c, 0x2c, 0x68, 0xde, 0x95, 0x9e, 0x2e, 0xb0, 0x13, 0x64, 0xa5, 0xb5, 0x96, 0xe2, 0x20, 0x1a,
-	0x0f, 0x21, 0xd5, 0xbf, 0x4b, 0x70, 0x51, 0x85, 0x3e, 0xf7, 0x55, 0x8e, 0x28, 0x5d, 0x9c, 0xb2,
-	0x76, 0x85, 0x2a, 0x2a, 0x07, 0xf4, 0x30, 0x3b, 0x43, 0x4e, 0xa0, 0xb5, 0x30, 0xb9, 0x08, 0xca,
-	0x68, 0x5e, 0x59, 0x29, 0x02, 0xd0, 0x23, 0x6c, 0x8b, 0x5c, 0x90, 0x4a, 0x94, 0x10, 0xc0, 0xf1,
-	0x5c, 0x58, 0xd1, 0x51, 0x85, 0x0a, 0x0a, 0x3c, 0x87, 0x83, 0xbc, 0x2f, 0x74, 0x0f, 0xe8, 0x12,
-	0x3b, 0x45, 0x56, 0x47, 0x9c, 0x81, 0x08, 0x79, 0x5f, 0x9a, 0x1e, 0x25, 0xe8, 0x73, 0x64, 0x96,
-	0xca, 0xe7, 0x46, 0x6b, 0xc8, 0x03, 0x5d, 0x66, 0x2b, 0x64, 0xd9, 0x0e, 0x43, 0xdf, 0x68, 0xae,
-	0x74, 0xd7, 0xd0, 0x2b, 0xb8, 0x67, 0x0f, 0x6e, 0x5f, 0xe5, 0xc0, 0x1b, 0xe9, 0x79, 0x6e, 0x8a,
-	0x02, 0xf2, 0x00, 0x92, 0xbe, 0x87, 0x6d, 0x90, 0xd3, 0xed, 0xee, 0x2a, 0x3b, 0xa5, 0xf9, 0xc3,
-	0x6c, 0x8d, 0x9c, 0x54, 0x96, 0x0b, 0x29, 0x1d, 0xc2, 0xa2, 0x88, 0x3b, 0x00, 0x49, 0x25, 0x4e,
-	0x3f, 0x81, 0x38, 0x28, 0x40, 0x78, 0x90, 0x14, 0xda, 0x21, 0x85, 0x03, 0x21, 0x87, 0x13, 0x43,
-	0xba, 0x6c, 0x9d, 0x9c, 0x8a, 0xc8, 0x48, 0x86, 0x56, 0xa0, 0x1e, 0xdb, 0x20, 0xa7, 0x40, 0x1b,
-	0x09, 0x1d, 0x5e, 0xf6, 0xca, 0xc0, 0x9b, 0xcd, 0x80, 0xa4, 0xdf, 0x49, 0xd8, 0x59, 0x72, 0xba,
-	0xc1, 0x8c, 0xf5, 0x41, 0x04, 0xe0, 0xa0, 0x45, 0xa7, 0x00, 0x49, 0xbf, 0x9b, 0xb0, 0x75, 0x72,
-	0xb2, 0x01, 0x5d, 0x97, 0x87, 0x83, 0x11, 0xf4, 0xbd, 0x49, 0xa8, 0x67, 0xfd, 0x84, 0xcb, 0xef,
-	0x4f, 0x42, 0x36, 0xd8, 0x09, 0xe8, 0x07, 0x93, 0x50, 0x59, 0xc2, 0x04, 0xf4, 0xc3, 0x84, 0x9d,
-	0x21, 0xcc, 0xb9, 0x9c, 0x63, 0x4e, 0x76, 0xb8, 0x08, 0x01, 0x4a, 0x1b, 0x3c, 0xfd, 0x51, 0xc2,
-	0xd6, 0xc8, 0x89, 0x31, 0xd0, 0xc4, 0x02, 0x78, 0xfa, 0xe3, 0x84, 0x9d, 0x27, 0x6b, 0x56, 0xe6,
-	0x96, 0x57, 0x1e, 0x1c, 0xb7, 0x85, 0xd0, 0x50, 0x47, 0x22, 0xaf, 0x0a, 0xfa, 0x93, 0x3b, 0xc0,
-	0xb2, 0xa0, 0x3f, 0x8d, 0x6b, 0x41, 0xbf, 0x0e, 0x66, 0xa6, 0xfc, 0x59, 0xc2, 0xee, 0x27, 0x9b,
-	0xf3, 0x20, 0xee, 0xf0, 0xe8, 0xba, 0x51, 0x59, 0xfa, 0x73, 0xcc, 0x88, 0x73, 0x73, 0x69, 0x7d,
-	0x53, 0x53, 0x7e, 0x91, 0xb0, 0xbb, 0xc9, 0xc6, 0x5c, 0x8a, 0x09, 0x7d, 0x70, 0xf4, 0x97, 0x09,
-	0x9e, 0xcd, 0x24, 0x61, 0xbc, 0xbf, 0x5f, 0xc5, 0x9d, 0x83, 0x13, 0x9d, 0x59, 0x4d, 0x7e, 0x5d,
-	0xeb, 0x38, 0x46, 0xc6, 0x83, 0x7e, 0x33, 0x3b, 0xa8, 0x09, 0x02, 0x4f, 0x7f, 0x1b, 0xa7, 0x8a,
-	0x48, 0x13, 0x4e, 0xdc, 0xc1, 0xe3, 0x15, 0xf8, 0xe0, 0xe9, 0xef, 0x12, 0x76, 0x91, 0xdc, 0x3f,
-	0x17, 0xab, 0xc5, 0x53, 0x5a, 0xe4, 0x41, 0xed, 0xab, 0x30, 0xa4, 0xbf, 0x8f, 0xdb, 0x9e, 0xcf,
-	0xd5, 0xc6, 0x95, 0xa2, 0xa0, 0x7f, 0x48, 0xd8, 0x43, 0xe4, 0xea, 0x7c, 0x8a, 0x13, 0x52, 0x19,
-	0xac, 0x1f, 0xa6, 0x72, 0x39, 0xe0, 0x90, 0xc0, 0xc5, 0xbe, 0x50, 0x05, 0x06, 0x16, 0xfd, 0x63,
-	0xc2, 0x1e, 0x20, 0xf7, 0xbc, 0xc9, 0x48, 0x90, 0x55, 0x0e, 0xbc, 0x30, 0x42, 0xd2, 0xd7, 0x13,
-	0xf6, 0x76, 0xb2, 0x3d, 0x9f, 0x87, 0x3b, 0xe6, 0x4a, 0x37, 0x33, 0x61, 0xee, 0xd1, 0x37, 0xee,
-	0xe0, 0x16, 0xaa, 0xe0, 0x84, 0xe6, 0x0e, 0x84, 0xa7, 0xd7, 0x13, 0xf6, 0x0e, 0xf2, 0xe0, 0x1d,
-	0x17, 0x1e, 0xff, 0xc5, 0xb8, 0xe5, 0x85, 0xf1, 0x81, 0xde, 0x48, 0xd8, 0x83, 0xe4, 0x81, 0xf9,
-	0x23, 0x8c, 0x28, 0xb9, 0xd2, 0x01, 0xdc, 0x3e, 0x68, 0x4c, 0x48, 0x7a, 0x73, 0x32, 0xdb, 0xda,
-	0x4c, 0xec, 0xaa, 0x5e, 0xe5, 0x40, 0xd2, 0x5b, 0x31, 0x56, 0xda, 0x6c, 0x83, 0x8e, 0x31, 0x75,
-	0x89, 0x76, 0x3c, 0x4a, 0x0f, 0xf4, 0x76, 0xc2, 0x4e, 0x90, 0xe3, 0x53, 0x04, 0x4f, 0xff, 0xf4,
-	0xbf, 0x39, 0x2a, 0xc1, 0x2b, 0x74, 0xf8, 0xe7, 0x98, 0x52, 0xb1, 0x4f, 0x48, 0x6e, 0x95, 0xee,
-	0x71, 0x17, 0x02, 0x2f, 0x3d, 0xfd, 0x62, 0xca, 0x28, 0x59, 0xc6, 0xfa, 0x6c, 0xc1, 0xe5, 0xa0,
-	0x03, 0xfd, 0x52, 0x8a, 0x51, 0xe3, 0x07, 0xc2, 0xb6, 0x05, 0xbd, 0x45, 0x9e, 0x48, 0x71, 0xc9,
-	0x33, 0x0d, 0xa1, 0x05, 0x9f, 0x4c, 0xd9, 0x2a, 0x39, 0x2a, 0x95, 0xdf, 0x1b, 0x99, 0x9e, 0x4a,
-	0xd9, 0x0a, 0x21, 0x75, 0x96, 0x79, 0x34, 0x3c, 0x9d, 0xe2, 0xaa, 0x6b, 0x83, 0x83, 0x1c, 0xd4,
-	0x3e, 0x48, 0xfa, 0x4c, 0x5c, 0x01, 0x46, 0x33, 0x38, 0x11, 0xb0, 0x46, 0x3d, 0x1b, 0x69, 0x79,
-	0x1f, 0xf2, 0x3d, 0xa5, 0xb1, 0x41, 0x85, 0xca, 0xd3, 0xe7, 0x52, 0xdc, 0x81, 0x0f, 0x0e, 0x04,
-	0xea, 0xe0, 0xc0, 0x5b, 0xa3, 0x31, 0xca, 0x9f, 0x4f, 0xd9, 0x71, 0xb2, 0x54, 0x42, 0xd9, 0x74,
-	0x96, 0x17, 0x52, 0xc6, 0xc8, 0x31, 0xfc, 0x1e, 0x87, 0xd2, 0x8b, 0x29, 0x3b, 0x46, 0x8e, 0xa0,
-	0xad, 0xc2, 0xca, 0xf9, 0xd2, 0xe8, 0xb3, 0xeb, 0x00, 0xe8, 0xcb, 0x71, 0xc7, 0x51, 0xc3, 0xe0,
-	0x84, 0xc5, 0x86, 0x00, 0x36, 0x1e, 0xd2, 0x97, 0x53, 0x54, 0xb4, 0xb2, 0x3d, 0x27, 0x24, 0xb8,
-	0x2b, 0x75, 0x9b, 0x0c, 0x62, 0x0f, 0x34, 0xfd, 0x4a, 0xca, 0x4e, 0x92, 0x95, 0x31, 0x04, 0xce,
-	0x19, 0x47, 0xbf, 0x1a, 0x57, 0x39, 0xb6, 0x5a, 0x07, 0x56, 0xe0, 0x01, 0x7c, 0x6d, 0xc6, 0x93,
-	0x34, 0x03, 0x8d, 0xd1, 0x0b, 0x92, 0x7e, 0x3d, 0x65, 0xa7, 0x08, 0x1d, 0x43, 0xb9, 0xd0, 0xc2,
-	0x0d, 0xe9, 0x37, 0x66, 0xcc, 0x98, 0xc1, 0x05, 0xd0, 0x6f, 0x46, 0x71, 0xc6, 0x66, 0x25, 0x0b,
-	0xa0, 0xdf, 0x4a, 0xd9, 0x26, 0x39, 0x5b, 0x69, 0x38, 0xb0, 0xb1, 0x84, 0xf2, 0xb6, 0x09, 0x39,
-	0x88, 0xfd, 0xdd, 0xd3, 0x57, 0x52, 0x76, 0x81, 0xac, 0x57, 0x1a, 0xeb, 0x86, 0x96, 0x20, 0x79,
-	0xe3, 0xa1, 0x95, 0xf7, 0xd5, 0x78, 0xb6, 0x33, 0xc3, 0x5a, 0xf0, 0xb5, 0x94, 0x9d, 0x26, 0xab,
-	0xd2, 0xe2, 0x29, 0x4a, 0x5e, 0xfa, 0x5e, 0xb3, 0xdb, 0xd7, 0xb1, 0xc9, 0xaf, 0x09, 0x67, 0xb9,
-	0x84, 0xae, 0xa8, 0x8a, 0xc0, 0x7b, 0x03, 0x5e, 0x8a, 0xbc, 0x81, 0xdf, 0x88, 0x62, 0x60, 0x73,
-	0xef, 0x16, 0x66, 0x50, 0x1b, 0x71, 0x34, 0xbd, 0x9e, 0x62, 0xf9, 0xa9, 0xf4, 0x9e, 0x36, 0x03,
-	0xcd, 0xed, 0x5e, 0xe0, 0x52, 0x39, 0xc8, 0xa3, 0xe4, 0x37, 0xa2, 0x50, 0xcd, 0x75, 0x87, 0xab,
-	0xae, 0xc8, 0x47, 0x6b, 0xbc, 0x99, 0xb2, 0x2d, 0x72, 0x1e, 0x74, 0xd7, 0xb8, 0x1c, 0x4a, 0xbc,
-	0x71, 0xb8, 0xaa, 0x00, 0xae, 0xb4, 0x0f, 0xa2, 0x28, 0xea, 0x2a, 0x7b, 0x2b, 0x65, 0xdb, 0xe4,
-	0xde, 0x49, 0x0e, 0x0e, 0xf6, 0x73, 0x98, 0xb7, 0xeb, 0x38, 0x29, 0x47, 0xbb, 0x05, 0x49, 0x3f,
-	0x9e, 0xe1, 0x46, 0xfd, 0x65, 0x34, 0x41, 0xe0, 0x5d, 0x67, 0x4a, 0x0e, 0xba, 0x43, 0x3f, 0x91,
-	0x61, 0x24, 0xfb, 0x3c, 0xd8, 0x1a, 0xa1, 0x9f, 0xc9, 0x70, 0x70, 0x34, 0xf8, 0x7e, 0x15, 0xf0,
-	0x34, 0xe9, 0x67, 0x33, 0x9c, 0x1a, 0x2f, 0x1f, 0xbe, 0xea, 0xf8, 0xdc, 0xa9, 0x0e, 0x38, 0xd9,
-	0x69, 0xfb, 0xda, 0x64, 0x13, 0xfe, 0x5c, 0xc6, 0xde, 0x4a, 0xee, 0x1b, 0x5d, 0x5e, 0xf0, 0xee,
-	0x30, 0x0a, 0xe8, 0x26, 0xcf, 0xe1, 0xc0, 0xc6, 0xc4, 0xfd, 0x7c, 0x86, 0x12, 0xcb, 0xca, 0x16,
-	0x0a, 0x7b, 0x3b, 0xd6, 0x7d, 0x91, 0xf7, 0xdb, 0xba, 0x42, 0x9f, 0xc8, 0xb0, 0xe4, 0x28, 0xad,
-	0x82, 0x12, 0x05, 0x4e, 0x15, 0xe0, 0x20, 0x70, 0x0f, 0xa1, 0xb2, 0xed, 0x6c, 0xe3, 0x4c, 0x7b,
-	0x32, 0xc3, 0x8a, 0x36, 0x9f, 0xdc, 0x38, 0x9c, 0x99, 0xfd, 0xa9, 0x8c, 0xdd, 0x47, 0xee, 0xd6,
-	0xc2, 0xb7, 0xf3, 0x8a, 0x1c, 0x53, 0x63, 0x86, 0xf5, 0x74, 0x86, 0xd5, 0x2a, 0xb2, 0x70, 0x3b,
-	0xce, 0xdb, 0x19, 0xc2, 0x33, 0x19, 0x7b, 0x1b, 0x79, 0x0b, 0x12, 0x3c, 0xe4, 0x95, 0x53, 0x61,
-	0xc8, 0x4b, 0x23, 0xb1, 0xe5, 0x97, 0xa5, 0xd0, 0x72, 0x86, 0xfd, 0x6c, 0x86, 0xc7, 0x3c, 0xcd,
-	0x74, 0xf0, 0x18, 0xe4, 0x61, 0xbc, 0x95, 0xe7, 0x32, 0x0c, 0x57, 0x9c, 0x0e, 0xcb, 0xe9, 0xcc,
-	0x1d, 0xe7, 0xf9, 0x0c, 0xb3, 0x01, 0x4f, 0xd6, 0xdb, 0xde, 0x80, 0xe7, 0x0e, 0x50, 0x39, 0x0f,
-	0xde, 0x23, 0xcb, 0xc1, 0xe3, 0xf4, 0x85, 0x3b, 0x33, 0xbc, 0xa5, 0x2f, 0x4e, 0x33, 0x24, 0x14,
-	0x30, 0xe3, 0xe3, 0xa5, 0x3b, 0x33, 0xbc, 0xa5, 0x2f, 0x47, 0x5d, 0x2a, 0x18, 0x49, 0x3d, 0xd3,
-	0x15, 0xe8, 0x2b, 0x19, 0x76, 0xae, 0x39, 0x84, 0xf9, 0xc2, 0xbc, 0x1a, 0x85, 0x51, 0x25, 0xc6,
-	0x82, 0x0a, 0x5c, 0x42, 0x3c, 0x92, 0x69, 0xce, 0x6b, 0xf1, 0x8c, 0x41, 0x77, 0xf8, 0x54, 0x70,
-	0x72, 0x9c, 0xa4, 0x00, 0x81, 0xf7, 0xe1, 0x99, 0x11, 0xdf, 0xce, 0xd8, 0x39, 0x72, 0xc6, 0x5f,
-	0xc6, 0xc2, 0x17, 0x33, 0x54, 0x69, 0x39, 0x16, 0xfa, 0x7a, 0x44, 0x7b, 0xc1, 0x56, 0xf3, 0xd0,
-	0x1b, 0x31, 0x90, 0xf1, 0x60, 0xb5, 0xd1, 0x28, 0x81, 0xda, 0x07, 0x37, 0x44, 0x4e, 0x7b, 0x26,
-	0x23, 0xea, 0xcd, 0x2c, 0x5e, 0x46, 0xca, 0xb2, 0xc9, 0xe6, 0x31, 0x72, 0x0b, 0xdf, 0x02, 0x2b,
-	0x13, 0x48, 0xec, 0x15, 0xb7, 0x23, 0x1f, 0xe5, 0xd5, 0x30, 0xe0, 0xc2, 0x7b, 0x93, 0xab, 0xe8,
-	0x92, 0xfe, 0x25, 0xc3, 0x82, 0x5f, 0xb5, 0xb9, 0x40, 0xff, 0x1a, 0xc7, 0x8f, 0x4b, 0x57, 0xad,
-	0xed, 0xdf, 0x5a, 0x56, 0x2d, 0x13, 0xfd, 0x7b, 0xf4, 0x37, 0xe7, 0xb8, 0xe9, 0x3f, 0xc6, 0xc8,
-	0xf4, 0x21, 0xd2, 0x7f, 0xc6, 0x72, 0x50, 0x01, 0xb7, 0x52, 0x4f, 0xe4, 0x31, 0xfd, 0x57, 0x86,
-	0x35, 0x2a, 0x38, 0x81, 0x0d, 0xaa, 0xc7, 0x85, 0x03, 0xd1, 0xbe, 0x33, 0xfe, 0x9d, 0x61, 0x6b,
-	0xf1, 0x97, 0xeb, 0xb4, 0xa2, 0xff, 0xc9, 0xb0, 0x5a, 0xb7, 0x6b, 0x8b, 0x0a, 0x7a, 0xfa, 0x85,
-	0x85, 0x8b, 0x9f, 0x4c, 0xc9, 0x4a, 0xfd, 0x1e, 0x8b, 0x4f, 0xc7, 0xf8, 0x28, 0x23, 0x64, 0xd1,
-	0x81, 0xaf, 0x8a, 0x40, 0xef, 0x62, 0x4b, 0xe4, 0x50, 0x2e, 0x2a, 0x0f, 0x34, 0x61, 0x47, 0xc9,
-	0x91, 0x20, 0x2a, 0x1e, 0x86, 0x16, 0x68, 0x8a, 0x5f, 0xb8, 0x98, 0xf8, 0x95, 0xe1, 0x10, 0x51,
-	0x2f, 0x69, 0x81, 0x1d, 0x21, 0x0b, 0x7d, 0xbc, 0x85, 0x1c, 0x42, 0x6b, 0xfd, 0xf8, 0xa0, 0x8b,
-	0xec, 0x38, 0x21, 0x16, 0x1f, 0x32, 0x05, 0xec, 0x43, 0x41, 0x0f, 0xa3, 0xe3, 0x52, 0x69, 0xe3,
-	0xe8, 0x91, 0xf8, 0xa7, 0x78, 0xcc, 0x38, 0xba, 0xc4, 0x96, 0xc9, 0xe1, 0x7d, 0x70, 0x71, 0xcf,
-	0x84, 0x31, 0x72, 0x1c, 0x63, 0x2c, 0x56, 0xcf, 0x5a, 0xf1, 0x65, 0x74, 0xe9, 0x41, 0x7b, 0xe3,
-	0xe8, 0x51, 0x74, 0x59, 0x87, 0x42, 0x6e, 0x24, 0xd0, 0x63, 0xe3, 0xef, 0xb8, 0xa8, 0xe3, 0xf8,
-	0x5d, 0x97, 0x6d, 0x7c, 0xfc, 0xd2, 0x15, 0x46, 0xc9, 0xd1, 0x56, 0x80, 0x68, 0xa1, 0x38, 0x5d,
-	0x5d, 0x8f, 0x25, 0x5d, 0xc5, 0x75, 0xab, 0xd2, 0x2b, 0xca, 0xae, 0x7c, 0x2a, 0x21, 0xab, 0x13,
-	0x8f, 0x61, 0x87, 0x0f, 0x27, 0xc7, 0x1e, 0x26, 0x87, 0x1f, 0xa9, 0x9f, 0x50, 0xec, 0xfc, 0xd4,
-	0x4b, 0x77, 0xf6, 0xdd, 0xbc, 0xb1, 0x3a, 0x05, 0x7f, 0xc4, 0x28, 0xb9, 0x75, 0x17, 0x7b, 0x2f,
-	0x59, 0xc0, 0x27, 0x31, 0xbb, 0xf7, 0x4d, 0x5f, 0xc9, 0xff, 0xc7, 0xc3, 0xfb, 0xce, 0x7e, 0x74,
-	0x3d, 0x5a, 0x2f, 0xd5, 0xbf, 0x84, 0x14, 0xaa, 0x73, 0xa9, 0x67, 0x9a, 0x1f, 0x44, 0x3a, 0x8b,
-	0xf1, 0xff, 0xab, 0xff, 0x0d, 0x00, 0x00, 0xff, 0xff, 0x3a, 0xa9, 0x89, 0x1b, 0x60, 0x11, 0x00,
-	0x00,
+	// 2285 bytes of a gzipped FileDescriptorProto
+	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xff, 0x84, 0x58, 0x59, 0x6f, 0x25, 0x47,
+	0x15, 0x4e, 0x77, 0xdf, 0x59, 0x5c, 0xf6, 0x8c, 0xcb, 0x35, 0x4b, 0x6c, 0xcf, 0x12, 0xc7, 0x59,
+	0x30, 0x09, 0x78, 0x92, 0x19, 0x81, 0x22, 0x44, 0x24, 0x44, 0x24, 0x24, 0x24, 0x82, 0x22, 0x23,
+	0xf1, 0xc0, 0x4b, 0xa9, 0x6e, 0xd7, 0xb9, 0xf7, 0x56, 0xdc, 0x5d, 0x55, 0xa9, 0xaa, 0xb6, 0x7d,
+	0xff, 0x05, 0x44, 0x88, 0x07, 0x78, 0x05, 0x9e, 0x20, 0xfb, 0x9e, 0xb0, 0x65, 0x23, 0x61, 0xdf,
+	0x77, 0xb2, 0x4e, 0xf8, 0x05, 0xec, 0xf0, 0x80, 0x4e, 0x75, 0xf7, 0xdd, 0x72, 0x63, 0x5e, 0xec,
+	0xdb, 0xe7, 0xfb, 0xea, 0xd4, 0xa9, 0xb3, 0x56, 0x37, 0x39, 0x67, 0x5c, 0x7e, 0x87, 0xbb, 0x64,
+	0x9d, 0x09, 0xc6, 0x5f, 0x2a, 0x21, 0x38, 0x95, 0x7b, 0xb9, 0x1d, 0x9f, 0xd9, 0x62, 0x29, 0xfa,
+	0xa5, 0xd8, 0x8e, 0x94, 0xf5, 0x13, 0x0d, 0x58, 0x63, 0xeb, 0x6b, 0x53, 0x0b, 0x73, 0x53, 0x96,
+	0x46, 0xd7, 0xd0, 0x66, 0x41, 0xe8, 0xdd, 0x35, 0xf7, 0x2e, 0xa3, 0x83, 0x50, 0x1a, 0x1c, 0x3b,
+	0x4f, 0x16, 0xfa, 0x22, 0xc0, 0xbe, 0x18, 0x7e, 0x52, 0xae, 0x26, 0x1b, 0xc9, 0xd6, 0xc2, 0xce,
+	0x58, 0xc0, 0x3e, 0x42, 0x8e, 0xf6, 0x44, 0xa9, 0x8a, 0xe1, 0x6a, 0xba, 0x91, 0x6d, 0x2d, 0x5e,
+	0xde, 0xdc, 0x56, 0x06, 0x95, 0x95, 0x10, 0x06, 0x50, 0xf9, 0xed, 0xbc, 0x50, 0xa0, 0xc3, 0x76,
+	0xad, 0xf5, 0x13, 0x91, 0xb9, 0xd3, 0xac, 0xd8, 0xfc, 0x52, 0x42, 0x96, 0xee, 0xa9, 0xfc, 0x00,
+	0x64, 0x0d, 0xb3, 0x8b, 0x84, 0xd4, 0xa6, 0x7e, 0x5a, 0x94, 0xd0, 0xec, 0x35, 0x21, 0x61, 0xa7,
+	0xc9, 0x91, 0x3d, 0x51, 0x54, 0xb0, 0x9a, 0x6e, 0x24, 0x5b, 0xc9, 0x4e, 0xfd, 0xc0, 0x36, 0xc8,
+	0x62, 0x50, 0x25, 0xf8, 0x20, 0x4a, 0x7b, 0xf7, 0x67, 0x56, 0xb3, 0x8d, 0x64, 0x2b, 0xdb, 0x99,
+	0x14, 0xb1, 0x6d, 0x72, 0xb4, 0x10, 0x5d, 0x28, 0xfc, 0x6a, 0x27, 0x1a, 0x79, 0x76, 0x7b, 0xc2,
+	0x3d, 0xdb, 0x9f, 0x42, 0xe8, 0x1e, 0xa1, 0xdc, 0x4e, 0xc3, 0xda, 0xfc, 0x10, 0x59, 0x18, 0x09,
+	0x19, 0x23, 0x1d, 0x3d, 0x36, 0x27, 0xfe, 0x9e, 0x36, 0x64, 0xa1, 0x31, 0x64, 0x73, 0x97, 0x9c,
+	0x9d, 0x3c, 0xce, 0xb4, 0x0f, 0x35, 0x84, 0x7d, 0xe3, 0x76, 0xc7, 0x3e, 0x1c, 0x09, 0xd8, 0x15,
+	0x72, 0xac, 0x89, 0x50, 0xe3, 0xc4, 0xb5, 0x29, 0xfb, 0x26, 0x75, 0xee, 0xb4, 0xcc, 0x5b, 0xee,
+	0xbf, 0x8e, 0x90, 0xbb, 0xc7, 0xae, 0xb9, 0x48, 0xd6, 0xad, 0x33, 0x39, 0x78, 0xcf, 0x7d, 0x10,
+	0x2e, 0x70, 0x3c, 0x3f, 0xf7, 0x90, 0x1b, 0x2d, 0x3d, 0xbd, 0x86, 0x6d, 0x90, 0xf3, 0x2d, 0xbe,
+	0xa7, 0x5c, 0xa8, 0x44, 0xc1, 0x4b, 0x28, 0x8d, 0x1b, 0xf2, 0xee, 0x30, 0x80, 0xa7, 0x09, 0xbb,
+	0x9e, 0x5c, 0x68, 0x19, 0x0e, 0xbc, 0x92, 0xa0, 0xc3, 0x34, 0x25, 0x65, 0x17, 0xc8, 0x5a, 0x4b,
+	0xc9, 0x6d, 0xd5, 0x6a, 0xe7, 0xc1, 0x04, 0x51, 0xd0, 0x8c, 0x9d, 0x26, 0xb4, 0x85, 0x8d, 0x05,
+	0xcd, 0x7b, 0xd2, 0xd3, 0x0e, 0x3b, 0x45, 0x96, 0x5b, 0x69, 0x29, 0x0e, 0xa2, 0xf0, 0x08, 0x52,
+	0xfd, 0x87, 0x05, 0x17, 0x55, 0x18, 0x70, 0x5f, 0xe5, 0x88, 0xd2, 0xa3, 0x53, 0xd2, 0x9e, 0x50,
+	0x45, 0xe5, 0x80, 0x1e, 0x63, 0xd7, 0x92, 0x53, 0x28, 0x2d, 0x4c, 0x2e, 0x82, 0x32, 0x9a, 0x57,
+	0x56, 0x8a, 0x00, 0xf4, 0x38, 0xdb, 0x24, 0x17, 0xa5, 0x12, 0x25, 0x04, 0x70, 0x3c, 0x17, 0x56,
+	0x74, 0x55, 0xa1, 0x82, 0x02, 0xcf, 0xe1, 0x20, 0x1f, 0x08, 0xdd, 0x07, 0xba, 0xc0, 0xce, 0x90,
+	0x95, 0x11, 0x67, 0x5f, 0x84, 0x7c, 0x20, 0x4d, 0x9f, 0x12, 0xd4, 0x39, 0x12, 0x4b, 0xe5, 0x73,
+	0xa3, 0x35, 0xe4, 0x81, 0x2e, 0x32, 0x4a, 0x96, 0x70, 0xb3, 0x60, 0x0c, 0xef, 0x56, 0x7e, 0x48,
+	0x97, 0xd8, 0x32, 0x59, 0xb4, 0xc3, 0x30, 0x30, 0x9a, 0x2b, 0xdd, 0x33, 0xf4, 0x32, 0x7a, 0xc1,
+	0x83, 0xdb, 0x53, 0x39, 0xf0, 0x26, 0x18, 0x3c, 0x37, 0x45, 0x01, 0x79, 0x00, 0x49, 0x3f, 0xca,
+	0xd6, 0xc9, 0xd9, 0xf6, 0xbc, 0x95, 0x9d, 0x8a, 0xc2, 0x9d, 0x6c, 0x95, 0x9c, 0x56, 0x96, 0x0b,
+	0x29, 0x1d, 0xc2, 0xa2, 0x88, 0x67, 0x02, 0x49, 0x25, 0x1a, 0x34, 0x81, 0x38, 0x28, 0x40, 0x78,
+	0x90, 0x14, 0xda, 0x25, 0x85, 0x03, 0x21, 0x87, 0x13, 0x4b, 0x7a, 0x6c, 0x8d, 0x9c, 0x89, 0xc8,
+	0xc8, 0x31, 0xad, 0xcb, 0xfa, 0x6c, 0x9d, 0x9c, 0x01, 0x6d, 0x24, 0x74, 0x79, 0xd9, 0x2f, 0x03,
+	0x6f, 0x8e, 0x07, 0x92, 0xbe, 0x92, 0xb0, 0x73, 0xe4, 0x6c, 0x83, 0x19, 0xeb, 0x83, 0x08, 0xc0,
+	0x41, 0x8b, 0x6e, 0x01, 0x92, 0xbe, 0x9a, 0xb0, 0x35, 0x72, 0xba, 0x01, 0x5d, 0x8f, 0x87, 0x83,
+	0x11, 0xf4, 0x83, 0x49, 0xa8, 0x6f, 0xfd, 0x84, 0xca, 0x1f, 0x4e, 0x42, 0x36, 0xd8, 0x09, 0xe8,
+	0x47, 0x93, 0x50, 0x59, 0xc2, 0x04, 0xf4, 0xe3, 0x84, 0x5d, 0x4b, 0x98, 0x73, 0x39, 0xc7, 0x2a,
+	0xed, 0x72, 0x11, 0x02, 0x94, 0x36, 0x78, 0xfa, 0x93, 0x84, 0xad, 0x92, 0x53, 0x63, 0xa0, 0xc9,
+	0x0e, 0xf0, 0xf4, 0xa7, 0x09, 0xbb, 0x40, 0x56, 0xad, 0xcc, 0x2d, 0xaf, 0x3c, 0x38, 0x6e, 0x0b,
+	0xa1, 0xa1, 0xce, 0x4d, 0x5e, 0x15, 0xf4, 0x67, 0x87, 0xc0, 0xb2, 0xa0, 0x3f, 0x8f, 0xb6, 0xa0,
+	0x5e, 0x07, 0x33, 0x5b, 0xfe, 0x22, 0x61, 0x37, 0x91, 0x8d, 0x79, 0x10, 0x77, 0x18, 0xba, 0x5e,
+	0xf4, 0x2c, 0xfd, 0x25, 0xd6, 0xc8, 0xf9, 0xb9, 0xb4, 0x81, 0xa9, 0x29, 0xbf, 0x4a, 0xd8, 0x75,
+	0x64, 0x7d, 0x2e, 0xc5, 0x84, 0x01, 0x38, 0xfa, 0xeb, 0x04, 0x63, 0x33, 0x49, 0x18, 0x9f, 0xef,
+	0x37, 0xf1, 0xe4, 0xe0, 0x44, 0x77, 0xd6, 0x27, 0xbf, 0xad, 0xfd, 0x38, 0x46, 0xc6, 0x8b, 0x7e,
+	0x37, 0xbb, 0xa8, 0x49, 0x02, 0x4f, 0x7f, 0x1f, 0xb7, 0x8a, 0x48, 0x93, 0x4e, 0xdc, 0xc1, 0x7d,
+	0x15, 0xf8, 0xe0, 0xe9, 0x1f, 0x12, 0x76, 0x0b, 0xb9, 0x69, 0x2e, 0x56, 0x3b, 0x4f, 0x69, 0x91,
+	0x07, 0xb5, 0xa7, 0xc2, 0x90, 0xfe, 0x31, 0x1e, 0x7b, 0x3e, 0x57, 0x1b, 0x57, 0x8a, 0x82, 0xfe,
+	0x29, 0x61, 0x77, 0x90, 0x2b, 0xf3, 0x29, 0x4e, 0x48, 0x65, 0xb0, 0xa3, 0x98, 0xca, 0xe5, 0x80,
+	0x4b, 0x02, 0x17, 0x7b, 0x42, 0x15, 0x98, 0x58, 0xf4, 0xcf, 0x09, 0xbb, 0x99, 0x5c, 0xff, 0x1e,
+	0x2b, 0x41, 0x56, 0x39, 0xf0, 0xc2, 0x08, 0x49, 0x5f, 0x4b, 0xd8, 0x07, 0xc9, 0xd6, 0x7c, 0x1e,
+	0x9e, 0x98, 0x2b, 0xdd, 0xec, 0x84, 0xb5, 0x47, 0x5f, 0x3f, 0x44, 0x2d, 0x54, 0xc1, 0x09, 0xcd,
+	0x1d, 0x08, 0x4f, 0xdf, 0x48, 0xd8, 0x6d, 0xe4, 0xd6, 0x43, 0x0d, 0x8f, 0x7f, 0x31, 0x6f, 0x79,
+	0x61, 0x7c, 0xa0, 0x6f, 0x26, 0xec, 0x56, 0x72, 0xf3, 0xfc, 0x15, 0x46, 0x94, 0x5c, 0xe9, 0x00,
+	0x6e, 0x0f, 0x34, 0x16, 0x24, 0x7d, 0x6b, 0xb2, 0xda, 0xda, 0x4a, 0xec, 0xa9, 0x7e, 0xe5, 0x40,
+	0xd2, 0xb7, 0x63, 0xae, 0xb4, 0xd5, 0x06, 0x5d, 0x63, 0xea, 0xa6, 0xed, 0x78, 0x74, 0x3d, 0xd0,
+	0xab, 0x09, 0x3b, 0x45, 0x4e, 0x4e, 0x11, 0x3c, 0x7d, 0xe7, 0xdd, 0x35, 0x2a, 0xc1, 0x2b, 0x54,
+	0xf8, 0x97, 0x58, 0x52, 0x71, 0x72, 0x48, 0x6e, 0x95, 0xee, 0x73, 0x17, 0x02, 0x2f, 0x3d, 0xfd,
+	0x46, 0xca, 0x28, 0x59, 0xc4, 0x8e, 0x6d, 0xc1, 0xe5, 0xa0, 0x03, 0xfd, 0x66, 0x8a, 0x59, 0xe3,
+	0xf7, 0x85, 0x6d, 0x5b, 0x7c, 0x8b, 0x3c, 0x90, 0xa2, 0xc9, 0x33, 0x23, 0xa2, 0x05, 0x1f, 0x4c,
+	0xd9, 0x0a, 0x59, 0x92, 0xca, 0xef, 0x8e, 0x44, 0x0f, 0xa5, 0x6c, 0x99, 0x90, 0xba, 0xca, 0x3c,
+	0x0a, 0x1e, 0x4e, 0xd1, 0xea, 0x5a, 0xe0, 0x20, 0x07, 0xb5, 0x07, 0x92, 0x3e, 0x12, 0x2d, 0xc0,
+	0x6c, 0x06, 0x27, 0x02, 0xf6, 0xa8, 0x47, 0x23, 0x2d, 0x1f, 0x40, 0xbe, 0xab, 0x34, 0x8e, 0xac,
+	0x50, 0x79, 0xfa, 0x58, 0x8a, 0x27, 0xf0, 0xc1, 0x81, 0x40, 0x3f, 0x38, 0xf0, 0xd6, 0x68, 0xcc,
+	0xf2, 0xc7, 0x53, 0x76, 0x92, 0x2c, 0x94, 0x50, 0x36, 0xb3, 0xe6, 0x89, 0x94, 0x31, 0x72, 0x02,
+	0x9f, 0xc7, 0xa9, 0xf4, 0x64, 0xca, 0x4e, 0x90, 0xe3, 0x28, 0xab, 0xb0, 0x73, 0x3e, 0x35, 0x7a,
+	0xec, 0x39, 0x00, 0xfa, 0x74, 0x3c, 0x71, 0xf4, 0x61, 0x70, 0xc2, 0xe2, 0x88, 0x00, 0x1b, 0x83,
+	0xf4, 0x4c, 0x8a, 0x1e, 0xad, 0x6c, 0xdf, 0x09, 0x09, 0xee, 0x72, 0x3d, 0x38, 0x83, 0xd8, 0x05,
+	0x4d, 0x9f, 0x4d, 0xd9, 0x69, 0xb2, 0x3c, 0x86, 0xc0, 0x39, 0xe3, 0xe8, 0x73, 0xd1, 0xca, 0xb1,
+	0xd4, 0x3a, 0xb0, 0x02, 0x03, 0xf0, 0xad, 0x19, 0x4d, 0xd2, 0xec, 0x6b, 0xcc, 0x5e, 0x90, 0xf4,
+	0xdb, 0x29, 0x3b, 0x43, 0xe8, 0x18, 0xca, 0x85, 0x16, 0x6e, 0x48, 0xbf, 0x33, 0x23, 0xc6, 0x0a,
+	0x2e, 0x80, 0x7e, 0x37, 0x3a, 0x67, 0x2c, 0x56, 0xb2, 0x00, 0xfa, 0xbd, 0x94, 0x6d, 0x90, 0x73,
+	0x95, 0x86, 0x03, 0x1b, 0x5b, 0x28, 0x6f, 0x87, 0x90, 0x83, 0x38, 0xf1, 0x3d, 0x7d, 0x3e, 0x65,
+	0x17, 0xc9, 0x5a, 0xa5, 0xb1, 0x6f, 0x68, 0x09, 0x92, 0x37, 0x1a, 0x5a, 0xf7, 0xbe, 0x10, 0x63,
+	0x3b, 0xb3, 0xac, 0x05, 0x5f, 0x8c, 0x0e, 0x6a, 0x07, 0x9a, 0xb7, 0xc6, 0x14, 0xcd, 0xdc, 0x7f,
+	0x29, 0xc5, 0x46, 0x32, 0x8d, 0x48, 0x67, 0xac, 0x05, 0x49, 0x5f, 0x4e, 0x31, 0x89, 0x47, 0x98,
+	0x28, 0x6d, 0x81, 0x89, 0x50, 0x59, 0x8b, 0x73, 0x0c, 0x24, 0xfd, 0x7e, 0xca, 0xce, 0x93, 0x6b,
+	0x47, 0x04, 0x70, 0x38, 0x9f, 0xcd, 0x1e, 0xb8, 0x5e, 0x61, 0xf6, 0xe9, 0x2b, 0x29, 0xbb, 0x91,
+	0x5c, 0xd7, 0x58, 0x74, 0xe5, 0xb6, 0x2b, 0x3c, 0x17, 0x45, 0xc1, 0x0b, 0x11, 0x40, 0xe7, 0xc3,
+	0xd1, 0xdc, 0x7c, 0x35, 0x65, 0x67, 0xc9, 0x8a, 0xb4, 0x98, 0x60, 0x92, 0x97, 0xbe, 0xdf, 0x04,
+	0xe2, 0x35, 0xbc, 0x91, 0xac, 0x0a, 0x67, 0xb9, 0x84, 0x9e, 0xa8, 0x8a, 0xc0, 0xfb, 0xfb, 0xbc,
+	0x14, 0x79, 0x03, 0xbf, 0x1e, 0xe3, 0x84, 0x37, 0x11, 0xdc, 0xab, 0x16, 0xe2, 0x6a, 0xfa, 0x46,
+	0x3c, 0x50, 0xa5, 0x77, 0xb5, 0xd9, 0xd7, 0xdc, 0xee, 0x06, 0x2e, 0x95, 0x83, 0x3c, 0x66, 0xc3,
+	0x9b, 0x31, 0x86, 0xcd, 0xdd, 0x8c, 0xab, 0x9e, 0xc8, 0x47, 0xee, 0x7b, 0x2b, 0x65, 0x9b, 0xe4,
+	0x02, 0xe8, 0x9e, 0x71, 0x39, 0x94, 0x78, 0x3d, 0x72, 0x55, 0x01, 0x5c, 0x69, 0x1f, 0xd0, 0xea,
+	0x38, 0x00, 0xde, 0x4e, 0xd9, 0x16, 0xb9, 0x61, 0x92, 0x83, 0x8b, 0xfd, 0x1c, 0xe6, 0xd5, 0x68,
+	0x7c, 0x1b, 0x04, 0xb4, 0xb0, 0x99, 0x36, 0xb9, 0xc2, 0x81, 0xfb, 0x4e, 0x9d, 0xe1, 0xe5, 0x28,
+	0x4e, 0x20, 0xe9, 0xe7, 0x33, 0xf4, 0x83, 0xbf, 0x1d, 0x45, 0x10, 0x78, 0xcf, 0x99, 0x92, 0x83,
+	0xee, 0xd2, 0x2f, 0x64, 0x58, 0x83, 0x3e, 0x0f, 0xb6, 0x46, 0xe8, 0x97, 0x33, 0x5c, 0x1c, 0x05,
+	0x7e, 0x50, 0x05, 0xcc, 0x43, 0xfa, 0x95, 0x0c, 0x2d, 0xc3, 0xbb, 0x8d, 0xaf, 0xba, 0x3e, 0x77,
+	0xaa, 0x0b, 0x4e, 0x76, 0xdb, 0x89, 0x3c, 0x79, 0x7d, 0xf8, 0x6a, 0xc6, 0xde, 0x4f, 0x6e, 0x1c,
+	0x5d, 0xc4, 0xf0, 0xd6, 0x33, 0x2a, 0xc5, 0xa6, 0x43, 0xc1, 0x81, 0x8d, 0x2d, 0xe7, 0x6b, 0x19,
+	0x1e, 0x42, 0x56, 0xb6, 0x50, 0x78, 0x2b, 0xc1, 0x89, 0x25, 0xf2, 0x41, 0xdb, 0x11, 0xe9, 0x03,
+	0x19, 0x36, 0x4b, 0xa5, 0x55, 0x50, 0xa2, 0xc0, 0xad, 0x02, 0x1c, 0x04, 0xee, 0x21, 0x54, 0xb6,
+	0xdd, 0x6d, 0xdc, 0x23, 0x1e, 0xcc, 0xb0, 0x17, 0xcf, 0x27, 0x37, 0x0a, 0x67, 0x76, 0x7f, 0x28,
+	0xc3, 0xec, 0xd1, 0xc2, 0xb7, 0xfb, 0x8a, 0x1c, 0x8b, 0x7a, 0x86, 0xf5, 0x70, 0x86, 0x29, 0x1a,
+	0x59, 0x78, 0x1c, 0xe7, 0xed, 0x0c, 0xe1, 0x91, 0x8c, 0x7d, 0x80, 0xbc, 0x0f, 0x09, 0x1e, 0xf2,
+	0xca, 0xa9, 0x30, 0xe4, 0xa5, 0x91, 0x78, 0x59, 0x29, 0x4b, 0xa1, 0xe5, 0x0c, 0xfb, 0xd1, 0x0c,
+	0xb3, 0x60, 0x9a, 0xe9, 0xe0, 0x5e, 0xc8, 0xc3, 0xf8, 0x28, 0x8f, 0x65, 0x58, 0x68, 0xb8, 0x1d,
+	0x0e, 0x82, 0x99, 0xdb, 0xd9, 0xe3, 0x19, 0xd6, 0x31, 0x46, 0xd6, 0xdb, 0xfe, 0x3e, 0xcf, 0x1d,
+	0xa0, 0xe7, 0x3c, 0x78, 0x8f, 0x2c, 0x07, 0xf7, 0xd1, 0x27, 0x0e, 0x67, 0x78, 0x4b, 0x9f, 0x9c,
+	0x66, 0x48, 0x28, 0x60, 0x46, 0xc7, 0x53, 0x87, 0x33, 0xbc, 0xa5, 0x4f, 0x47, 0xbf, 0x54, 0x30,
+	0x72, 0xf5, 0xcc, 0x3c, 0xa3, 0xcf, 0x67, 0x38, 0x73, 0xe7, 0x10, 0xe6, 0x3b, 0xe6, 0x85, 0xe8,
+	0x18, 0x55, 0x62, 0x2e, 0xa8, 0xc0, 0x25, 0xc4, 0x90, 0x4c, 0x73, 0x5e, 0x8c, 0x31, 0x06, 0xdd,
+	0xe5, 0x53, 0xc9, 0xc9, 0x71, 0x93, 0x02, 0x04, 0xde, 0xed, 0x67, 0x56, 0xbc, 0x94, 0x61, 0xff,
+	0xf0, 0xb7, 0x63, 0xcb, 0x8e, 0x05, 0xac, 0xb4, 0x1c, 0x3b, 0xfa, 0x8d, 0x88, 0xf6, 0x83, 0xad,
+	0xe6, 0xa1, 0x6f, 0xc6, 0x44, 0xc6, 0xc0, 0x6a, 0xa3, 0xd1, 0x05, 0x6a, 0x0f, 0xdc, 0x10, 0x39,
+	0x6d, 0x4c, 0x46, 0xd4, 0xb7, 0xb2, 0x78, 0x8d, 0x2a, 0xcb, 0xa6, 0xd8, 0xc7, 0xc8, 0xdb, 0xf8,
+	0x5e, 0xb3, 0x3c, 0x81, 0xc4, 0x29, 0x77, 0x35, 0xf2, 0xd1, 0xbd, 0x1a, 0xf6, 0xb9, 0xf0, 0xde,
+	0xe4, 0x2a, 0xaa, 0xa4, 0x7f, 0xcd, 0x70, 0x54, 0x55, 0x6d, 0x2d, 0xd0, 0xbf, 0xc5, 0xf5, 0xe3,
+	0xa6, 0x5b, 0xfb, 0xf6, 0xef, 0x2d, 0xab, 0x76, 0x13, 0xfd, 0x47, 0xd4, 0x37, 0x27, 0xdc, 0xf4,
+	0x9f, 0x63, 0x64, 0x3a, 0x88, 0xf4, 0x5f, 0xb1, 0x1d, 0x54, 0xc0, 0xad, 0xd4, 0x13, 0x75, 0x4c,
+	0xff, 0x9d, 0x61, 0x0b, 0x0b, 0x4e, 0xe0, 0x68, 0xed, 0x73, 0xe1, 0x40, 0xb4, 0xef, 0x4c, 0xff,
+	0xc9, 0x70, 0x28, 0xfa, 0xdb, 0xeb, 0xb2, 0xa2, 0xff, 0xcd, 0x70, 0xce, 0xb4, 0xb6, 0x45, 0x0f,
+	0x7a, 0xfa, 0xf5, 0x0e, 0x76, 0xc7, 0xd1, 0x10, 0xae, 0x57, 0x36, 0xa3, 0xe0, 0xa1, 0x0e, 0x66,
+	0xd5, 0x2c, 0x56, 0x88, 0xfe, 0xa8, 0x57, 0x3f, 0xdc, 0xc1, 0xac, 0x1a, 0x33, 0x74, 0xfd, 0x26,
+	0x86, 0x51, 0xf1, 0x43, 0x9d, 0x7b, 0xfa, 0x48, 0x27, 0x5e, 0x60, 0xf0, 0x8a, 0x24, 0x79, 0xfc,
+	0xe7, 0xf9, 0x7d, 0x15, 0x54, 0x20, 0xe9, 0x33, 0x1d, 0x6c, 0xd8, 0xd3, 0x50, 0xf4, 0xf6, 0xb3,
+	0xd1, 0xa4, 0x69, 0xa0, 0x9d, 0x40, 0xcf, 0x75, 0xe2, 0x1d, 0x6b, 0x0a, 0xab, 0xeb, 0x11, 0x27,
+	0x72, 0x87, 0xdd, 0x40, 0x2e, 0xd6, 0x6f, 0x39, 0x0e, 0xea, 0x2e, 0x85, 0x71, 0xdf, 0x85, 0xa1,
+	0xe7, 0x3e, 0x17, 0x5a, 0x63, 0x52, 0x1e, 0x4a, 0x1a, 0xa8, 0xb8, 0xcd, 0x4b, 0x1d, 0xbc, 0x05,
+	0xbf, 0x9b, 0xd4, 0xab, 0x8a, 0x82, 0xd7, 0x27, 0x7b, 0xb9, 0x73, 0xcb, 0xfd, 0x29, 0x59, 0xae,
+	0x5f, 0xca, 0xe3, 0xf7, 0x83, 0xf8, 0x66, 0x4e, 0xc8, 0x51, 0x07, 0xbe, 0x2a, 0x02, 0xbd, 0x86,
+	0x2d, 0x90, 0x23, 0xb9, 0xa8, 0x3c, 0xd0, 0x84, 0x2d, 0x91, 0xe3, 0x41, 0x54, 0x3c, 0x0c, 0x2d,
+	0xd0, 0x14, 0x9f, 0x30, 0x8a, 0xf1, 0x29, 0xc3, 0x25, 0xa2, 0x8e, 0x65, 0x87, 0x1d, 0x27, 0x9d,
+	0x01, 0x5e, 0x3c, 0x8f, 0xa0, 0xb4, 0x9e, 0xa3, 0xf4, 0x28, 0x3b, 0x49, 0x88, 0xc5, 0xb7, 0xd9,
+	0x02, 0xf6, 0xa0, 0xa0, 0xc7, 0x50, 0x71, 0xa9, 0xb4, 0x71, 0xf4, 0x78, 0xfc, 0x29, 0xee, 0x35,
+	0x8e, 0x2e, 0xb0, 0x45, 0x72, 0x6c, 0x0f, 0x5c, 0x4c, 0x16, 0xc2, 0x18, 0x39, 0x89, 0xc5, 0x19,
+	0xa7, 0x52, 0x9d, 0xaa, 0x8b, 0xa8, 0xd2, 0x83, 0xf6, 0xc6, 0xd1, 0x25, 0x54, 0x59, 0xd7, 0x50,
+	0x6e, 0x24, 0xd0, 0x13, 0xe3, 0xe7, 0x68, 0xd4, 0x49, 0x7c, 0xae, 0xc7, 0xa1, 0x16, 0x25, 0xd0,
+	0xe5, 0xf8, 0xa6, 0xdc, 0x64, 0x4e, 0x94, 0x50, 0xdc, 0xae, 0x9e, 0x73, 0x92, 0xae, 0xa0, 0xdd,
+	0xaa, 0xf4, 0x8a, 0xb2, 0xcb, 0x5f, 0x4c, 0xc8, 0xca, 0xc4, 0x17, 0x11, 0x87, 0xef, 0xca, 0x8e,
+	0xdd, 0x49, 0x8e, 0xdd, 0x55, 0xbf, 0x35, 0xb3, 0x0b, 0x53, 0x9f, 0x3b, 0x66, 0x3f, 0x9e, 0xac,
+	0xaf, 0x4c, 0xc1, 0x9f, 0x35, 0x4a, 0x6e, 0x5e, 0xc3, 0x3e, 0x46, 0x3a, 0xf7, 0x54, 0x7e, 0xc0,
+	0x6e, 0x78, 0xcf, 0x4f, 0x25, 0xff, 0x47, 0xc3, 0xc7, 0xcf, 0x7d, 0x6e, 0x2d, 0x4a, 0x2f, 0xd5,
+	0x9f, 0xc3, 0x0a, 0xd5, 0xbd, 0xd4, 0x37, 0xcd, 0x57, 0xb1, 0xee, 0xd1, 0xf8, 0xff, 0xca, 0xff,
+	0x02, 0x00, 0x00, 0xff, 0xff, 0xb7, 0x95, 0x73, 0xac, 0x65, 0x13, 0x00, 0x00,
 }
 
 // Reference imports to suppress errors if they are not otherwise used.